@@ -15,10 +15,12 @@ from starlette.middleware.sessions import (
     SessionMiddleware as StarletteSessionMiddleware,
 )
 
+from mlflow_oidc_auth import audit_pipeline
 from mlflow_oidc_auth.config import config
 from mlflow_oidc_auth.exceptions import register_exception_handlers
 from mlflow_oidc_auth.graphql import install_mlflow_graphql_authorization_middleware
 from mlflow_oidc_auth.hooks import after_request_hook, before_request_hook
+from mlflow_oidc_auth.jobs import trash_gc
 from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.middleware import (
     AuthAwareWSGIMiddleware,
@@ -26,8 +28,9 @@ from mlflow_oidc_auth.middleware import (
     ProxyHeadersMiddleware,
     WorkspaceContextMiddleware,
     add_fastapi_permission_middleware,
+    wsgi_bridge,
 )
-from mlflow_oidc_auth.oauth import ensure_all_clients_registered
+from mlflow_oidc_auth.oauth import ProviderStartup, start_providers
 from mlflow_oidc_auth.routers import ajax_alias_router, get_all_routers
 
 logger = get_logger()
@@ -39,6 +42,8 @@ _oidc_initialized: bool = False
 # providers failed, because failing the startup probe would pull the pod from service while it
 # can still authenticate everyone else. This dict is what says *which* ones are broken (#315).
 _oidc_provider_status: dict[str, bool] = {}
+# Per-provider startup timings and discovery outcome, for the startup probe's report.
+_oidc_provider_startup: dict[str, ProviderStartup] = {}
 
 
 def is_oidc_ready() -> bool:
@@ -59,6 +64,15 @@ def get_oidc_provider_status() -> dict[str, bool]:
     return dict(_oidc_provider_status)
 
 
+def get_oidc_provider_startup(include_errors: bool = False) -> dict[str, dict]:
+    """Per-provider startup report: registration, discovery outcome and time taken.
+
+    ``include_errors`` adds why discovery failed. The public ``/health/startup`` probe leaves it
+    out; the admin ``/oidc/runtime`` route and the startup log carry it.
+    """
+    return {provider_id: outcome.to_dict(include_error=include_errors) for provider_id, outcome in _oidc_provider_startup.items()}
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """FastAPI lifespan context manager for startup/shutdown events.
@@ -67,14 +81,28 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     This is critical for multi-replica deployments where any replica may receive
     /callback or /logout requests that require the OIDC client to be registered.
     """
-    global _oidc_initialized, _oidc_provider_status
+    global _oidc_initialized, _oidc_provider_status, _oidc_provider_startup
 
     # Startup: Register OIDC client
     logger.info("Starting MLflow OIDC Auth Plugin...")
     # Every provider is registered independently, so one that is misconfigured or whose
     # discovery document is unreachable does not disable login for the others (#315).
-    results = ensure_all_clients_registered()
+    # Discovery documents are fetched concurrently and bounded by
+    # OIDC_PROVIDER_STARTUP_TIMEOUT_SECONDS, so one slow IdP cannot hold up startup.
+    startup = start_providers()
+    _oidc_provider_startup = startup
+    results = {provider_id: outcome.registered for provider_id, outcome in startup.items()}
     _oidc_provider_status = results
+    for provider_id, outcome in sorted(startup.items()):
+        log = logger.info if outcome.discovery in ("ok", "skipped") else logger.warning
+        log(
+            "OIDC provider '%s' startup: registered=%s discovery=%s in %.0f ms%s",
+            provider_id,
+            outcome.registered,
+            outcome.discovery,
+            outcome.seconds * 1000,
+            f" ({outcome.error})" if outcome.error else "",
+        )
     registered = [provider_id for provider_id, ok in results.items() if ok]
     failed = [provider_id for provider_id, ok in results.items() if not ok]
 
@@ -96,10 +124,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             "OIDC authentication will not be available until configuration is corrected."
         )
 
+    # Trash cleanup runs as background jobs; starting the worker also resumes any job a
+    # previous process was stopped in the middle of.
+    trash_gc.start()
+    # From here on, audit events are written by a background thread.
+    audit_pipeline.start()
+
     yield  # App runs here
 
     # Shutdown: Cleanup if needed
     logger.info("Shutting down MLflow OIDC Auth Plugin...")
+    # Let the Flask worker threads exit once their requests finish.
+    wsgi_bridge.shutdown()
+    # Hand an unfinished cleanup job back to the queue; the next start resumes it.
+    trash_gc.shutdown()
+    # Last, so the events the steps above emitted are written too.
+    audit_pipeline.shutdown()
 
 
 def _seed_default_workspace() -> None:
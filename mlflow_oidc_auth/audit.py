@@ -8,10 +8,17 @@ Audit events are emitted via a dedicated Python logger (``mlflow_oidc_auth.audit
 separate from the application logger, making it easy to route audit logs to a SIEM
 or compliance pipeline via any standard log collector.
 
+In the server, events are queued and written in batches by a background thread, so the
+request that emits one does not wait on audit I/O (see ``audit_pipeline.py``). Elsewhere, and
+before the server has started, they are written synchronously.
+
 Configuration (environment variables / config providers):
     AUDIT_LOG_ENABLED  – Enable audit logging (default ``True``).
     AUDIT_LOG_LEVEL    – Log level for audit events: ``INFO`` or ``WARNING``
                          (default ``INFO``).
+    AUDIT_LOG_ASYNC    – Write events from a background thread in the server
+                         (default ``True``). The ``AUDIT_*`` queue and sink settings
+                         are described in ``audit_pipeline.py``.
 
 Each audit event is a single-line JSON object with the following fields:
     timestamp      – ISO-8601 UTC timestamp.
@@ -83,6 +90,15 @@ def _resolve_level() -> int:
     return getattr(logging, str(level_str).upper(), logging.INFO)
 
 
+def _submit_async(level: int, record: Dict[str, Any]) -> bool:
+    """Hand the event to the background writer. False if none is running."""
+    try:
+        from mlflow_oidc_auth import audit_pipeline
+    except Exception:
+        return False
+    return audit_pipeline.submit(level, record)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -116,10 +132,14 @@ def emit_audit_event(
         "actor": actor,
         "resource_type": resource_type,
         "resource_id": resource_id,
-        "detail": detail or {},
+        # Copied, because a queued event is serialised later, after the caller may have
+        # changed its dict.
+        "detail": dict(detail) if detail else {},
         "status": status,
     }
 
-    logger = _get_audit_logger()
     level = _resolve_level()
+    if _submit_async(level, record):
+        return
+    logger = _get_audit_logger()
     logger.log(level, json.dumps(record, default=str))
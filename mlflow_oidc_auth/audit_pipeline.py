@@ -0,0 +1,384 @@
+"""
+Asynchronous, batched delivery of audit events.
+
+``emit_audit_event`` used to serialise each event and write it through a ``StreamHandler`` on
+the calling thread. That included every denial ``AuthMiddleware`` audits and every row of a
+bulk permission change, so a credential-stuffing burst or a bulk regex rewrite spent its time
+on audit I/O. In the server, events now go onto a bounded in-memory queue. One writer thread
+drains it, serialises the events, and hands them to the configured sinks a batch at a time.
+
+Batches form on their own: the writer takes whatever has queued while it was writing, up to
+``AUDIT_BATCH_SIZE``, so a quiet server writes each event at once and a busy one writes fewer,
+larger batches.
+
+When the queue is full, ``AUDIT_QUEUE_FULL_POLICY`` decides what happens:
+
+- ``drop-oldest`` (default): the oldest queued event is discarded and counted in ``dropped``.
+  The request path never waits on audit I/O.
+- ``block``: the emitting thread waits for room, so a slow sink slows the requests that emit
+  events. Waiting is only possible off the event loop: an event emitted on a thread running an
+  asyncio loop (``AuthMiddleware`` emits its denials there) would stall every request the loop
+  serves, so a full queue there drops the oldest event instead and counts it in ``dropped``.
+
+A sink that raises loses that batch, and its events are counted in ``failed``. The writer logs
+the failure and carries on; batches are not retried.
+
+The pipeline runs between ``start()`` and ``shutdown()``, which the FastAPI lifespan calls.
+``shutdown()`` flushes what is queued before it returns. Outside that window (CLI commands,
+tests, anything before startup or after shutdown has begun) ``submit`` declines, and
+``emit_audit_event`` writes synchronously as before.
+
+Sinks (``AUDIT_SINKS``, comma-separated):
+
+- ``log`` (default): the ``mlflow_oidc_auth.audit`` logger, so existing log routing is unchanged.
+- ``stream``: standard error, one write per batch.
+- ``file``: ``AUDIT_FILE_PATH``, rotated at ``AUDIT_FILE_MAX_BYTES`` with
+  ``AUDIT_FILE_BACKUP_COUNT`` old files kept.
+- ``http``: each batch is POSTed to ``AUDIT_HTTP_URL`` as newline-delimited JSON.
+
+Other sinks are any object with ``write(batch)`` and ``close()``, passed to ``start(sinks=...)``.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, TextIO, Tuple
+
+import requests
+
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+
+logger = get_logger()
+
+DROP_OLDEST = "drop-oldest"
+BLOCK = "block"
+
+# One queued event: its log level and the record emit_audit_event built.
+_Event = Tuple[int, Dict[str, Any]]
+# One serialised event, as sinks receive it: its log level and a single line of JSON.
+AuditLine = Tuple[int, str]
+
+
+class AuditSink:
+    """Where batches of audit events go."""
+
+    name = "sink"
+
+    def write(self, batch: List[AuditLine]) -> None:
+        """Write ``batch``, oldest first. Raising loses the batch; it is not retried."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release anything the sink holds. Called once, after the last batch."""
+
+
+class LogSink(AuditSink):
+    """The ``mlflow_oidc_auth.audit`` logger, at each event's level."""
+
+    name = "log"
+
+    def write(self, batch: List[AuditLine]) -> None:
+        from mlflow_oidc_auth.audit import _get_audit_logger
+
+        audit_logger = _get_audit_logger()
+        for level, line in batch:
+            audit_logger.log(level, line)
+
+
+class StreamSink(AuditSink):
+    """A text stream, standard error by default, written once per batch."""
+
+    name = "stream"
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self._stream = stream
+
+    def write(self, batch: List[AuditLine]) -> None:
+        stream = self._stream or sys.stderr
+        stream.write("".join(line + "\n" for _, line in batch))
+        stream.flush()
+
+
+class RotatingFileSink(AuditSink):
+    """A file that is rotated once it reaches ``max_bytes``.
+
+    Rotation follows ``logging.handlers.RotatingFileHandler``: ``path`` becomes ``path.1``, the
+    previous ``path.1`` becomes ``path.2``, and so on up to ``backup_count``. A batch is never
+    split across files.
+    """
+
+    name = "file"
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file: Optional[TextIO] = None
+
+    def write(self, batch: List[AuditLine]) -> None:
+        data = "".join(line + "\n" for _, line in batch)
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        if self.max_bytes > 0 and self._file.tell() > 0 and self._file.tell() + len(data.encode("utf-8")) > self.max_bytes:
+            self._rollover()
+        self._file.write(data)
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rollover(self) -> None:
+        self.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(f"{self.path}.{i}"):
+                    os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+
+class HttpSink(AuditSink):
+    """POSTs each batch to a collector as newline-delimited JSON."""
+
+    name = "http"
+
+    def __init__(self, url: str, timeout: float) -> None:
+        self.url = url
+        self.timeout = timeout
+        self._session = requests.Session()
+
+    def write(self, batch: List[AuditLine]) -> None:
+        response = self._session.post(
+            self.url,
+            data="".join(line + "\n" for _, line in batch).encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+    def close(self) -> None:
+        self._session.close()
+
+
+def sinks_from_config() -> List[AuditSink]:
+    """The sinks ``AUDIT_SINKS`` names. An unknown or incomplete one is logged and skipped."""
+    sinks: List[AuditSink] = []
+    for name in config.AUDIT_SINKS:
+        name = name.lower()
+        if name == "log":
+            sinks.append(LogSink())
+        elif name == "stream":
+            sinks.append(StreamSink())
+        elif name == "file" and config.AUDIT_FILE_PATH:
+            sinks.append(RotatingFileSink(config.AUDIT_FILE_PATH, config.AUDIT_FILE_MAX_BYTES, config.AUDIT_FILE_BACKUP_COUNT))
+        elif name == "http" and config.AUDIT_HTTP_URL:
+            sinks.append(HttpSink(config.AUDIT_HTTP_URL, config.AUDIT_HTTP_TIMEOUT_SECONDS))
+        else:
+            logger.warning("Audit sink '%s' is unknown or not configured (AUDIT_FILE_PATH, AUDIT_HTTP_URL); skipping it", name)
+    if not sinks:
+        # A misconfiguration must not silently discard the audit trail.
+        logger.warning("No usable audit sink in AUDIT_SINKS; writing audit events to the audit logger")
+        sinks.append(LogSink())
+    return sinks
+
+
+def _on_event_loop() -> bool:
+    """True on a thread that is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class AuditPipeline:
+    """A bounded queue of audit events and the thread that writes them to ``sinks``.
+
+    Parameters:
+        sinks: Where batches go, each in turn.
+        queue_size: Events held before ``policy`` applies; defaults to ``AUDIT_QUEUE_SIZE``.
+        batch_size: Most events per batch; defaults to ``AUDIT_BATCH_SIZE``.
+        policy: ``drop-oldest`` or ``block``; defaults to ``AUDIT_QUEUE_FULL_POLICY``.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[AuditSink],
+        *,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        policy: Optional[str] = None,
+    ) -> None:
+        self.sinks = list(sinks)
+        self.queue_size = max(1, queue_size if queue_size is not None else config.AUDIT_QUEUE_SIZE)
+        self.batch_size = max(1, batch_size if batch_size is not None else config.AUDIT_BATCH_SIZE)
+        self.policy = (policy or config.AUDIT_QUEUE_FULL_POLICY).lower()
+        if self.policy not in (DROP_OLDEST, BLOCK):
+            logger.warning("AUDIT_QUEUE_FULL_POLICY '%s' is not '%s' or '%s'; using '%s'", self.policy, DROP_OLDEST, BLOCK, DROP_OLDEST)
+            self.policy = DROP_OLDEST
+        self._queue: Deque[_Event] = deque()
+        self._cond = threading.Condition()
+        self._writing = 0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._counters = {"submitted": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0}
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, level: int, record: Dict[str, Any]) -> bool:
+        """Queue one event. Under ``block``, and off the event loop, waits while the queue is full.
+
+        Returns:
+            False if the pipeline is stopping, including when it began to while this call waited.
+            The event is not queued, and the caller writes it itself.
+        """
+        with self._cond:
+            if self._stopping:
+                return False
+            if len(self._queue) >= self.queue_size:
+                if self.policy == BLOCK and not _on_event_loop():
+                    while len(self._queue) >= self.queue_size and not self._stopping:
+                        self._cond.wait()
+                    if self._stopping:
+                        return False
+                else:
+                    self._queue.popleft()
+                    self._counters["dropped"] += 1
+            self._queue.append((level, record))
+            self._counters["submitted"] += 1
+            self._cond.notify_all()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been written. False if ``timeout`` passed first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Write what is queued, then stop the writer and close the sinks.
+
+        Returns:
+            False if events were still queued when ``timeout`` passed. They are discarded
+            and counted in ``dropped``.
+        """
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._counters["dropped"] += len(self._queue)
+            self._queue.clear()
+            self._cond.notify_all()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                logger.warning("Audit sink '%s' did not close cleanly: %s", sink.name, e)
+        return flushed
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and counters. ``written`` counts events every sink accepted, ``failed``
+        events at least one sink lost, and ``dropped`` events discarded unwritten."""
+        with self._cond:
+            return {
+                "queued": len(self._queue),
+                "queue_size": self.queue_size,
+                "policy": self.policy,
+                "sinks": [sink.name for sink in self.sinks],
+                **self._counters,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                events = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._writing += 1
+                # Room was made; a blocked emitter can go on.
+                self._cond.notify_all()
+            try:
+                self._write(events)
+            finally:
+                with self._cond:
+                    self._writing -= 1
+                    self._cond.notify_all()
+
+    def _write(self, events: List[_Event]) -> None:
+        batch = [(level, json.dumps(record, default=str)) for level, record in events]
+        delivered = True
+        for sink in self.sinks:
+            try:
+                sink.write(batch)
+            except Exception as e:
+                delivered = False
+                logger.warning("Audit sink '%s' failed; %d event(s) lost: %s", sink.name, len(batch), e)
+        with self._cond:
+            self._counters["written" if delivered else "failed"] += len(batch)
+            self._counters["batches"] += 1
+
+
+_pipeline: Optional[AuditPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def start(sinks: Optional[Sequence[AuditSink]] = None) -> Optional[AuditPipeline]:
+    """Start this process's pipeline. Does nothing, and returns None, if ``AUDIT_LOG_ASYNC`` is off."""
+    global _pipeline
+    if not config.AUDIT_LOG_ASYNC:
+        return None
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = AuditPipeline(sinks if sinks is not None else sinks_from_config())
+        _pipeline.start()
+        return _pipeline
+
+
+def submit(level: int, record: Dict[str, Any]) -> bool:
+    """Queue an event if the pipeline is running. False means the caller writes it itself."""
+    pipeline = _pipeline
+    if pipeline is None:
+        return False
+    return pipeline.submit(level, record)
+
+
+def stats() -> Dict[str, Any]:
+    """The running pipeline's counters, or ``{"running": False}``."""
+    pipeline = _pipeline
+    if pipeline is None:
+        return {"running": False}
+    return {"running": True, **pipeline.stats()}
+
+
+def shutdown(timeout: Optional[float] = None) -> None:
+    """Write what is queued and stop. Later events are written synchronously."""
+    global _pipeline
+    with _pipeline_lock:
+        pipeline, _pipeline = _pipeline, None
+    if pipeline is not None:
+        timeout = config.AUDIT_SHUTDOWN_TIMEOUT_SECONDS if timeout is None else timeout
+        if not pipeline.stop(timeout):
+            logger.warning("Audit events still queued after %ss at shutdown were discarded", timeout)
@@ -2,15 +2,17 @@ import base64
 import hashlib
 import json
 import threading
+import time
 
 import requests
 from authlib.jose import JsonWebToken
 from authlib.jose.errors import BadSignatureError
-from cachetools import TTLCache
+from cachetools import TLRUCache, TTLCache
 
-from typing import Optional
+from typing import Any, NamedTuple, Optional
 
 from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.discovery import get_discovery_document
 from mlflow_oidc_auth.kubernetes import in_cluster_credentials, load_inline_jwks
 from mlflow_oidc_auth.logger import get_logger
 
@@ -55,12 +57,103 @@ _provider_jwks_cache: TTLCache = TTLCache(maxsize=32, ttl=config.OIDC_JWKS_CACHE
 _provider_jwks_lock = threading.Lock()
 
 
+class _ValidatedToken(NamedTuple):
+    provider: Any
+    claims: Any
+    expires_at: float
+    kid: Optional[str] = None
+
+
+# Validated bearer tokens, keyed by the SHA-256 of the token so the token itself is never held.
+# A training job presents the same token on every request for its whole lifetime, and verifying
+# its signature each time was a top CPU cost on API pods. An entry lives until the token's own
+# ``exp`` or OIDC_TOKEN_CACHE_TTL_SECONDS, whichever comes first. When a failed signature forces
+# a provider's JWKS refresh, that provider's entries whose ``kid`` is no longer in the refreshed
+# key set are dropped (see :func:`_forget_rotated_validations`), so a rotated-out key stops being
+# honoured along with the tokens it signed. Entries of other providers, and those signed by keys
+# still published, are kept: a forged token must not be able to empty the cache. Only successful
+# validations are kept. LRU-bounded, so a flood of distinct tokens cannot grow it.
+_validated_tokens: TLRUCache = TLRUCache(
+    maxsize=config.OIDC_TOKEN_CACHE_MAX_SIZE,
+    ttu=lambda _key, entry, _now: entry.expires_at,
+    timer=time.time,
+)
+_validated_tokens_lock = threading.Lock()
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _cached_validation(token: str) -> Optional[_ValidatedToken]:
+    """The entry for a token validated earlier and not yet expired, or None."""
+    if config.OIDC_TOKEN_CACHE_TTL_SECONDS <= 0:
+        return None
+    with _validated_tokens_lock:
+        return _validated_tokens.get(_token_digest(token))
+
+
+def _remember_validation(token: str, provider, claims) -> None:
+    max_ttl = config.OIDC_TOKEN_CACHE_TTL_SECONDS
+    if max_ttl <= 0:
+        return
+    now = time.time()
+    expires_at = now + max_ttl
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        expires_at = min(expires_at, float(exp))
+    if expires_at <= now:
+        return
+    header = getattr(claims, "header", None)
+    kid = header.get("kid") if isinstance(header, dict) else None
+    with _validated_tokens_lock:
+        _validated_tokens[_token_digest(token)] = _ValidatedToken(provider, claims, expires_at, kid)
+
+
+def validated_claims(token: str):
+    """The claims of a token :func:`validate_token` has already accepted, or None.
+
+    Never decodes and never fetches keys, so async callers can try it on the event loop before
+    sending a miss to a worker thread.
+    """
+    cached = _cached_validation(token)
+    return cached.claims if cached is not None else None
+
+
+def clear_validated_tokens() -> None:
+    """Forget every cached token validation."""
+    with _validated_tokens_lock:
+        _validated_tokens.clear()
+
+
+def _forget_rotated_validations(provider, jwks: dict) -> None:
+    """Drop ``provider``'s cached validations whose signing key is not in ``jwks``.
+
+    A validation cached without a ``kid`` cannot be matched to a key, so it is dropped too —
+    but only for this provider.
+    """
+    kids = {key.get("kid") for key in (jwks or {}).get("keys", []) if isinstance(key, dict)}
+    kids.discard(None)
+    provider_id = getattr(provider, "id", None)
+    with _validated_tokens_lock:
+        stale = [
+            digest
+            for digest, entry in list(_validated_tokens.items())
+            if getattr(entry.provider, "id", None) == provider_id and (entry.kid is None or entry.kid not in kids)
+        ]
+        for digest in stale:
+            _validated_tokens.pop(digest, None)
+    if stale:
+        logger.debug("Dropped %d cached token validation(s) for provider %s after a key-set refresh", len(stale), provider_id)
+
+
 def _get_oidc_jwks(force_refresh: bool = False) -> dict:
     """Fetch JWKS from OIDC provider, with TTL-based caching.
 
     Results are cached for ``OIDC_JWKS_CACHE_TTL_SECONDS`` (default 300s) to
-    avoid hitting the OIDC provider on every token validation.  When
-    ``force_refresh`` is True the cache is cleared first — this is used on
+    avoid hitting the OIDC provider on every token validation, and refreshed in
+    the background before they expire (see :func:`_load_jwks`).  When
+    ``force_refresh`` is True a fresh key set is fetched — this is used on
     ``BadSignatureError`` to handle key rotation.
 
     Parameters:
@@ -82,6 +175,45 @@ def _get_oidc_jwks(force_refresh: bool = False) -> dict:
     )
 
 
+class _JwksFetch:
+    """One in-flight key-set fetch, shared by every caller that wants its result."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.jwks: Optional[dict] = None
+        self.error: Optional[BaseException] = None
+
+    def result(self) -> dict:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.jwks
+
+
+# Refresh-ahead bookkeeping for ``_load_jwks``, keyed by the same ``cache_key`` as the cache the
+# key set lands in (the deployment-wide key is a string, per-provider keys are tuples, so the
+# two caches cannot collide here). ``_jwks_inflight`` holds the single fetch running per key;
+# ``_jwks_refresh_due`` the monotonic time after which a hit should start a background refresh.
+_jwks_inflight: dict = {}
+_jwks_refresh_due: dict = {}
+# Monotonic time each key's last forced refresh finished, for the cooldown below.
+_jwks_forced_at: dict = {}
+_jwks_fetch_lock = threading.Lock()
+
+# A key set is refreshed in the background once this fraction of its TTL has passed, so under
+# steady traffic the entry is replaced before it expires and no request waits on the IdP.
+_JWKS_REFRESH_AT = 0.8
+# After a failed fetch the next refresh waits this long, so an unreachable IdP is retried every
+# few seconds rather than by every request. The current key set keeps being served meanwhile,
+# until the cache evicts it.
+_JWKS_REFRESH_RETRY_SECONDS = 10.0
+# A forced refresh is triggered by any token with a bad signature, and anyone can present one.
+# Within this many seconds of the previous forced refresh of the same key set, the cached keys
+# are served instead, so forged tokens cannot turn into a stream of fetches against the IdP. A
+# genuinely rotated key is still picked up, at most this much later.
+_JWKS_FORCED_REFRESH_INTERVAL_SECONDS = 30.0
+
+
 def _load_jwks(
     url: str,
     *,
@@ -100,17 +232,87 @@ def _load_jwks(
     lands in, and a deployment silently takes one or the other depending on whether its provider
     names a key source — so two implementations would mean a fix applied to the branch under
     test having no effect on the branch a real deployment runs.
+
+    Stale-while-revalidate: a hit past ``_JWKS_REFRESH_AT`` of the TTL returns the cached key set
+    at once and starts a refresh on a background thread. Fetches are single-flight per
+    ``cache_key``: a miss, or a ``force_refresh`` after a bad signature, joins the fetch already
+    running for that key instead of starting another. A forced refresh does not evict the
+    current key set, so requests whose tokens still verify keep being served from it while the
+    fetch runs; the new key set replaces it when it arrives. Forced refreshes are also rate
+    limited per key (``_JWKS_FORCED_REFRESH_INTERVAL_SECONDS``): within the cooldown, and with
+    no fetch to join, the cached key set is returned.
     """
-    with lock:
-        if force_refresh:
-            cache.pop(cache_key, None)
-        cached = cache.get(cache_key)
+    if force_refresh:
+        with _jwks_fetch_lock:
+            running = _jwks_inflight.get(cache_key)
+            forced_at = _jwks_forced_at.get(cache_key)
+        if running is None and forced_at is not None and time.monotonic() - forced_at < _JWKS_FORCED_REFRESH_INTERVAL_SECONDS:
+            with lock:
+                cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug("JWKS for %s was refreshed moments ago; not forcing another fetch", label)
+                return cached
+    else:
+        with lock:
+            cached = cache.get(cache_key)
         if cached is not None:
+            with _jwks_fetch_lock:
+                due = _jwks_refresh_due.get(cache_key)
+            if due is not None and time.monotonic() >= due:
+                _start_jwks_fetch(url, cache, lock, cache_key, label, direct, verify, auth_token, background=True)
             return cached
 
-    # Fetched outside the lock, so HTTP I/O does not block other threads. Timeouts are
-    # essential: without them a hung IdP holds request threads until the OS-level TCP timeout
-    # (~2 minutes), and authentication failures cascade.
+    return _start_jwks_fetch(url, cache, lock, cache_key, label, direct, verify, auth_token, background=False, refresh_discovery=force_refresh).result()
+
+
+def _start_jwks_fetch(url, cache, lock, cache_key, label, direct, verify, auth_token, *, background: bool, refresh_discovery: bool = False) -> _JwksFetch:
+    """Join the fetch running for ``cache_key``, or start one.
+
+    A foreground fetch runs on the calling thread (it needs the result anyway); a background one
+    on a daemon thread. Either way only one runs per key at a time.
+    """
+    with _jwks_fetch_lock:
+        running = _jwks_inflight.get(cache_key)
+        if running is not None:
+            return running
+        fetch = _jwks_inflight[cache_key] = _JwksFetch()
+
+    args = (fetch, url, cache, lock, cache_key, label, direct, verify, auth_token, refresh_discovery)
+    if background:
+        logger.debug("Refreshing JWKS for %s in the background", label)
+        threading.Thread(target=_run_jwks_fetch, args=args, name="jwks-refresh", daemon=True).start()
+    else:
+        _run_jwks_fetch(*args)
+    return fetch
+
+
+def _run_jwks_fetch(fetch: _JwksFetch, url, cache, lock, cache_key, label, direct, verify, auth_token, refresh_discovery=False) -> None:
+    try:
+        jwks = _fetch_jwks(url, label=label, direct=direct, verify=verify, auth_token=auth_token, refresh_discovery=refresh_discovery)
+    except BaseException as e:
+        fetch.error = e
+        with _jwks_fetch_lock:
+            # The current key set (if any) stays until the cache evicts it; retry soon, not on
+            # every request.
+            _jwks_refresh_due[cache_key] = time.monotonic() + _JWKS_REFRESH_RETRY_SECONDS
+    else:
+        fetch.jwks = jwks
+        with lock:
+            cache[cache_key] = jwks
+        with _jwks_fetch_lock:
+            _jwks_refresh_due[cache_key] = time.monotonic() + cache.ttl * _JWKS_REFRESH_AT
+    finally:
+        with _jwks_fetch_lock:
+            _jwks_inflight.pop(cache_key, None)
+            if refresh_discovery:
+                _jwks_forced_at[cache_key] = time.monotonic()
+        fetch.done.set()
+
+
+def _fetch_jwks(url: str, *, label: str, direct: bool, verify, auth_token: Optional[str], refresh_discovery: bool = False) -> dict:
+    """The HTTP half of :func:`_load_jwks`: discovery (unless ``direct``, and usually cached), then the key set."""
+    # Timeouts are essential: without them a hung IdP holds request threads until the OS-level
+    # TCP timeout (~2 minutes), and authentication failures cascade.
     timeout = config.OIDC_HTTP_TIMEOUT_SECONDS
     if verify is None:
         verify = config.OIDC_VERIFY_SSL
@@ -123,8 +325,14 @@ def _load_jwks(
             # but whose JWKS endpoint is known (#314).
             jwks_uri = url
         else:
-            logger.debug("Fetching OIDC discovery metadata for %s", label)
-            metadata = requests.get(url, timeout=timeout, verify=verify, allow_redirects=False, **extra).json()
+            # Shared with the login path and kept across routine key-set refreshes
+            # (discovery.py). A forced refresh, after a signature failed, fetches it again.
+            def fetch_discovery() -> dict:
+                response = requests.get(url, timeout=timeout, verify=verify, allow_redirects=False, **extra)
+                response.raise_for_status()
+                return response.json()
+
+            metadata = get_discovery_document(url, fetch=fetch_discovery, force_refresh=refresh_discovery)
             jwks_uri = metadata.get("jwks_uri")
             if not jwks_uri:
                 raise ValueError(f"No jwks_uri found in OIDC discovery metadata for {label}")
@@ -132,16 +340,11 @@ def _load_jwks(
         logger.debug("Fetching JWKS from %s", jwks_uri)
         # Redirects are not followed on either fetch: this decides which signatures are valid,
         # so a 302 must be a visible configuration error rather than a silent change of source.
-        jwks = requests.get(jwks_uri, timeout=timeout, verify=verify, allow_redirects=False, **extra).json()
+        return requests.get(jwks_uri, timeout=timeout, verify=verify, allow_redirects=False, **extra).json()
     except requests.exceptions.RequestException as e:
         logger.error("Failed to fetch JWKS for %s: %s", label, e)
         raise
 
-    with lock:
-        cache[cache_key] = jwks
-
-    return jwks
-
 
 def _get_provider_jwks(provider, force_refresh: bool = False) -> dict:
     """Fetch the JWKS for one provider, cached per provider id (#313).
@@ -152,12 +355,22 @@ def _get_provider_jwks(provider, force_refresh: bool = False) -> dict:
 
     Parameters:
         provider: The resolved :class:`ProviderConfig`.
-        force_refresh: Drop this provider's cached keys first. Used on ``BadSignatureError`` to
-            pick up a rotated key — and only ever for the provider whose signature failed.
+        force_refresh: Fetch this provider's keys again. Used on ``BadSignatureError`` to pick
+            up a rotated key — and only ever for the provider whose signature failed. Afterwards
+            this provider's cached token validations signed by a key no longer published are
+            dropped, since a removed key must not keep vouching for the tokens it signed.
 
     Returns:
         The JWKS payload.
     """
+    jwks = _load_provider_jwks(provider, force_refresh)
+    if force_refresh:
+        _forget_rotated_validations(provider, jwks)
+    return jwks
+
+
+def _load_provider_jwks(provider, force_refresh: bool) -> dict:
+    """The key-source half of :func:`_get_provider_jwks`."""
     # A cluster's keys may be written into configuration rather than fetched (#314): the only
     # mode that works when the API server is unreachable from wherever MLflow runs, and the only
     # one with no network in the authentication path at all.
@@ -278,7 +491,14 @@ def _unverified_issuer(token: str) -> str | None:
 
 
 def resolve_token_provider(token: str):
-    """The provider whose policy applies to ``token``. See :func:`_resolve_provider`."""
+    """The provider whose policy applies to ``token``. See :func:`_resolve_provider`.
+
+    For a token :func:`validate_token` has already accepted, this is the provider that
+    validated it, read from the validation cache rather than decoded again.
+    """
+    cached = _cached_validation(token)
+    if cached is not None:
+        return cached.provider
     return _resolve_provider(token)
 
 
@@ -355,6 +575,10 @@ def validate_token(token: str):
     alone. No union of keys across providers is ever offered to the decoder, so a ``kid`` can
     only ever select a key belonging to the issuer the token claims.
 
+    A token that validated before is served from the validation cache until its ``exp`` (or
+    ``OIDC_TOKEN_CACHE_TTL_SECONDS``) without being decoded again. The cached claims are shared
+    between requests and must not be modified.
+
     Returns:
         The validated claims.
 
@@ -362,6 +586,10 @@ def validate_token(token: str):
         ValueError: If no provider matches the token's issuer.
         Exception: Whatever authlib raises for a token that does not validate.
     """
+    cached = _cached_validation(token)
+    if cached is not None:
+        return cached.claims
+
     provider = _resolve_provider(token)
     claims_options = _claims_options_for(provider)
     decoder = _jwt_for(provider)
@@ -370,14 +598,15 @@ def validate_token(token: str):
         jwks = _get_provider_jwks(provider)
         payload = decoder.decode(token, jwks, claims_options=claims_options)
         payload.validate()
-        return payload
     except BadSignatureError as e:
         logger.error("Token validation failed with bad signature for provider %s: %s", provider.id, str(e))
         # Refresh *this* provider's keys and retry once, for key rotation.
         jwks = _get_provider_jwks(provider, force_refresh=True)
         payload = decoder.decode(token, jwks, claims_options=claims_options)
         payload.validate()
-        return payload
     except Exception as e:
         logger.error("Unexpected error during token validation: %s", str(e))
         raise
+
+    _remember_validation(token, provider, payload)
+    return payload
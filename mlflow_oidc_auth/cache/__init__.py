@@ -9,6 +9,12 @@ Backend selection is driven by ``CACHE_BACKEND`` config:
 - ``"local"`` (default) — uses LocalTTLCacheBackend
 - ``"redis"`` — uses RedisCacheBackend (requires ``redis`` package and ``CACHE_REDIS_URL``)
 
+Redis values are encoded by a ``CacheCodec`` chosen by ``CACHE_CODEC``
+(``"compact"`` or ``"pickle"``); see ``codec``.
+
+``CACHE_INVALIDATION_BUS`` (``"none"``, ``"local"`` or ``"redis"``) broadcasts
+invalidations of local backends to every replica; see ``invalidation_bus``.
+
 Usage::
 
     from mlflow_oidc_auth.cache import get_cache_backend
@@ -19,9 +25,18 @@ Usage::
 """
 
 from mlflow_oidc_auth.cache.backend import CacheBackend
-from mlflow_oidc_auth.cache.factory import get_cache_backend
+from mlflow_oidc_auth.cache.codec import CacheCodec, PermissionCodec, PickleCodec
+from mlflow_oidc_auth.cache.factory import get_cache_backend, with_invalidation_bus
+from mlflow_oidc_auth.cache.invalidation_bus import InvalidationBus, InvalidationEvent, get_invalidation_bus
 
 __all__ = [
     "CacheBackend",
+    "CacheCodec",
+    "InvalidationBus",
+    "InvalidationEvent",
+    "PermissionCodec",
+    "PickleCodec",
     "get_cache_backend",
+    "get_invalidation_bus",
+    "with_invalidation_bus",
 ]
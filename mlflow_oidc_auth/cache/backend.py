@@ -6,7 +6,7 @@ must satisfy. Values are stored as arbitrary Python objects — serialization is
 handled internally by each backend (e.g. pickle for Redis, identity for local).
 """
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Dict, Iterable, Mapping, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -42,6 +42,22 @@ class CacheBackend(Protocol):
         """
         ...
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve several values in one operation.
+
+        Returns:
+            A dict of the keys that were found; missing or expired keys are absent.
+        """
+        ...
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several values in one operation, each with the configured TTL."""
+        ...
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Remove several keys in one operation. Missing keys are ignored."""
+        ...
+
     def delete_prefix(self, prefix: str) -> None:
         """Remove every key in this namespace that starts with ``prefix``.
 
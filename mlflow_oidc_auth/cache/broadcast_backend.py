@@ -0,0 +1,110 @@
+"""
+Local cache backend with invalidation broadcast across replicas.
+
+Wraps an in-process backend. ``get`` and ``set`` stay local. ``delete``,
+``delete_many``, ``delete_prefix`` and ``clear`` apply locally and are published on the
+invalidation bus. The same operations received from other replicas are applied
+to this replica's entries.
+
+With a bus configured, a permission change reaches every replica's in-process
+cache at once. TTL expiry then only bounds staleness when a bus message is lost.
+"""
+
+import threading
+import uuid
+from typing import Any, Dict, Iterable, Mapping
+
+from mlflow_oidc_auth.cache.backend import CacheBackend
+from mlflow_oidc_auth.cache.invalidation_bus import (
+    ALL_NAMESPACES,
+    CLEAR,
+    DELETE,
+    DELETE_MANY,
+    DELETE_PREFIX,
+    InvalidationBus,
+    InvalidationEvent,
+)
+from mlflow_oidc_auth.logger import get_logger
+
+logger = get_logger()
+
+
+class BroadcastCacheBackend:
+    """In-process cache whose invalidations are shared over an InvalidationBus.
+
+    Bus events arrive on the bus's listener thread. All access to the wrapped
+    backend is therefore serialized, because cachetools caches are not
+    thread-safe.
+
+    Parameters:
+        inner: The in-process backend holding the entries.
+        namespace: Cache namespace; only events for this namespace are applied.
+        bus: The invalidation bus shared by every replica.
+    """
+
+    def __init__(self, inner: CacheBackend, namespace: str, bus: InvalidationBus) -> None:
+        self._inner = inner
+        self._namespace = namespace
+        self._bus = bus
+        self._origin = uuid.uuid4().hex
+        self._lock = threading.RLock()
+        bus.subscribe(self._on_event)
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            return self._inner.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._inner.set(key, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._inner.delete(key)
+        self._publish(DELETE, key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        with self._lock:
+            return self._inner.get_many(keys)
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._inner.set_many(items)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        keys = tuple(keys)
+        if not keys:
+            return
+        with self._lock:
+            self._inner.delete_many(keys)
+        self._publish(DELETE_MANY, keys)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            self._inner.delete_prefix(prefix)
+        self._publish(DELETE_PREFIX, prefix)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._inner.clear()
+        self._publish(CLEAR, None)
+
+    def _publish(self, op: str, arg: str | tuple | None) -> None:
+        self._bus.publish(InvalidationEvent(namespace=self._namespace, op=op, arg=arg, origin=self._origin))
+
+    def _on_event(self, event: InvalidationEvent) -> None:
+        if event.origin == self._origin:
+            return
+        if event.namespace not in (self._namespace, ALL_NAMESPACES):
+            return
+        with self._lock:
+            if event.op == DELETE and event.arg is not None:
+                self._inner.delete(event.arg)
+            elif event.op == DELETE_MANY and event.arg is not None:
+                self._inner.delete_many(event.arg)
+            elif event.op == DELETE_PREFIX and event.arg is not None:
+                self._inner.delete_prefix(event.arg)
+            elif event.op == CLEAR:
+                self._inner.clear()
+            else:
+                logger.warning("Ignoring unknown cache invalidation op %r for namespace %s", event.op, event.namespace)
@@ -0,0 +1,128 @@
+"""
+Value codecs for out-of-process cache backends.
+
+The Redis backend stores bytes, so every value is encoded on ``set`` and decoded
+on ``get``. Pickling a ``PermissionResult`` costs about a hundred bytes and a
+full unpickle (class lookup, dataclass reconstruction) on every cache hit. It
+also ties the stored bytes to the class layout, so renaming or moving a class
+breaks every entry written by the previous release.
+
+Two codecs:
+- PickleCodec: arbitrary Python objects, the previous behaviour.
+- PermissionCodec: ``PermissionResult`` and ``Permission`` values are stored as
+  a tag byte plus one-byte ids for the permission name and the source kind (3
+  bytes for a result). Decoding returns the shared ``Permission`` constants.
+  Any other value is pickled, so the codec is safe for every cache namespace.
+
+Codec selection is driven by ``CACHE_CODEC`` config:
+- ``"pickle"`` (default for this release): PickleCodec.
+- ``"compact"``: PermissionCodec.
+
+PermissionCodec reads pickled entries too, so switching to it needs no cache
+flush. The id tables below are append-only: an id a replica does not know
+decodes as a cache miss, never as a wrong permission. Replicas running a release
+without codecs run a bare ``pickle.loads`` on every entry and fail on compact
+ones, which is why pickle stays the default for one release. Upgrade order: roll
+out this release with the default, then set ``CACHE_CODEC=compact`` once no
+older replica shares the Redis.
+"""
+
+import pickle
+from typing import Any, Protocol, runtime_checkable
+
+from mlflow_oidc_auth.models.permission import PermissionResult
+from mlflow_oidc_auth.permissions import ALL_PERMISSIONS, Permission
+
+# Append-only: ids are stored in Redis and must keep their meaning across releases.
+_PERMISSION_NAMES = ("READ", "USE", "EDIT", "MANAGE", "NO_PERMISSIONS")
+_RESULT_KINDS = ("user", "group", "regex", "group-regex", "fallback", "workspace", "workspace-deny")
+
+_PERMISSION_IDS = {name: i for i, name in enumerate(_PERMISSION_NAMES)}
+_KIND_IDS = {kind: i for i, kind in enumerate(_RESULT_KINDS)}
+
+# Pickle protocol 2+ output always starts with the PROTO opcode (0x80), so the
+# compact tags below never collide with a pickled value.
+_TAG_RESULT = 0x01
+_TAG_PERMISSION = 0x02
+_PICKLE_PROTO = 0x80
+
+
+@runtime_checkable
+class CacheCodec(Protocol):
+    """Protocol for cache value codecs."""
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize ``value`` for storage."""
+        ...
+
+    def decode(self, raw: bytes) -> Any | None:
+        """Deserialize stored bytes. Returns None for data this codec cannot read."""
+        ...
+
+
+class PickleCodec:
+    """Pickle every value (highest protocol)."""
+
+    def encode(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, raw: bytes) -> Any | None:
+        return pickle.loads(raw)
+
+
+class PermissionCodec:
+    """Compact encoding for permission decisions, pickle for everything else."""
+
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, PermissionResult):
+            permission_id = self._permission_id(value.permission)
+            kind_id = _KIND_IDS.get(value.kind)
+            if permission_id is not None and kind_id is not None:
+                return bytes((_TAG_RESULT, permission_id, kind_id))
+        elif isinstance(value, Permission):
+            permission_id = self._permission_id(value)
+            if permission_id is not None:
+                return bytes((_TAG_PERMISSION, permission_id))
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, raw: bytes) -> Any | None:
+        if not raw:
+            return None
+        tag = raw[0]
+        if tag == _PICKLE_PROTO:
+            return pickle.loads(raw)
+        if tag == _TAG_RESULT and len(raw) == 3:
+            permission = self._permission(raw[1])
+            if permission is None or raw[2] >= len(_RESULT_KINDS):
+                return None
+            return PermissionResult(permission, _RESULT_KINDS[raw[2]])
+        if tag == _TAG_PERMISSION and len(raw) == 2:
+            return self._permission(raw[1])
+        return None
+
+    @staticmethod
+    def _permission_id(permission: Permission) -> int | None:
+        # Only the shared constants are encoded by name; a custom Permission with a
+        # known name but different flags must round-trip exactly, so it is pickled.
+        if ALL_PERMISSIONS.get(permission.name) != permission:
+            return None
+        return _PERMISSION_IDS.get(permission.name)
+
+    @staticmethod
+    def _permission(permission_id: int) -> Permission | None:
+        if permission_id >= len(_PERMISSION_NAMES):
+            return None
+        return ALL_PERMISSIONS.get(_PERMISSION_NAMES[permission_id])
+
+
+def get_codec(name: str) -> CacheCodec:
+    """Return the codec for a ``CACHE_CODEC`` value.
+
+    Raises:
+        ValueError: If ``name`` is not a known codec.
+    """
+    if name == "compact":
+        return PermissionCodec()
+    if name == "pickle":
+        return PickleCodec()
+    raise ValueError(f"Unknown CACHE_CODEC: '{name}'. Supported values: 'compact', 'pickle'")
@@ -2,17 +2,27 @@
 Cache backend factory.
 
 Creates cache backend instances based on the ``CACHE_BACKEND`` configuration.
-Supports ``"local"`` (default) and ``"redis"`` backends.
+Supports ``"local"`` (default), ``"redis"`` and ``"tiered"`` (local L1 in front
+of Redis L2) backends.
 
 Each call creates a fresh backend instance — callers are expected to hold
 a module-level reference (lazy-initialized) to reuse the same backend.
+
+When ``CACHE_INVALIDATION_BUS`` is configured, local backends are wrapped so
+their invalidations are broadcast to the other replicas. Redis backends are
+shared by every replica and need no bus.
 """
 
 from mlflow_oidc_auth.cache.backend import CacheBackend
+from mlflow_oidc_auth.cache.codec import get_codec
+from mlflow_oidc_auth.cache.invalidation_bus import get_invalidation_bus
 from mlflow_oidc_auth.logger import get_logger
 
 logger = get_logger()
 
+_L1_DEFAULT_MAX_SIZE = 1024
+_L1_DEFAULT_TTL = 5
+
 
 def get_cache_backend(namespace: str, maxsize: int, ttl: int) -> CacheBackend:
     """Create a cache backend instance based on application configuration.
@@ -20,16 +30,17 @@ def get_cache_backend(namespace: str, maxsize: int, ttl: int) -> CacheBackend:
     Parameters:
         namespace: Logical cache name (e.g. ``"permissions"``, ``"workspace"``).
             Used as a sub-prefix in Redis to isolate different cache domains.
-        maxsize: Maximum entries for local backend (ignored by Redis).
+        maxsize: Maximum entries for local backend (ignored by Redis; caps the
+            tiered backend's L1 size).
         ttl: Time-to-live in seconds for cache entries.
 
     Returns:
         A CacheBackend implementation.
 
     Raises:
-        ValueError: If ``CACHE_BACKEND`` is set to an unknown value.
-        ImportError: If ``"redis"`` is selected but the redis package is missing.
-        ConnectionError: If ``"redis"`` is selected but the server is unreachable.
+        ValueError: If ``CACHE_BACKEND``, ``CACHE_CODEC`` or ``CACHE_INVALIDATION_BUS`` is set to an unknown value.
+        ImportError: If ``"redis"`` or ``"tiered"`` is selected but the redis package is missing.
+        ConnectionError: If ``"redis"`` or ``"tiered"`` is selected but the server is unreachable.
     """
     from mlflow_oidc_auth.config import config
 
@@ -44,26 +55,71 @@ def get_cache_backend(namespace: str, maxsize: int, ttl: int) -> CacheBackend:
             maxsize,
             ttl,
         )
-        return LocalTTLCacheBackend(maxsize=maxsize, ttl=ttl)
+        return with_invalidation_bus(LocalTTLCacheBackend(maxsize=maxsize, ttl=ttl), namespace)
 
     elif backend_type == "redis":
-        from mlflow_oidc_auth.cache.redis_backend import RedisCacheBackend
+        return _create_redis_backend(config, backend_type, namespace, ttl)
 
-        redis_url = getattr(config, "CACHE_REDIS_URL", None)
-        if not redis_url:
-            raise ValueError("CACHE_BACKEND is set to 'redis' but CACHE_REDIS_URL is not configured")
+    elif backend_type == "tiered":
+        from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+        from mlflow_oidc_auth.cache.tiered_backend import TieredCacheBackend
 
-        key_prefix = getattr(config, "CACHE_KEY_PREFIX", "mlflow_oidc_auth:")
-        full_prefix = f"{key_prefix}{namespace}:"
+        l2 = _create_redis_backend(config, backend_type, namespace, ttl)
+        l1_maxsize = min(maxsize, getattr(config, "CACHE_L1_MAX_SIZE", _L1_DEFAULT_MAX_SIZE))
+        l1_ttl = min(ttl, getattr(config, "CACHE_L1_TTL_SECONDS", _L1_DEFAULT_TTL))
+        l1 = with_invalidation_bus(LocalTTLCacheBackend(maxsize=l1_maxsize, ttl=l1_ttl), namespace)
 
         logger.info(
-            "Using Redis cache backend for '%s' (url=%s, prefix=%s, ttl=%ds)",
+            "Using tiered cache backend for '%s' (L1 maxsize=%d, L1 ttl=%ds)",
             namespace,
-            redis_url,
-            full_prefix,
-            ttl,
+            l1_maxsize,
+            l1_ttl,
         )
-        return RedisCacheBackend(url=redis_url, prefix=full_prefix, ttl=ttl)
+        if get_invalidation_bus() is None:
+            logger.warning(
+                "Tiered cache '%s' has no CACHE_INVALIDATION_BUS; other replicas may serve invalidated L1 entries for up to %ds",
+                namespace,
+                l1_ttl,
+            )
+        return TieredCacheBackend(l1=l1, l2=l2)
 
     else:
-        raise ValueError(f"Unknown CACHE_BACKEND: '{backend_type}'. Supported values: 'local', 'redis'")
+        raise ValueError(f"Unknown CACHE_BACKEND: '{backend_type}'. Supported values: 'local', 'redis', 'tiered'")
+
+
+def _create_redis_backend(config, backend_type: str, namespace: str, ttl: int) -> CacheBackend:
+    from mlflow_oidc_auth.cache.redis_backend import RedisCacheBackend
+
+    redis_url = getattr(config, "CACHE_REDIS_URL", None)
+    if not redis_url:
+        raise ValueError(f"CACHE_BACKEND is set to '{backend_type}' but CACHE_REDIS_URL is not configured")
+
+    key_prefix = getattr(config, "CACHE_KEY_PREFIX", "mlflow_oidc_auth:")
+    full_prefix = f"{key_prefix}{namespace}:"
+    codec_name = getattr(config, "CACHE_CODEC", "pickle")
+    codec = get_codec(codec_name)
+
+    logger.info(
+        "Using Redis cache backend for '%s' (url=%s, prefix=%s, ttl=%ds, codec=%s)",
+        namespace,
+        redis_url,
+        full_prefix,
+        ttl,
+        codec_name,
+    )
+    return RedisCacheBackend(url=redis_url, prefix=full_prefix, ttl=ttl, codec=codec)
+
+
+def with_invalidation_bus(backend: CacheBackend, namespace: str) -> CacheBackend:
+    """Wrap an in-process backend so its invalidations reach every replica.
+
+    Returns ``backend`` unchanged when no ``CACHE_INVALIDATION_BUS`` is configured.
+    """
+    bus = get_invalidation_bus()
+    if bus is None:
+        return backend
+
+    from mlflow_oidc_auth.cache.broadcast_backend import BroadcastCacheBackend
+
+    logger.info("Broadcasting invalidations for '%s' over the cache invalidation bus", namespace)
+    return BroadcastCacheBackend(backend, namespace, bus)
@@ -0,0 +1,290 @@
+"""
+Cross-replica cache invalidation bus.
+
+The local TTL backend keeps each replica's cache in-process, so an invalidation
+(``delete``, ``delete_many``, ``delete_prefix``, ``clear``) only reached the replica that ran it.
+The other replicas kept serving stale decisions until the TTL expired. A bus
+broadcasts these events per cache namespace, so every replica keeps its fast
+in-process cache and still drops entries when any replica invalidates them.
+
+Two implementations:
+- LocalInvalidationBus: in-process fan-out. Used in tests to stand in for several
+  replicas, and for single-process deployments that want the same wiring.
+- RedisInvalidationBus: Redis pub/sub on one channel (requires the ``redis``
+  package, install via ``pip install mlflow-oidc-auth[cache]``).
+
+Bus selection is driven by ``CACHE_INVALIDATION_BUS`` config:
+- ``"none"`` (default): no bus; invalidation stays local.
+- ``"local"``: LocalInvalidationBus.
+- ``"redis"``: RedisInvalidationBus on ``CACHE_INVALIDATION_REDIS_URL`` (defaults
+  to ``CACHE_REDIS_URL``).
+
+Delivery is best effort. Publish failures are logged, never raised, because the
+local invalidation has already happened and TTL expiry still bounds staleness.
+If the Redis subscription drops, events may have been missed. On reconnect the
+bus sends a ``clear`` for every namespace, so no replica keeps entries it may
+have missed invalidations for.
+"""
+
+import json
+import threading
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Protocol, Tuple, Union, runtime_checkable
+
+from mlflow_oidc_auth.logger import get_logger
+
+logger = get_logger()
+
+DELETE = "delete"
+DELETE_MANY = "delete_many"
+DELETE_PREFIX = "delete_prefix"
+CLEAR = "clear"
+
+# Namespace wildcard, used for the clear-everything event after a reconnect.
+ALL_NAMESPACES = "*"
+
+_RECONNECT_BACKOFF_SECONDS = 1.0
+_RECONNECT_BACKOFF_MAX_SECONDS = 30.0
+_POLL_TIMEOUT_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class InvalidationEvent:
+    """One invalidation, as broadcast on the bus.
+
+    Attributes:
+        namespace: Cache namespace the event applies to, or ``ALL_NAMESPACES``.
+        op: ``DELETE``, ``DELETE_MANY``, ``DELETE_PREFIX`` or ``CLEAR``.
+        arg: The key or prefix, a tuple of keys for ``DELETE_MANY``, or None for ``CLEAR``.
+        origin: Id of the publishing cache, so it can skip its own events.
+    """
+
+    namespace: str
+    op: str
+    arg: Union[str, Tuple[str, ...], None] = None
+    origin: str = ""
+
+    def to_message(self) -> bytes:
+        return json.dumps(asdict(self), separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_message(cls, data: bytes | str) -> "InvalidationEvent":
+        payload = json.loads(data)
+        arg = payload.get("arg")
+        if isinstance(arg, list):
+            arg = tuple(arg)
+        return cls(namespace=payload["namespace"], op=payload["op"], arg=arg, origin=payload.get("origin", ""))
+
+
+Subscriber = Callable[[InvalidationEvent], None]
+
+
+@runtime_checkable
+class InvalidationBus(Protocol):
+    """Protocol for invalidation buses."""
+
+    def publish(self, event: InvalidationEvent) -> None:
+        """Broadcast an event to every subscriber, on every replica."""
+        ...
+
+    def subscribe(self, callback: Subscriber) -> None:
+        """Register a callback for every event received from the bus."""
+        ...
+
+    def close(self) -> None:
+        """Stop receiving events and release connections."""
+        ...
+
+
+class _SubscriberList:
+    """Thread-safe subscriber registry shared by both buses."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._callbacks: List[Subscriber] = []
+
+    def add(self, callback: Subscriber) -> None:
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._callbacks.clear()
+
+    def dispatch(self, event: InvalidationEvent) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning("Cache invalidation subscriber failed for %s/%s: %s", event.namespace, event.op, e)
+
+
+class LocalInvalidationBus:
+    """In-process bus: publish delivers synchronously to every subscriber."""
+
+    def __init__(self) -> None:
+        self._subscribers = _SubscriberList()
+
+    def publish(self, event: InvalidationEvent) -> None:
+        self._subscribers.dispatch(event)
+
+    def subscribe(self, callback: Subscriber) -> None:
+        self._subscribers.add(callback)
+
+    def close(self) -> None:
+        self._subscribers.clear()
+
+
+class RedisInvalidationBus:
+    """Redis pub/sub bus.
+
+    The subscription is opened in the constructor, so a misconfigured URL fails
+    fast and no event published after construction is missed. A daemon thread
+    receives events and dispatches them to subscribers.
+
+    Parameters:
+        url: Redis connection URL.
+        channel: Pub/sub channel shared by every replica.
+    """
+
+    def __init__(self, url: str, channel: str) -> None:
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("Redis invalidation bus requires the 'redis' package. " "Install it with: pip install mlflow-oidc-auth[cache]")
+
+        self._client = redis.Redis.from_url(url, decode_responses=False)
+        self._channel = channel
+        self._subscribers = _SubscriberList()
+        self._stop = threading.Event()
+
+        try:
+            self._pubsub = self._open_subscription()
+        except redis.ConnectionError as e:
+            raise ConnectionError(f"Cannot connect to Redis at {url}: {e}") from e
+        logger.info("Redis invalidation bus subscribed to channel %s", channel)
+
+        self._thread = threading.Thread(target=self._listen, name="cache-invalidation-bus", daemon=True)
+        self._thread.start()
+
+    def _open_subscription(self):
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self._channel)
+        return pubsub
+
+    def publish(self, event: InvalidationEvent) -> None:
+        try:
+            self._client.publish(self._channel, event.to_message())
+        except Exception as e:
+            logger.warning("Cache invalidation publish failed for %s/%s; other replicas rely on TTL: %s", event.namespace, event.op, e)
+
+    def subscribe(self, callback: Subscriber) -> None:
+        self._subscribers.add(callback)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._subscribers.clear()
+        self._thread.join(timeout=_POLL_TIMEOUT_SECONDS * 2)
+        try:
+            self._pubsub.close()
+        except Exception:
+            pass
+
+    def _listen(self) -> None:
+        backoff = _RECONNECT_BACKOFF_SECONDS
+        while not self._stop.is_set():
+            try:
+                message = self._pubsub.get_message(timeout=_POLL_TIMEOUT_SECONDS)
+                if message is not None and message.get("type") == "message":
+                    self._dispatch(message["data"])
+                backoff = _RECONNECT_BACKOFF_SECONDS
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                logger.warning("Cache invalidation bus lost its subscription (%s); reconnecting in %.0fs", e, backoff)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, _RECONNECT_BACKOFF_MAX_SECONDS)
+                self._reconnect()
+
+    def _reconnect(self) -> None:
+        try:
+            self._pubsub.close()
+        except Exception:
+            pass
+        try:
+            self._pubsub = self._open_subscription()
+        except Exception as e:
+            logger.warning("Cache invalidation bus reconnect failed: %s", e)
+            return
+        # Events published while disconnected are gone; drop everything they could
+        # have invalidated.
+        logger.info("Cache invalidation bus resubscribed; clearing local caches")
+        self._subscribers.dispatch(InvalidationEvent(namespace=ALL_NAMESPACES, op=CLEAR))
+
+    def _dispatch(self, data: bytes) -> None:
+        try:
+            event = InvalidationEvent.from_message(data)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring malformed cache invalidation message: %s", e)
+            return
+        self._subscribers.dispatch(event)
+
+
+_bus: InvalidationBus | None = None
+_bus_resolved = False
+_bus_lock = threading.Lock()
+
+
+def _create_invalidation_bus() -> InvalidationBus | None:
+    from mlflow_oidc_auth.config import config
+
+    bus_type = getattr(config, "CACHE_INVALIDATION_BUS", "none")
+
+    if bus_type in ("none", "", None):
+        return None
+
+    if bus_type == "local":
+        logger.info("Using local cache invalidation bus")
+        return LocalInvalidationBus()
+
+    if bus_type == "redis":
+        redis_url = getattr(config, "CACHE_INVALIDATION_REDIS_URL", None) or getattr(config, "CACHE_REDIS_URL", None)
+        if not redis_url:
+            raise ValueError("CACHE_INVALIDATION_BUS is set to 'redis' but neither CACHE_INVALIDATION_REDIS_URL nor CACHE_REDIS_URL is configured")
+        key_prefix = getattr(config, "CACHE_KEY_PREFIX", "mlflow_oidc_auth:")
+        channel = getattr(config, "CACHE_INVALIDATION_CHANNEL", None) or f"{key_prefix}invalidation"
+        return RedisInvalidationBus(url=redis_url, channel=channel)
+
+    raise ValueError(f"Unknown CACHE_INVALIDATION_BUS: '{bus_type}'. Supported values: 'none', 'local', 'redis'")
+
+
+def get_invalidation_bus() -> InvalidationBus | None:
+    """Return the process-wide invalidation bus, or None when none is configured.
+
+    Created on first use and shared by every cache namespace.
+
+    Raises:
+        ValueError: If ``CACHE_INVALIDATION_BUS`` is unknown, or ``redis`` is
+            selected without a Redis URL.
+        ImportError: If ``"redis"`` is selected but the redis package is missing.
+        ConnectionError: If ``"redis"`` is selected but the server is unreachable.
+    """
+    global _bus, _bus_resolved
+    if not _bus_resolved:
+        with _bus_lock:
+            if not _bus_resolved:
+                _bus = _create_invalidation_bus()
+                _bus_resolved = True
+    return _bus
+
+
+def reset_invalidation_bus() -> None:
+    """Close and forget the process-wide bus (tests)."""
+    global _bus, _bus_resolved
+    with _bus_lock:
+        if _bus is not None:
+            _bus.close()
+        _bus = None
+        _bus_resolved = False
@@ -7,11 +7,12 @@ or when cross-replica cache coherence is not required.
 
 Limitations:
 - Each process has its own isolated cache.
-- Cache invalidation is local only — other replicas are unaware.
-- TTL expiry is the only cross-replica consistency mechanism.
+- Cache invalidation is local only, unless ``CACHE_INVALIDATION_BUS`` is set, in
+  which case the factory wraps this backend in a BroadcastCacheBackend.
+- Without a bus, TTL expiry is the only cross-replica consistency mechanism.
 """
 
-from typing import Any
+from typing import Any, Dict, Iterable, Mapping
 
 from cachetools import TTLCache
 
@@ -36,6 +37,22 @@ class LocalTTLCacheBackend:
     def delete(self, key: str) -> None:
         self._cache.pop(key, None)
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        found = {}
+        for key in keys:
+            value = self._cache.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        for key, value in items.items():
+            self._cache[key] = value
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._cache.pop(key, None)
+
     def delete_prefix(self, prefix: str) -> None:
         # Materialize the key list first: TTLCache mutates on iteration when
         # entries expire, and we delete while walking it.
@@ -2,7 +2,8 @@
 Redis-backed cache backend for multi-replica deployments.
 
 Requires the ``redis`` package (install via ``pip install mlflow-oidc-auth[cache]``).
-Values are serialized with pickle for round-trip fidelity of arbitrary Python objects.
+Values are serialized by a pluggable codec (see ``codec``); the factory picks it
+from ``CACHE_CODEC``. Without one, values are pickled.
 
 Configuration:
 - ``CACHE_REDIS_URL``: Redis connection URL (e.g. ``redis://localhost:6379/0``).
@@ -11,9 +12,9 @@ Configuration:
 Thread-safety: redis-py's ConnectionPool is thread-safe.
 """
 
-import pickle
-from typing import Any
+from typing import Any, Dict, Iterable, Mapping
 
+from mlflow_oidc_auth.cache.codec import CacheCodec, PickleCodec
 from mlflow_oidc_auth.logger import get_logger
 
 logger = get_logger()
@@ -36,9 +37,10 @@ class RedisCacheBackend:
         url: Redis connection URL.
         prefix: Key prefix for namespace isolation.
         ttl: Default time-to-live in seconds for each entry.
+        codec: Value codec. Defaults to PickleCodec.
     """
 
-    def __init__(self, url: str, prefix: str, ttl: int) -> None:
+    def __init__(self, url: str, prefix: str, ttl: int, codec: CacheCodec | None = None) -> None:
         try:
             import redis
         except ImportError:
@@ -47,6 +49,7 @@ class RedisCacheBackend:
         self._client = redis.Redis.from_url(url, decode_responses=False)
         self._prefix = prefix
         self._ttl = ttl
+        self._codec = codec or PickleCodec()
 
         # Verify connectivity at init time so misconfig fails fast
         try:
@@ -62,15 +65,54 @@ class RedisCacheBackend:
         raw = self._client.get(self._make_key(key))
         if raw is None:
             return None
-        return pickle.loads(raw)
+        return self._decode(key, raw)
 
     def set(self, key: str, value: Any) -> None:
-        raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
-        self._client.setex(self._make_key(key), self._ttl, raw)
+        self._client.setex(self._make_key(key), self._ttl, self._codec.encode(value))
+
+    def _decode(self, key: str, raw: bytes) -> Any | None:
+        # An entry written by another release may not decode (unknown class or
+        # encoding). Treat it as a miss; the caller recomputes and overwrites it.
+        try:
+            return self._codec.decode(raw)
+        except Exception as e:
+            logger.warning("Ignoring undecodable cache entry %s: %s", self._make_key(key), e)
+            return None
 
     def delete(self, key: str) -> None:
         self._client.delete(self._make_key(key))
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Fetch every key with a single MGET."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        raws = self._client.mget([self._make_key(key) for key in keys])
+        found = {}
+        for key, raw in zip(keys, raws):
+            value = self._decode(key, raw) if raw is not None else None
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Write every entry with SETEX in one pipelined round trip.
+
+        Not a MULTI/EXEC transaction: entries are independent, and a partial
+        write only costs a later cache miss.
+        """
+        if not items:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.setex(self._make_key(key), self._ttl, self._codec.encode(value))
+        pipe.execute()
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        keys = [self._make_key(key) for key in keys]
+        if keys:
+            self._client.delete(*keys)
+
     def delete_prefix(self, prefix: str) -> None:
         """Delete every key in this namespace starting with ``prefix``.
 
@@ -0,0 +1,114 @@
+"""
+Two-tier cache backend: a small in-process L1 in front of a shared Redis L2.
+
+A Redis-only cache pays a network round trip and an unpickle on every hit.
+Permission checks run on every request, so the tiered backend serves hot keys
+from an in-process TTL cache and falls back to Redis only on an L1 miss. Cold
+entries are still shared across replicas through L2.
+
+- ``get``: L1, then L2. An L2 hit is copied into L1.
+- ``set``: written to L2, then L1.
+- ``delete`` / ``delete_prefix`` / ``clear``: applied to L1, then L2.
+
+Other replicas' L1 entries are invalidated through the cache invalidation bus
+when one is configured (``CACHE_INVALIDATION_BUS``). Without a bus they expire
+after the L1 TTL, which is why that TTL defaults to a few seconds.
+
+Per-tier hit and miss counters are available via ``stats()``.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, Mapping
+
+from mlflow_oidc_auth.cache.backend import CacheBackend
+
+
+class TieredCacheBackend:
+    """Read-through L1/L2 cache with write-through invalidation.
+
+    Parameters:
+        l1: In-process backend for hot keys (small maxsize, short TTL).
+        l2: Shared backend, normally RedisCacheBackend.
+    """
+
+    def __init__(self, l1: CacheBackend, l2: CacheBackend) -> None:
+        self._l1 = l1
+        self._l2 = l2
+        self._stats_lock = threading.Lock()
+        self._l1_hits = 0
+        self._l1_misses = 0
+        self._l2_hits = 0
+        self._l2_misses = 0
+
+    def get(self, key: str) -> Any | None:
+        value = self._l1.get(key)
+        if value is not None:
+            with self._stats_lock:
+                self._l1_hits += 1
+            return value
+
+        value = self._l2.get(key)
+        with self._stats_lock:
+            self._l1_misses += 1
+            if value is None:
+                self._l2_misses += 1
+            else:
+                self._l2_hits += 1
+        if value is not None:
+            self._l1.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._l2.set(key, value)
+        self._l1.set(key, value)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """L1 for every key, then one L2 batch read for the L1 misses."""
+        keys = list(keys)
+        found = self._l1.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        from_l2 = self._l2.get_many(missing) if missing else {}
+        with self._stats_lock:
+            self._l1_hits += len(found)
+            self._l1_misses += len(missing)
+            self._l2_hits += len(from_l2)
+            self._l2_misses += len(missing) - len(from_l2)
+        if from_l2:
+            self._l1.set_many(from_l2)
+            found.update(from_l2)
+        return found
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        self._l2.set_many(items)
+        self._l1.set_many(items)
+
+    def delete(self, key: str) -> None:
+        self._l1.delete(key)
+        self._l2.delete(key)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        self._l1.delete_many(keys)
+        self._l2.delete_many(keys)
+
+    def delete_prefix(self, prefix: str) -> None:
+        self._l1.delete_prefix(prefix)
+        self._l2.delete_prefix(prefix)
+
+    def clear(self) -> None:
+        self._l1.clear()
+        self._l2.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return per-tier hit and miss counts since construction (or the last reset)."""
+        with self._stats_lock:
+            return {
+                "l1_hits": self._l1_hits,
+                "l1_misses": self._l1_misses,
+                "l2_hits": self._l2_hits,
+                "l2_misses": self._l2_misses,
+            }
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._l1_hits = self._l1_misses = self._l2_hits = self._l2_misses = 0
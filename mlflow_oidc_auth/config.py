@@ -125,11 +125,22 @@ class AppConfig:
 
         # JWKS caching settings
         self.OIDC_JWKS_CACHE_TTL_SECONDS = config_manager.get_int("OIDC_JWKS_CACHE_TTL_SECONDS", default=300)
+        # Validated bearer tokens are cached (keyed by SHA-256 of the token) until their own
+        # exp, capped at this many seconds. 0 disables.
+        self.OIDC_TOKEN_CACHE_TTL_SECONDS = config_manager.get_int("OIDC_TOKEN_CACHE_TTL_SECONDS", default=300)
+        self.OIDC_TOKEN_CACHE_MAX_SIZE = config_manager.get_int("OIDC_TOKEN_CACHE_MAX_SIZE", default=4096)
 
         # HTTP timeout for OIDC discovery and JWKS fetches (seconds). Without
         # this, a hung IdP can block request threads until the OS-level TCP
         # timeout (~2 minutes), causing cascading auth failures.
         self.OIDC_HTTP_TIMEOUT_SECONDS = config_manager.get_int("OIDC_HTTP_TIMEOUT_SECONDS", default=10)
+        # Discovery documents are shared by the login and key-set paths and kept this long
+        # (seconds). 0 disables the cache.
+        self.OIDC_DISCOVERY_CACHE_TTL_SECONDS = config_manager.get_int("OIDC_DISCOVERY_CACHE_TTL_SECONDS", default=3600)
+        # At startup every provider's discovery document is fetched concurrently; providers
+        # still pending after this many seconds are reported as timed out and left to load on
+        # first use. 0 skips the warm-up.
+        self.OIDC_PROVIDER_STARTUP_TIMEOUT_SECONDS = config_manager.get_int("OIDC_PROVIDER_STARTUP_TIMEOUT_SECONDS", default=10)
         # TLS verification for OIDC discovery/JWKS and the token endpoint. Default True;
         # only disable for providers with self-signed certs in trusted networks.
         self.OIDC_VERIFY_SSL = config_manager.get_bool("OIDC_VERIFY_SSL", default=True)
@@ -153,6 +164,17 @@ class AppConfig:
 
         self.PERMISSION_CACHE_TTL_SECONDS = config_manager.get_int("PERMISSION_CACHE_TTL_SECONDS", default=30)
 
+        # Longest allow-list a search pushes into its SQL query before leaving filtering to the
+        # after-request refetch loop (utils/search_pushdown.py); 0 disables pushdown.
+        self.SEARCH_PUSHDOWN_MAX_IDS = config_manager.get_int("SEARCH_PUSHDOWN_MAX_IDS", default=5000)
+        # How long a user's readable/manageable resource index (utils/resource_index.py) is
+        # reused. Local permission writes rebuild it sooner; 0 rebuilds on every listing.
+        self.RESOURCE_INDEX_TTL_SECONDS = config_manager.get_int("RESOURCE_INDEX_TTL_SECONDS", default=30)
+        # How long a user's gateway endpoint capability map (utils/gateway_capabilities.py)
+        # is reused by the gateway proxy check. Permission writes rebuild it sooner, on other
+        # replicas too when CACHE_INVALIDATION_BUS is set; 0 rebuilds on every proxied call.
+        self.GATEWAY_CAPABILITY_TTL_SECONDS = config_manager.get_int("GATEWAY_CAPABILITY_TTL_SECONDS", default=30)
+
         # username source
         self.OIDC_USERNAME_FIELD = config_manager.get_list("OIDC_USERNAME_FIELD", default=["email", "preferred_username"])
         self.OIDC_DISPLAY_NAME_FIELD = config_manager.get_list("OIDC_DISPLAY_NAME_FIELD", default=["name"])
@@ -193,18 +215,72 @@ class AppConfig:
         # Workspace feature flags
         self.MLFLOW_ENABLE_WORKSPACES = config_manager.get_bool("MLFLOW_ENABLE_WORKSPACES", default=False)
 
+        # Successful Basic-auth verifications are remembered in-process for this long, so
+        # repeated requests skip the password hash. 0 disables.
+        self.BASIC_AUTH_CACHE_TTL_SECONDS = config_manager.get_int("BASIC_AUTH_CACHE_TTL_SECONDS", default=60)
+        self.BASIC_AUTH_CACHE_MAX_SIZE = config_manager.get_int("BASIC_AUTH_CACHE_MAX_SIZE", default=1024)
+
+        # Run/trace id -> experiment id. The mapping never changes, so entries live long; 0 disables.
+        self.EXPERIMENT_RESOLVER_CACHE_TTL_SECONDS = config_manager.get_int("EXPERIMENT_RESOLVER_CACHE_TTL_SECONDS", default=86400)
+        self.EXPERIMENT_RESOLVER_CACHE_MAX_SIZE = config_manager.get_int("EXPERIMENT_RESOLVER_CACHE_MAX_SIZE", default=100000)
+
+        # Experiment id -> name/workspace/lifecycle for regex and workspace checks; 0 disables.
+        # Renames and moves change permission decisions, so without CACHE_INVALIDATION_BUS this
+        # bounds how long other replicas decide on the old value, like PERMISSION_CACHE_TTL_SECONDS.
+        self.EXPERIMENT_METADATA_CACHE_TTL_SECONDS = config_manager.get_int("EXPERIMENT_METADATA_CACHE_TTL_SECONDS", default=30)
+        self.EXPERIMENT_METADATA_CACHE_MAX_SIZE = config_manager.get_int("EXPERIMENT_METADATA_CACHE_MAX_SIZE", default=10000)
+
+        # Worker threads for blocking store calls made from async handlers and the auth
+        # middleware (utils/offload.py). Separate from the default anyio thread limiter; 0 runs
+        # the calls inline on the event loop.
+        self.STORE_OFFLOAD_MAX_THREADS = config_manager.get_int("STORE_OFFLOAD_MAX_THREADS", default=32)
+
+        # The mounted MLflow Flask app runs on a thread pool of its own (middleware/wsgi_bridge.py):
+        # at most this many Flask requests at once, the rest queue. Responses of known length
+        # are sent in chunks of up to WSGI_BRIDGE_CHUNK_SIZE bytes.
+        self.WSGI_BRIDGE_MAX_WORKERS = config_manager.get_int("WSGI_BRIDGE_MAX_WORKERS", default=16)
+        self.WSGI_BRIDGE_CHUNK_SIZE = config_manager.get_int("WSGI_BRIDGE_CHUNK_SIZE", default=65536)
+
+        # Trash cleanup runs as a background job (jobs/trash_gc.py): runs are hard-deleted
+        # TRASH_GC_BATCH_SIZE per transaction, with up to TRASH_GC_PARALLELISM artifact deletions
+        # at once. A running job whose worker has not checkpointed for TRASH_GC_LEASE_SECONDS is
+        # taken over by another; idle workers look for jobs every TRASH_GC_POLL_SECONDS.
+        self.TRASH_GC_BATCH_SIZE = config_manager.get_int("TRASH_GC_BATCH_SIZE", default=500)
+        self.TRASH_GC_PARALLELISM = config_manager.get_int("TRASH_GC_PARALLELISM", default=4)
+        self.TRASH_GC_LEASE_SECONDS = config_manager.get_int("TRASH_GC_LEASE_SECONDS", default=300)
+        self.TRASH_GC_POLL_SECONDS = config_manager.get_int("TRASH_GC_POLL_SECONDS", default=30)
+
         # Workspace cache settings
         self.WORKSPACE_CACHE_MAX_SIZE = config_manager.get_int("WORKSPACE_CACHE_MAX_SIZE", default=1024)
         self.WORKSPACE_CACHE_TTL_SECONDS = config_manager.get_int("WORKSPACE_CACHE_TTL_SECONDS", default=300)
+        # Denials ("no workspace grant") are cached separately with a short TTL. The
+        # invalidation hooks purge them on every workspace permission change. 0 disables.
+        self.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = config_manager.get_int("WORKSPACE_DENIAL_CACHE_TTL_SECONDS", default=10)
 
         # Proxy trust settings
         self.TRUSTED_PROXIES = config_manager.get_list("TRUSTED_PROXIES", default=[])
 
         # Cache backend settings
-        # "local" (default, in-process TTLCache) or "redis" (shared across replicas)
+        # "local" (default, in-process TTLCache), "redis" (shared across replicas) or
+        # "tiered" (small in-process L1 in front of a shared Redis L2)
         self.CACHE_BACKEND = config_manager.get("CACHE_BACKEND", "local")
         self.CACHE_REDIS_URL = config_manager.get("CACHE_REDIS_URL")
         self.CACHE_KEY_PREFIX = config_manager.get("CACHE_KEY_PREFIX", "mlflow_oidc_auth:")
+        # Redis value encoding: "compact" (permission decisions in a few bytes, pickle
+        # for other values) or "pickle". Defaults to "pickle" for this release: replicas
+        # of a release that predates codecs share the same Redis during a rolling upgrade
+        # and cannot read compact entries. Set "compact" once every replica runs this
+        # release; compact becomes the default in the next one.
+        self.CACHE_CODEC = config_manager.get("CACHE_CODEC", "pickle")
+        # Tiered backend L1 bounds. Both are capped by the cache's own size and TTL.
+        self.CACHE_L1_MAX_SIZE = config_manager.get_int("CACHE_L1_MAX_SIZE", default=1024)
+        self.CACHE_L1_TTL_SECONDS = config_manager.get_int("CACHE_L1_TTL_SECONDS", default=5)
+        # Cross-replica invalidation for local caches: "none" (default), "local" (in-process)
+        # or "redis" (pub/sub). The Redis URL defaults to CACHE_REDIS_URL and the channel
+        # to "<CACHE_KEY_PREFIX>invalidation".
+        self.CACHE_INVALIDATION_BUS = config_manager.get("CACHE_INVALIDATION_BUS", "none")
+        self.CACHE_INVALIDATION_REDIS_URL = config_manager.get("CACHE_INVALIDATION_REDIS_URL")
+        self.CACHE_INVALIDATION_CHANNEL = config_manager.get("CACHE_INVALIDATION_CHANNEL")
 
         # Database connection pool settings (auth DB only — separate from MLflow tracking store)
         # These are passed to SQLAlchemy's create_engine().  A value of 0 / None
@@ -213,6 +289,15 @@ class AppConfig:
         self.DB_POOL_MAX_OVERFLOW = config_manager.get_int("OIDC_DB_POOL_MAX_OVERFLOW", default=0)
         self.DB_POOL_RECYCLE_SECONDS = config_manager.get_int("OIDC_DB_POOL_RECYCLE_SECONDS", default=0)
 
+        # Read replicas of the auth database (comma-separated URIs, same schema as the
+        # primary). Read-only sessions go to a healthy replica, writes to the primary.
+        # After any write, and after a cache invalidation from another process, reads stay
+        # on the primary for the read-your-writes window; size it above the replica lag.
+        # A replica that fails to connect is skipped for the retry interval.
+        self.OIDC_USERS_DB_REPLICA_URIS = [uri for uri in config_manager.get_list("OIDC_USERS_DB_REPLICA_URIS") if uri]
+        self.DB_REPLICA_READ_YOUR_WRITES_SECONDS = config_manager.get_int("OIDC_DB_REPLICA_READ_YOUR_WRITES_SECONDS", default=5)
+        self.DB_REPLICA_RETRY_SECONDS = config_manager.get_int("OIDC_DB_REPLICA_RETRY_SECONDS", default=30)
+
         # OIDC workspace detection settings
         self.OIDC_WORKSPACE_CLAIM_NAME = config_manager.get("OIDC_WORKSPACE_CLAIM_NAME", "workspace")
         self.OIDC_WORKSPACE_DETECTION_PLUGIN = config_manager.get("OIDC_WORKSPACE_DETECTION_PLUGIN")
@@ -223,6 +308,25 @@ class AppConfig:
         # Audit logging settings
         self.AUDIT_LOG_ENABLED = config_manager.get_bool("AUDIT_LOG_ENABLED", default=True)
         self.AUDIT_LOG_LEVEL = config_manager.get("AUDIT_LOG_LEVEL", "INFO")
+        # In the server, audit events are queued and written by a background thread
+        # (audit_pipeline.py). Up to AUDIT_QUEUE_SIZE events wait; when the queue is full,
+        # AUDIT_QUEUE_FULL_POLICY either drops the oldest ("drop-oldest") or makes the emitter
+        # wait ("block"). The writer hands at most AUDIT_BATCH_SIZE events at a time to each of
+        # AUDIT_SINKS ("log", "stream", "file", "http"). Shutdown waits up to
+        # AUDIT_SHUTDOWN_TIMEOUT_SECONDS for the queue to drain.
+        self.AUDIT_LOG_ASYNC = config_manager.get_bool("AUDIT_LOG_ASYNC", default=True)
+        self.AUDIT_QUEUE_SIZE = config_manager.get_int("AUDIT_QUEUE_SIZE", default=10000)
+        self.AUDIT_QUEUE_FULL_POLICY = config_manager.get("AUDIT_QUEUE_FULL_POLICY", "drop-oldest")
+        self.AUDIT_BATCH_SIZE = config_manager.get_int("AUDIT_BATCH_SIZE", default=500)
+        self.AUDIT_SINKS = config_manager.get_list("AUDIT_SINKS", default=["log"])
+        self.AUDIT_SHUTDOWN_TIMEOUT_SECONDS = config_manager.get_int("AUDIT_SHUTDOWN_TIMEOUT_SECONDS", default=10)
+        # The "file" sink: rotated at AUDIT_FILE_MAX_BYTES, keeping AUDIT_FILE_BACKUP_COUNT old files.
+        self.AUDIT_FILE_PATH = config_manager.get("AUDIT_FILE_PATH")
+        self.AUDIT_FILE_MAX_BYTES = config_manager.get_int("AUDIT_FILE_MAX_BYTES", default=104857600)
+        self.AUDIT_FILE_BACKUP_COUNT = config_manager.get_int("AUDIT_FILE_BACKUP_COUNT", default=5)
+        # The "http" sink: each batch is POSTed to AUDIT_HTTP_URL as newline-delimited JSON.
+        self.AUDIT_HTTP_URL = config_manager.get("AUDIT_HTTP_URL")
+        self.AUDIT_HTTP_TIMEOUT_SECONDS = config_manager.get_int("AUDIT_HTTP_TIMEOUT_SECONDS", default=5)
 
         # API documentation settings
         self.ENABLE_API_DOCS = config_manager.get_bool("ENABLE_API_DOCS", default=False)
@@ -29,7 +29,9 @@ SECRET_CLASSIFICATION: dict[str, SecretLevel] = {
     "OIDC_CLIENT_SECRET": SecretLevel.SECRET,
     # Sensitive - should not be logged
     "OIDC_USERS_DB_URI": SecretLevel.SENSITIVE,
+    "OIDC_USERS_DB_REPLICA_URIS": SecretLevel.SENSITIVE,
     "OIDC_CLIENT_ID": SecretLevel.SENSITIVE,
+    "AUDIT_HTTP_URL": SecretLevel.SENSITIVE,
     # Everything else is public by default
 }
 
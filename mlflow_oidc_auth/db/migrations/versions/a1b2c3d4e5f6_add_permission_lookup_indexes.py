@@ -0,0 +1,70 @@
+"""add permission lookup indexes
+
+Revision ID: a1b2c3d4e5f6
+Revises: 9c0d1e2f3456
+Create Date: 2026-10-18 00:00:00.000000
+
+The permission tables were only indexed by their unique constraints, which all lead with
+the resource (``(experiment_id, user_id)``, ``(regex, group_id)``, ...). Every per-user and
+per-group lookup on the request path filters by ``user_id`` or ``group_id`` alone, so SQLite
+and PostgreSQL scanned the whole table for them. This adds those indexes, and ``(prompt, ...)``
+ones on the registered model regex tables, which every lookup also filters by ``prompt``.
+
+``user_groups`` already has ``(user_id, group_id)``, which serves lookups by user; it only
+needed one for listing a group's members. Indexes only: no data changes.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a1b2c3d4e5f6"
+down_revision = "9c0d1e2f3456"
+branch_labels = None
+depends_on = None
+
+# (table, indexed columns); the index is named ix_<table>_<columns>.
+INDEXES = [
+    ("experiment_permissions", ["user_id"]),
+    ("experiment_group_permissions", ["group_id"]),
+    ("experiment_regex_permissions", ["user_id"]),
+    ("experiment_group_regex_permissions", ["group_id"]),
+    ("registered_model_permissions", ["user_id"]),
+    ("registered_model_group_permissions", ["group_id"]),
+    ("registered_model_regex_permissions", ["prompt", "user_id"]),
+    ("registered_model_group_regex_permissions", ["prompt", "group_id"]),
+    ("scorer_permissions", ["user_id"]),
+    ("scorer_group_permissions", ["group_id"]),
+    ("scorer_regex_permissions", ["user_id"]),
+    ("scorer_group_regex_permissions", ["group_id"]),
+    ("gateway_endpoint_permissions", ["user_id"]),
+    ("gateway_endpoint_group_permissions", ["group_id"]),
+    ("gateway_endpoint_regex_permissions", ["user_id"]),
+    ("gateway_endpoint_group_regex_permissions", ["group_id"]),
+    ("gateway_model_definition_permissions", ["user_id"]),
+    ("gateway_model_definition_group_permissions", ["group_id"]),
+    ("gateway_model_definition_regex_permissions", ["user_id"]),
+    ("gateway_model_definition_group_regex_permissions", ["group_id"]),
+    ("gateway_secret_permissions", ["user_id"]),
+    ("gateway_secret_group_permissions", ["group_id"]),
+    ("gateway_secret_regex_permissions", ["user_id"]),
+    ("gateway_secret_group_regex_permissions", ["group_id"]),
+    ("workspace_permissions", ["user_id"]),
+    ("workspace_group_permissions", ["group_id"]),
+    ("workspace_regex_permissions", ["user_id"]),
+    ("workspace_group_regex_permissions", ["group_id"]),
+    ("user_groups", ["group_id"]),
+]
+
+
+def _index_name(table: str, columns: list) -> str:
+    return f"ix_{table}_{'_'.join(columns)}"
+
+
+def upgrade() -> None:
+    for table, columns in INDEXES:
+        op.create_index(_index_name(table, columns), table, columns)
+
+
+def downgrade() -> None:
+    for table, columns in reversed(INDEXES):
+        op.drop_index(_index_name(table, columns), table_name=table)
@@ -0,0 +1,75 @@
+"""add trash gc jobs
+
+Revision ID: b2c3d4e5f6a7
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 00:00:00.000000
+
+``POST /oidc/trash/cleanup`` now enqueues a job instead of deleting inside the request. These
+two tables hold the queue and each job's checkpoint: the job row records where it has got to
+and the item rows record which runs and experiments are still to do, so a job interrupted by a
+restart resumes rather than starting again. New tables only: no existing data changes.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b2c3d4e5f6a7"
+down_revision = "a1b2c3d4e5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trash_gc_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("phase", sa.String(length=32), nullable=False),
+        sa.Column("requested_by", sa.String(length=255), nullable=False),
+        sa.Column("workspace", sa.String(length=255), nullable=True),
+        sa.Column("older_than", sa.String(length=64), nullable=True),
+        sa.Column("older_than_ms", sa.BigInteger(), server_default="0", nullable=False),
+        # Explicit id lists as the admin supplied them, comma-separated. Text because a UI
+        # selection has no useful length bound.
+        sa.Column("run_ids", sa.Text(), nullable=True),
+        sa.Column("experiment_ids", sa.Text(), nullable=True),
+        sa.Column("total_runs", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("deleted_runs", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("failed_runs", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_experiments", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("deleted_experiments", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("failed_experiments", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("claimed_by", sa.String(length=255), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Workers look for claimable jobs by status.
+    op.create_index("ix_trash_gc_jobs_status", "trash_gc_jobs", ["status"])
+
+    op.create_table(
+        "trash_gc_job_items",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("resource_id", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["trash_gc_jobs.id"], name="fk_trash_gc_job_items_job_id", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_trash_gc_job_items_job_id_kind_resource_id", "trash_gc_job_items", ["job_id", "kind", "resource_id"], unique=True)
+    # Every batch is "the next N unfinished items of this kind for this job".
+    op.create_index("ix_trash_gc_job_items_job_id_kind_status", "trash_gc_job_items", ["job_id", "kind", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_trash_gc_job_items_job_id_kind_status", table_name="trash_gc_job_items")
+    op.drop_index("ix_trash_gc_job_items_job_id_kind_resource_id", table_name="trash_gc_job_items")
+    op.drop_table("trash_gc_job_items")
+    op.drop_index("ix_trash_gc_jobs_status", table_name="trash_gc_jobs")
+    op.drop_table("trash_gc_jobs")
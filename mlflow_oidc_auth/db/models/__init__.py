@@ -30,6 +30,7 @@ from mlflow_oidc_auth.db.models.registered_model import (
     SqlRegisteredModelPermission,
     SqlRegisteredModelRegexPermission,
 )
+from mlflow_oidc_auth.db.models.trash_gc import SqlTrashGcJob, SqlTrashGcJobItem
 from mlflow_oidc_auth.db.models.scorer import (
     SqlScorerGroupPermission,
     SqlScorerGroupRegexPermission,
@@ -78,4 +79,6 @@ __all__ = [
     "SqlWorkspaceGroupPermission",
     "SqlWorkspaceRegexPermission",
     "SqlWorkspaceGroupRegexPermission",
+    "SqlTrashGcJob",
+    "SqlTrashGcJobItem",
 ]
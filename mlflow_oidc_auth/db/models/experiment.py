@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from mlflow_oidc_auth.db.models._base import Base
@@ -11,7 +11,10 @@ class SqlExperimentPermission(Base):
     experiment_id: Mapped[str] = mapped_column(String(255), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("experiment_id", "user_id", name="unique_experiment_user"),)
+    __table_args__ = (
+        UniqueConstraint("experiment_id", "user_id", name="unique_experiment_user"),
+        Index("ix_experiment_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return ExperimentPermission(
@@ -27,7 +30,10 @@ class SqlExperimentGroupPermission(Base):
     experiment_id: Mapped[str] = mapped_column(String(255), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("experiment_id", "group_id", name="unique_experiment_group"),)
+    __table_args__ = (
+        UniqueConstraint("experiment_id", "group_id", name="unique_experiment_group"),
+        Index("ix_experiment_group_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return ExperimentPermission(
@@ -44,7 +50,10 @@ class SqlExperimentRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "user_id", name="unique_experiment_user_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "user_id", name="unique_experiment_user_regex"),
+        Index("ix_experiment_regex_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return ExperimentRegexPermission(
@@ -63,7 +72,10 @@ class SqlExperimentGroupRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "group_id", name="unique_experiment_group_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "group_id", name="unique_experiment_group_regex"),
+        Index("ix_experiment_group_regex_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return ExperimentGroupRegexPermission(
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from mlflow_oidc_auth.db.models._base import Base
@@ -11,7 +11,10 @@ class SqlGatewayModelDefinitionPermission(Base):
     model_definition_id: Mapped[str] = mapped_column(String(255), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("model_definition_id", "user_id", name="unique_model_def_user"),)
+    __table_args__ = (
+        UniqueConstraint("model_definition_id", "user_id", name="unique_model_def_user"),
+        Index("ix_gateway_model_definition_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return GatewayModelDefinitionPermission(
@@ -27,7 +30,10 @@ class SqlGatewayModelDefinitionGroupPermission(Base):
     model_definition_id: Mapped[str] = mapped_column(String(255), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("model_definition_id", "group_id", name="unique_model_def_group"),)
+    __table_args__ = (
+        UniqueConstraint("model_definition_id", "group_id", name="unique_model_def_group"),
+        Index("ix_gateway_model_definition_group_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return GatewayModelDefinitionPermission(
@@ -44,7 +50,10 @@ class SqlGatewayModelDefinitionRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "user_id", name="unique_model_def_user_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "user_id", name="unique_model_def_user_regex"),
+        Index("ix_gateway_model_definition_regex_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return GatewayModelDefinitionRegexPermission(
@@ -63,7 +72,10 @@ class SqlGatewayModelDefinitionGroupRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "group_id", name="unique_model_def_group_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "group_id", name="unique_model_def_group_regex"),
+        Index("ix_gateway_model_definition_group_regex_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return GatewayModelDefinitionGroupRegexPermission(
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from mlflow_oidc_auth.db.models._base import Base
@@ -12,7 +12,10 @@ class SqlGatewaySecretPermission(Base):
     secret_id: Mapped[str] = mapped_column(String(255), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("secret_id", "user_id", name="unique_secret_user"),)
+    __table_args__ = (
+        UniqueConstraint("secret_id", "user_id", name="unique_secret_user"),
+        Index("ix_gateway_secret_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return GatewaySecretPermission(
@@ -28,7 +31,10 @@ class SqlGatewaySecretGroupPermission(Base):
     secret_id: Mapped[str] = mapped_column(String(255), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("secret_id", "group_id", name="unique_secret_group"),)
+    __table_args__ = (
+        UniqueConstraint("secret_id", "group_id", name="unique_secret_group"),
+        Index("ix_gateway_secret_group_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return GatewaySecretPermission(
@@ -45,7 +51,10 @@ class SqlGatewaySecretRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "user_id", name="unique_secret_user_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "user_id", name="unique_secret_user_regex"),
+        Index("ix_gateway_secret_regex_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return GatewaySecretRegexPermission(
@@ -64,7 +73,10 @@ class SqlGatewaySecretGroupRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "group_id", name="unique_secret_group_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "group_id", name="unique_secret_group_regex"),
+        Index("ix_gateway_secret_group_regex_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return GatewaySecretGroupRegexPermission(
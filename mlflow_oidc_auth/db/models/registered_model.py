@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from mlflow_oidc_auth.db.models._base import Base
@@ -11,7 +11,10 @@ class SqlRegisteredModelPermission(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("name", "user_id", name="unique_name_user"),)
+    __table_args__ = (
+        UniqueConstraint("name", "user_id", name="unique_name_user"),
+        Index("ix_registered_model_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return RegisteredModelPermission(
@@ -28,7 +31,10 @@ class SqlRegisteredModelGroupPermission(Base):
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
     prompt: Mapped[bool] = mapped_column(Boolean, default=False)
-    __table_args__ = (UniqueConstraint("name", "group_id", name="unique_name_group"),)
+    __table_args__ = (
+        UniqueConstraint("name", "group_id", name="unique_name_group"),
+        Index("ix_registered_model_group_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return RegisteredModelPermission(
@@ -47,7 +53,10 @@ class SqlRegisteredModelRegexPermission(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
     prompt: Mapped[bool] = mapped_column(Boolean, default=False)
-    __table_args__ = (UniqueConstraint("regex", "user_id", "prompt", name="unique_name_user_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "user_id", "prompt", name="unique_name_user_regex"),
+        Index("ix_registered_model_regex_permissions_prompt_user_id", "prompt", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return RegisteredModelRegexPermission(
@@ -68,7 +77,10 @@ class SqlRegisteredModelGroupRegexPermission(Base):
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
     prompt: Mapped[bool] = mapped_column(Boolean, default=False)
-    __table_args__ = (UniqueConstraint("regex", "group_id", "prompt", name="unique_name_group_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "group_id", "prompt", name="unique_name_group_regex"),
+        Index("ix_registered_model_group_regex_permissions_prompt_group_id", "prompt", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return RegisteredModelGroupRegexPermission(
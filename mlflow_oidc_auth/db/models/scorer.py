@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from mlflow_oidc_auth.db.models._base import Base
@@ -12,7 +12,10 @@ class SqlScorerPermission(Base):
     scorer_name: Mapped[str] = mapped_column(String(256), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("experiment_id", "scorer_name", "user_id", name="unique_scorer_user"),)
+    __table_args__ = (
+        UniqueConstraint("experiment_id", "scorer_name", "user_id", name="unique_scorer_user"),
+        Index("ix_scorer_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return ScorerPermission(
@@ -30,7 +33,10 @@ class SqlScorerGroupPermission(Base):
     scorer_name: Mapped[str] = mapped_column(String(256), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("experiment_id", "scorer_name", "group_id", name="unique_scorer_group"),)
+    __table_args__ = (
+        UniqueConstraint("experiment_id", "scorer_name", "group_id", name="unique_scorer_group"),
+        Index("ix_scorer_group_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return ScorerPermission(
@@ -48,7 +54,10 @@ class SqlScorerRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "user_id", name="unique_scorer_user_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "user_id", name="unique_scorer_user_regex"),
+        Index("ix_scorer_regex_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self):
         return ScorerRegexPermission(
@@ -67,7 +76,10 @@ class SqlScorerGroupRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "group_id", name="unique_scorer_group_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "group_id", name="unique_scorer_group_regex"),
+        Index("ix_scorer_group_regex_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return ScorerGroupRegexPermission(
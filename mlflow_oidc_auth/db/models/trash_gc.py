@@ -0,0 +1,77 @@
+"""Trash garbage-collection jobs.
+
+Permanently deleting the trash used to happen inside the ``POST /oidc/trash/cleanup`` request,
+which timed out long before a large trash was empty. The request now records a job here and a
+background worker (``mlflow_oidc_auth/jobs/trash_gc.py``) works through it in batches.
+
+The job row is the checkpoint: its ``phase`` and counters, and the status of each item, are
+written after every batch, so a worker that stops — a restart, a crash, a lost lease — leaves
+enough behind for the next one to pick up where it left off rather than start over.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from mlflow_oidc_auth.db.models._base import Base
+
+
+class SqlTrashGcJob(Base):
+    """One request to permanently delete trashed runs and experiments.
+
+    ``status`` is the lifecycle (``queued``, ``running``, ``completed``, ``failed``); ``phase`` is
+    where a running job has got to (``collect``, ``runs``, ``experiments``). ``claimed_by`` and
+    ``heartbeat_at`` are the worker's lease: a running job whose heartbeat is older than the
+    lease is considered abandoned and may be claimed by another worker.
+
+    The request's filters are kept as given — ``older_than`` as the text the admin typed, for
+    display, and as the milliseconds it parsed to, which is what the worker uses.
+    """
+
+    __tablename__ = "trash_gc_jobs"
+    id: Mapped[int] = mapped_column(Integer(), primary_key=True)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    phase: Mapped[str] = mapped_column(String(32), nullable=False)
+    requested_by: Mapped[str] = mapped_column(String(255), nullable=False)
+    workspace: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    older_than: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    older_than_ms: Mapped[int] = mapped_column(BigInteger(), nullable=False, default=0)
+    run_ids: Mapped[Optional[str]] = mapped_column(Text(), nullable=True)
+    experiment_ids: Mapped[Optional[str]] = mapped_column(Text(), nullable=True)
+    total_runs: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    deleted_runs: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    failed_runs: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    total_experiments: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    deleted_experiments: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    failed_experiments: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    claimed_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(), nullable=False, server_default=func.now())
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(), nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text(), nullable=True)
+    __table_args__ = (Index("ix_trash_gc_jobs_status", "status"),)
+
+
+class SqlTrashGcJobItem(Base):
+    """One run or experiment a job is to delete.
+
+    ``status`` is ``pending`` until a worker takes the item into a batch, ``processing`` while
+    that batch is in flight, and ``deleted`` or ``failed`` once it has been recorded. An item
+    left ``processing`` by a worker that stopped is retried by the next one, which treats a run
+    that no longer exists as deleted rather than failed: the previous worker got that far.
+    """
+
+    __tablename__ = "trash_gc_job_items"
+    id: Mapped[int] = mapped_column(Integer(), primary_key=True)
+    job_id: Mapped[int] = mapped_column(ForeignKey("trash_gc_jobs.id", ondelete="CASCADE"), nullable=False)
+    kind: Mapped[str] = mapped_column(String(16), nullable=False)
+    resource_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    error: Mapped[Optional[str]] = mapped_column(Text(), nullable=True)
+    __table_args__ = (
+        Index("ix_trash_gc_job_items_job_id_kind_resource_id", "job_id", "kind", "resource_id", unique=True),
+        Index("ix_trash_gc_job_items_job_id_kind_status", "job_id", "kind", "status"),
+    )
@@ -106,7 +106,10 @@ class SqlUserGroup(Base):
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     # Whether this membership was set by an admin or derived from a provider claim (issue #333).
     managed_by: Mapped[str] = mapped_column(String(255), nullable=False, server_default="manual", default="manual")
-    __table_args__ = (UniqueConstraint("user_id", "group_id", name="unique_user_group"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "group_id", name="unique_user_group"),
+        Index("ix_user_groups_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self):
         return UserGroup(
@@ -1,6 +1,6 @@
 """SQLAlchemy ORM models for workspace permission tables."""
 
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from mlflow_oidc_auth.db.models._base import Base
@@ -20,6 +20,7 @@ class SqlWorkspacePermission(Base):
     workspace: Mapped[str] = mapped_column(String(255), primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
     permission: Mapped[str] = mapped_column(String(255), nullable=False)
+    __table_args__ = (Index("ix_workspace_permissions_user_id", "user_id"),)
 
     user = relationship("SqlUser")
 
@@ -40,6 +41,7 @@ class SqlWorkspaceGroupPermission(Base):
     workspace: Mapped[str] = mapped_column(String(255), primary_key=True)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), primary_key=True)
     permission: Mapped[str] = mapped_column(String(255), nullable=False)
+    __table_args__ = (Index("ix_workspace_group_permissions_group_id", "group_id"),)
 
     group = relationship("SqlGroup")
 
@@ -61,7 +63,10 @@ class SqlWorkspaceRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "user_id", name="unique_workspace_user_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "user_id", name="unique_workspace_user_regex"),
+        Index("ix_workspace_regex_permissions_user_id", "user_id"),
+    )
 
     def to_mlflow_entity(self) -> WorkspaceRegexPermission:
         return WorkspaceRegexPermission(
@@ -82,7 +87,10 @@ class SqlWorkspaceGroupRegexPermission(Base):
     priority: Mapped[int] = mapped_column(Integer(), nullable=False)
     group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
     permission: Mapped[str] = mapped_column(String(255))
-    __table_args__ = (UniqueConstraint("regex", "group_id", name="unique_workspace_group_regex"),)
+    __table_args__ = (
+        UniqueConstraint("regex", "group_id", name="unique_workspace_group_regex"),
+        Index("ix_workspace_group_regex_permissions_group_id", "group_id"),
+    )
 
     def to_mlflow_entity(self) -> WorkspaceGroupRegexPermission:
         return WorkspaceGroupRegexPermission(
@@ -0,0 +1,152 @@
+"""
+Route auth-database sessions between the primary and its read replicas.
+
+Every repository already says which sessions write: ``self._Session()`` for reads and
+``self._Session(read_only=False)`` for writes (the flag MLflow's managed session maker
+checks under test). With ``OIDC_USERS_DB_REPLICA_URIS`` set, ``SqlAlchemyStore`` uses a
+:class:`RoutingSessionMaker` in place of that maker:
+
+- Writes go to the primary.
+- Reads go to a healthy replica, round robin, unless the primary is pinned (below).
+- After a write commits, every read in the process goes to the primary for
+  ``DB_REPLICA_READ_YOUR_WRITES_SECONDS``. Permission caches rebuild straight after a grant
+  changes; that rebuild must not read a replica that has not caught up, or the stale
+  result would be cached for its whole TTL. An invalidation arriving on the cache bus from
+  another process pins the primary the same way.
+- :func:`primary_reads` sends the reads inside it to the primary, for code that must see
+  its own or another worker's latest write (a session created on another worker, a lookup
+  that feeds a write).
+
+Health checks ride on connection checkout. A read opens its replica connection before the
+session starts, and the engines ping on checkout (``pool_pre_ping``), so a replica that is
+down fails there and the read fails over to the primary. The replica is then skipped for
+``DB_REPLICA_RETRY_SECONDS``; the first read after that is its re-check. A replica that
+fails in the middle of a read marks itself down the same way, but that read raises: the
+session has already returned rows to the caller and cannot be replayed.
+"""
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Iterator, List, Optional, Tuple
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import TEMPORARILY_UNAVAILABLE, ErrorCode
+from mlflow.store.db.utils import _get_managed_session_maker
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from mlflow_oidc_auth.logger import get_logger
+
+logger = get_logger()
+
+_primary_reads: ContextVar[bool] = ContextVar("auth_db_primary_reads", default=False)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Send the read-only sessions opened inside the block to the primary."""
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+class _Replica:
+    """One replica engine and its health."""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.bind_session = sessionmaker()
+        self.down_until = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+
+class RoutingSessionMaker:
+    """A drop-in for MLflow's managed session maker that routes reads to replicas.
+
+    Called as ``maker()`` or ``maker(read_only=False)``, like the maker it replaces, and
+    returns the same committed-or-rolled-back session context.
+
+    Args:
+        primary: The managed session maker of the primary database.
+        replicas: One engine per replica.
+        db_type: The dialect name, as MLflow's managed session maker expects it.
+        read_your_writes_seconds: How long reads stay on the primary after a write.
+        retry_seconds: How long a replica that failed is skipped.
+    """
+
+    def __init__(self, primary, replicas: List[Engine], db_type: str, read_your_writes_seconds: float, retry_seconds: float) -> None:
+        self._primary = primary
+        self._replicas = [_Replica(engine) for engine in replicas]
+        self._db_type = db_type
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._retry_seconds = retry_seconds
+        self._pinned_until = 0.0
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def __call__(self, read_only: bool = True) -> Iterator[Session]:
+        target = self._replica_connection() if read_only else None
+        if target is None:
+            with self._primary(read_only=read_only) as session:
+                yield session
+            if not read_only:
+                self.pin_primary()
+            return
+
+        replica, connection = target
+        try:
+            with _get_managed_session_maker(partial(replica.bind_session, bind=connection), self._db_type)(read_only=True) as session:
+                yield session
+        except MlflowException as e:
+            if e.error_code == ErrorCode.Name(TEMPORARILY_UNAVAILABLE):
+                self._mark_down(replica, e)
+            raise
+        finally:
+            connection.close()
+
+    def pin_primary(self) -> None:
+        """Keep reads on the primary for the read-your-writes window, starting now."""
+        self._pinned_until = max(self._pinned_until, time.monotonic() + self._read_your_writes_seconds)
+
+    def replica_status(self) -> List[Tuple[str, bool]]:
+        """Each replica's URL (password hidden) and whether reads currently use it."""
+        now = time.monotonic()
+        return [(replica.name, replica.down_until <= now) for replica in self._replicas]
+
+    def dispose(self) -> None:
+        for replica in self._replicas:
+            replica.engine.dispose()
+
+    def _replica_connection(self) -> Optional[Tuple[_Replica, Connection]]:
+        """A live connection to the next healthy replica, or None to read from the primary."""
+        now = time.monotonic()
+        if _primary_reads.get() or now < self._pinned_until:
+            return None
+        start = next(self._next)
+        for offset in range(len(self._replicas)):
+            replica = self._replicas[(start + offset) % len(self._replicas)]
+            if replica.down_until > now:
+                continue
+            try:
+                return replica, replica.engine.connect()
+            except SQLAlchemyError as e:
+                self._mark_down(replica, e)
+        return None
+
+    def _mark_down(self, replica: _Replica, error: Exception) -> None:
+        with self._lock:
+            was_up = replica.down_until <= time.monotonic()
+            replica.down_until = time.monotonic() + self._retry_seconds
+        if was_up:
+            logger.warning(f"Auth DB replica {replica.name} failed, reading from the primary for {self._retry_seconds}s: {error}")
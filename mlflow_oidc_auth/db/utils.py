@@ -1,10 +1,18 @@
 from pathlib import Path
+from typing import Optional, Set
 
 from alembic.command import upgrade
 from alembic.config import Config
 from alembic.migration import MigrationContext
 from alembic.script import ScriptDirectory
+from sqlalchemy import column, select, table
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+# The newest revision in migrations/versions, shipped with the code. Every worker compares the
+# database against it on boot, and only loads Alembic when they differ. Update it with every new
+# migration; test_db_utils fails if it does not match the script directory's head.
+HEAD_REVISION = "b2c3d4e5f6a7"
 
 
 def _get_alembic_dir() -> str:
@@ -34,10 +42,28 @@ def migrate(engine: Engine, revision: str) -> None:
         upgrade(alembic_cfg, revision)
 
 
+def current_revisions(engine: Engine) -> Optional[Set[str]]:
+    """The revisions recorded in the version table, or None if it cannot be read (a new database)."""
+    from mlflow_oidc_auth.config import config
+
+    query = select(column("version_num")).select_from(table(config.OIDC_ALEMBIC_VERSION_TABLE))
+    try:
+        with engine.connect() as conn:
+            return {row[0] for row in conn.execute(query)}
+    except SQLAlchemyError:
+        return None
+
+
 def migrate_if_needed(engine: Engine, revision: str) -> None:
+    from mlflow_oidc_auth.config import config
+
+    # Loading the Alembic config and scripts costs every worker a noticeable part of its boot,
+    # and is wasted on a database that is already current, which is nearly every boot.
+    if revision == "head" and current_revisions(engine) == {HEAD_REVISION}:
+        return
     alembic_cfg = _get_alembic_config(engine.url.render_as_string(hide_password=False))
     script_dir = ScriptDirectory.from_config(alembic_cfg)
     with engine.begin() as conn:
-        context = MigrationContext.configure(conn)
+        context = MigrationContext.configure(conn, opts={"version_table": config.OIDC_ALEMBIC_VERSION_TABLE})
         if context.get_current_revision() != script_dir.get_current_head():
             upgrade(alembic_cfg, revision)
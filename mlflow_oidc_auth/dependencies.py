@@ -14,6 +14,7 @@ from mlflow_oidc_auth.utils import (
     get_is_admin,
     get_username,
 )
+from mlflow_oidc_auth.utils.offload import run_blocking
 from mlflow_oidc_auth.utils.workspace_cache import get_workspace_permission_cached
 
 
@@ -89,7 +90,7 @@ async def check_experiment_manage_permission(
     HTTPException
         If the user doesn't have management permission for the experiment.
     """
-    if not is_admin and not can_manage_experiment(experiment_id, current_username):
+    if not is_admin and not await run_blocking(can_manage_experiment, experiment_id, current_username):
         raise HTTPException(
             status_code=403,
             detail=f"Insufficient permissions to manage experiment {experiment_id}",
@@ -120,7 +121,7 @@ async def check_registered_model_manage_permission(
     --------
     None
     """
-    if not is_admin and not can_manage_registered_model(name, current_username):
+    if not is_admin and not await run_blocking(can_manage_registered_model, name, current_username):
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage {name}")
 
     return None
@@ -137,7 +138,7 @@ async def check_prompt_manage_permission(
     in the system. Users with admin rights or explicit manage permission can proceed.
     """
 
-    if not is_admin and not can_manage_registered_model(prompt_name, current_username):
+    if not is_admin and not await run_blocking(can_manage_registered_model, prompt_name, current_username):
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage {prompt_name}")
 
     return None
@@ -154,7 +155,7 @@ async def check_gateway_endpoint_manage_permission(
     """
     from mlflow_oidc_auth.utils.permissions import can_manage_gateway_endpoint
 
-    if not is_admin and not can_manage_gateway_endpoint(name, current_username):
+    if not is_admin and not await run_blocking(can_manage_gateway_endpoint, name, current_username):
         raise HTTPException(
             status_code=403,
             detail=f"Insufficient permissions to manage endpoint {name}",
@@ -174,7 +175,7 @@ async def check_gateway_secret_manage_permission(
     """
     from mlflow_oidc_auth.utils.permissions import can_manage_gateway_secret
 
-    if not is_admin and not can_manage_gateway_secret(name, current_username):
+    if not is_admin and not await run_blocking(can_manage_gateway_secret, name, current_username):
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage secret {name}")
 
     return None
@@ -191,7 +192,7 @@ async def check_gateway_model_definition_manage_permission(
     """
     from mlflow_oidc_auth.utils.permissions import can_manage_gateway_model_definition
 
-    if not is_admin and not can_manage_gateway_model_definition(name, current_username):
+    if not is_admin and not await run_blocking(can_manage_gateway_model_definition, name, current_username):
         raise HTTPException(
             status_code=403,
             detail=f"Insufficient permissions to manage model definition {name}",
@@ -231,7 +232,7 @@ async def check_scorer_manage_permission(
             detail="Missing required parameters: experiment_id and scorer_name",
         )
 
-    if not is_admin and not can_manage_scorer(str(experiment_id), str(scorer_name), str(current_username)):
+    if not is_admin and not await run_blocking(can_manage_scorer, str(experiment_id), str(scorer_name), str(current_username)):
         raise HTTPException(
             status_code=403,
             detail=f"Insufficient permissions to manage scorer {scorer_name}",
@@ -265,7 +266,7 @@ async def check_workspace_manage_permission(
     if not config.MLFLOW_ENABLE_WORKSPACES:
         raise HTTPException(status_code=403, detail="Workspaces are not enabled")
 
-    perm = get_workspace_permission_cached(username, workspace)
+    perm = await run_blocking(get_workspace_permission_cached, username, workspace)
     if perm is None or not perm.can_manage:
         raise HTTPException(
             status_code=403,
@@ -300,7 +301,7 @@ async def check_workspace_read_permission(
     if not config.MLFLOW_ENABLE_WORKSPACES:
         raise HTTPException(status_code=403, detail="Workspaces are not enabled")
 
-    perm = get_workspace_permission_cached(username, workspace)
+    perm = await run_blocking(get_workspace_permission_cached, username, workspace)
     if perm is None or not perm.can_read:
         raise HTTPException(
             status_code=403,
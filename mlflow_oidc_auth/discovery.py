@@ -0,0 +1,103 @@
+"""OIDC discovery documents, fetched once per URL and shared.
+
+A provider's discovery document had three independent readers. authlib's client loaded it on
+the first login in each process. ``auth._fetch_jwks`` fetched it again before every key-set
+fetch, so once per ``OIDC_JWKS_CACHE_TTL_SECONDS`` per provider. The RFC 9207 and PKCE checks
+read authlib's copy. They now share one cache here, keyed by URL. The startup warm-up
+(``oauth.start_providers``) fills it and seeds each authlib client from it, so neither the
+first login nor the first bearer token waits on the IdP for discovery.
+
+Documents are kept for ``OIDC_DISCOVERY_CACHE_TTL_SECONDS``. Fetches are single-flight per URL,
+and failures are not cached: the next caller tries again. A response without ``issuer`` or
+``jwks_uri``, such as a transient IdP error body, is handed to the caller but not cached.
+"""
+
+import threading
+from typing import Callable, Dict, Optional
+
+import requests
+from cachetools import TTLCache
+
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+
+logger = get_logger()
+
+_CACHE_MAX_SIZE = 64
+# A response without these is an error body or a different resource, not a discovery document.
+_REQUIRED_FIELDS = ("issuer", "jwks_uri")
+
+_documents: TTLCache = TTLCache(maxsize=_CACHE_MAX_SIZE, ttl=max(config.OIDC_DISCOVERY_CACHE_TTL_SECONDS, 1))
+_documents_lock = threading.Lock()
+# One lock per URL, so a slow IdP holds up only the callers waiting for its own document.
+_fetch_locks: Dict[str, threading.Lock] = {}
+
+
+def get_discovery_document(url: str, *, verify=None, fetch: Optional[Callable[[], object]] = None, force_refresh: bool = False) -> dict:
+    """The discovery document at ``url``, from the cache or fetched.
+
+    Parameters:
+        url: The provider's ``/.well-known/openid-configuration`` URL.
+        verify: TLS verification for the fetch. Defaults to ``OIDC_VERIFY_SSL``.
+        fetch: Fetches the document on a miss, for a caller with its own HTTP settings.
+            Defaults to a plain GET of ``url``.
+        force_refresh: Fetch even if a document is cached, and replace it.
+
+    Raises:
+        requests.exceptions.RequestException: If the fetch fails.
+        ValueError: If the response is not a JSON object.
+    """
+    cached = None if force_refresh else _cached(url)
+    if cached is not None:
+        return cached
+
+    with _documents_lock:
+        fetch_lock = _fetch_locks.setdefault(url, threading.Lock())
+    with fetch_lock:
+        # Another caller may have fetched it while this one waited.
+        cached = None if force_refresh else _cached(url)
+        if cached is not None:
+            return cached
+        document = fetch() if fetch is not None else _fetch(url, verify)
+        if not isinstance(document, dict):
+            raise ValueError(f"OIDC discovery document at {url} is not a JSON object")
+        missing = [field for field in _REQUIRED_FIELDS if not document.get(field)]
+        if missing:
+            # An IdP error body ({"error": "temporarily_unavailable"}) parses as an object too;
+            # cached, it would break every key-set load for the whole TTL. The caller gets it
+            # once and reports it, and the next caller fetches again.
+            logger.warning("Not caching OIDC discovery document at %s: no %s", url, ", ".join(missing))
+        elif config.OIDC_DISCOVERY_CACHE_TTL_SECONDS > 0:
+            with _documents_lock:
+                _documents[url] = document
+    return document
+
+
+def cached_discovery_document(url: str) -> Optional[dict]:
+    """The cached document for ``url``, or None. Never fetches."""
+    return _cached(url)
+
+
+def clear_discovery_cache() -> None:
+    """Forget every cached document."""
+    with _documents_lock:
+        _documents.clear()
+
+
+def _cached(url: str) -> Optional[dict]:
+    with _documents_lock:
+        return _documents.get(url)
+
+
+def _fetch(url: str, verify) -> dict:
+    logger.debug("Fetching OIDC discovery metadata from %s", url)
+    # Redirects are not followed: the document names the key set, so a 302 must be a visible
+    # configuration error rather than a silent change of source.
+    response = requests.get(
+        url,
+        timeout=config.OIDC_HTTP_TIMEOUT_SECONDS,
+        verify=config.OIDC_VERIFY_SSL if verify is None else verify,
+        allow_redirects=False,
+    )
+    response.raise_for_status()
+    return response.json()
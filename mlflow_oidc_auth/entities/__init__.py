@@ -10,6 +10,7 @@ from mlflow_oidc_auth.entities.registered_model import (
     RegisteredModelGroupRegexPermission,
     RegisteredModelRegexPermission,
 )
+from mlflow_oidc_auth.entities.resource_principal import ResourcePrincipal
 from mlflow_oidc_auth.entities.scorer import (
     ScorerPermission,
     ScorerGroupRegexPermission,
@@ -48,6 +49,7 @@ __all__ = [
     "RegisteredModelPermission",
     "RegisteredModelGroupRegexPermission",
     "RegisteredModelRegexPermission",
+    "ResourcePrincipal",
     "ScorerPermission",
     "ScorerGroupRegexPermission",
     "ScorerRegexPermission",
@@ -0,0 +1,35 @@
+"""
+A principal's grant on one resource, as returned by the reverse "who has access" lookups.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ResourcePrincipal:
+    """One grant that applies to a resource.
+
+    Attributes:
+        name: Username or group name.
+        permission: The permission the grant gives.
+        kind: ``user``, ``service-account`` or ``group``.
+        source: Where the grant comes from, named as in ``PERMISSION_SOURCE_ORDER``:
+                ``user``, ``group``, ``regex`` or ``group-regex``.
+        regex: The matching rule's pattern, for regex-derived grants.
+    """
+
+    name: str
+    permission: str
+    kind: str
+    source: str
+    regex: Optional[str] = None
+
+    def to_json(self):
+        return {
+            "name": self.name,
+            "permission": self.permission,
+            "kind": self.kind,
+            "source": self.source,
+            "regex": self.regex,
+        }
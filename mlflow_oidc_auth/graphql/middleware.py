@@ -10,6 +10,7 @@ from mlflow.server.handlers import _get_tracking_store
 from mlflow_oidc_auth.bridge import get_fastapi_admin_status, get_fastapi_username
 from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.utils import effective_experiment_permission, effective_registered_model_permission
+from mlflow_oidc_auth.utils.experiment_resolver import experiment_id_for_run, experiment_ids_for_runs
 
 logger = get_logger()
 
@@ -85,9 +86,7 @@ def _can_read_run(run_id: str, username: str) -> bool:
     its experiment and then apply experiment READ checks.
     """
 
-    tracking_store = _get_tracking_store()
-    run = tracking_store.get_run(run_id)
-    return _can_read_experiment(run.info.experiment_id, username)
+    return _can_read_experiment(experiment_id_for_run(_get_tracking_store(), run_id), username)
 
 
 def _can_read_model(model_name: str, username: str) -> bool:
@@ -191,11 +190,9 @@ class GraphQLAuthorizationMiddleware:
             return True if run_id is None else _can_read_run(str(run_id), username)
 
         if field_name == "mlflowGetMetricHistoryBulkInterval":
-            run_ids: Sequence[str] = _get_input_attr(input_obj, "run_ids", []) or []
-            for run_id in run_ids:
-                if not _can_read_run(str(run_id), username):
-                    return False
-            return True
+            run_ids: Sequence[str] = [str(run_id) for run_id in _get_input_attr(input_obj, "run_ids", []) or []]
+            experiment_ids = experiment_ids_for_runs(_get_tracking_store(), run_ids)
+            return all(_can_read_experiment(experiment_ids[run_id], username) for run_id in run_ids)
 
         if field_name in ("mlflowSearchRuns", "mlflowSearchDatasets"):
             experiment_ids: Sequence[str] = _get_input_attr(input_obj, "experiment_ids", []) or []
@@ -12,6 +12,7 @@ from mlflow.protos.service_pb2 import (
     CreateGatewayModelDefinition,
     CreateGatewaySecret,
     CreateWorkspace,
+    DeleteExperiment,
     DeleteGatewayEndpoint,
     DeleteGatewayModelDefinition,
     DeleteGatewaySecret,
@@ -22,8 +23,10 @@ from mlflow.protos.service_pb2 import (
     ListGatewaySecretInfos,
     ListWorkspaces,
     RegisterScorer,
+    RestoreExperiment,
     SearchExperiments,
     SearchLoggedModels,
+    UpdateExperiment,
     UpdateGatewayEndpoint,
 )
 from mlflow.server.handlers import (
@@ -50,10 +53,24 @@ from mlflow_oidc_auth.utils import (
     get_model_name,
 )
 from mlflow_oidc_auth.utils.permissions import (
+    EXPERIMENT,
+    GATEWAY_ENDPOINT,
+    GATEWAY_MODEL_DEFINITION,
+    GATEWAY_SECRET,
+    REGISTERED_MODEL,
     can_read_gateway_endpoint,
     can_read_gateway_model_definition,
     can_read_gateway_secret,
+    resolve_permissions_many,
 )
+from mlflow_oidc_auth.utils.experiment_metadata import (
+    get_experiment_metadata,
+    get_experiments_metadata,
+    invalidate_experiment_metadata,
+    remember_experiments,
+)
+from mlflow_oidc_auth.utils.gateway_capabilities import invalidate_gateway_capabilities
+from mlflow_oidc_auth.utils.resource_index import invalidate_resource_indexes
 from mlflow_oidc_auth.utils.workspace_cache import (
     flush_workspace_cache,
     get_workspace_permission_cached,
@@ -83,6 +100,22 @@ def _get_request_permission_cache() -> dict:
     return cache
 
 
+def _prefetch_can_read(kind: str, resource_type: str, resource_ids, username: str) -> None:
+    """Decide a whole page in one batched lookup before the per-row checks.
+
+    Fills the request-scoped dict under the same keys the ``_cached_can_read_*``
+    helpers use, so they find every row already decided. A page then costs one
+    batched permission-cache read and at most one write, instead of one of each
+    per row. Ids already memoized for this request are skipped.
+    """
+    cache = _get_request_permission_cache()
+    missing = [resource_id for resource_id in dict.fromkeys(resource_ids) if (kind, resource_id, username) not in cache]
+    if not missing:
+        return
+    for resource_id, result in resolve_permissions_many(resource_type, missing, username).items():
+        cache[(kind, resource_id, username)] = result.permission.can_read
+
+
 def _cached_can_read_experiment(experiment_id: str, username: str) -> bool:
     """can_read_experiment with request-scoped memoization."""
     cache = _get_request_permission_cache()
@@ -134,6 +167,8 @@ def _set_can_manage_experiment_permission(resp: Response):
     experiment_id = response_message.experiment_id
     username = get_fastapi_username()
     store.create_experiment_permission(experiment_id, username, MANAGE.name)
+    # Another user's regex rule may match the new name.
+    invalidate_resource_indexes(EXPERIMENT)
 
 
 def _set_can_manage_registered_model_permission(resp: Response):
@@ -142,6 +177,20 @@ def _set_can_manage_registered_model_permission(resp: Response):
     name = response_message.registered_model.name
     username = get_fastapi_username()
     store.create_registered_model_permission(name, username, MANAGE.name)
+    invalidate_resource_indexes(REGISTERED_MODEL)
+
+
+def _invalidate_experiment_metadata(resp: Response):
+    """Drop the cached name/workspace/lifecycle of a renamed, deleted or restored experiment.
+
+    A rename can also change which regex rules match, so regex-built resource indexes
+    are marked stale too.
+    """
+    data = request.get_json(force=True, silent=True)
+    experiment_id = data.get("experiment_id") if data else None
+    if experiment_id:
+        invalidate_experiment_metadata(experiment_id)
+        invalidate_resource_indexes(EXPERIMENT)
 
 
 def _delete_can_manage_registered_model_permission(resp: Response):
@@ -199,6 +248,22 @@ def _can_access_workspace(username: str, workspace: str | None) -> bool:
     return cache[key]
 
 
+def _experiment_workspaces(tracking_store, experiment_ids) -> dict:
+    """Map experiment ids to workspaces in one metadata lookup; None for any that cannot be read."""
+    try:
+        return {experiment_id: metadata.workspace for experiment_id, metadata in get_experiments_metadata(tracking_store, experiment_ids).items()}
+    except Exception:
+        pass
+    # One id failed the bulk lookup; resolve the rest one by one so only that one is denied.
+    workspaces = {}
+    for experiment_id in dict.fromkeys(experiment_ids):
+        try:
+            workspaces[experiment_id] = get_experiment_metadata(tracking_store, experiment_id).workspace
+        except Exception:
+            workspaces[experiment_id] = None
+    return workspaces
+
+
 def _filter_search_experiments(resp: Response):
     if get_fastapi_admin_status():
         return
@@ -210,19 +275,14 @@ def _filter_search_experiments(resp: Response):
     username = get_fastapi_username()
 
     # Filter out unreadable experiments from the current response page.
+    _prefetch_can_read("exp", EXPERIMENT, [e.experiment_id for e in response_message.experiments], username)
     for e in list(response_message.experiments):
         if not _cached_can_read_experiment(e.experiment_id, username):
             response_message.experiments.remove(e)
 
     # Filter by workspace permission (WSSEC-01)
     if config.MLFLOW_ENABLE_WORKSPACES:
-        tracking_store = _get_tracking_store()
-        ws_map = {}
-        for e in list(response_message.experiments):
-            try:
-                ws_map[e.experiment_id] = tracking_store.get_experiment(e.experiment_id).workspace
-            except Exception:
-                ws_map[e.experiment_id] = None
+        ws_map = _experiment_workspaces(_get_tracking_store(), [e.experiment_id for e in response_message.experiments])
         for e in list(response_message.experiments):
             if not _can_access_workspace(username, ws_map.get(e.experiment_id)):
                 response_message.experiments.remove(e)
@@ -244,6 +304,9 @@ def _filter_search_experiments(resp: Response):
             response_message.next_page_token = ""
             break
 
+        # Store entities carry their workspace; keep them so the checks below need no lookup.
+        remember_experiments(refetched)
+        _prefetch_can_read("exp", EXPERIMENT, [e.experiment_id for e in refetched], username)
         readable_proto = [
             e.to_proto() for e in refetched if _cached_can_read_experiment(e.experiment_id, username) and _can_access_workspace(username, e.workspace)
         ]
@@ -267,6 +330,7 @@ def _filter_search_registered_models(resp: Response):
     username = get_fastapi_username()
 
     # Filter out unreadable models from the current response page.
+    _prefetch_can_read("rm", REGISTERED_MODEL, [rm.name for rm in response_message.registered_models], username)
     for rm in list(response_message.registered_models):
         if not _cached_can_read_registered_model(rm.name, username):
             response_message.registered_models.remove(rm)
@@ -299,6 +363,7 @@ def _filter_search_registered_models(resp: Response):
             response_message.next_page_token = ""
             break
 
+        _prefetch_can_read("rm", REGISTERED_MODEL, [rm.name for rm in refetched], username)
         readable_proto = [
             rm.to_proto() for rm in refetched if _cached_can_read_registered_model(rm.name, username) and _can_access_workspace(username, rm.workspace)
         ]
@@ -323,6 +388,7 @@ def _filter_search_model_versions(resp: Response):
     username = get_fastapi_username()
 
     # Filter out unreadable model versions from the current response page.
+    _prefetch_can_read("rm", REGISTERED_MODEL, [mv.name for mv in response_message.model_versions], username)
     for mv in list(response_message.model_versions):
         if not _cached_can_read_registered_model(mv.name, username):
             response_message.model_versions.remove(mv)
@@ -355,6 +421,7 @@ def _filter_search_model_versions(resp: Response):
             response_message.next_page_token = ""
             break
 
+        _prefetch_can_read("rm", REGISTERED_MODEL, [mv.name for mv in refetched], username)
         for mv in refetched:
             if _cached_can_read_registered_model(mv.name, username) and _can_access_workspace(username, getattr(mv, "workspace", None)):
                 response_message.model_versions.append(mv.to_proto())
@@ -380,6 +447,7 @@ def _filter_search_logged_models(resp: Response) -> None:
     username = get_fastapi_username()
 
     # Remove unreadable models from the current response page.
+    _prefetch_can_read("exp", EXPERIMENT, [m.info.experiment_id for m in response_message.models], username)
     for m in list(response_message.models):
         if not _cached_can_read_experiment(m.info.experiment_id, username):
             response_message.models.remove(m)
@@ -387,14 +455,7 @@ def _filter_search_logged_models(resp: Response) -> None:
     # Filter by workspace permission (WSSEC-03)
     exp_ws_map: dict[str, str | None] = {}
     if config.MLFLOW_ENABLE_WORKSPACES:
-        tracking_store_ws = _get_tracking_store()
-        for m in list(response_message.models):
-            exp_id = m.info.experiment_id
-            if exp_id not in exp_ws_map:
-                try:
-                    exp_ws_map[exp_id] = tracking_store_ws.get_experiment(exp_id).workspace
-                except Exception:
-                    exp_ws_map[exp_id] = None
+        exp_ws_map = _experiment_workspaces(_get_tracking_store(), [m.info.experiment_id for m in response_message.models])
         for m in list(response_message.models):
             if not _can_access_workspace(username, exp_ws_map.get(m.info.experiment_id)):
                 response_message.models.remove(m)
@@ -429,19 +490,18 @@ def _filter_search_logged_models(resp: Response) -> None:
         offset = Token.decode(next_page_token).offset if next_page_token else 0
         last_index = len(batch) - 1
 
+        _prefetch_can_read("exp", EXPERIMENT, [model.experiment_id for model in batch], username)
+        if config.MLFLOW_ENABLE_WORKSPACES:
+            unseen = [model.experiment_id for model in batch if model.experiment_id not in exp_ws_map]
+            if unseen:
+                exp_ws_map.update(_experiment_workspaces(tracking_store, unseen))
         for index, model in enumerate(batch):
             if not _cached_can_read_experiment(model.experiment_id, username):
                 continue
 
             # Workspace filtering for refetch path (WSSEC-03)
             if config.MLFLOW_ENABLE_WORKSPACES:
-                exp_id = model.experiment_id
-                if exp_id not in exp_ws_map:
-                    try:
-                        exp_ws_map[exp_id] = tracking_store.get_experiment(exp_id).workspace
-                    except Exception:
-                        exp_ws_map[exp_id] = None
-                if not _can_access_workspace(username, exp_ws_map.get(exp_id)):
+                if not _can_access_workspace(username, exp_ws_map.get(model.experiment_id)):
                     continue
 
             response_message.models.append(model.to_proto())
@@ -468,6 +528,7 @@ def _rename_registered_model_permission(resp: Response):
         return
     store.rename_registered_model_permissions(name, new_name)
     store.rename_group_model_permissions(name, new_name)
+    invalidate_resource_indexes(REGISTERED_MODEL)
 
 
 def _set_can_manage_scorer_permission(resp: Response):
@@ -498,6 +559,8 @@ def _set_can_manage_gateway_endpoint_permission(resp: Response):
     name = response_message.endpoint.name
     username = get_fastapi_username()
     store.create_gateway_endpoint_permission(name, username, MANAGE.name)
+    # Another user's regex rule may match the new name.
+    invalidate_gateway_capabilities()
 
 
 def _rename_gateway_endpoint_permission(resp: Response):
@@ -518,6 +581,7 @@ def _rename_gateway_endpoint_permission(resp: Response):
         # Name unchanged — nothing to do.
         return
 
+    invalidate_gateway_capabilities()
     try:
         store.rename_gateway_endpoint_permissions(old_name, new_name)
     except Exception:
@@ -552,6 +616,7 @@ def _filter_list_gateway_endpoints(resp: Response) -> None:
     username = get_fastapi_username()
     logger = get_logger()
 
+    _prefetch_can_read("gw_ep", GATEWAY_ENDPOINT, [endpoint.name for endpoint in response_message.endpoints], username)
     for endpoint in list(response_message.endpoints):
         if not _cached_can_read_gateway_endpoint(endpoint.name, username):
             response_message.endpoints.remove(endpoint)
@@ -570,6 +635,7 @@ def _filter_list_gateway_secrets(resp: Response) -> None:
     username = get_fastapi_username()
     logger = get_logger()
 
+    _prefetch_can_read("gw_secret", GATEWAY_SECRET, [secret.secret_name for secret in response_message.secrets], username)
     for secret in list(response_message.secrets):
         if not _cached_can_read_gateway_secret(secret.secret_name, username):
             response_message.secrets.remove(secret)
@@ -588,6 +654,7 @@ def _filter_list_gateway_model_definitions(resp: Response) -> None:
     username = get_fastapi_username()
     logger = get_logger()
 
+    _prefetch_can_read("gw_md", GATEWAY_MODEL_DEFINITION, [model_def.name for model_def in response_message.model_definitions], username)
     for model_def in list(response_message.model_definitions):
         if not _cached_can_read_gateway_model_definition(model_def.name, username):
             response_message.model_definitions.remove(model_def)
@@ -601,6 +668,7 @@ def _delete_gateway_endpoint_permissions_cascade(resp: Response) -> None:
     name = getattr(g, "_deleting_gateway_endpoint_name", None)
     if not name:
         return
+    invalidate_gateway_capabilities()
     try:
         store.wipe_gateway_endpoint_permissions(name)
     except Exception:
@@ -697,6 +765,9 @@ def _filter_list_workspaces(response: Response) -> None:
 
 AFTER_REQUEST_PATH_HANDLERS = {
     CreateExperiment: _set_can_manage_experiment_permission,
+    UpdateExperiment: _invalidate_experiment_metadata,
+    DeleteExperiment: _invalidate_experiment_metadata,
+    RestoreExperiment: _invalidate_experiment_metadata,
     CreateRegisteredModel: _set_can_manage_registered_model_permission,
     DeleteRegisteredModel: _delete_can_manage_registered_model_permission,
     SearchExperiments: _filter_search_experiments,
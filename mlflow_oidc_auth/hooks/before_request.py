@@ -110,6 +110,7 @@ from mlflow.protos.service_pb2 import (
     CancelPromptOptimizationJob,
 )
 
+from mlflow.exceptions import MlflowException
 from mlflow.server.handlers import catch_mlflow_exception, get_endpoints
 
 # Forward-compatible imports for Gateway Budget Policy protos.
@@ -619,6 +620,66 @@ def _is_workspace_gated_creation(path: str, method: str) -> bool:
     return (path, method) in _get_workspace_gated_creation_paths()
 
 
+# ---------------------------------------------------------------------------
+# Authorization-aware search (utils/search_pushdown.py)
+# ---------------------------------------------------------------------------
+
+_SEARCH_PUSHDOWN_PATHS: dict[tuple[str, str], str] | None = None
+
+
+def _get_search_pushdown_paths() -> dict[tuple[str, str], str]:
+    """Lazily map the search endpoints' (path, method) pairs to their pushdown kind."""
+    global _SEARCH_PUSHDOWN_PATHS
+    if _SEARCH_PUSHDOWN_PATHS is None:
+        from mlflow.protos.model_registry_pb2 import SearchModelVersions, SearchRegisteredModels
+        from mlflow.protos.service_pb2 import SearchExperiments, SearchLoggedModels
+
+        from mlflow_oidc_auth.utils.search_pushdown import (
+            SEARCH_EXPERIMENTS,
+            SEARCH_LOGGED_MODELS,
+            SEARCH_MODEL_VERSIONS,
+            SEARCH_REGISTERED_MODELS,
+        )
+
+        kinds = {
+            SearchExperiments: SEARCH_EXPERIMENTS,
+            SearchLoggedModels: SEARCH_LOGGED_MODELS,
+            SearchRegisteredModels: SEARCH_REGISTERED_MODELS,
+            SearchModelVersions: SEARCH_MODEL_VERSIONS,
+        }
+        paths: dict[tuple[str, str], str] = {}
+        for http_path, handler, methods in get_endpoints(lambda rc: rc if rc in kinds else None):
+            if handler in kinds:
+                for method in methods:
+                    paths[(http_path, method)] = kinds[handler]
+        _SEARCH_PUSHDOWN_PATHS = paths
+    return _SEARCH_PUSHDOWN_PATHS
+
+
+def _push_down_search(username: str) -> None:
+    """Let an authorized, non-admin search query only the rows the caller can read.
+
+    The after-request filters stay authoritative; this only spares them the refetch loop.
+    """
+    method = "GET" if request.method == "HEAD" else request.method
+    kind = _get_search_pushdown_paths().get((request.path, method))
+    if kind is None:
+        return
+
+    from mlflow.protos.service_pb2 import SearchLoggedModels
+    from mlflow.server.handlers import _get_request_message
+
+    from mlflow_oidc_auth.utils.search_pushdown import SEARCH_LOGGED_MODELS, enable_search_pushdown
+
+    experiment_ids: list = []
+    if kind == SEARCH_LOGGED_MODELS:
+        try:
+            experiment_ids = list(_get_request_message(SearchLoggedModels()).experiment_ids)
+        except MlflowException:
+            return  # MLflow rejects the malformed request itself.
+    enable_search_pushdown(kind, username, experiment_ids)
+
+
 _ARTIFACT_PROXY_MARKER = "/mlflow-artifacts/"
 
 
@@ -841,6 +902,7 @@ def before_request_hook():
             return responses.make_forbidden_response()
         if not validator(username):
             return responses.make_forbidden_response()
+    _push_down_search(username)
 
 
 before_request_hook = catch_mlflow_exception(before_request_hook)
@@ -0,0 +1,7 @@
+"""
+Background jobs.
+
+Work too long to finish inside an HTTP request is recorded in the auth database and carried
+out here, on worker threads started with the application. The request returns a job id at
+once and the client polls for progress.
+"""
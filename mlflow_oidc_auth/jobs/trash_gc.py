@@ -0,0 +1,541 @@
+"""
+Trash garbage collection as a background job.
+
+``POST /oidc/trash/cleanup`` used to find every trashed run and experiment and hard-delete them
+inside the request, which timed out on a large trash and lost all record of how far it had got.
+The endpoint now enqueues a job (``repository/trash_gc_job.py``) and returns; a worker thread
+here claims it and works through it in three phases:
+
+1. **collect** — resolve the request's filters to run and experiment ids, once, and record them
+   as the job's items. The ids are paged out of the tracking store iteratively rather than by
+   recursion, renewing the lease between pages so a large collect cannot outlive it.
+2. **runs** — take ``TRASH_GC_BATCH_SIZE`` runs at a time: check each is deleted (and old
+   enough), delete their artifacts ``TRASH_GC_PARALLELISM`` at a time, then hard-delete the
+   batch in one tracking-store transaction.
+3. **experiments** — hard-delete the experiments, which takes whatever runs they still hold.
+
+Every batch ends in a checkpoint, so a job interrupted by a restart resumes at the batch it was
+on. A clean shutdown hands the job back to the queue; a worker that dies holds it until its lease
+(``TRASH_GC_LEASE_SECONDS``) expires and another worker takes it over.
+
+**One transaction per batch.** On a SQL tracking store a batch is deleted with one statement
+per table rather than MLflow's per-run ``_hard_delete_run``, which loads each run and its
+collections through the ORM. The statements are derived from the relationships MLflow declares
+on ``SqlRun`` — rows it would cascade-delete are deleted, references it would clear are
+cleared — so they do what ``session.delete`` would do for each run. If the batch fails it is
+retried a run at a time with ``_hard_delete_run``, so one bad run cannot hold back the rest;
+other tracking stores are always deleted a run at a time.
+"""
+
+import functools
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from mlflow.entities import ViewType
+from mlflow.entities.lifecycle_stage import LifecycleStage
+from mlflow.exceptions import InvalidUrlException
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.tracking import _get_store
+from mlflow.utils.time import get_current_time_millis
+
+from mlflow_oidc_auth.audit import emit_audit_event
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.repository.trash_gc_job import (
+    COMPLETED,
+    EXPERIMENT,
+    FAILED,
+    PHASE_COLLECT,
+    PHASE_EXPERIMENTS,
+    PHASE_RUNS,
+    RUN,
+    TrashGcJob,
+    TrashGcJobRepository,
+)
+from mlflow_oidc_auth.utils.experiment_metadata import invalidate_experiment_metadata
+
+logger = get_logger()
+
+
+class _Interrupted(Exception):
+    """The worker is stopping; the job goes back to the queue as it stands."""
+
+
+class _LeaseLost(Exception):
+    """Another worker has taken the job over; this one must not write to it again."""
+
+
+@dataclass(frozen=True)
+class _RunInfo:
+    lifecycle_stage: str
+    artifact_uri: Optional[str]
+
+
+def _is_sql_store(tracking_store) -> bool:
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    return isinstance(tracking_store, SqlAlchemyStore)
+
+
+def _paginate(search, between_pages: Optional[Callable[[], None]] = None, **kwargs) -> Iterator:
+    """Yield every result of a paged tracking-store search, a page at a time.
+
+    ``between_pages``, if given, is called before each page after the first.
+    """
+    token = None
+    while True:
+        page = search(page_token=token, **kwargs)
+        yield from page
+        token = page.token
+        if not token:
+            return
+        if between_pages is not None:
+            between_pages()
+
+
+@functools.lru_cache(maxsize=1)
+def _run_delete_plan() -> Optional[Tuple[list, object]]:
+    """The statements that hard-delete a batch of runs, in the order they must run.
+
+    Returns ``(children, runs_column)``: for each one-to-many relationship MLflow declares on
+    ``SqlRun``, the referencing column and whether ``session.delete`` would delete the rows
+    (cascade) or clear the reference; then the column the runs themselves are deleted by.
+
+    None if a relationship is one this cannot mirror with a single statement — a composite key,
+    or a child with cascades of its own. Runs are then deleted one at a time instead.
+    """
+    from mlflow.store.tracking.dbmodels.models import SqlRun
+    from sqlalchemy import inspect
+    from sqlalchemy.orm.interfaces import ONETOMANY
+
+    children = []
+    for relationship in inspect(SqlRun).relationships:
+        if relationship.direction is not ONETOMANY or relationship.viewonly:
+            continue
+        if len(relationship.local_remote_pairs) != 1:
+            logger.info("SqlRun.%s has a composite key; trash GC deletes runs one at a time", relationship.key)
+            return None
+        if any(child.cascade.delete for child in relationship.mapper.relationships if child.direction is ONETOMANY):
+            logger.info("SqlRun.%s cascades further; trash GC deletes runs one at a time", relationship.key)
+            return None
+        ((_, remote),) = relationship.local_remote_pairs
+        children.append((remote, bool(relationship.cascade.delete)))
+    return children, SqlRun.run_uuid
+
+
+def _bulk_hard_delete_runs(tracking_store, run_ids: List[str]) -> bool:
+    """Hard-delete ``run_ids`` from a SQL tracking store in one transaction.
+
+    Returns False, having deleted nothing, if MLflow's mapping has no single-statement plan.
+    """
+    from sqlalchemy import delete, update
+
+    plan = _run_delete_plan()
+    if plan is None:
+        return False
+    children, runs_column = plan
+    with tracking_store.ManagedSessionMaker(read_only=False) as session:
+        for column, cascade in children:
+            if cascade:
+                session.execute(delete(column.table).where(column.in_(run_ids)))
+            else:
+                session.execute(update(column.table).where(column.in_(run_ids)).values({column.name: None}))
+        session.execute(delete(runs_column.table).where(runs_column.in_(run_ids)))
+    return True
+
+
+def _describe_runs(tracking_store, run_ids: List[str]) -> Tuple[Dict[str, _RunInfo], Dict[str, str]]:
+    """Look up what a batch needs to know about its runs.
+
+    Returns the runs that were found, and why each of the others could not be looked up. On a
+    SQL store this is one query, scoped by the store's ``_get_query`` exactly as MLflow's own
+    lookups are (by workspace, when workspaces are enabled).
+    """
+    if _is_sql_store(tracking_store):
+        from mlflow.store.tracking.dbmodels.models import SqlRun
+
+        with tracking_store.ManagedSessionMaker() as session:
+            rows = (
+                tracking_store._get_query(session, SqlRun)
+                .filter(SqlRun.run_uuid.in_(run_ids))
+                .with_entities(SqlRun.run_uuid, SqlRun.lifecycle_stage, SqlRun.artifact_uri)
+                .all()
+            )
+        found = {run_uuid: _RunInfo(lifecycle_stage, artifact_uri) for run_uuid, lifecycle_stage, artifact_uri in rows}
+        return found, {run_id: "Run not found" for run_id in run_ids if run_id not in found}
+
+    found, errors = {}, {}
+    for run_id in run_ids:
+        try:
+            run = tracking_store.get_run(run_id)
+        except Exception as e:
+            errors[run_id] = str(e)
+            continue
+        found[run_id] = _RunInfo(run.info.lifecycle_stage, run.info.artifact_uri)
+    return found, errors
+
+
+def _delete_artifacts(run_id: str, artifact_uri: Optional[str]) -> None:
+    """Delete a run's artifacts. Failures are logged, never raised: the run is deleted regardless."""
+    try:
+        get_artifact_repository(artifact_uri).delete_artifacts()
+    except InvalidUrlException as e:
+        logger.warning(f"Could not delete artifacts for run {run_id}: {str(e)}")
+    except Exception as e:
+        logger.warning(f"Error deleting artifacts for run {run_id}: {str(e)}")
+
+
+def _hard_delete_runs(tracking_store, run_ids: List[str]) -> Dict[str, str]:
+    """Hard-delete a batch of runs; returns the ones that could not be deleted, with why."""
+    if not run_ids:
+        return {}
+    if _is_sql_store(tracking_store):
+        try:
+            if _bulk_hard_delete_runs(tracking_store, run_ids):
+                return {}
+        except Exception as e:
+            logger.warning("Hard-deleting %d runs in one transaction failed (%s); deleting them one at a time", len(run_ids), e)
+
+    failures = {}
+    for run_id in run_ids:
+        try:
+            tracking_store._hard_delete_run(run_id)
+        except Exception as e:
+            logger.error(f"Error deleting run {run_id}: {str(e)}")
+            failures[run_id] = str(e)
+    return failures
+
+
+@contextmanager
+def _in_workspace(workspace: Optional[str]) -> Iterator[None]:
+    """Run with the workspace the job was requested in, as the request itself would have."""
+    if workspace is None:
+        yield
+        return
+    from mlflow.utils.workspace_context import clear_server_request_workspace, set_server_request_workspace
+
+    set_server_request_workspace(workspace)
+    try:
+        yield
+    finally:
+        clear_server_request_workspace()
+
+
+class TrashGcWorker:
+    """Claims trash GC jobs and carries them out, on a daemon thread or one at a time.
+
+    Parameters:
+        repository: Where jobs are queued. Defaults to the auth store's, resolved on first use
+            so that constructing a worker does not open the database.
+        tracking_store: The MLflow tracking store to delete from. Defaults to MLflow's.
+        batch_size: Runs per batch; defaults to ``TRASH_GC_BATCH_SIZE``.
+        parallelism: Concurrent artifact deletions; defaults to ``TRASH_GC_PARALLELISM``.
+        lease_seconds: How long a silent worker keeps a job; defaults to ``TRASH_GC_LEASE_SECONDS``.
+        poll_seconds: How often an idle worker looks for jobs; defaults to ``TRASH_GC_POLL_SECONDS``.
+        worker_id: Identifies this worker in ``claimed_by``. Unique per worker by default.
+    """
+
+    def __init__(
+        self,
+        repository: Optional[TrashGcJobRepository] = None,
+        *,
+        tracking_store=None,
+        batch_size: Optional[int] = None,
+        parallelism: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        poll_seconds: Optional[float] = None,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        self._repository = repository
+        self._tracking_store = tracking_store
+        self.batch_size = max(1, batch_size if batch_size is not None else config.TRASH_GC_BATCH_SIZE)
+        self.parallelism = max(1, parallelism if parallelism is not None else config.TRASH_GC_PARALLELISM)
+        self.lease_seconds = lease_seconds if lease_seconds is not None else config.TRASH_GC_LEASE_SECONDS
+        self.poll_seconds = poll_seconds if poll_seconds is not None else config.TRASH_GC_POLL_SECONDS
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def repository(self) -> TrashGcJobRepository:
+        if self._repository is None:
+            from mlflow_oidc_auth.store import store
+
+            self._repository = store.trash_gc_job_repo
+        return self._repository
+
+    @property
+    def tracking_store(self):
+        return self._tracking_store if self._tracking_store is not None else _get_store()
+
+    def start(self) -> None:
+        """Start the background thread. Idempotent."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="trash-gc", daemon=True)
+        self._thread.start()
+
+    def wake(self) -> None:
+        """Look for work now rather than at the next poll; called when a job is enqueued."""
+        self._wake.set()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop after the current batch, handing an unfinished job back to the queue."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def run_once(self) -> bool:
+        """Claim one job and carry it out. Returns False if there was nothing to claim."""
+        job = self.repository.claim(self.worker_id, self.lease_seconds)
+        if job is None:
+            return False
+        self._process(job)
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                worked = self.run_once()
+            except Exception:
+                logger.exception("Trash GC worker could not claim a job; retrying in %ss", self.poll_seconds)
+                worked = False
+            if not worked:
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+
+    def _process(self, job: TrashGcJob) -> None:
+        logger.info(f"Trash GC job {job.id} claimed by {self.worker_id} in phase '{job.phase}'")
+        try:
+            with _in_workspace(job.workspace):
+                self._work(job)
+        except _Interrupted:
+            self.repository.release(job.id, self.worker_id)
+            logger.info(f"Trash GC job {job.id} interrupted; returned to the queue to resume later")
+            return
+        except _LeaseLost:
+            logger.warning(f"Trash GC job {job.id} was taken over by another worker; {self.worker_id} stopped working on it")
+            return
+        except Exception as e:
+            logger.exception("Trash GC job %s failed", job.id)
+            self.repository.finish(job.id, self.worker_id, FAILED, error=str(e))
+            return
+
+        if not self.repository.finish(job.id, self.worker_id, COMPLETED):
+            return
+        finished = self.repository.get(job.id)
+        logger.info(
+            f"Trash GC job {job.id} for '{job.requested_by}' completed: " f"{finished.deleted_runs} runs, {finished.deleted_experiments} experiments deleted"
+        )
+        emit_audit_event(
+            "trash.cleanup",
+            job.requested_by,
+            resource_type="trash",
+            resource_id=str(job.id),
+            detail={
+                "deleted_runs_count": finished.deleted_runs,
+                "deleted_experiments_count": finished.deleted_experiments,
+                "failed_runs_count": finished.failed_runs,
+                "failed_experiments_count": finished.failed_experiments,
+                "older_than": job.older_than,
+            },
+        )
+
+    def _work(self, job: TrashGcJob) -> None:
+        tracking_store = self.tracking_store
+        phase = job.phase
+        if phase == PHASE_COLLECT:
+            run_ids, experiment_ids = self._collect(tracking_store, job)
+            self._checked(self.repository.start_deleting(job.id, self.worker_id, run_ids, experiment_ids))
+            phase = PHASE_RUNS
+        if phase == PHASE_RUNS:
+            self._delete_runs(tracking_store, job)
+            self._checked(self.repository.set_phase(job.id, self.worker_id, PHASE_EXPERIMENTS))
+            phase = PHASE_EXPERIMENTS
+        if phase == PHASE_EXPERIMENTS:
+            self._delete_experiments(tracking_store, job)
+
+    def _collect(self, tracking_store, job: TrashGcJob) -> Tuple[List[str], List[str]]:
+        """Resolve the job's filters to the runs and experiments it covers.
+
+        The lease is renewed after each tracking-store call and between pages, as the delete
+        phases renew it between batches.
+        """
+        heartbeat = functools.partial(self._heartbeat, job)
+        try:
+            aged_run_ids = tracking_store._get_deleted_runs(older_than=job.older_than_ms)
+        except Exception as e:
+            logger.warning(f"Could not fetch deleted runs by time criteria: {str(e)}")
+            aged_run_ids = []
+        heartbeat()
+        run_ids = list(job.run_ids) if job.run_ids else list(aged_run_ids)
+
+        experiment_ids: List[str] = []
+        if hasattr(tracking_store, "_hard_delete_experiment"):
+            if job.experiment_ids:
+                experiment_ids = list(job.experiment_ids)
+            else:
+                time_threshold = get_current_time_millis() - job.older_than_ms
+                filter_string = f"last_update_time < {time_threshold}" if job.older_than else None
+                experiments = _paginate(
+                    tracking_store.search_experiments, between_pages=heartbeat, view_type=ViewType.DELETED_ONLY, filter_string=filter_string
+                )
+                experiment_ids = [experiment.experiment_id for experiment in experiments]
+                heartbeat()
+            if experiment_ids:
+                runs = _paginate(
+                    tracking_store.search_runs,
+                    between_pages=heartbeat,
+                    experiment_ids=experiment_ids,
+                    filter_string="",
+                    run_view_type=ViewType.DELETED_ONLY,
+                )
+                run_ids.extend(run.info.run_id for run in runs)
+        else:
+            logger.warning("Backend store does not support hard deletion of experiments - skipping experiments")
+
+        return list(dict.fromkeys(run_ids)), list(dict.fromkeys(experiment_ids))
+
+    def _delete_runs(self, tracking_store, job: TrashGcJob) -> None:
+        # Which runs are old enough is asked once per pass rather than per batch. Asked again on
+        # resume, it can only have grown: runs age, they do not get younger.
+        aged: Optional[Set[str]] = None
+        if job.older_than:
+            try:
+                aged = set(tracking_store._get_deleted_runs(older_than=job.older_than_ms))
+            except Exception as e:
+                logger.warning(f"Could not fetch deleted runs by time criteria: {str(e)}")
+                aged = set()
+
+        while True:
+            self._check_stop()
+            batch = self._checked(self.repository.take_batch(job.id, self.worker_id, RUN, self.batch_size))
+            if not batch:
+                return
+            deleted, failed = self._delete_run_batch(tracking_store, batch, aged, job.older_than)
+            self._checked(self.repository.record_batch(job.id, self.worker_id, RUN, deleted, failed))
+
+    def _delete_run_batch(self, tracking_store, batch: Dict[str, bool], aged: Optional[Set[str]], older_than: Optional[str]):
+        found, lookup_errors = _describe_runs(tracking_store, list(batch))
+        deleted: List[str] = []
+        failed: Dict[str, str] = {}
+        eligible: Dict[str, Optional[str]] = {}
+        for run_id, resumed in batch.items():
+            info = found.get(run_id)
+            if info is None:
+                # A run an earlier attempt at this batch had already started on and that is now
+                # gone was deleted by that attempt; it only missed the checkpoint.
+                if resumed:
+                    deleted.append(run_id)
+                else:
+                    failed[run_id] = lookup_errors.get(run_id, "Run not found")
+            elif info.lifecycle_stage != LifecycleStage.DELETED:
+                failed[run_id] = "Run is not in deleted lifecycle stage"
+            elif aged is not None and run_id not in aged:
+                failed[run_id] = f"Run is not older than {older_than}"
+            else:
+                eligible[run_id] = info.artifact_uri
+
+        if self.parallelism > 1 and len(eligible) > 1:
+            list(self._artifact_pool().map(_delete_artifacts, eligible.keys(), eligible.values()))
+        else:
+            for run_id, artifact_uri in eligible.items():
+                _delete_artifacts(run_id, artifact_uri)
+
+        failures = _hard_delete_runs(tracking_store, list(eligible))
+        deleted.extend(run_id for run_id in eligible if run_id not in failures)
+        failed.update(failures)
+        return deleted, failed
+
+    def _delete_experiments(self, tracking_store, job: TrashGcJob) -> None:
+        while True:
+            self._check_stop()
+            batch = self._checked(self.repository.take_batch(job.id, self.worker_id, EXPERIMENT, self.batch_size))
+            if not batch:
+                return
+            deleted: List[str] = []
+            failed: Dict[str, str] = {}
+            for experiment_id, resumed in batch.items():
+                try:
+                    tracking_store._hard_delete_experiment(experiment_id)
+                except Exception as e:
+                    if resumed and not self._experiment_exists(tracking_store, experiment_id):
+                        deleted.append(experiment_id)
+                        continue
+                    logger.error(f"Error deleting experiment {experiment_id}: {str(e)}")
+                    failed[experiment_id] = str(e)
+                    continue
+                invalidate_experiment_metadata(experiment_id)
+                deleted.append(experiment_id)
+            self._checked(self.repository.record_batch(job.id, self.worker_id, EXPERIMENT, deleted, failed))
+
+    @staticmethod
+    def _experiment_exists(tracking_store, experiment_id: str) -> bool:
+        try:
+            tracking_store.get_experiment(experiment_id)
+        except Exception:
+            return False
+        return True
+
+    def _artifact_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.parallelism, thread_name_prefix="trash-gc-artifacts")
+        return self._pool
+
+    def _heartbeat(self, job: TrashGcJob) -> None:
+        """Renew the lease, or stop if it was lost."""
+        self._checked(self.repository.heartbeat(job.id, self.worker_id))
+
+    def _check_stop(self) -> None:
+        if self._stop.is_set():
+            raise _Interrupted()
+
+    @staticmethod
+    def _checked(result):
+        """Pass a repository result through, or stop if it says the lease was lost."""
+        if result is None or result is False:
+            raise _LeaseLost()
+        return result
+
+
+_worker: Optional[TrashGcWorker] = None
+_worker_lock = threading.Lock()
+
+
+def start() -> TrashGcWorker:
+    """Start this process's worker, which also resumes any job a previous process left."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = TrashGcWorker()
+        _worker.start()
+        return _worker
+
+
+def notify() -> None:
+    """Tell this process's worker a job was enqueued, so it starts without waiting for a poll."""
+    if _worker is not None:
+        _worker.wake()
+
+
+def shutdown() -> None:
+    """Stop this process's worker; an unfinished job goes back to the queue for the next start."""
+    global _worker
+    with _worker_lock:
+        if _worker is not None:
+            _worker.stop()
+            _worker = None
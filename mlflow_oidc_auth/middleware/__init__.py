@@ -10,17 +10,21 @@ from mlflow_oidc_auth.middleware.auth_aware_wsgi_middleware import (
     AuthAwareWSGIMiddleware,
 )
 from mlflow_oidc_auth.middleware.fastapi_permission_middleware import (
+    FastAPIPermissionMiddleware,
     add_fastapi_permission_middleware,
 )
 from mlflow_oidc_auth.middleware.proxy_headers_middleware import ProxyHeadersMiddleware
 from mlflow_oidc_auth.middleware.workspace_context_middleware import (
     WorkspaceContextMiddleware,
 )
+from mlflow_oidc_auth.middleware.wsgi_bridge import WSGIBridge
 
 __all__ = [
     "AuthMiddleware",
     "AuthAwareWSGIMiddleware",
+    "FastAPIPermissionMiddleware",
     "ProxyHeadersMiddleware",
     "WorkspaceContextMiddleware",
+    "WSGIBridge",
     "add_fastapi_permission_middleware",
 ]
@@ -0,0 +1,71 @@
+"""
+Pure-ASGI base for the request-inspecting middleware.
+
+Starlette's ``BaseHTTPMiddleware`` runs the downstream app in a separate task and relays its
+response through a memory stream, so ``call_next`` can hand a ``Response`` back to
+``dispatch``. That relay costs a task and a stream per request and sits between MLflow's
+artifact downloads and uploads and the client.
+
+None of the middleware here looks at the downstream response: each one inspects or adjusts
+the request and then either forwards it or answers it itself. ``DispatchMiddleware`` keeps the
+familiar ``dispatch(request, call_next)`` shape for that, but ``call_next`` calls the wrapped
+app directly with the original ``receive`` and ``send``, in the same task, and returns a
+placeholder once the response has been sent. A ``dispatch`` may therefore await
+``call_next`` (including inside ``try``/``finally``, which now spans the whole response) and
+return what it got, or return a response of its own, but must not read or modify the
+response ``call_next`` returns.
+
+``call_next`` uses the ``receive`` of the request it is given. A ``dispatch`` that reads the
+body passes ``with_body(request, body)`` on, so the downstream app still receives it.
+"""
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class _Forwarded(Response):
+    """Returned by ``call_next``: the downstream app has already sent its response."""
+
+    def __init__(self) -> None:
+        super().__init__(status_code=200)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # pragma: no cover - never sent
+        raise RuntimeError("the downstream response has already been sent")
+
+
+def with_body(request: Request, body: bytes) -> Request:
+    """Return ``request`` with a ``receive`` that replays ``body``, already read from it."""
+    replayed = False
+
+    async def receive() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await request.receive()
+
+    return Request(request.scope, receive)
+
+
+class DispatchMiddleware:
+    """Base class: subclasses implement ``async dispatch(request, call_next) -> Response``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def call_next(request: Request) -> Response:
+            await self.app(scope, request.receive, send)
+            return _Forwarded()
+
+        response = await self.dispatch(Request(scope, receive, send), call_next)
+        if not isinstance(response, _Forwarded):
+            await response(scope, receive, send)
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        raise NotImplementedError()  # pragma: no cover
@@ -3,6 +3,8 @@ Auth Passing WSGI Middleware
 
 This middleware passes FastAPI authentication information to Flask via WSGI environ.
 It acts as a bridge between FastAPI's authentication middleware and Flask's WSGI application.
+HTTP requests are served by a ``WSGIBridge``, which runs Flask on a bounded thread pool of its
+own and streams request and response bodies.
 """
 
 from asgiref.wsgi import WsgiToAsgi as WSGIMiddleware
@@ -12,6 +14,7 @@ import asyncio
 
 from mlflow_oidc_auth.entities.auth_context import AUTH_CONTEXT_KEY, AuthContext
 from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.middleware.wsgi_bridge import WSGIBridge
 
 logger = get_logger()
 
@@ -20,7 +23,7 @@ class AuthInjectingWSGIApp:
     """
     WSGI app wrapper that injects FastAPI authentication info into environ.
 
-    This wrapper sits between WSGIMiddleware and the Flask app to inject
+    This wrapper sits between the WSGI bridge and the Flask app to inject
     authentication information from the ASGI scope into the WSGI environ.
     """
 
@@ -51,21 +54,18 @@ class AuthAwareWSGIMiddleware:
     This middleware:
     1. Extracts the ASGI scope
     2. Creates an auth-injecting wrapper around the Flask app
-    3. Uses WSGIMiddleware to handle the ASGI-to-WSGI conversion
+    3. Serves it through a shared ``WSGIBridge``
     """
 
-    def __init__(self, flask_app):
+    def __init__(self, flask_app, bridge: WSGIBridge | None = None):
         self.flask_app = flask_app
+        self.bridge = bridge or WSGIBridge()
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] == "http":
             # Create auth-injecting wrapper for this request
             auth_injecting_app = AuthInjectingWSGIApp(self.flask_app, scope)
-
-            # Use asgiref's WsgiToAsgi adapter to handle ASGI-to-WSGI conversion.
-            # This avoids the deprecated starlette.middleware.wsgi dependency.
-            wsgi_adapter = WSGIMiddleware(auth_injecting_app)
-            await wsgi_adapter(scope, receive, send)
+            await self.bridge.handle(auth_injecting_app, scope, receive, send)
         else:
             # For non-HTTP requests (websocket/lifespan) try calling the
             # provided Flask app directly. If it is a callable that returns
@@ -14,20 +14,21 @@ import time
 from cachetools import TTLCache
 from fastapi import Request, Response
 from fastapi.responses import RedirectResponse, JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.concurrency import run_in_threadpool
 
 from mlflow_oidc_auth.config import config
 from mlflow_oidc_auth.entities.auth_context import AUTH_CONTEXT_KEY, AuthContext
 from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.middleware._dispatch import DispatchMiddleware
 from mlflow_oidc_auth.routers._prefix import API_PATH_PREFIXES
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, ErrorCode
 
 from mlflow_oidc_auth.audit import emit_audit_event
-from mlflow_oidc_auth.auth import validate_token
+from mlflow_oidc_auth.auth import validate_token, validated_claims
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils.oidc_field_extraction import extract_username, extract_display_name, BEARER_TOKEN_SOURCE
+from mlflow_oidc_auth.utils.offload import run_blocking
 
 logger = get_logger()
 
@@ -88,7 +89,7 @@ def normalize_workspace_header(raw_workspace: Optional[str]) -> Optional[str]:
     return raw_workspace.strip() or None
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware(DispatchMiddleware):
     """
     FastAPI middleware for user authentication.
 
@@ -99,9 +100,6 @@ class AuthMiddleware(BaseHTTPMiddleware):
     4. Redirects unauthenticated users to login for protected routes
     """
 
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-
     def _is_unprotected_route(self, path: str) -> bool:
         """
         Check if the route is unprotected and doesn't require authentication.
@@ -148,7 +146,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             username, password = decoded_credentials.split(":", 1)
 
             # Authenticate against store
-            if store.authenticate_user(username.lower(), password):
+            if await run_blocking(store.authenticate_user, username.lower(), password):
                 logger.debug(f"User {username} authenticated via basic auth")
                 return True, username.lower(), ""
             else:
@@ -368,8 +366,12 @@ class AuthMiddleware(BaseHTTPMiddleware):
         """
         try:
             token = auth_header.split(" ", 1)[1]
-            # Validate token and extract user info
-            payload = validate_token(token)
+            # Validate token and extract user info. A token seen before is answered from the
+            # validation cache; anything else may have to fetch the JWKS, which is blocking HTTP
+            # and must not stall the event loop.
+            payload = validated_claims(token)
+            if payload is None:
+                payload = await run_in_threadpool(validate_token, token)
 
             provider = self._provider_for(token)
 
@@ -379,7 +381,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 # identity is derived here rather than from OIDC_USERNAME_FIELD: a global field
                 # list that had to include ``sub`` to make this work would also change how every
                 # other provider's tokens are named.
-                return self._authenticate_service_account(token, payload, provider)
+                return await run_blocking(self._authenticate_service_account, token, payload, provider)
 
             # Extract username from configured fields. extract_username guarantees a
             # non-empty, normalized username whenever it returns no error.
@@ -387,7 +389,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             if error_msg:
                 return False, None, error_msg
 
-            self._maybe_provision_bearer_user(username, token, payload)
+            await run_blocking(self._maybe_provision_bearer_user, username, token, payload)
             logger.debug(f"User {username} authenticated via bearer token")
             return True, username, ""
         except Exception as e:
@@ -423,7 +425,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
                         # exactly the sessions that cannot be revoked.
                         return False, None, "No session authentication"
 
-                    resolved = store.resolve_auth_session(session_id)
+                    resolved = await run_blocking(store.resolve_auth_session, session_id)
                     if resolved is None:
                         # Unknown, revoked or expired — indistinguishable on purpose.
                         session.clear()
@@ -622,7 +624,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 is_admin, is_active = resolved.is_admin, resolved.is_active
                 denial_reason = "" if is_active else DENIAL_INACTIVE
             else:
-                is_admin, is_active, denial_reason = self._get_user_auth_state(username)
+                is_admin, is_active, denial_reason = await run_blocking(self._get_user_auth_state, username)
 
             # A deprovisioned user holds a signed cookie or a valid token that has not expired
             # yet, so credentials alone still check out. Directories deactivate rather than
@@ -17,9 +17,10 @@ from collections.abc import Awaitable, Callable
 from typing import Any
 
 from fastapi import FastAPI, Request
-from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 
 from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.middleware._dispatch import DispatchMiddleware, with_body
 from mlflow_oidc_auth.utils.permissions import can_use_gateway_endpoint
 
 logger = get_logger()
@@ -175,19 +176,17 @@ def _find_fastapi_validator(
 # ---------------------------------------------------------------------------
 
 
-def add_fastapi_permission_middleware(app: FastAPI) -> None:
-    """Add OIDC-aware permission middleware for FastAPI-native routes.
-
-    This middleware runs AFTER ``AuthMiddleware`` (which has already set
-    ``request.state.username`` / ``request.state.is_admin`` and the ASGI
-    scope ``mlflow_oidc_auth`` dict).  It only activates for routes served
-    directly by FastAPI (gateway, otel, assistant, job API) — all other
-    requests fall through to the Flask WSGI mount where the Flask hooks
-    handle authorization.
+class FastAPIPermissionMiddleware(DispatchMiddleware):
+    """OIDC-aware permission checks for FastAPI-native routes.
+
+    Runs AFTER ``AuthMiddleware`` (which has already set ``request.state.username`` /
+    ``request.state.is_admin`` and the ASGI scope ``mlflow_oidc_auth`` dict).  It only
+    activates for routes served directly by FastAPI (gateway, otel, assistant, job API) —
+    all other requests fall through to the Flask WSGI mount where the Flask hooks handle
+    authorization.
     """
 
-    @app.middleware("http")
-    async def fastapi_permission_middleware(request: Request, call_next):
+    async def dispatch(self, request: Request, call_next) -> Response:
         path = request.url.path
 
         # Find validator for this route — returns None for Flask-handled routes
@@ -223,4 +222,16 @@ def add_fastapi_permission_middleware(app: FastAPI) -> None:
                 status_code=403,
             )
 
+        # The gateway validator has read the body to find the endpoint; replay it downstream.
+        if path in _ROUTES_NEEDING_BODY:
+            request = with_body(request, await request.body())
         return await call_next(request)
+
+
+def add_fastapi_permission_middleware(app: FastAPI) -> None:
+    """Add :class:`FastAPIPermissionMiddleware` to ``app``.
+
+    Register it before ``AuthMiddleware`` so that it ends up inside it and sees the
+    authentication context.
+    """
+    app.add_middleware(FastAPIPermissionMiddleware)
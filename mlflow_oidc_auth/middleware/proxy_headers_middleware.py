@@ -10,10 +10,10 @@ import ipaddress
 from typing import List, Optional
 
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
 from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.middleware._dispatch import DispatchMiddleware
 
 logger = get_logger()
 
@@ -42,7 +42,7 @@ def _parse_trusted_proxies(
     return networks
 
 
-class ProxyHeadersMiddleware(BaseHTTPMiddleware):
+class ProxyHeadersMiddleware(DispatchMiddleware):
     """
     FastAPI middleware for handling proxy headers.
 
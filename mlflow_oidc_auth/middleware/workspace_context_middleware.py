@@ -18,16 +18,15 @@ import json
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
 
 from mlflow_oidc_auth.config import config
 from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.middleware._dispatch import DispatchMiddleware
 
 logger = get_logger()
 
 
-class WorkspaceContextMiddleware(BaseHTTPMiddleware):
+class WorkspaceContextMiddleware(DispatchMiddleware):
     """
     Sets the MLflow workspace ContextVar for the lifetime of each request.
 
@@ -41,9 +40,6 @@ class WorkspaceContextMiddleware(BaseHTTPMiddleware):
     When workspaces are disabled this middleware is a transparent pass-through.
     """
 
-    def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
-
     async def dispatch(self, request: Request, call_next) -> Response:
         if not config.MLFLOW_ENABLE_WORKSPACES:
             return await call_next(request)
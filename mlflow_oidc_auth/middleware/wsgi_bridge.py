@@ -0,0 +1,383 @@
+"""
+Streaming ASGI-to-WSGI bridge for the mounted MLflow Flask app.
+
+asgiref's ``WsgiToAsgi`` reads the whole request body before it calls the app, spilling
+anything past 64 KiB to a temporary file, and runs every WSGI call through ``sync_to_async``
+with its default ``thread_sensitive=True``: one shared thread for the whole process, so Flask
+requests ran one at a time and an artifact upload was received in full before MLflow saw a
+byte of it.
+
+``WSGIBridge`` instead:
+
+* runs the app on a thread pool of its own (``WSGI_BRIDGE_MAX_WORKERS``), so Flask requests
+  run concurrently up to that limit and queue beyond it, without taking threads from the
+  anyio pool that sync FastAPI endpoints use;
+* streams the request body: ``wsgi.input`` pulls messages from ``receive`` as the app reads
+  it, so an upload never sits in memory or on disk ahead of the app;
+* sends each response chunk before the app produces the next one, so a slow client slows the
+  app down instead of the response piling up in memory. Responses with a ``Content-Length``
+  (files, artifacts) are sent in chunks of up to ``WSGI_BRIDGE_CHUNK_SIZE``; others, which
+  may be incremental streams, are sent as the app yields them.
+
+Queue depth, in-flight requests and bytes moved are available via ``stats()``.
+"""
+
+import asyncio
+import contextvars
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from starlette.types import Receive, Scope, Send
+
+from mlflow_oidc_auth.logger import get_logger
+
+logger = get_logger()
+
+
+class _BridgeStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.queued = 0
+            self.in_flight = 0
+            self.max_queued = 0
+            self.max_in_flight = 0
+            self.completed = 0
+            self.failed = 0
+            self.bytes_received = 0
+            self.bytes_sent = 0
+            self.wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def submit(self) -> None:
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+    def start(self, waited: float) -> None:
+        with self._lock:
+            self.queued -= 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def cancel(self) -> None:
+        """A request abandoned while still queued."""
+        with self._lock:
+            self.queued -= 1
+
+    def finish(self, ok: bool, received: int, sent: int) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.bytes_received += received
+            self.bytes_sent += sent
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queued": self.queued,
+                "in_flight": self.in_flight,
+                "max_queued": self.max_queued,
+                "max_in_flight": self.max_in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "bytes_received": self.bytes_received,
+                "bytes_sent": self.bytes_sent,
+                "wait_seconds": round(self.wait_seconds, 6),
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+            }
+
+
+class _RequestBody:
+    """``wsgi.input`` that reads the ASGI request body on demand, from a worker thread."""
+
+    def __init__(self, receive: Receive, loop: asyncio.AbstractEventLoop) -> None:
+        self._receive = receive
+        self._loop = loop
+        self._buffer = bytearray()
+        self._more = True
+        self.received = 0
+
+    def _pull(self) -> bool:
+        """Append the next message's body to the buffer. False once the body has ended."""
+        if not self._more:
+            return False
+        message = asyncio.run_coroutine_threadsafe(self._receive(), self._loop).result()
+        if message["type"] == "http.disconnect":
+            self._more = False
+            raise OSError("Client disconnected before the request body was read")
+        chunk = message.get("body", b"")
+        self._buffer += chunk
+        self.received += len(chunk)
+        self._more = message.get("more_body", False)
+        return True
+
+    def _take(self, size: int) -> bytes:
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            while self._pull():
+                pass
+            return self._take(len(self._buffer))
+        while len(self._buffer) < size and self._pull():
+            pass
+        return self._take(size)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        limit = size if size is not None and size >= 0 else None
+        while b"\n" not in self._buffer and (limit is None or len(self._buffer) < limit) and self._pull():
+            pass
+        end = self._buffer.find(b"\n") + 1 or len(self._buffer)
+        if limit is not None:
+            end = min(end, limit)
+        return self._take(end)
+
+    def readlines(self, hint: int = -1) -> List[bytes]:
+        lines = []
+        total = 0
+        while True:
+            line = self.readline()
+            if not line:
+                return lines
+            lines.append(line)
+            total += len(line)
+            if 0 < hint <= total:
+                return lines
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+
+class _Response:
+    """``start_response`` and the response body, sent from a worker thread."""
+
+    def __init__(self, send: Send, loop: asyncio.AbstractEventLoop, chunk_size: int) -> None:
+        self._send_async = send
+        self._loop = loop
+        self._chunk_size = chunk_size
+        self._start: Optional[Dict[str, Any]] = None
+        self._started = False
+        self._pending = bytearray()
+        self.content_length: Optional[int] = None
+        self.sent = 0
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        asyncio.run_coroutine_threadsafe(self._send_async(message), self._loop).result()
+
+    def start_response(self, status: str, response_headers, exc_info=None) -> Callable[[bytes], None]:
+        if exc_info is not None:
+            try:
+                if self._started:
+                    raise exc_info[1].with_traceback(exc_info[2])
+            finally:
+                exc_info = None
+        elif self._start is not None:
+            raise RuntimeError("start_response called a second time without exc_info")
+
+        self.content_length = None
+        headers = []
+        for name, value in response_headers:
+            if name.lower() == "content-length":
+                self.content_length = int(value)
+            headers.append((name.lower().encode("latin-1"), value.encode("latin-1")))
+        self._start = {"type": "http.response.start", "status": int(status.split(" ", 1)[0]), "headers": headers}
+        return self.write
+
+    @property
+    def complete(self) -> bool:
+        """Whether everything the ``Content-Length`` announced has been written."""
+        return self.content_length is not None and self.sent + len(self._pending) >= self.content_length
+
+    def write(self, data: bytes) -> None:
+        if self._start is None:
+            raise RuntimeError("write() before start_response")
+        if self.content_length is not None:
+            # Never send more than the announced length; the client would read it as the next response.
+            data = data[: max(0, self.content_length - self.sent - len(self._pending))]
+        if not data:
+            return
+        self._pending += data
+        if self.content_length is None or len(self._pending) >= self._chunk_size:
+            self._flush(more_body=True)
+
+    def _flush(self, more_body: bool) -> None:
+        if not self._started:
+            self._started = True
+            self._send(self._start)
+        if self._pending or not more_body:
+            body = bytes(self._pending)
+            self._pending.clear()
+            self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            self.sent += len(body)
+
+    def finish(self) -> None:
+        if self._start is None:
+            raise RuntimeError("WSGI application returned without calling start_response")
+        self._flush(more_body=False)
+
+
+def build_environ(scope: Scope, body: Any) -> Dict[str, Any]:
+    """The WSGI environ for an ASGI HTTP ``scope``, reading the request body from ``body``."""
+    script_name = scope.get("root_path", "").encode("utf8").decode("latin1")
+    path_info = scope["path"].encode("utf8").decode("latin1")
+    if path_info.startswith(script_name):
+        path_info = path_info[len(script_name) :]
+    server = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": script_name,
+        "PATH_INFO": path_info,
+        "QUERY_STRING": scope.get("query_string", b"").decode("ascii"),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        # The body stream ends where the request body does, so the app may read to EOF even
+        # without a Content-Length (chunked uploads).
+        "wsgi.input_terminated": True,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client") is not None:
+        environ["REMOTE_ADDR"] = scope["client"][0]
+
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin1")
+        if name == "content-length":
+            key = "CONTENT_LENGTH"
+        elif name == "content-type":
+            key = "CONTENT_TYPE"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        value = value.decode("latin1")
+        environ[key] = f"{environ[key]},{value}" if key in environ and key.startswith("HTTP_") else value
+    return environ
+
+
+_bridges: "weakref.WeakSet[WSGIBridge]" = weakref.WeakSet()
+
+
+class WSGIBridge:
+    """ASGI app that serves a WSGI app from a bounded thread pool, streaming both bodies.
+
+    Parameters:
+        wsgi_app: The WSGI application served by ``__call__``. ``handle`` serves any other.
+        max_workers: Threads running the WSGI app at once; requests beyond this queue.
+            Defaults to ``WSGI_BRIDGE_MAX_WORKERS``.
+        chunk_size: Largest response chunk sent for a body with a known length. Defaults to
+            ``WSGI_BRIDGE_CHUNK_SIZE``.
+    """
+
+    def __init__(self, wsgi_app: Optional[Callable] = None, max_workers: Optional[int] = None, chunk_size: Optional[int] = None) -> None:
+        from mlflow_oidc_auth.config import config
+
+        self.wsgi_app = wsgi_app
+        self.max_workers = max(1, max_workers or config.WSGI_BRIDGE_MAX_WORKERS)
+        self.chunk_size = max(1, chunk_size or config.WSGI_BRIDGE_CHUNK_SIZE)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._stats = _BridgeStats()
+        _bridges.add(self)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mlflow-wsgi")
+            return self._executor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.handle(self.wsgi_app, scope, receive, send)
+
+    async def handle(self, wsgi_app: Callable, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve one HTTP request with ``wsgi_app``."""
+        if scope["type"] != "http":
+            raise ValueError("WSGIBridge received a non-HTTP scope")
+
+        loop = asyncio.get_running_loop()
+        body = _RequestBody(receive, loop)
+        response = _Response(send, loop, self.chunk_size)
+        environ = build_environ(scope, body)
+        context = contextvars.copy_context()
+        submitted_at = time.perf_counter()
+        started = False
+
+        def _work() -> None:
+            nonlocal started
+            started = True
+            self._stats.start(time.perf_counter() - submitted_at)
+            ok = False
+            try:
+                context.run(self._run, wsgi_app, environ, response)
+                ok = True
+            finally:
+                self._stats.finish(ok, body.received, response.sent)
+
+        self._stats.submit()
+        try:
+            await loop.run_in_executor(self._get_executor(), _work)
+        finally:
+            if not started:
+                self._stats.cancel()
+
+    @staticmethod
+    def _run(wsgi_app: Callable, environ: Dict[str, Any], response: _Response) -> None:
+        result = wsgi_app(environ, response.start_response)
+        try:
+            for chunk in result:
+                response.write(chunk)
+                if response.complete:
+                    break
+        finally:
+            close = getattr(result, "close", None)
+            if close is not None:
+                close()
+        response.finish()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"max_workers": self.max_workers, "chunk_size": self.chunk_size, **self._stats.snapshot()}
+
+    def reset_stats(self) -> None:
+        self._stats.reset()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once running requests finish. A later request starts new ones."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def stats() -> Dict[str, Any]:
+    """Counters for every live bridge, summed; per-bridge figures come from ``WSGIBridge.stats``."""
+    totals: Dict[str, Any] = {}
+    for bridge in list(_bridges):
+        for key, value in bridge.stats().items():
+            if key.startswith("max_") and key != "max_workers":
+                totals[key] = max(totals.get(key, 0), value)
+            elif key != "chunk_size":
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def shutdown() -> None:
+    for bridge in list(_bridges):
+        bridge.shutdown()
@@ -27,7 +27,7 @@ from mlflow_oidc_auth.models.group import (
     GroupScorerRegexPermissionItem,
     GroupUser,
 )
-from mlflow_oidc_auth.models.permission import PermissionResult, UserPermission
+from mlflow_oidc_auth.models.permission import PermissionResult, ResourcePrincipalEntry, UserPermission
 from mlflow_oidc_auth.models.prompt import PromptPermission, PromptRegexCreate
 from mlflow_oidc_auth.models.registered_model import (
     RegisteredModelPermission,
@@ -146,4 +146,5 @@ __all__ = [
     "WebhookListResponse",
     "WebhookTestResponse",
     "UserPermission",
+    "ResourcePrincipalEntry",
 ]
@@ -1,4 +1,4 @@
-from typing import NamedTuple, Literal
+from typing import Literal, NamedTuple, Optional
 from pydantic import BaseModel, Field
 
 from mlflow_oidc_auth.permissions import Permission
@@ -37,3 +37,28 @@ class UserPermission(BaseModel):
     name: str = Field(..., description="Username of the user with access")
     permission: str = Field(..., description="Permission level for the resource")
     kind: Literal["user", "service-account"] = Field(..., description="Kind of user account")
+
+
+class ResourcePrincipalEntry(BaseModel):
+    """
+    One grant on a resource, as listed by the admin permission-matrix endpoints.
+
+    Parameters:
+    -----------
+    name : str
+        The username or group name.
+    permission : str
+        The permission level the grant gives.
+    kind : str
+        The kind of principal ('user', 'service-account' or 'group').
+    source : str
+        Where the grant comes from ('user', 'group', 'regex' or 'group-regex').
+    regex : Optional[str]
+        The matching rule's pattern, for regex-derived grants.
+    """
+
+    name: str = Field(..., description="Username or group name")
+    permission: str = Field(..., description="Permission level for the resource")
+    kind: Literal["user", "service-account", "group"] = Field(..., description="Kind of principal")
+    source: Literal["user", "group", "regex", "group-regex"] = Field(..., description="Source of the grant")
+    regex: Optional[str] = Field(None, description="Matching regex rule, for regex-derived grants")
@@ -25,12 +25,16 @@ providers (Vault, AWS, Azure) keep working.
 from __future__ import annotations
 
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from typing import Dict, Optional
 
 from authlib.integrations.starlette_client import OAuth
 
 from mlflow_oidc_auth.config import config
 from mlflow_oidc_auth.config_providers import config_manager
+from mlflow_oidc_auth.discovery import get_discovery_document
 from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.provider_registry import DEFAULT_PROVIDER_ID
 
@@ -41,6 +45,9 @@ logger = get_logger()
 # being renamed to "default" — a rename would be a breaking change for no benefit.
 LEGACY_CLIENT_NAME = "oidc"
 
+# Discovery fetches at startup are network-bound; this many run at once.
+_MAX_STARTUP_WORKERS = 16
+
 
 class PKCEUnsupportedError(Exception):
     """The provider advertises PKCE methods and the configured one is not among them (#312)."""
@@ -297,6 +304,95 @@ def ensure_all_clients_registered() -> Dict[str, bool]:
     return results
 
 
+@dataclass(frozen=True)
+class ProviderStartup:
+    """How one provider's startup went, for the startup report.
+
+    Attributes:
+        registered: Whether its authlib client is registered.
+        discovery: ``ok``, ``failed``, ``timeout``, or ``skipped`` (not registered, or the
+            warm-up is disabled).
+        seconds: Time spent fetching its discovery document.
+        error: Why discovery failed, when it did.
+    """
+
+    registered: bool
+    discovery: str
+    seconds: float
+    error: Optional[str] = None
+
+    def to_dict(self, include_error: bool = False) -> Dict[str, object]:
+        """The report as JSON. ``error`` can name internal hosts and proxies, so it is opt-in."""
+        report: Dict[str, object] = {"registered": self.registered, "discovery": self.discovery, "seconds": round(self.seconds, 3)}
+        if include_error:
+            report["error"] = self.error
+        return report
+
+
+def _seed_server_metadata(client, document: dict) -> None:
+    """Give an authlib client its discovery document, so it does not fetch one itself.
+
+    authlib's ``load_server_metadata`` fetches only while ``_loaded_at`` is absent.
+    """
+    client.server_metadata.update(document)
+    client.server_metadata["_loaded_at"] = time.time()
+
+
+def _warm_provider(provider_id: str, discovery_url: str) -> ProviderStartup:
+    """Fetch (or reuse) the provider's discovery document and seed its client with it."""
+    started = time.monotonic()
+    try:
+        document = get_discovery_document(discovery_url)
+        client = get_client(provider_id)
+        if client is not None:
+            _seed_server_metadata(client, document)
+    except Exception as exc:
+        return ProviderStartup(True, "failed", time.monotonic() - started, str(exc))
+    return ProviderStartup(True, "ok", time.monotonic() - started)
+
+
+def start_providers(timeout: Optional[float] = None) -> Dict[str, ProviderStartup]:
+    """Register every OIDC provider, then fetch their discovery documents concurrently.
+
+    Registration makes no network call. Discovery did, on the first login to each provider,
+    and with several providers one slow IdP held up that login for the full HTTP timeout.
+    Here all discovery fetches run at once, bounded by ``timeout`` seconds in total
+    (``OIDC_PROVIDER_STARTUP_TIMEOUT_SECONDS`` by default). A provider that fails or is still
+    pending at the deadline stays registered and is reported as such. Its document loads on
+    first use, as before, and startup does not wait for it.
+
+    Returns:
+        ``{provider_id: ProviderStartup}`` for every provider ``ensure_all_clients_registered``
+        reports.
+    """
+    if timeout is None:
+        timeout = config.OIDC_PROVIDER_STARTUP_TIMEOUT_SECONDS
+    registered = ensure_all_clients_registered()
+
+    urls = {}
+    for provider_id, ok in registered.items():
+        settings = _client_settings(provider_id) if ok and timeout > 0 else None
+        if settings is not None:
+            urls[provider_id] = settings["server_metadata_url"]
+
+    report = {provider_id: ProviderStartup(ok, "skipped", 0.0) for provider_id, ok in registered.items()}
+    if not urls:
+        return report
+
+    executor = ThreadPoolExecutor(max_workers=min(len(urls), _MAX_STARTUP_WORKERS), thread_name_prefix="oidc-discovery")
+    futures = {executor.submit(_warm_provider, provider_id, url): provider_id for provider_id, url in urls.items()}
+    done, pending = wait(futures, timeout=timeout)
+    # Fetches still running finish (or time out) on their own; their documents still land in
+    # the cache for the first login.
+    executor.shutdown(wait=False)
+
+    for future in done:
+        report[futures[future]] = future.result()
+    for future in pending:
+        report[futures[future]] = ProviderStartup(True, "timeout", float(timeout), f"no discovery document after {timeout}s")
+    return report
+
+
 def ensure_oidc_client_registered() -> bool:
     """Ensure the legacy ``oidc`` client is registered.
 
@@ -99,6 +99,8 @@ from mlflow_oidc_auth.repository.workspace_regex_permission import (
 from mlflow_oidc_auth.repository.workspace_group_regex_permission import (
     WorkspaceGroupRegexPermissionRepository as WorkspaceGroupRegexPermRepo,
 )
+from mlflow_oidc_auth.repository.resource_principal import ResourcePrincipalRepository
+from mlflow_oidc_auth.repository.trash_gc_job import TrashGcJobRepository
 
 __all__ = [
     "BaseUserPermissionRepository",
@@ -139,4 +141,6 @@ __all__ = [
     "WorkspaceGroupPermissionRepository",
     "WorkspaceRegexPermissionRepository",
     "WorkspaceGroupRegexPermRepo",
+    "ResourcePrincipalRepository",
+    "TrashGcJobRepository",
 ]
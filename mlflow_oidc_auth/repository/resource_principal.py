@@ -0,0 +1,252 @@
+"""Reverse lookups: which users and groups hold a grant on a resource.
+
+The ``/{resource}/users`` endpoints used to load every user with all of their
+permission relationships and scan them in Python for one resource id, so their cost
+grew with users x grants. This repository answers the question from the permission
+tables instead: one indexed ``IN`` query per grant table, joined to ``users`` or
+``groups`` for the principal's name, for any number of resources at once.
+
+Regex-derived grants are opt-in (``sources``). The rule tables cannot be filtered by resource in
+SQL, so every rule is read once (one query per table) and matched against each
+resource name in Python; for a principal, the first matching rule in priority order
+wins, exactly as in permission resolution.
+
+Each resource type maps onto its four tables. Prompts share the registered model
+tables: direct user grants are the model grants, while group and regex rows are told
+apart by their ``prompt`` flag. Scorers are keyed by ``(experiment_id, scorer_name)``
+and their regex rules match the scorer name. Experiment regex rules match the
+experiment name, which the caller supplies.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from sqlalchemy.orm import Session
+
+from mlflow_oidc_auth.db.models import (
+    SqlExperimentGroupPermission,
+    SqlExperimentGroupRegexPermission,
+    SqlExperimentPermission,
+    SqlExperimentRegexPermission,
+    SqlGatewayEndpointGroupPermission,
+    SqlGatewayEndpointGroupRegexPermission,
+    SqlGatewayEndpointPermission,
+    SqlGatewayEndpointRegexPermission,
+    SqlGatewayModelDefinitionGroupPermission,
+    SqlGatewayModelDefinitionGroupRegexPermission,
+    SqlGatewayModelDefinitionPermission,
+    SqlGatewayModelDefinitionRegexPermission,
+    SqlGatewaySecretGroupPermission,
+    SqlGatewaySecretGroupRegexPermission,
+    SqlGatewaySecretPermission,
+    SqlGatewaySecretRegexPermission,
+    SqlGroup,
+    SqlRegisteredModelGroupPermission,
+    SqlRegisteredModelGroupRegexPermission,
+    SqlRegisteredModelPermission,
+    SqlRegisteredModelRegexPermission,
+    SqlScorerGroupPermission,
+    SqlScorerGroupRegexPermission,
+    SqlScorerPermission,
+    SqlScorerRegexPermission,
+    SqlUser,
+)
+from mlflow_oidc_auth.entities.resource_principal import ResourcePrincipal
+
+# Bound on the number of values in one IN (...) clause.
+_IN_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True)
+class _ResourceTables:
+    """The four grant tables of a resource type and how a resource is keyed in them."""
+
+    user: Type
+    group: Type
+    regex: Type
+    group_regex: Type
+    key: Tuple[str, ...]
+    # Value of the ``prompt`` column of the shared registered model group and regex
+    # tables. The direct user table has no such column: prompts reuse the model grants.
+    prompt: Optional[bool] = None
+
+
+_TABLES: Dict[str, _ResourceTables] = {
+    "experiment": _ResourceTables(
+        SqlExperimentPermission, SqlExperimentGroupPermission, SqlExperimentRegexPermission, SqlExperimentGroupRegexPermission, ("experiment_id",)
+    ),
+    "registered_model": _ResourceTables(
+        SqlRegisteredModelPermission,
+        SqlRegisteredModelGroupPermission,
+        SqlRegisteredModelRegexPermission,
+        SqlRegisteredModelGroupRegexPermission,
+        ("name",),
+        prompt=False,
+    ),
+    "prompt": _ResourceTables(
+        SqlRegisteredModelPermission,
+        SqlRegisteredModelGroupPermission,
+        SqlRegisteredModelRegexPermission,
+        SqlRegisteredModelGroupRegexPermission,
+        ("name",),
+        prompt=True,
+    ),
+    "scorer": _ResourceTables(
+        SqlScorerPermission, SqlScorerGroupPermission, SqlScorerRegexPermission, SqlScorerGroupRegexPermission, ("experiment_id", "scorer_name")
+    ),
+    "gateway_endpoint": _ResourceTables(
+        SqlGatewayEndpointPermission,
+        SqlGatewayEndpointGroupPermission,
+        SqlGatewayEndpointRegexPermission,
+        SqlGatewayEndpointGroupRegexPermission,
+        ("endpoint_id",),
+    ),
+    "gateway_secret": _ResourceTables(
+        SqlGatewaySecretPermission, SqlGatewaySecretGroupPermission, SqlGatewaySecretRegexPermission, SqlGatewaySecretGroupRegexPermission, ("secret_id",)
+    ),
+    "gateway_model_definition": _ResourceTables(
+        SqlGatewayModelDefinitionPermission,
+        SqlGatewayModelDefinitionGroupPermission,
+        SqlGatewayModelDefinitionRegexPermission,
+        SqlGatewayModelDefinitionGroupRegexPermission,
+        ("model_definition_id",),
+    ),
+}
+
+RESOURCE_TYPES = tuple(_TABLES)
+
+# Grant sources, named and ordered as in PERMISSION_SOURCE_ORDER's default.
+ALL_SOURCES = ("user", "group", "regex", "group-regex")
+DIRECT_SOURCES = ("user", "group")
+
+
+def _chunks(values: List, size: int = _IN_CHUNK_SIZE) -> Iterable[List]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _user_kind(is_service_account: Optional[bool]) -> str:
+    return "service-account" if is_service_account else "user"
+
+
+class ResourcePrincipalRepository:
+    """Reverse permission lookups across the seven resource types.
+
+    Resource ids are the values the grant tables store: experiment ids, model, prompt
+    and gateway names, and ``(experiment_id, scorer_name)`` tuples for scorers.
+    """
+
+    def __init__(self, session_maker: Callable[[], Session]):
+        self._Session: Callable[[], Session] = session_maker
+
+    @staticmethod
+    def _tables(resource_type: str) -> _ResourceTables:
+        try:
+            return _TABLES[resource_type]
+        except KeyError:
+            raise MlflowException(f"Unknown resource type: {resource_type}", INVALID_PARAMETER_VALUE)
+
+    @staticmethod
+    def _key_filter(model: Type, key: Tuple[str, ...], chunk: List) -> list:
+        if len(key) == 1:
+            return [getattr(model, key[0]).in_(chunk)]
+        # Composite keys: filter each column, then drop the cross-product rows in Python.
+        return [getattr(model, column).in_({resource_id[i] for resource_id in chunk}) for i, column in enumerate(key)]
+
+    def _direct_rows(self, session: Session, tables: _ResourceTables, resource_ids: List, group: bool) -> List[Tuple[Any, ResourcePrincipal]]:
+        model = tables.group if group else tables.user
+        principal = SqlGroup.group_name if group else SqlUser.username
+        key_columns = [getattr(model, column) for column in tables.key]
+        wanted = set(resource_ids)
+        rows: List[Tuple[Any, ResourcePrincipal]] = []
+        for chunk in _chunks(resource_ids):
+            if group:
+                query = session.query(*key_columns, principal, model.permission).join(SqlGroup, SqlGroup.id == model.group_id)
+                if tables.prompt is not None:
+                    query = query.filter(model.prompt == tables.prompt)
+            else:
+                query = session.query(*key_columns, principal, model.permission, SqlUser.is_service_account).join(SqlUser, SqlUser.id == model.user_id)
+            for row in query.filter(*self._key_filter(model, tables.key, chunk)).all():
+                key_width = len(tables.key)
+                resource_id = row[0] if key_width == 1 else tuple(row[:key_width])
+                if resource_id not in wanted:
+                    continue
+                name, permission = row[key_width], row[key_width + 1]
+                kind = "group" if group else _user_kind(row[key_width + 2])
+                rows.append((resource_id, ResourcePrincipal(str(name), str(permission), kind, "group" if group else "user")))
+        return rows
+
+    def _regex_rules(self, session: Session, tables: _ResourceTables, group: bool) -> Dict[Tuple[str, str], List[Tuple[re.Pattern, str, str]]]:
+        """Every rule of the type, grouped by principal and in priority order."""
+        model = tables.group_regex if group else tables.regex
+        if group:
+            query = session.query(SqlGroup.group_name, model.regex, model.permission).join(SqlGroup, SqlGroup.id == model.group_id)
+        else:
+            query = session.query(SqlUser.username, model.regex, model.permission, SqlUser.is_service_account).join(SqlUser, SqlUser.id == model.user_id)
+        if tables.prompt is not None:
+            query = query.filter(model.prompt == tables.prompt)
+        rules: Dict[Tuple[str, str], List[Tuple[re.Pattern, str, str]]] = {}
+        for row in query.order_by(model.priority, model.id).all():
+            kind = "group" if group else _user_kind(row[3])
+            rules.setdefault((str(row[0]), kind), []).append((re.compile(row[1]), str(row[1]), str(row[2])))
+        return rules
+
+    def list_principals(
+        self,
+        resource_type: str,
+        resource_ids: Iterable[Any],
+        sources: Iterable[str] = DIRECT_SOURCES,
+        names: Optional[Mapping[Any, str]] = None,
+    ) -> Dict[Any, List[ResourcePrincipal]]:
+        """List the grants that apply to each of ``resource_ids``.
+
+        :param resource_type: One of ``RESOURCE_TYPES``.
+        :param resource_ids: The resources to look up.
+        :param sources: The grant sources to read, from ``ALL_SOURCES``. Direct user and
+            group grants by default; each source costs one query.
+        :param names: The name regex rules are matched against, per resource id. Defaults
+            to the id itself (the scorer name for scorers); experiments have no name here,
+            so their regex grants are only listed for ids present in ``names``.
+        :return: Every requested id, mapped to its grants in ``ALL_SOURCES`` order, each
+            source sorted by principal name.
+        """
+        tables = self._tables(resource_type)
+        wanted = set(sources)
+        unknown = wanted.difference(ALL_SOURCES)
+        if unknown:
+            raise MlflowException(f"Unknown permission sources: {sorted(unknown)}", INVALID_PARAMETER_VALUE)
+        ids = list(dict.fromkeys(resource_ids))
+        result: Dict[Any, List[ResourcePrincipal]] = {resource_id: [] for resource_id in ids}
+        if not ids or not wanted:
+            return result
+        with self._Session() as session:
+            for source, group in (("user", False), ("group", True)):
+                if source in wanted:
+                    for resource_id, principal in sorted(self._direct_rows(session, tables, ids, group), key=lambda row: row[1].name):
+                        result[resource_id].append(principal)
+            for source, group in (("regex", False), ("group-regex", True)):
+                if source not in wanted:
+                    continue
+                rules = sorted(self._regex_rules(session, tables, group).items())
+                for resource_id in ids if rules else ():
+                    name = self._regex_name(resource_type, resource_id, names)
+                    if name is None:
+                        continue
+                    for (principal, kind), principal_rules in rules:
+                        match = next((rule for rule in principal_rules if rule[0].match(name)), None)
+                        if match is not None:
+                            result[resource_id].append(ResourcePrincipal(principal, match[2], kind, source, regex=match[1]))
+        return result
+
+    @staticmethod
+    def _regex_name(resource_type: str, resource_id: Any, names: Optional[Mapping[Any, str]]) -> Optional[str]:
+        if names is not None and resource_id in names:
+            return names[resource_id]
+        if resource_type == "experiment":
+            return None
+        if resource_type == "scorer":
+            return resource_id[1]
+        return resource_id
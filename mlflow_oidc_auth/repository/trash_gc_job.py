@@ -0,0 +1,350 @@
+"""Trash garbage-collection jobs: the queue and its checkpoints.
+
+``POST /oidc/trash/cleanup`` creates a job; the worker in ``mlflow_oidc_auth/jobs/trash_gc.py``
+claims it and works through it with the methods here. Everything a worker writes is guarded by
+its lease — the job's ``claimed_by`` — so a worker that was presumed dead and replaced cannot
+overwrite the progress of the one that replaced it: every call that would write reports False
+instead, and the worker stops.
+
+**Claiming is one conditional update.** ``claim`` reads a candidate and then claims it with an
+``UPDATE`` whose ``WHERE`` repeats the eligibility test; only the caller whose update matched
+has the job. Two replicas polling at once cannot both run it.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import and_, func, insert, or_
+from sqlalchemy.orm import Session
+
+from mlflow_oidc_auth.db.models import SqlTrashGcJob, SqlTrashGcJobItem
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+PHASE_COLLECT = "collect"
+PHASE_RUNS = "runs"
+PHASE_EXPERIMENTS = "experiments"
+PHASE_DONE = "done"
+
+RUN = "run"
+EXPERIMENT = "experiment"
+
+ITEM_PENDING = "pending"
+ITEM_PROCESSING = "processing"
+ITEM_DELETED = "deleted"
+ITEM_FAILED = "failed"
+
+# The job counters each item kind advances, as (deleted, failed).
+_COUNTERS = {
+    RUN: ("deleted_runs", "failed_runs"),
+    EXPERIMENT: ("deleted_experiments", "failed_experiments"),
+}
+
+# Rows per INSERT when a job's items are recorded. Bounded so a 100k-run trash does not become
+# one statement with 100k parameter sets held in memory at once.
+_INSERT_CHUNK = 5000
+
+
+@dataclass(frozen=True)
+class TrashGcJob:
+    """A snapshot of a job row.
+
+    Attributes:
+        id: Job identifier, as returned to the client that enqueued it.
+        status: ``queued``, ``running``, ``completed`` or ``failed``.
+        phase: ``collect``, ``runs``, ``experiments`` or ``done``.
+        requested_by: Admin who enqueued it.
+        workspace: Workspace the request was made in, when workspaces are enabled.
+        older_than: The age filter as given, for display.
+        older_than_ms: The age filter in milliseconds; 0 when none was given.
+        run_ids: Explicit run ids, or empty to take every deleted run.
+        experiment_ids: Explicit experiment ids, or empty to take every deleted experiment.
+    """
+
+    id: int
+    status: str
+    phase: str
+    requested_by: str
+    workspace: Optional[str] = None
+    older_than: Optional[str] = None
+    older_than_ms: int = 0
+    run_ids: tuple = ()
+    experiment_ids: tuple = ()
+    total_runs: int = 0
+    deleted_runs: int = 0
+    failed_runs: int = 0
+    total_experiments: int = 0
+    deleted_experiments: int = 0
+    failed_experiments: int = 0
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TrashGcFailure:
+    """A run or experiment a job could not delete, and why."""
+
+    kind: str
+    resource_id: str
+    error: Optional[str]
+
+
+def _now() -> datetime:
+    """Naive UTC, matching the DateTime columns the migration created."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _split(raw: Optional[str]) -> tuple:
+    return tuple(value for value in (raw or "").split(",") if value)
+
+
+def _to_job(row: SqlTrashGcJob) -> TrashGcJob:
+    return TrashGcJob(
+        id=row.id,
+        status=row.status,
+        phase=row.phase,
+        requested_by=row.requested_by,
+        workspace=row.workspace,
+        older_than=row.older_than,
+        older_than_ms=row.older_than_ms or 0,
+        run_ids=_split(row.run_ids),
+        experiment_ids=_split(row.experiment_ids),
+        total_runs=row.total_runs or 0,
+        deleted_runs=row.deleted_runs or 0,
+        failed_runs=row.failed_runs or 0,
+        total_experiments=row.total_experiments or 0,
+        deleted_experiments=row.deleted_experiments or 0,
+        failed_experiments=row.failed_experiments or 0,
+        created_at=row.created_at,
+        started_at=row.started_at,
+        finished_at=row.finished_at,
+        error=row.error,
+    )
+
+
+class TrashGcJobRepository:
+    """Enqueues, claims and checkpoints trash garbage-collection jobs."""
+
+    def __init__(self, session_maker):
+        self._Session: Callable[[], Session] = session_maker
+
+    def create(
+        self,
+        requested_by: str,
+        *,
+        older_than: Optional[str] = None,
+        older_than_ms: int = 0,
+        run_ids: Iterable[str] = (),
+        experiment_ids: Iterable[str] = (),
+        workspace: Optional[str] = None,
+    ) -> int:
+        """Enqueue a job and return its id.
+
+        Nothing is resolved here: which runs and experiments the job covers is worked out by
+        the worker in its ``collect`` phase, so enqueueing stays constant-time however large
+        the trash is.
+        """
+        job = SqlTrashGcJob(
+            status=QUEUED,
+            phase=PHASE_COLLECT,
+            requested_by=requested_by,
+            workspace=workspace,
+            older_than=older_than,
+            older_than_ms=older_than_ms,
+            run_ids=",".join(run_ids) or None,
+            experiment_ids=",".join(experiment_ids) or None,
+        )
+        with self._Session(read_only=False) as session:
+            session.add(job)
+            session.flush()
+            return job.id
+
+    def get(self, job_id: int) -> Optional[TrashGcJob]:
+        """The job with this id, or None."""
+        with self._Session() as session:
+            row = session.get(SqlTrashGcJob, job_id)
+            return _to_job(row) if row is not None else None
+
+    def list_failures(self, job_id: int, limit: int = 100) -> List[TrashGcFailure]:
+        """The first ``limit`` items the job could not delete, in the order it reached them."""
+        with self._Session() as session:
+            rows = (
+                session.query(SqlTrashGcJobItem.kind, SqlTrashGcJobItem.resource_id, SqlTrashGcJobItem.error)
+                .filter(SqlTrashGcJobItem.job_id == job_id, SqlTrashGcJobItem.status == ITEM_FAILED)
+                .order_by(SqlTrashGcJobItem.id)
+                .limit(limit)
+                .all()
+            )
+            return [TrashGcFailure(kind=kind, resource_id=resource_id, error=error) for kind, resource_id, error in rows]
+
+    def claim(self, worker_id: str, lease_seconds: int) -> Optional[TrashGcJob]:
+        """Take the oldest job that is queued, or running under a lease that has expired.
+
+        Returns None when there is nothing to do, or when another worker claimed the candidate
+        first.
+        """
+        now = _now()
+        claimable = or_(
+            SqlTrashGcJob.status == QUEUED,
+            and_(
+                SqlTrashGcJob.status == RUNNING,
+                or_(SqlTrashGcJob.heartbeat_at.is_(None), SqlTrashGcJob.heartbeat_at < now - timedelta(seconds=lease_seconds)),
+            ),
+        )
+        with self._Session(read_only=False) as session:
+            candidate = session.query(SqlTrashGcJob.id).filter(claimable).order_by(SqlTrashGcJob.id).first()
+            if candidate is None:
+                return None
+            claimed = (
+                session.query(SqlTrashGcJob)
+                .filter(SqlTrashGcJob.id == candidate[0], claimable)
+                .update(
+                    {
+                        SqlTrashGcJob.status: RUNNING,
+                        SqlTrashGcJob.claimed_by: worker_id,
+                        SqlTrashGcJob.heartbeat_at: now,
+                        SqlTrashGcJob.started_at: func.coalesce(SqlTrashGcJob.started_at, now),
+                    },
+                    synchronize_session=False,
+                )
+            )
+            if not claimed:
+                return None
+            session.flush()
+            session.expire_all()
+            return _to_job(session.get(SqlTrashGcJob, candidate[0]))
+
+    def release(self, job_id: int, worker_id: str) -> bool:
+        """Hand a job back to the queue, progress intact, so the next worker resumes it at once.
+
+        Used on a clean shutdown; a worker that dies without calling this is replaced once its
+        lease expires instead.
+        """
+        with self._Session(read_only=False) as session:
+            return self._touch(session, job_id, worker_id, status=QUEUED, claimed_by=None, heartbeat_at=None)
+
+    def start_deleting(self, job_id: int, worker_id: str, run_ids: List[str], experiment_ids: List[str]) -> bool:
+        """Record what the job will delete and move it to the ``runs`` phase.
+
+        One transaction, so a worker that stops part-way through leaves the job in ``collect``
+        with no items, and the next one collects afresh.
+        """
+        with self._Session(read_only=False) as session:
+            if not self._touch(
+                session,
+                job_id,
+                worker_id,
+                phase=PHASE_RUNS,
+                total_runs=len(run_ids),
+                total_experiments=len(experiment_ids),
+            ):
+                return False
+            items = [(RUN, run_id) for run_id in run_ids] + [(EXPERIMENT, experiment_id) for experiment_id in experiment_ids]
+            for start in range(0, len(items), _INSERT_CHUNK):
+                session.execute(
+                    insert(SqlTrashGcJobItem),
+                    [
+                        {"job_id": job_id, "kind": kind, "resource_id": resource_id, "status": ITEM_PENDING}
+                        for kind, resource_id in items[start : start + _INSERT_CHUNK]
+                    ],
+                )
+            return True
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """Renew the lease without changing anything else."""
+        with self._Session(read_only=False) as session:
+            return self._touch(session, job_id, worker_id)
+
+    def set_phase(self, job_id: int, worker_id: str, phase: str) -> bool:
+        """Move the job to ``phase``."""
+        with self._Session(read_only=False) as session:
+            return self._touch(session, job_id, worker_id, phase=phase)
+
+    def take_batch(self, job_id: int, worker_id: str, kind: str, limit: int) -> Optional[Dict[str, bool]]:
+        """Take up to ``limit`` unfinished items of ``kind`` into a batch.
+
+        Items a previous worker left ``processing`` come first, so an interrupted batch is
+        finished before new work starts.
+
+        Returns:
+            ``{resource_id: resumed}``, where ``resumed`` is True for items an earlier batch had
+            already started on; empty when the kind is finished; None if the lease was lost.
+        """
+        with self._Session(read_only=False) as session:
+            if not self._touch(session, job_id, worker_id):
+                return None
+            rows = (
+                session.query(SqlTrashGcJobItem.id, SqlTrashGcJobItem.resource_id, SqlTrashGcJobItem.status)
+                .filter(
+                    SqlTrashGcJobItem.job_id == job_id,
+                    SqlTrashGcJobItem.kind == kind,
+                    SqlTrashGcJobItem.status.in_((ITEM_PENDING, ITEM_PROCESSING)),
+                )
+                .order_by(SqlTrashGcJobItem.id)
+                .limit(limit)
+                .all()
+            )
+            pending = [item_id for item_id, _, status in rows if status == ITEM_PENDING]
+            if pending:
+                session.query(SqlTrashGcJobItem).filter(SqlTrashGcJobItem.id.in_(pending)).update(
+                    {SqlTrashGcJobItem.status: ITEM_PROCESSING}, synchronize_session=False
+                )
+            return {resource_id: status == ITEM_PROCESSING for _, resource_id, status in rows}
+
+    def record_batch(self, job_id: int, worker_id: str, kind: str, deleted: Iterable[str], failed: Mapping[str, str]) -> bool:
+        """Checkpoint a finished batch: its items' outcomes and the job's counters, together."""
+        deleted = list(deleted)
+        deleted_column, failed_column = _COUNTERS[kind]
+        with self._Session(read_only=False) as session:
+            if not self._touch(
+                session,
+                job_id,
+                worker_id,
+                **{
+                    deleted_column: getattr(SqlTrashGcJob, deleted_column) + len(deleted),
+                    failed_column: getattr(SqlTrashGcJob, failed_column) + len(failed),
+                },
+            ):
+                return False
+            items = session.query(SqlTrashGcJobItem).filter(SqlTrashGcJobItem.job_id == job_id, SqlTrashGcJobItem.kind == kind)
+            if deleted:
+                items.filter(SqlTrashGcJobItem.resource_id.in_(deleted)).update({SqlTrashGcJobItem.status: ITEM_DELETED}, synchronize_session=False)
+            for resource_id, error in failed.items():
+                items.filter(SqlTrashGcJobItem.resource_id == resource_id).update(
+                    {SqlTrashGcJobItem.status: ITEM_FAILED, SqlTrashGcJobItem.error: error}, synchronize_session=False
+                )
+            return True
+
+    def finish(self, job_id: int, worker_id: str, status: str, error: Optional[str] = None) -> bool:
+        """Close the job as ``completed`` or ``failed`` and give up the lease."""
+        with self._Session(read_only=False) as session:
+            return self._touch(
+                session,
+                job_id,
+                worker_id,
+                status=status,
+                phase=PHASE_DONE if status == COMPLETED else SqlTrashGcJob.phase,
+                claimed_by=None,
+                finished_at=_now(),
+                error=error,
+            )
+
+    @staticmethod
+    def _touch(session: Session, job_id: int, worker_id: str, **values) -> bool:
+        """Renew ``worker_id``'s lease on the job, applying ``values`` in the same statement.
+
+        False if the worker no longer holds the lease, in which case nothing is written.
+        """
+        values.setdefault("heartbeat_at", _now())
+        updated = (
+            session.query(SqlTrashGcJob)
+            .filter(SqlTrashGcJob.id == job_id, SqlTrashGcJob.status == RUNNING, SqlTrashGcJob.claimed_by == worker_id)
+            .update({getattr(SqlTrashGcJob, column): value for column, value in values.items()}, synchronize_session=False)
+        )
+        return updated == 1
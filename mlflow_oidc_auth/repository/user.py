@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import (
@@ -478,6 +478,16 @@ class UserRepository:
             _audit_sessions_revoked(username, deleted_sessions, "user_deleted")
 
     def authenticate(self, username: str, password: str) -> bool:
+        return self.verify_password(username, password)[0]
+
+    def verify_password(self, username: str, password: str) -> Tuple[bool, Optional[datetime]]:
+        """Check a password and report the expiration it was checked against.
+
+        Returns:
+            ``(verified, password_expiration)``. The expiration (UTC, or None when the
+            password does not expire) lets a caller cache the verification without
+            outliving the password.
+        """
         username = normalize_username(username)
         with self._Session() as session:
             try:
@@ -489,7 +499,7 @@ class UserRepository:
                     if expiration.tzinfo is None:
                         expiration = expiration.replace(tzinfo=timezone.utc)
                     if expiration < datetime.now(timezone.utc):
-                        return False
-                return check_password_hash(getattr(user, "password_hash"), password)
+                        return False, expiration
+                return check_password_hash(getattr(user, "password_hash"), password), expiration
             except MlflowException:
-                return False
+                return False, None
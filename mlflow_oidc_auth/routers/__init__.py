@@ -31,6 +31,7 @@ from mlflow_oidc_auth.routers.gateway_model_definition_permissions import (
     gateway_model_definition_permissions_router,
 )
 from mlflow_oidc_auth.routers.health import health_check_router
+from mlflow_oidc_auth.routers.runtime import runtime_router
 from mlflow_oidc_auth.routers.trash import trash_router
 from mlflow_oidc_auth.routers.ui import ui_router
 from mlflow_oidc_auth.routers.user_permissions import user_permissions_router
@@ -53,6 +54,7 @@ __all__ = [
     "gateway_secret_permissions_router",
     "gateway_model_definition_permissions_router",
     "health_check_router",
+    "runtime_router",
     "trash_router",
     "ui_router",
     "user_permissions_router",
@@ -181,6 +183,7 @@ def get_all_routers() -> List[APIRouter]:
         gateway_secret_permissions_router,
         gateway_model_definition_permissions_router,
         health_check_router,
+        runtime_router,
         trash_router,
         ui_router,
         user_permissions_router,
@@ -53,6 +53,7 @@ USERS_ROUTER_PREFIX = _get_rest_path("/mlflow/users")
 HEALTH_CHECK_ROUTER_PREFIX = "/health"
 UI_ROUTER_PREFIX = "/oidc/ui"
 TRASH_ROUTER_PREFIX = "/oidc/trash"
+RUNTIME_ROUTER_PREFIX = "/oidc/runtime"
 WEBHOOK_ROUTER_PREFIX = "/oidc/webhook"
 WORKSPACE_PERMISSIONS_ROUTER_PREFIX = _get_rest_path("/mlflow/permissions/workspaces", version=3)
 WORKSPACE_REGEX_PERMISSIONS_ROUTER_PREFIX = _get_rest_path("/mlflow/permissions/workspaces/regex", version=3)
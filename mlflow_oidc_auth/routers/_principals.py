@@ -0,0 +1,35 @@
+"""
+Response shaping for the "who has access" endpoints.
+
+Every ``/{resource}/users`` and ``/{resource}/groups`` endpoint, and the admin
+``/principals`` batch endpoints, read from ``store.list_resource_principals``; these
+helpers turn its ``ResourcePrincipal`` lists into the response models.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from mlflow_oidc_auth.entities import ResourcePrincipal
+from mlflow_oidc_auth.models import GroupPermissionEntry, ResourcePrincipalEntry, UserPermission
+
+USER_SOURCES: Tuple[str, ...] = ("user",)
+GROUP_SOURCES: Tuple[str, ...] = ("group",)
+
+
+def matrix_sources(include_regex: bool) -> Tuple[str, ...]:
+    """Sources listed by a ``/principals`` request."""
+    return ("user", "group", "regex", "group-regex") if include_regex else ("user", "group")
+
+
+def to_user_permissions(principals: Iterable[ResourcePrincipal]) -> List[UserPermission]:
+    return [UserPermission(name=p.name, permission=p.permission, kind=p.kind) for p in principals if p.source == "user"]
+
+
+def to_group_entries(principals: Iterable[ResourcePrincipal]) -> List[GroupPermissionEntry]:
+    return [GroupPermissionEntry(name=p.name, permission=p.permission) for p in principals if p.source == "group"]
+
+
+def to_matrix(principals: Dict[Any, List[ResourcePrincipal]], key: Callable[[Any], str] = str) -> Dict[str, List[ResourcePrincipalEntry]]:
+    return {
+        key(resource_id): [ResourcePrincipalEntry(name=p.name, permission=p.permission, kind=p.kind, source=p.source, regex=p.regex) for p in entries]
+        for resource_id, entries in principals.items()
+    }
@@ -1,16 +1,22 @@
-from typing import List
+from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from mlflow.exceptions import MlflowException
 from mlflow.server.handlers import _get_tracking_store
 
-from mlflow_oidc_auth.dependencies import check_experiment_manage_permission
+from mlflow_oidc_auth.dependencies import check_admin_permission, check_experiment_manage_permission
 from mlflow_oidc_auth.logger import get_logger
-from mlflow_oidc_auth.models import ExperimentSummary, GroupPermissionEntry, UserPermission
+from mlflow_oidc_auth.models import ExperimentSummary, GroupPermissionEntry, ResourcePrincipalEntry, UserPermission
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils import get_is_admin, get_username
 from mlflow_oidc_auth.utils.batch_permissions import filter_manageable_experiments
+from mlflow_oidc_auth.utils.experiment_metadata import get_experiment_metadata, get_experiments_metadata
+from mlflow_oidc_auth.utils.offload import run_blocking
+from mlflow_oidc_auth.utils.permissions import EXPERIMENT
+from mlflow_oidc_auth.utils.resource_index import list_experiments_from_index
 
 from ._prefix import EXPERIMENT_PERMISSIONS_ROUTER_PREFIX
+from ._principals import GROUP_SOURCES, USER_SOURCES, matrix_sources, to_group_entries, to_matrix, to_user_permissions
 
 logger = get_logger()
 
@@ -26,6 +32,33 @@ experiment_permissions_router = APIRouter(
 LIST_EXPERIMENTS = ""
 EXPERIMENT_USER_PERMISSIONS = "/{experiment_id}/users"
 EXPERIMENT_GROUP_PERMISSIONS = "/{experiment_id}/groups"
+EXPERIMENT_PRINCIPALS = "/principals"
+
+
+@experiment_permissions_router.get(
+    EXPERIMENT_PRINCIPALS,
+    response_model=Dict[str, List[ResourcePrincipalEntry]],
+    summary="List users and groups with permissions for several experiments",
+    description="Retrieves every grant on each of the given experiments, for the admin permission matrix.",
+)
+async def get_experiments_principals(
+    experiment_ids: List[str] = Query(..., alias="experiment_id", description="Experiment IDs to list grants for"),
+    include_regex: bool = Query(False, description="Also list grants derived from regex and group-regex rules"),
+    _: str = Depends(check_admin_permission),
+) -> Dict[str, List[ResourcePrincipalEntry]]:
+    """
+    List users and groups with permissions for a batch of experiments.
+
+    Regex rules match experiment names; experiments that cannot be found are listed
+    with their direct grants only.
+    """
+    names = await run_blocking(_experiment_names, experiment_ids) if include_regex else {}
+    try:
+        principals = await run_blocking(store.list_resource_principals, EXPERIMENT, experiment_ids, sources=matrix_sources(include_regex), names=names)
+    except Exception as e:
+        logger.error(f"Error retrieving experiment principals: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve experiment permissions")
+    return to_matrix(principals)
 
 
 @experiment_permissions_router.get(
@@ -61,26 +94,8 @@ async def get_experiment_users(
     HTTPException
         If the user doesn't have permission to access this information.
     """
-    all_users = store.list_users(all=True)
-
-    # Filter and format users with permissions for this experiment
-    users_with_permissions = []
-
-    for user in all_users:
-        # Get experiment permissions for this user
-        user_experiment_permissions = {str(exp.experiment_id): exp.permission for exp in (user.experiment_permissions or [])}
-
-        # Check if user has permission for this experiment
-        if experiment_id in user_experiment_permissions:
-            users_with_permissions.append(
-                UserPermission(
-                    name=user.username,
-                    permission=user_experiment_permissions[experiment_id],
-                    kind="service-account" if user.is_service_account else "user",
-                )
-            )
-
-    return users_with_permissions
+    principals = await run_blocking(store.list_resource_principals, EXPERIMENT, [experiment_id], sources=USER_SOURCES)
+    return to_user_permissions(principals[experiment_id])
 
 
 @experiment_permissions_router.get(
@@ -96,8 +111,8 @@ async def get_experiment_groups(
     """List all groups with permissions for a specific experiment."""
 
     try:
-        groups = store.experiment_group_repo.list_groups_for_experiment(str(experiment_id))
-        return [GroupPermissionEntry(name=name, permission=permission) for name, permission in groups]
+        principals = await run_blocking(store.list_resource_principals, EXPERIMENT, [str(experiment_id)], sources=GROUP_SOURCES)
+        return to_group_entries(principals[str(experiment_id)])
     except Exception as e:
         logger.error(f"Error retrieving experiment group permissions: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve experiment group permissions")
@@ -134,16 +149,37 @@ async def list_experiments(username: str = Depends(get_username), is_admin: bool
     HTTPException
         If there is an error retrieving or processing the experiments.
     """
-    tracking_store = _get_tracking_store()
-    all_experiments = tracking_store.search_experiments()
-
-    # Filter experiments based on user permissions (batch resolution for efficiency)
-    if is_admin:
-        # Admins can see all experiments
-        manageable_experiments = all_experiments
-    else:
-        # Regular users only see experiments they can manage
-        manageable_experiments = filter_manageable_experiments(username, all_experiments)
+    manageable_experiments = await run_blocking(_manageable_experiments, username, is_admin)
 
     # Format the response
     return [ExperimentSummary(name=experiment.name, id=experiment.experiment_id, tags=experiment.tags) for experiment in manageable_experiments]
+
+
+def _experiment_names(experiment_ids: List[str]) -> Dict[str, str]:
+    """Names of the experiments that exist, for matching regex rules."""
+    tracking_store = _get_tracking_store()
+    try:
+        return {experiment_id: metadata.name for experiment_id, metadata in get_experiments_metadata(tracking_store, experiment_ids).items()}
+    except MlflowException:
+        pass
+    # One unknown id fails the bulk lookup; resolve the others one at a time.
+    names: Dict[str, str] = {}
+    for experiment_id in dict.fromkeys(experiment_ids):
+        try:
+            names[experiment_id] = get_experiment_metadata(tracking_store, experiment_id).name
+        except MlflowException:
+            logger.debug(f"Experiment {experiment_id} not found; listing its direct grants only")
+    return names
+
+
+def _manageable_experiments(username: str, is_admin: bool) -> List:
+    """Every experiment for an admin; otherwise the ones ``username`` can manage."""
+    tracking_store = _get_tracking_store()
+
+    # Regular users only see experiments they can manage. The user's resource index
+    # names them directly; without it, list everything and batch-resolve.
+    manageable_experiments = None if is_admin else list_experiments_from_index(tracking_store, username, manage=True)
+    if manageable_experiments is None:
+        all_experiments = tracking_store.search_experiments()
+        manageable_experiments = all_experiments if is_admin else filter_manageable_experiments(username, all_experiments)
+    return manageable_experiments
@@ -1,16 +1,19 @@
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from fastapi.responses import JSONResponse
 
-from mlflow_oidc_auth.dependencies import check_gateway_endpoint_manage_permission
+from mlflow_oidc_auth.dependencies import check_admin_permission, check_gateway_endpoint_manage_permission
 from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.models.group import GroupPermissionEntry
-from mlflow_oidc_auth.models.permission import UserPermission
+from mlflow_oidc_auth.models.permission import ResourcePrincipalEntry, UserPermission
 from mlflow_oidc_auth.routers._prefix import GATEWAY_PERMISSIONS_ROUTER_PREFIX
+from mlflow_oidc_auth.routers._principals import GROUP_SOURCES, USER_SOURCES, matrix_sources, to_group_entries, to_matrix, to_user_permissions
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils import fetch_all_gateway_endpoints, get_is_admin, get_username
 from mlflow_oidc_auth.utils.batch_permissions import filter_manageable_gateway_endpoints
+from mlflow_oidc_auth.utils.offload import run_blocking
+from mlflow_oidc_auth.utils.permissions import GATEWAY_ENDPOINT
 
 logger = get_logger()
 
@@ -28,6 +31,26 @@ LIST_ENDPOINTS = ""
 
 GATEWAY_ENDPOINT_USER_PERMISSIONS = "/{name:path}/users"
 GATEWAY_ENDPOINT_GROUP_PERMISSIONS = "/{name:path}/groups"
+GATEWAY_ENDPOINT_PRINCIPALS = "/principals"
+
+
+@gateway_endpoint_permissions_router.get(
+    GATEWAY_ENDPOINT_PRINCIPALS,
+    response_model=Dict[str, List[ResourcePrincipalEntry]],
+    summary="List users and groups with permissions for several gateway endpoints",
+    description="Retrieves every grant on each of the given gateway endpoints, for the admin permission matrix.",
+)
+async def get_gateway_endpoints_principals(
+    names: List[str] = Query(..., alias="name", description="Gateway endpoint names to list grants for"),
+    include_regex: bool = Query(False, description="Also list grants derived from regex and group-regex rules"),
+    _: str = Depends(check_admin_permission),
+) -> Dict[str, List[ResourcePrincipalEntry]]:
+    """List users and groups with permissions for a batch of gateway endpoints."""
+    try:
+        return to_matrix(await run_blocking(store.list_resource_principals, GATEWAY_ENDPOINT, names, sources=matrix_sources(include_regex)))
+    except Exception as e:
+        logger.error(f"Error retrieving gateway endpoint principals: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve gateway endpoint permissions")
 
 
 @gateway_endpoint_permissions_router.get(
@@ -40,24 +63,8 @@ async def get_gateway_endpoint_users(
     name: str = Path(..., description="The gateway endpoint name to get permissions for"),
     _: None = Depends(check_gateway_endpoint_manage_permission),
 ) -> List[UserPermission]:
-    list_users = store.list_users(all=True)
-
-    users: List[UserPermission] = []
-    for user in list_users:
-        user_gateways = {}
-        if hasattr(user, "gateway_endpoint_permissions") and user.gateway_endpoint_permissions:
-            # Permission objects use `endpoint_id`
-            user_gateways = {g.endpoint_id: g.permission for g in user.gateway_endpoint_permissions}
-
-        if name in user_gateways:
-            users.append(
-                UserPermission(
-                    name=user.username,
-                    permission=user_gateways[name],
-                    kind="service-account" if user.is_service_account else "user",
-                )
-            )
-    return users
+    principals = await run_blocking(store.list_resource_principals, GATEWAY_ENDPOINT, [name], sources=USER_SOURCES)
+    return to_user_permissions(principals[name])
 
 
 @gateway_endpoint_permissions_router.get(
@@ -72,8 +79,8 @@ async def get_gateway_endpoint_groups(
 ) -> List[GroupPermissionEntry]:
     """List all groups with permissions for a specific gateway endpoint."""
     try:
-        groups = store.gateway_endpoint_group_repo.list_groups_for_endpoint(name)
-        return [GroupPermissionEntry(name=group_name, permission=permission) for group_name, permission in groups]
+        principals = await run_blocking(store.list_resource_principals, GATEWAY_ENDPOINT, [name], sources=GROUP_SOURCES)
+        return to_group_entries(principals[name])
     except Exception as e:
         logger.error(f"Error retrieving gateway endpoint group permissions: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve gateway endpoint group permissions")
@@ -114,14 +121,14 @@ async def list_gateway_endpoints(username: str = Depends(get_username), is_admin
     """
     try:
         # Fetch all gateway endpoints from MLflow's tracking store
-        all_endpoints = fetch_all_gateway_endpoints()
+        all_endpoints = await run_blocking(fetch_all_gateway_endpoints)
 
         if is_admin:
             # Admins can see all endpoints
             endpoints = all_endpoints
         else:
             # Regular users only see endpoints they can manage
-            endpoints = filter_manageable_gateway_endpoints(username, all_endpoints)
+            endpoints = await run_blocking(filter_manageable_gateway_endpoints, username, all_endpoints)
 
         # Format the response to match the expected frontend schema
         return JSONResponse(
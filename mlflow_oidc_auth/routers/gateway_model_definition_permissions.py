@@ -1,16 +1,19 @@
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from fastapi.responses import JSONResponse
 
-from mlflow_oidc_auth.dependencies import check_gateway_model_definition_manage_permission
+from mlflow_oidc_auth.dependencies import check_admin_permission, check_gateway_model_definition_manage_permission
 from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.models.group import GroupPermissionEntry
-from mlflow_oidc_auth.models.permission import UserPermission
+from mlflow_oidc_auth.models.permission import ResourcePrincipalEntry, UserPermission
 from mlflow_oidc_auth.routers._prefix import GATEWAY_PERMISSIONS_ROUTER_PREFIX
+from mlflow_oidc_auth.routers._principals import GROUP_SOURCES, USER_SOURCES, matrix_sources, to_group_entries, to_matrix, to_user_permissions
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils import fetch_all_gateway_model_definitions, get_is_admin, get_username
 from mlflow_oidc_auth.utils.batch_permissions import filter_manageable_gateway_model_definitions
+from mlflow_oidc_auth.utils.offload import run_blocking
+from mlflow_oidc_auth.utils.permissions import GATEWAY_MODEL_DEFINITION
 
 logger = get_logger()
 
@@ -28,6 +31,26 @@ LIST_MODEL_DEFINITIONS = ""
 
 GATEWAY_MODEL_DEFINITION_USER_PERMISSIONS = "/{name:path}/users"
 GATEWAY_MODEL_DEFINITION_GROUP_PERMISSIONS = "/{name:path}/groups"
+GATEWAY_MODEL_DEFINITION_PRINCIPALS = "/principals"
+
+
+@gateway_model_definition_permissions_router.get(
+    GATEWAY_MODEL_DEFINITION_PRINCIPALS,
+    response_model=Dict[str, List[ResourcePrincipalEntry]],
+    summary="List users and groups with permissions for several gateway model definitions",
+    description="Retrieves every grant on each of the given gateway model definitions, for the admin permission matrix.",
+)
+async def get_gateway_model_definitions_principals(
+    names: List[str] = Query(..., alias="name", description="Gateway model definition names to list grants for"),
+    include_regex: bool = Query(False, description="Also list grants derived from regex and group-regex rules"),
+    _: str = Depends(check_admin_permission),
+) -> Dict[str, List[ResourcePrincipalEntry]]:
+    """List users and groups with permissions for a batch of gateway model definitions."""
+    try:
+        return to_matrix(await run_blocking(store.list_resource_principals, GATEWAY_MODEL_DEFINITION, names, sources=matrix_sources(include_regex)))
+    except Exception as e:
+        logger.error(f"Error retrieving gateway model definition principals: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve gateway model definition permissions")
 
 
 @gateway_model_definition_permissions_router.get(
@@ -40,23 +63,8 @@ async def get_gateway_model_definition_users(
     name: str = Path(..., description="The gateway model definition name to get permissions for"),
     _: None = Depends(check_gateway_model_definition_manage_permission),
 ) -> List[UserPermission]:
-    list_users = store.list_users(all=True)
-
-    users: List[UserPermission] = []
-    for user in list_users:
-        user_defs = {}
-        if hasattr(user, "gateway_model_definition_permissions") and user.gateway_model_definition_permissions:
-            user_defs = {g.model_definition_id: g.permission for g in user.gateway_model_definition_permissions}
-
-        if name in user_defs:
-            users.append(
-                UserPermission(
-                    name=user.username,
-                    permission=user_defs[name],
-                    kind="service-account" if user.is_service_account else "user",
-                )
-            )
-    return users
+    principals = await run_blocking(store.list_resource_principals, GATEWAY_MODEL_DEFINITION, [name], sources=USER_SOURCES)
+    return to_user_permissions(principals[name])
 
 
 @gateway_model_definition_permissions_router.get(
@@ -71,8 +79,8 @@ async def get_gateway_model_definition_groups(
 ) -> List[GroupPermissionEntry]:
     """List all groups with permissions for a specific gateway model definition."""
     try:
-        groups = store.gateway_model_definition_group_repo.list_groups_for_model_definition(name)
-        return [GroupPermissionEntry(name=group_name, permission=permission) for group_name, permission in groups]
+        principals = await run_blocking(store.list_resource_principals, GATEWAY_MODEL_DEFINITION, [name], sources=GROUP_SOURCES)
+        return to_group_entries(principals[name])
     except Exception as e:
         logger.error(f"Error retrieving gateway model definition group permissions: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve gateway model definition group permissions")
@@ -111,14 +119,14 @@ async def list_gateway_model_definitions(username: str = Depends(get_username),
     """
     try:
         # Fetch all gateway model definitions from MLflow's tracking store
-        all_models = fetch_all_gateway_model_definitions()
+        all_models = await run_blocking(fetch_all_gateway_model_definitions)
 
         if is_admin:
             # Admins can see all model definitions
             models = all_models
         else:
             # Regular users only see model definitions they can manage
-            models = filter_manageable_gateway_model_definitions(username, all_models)
+            models = await run_blocking(filter_manageable_gateway_model_definitions, username, all_models)
 
         # Format the response to match the expected frontend schema
         return JSONResponse(
@@ -1,16 +1,19 @@
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from fastapi.responses import JSONResponse
 
-from mlflow_oidc_auth.dependencies import check_gateway_secret_manage_permission
+from mlflow_oidc_auth.dependencies import check_admin_permission, check_gateway_secret_manage_permission
 from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.models.group import GroupPermissionEntry
-from mlflow_oidc_auth.models.permission import UserPermission
+from mlflow_oidc_auth.models.permission import ResourcePrincipalEntry, UserPermission
 from mlflow_oidc_auth.routers._prefix import GATEWAY_PERMISSIONS_ROUTER_PREFIX
+from mlflow_oidc_auth.routers._principals import GROUP_SOURCES, USER_SOURCES, matrix_sources, to_group_entries, to_matrix, to_user_permissions
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils import fetch_all_gateway_secrets, get_is_admin, get_username
 from mlflow_oidc_auth.utils.batch_permissions import filter_manageable_gateway_secrets
+from mlflow_oidc_auth.utils.offload import run_blocking
+from mlflow_oidc_auth.utils.permissions import GATEWAY_SECRET
 
 logger = get_logger()
 
@@ -28,6 +31,26 @@ LIST_SECRETS = ""
 
 GATEWAY_SECRET_USER_PERMISSIONS = "/{name:path}/users"
 GATEWAY_SECRET_GROUP_PERMISSIONS = "/{name:path}/groups"
+GATEWAY_SECRET_PRINCIPALS = "/principals"
+
+
+@gateway_secret_permissions_router.get(
+    GATEWAY_SECRET_PRINCIPALS,
+    response_model=Dict[str, List[ResourcePrincipalEntry]],
+    summary="List users and groups with permissions for several gateway secrets",
+    description="Retrieves every grant on each of the given gateway secrets, for the admin permission matrix.",
+)
+async def get_gateway_secrets_principals(
+    names: List[str] = Query(..., alias="name", description="Gateway secret names to list grants for"),
+    include_regex: bool = Query(False, description="Also list grants derived from regex and group-regex rules"),
+    _: str = Depends(check_admin_permission),
+) -> Dict[str, List[ResourcePrincipalEntry]]:
+    """List users and groups with permissions for a batch of gateway secrets."""
+    try:
+        return to_matrix(await run_blocking(store.list_resource_principals, GATEWAY_SECRET, names, sources=matrix_sources(include_regex)))
+    except Exception as e:
+        logger.error(f"Error retrieving gateway secret principals: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve gateway secret permissions")
 
 
 @gateway_secret_permissions_router.get(
@@ -40,23 +63,8 @@ async def get_gateway_secret_users(
     name: str = Path(..., description="The gateway secret name to get permissions for"),
     _: None = Depends(check_gateway_secret_manage_permission),
 ) -> List[UserPermission]:
-    list_users = store.list_users(all=True)
-
-    users: List[UserPermission] = []
-    for user in list_users:
-        user_secrets = {}
-        if hasattr(user, "gateway_secret_permissions") and user.gateway_secret_permissions:
-            user_secrets = {g.secret_id: g.permission for g in user.gateway_secret_permissions}
-
-        if name in user_secrets:
-            users.append(
-                UserPermission(
-                    name=user.username,
-                    permission=user_secrets[name],
-                    kind="service-account" if user.is_service_account else "user",
-                )
-            )
-    return users
+    principals = await run_blocking(store.list_resource_principals, GATEWAY_SECRET, [name], sources=USER_SOURCES)
+    return to_user_permissions(principals[name])
 
 
 @gateway_secret_permissions_router.get(
@@ -71,8 +79,8 @@ async def get_gateway_secret_groups(
 ) -> List[GroupPermissionEntry]:
     """List all groups with permissions for a specific gateway secret."""
     try:
-        groups = store.gateway_secret_group_repo.list_groups_for_secret(name)
-        return [GroupPermissionEntry(name=group_name, permission=permission) for group_name, permission in groups]
+        principals = await run_blocking(store.list_resource_principals, GATEWAY_SECRET, [name], sources=GROUP_SOURCES)
+        return to_group_entries(principals[name])
     except Exception as e:
         logger.error(f"Error retrieving gateway secret group permissions: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve gateway secret group permissions")
@@ -111,14 +119,14 @@ async def list_gateway_secrets(username: str = Depends(get_username), is_admin:
     """
     try:
         # Fetch all gateway secrets from MLflow's tracking store
-        all_secrets = fetch_all_gateway_secrets()
+        all_secrets = await run_blocking(fetch_all_gateway_secrets)
 
         if is_admin:
             # Admins can see all secrets
             secrets = all_secrets
         else:
             # Regular users only see secrets they can manage
-            secrets = filter_manageable_gateway_secrets(username, all_secrets)
+            secrets = await run_blocking(filter_manageable_gateway_secrets, username, all_secrets)
 
         # Format the response to match the expected frontend schema
         return JSONResponse(
@@ -44,6 +44,7 @@ from mlflow_oidc_auth.utils import (
     get_is_admin,
     get_username,
 )
+from mlflow_oidc_auth.utils.offload import run_blocking
 
 from ._prefix import GROUP_PERMISSIONS_ROUTER_PREFIX
 
@@ -133,7 +134,7 @@ async def list_groups(username: str = Depends(get_username)) -> GroupListRespons
     try:
         from mlflow_oidc_auth.store import store
 
-        groups = store.get_groups()
+        groups = await run_blocking(store.get_groups)
         return GroupListResponse(root=groups)
 
     except Exception as e:
@@ -175,7 +176,7 @@ async def get_group_users(
         If there's an error retrieving the group users.
     """
     try:
-        users = store.get_group_users(group_name)
+        users = await run_blocking(store.get_group_users, group_name)
         return [GroupUser(username=user.username, is_admin=user.is_admin) for user in users]
     except Exception as e:
         logger.error(f"Error getting group users: {str(e)}")
@@ -217,16 +218,16 @@ async def get_group_experiments(
     """
     try:
         # Get experiments that have permissions assigned to this group
-        group_experiments = store.get_group_experiments(group_name)
+        group_experiments = await run_blocking(store.get_group_experiments, group_name)
         tracking_store = _get_tracking_store()
 
         items: List[GroupExperimentPermissionItem] = []
         for experiment in group_experiments:
-            can_manage = is_admin or effective_experiment_permission(experiment.experiment_id, current_username).permission.can_manage
+            can_manage = is_admin or (await run_blocking(effective_experiment_permission, experiment.experiment_id, current_username)).permission.can_manage
             if not can_manage:
                 continue
 
-            mlflow_experiment = tracking_store.get_experiment(experiment.experiment_id)
+            mlflow_experiment = await run_blocking(tracking_store.get_experiment, experiment.experiment_id)
             items.append(
                 GroupExperimentPermissionItem(
                     id=str(experiment.experiment_id),
@@ -276,7 +277,8 @@ async def create_group_experiment_permission(
         Confirmation of the created permission.
     """
     try:
-        store.create_group_experiment_permission(
+        await run_blocking(
+            store.create_group_experiment_permission,
             group_name,
             experiment_id,
             permission_data.permission,
@@ -327,7 +329,8 @@ async def update_group_experiment_permission(
         Confirmation of the updated permission.
     """
     try:
-        store.update_group_experiment_permission(
+        await run_blocking(
+            store.update_group_experiment_permission,
             group_name,
             experiment_id,
             permission_data.permission,
@@ -375,7 +378,7 @@ async def delete_group_experiment_permission(
         Confirmation of the deleted permission.
     """
     try:
-        store.delete_group_experiment_permission(group_name, experiment_id)
+        await run_blocking(store.delete_group_experiment_permission, group_name, experiment_id)
         emit_audit_event(
             "permission.delete",
             actor=current_username,
@@ -424,11 +427,11 @@ async def get_group_registered_models(
     """
     try:
         # Get registered models that have permissions assigned to this group
-        group_models = store.get_group_models(group_name)
+        group_models = await run_blocking(store.get_group_models, group_name)
 
         items: List[GroupNamedPermissionItem] = []
         for model in group_models:
-            can_manage = is_admin or effective_registered_model_permission(model.name, current_username).permission.can_manage
+            can_manage = is_admin or (await run_blocking(effective_registered_model_permission, model.name, current_username)).permission.can_manage
             if not can_manage:
                 continue
 
@@ -478,10 +481,11 @@ async def create_group_registered_model_permission(
         Confirmation of the created permission.
     """
     # Check if user can manage this registered model
-    if not is_admin and not effective_registered_model_permission(name, current_username).permission.can_manage:
+    if not is_admin and not (await run_blocking(effective_registered_model_permission, name, current_username)).permission.can_manage:
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage registered model {name}")
     try:
-        store.create_group_model_permission(
+        await run_blocking(
+            store.create_group_model_permission,
             group_name=group_name,
             name=name,
             permission=permission_data.permission,
@@ -535,10 +539,11 @@ async def update_group_registered_model_permission(
         Confirmation of the updated permission.
     """
     # Check if user can manage this registered model
-    if not is_admin and not effective_registered_model_permission(name, current_username).permission.can_manage:
+    if not is_admin and not (await run_blocking(effective_registered_model_permission, name, current_username)).permission.can_manage:
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage registered model {name}")
     try:
-        store.update_group_model_permission(
+        await run_blocking(
+            store.update_group_model_permission,
             group_name=group_name,
             name=name,
             permission=permission_data.permission,
@@ -589,10 +594,10 @@ async def delete_group_registered_model_permission(
         Confirmation of the deleted permission.
     """
     # Check if user can manage this registered model
-    if not is_admin and not effective_registered_model_permission(name, current_username).permission.can_manage:
+    if not is_admin and not (await run_blocking(effective_registered_model_permission, name, current_username)).permission.can_manage:
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage registered model {name}")
     try:
-        store.delete_group_model_permission(group_name, name)
+        await run_blocking(store.delete_group_model_permission, group_name, name)
         emit_audit_event(
             "permission.delete",
             actor=current_username,
@@ -641,12 +646,12 @@ async def get_group_prompts(
     """
     try:
         # Get prompts that have permissions assigned to this group
-        group_prompts = store.get_group_prompts(group_name)
+        group_prompts = await run_blocking(store.get_group_prompts, group_name)
 
         # For admins: show all group prompts
         items: List[GroupNamedPermissionItem] = []
         for prompt in group_prompts:
-            can_manage = is_admin or effective_prompt_permission(prompt.name, current_username).permission.can_manage
+            can_manage = is_admin or (await run_blocking(effective_prompt_permission, prompt.name, current_username)).permission.can_manage
             if not can_manage:
                 continue
 
@@ -695,11 +700,12 @@ async def create_group_prompt_permission(
         Confirmation of the created permission.
     """
     # Check if user can manage this prompt
-    if not is_admin and not effective_prompt_permission(prompt_name, current_username).permission.can_manage:
+    if not is_admin and not (await run_blocking(effective_prompt_permission, prompt_name, current_username)).permission.can_manage:
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage prompt {prompt_name}")
 
     try:
-        store.create_group_prompt_permission(
+        await run_blocking(
+            store.create_group_prompt_permission,
             group_name=group_name,
             name=prompt_name,
             permission=permission_data.permission,
@@ -753,11 +759,12 @@ async def update_group_prompt_permission(
         Confirmation of the updated permission.
     """
     # Check if user can manage this prompt
-    if not is_admin and not effective_prompt_permission(prompt_name, current_username).permission.can_manage:
+    if not is_admin and not (await run_blocking(effective_prompt_permission, prompt_name, current_username)).permission.can_manage:
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage prompt {prompt_name}")
 
     try:
-        store.update_group_prompt_permission(
+        await run_blocking(
+            store.update_group_prompt_permission,
             group_name=group_name,
             name=prompt_name,
             permission=permission_data.permission,
@@ -808,11 +815,11 @@ async def delete_group_prompt_permission(
         Confirmation of the deleted permission.
     """
     # Check if user can manage this prompt
-    if not is_admin and not effective_prompt_permission(prompt_name, current_username).permission.can_manage:
+    if not is_admin and not (await run_blocking(effective_prompt_permission, prompt_name, current_username)).permission.can_manage:
         raise HTTPException(status_code=403, detail=f"Insufficient permissions to manage prompt {prompt_name}")
 
     try:
-        store.delete_group_prompt_permission(group_name, prompt_name)
+        await run_blocking(store.delete_group_prompt_permission, group_name, prompt_name)
         emit_audit_event(
             "permission.delete",
             actor=current_username,
@@ -841,7 +848,7 @@ async def get_group_experiment_pattern_permissions(
     Get all experiment regex pattern permissions for a group.
     """
     try:
-        patterns = store.list_group_experiment_regex_permissions(group_name)
+        patterns = await run_blocking(store.list_group_experiment_regex_permissions, group_name)
         items: List[GroupExperimentRegexPermissionItem] = []
         for pattern in patterns:
             payload = pattern.to_json() if hasattr(pattern, "to_json") else None
@@ -889,8 +896,12 @@ async def create_group_experiment_pattern_permission(
     Create a regex pattern permission for a group to access experiments.
     """
     try:
-        store.create_group_experiment_regex_permission(
-            regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission, group_name=group_name
+        await run_blocking(
+            store.create_group_experiment_regex_permission,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
+            group_name=group_name,
         )
         emit_audit_event(
             "permission.create",
@@ -921,7 +932,7 @@ async def get_group_experiment_pattern_permission(
     Get a specific experiment regex pattern permission for a group.
     """
     try:
-        pattern = store.get_group_experiment_regex_permission(group_name, id)
+        pattern = await run_blocking(store.get_group_experiment_regex_permission, group_name, id)
         payload = pattern.to_json() if hasattr(pattern, "to_json") else None
         if isinstance(payload, dict):
             item = GroupExperimentRegexPermissionItem(
@@ -963,8 +974,13 @@ async def update_group_experiment_pattern_permission(
     Update a specific experiment regex pattern permission for a group.
     """
     try:
-        store.update_group_experiment_regex_permission(
-            id=id, group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        await run_blocking(
+            store.update_group_experiment_regex_permission,
+            id=id,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.update",
@@ -995,7 +1011,7 @@ async def delete_group_experiment_pattern_permission(
     Delete a specific experiment regex pattern permission for a group.
     """
     try:
-        store.delete_group_experiment_regex_permission(group_name, id)
+        await run_blocking(store.delete_group_experiment_regex_permission, group_name, id)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1024,7 +1040,7 @@ async def get_group_registered_model_pattern_permissions(
     Get all registered model regex pattern permissions for a group.
     """
     try:
-        patterns = store.list_group_registered_model_regex_permissions(group_name)
+        patterns = await run_blocking(store.list_group_registered_model_regex_permissions, group_name)
         items: List[GroupRegisteredModelRegexPermissionItem] = []
         for pattern in patterns:
             payload = pattern.to_json() if hasattr(pattern, "to_json") else None
@@ -1074,8 +1090,12 @@ async def create_group_registered_model_pattern_permission(
     Create a regex pattern permission for a group to access registered models.
     """
     try:
-        store.create_group_registered_model_regex_permission(
-            regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission, group_name=group_name
+        await run_blocking(
+            store.create_group_registered_model_regex_permission,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
+            group_name=group_name,
         )
         emit_audit_event(
             "permission.create",
@@ -1106,7 +1126,7 @@ async def get_group_registered_model_pattern_permission(
     Get a specific registered model regex pattern permission for a group.
     """
     try:
-        pattern = store.get_group_registered_model_regex_permission(group_name, id)
+        pattern = await run_blocking(store.get_group_registered_model_regex_permission, group_name, id)
         payload = pattern.to_json() if hasattr(pattern, "to_json") else None
         if isinstance(payload, dict):
             item = GroupRegisteredModelRegexPermissionItem(
@@ -1150,8 +1170,13 @@ async def update_group_registered_model_pattern_permission(
     Update a specific registered model regex pattern permission for a group.
     """
     try:
-        store.update_group_registered_model_regex_permission(
-            id=id, group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        await run_blocking(
+            store.update_group_registered_model_regex_permission,
+            id=id,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.update",
@@ -1182,7 +1207,7 @@ async def delete_group_registered_model_pattern_permission(
     Delete a specific registered model regex pattern permission for a group.
     """
     try:
-        store.delete_group_registered_model_regex_permission(group_name, id)
+        await run_blocking(store.delete_group_registered_model_regex_permission, group_name, id)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1211,7 +1236,7 @@ async def get_group_prompt_pattern_permissions(
     Get all prompt regex pattern permissions for a group.
     """
     try:
-        patterns = store.list_group_prompt_regex_permissions(group_name)
+        patterns = await run_blocking(store.list_group_prompt_regex_permissions, group_name)
         items: List[GroupPromptRegexPermissionItem] = []
         for pattern in patterns:
             payload = pattern.to_json() if hasattr(pattern, "to_json") else None
@@ -1261,8 +1286,12 @@ async def create_group_prompt_pattern_permission(
     Create a regex pattern permission for a group to access prompts.
     """
     try:
-        store.create_group_prompt_regex_permission(
-            regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission, group_name=group_name
+        await run_blocking(
+            store.create_group_prompt_regex_permission,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
+            group_name=group_name,
         )
         emit_audit_event(
             "permission.create",
@@ -1293,7 +1322,7 @@ async def get_group_prompt_pattern_permission(
     Get a specific prompt regex pattern permission for a group.
     """
     try:
-        pattern = store.get_group_prompt_regex_permission(id, group_name)
+        pattern = await run_blocking(store.get_group_prompt_regex_permission, id, group_name)
         payload = pattern.to_json() if hasattr(pattern, "to_json") else None
         if isinstance(payload, dict):
             item = GroupPromptRegexPermissionItem(
@@ -1337,8 +1366,13 @@ async def update_group_prompt_pattern_permission(
     Update a specific prompt regex pattern permission for a group.
     """
     try:
-        store.update_group_prompt_regex_permission(
-            id=id, group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        await run_blocking(
+            store.update_group_prompt_regex_permission,
+            id=id,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.update",
@@ -1369,7 +1403,7 @@ async def delete_group_prompt_pattern_permission(
     Delete a specific prompt regex pattern permission for a group.
     """
     try:
-        store.delete_group_prompt_regex_permission(id, group_name)
+        await run_blocking(store.delete_group_prompt_regex_permission, id, group_name)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1401,11 +1435,11 @@ async def get_group_scorers(
     for scorers belonging to experiments they can manage.
     """
     try:
-        group_scorers = store.list_group_scorer_permissions(group_name)
+        group_scorers = await run_blocking(store.list_group_scorer_permissions, group_name)
         filtered = (
             group_scorers
             if is_admin
-            else [sp for sp in group_scorers if effective_experiment_permission(sp.experiment_id, current_username).permission.can_manage]
+            else [sp for sp in group_scorers if (await run_blocking(effective_experiment_permission, sp.experiment_id, current_username)).permission.can_manage]
         )
         return [
             GroupScorerPermissionItem(
@@ -1437,7 +1471,8 @@ async def create_group_scorer_permission(
     current_username: str = Depends(check_experiment_manage_permission),
 ) -> StatusMessageResponse:
     try:
-        store.create_group_scorer_permission(
+        await run_blocking(
+            store.create_group_scorer_permission,
             group_name=group_name,
             experiment_id=str(experiment_id),
             scorer_name=str(scorer_name),
@@ -1471,7 +1506,8 @@ async def update_group_scorer_permission(
     current_username: str = Depends(check_experiment_manage_permission),
 ) -> StatusMessageResponse:
     try:
-        store.update_group_scorer_permission(
+        await run_blocking(
+            store.update_group_scorer_permission,
             group_name=group_name,
             experiment_id=str(experiment_id),
             scorer_name=str(scorer_name),
@@ -1504,7 +1540,7 @@ async def delete_group_scorer_permission(
     current_username: str = Depends(check_experiment_manage_permission),
 ) -> StatusMessageResponse:
     try:
-        store.delete_group_scorer_permission(group_name, str(experiment_id), str(scorer_name))
+        await run_blocking(store.delete_group_scorer_permission, group_name, str(experiment_id), str(scorer_name))
         emit_audit_event(
             "permission.delete",
             actor=current_username,
@@ -1530,7 +1566,7 @@ async def get_group_scorer_pattern_permissions(
     admin_username: str = Depends(check_admin_permission),
 ) -> List[GroupScorerRegexPermissionItem]:
     try:
-        patterns = store.list_group_scorer_regex_permissions(group_name)
+        patterns = await run_blocking(store.list_group_scorer_regex_permissions, group_name)
         items: List[GroupScorerRegexPermissionItem] = []
         for pattern in patterns:
             payload = pattern.to_json() if hasattr(pattern, "to_json") else None
@@ -1575,7 +1611,8 @@ async def create_group_scorer_pattern_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> StatusMessageResponse:
     try:
-        store.create_group_scorer_regex_permission(
+        await run_blocking(
+            store.create_group_scorer_regex_permission,
             group_name=group_name,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
@@ -1607,7 +1644,7 @@ async def get_group_scorer_pattern_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> GroupScorerRegexPermissionItem:
     try:
-        pattern = store.get_group_scorer_regex_permission(group_name, id)
+        pattern = await run_blocking(store.get_group_scorer_regex_permission, group_name, id)
         payload = pattern.to_json() if hasattr(pattern, "to_json") else None
         if isinstance(payload, dict):
             item = GroupScorerRegexPermissionItem(
@@ -1646,7 +1683,8 @@ async def update_group_scorer_pattern_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> StatusMessageResponse:
     try:
-        store.update_group_scorer_regex_permission(
+        await run_blocking(
+            store.update_group_scorer_regex_permission,
             id=id,
             group_name=group_name,
             regex=pattern_data.regex,
@@ -1679,7 +1717,7 @@ async def delete_group_scorer_pattern_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> StatusMessageResponse:
     try:
-        store.delete_group_scorer_regex_permission(id, group_name)
+        await run_blocking(store.delete_group_scorer_regex_permission, id, group_name)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1711,7 +1749,7 @@ async def get_group_gateway_endpoint_permissions(
 ) -> List[GroupNamedPermissionItem]:
     """List gateway endpoint permissions for a group."""
     try:
-        perms = store.list_group_gateway_endpoint_permissions(group_name=group_name)
+        perms = await run_blocking(store.list_group_gateway_endpoint_permissions, group_name=group_name)
         return [GroupNamedPermissionItem(name=p.endpoint_id, permission=p.permission) for p in perms]
     except Exception as e:
         logger.error(f"Error listing group gateway endpoint permissions: {str(e)}")
@@ -1734,7 +1772,9 @@ async def create_group_gateway_endpoint_permission(
 ) -> GroupNamedPermissionItem:
     """Create a gateway endpoint permission for a group."""
     try:
-        perm = store.create_group_gateway_endpoint_permission(group_name=group_name, gateway_name=name, permission=permission_data.permission)
+        perm = await run_blocking(
+            store.create_group_gateway_endpoint_permission, group_name=group_name, gateway_name=name, permission=permission_data.permission
+        )
         emit_audit_event(
             "permission.create",
             actor=admin_username,
@@ -1762,7 +1802,7 @@ async def get_group_gateway_endpoint_permission(
 ) -> GroupNamedPermissionItem:
     """Get a gateway endpoint permission for a group."""
     try:
-        perm = store.get_user_groups_gateway_endpoint_permission(gateway_name=name, group_name=group_name)
+        perm = await run_blocking(store.get_user_groups_gateway_endpoint_permission, gateway_name=name, group_name=group_name)
         return GroupNamedPermissionItem(name=perm.endpoint_id, permission=perm.permission)
     except Exception as e:
         logger.error(f"Error getting group gateway endpoint permission: {str(e)}")
@@ -1784,7 +1824,7 @@ async def update_group_gateway_endpoint_permission(
 ) -> StatusMessageResponse:
     """Update a gateway endpoint permission for a group."""
     try:
-        store.update_group_gateway_endpoint_permission(group_name=group_name, gateway_name=name, permission=permission_data.permission)
+        await run_blocking(store.update_group_gateway_endpoint_permission, group_name=group_name, gateway_name=name, permission=permission_data.permission)
         emit_audit_event(
             "permission.update",
             actor=admin_username,
@@ -1812,7 +1852,7 @@ async def delete_group_gateway_endpoint_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway endpoint permission for a group."""
     try:
-        store.delete_group_gateway_endpoint_permission(group_name=group_name, gateway_name=name)
+        await run_blocking(store.delete_group_gateway_endpoint_permission, group_name=group_name, gateway_name=name)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1844,7 +1884,7 @@ async def get_group_gateway_endpoint_pattern_permissions(
 ) -> List[GroupGatewayRegexPermissionItem]:
     """List gateway endpoint pattern permissions for a group."""
     try:
-        perms = store.list_group_gateway_endpoint_regex_permissions(group_name=group_name)
+        perms = await run_blocking(store.list_group_gateway_endpoint_regex_permissions, group_name=group_name)
         return [GroupGatewayRegexPermissionItem(id=p.id, regex=p.regex, priority=p.priority, group_id=p.group_id, permission=p.permission) for p in perms]
     except Exception as e:
         logger.error(f"Error listing group gateway endpoint pattern permissions: {str(e)}")
@@ -1866,8 +1906,12 @@ async def create_group_gateway_endpoint_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Create a gateway endpoint pattern permission for a group."""
     try:
-        perm = store.create_group_gateway_endpoint_regex_permission(
-            group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        perm = await run_blocking(
+            store.create_group_gateway_endpoint_regex_permission,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.create",
@@ -1896,7 +1940,7 @@ async def get_group_gateway_endpoint_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Get a gateway endpoint pattern permission for a group."""
     try:
-        perm = store.get_group_gateway_endpoint_regex_permission(id=id, group_name=group_name)
+        perm = await run_blocking(store.get_group_gateway_endpoint_regex_permission, id=id, group_name=group_name)
         return GroupGatewayRegexPermissionItem(id=perm.id, regex=perm.regex, priority=perm.priority, group_id=perm.group_id, permission=perm.permission)
     except Exception as e:
         logger.error(f"Error getting group gateway endpoint pattern permission: {str(e)}")
@@ -1918,8 +1962,13 @@ async def update_group_gateway_endpoint_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Update a gateway endpoint pattern permission for a group."""
     try:
-        perm = store.update_group_gateway_endpoint_regex_permission(
-            id=id, group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        perm = await run_blocking(
+            store.update_group_gateway_endpoint_regex_permission,
+            id=id,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.update",
@@ -1948,7 +1997,7 @@ async def delete_group_gateway_endpoint_pattern_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway endpoint pattern permission for a group."""
     try:
-        store.delete_group_gateway_endpoint_regex_permission(id=id, group_name=group_name)
+        await run_blocking(store.delete_group_gateway_endpoint_regex_permission, id=id, group_name=group_name)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1980,7 +2029,7 @@ async def get_group_gateway_model_definition_permissions(
 ) -> List[GroupNamedPermissionItem]:
     """List gateway model definition permissions for a group."""
     try:
-        perms = store.list_group_gateway_model_definition_permissions(group_name=group_name)
+        perms = await run_blocking(store.list_group_gateway_model_definition_permissions, group_name=group_name)
         return [GroupNamedPermissionItem(name=p.model_definition_id, permission=p.permission) for p in perms]
     except Exception as e:
         logger.error(f"Error listing group gateway model definition permissions: {str(e)}")
@@ -2003,7 +2052,9 @@ async def create_group_gateway_model_definition_permission(
 ) -> GroupNamedPermissionItem:
     """Create a gateway model definition permission for a group."""
     try:
-        perm = store.create_group_gateway_model_definition_permission(group_name=group_name, gateway_name=name, permission=permission_data.permission)
+        perm = await run_blocking(
+            store.create_group_gateway_model_definition_permission, group_name=group_name, gateway_name=name, permission=permission_data.permission
+        )
         emit_audit_event(
             "permission.create",
             actor=admin_username,
@@ -2031,7 +2082,7 @@ async def get_group_gateway_model_definition_permission(
 ) -> GroupNamedPermissionItem:
     """Get a gateway model definition permission for a group."""
     try:
-        perm = store.get_user_groups_gateway_model_definition_permission(gateway_name=name, group_name=group_name)
+        perm = await run_blocking(store.get_user_groups_gateway_model_definition_permission, gateway_name=name, group_name=group_name)
         return GroupNamedPermissionItem(name=perm.model_definition_id, permission=perm.permission)
     except Exception as e:
         logger.error(f"Error getting group gateway model definition permission: {str(e)}")
@@ -2053,7 +2104,9 @@ async def update_group_gateway_model_definition_permission(
 ) -> StatusMessageResponse:
     """Update a gateway model definition permission for a group."""
     try:
-        store.update_group_gateway_model_definition_permission(group_name=group_name, gateway_name=name, permission=permission_data.permission)
+        await run_blocking(
+            store.update_group_gateway_model_definition_permission, group_name=group_name, gateway_name=name, permission=permission_data.permission
+        )
         emit_audit_event(
             "permission.update",
             actor=admin_username,
@@ -2081,7 +2134,7 @@ async def delete_group_gateway_model_definition_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway model definition permission for a group."""
     try:
-        store.delete_group_gateway_model_definition_permission(group_name=group_name, gateway_name=name)
+        await run_blocking(store.delete_group_gateway_model_definition_permission, group_name=group_name, gateway_name=name)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -2113,7 +2166,7 @@ async def get_group_gateway_model_definition_pattern_permissions(
 ) -> List[GroupGatewayRegexPermissionItem]:
     """List gateway model definition pattern permissions for a group."""
     try:
-        perms = store.list_group_gateway_model_definition_regex_permissions(group_name=group_name)
+        perms = await run_blocking(store.list_group_gateway_model_definition_regex_permissions, group_name=group_name)
         return [GroupGatewayRegexPermissionItem(id=p.id, regex=p.regex, priority=p.priority, group_id=p.group_id, permission=p.permission) for p in perms]
     except Exception as e:
         logger.error(f"Error listing group gateway model definition pattern permissions: {str(e)}")
@@ -2135,8 +2188,12 @@ async def create_group_gateway_model_definition_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Create a gateway model definition pattern permission for a group."""
     try:
-        perm = store.create_group_gateway_model_definition_regex_permission(
-            group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        perm = await run_blocking(
+            store.create_group_gateway_model_definition_regex_permission,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.create",
@@ -2165,7 +2222,7 @@ async def get_group_gateway_model_definition_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Get a gateway model definition pattern permission for a group."""
     try:
-        perm = store.get_group_gateway_model_definition_regex_permission(id=id, group_name=group_name)
+        perm = await run_blocking(store.get_group_gateway_model_definition_regex_permission, id=id, group_name=group_name)
         return GroupGatewayRegexPermissionItem(id=perm.id, regex=perm.regex, priority=perm.priority, group_id=perm.group_id, permission=perm.permission)
     except Exception as e:
         logger.error(f"Error getting group gateway model definition pattern permission: {str(e)}")
@@ -2187,8 +2244,13 @@ async def update_group_gateway_model_definition_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Update a gateway model definition pattern permission for a group."""
     try:
-        perm = store.update_group_gateway_model_definition_regex_permission(
-            id=id, group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        perm = await run_blocking(
+            store.update_group_gateway_model_definition_regex_permission,
+            id=id,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.update",
@@ -2217,7 +2279,7 @@ async def delete_group_gateway_model_definition_pattern_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway model definition pattern permission for a group."""
     try:
-        store.delete_group_gateway_model_definition_regex_permission(id=id, group_name=group_name)
+        await run_blocking(store.delete_group_gateway_model_definition_regex_permission, id=id, group_name=group_name)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -2249,7 +2311,7 @@ async def get_group_gateway_secret_permissions(
 ) -> List[GroupNamedPermissionItem]:
     """List gateway secret permissions for a group."""
     try:
-        perms = store.list_group_gateway_secret_permissions(group_name=group_name)
+        perms = await run_blocking(store.list_group_gateway_secret_permissions, group_name=group_name)
         return [GroupNamedPermissionItem(name=p.secret_id, permission=p.permission) for p in perms]
     except Exception as e:
         logger.error(f"Error listing group gateway secret permissions: {str(e)}")
@@ -2272,7 +2334,7 @@ async def create_group_gateway_secret_permission(
 ) -> GroupNamedPermissionItem:
     """Create a gateway secret permission for a group."""
     try:
-        perm = store.create_group_gateway_secret_permission(group_name=group_name, gateway_name=name, permission=permission_data.permission)
+        perm = await run_blocking(store.create_group_gateway_secret_permission, group_name=group_name, gateway_name=name, permission=permission_data.permission)
         emit_audit_event(
             "permission.create",
             actor=admin_username,
@@ -2300,7 +2362,7 @@ async def get_group_gateway_secret_permission(
 ) -> GroupNamedPermissionItem:
     """Get a gateway secret permission for a group."""
     try:
-        perm = store.get_user_groups_gateway_secret_permission(gateway_name=name, group_name=group_name)
+        perm = await run_blocking(store.get_user_groups_gateway_secret_permission, gateway_name=name, group_name=group_name)
         return GroupNamedPermissionItem(name=perm.secret_id, permission=perm.permission)
     except Exception as e:
         logger.error(f"Error getting group gateway secret permission: {str(e)}")
@@ -2322,7 +2384,7 @@ async def update_group_gateway_secret_permission(
 ) -> StatusMessageResponse:
     """Update a gateway secret permission for a group."""
     try:
-        store.update_group_gateway_secret_permission(group_name=group_name, gateway_name=name, permission=permission_data.permission)
+        await run_blocking(store.update_group_gateway_secret_permission, group_name=group_name, gateway_name=name, permission=permission_data.permission)
         emit_audit_event(
             "permission.update",
             actor=admin_username,
@@ -2350,7 +2412,7 @@ async def delete_group_gateway_secret_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway secret permission for a group."""
     try:
-        store.delete_group_gateway_secret_permission(group_name=group_name, gateway_name=name)
+        await run_blocking(store.delete_group_gateway_secret_permission, group_name=group_name, gateway_name=name)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -2382,7 +2444,7 @@ async def get_group_gateway_secret_pattern_permissions(
 ) -> List[GroupGatewayRegexPermissionItem]:
     """List gateway secret pattern permissions for a group."""
     try:
-        perms = store.list_group_gateway_secret_regex_permissions(group_name=group_name)
+        perms = await run_blocking(store.list_group_gateway_secret_regex_permissions, group_name=group_name)
         return [GroupGatewayRegexPermissionItem(id=p.id, regex=p.regex, priority=p.priority, group_id=p.group_id, permission=p.permission) for p in perms]
     except Exception as e:
         logger.error(f"Error listing group gateway secret pattern permissions: {str(e)}")
@@ -2404,8 +2466,12 @@ async def create_group_gateway_secret_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Create a gateway secret pattern permission for a group."""
     try:
-        perm = store.create_group_gateway_secret_regex_permission(
-            group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        perm = await run_blocking(
+            store.create_group_gateway_secret_regex_permission,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.create",
@@ -2434,7 +2500,7 @@ async def get_group_gateway_secret_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Get a gateway secret pattern permission for a group."""
     try:
-        perm = store.get_group_gateway_secret_regex_permission(id=id, group_name=group_name)
+        perm = await run_blocking(store.get_group_gateway_secret_regex_permission, id=id, group_name=group_name)
         return GroupGatewayRegexPermissionItem(id=perm.id, regex=perm.regex, priority=perm.priority, group_id=perm.group_id, permission=perm.permission)
     except Exception as e:
         logger.error(f"Error getting group gateway secret pattern permission: {str(e)}")
@@ -2456,8 +2522,13 @@ async def update_group_gateway_secret_pattern_permission(
 ) -> GroupGatewayRegexPermissionItem:
     """Update a gateway secret pattern permission for a group."""
     try:
-        perm = store.update_group_gateway_secret_regex_permission(
-            id=id, group_name=group_name, regex=pattern_data.regex, priority=pattern_data.priority, permission=pattern_data.permission
+        perm = await run_blocking(
+            store.update_group_gateway_secret_regex_permission,
+            id=id,
+            group_name=group_name,
+            regex=pattern_data.regex,
+            priority=pattern_data.priority,
+            permission=pattern_data.permission,
         )
         emit_audit_event(
             "permission.update",
@@ -2486,7 +2557,7 @@ async def delete_group_gateway_secret_pattern_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway secret pattern permission for a group."""
     try:
-        store.delete_group_gateway_secret_regex_permission(id=id, group_name=group_name)
+        await run_blocking(store.delete_group_gateway_secret_regex_permission, id=id, group_name=group_name)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -9,6 +9,7 @@ from fastapi.responses import JSONResponse
 
 from mlflow_oidc_auth.oauth import is_oidc_configured
 from mlflow_oidc_auth.store import store
+from mlflow_oidc_auth.utils.offload import run_blocking
 
 from ._prefix import HEALTH_CHECK_ROUTER_PREFIX
 
@@ -63,7 +64,7 @@ async def health_check_ready() -> JSONResponse:
 
     # Check database connectivity
     try:
-        checks["database"] = store.ping()
+        checks["database"] = await run_blocking(store.ping)
         if not checks["database"]:
             all_ready = False
     except Exception:
@@ -110,7 +111,7 @@ async def health_check_startup() -> JSONResponse:
     Returns:
         200 if startup complete, 503 if still initializing or failed.
     """
-    from mlflow_oidc_auth.app import get_oidc_provider_status, is_oidc_ready
+    from mlflow_oidc_auth.app import get_oidc_provider_startup, get_oidc_provider_status, is_oidc_ready
 
     oidc_ready = is_oidc_ready()
     # Reported alongside the boolean because "ready" only means at least one provider works.
@@ -118,7 +119,7 @@ async def health_check_startup() -> JSONResponse:
     providers = get_oidc_provider_status()
 
     if oidc_ready:
-        return JSONResponse(content={"status": "started", "oidc_initialized": True, "providers": providers})
+        return JSONResponse(content={"status": "started", "oidc_initialized": True, "providers": providers, "provider_startup": get_oidc_provider_startup()})
     else:
         # OIDC not initialized - might be missing config or startup in progress
         # Return 503 so Kubernetes knows startup is not complete
@@ -128,6 +129,7 @@ async def health_check_startup() -> JSONResponse:
                 "status": "initializing",
                 "oidc_initialized": False,
                 "providers": providers,
+                "provider_startup": get_oidc_provider_startup(),
                 "message": "OIDC client not yet initialized. Check OIDC configuration.",
             },
         )
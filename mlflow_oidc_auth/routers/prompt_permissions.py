@@ -1,16 +1,19 @@
-from typing import List
+from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from fastapi.responses import JSONResponse
 
-from mlflow_oidc_auth.dependencies import check_prompt_manage_permission
+from mlflow_oidc_auth.dependencies import check_admin_permission, check_prompt_manage_permission
 from mlflow_oidc_auth.logger import get_logger
-from mlflow_oidc_auth.models import UserPermission, GroupPermissionEntry
+from mlflow_oidc_auth.models import GroupPermissionEntry, ResourcePrincipalEntry, UserPermission
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils import fetch_all_prompts, get_is_admin, get_username
 from mlflow_oidc_auth.utils.batch_permissions import filter_manageable_prompts
+from mlflow_oidc_auth.utils.offload import run_blocking
+from mlflow_oidc_auth.utils.permissions import PROMPT
 
 from ._prefix import PROMPT_PERMISSIONS_ROUTER_PREFIX
+from ._principals import GROUP_SOURCES, USER_SOURCES, matrix_sources, to_group_entries, to_matrix, to_user_permissions
 
 logger = get_logger()
 
@@ -27,6 +30,26 @@ prompt_permissions_router = APIRouter(
 LIST_PROMPTS = ""
 PROMPT_USER_PERMISSIONS = "/{prompt_name:path}/users"
 PROMPT_GROUP_PERMISSIONS = "/{prompt_name:path}/groups"
+PROMPT_PRINCIPALS = "/principals"
+
+
+@prompt_permissions_router.get(
+    PROMPT_PRINCIPALS,
+    response_model=Dict[str, List[ResourcePrincipalEntry]],
+    summary="List users and groups with permissions for several prompts",
+    description="Retrieves every grant on each of the given prompts, for the admin permission matrix.",
+)
+async def get_prompts_principals(
+    names: List[str] = Query(..., alias="prompt_name", description="Prompt names to list grants for"),
+    include_regex: bool = Query(False, description="Also list grants derived from regex and group-regex rules"),
+    _: str = Depends(check_admin_permission),
+) -> Dict[str, List[ResourcePrincipalEntry]]:
+    """List users and groups with permissions for a batch of prompts."""
+    try:
+        return to_matrix(await run_blocking(store.list_resource_principals, PROMPT, names, sources=matrix_sources(include_regex)))
+    except Exception as e:
+        logger.error(f"Error retrieving prompt principals: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve prompt permissions")
 
 
 @prompt_permissions_router.get(
@@ -62,29 +85,8 @@ async def get_prompt_users(
     HTTPException
         If there is an error retrieving the user permissions.
     """
-    # Get all users
-    list_users = store.list_users(all=True)
-
-    # Filter users who are associated with the given prompt
-    # Note: In this system, prompts are treated as registered models with special handling
-    users: List[UserPermission] = []
-    for user in list_users:
-        # Check if the user is associated with the prompt
-        # Prompts are stored as registered models in the system
-        user_models = {}
-        if hasattr(user, "registered_model_permissions") and user.registered_model_permissions:
-            user_models = {model.name: model.permission for model in user.registered_model_permissions}
-
-        if prompt_name in user_models:
-            users.append(
-                UserPermission(
-                    name=user.username,
-                    permission=user_models[prompt_name],
-                    kind="service-account" if user.is_service_account else "user",
-                )
-            )
-
-    return users
+    principals = await run_blocking(store.list_resource_principals, PROMPT, [prompt_name], sources=USER_SOURCES)
+    return to_user_permissions(principals[prompt_name])
 
 
 @prompt_permissions_router.get(
@@ -100,8 +102,8 @@ async def get_prompt_groups(
     """List groups with explicit permissions for a prompt."""
 
     try:
-        groups = store.prompt_group_repo.list_groups_for_prompt(str(prompt_name))
-        return [GroupPermissionEntry(name=name, permission=permission) for name, permission in groups]
+        principals = await run_blocking(store.list_resource_principals, PROMPT, [str(prompt_name)], sources=GROUP_SOURCES)
+        return to_group_entries(principals[str(prompt_name)])
     except Exception as e:
         logger.error(f"Error retrieving prompt group permissions: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve prompt group permissions")
@@ -134,14 +136,14 @@ async def list_prompts(username: str = Depends(get_username), is_admin: bool = D
         If there is an error retrieving the prompts.
     """
     # Fetch all prompts and filter based on permissions (batch resolution for efficiency)
-    all_prompts = fetch_all_prompts()
+    all_prompts = await run_blocking(fetch_all_prompts)
 
     if is_admin:
         # Admin can see all prompts
         prompts = all_prompts
     else:
         # Regular user can only see prompts they can manage
-        prompts = filter_manageable_prompts(username, all_prompts)
+        prompts = await run_blocking(filter_manageable_prompts, username, all_prompts)
 
     return JSONResponse(
         content=[
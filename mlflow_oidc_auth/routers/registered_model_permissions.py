@@ -1,17 +1,20 @@
-from typing import List
+from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from fastapi.responses import JSONResponse
 
-from mlflow_oidc_auth.dependencies import check_registered_model_manage_permission
+from mlflow_oidc_auth.dependencies import check_admin_permission, check_registered_model_manage_permission
 from mlflow_oidc_auth.logger import get_logger
-from mlflow_oidc_auth.models import UserPermission, GroupPermissionEntry
+from mlflow_oidc_auth.models import GroupPermissionEntry, ResourcePrincipalEntry, UserPermission
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils import get_is_admin, get_username
+from mlflow_oidc_auth.utils.offload import run_blocking
 from mlflow_oidc_auth.utils.batch_permissions import filter_manageable_models
 from mlflow_oidc_auth.utils.data_fetching import fetch_all_registered_models
+from mlflow_oidc_auth.utils.permissions import REGISTERED_MODEL
 
 from ._prefix import REGISTERED_MODEL_PERMISSIONS_ROUTER_PREFIX
+from ._principals import GROUP_SOURCES, USER_SOURCES, matrix_sources, to_group_entries, to_matrix, to_user_permissions
 
 logger = get_logger()
 
@@ -30,6 +33,26 @@ LIST_MODELS = ""
 
 REGISTERED_MODEL_USER_PERMISSIONS = "/{name:path}/users"
 REGISTERED_MODEL_GROUP_PERMISSIONS = "/{name:path}/groups"
+REGISTERED_MODEL_PRINCIPALS = "/principals"
+
+
+@registered_model_permissions_router.get(
+    REGISTERED_MODEL_PRINCIPALS,
+    response_model=Dict[str, List[ResourcePrincipalEntry]],
+    summary="List users and groups with permissions for several registered models",
+    description="Retrieves every grant on each of the given registered models, for the admin permission matrix.",
+)
+async def get_registered_models_principals(
+    names: List[str] = Query(..., alias="name", description="Registered model names to list grants for"),
+    include_regex: bool = Query(False, description="Also list grants derived from regex and group-regex rules"),
+    _: str = Depends(check_admin_permission),
+) -> Dict[str, List[ResourcePrincipalEntry]]:
+    """List users and groups with permissions for a batch of registered models."""
+    try:
+        return to_matrix(await run_blocking(store.list_resource_principals, REGISTERED_MODEL, names, sources=matrix_sources(include_regex)))
+    except Exception as e:
+        logger.error(f"Error retrieving registered model principals: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve registered model permissions")
 
 
 @registered_model_permissions_router.get(
@@ -66,25 +89,8 @@ async def get_registered_model_users(
     HTTPException
         If there is an error retrieving the user permissions.
     """
-    list_users = store.list_users(all=True)
-
-    # Filter users who are associated with the given registered model
-    users: List[UserPermission] = []
-    for user in list_users:
-        # Check if the user is associated with the registered model
-        user_models = {}
-        if hasattr(user, "registered_model_permissions") and user.registered_model_permissions:
-            user_models = {model.name: model.permission for model in user.registered_model_permissions}
-
-        if name in user_models:
-            users.append(
-                UserPermission(
-                    name=user.username,
-                    permission=user_models[name],
-                    kind="service-account" if user.is_service_account else "user",
-                )
-            )
-    return users
+    principals = await run_blocking(store.list_resource_principals, REGISTERED_MODEL, [name], sources=USER_SOURCES)
+    return to_user_permissions(principals[name])
 
 
 @registered_model_permissions_router.get(
@@ -100,8 +106,8 @@ async def get_registered_model_groups(
     """List groups with explicit permissions for a registered model."""
 
     try:
-        groups = store.registered_model_group_repo.list_groups_for_model(str(name))
-        return [GroupPermissionEntry(name=name, permission=permission) for name, permission in groups]
+        principals = await run_blocking(store.list_resource_principals, REGISTERED_MODEL, [str(name)], sources=GROUP_SOURCES)
+        return to_group_entries(principals[str(name)])
     except Exception as e:
         logger.error(f"Error retrieving registered model group permissions: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve registered model group permissions")
@@ -136,14 +142,14 @@ async def list_models(username: str = Depends(get_username), is_admin: bool = De
         If there is an error retrieving the registered models.
     """
     # Fetch all models and filter based on permissions (batch resolution for efficiency)
-    all_models = fetch_all_registered_models()
+    all_models = await run_blocking(fetch_all_registered_models)
 
     if is_admin:
         # Admin can see all registered models
         registered_models = all_models
     else:
         # Regular user can only see models they can manage
-        registered_models = filter_manageable_models(username, all_models)
+        registered_models = await run_blocking(filter_manageable_models, username, all_models)
 
     return JSONResponse(
         content=[
@@ -0,0 +1,48 @@
+"""Runtime counters for operators.
+
+Queue depths and saturation of the thread pools and the audit queue tell an attacker when
+the server is easiest to overload, and discovery errors name internal IdP hosts and proxies,
+so they are served to administrators only. The public ``/health`` probes report status.
+"""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from mlflow_oidc_auth import audit_pipeline
+from mlflow_oidc_auth.dependencies import check_admin_permission
+from mlflow_oidc_auth.middleware import wsgi_bridge
+from mlflow_oidc_auth.utils import offload
+
+from ._prefix import RUNTIME_ROUTER_PREFIX
+
+runtime_router = APIRouter(
+    prefix=RUNTIME_ROUTER_PREFIX,
+    tags=["runtime"],
+    responses={
+        403: {"description": "Forbidden - Insufficient permissions"},
+    },
+)
+
+
+@runtime_router.get("", summary="Thread pool and audit queue counters")
+async def runtime_stats(admin_username: str = Depends(check_admin_permission)) -> JSONResponse:
+    """Thread pool counters and provider startup errors for monitoring.
+
+    Reports queue depth, in-flight work and bytes moved for the bridge that serves the MLflow
+    Flask app, and the same for blocking store calls offloaded from async handlers, and the
+    audit event queue. ``provider_startup`` is the ``/health/startup`` report plus each failed
+    discovery fetch's error. Nothing here identifies a user or a request.
+
+    Returns:
+        200 with ``wsgi_bridge``, ``store_offload``, ``audit`` and ``provider_startup``.
+    """
+    from mlflow_oidc_auth.app import get_oidc_provider_startup
+
+    return JSONResponse(
+        content={
+            "wsgi_bridge": wsgi_bridge.stats(),
+            "store_offload": offload.stats(),
+            "audit": audit_pipeline.stats(),
+            "provider_startup": get_oidc_provider_startup(include_errors=True),
+        }
+    )
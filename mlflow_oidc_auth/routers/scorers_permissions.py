@@ -4,19 +4,21 @@ This router implements the scorer permission endpoints introduced in newer MLflo
 versions under `/api/3.0/mlflow/permissions/scorers/*`.
 """
 
-from typing import List
+from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from mlflow.server.handlers import _get_tracking_store
 
-from mlflow_oidc_auth.dependencies import check_scorer_manage_permission
+from mlflow_oidc_auth.dependencies import check_admin_permission, check_scorer_manage_permission
 from mlflow_oidc_auth.logger import get_logger
-from mlflow_oidc_auth.models import GroupPermissionEntry, ScorerSummary, UserPermission
+from mlflow_oidc_auth.models import GroupPermissionEntry, ResourcePrincipalEntry, ScorerSummary, UserPermission
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils import get_is_admin, get_username
-from mlflow_oidc_auth.utils.permissions import can_manage_scorer
+from mlflow_oidc_auth.utils.offload import run_blocking
+from mlflow_oidc_auth.utils.permissions import SCORER, can_manage_scorer
 
 from ._prefix import SCORERS_ROUTER_PREFIX
+from ._principals import GROUP_SOURCES, USER_SOURCES, matrix_sources, to_group_entries, to_matrix, to_user_permissions
 
 logger = get_logger()
 
@@ -32,6 +34,7 @@ scorers_permissions_router = APIRouter(
 LIST_SCORERS = "/{experiment_id}"
 SCORER_USER_PERMISSIONS = "/{experiment_id}/{scorer_name:path}/users"
 SCORER_GROUP_PERMISSIONS = "/{experiment_id}/{scorer_name:path}/groups"
+SCORER_PRINCIPALS = "/{experiment_id}/principals"
 
 
 @scorers_permissions_router.get(
@@ -52,7 +55,7 @@ async def list_scorers(
 
     try:
         tracking_store = _get_tracking_store()
-        all_scorers = tracking_store.list_scorers(experiment_id)
+        all_scorers = await run_blocking(tracking_store.list_scorers, experiment_id)
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to list scorers for experiment {experiment_id}: {exc}")
         raise HTTPException(status_code=500, detail="Failed to retrieve scorers") from exc
@@ -60,7 +63,7 @@ async def list_scorers(
     if is_admin:
         visible_scorers = all_scorers
     else:
-        visible_scorers = [scorer for scorer in all_scorers if can_manage_scorer(str(experiment_id), scorer.scorer_name, username)]
+        visible_scorers = await run_blocking(lambda: [scorer for scorer in all_scorers if can_manage_scorer(str(experiment_id), scorer.scorer_name, username)])
 
     return [
         ScorerSummary(
@@ -74,6 +77,29 @@ async def list_scorers(
     ]
 
 
+@scorers_permissions_router.get(
+    SCORER_PRINCIPALS,
+    response_model=Dict[str, List[ResourcePrincipalEntry]],
+    summary="List users and groups with permissions for several scorers",
+    description="Retrieves every grant on each of the given scorers of an experiment, for the admin permission matrix.",
+)
+async def get_scorers_principals(
+    experiment_id: str = Path(..., description="The experiment ID owning the scorers"),
+    scorer_names: List[str] = Query(..., alias="scorer_name", description="Scorer names to list grants for"),
+    include_regex: bool = Query(False, description="Also list grants derived from regex and group-regex rules"),
+    _: str = Depends(check_admin_permission),
+) -> Dict[str, List[ResourcePrincipalEntry]]:
+    """List users and groups with permissions for a batch of scorers, keyed by scorer name."""
+
+    keys = [(str(experiment_id), str(scorer_name)) for scorer_name in scorer_names]
+    try:
+        principals = await run_blocking(store.list_resource_principals, SCORER, keys, sources=matrix_sources(include_regex))
+    except Exception as exc:  # noqa: BLE001
+        logger.error(f"Failed to list scorer principals for {experiment_id}: {exc}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve scorer permissions") from exc
+    return to_matrix(principals, key=lambda resource_id: resource_id[1])
+
+
 @scorers_permissions_router.get(
     SCORER_USER_PERMISSIONS,
     response_model=List[UserPermission],
@@ -91,29 +117,14 @@ async def get_scorer_users(
     may access this information.
     """
 
+    key = (str(experiment_id), str(scorer_name))
     try:
-        users = store.list_users(all=True)
+        principals = await run_blocking(store.list_resource_principals, SCORER, [key], sources=USER_SOURCES)
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to list scorer users for {experiment_id}/{scorer_name}: {exc}")
         raise HTTPException(status_code=500, detail="Failed to retrieve scorer user permissions") from exc
 
-    scorer_users: List[UserPermission] = []
-    for user in users:
-        scorer_permissions = {
-            (str(permission.experiment_id), str(permission.scorer_name)): str(permission.permission)
-            for permission in getattr(user, "scorer_permissions", []) or []
-        }
-
-        if (str(experiment_id), str(scorer_name)) in scorer_permissions:
-            scorer_users.append(
-                UserPermission(
-                    name=user.username,
-                    permission=scorer_permissions[(str(experiment_id), str(scorer_name))],
-                    kind="service-account" if user.is_service_account else "user",
-                )
-            )
-
-    return scorer_users
+    return to_user_permissions(principals[key])
 
 
 @scorers_permissions_router.get(
@@ -132,9 +143,10 @@ async def get_scorer_groups(
     Errors during lookup are surfaced as HTTP 500 responses with a concise message.
     """
 
+    key = (str(experiment_id), str(scorer_name))
     try:
-        groups = store.scorer_group_repo.list_groups_for_scorer(str(experiment_id), str(scorer_name))
-        return [GroupPermissionEntry(name=name, permission=permission) for name, permission in groups]
+        principals = await run_blocking(store.list_resource_principals, SCORER, [key], sources=GROUP_SOURCES)
+        return to_group_entries(principals[key])
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to list scorer groups for {experiment_id}/{scorer_name}: {exc}")
         raise HTTPException(status_code=500, detail="Failed to retrieve scorer group permissions") from exc
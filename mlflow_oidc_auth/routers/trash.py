@@ -1,22 +1,27 @@
 import re
 import warnings
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
 from mlflow.entities import ViewType
 from mlflow.entities.lifecycle_stage import LifecycleStage
-from mlflow.exceptions import InvalidUrlException, MlflowException
+from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
-from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.tracking import _get_store
 from mlflow.utils.time import get_current_time_millis
+from mlflow.utils.workspace_context import get_request_workspace
 
 from mlflow_oidc_auth.audit import emit_audit_event
 from mlflow_oidc_auth.dependencies import check_admin_permission
+from mlflow_oidc_auth.jobs import trash_gc
 from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.repository.trash_gc_job import EXPERIMENT, QUEUED, RUN
+from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.utils.data_fetching import fetch_all_experiments
+from mlflow_oidc_auth.utils.experiment_metadata import invalidate_experiment_metadata
+from mlflow_oidc_auth.utils.offload import run_blocking
 
 from ._prefix import TRASH_ROUTER_PREFIX
 
@@ -37,6 +42,10 @@ RUNS = "/runs"
 CLEANUP = "/cleanup"
 RESTORE_EXPERIMENT = f"{EXPERIMENTS}/{{experiment_id}}/restore"
 RESTORE_RUN = f"{RUNS}/{{run_id}}/restore"
+CLEANUP_JOB = f"{CLEANUP}/{{job_id}}"
+
+# Failed items listed in a cleanup job's status; the counts cover the rest.
+CLEANUP_FAILURES_LIMIT = 100
 
 
 @trash_router.get(
@@ -69,7 +78,7 @@ async def list_deleted_experiments(
         403 - If the user does not have admin permissions.
     """
     try:
-        deleted_experiments = fetch_all_experiments(view_type=ViewType.DELETED_ONLY)
+        deleted_experiments = await run_blocking(fetch_all_experiments, view_type=ViewType.DELETED_ONLY)
 
         # Format the response data
         experiments_list = []
@@ -132,10 +141,12 @@ async def list_deleted_runs(
         run_ids: List[str] = []
 
         if hasattr(backend_store, "_get_deleted_runs"):
-            run_ids = backend_store._get_deleted_runs(older_than=time_delta)
+            run_ids = await run_blocking(backend_store._get_deleted_runs, older_than=time_delta)
         else:
             # Fallback to search without age filtering when the backend lacks _get_deleted_runs
-            target_experiment_ids = experiment_filter if experiment_filter else [exp.experiment_id for exp in fetch_all_experiments(view_type=ViewType.ALL)]
+            target_experiment_ids = (
+                experiment_filter if experiment_filter else [exp.experiment_id for exp in await run_blocking(fetch_all_experiments, view_type=ViewType.ALL)]
+            )
 
             def fetch_runs(token=None):
                 try:
@@ -149,12 +160,12 @@ async def list_deleted_runs(
                 except Exception:
                     return []
 
-            run_ids = [run.info.run_id for run in fetch_runs()]
+            run_ids = [run.info.run_id for run in await run_blocking(fetch_runs)]
 
         runs_payload = []
         for run_id in run_ids:
             try:
-                run = backend_store.get_run(run_id)
+                run = await run_blocking(backend_store.get_run, run_id)
             except Exception as exc:  # pragma: no cover - defensive log path
                 logger.warning(f"Could not fetch run {run_id}: {str(exc)}")
                 continue
@@ -189,8 +200,12 @@ async def list_deleted_runs(
 
 @trash_router.post(
     CLEANUP,
+    status_code=202,
     summary="Permanently delete trashed entities",
-    description="Permanently deletes entities (experiments, runs) that are in the trash based on specified criteria.",
+    description=(
+        "Enqueues a job that permanently deletes entities (experiments, runs) that are in the trash based on specified criteria. "
+        "Returns the job id at once; poll the cleanup job endpoint for progress."
+    ),
 )
 async def permanently_delete_all_trashed_entities(
     admin_username: str = Depends(check_admin_permission),
@@ -208,11 +223,12 @@ async def permanently_delete_all_trashed_entities(
     ),
 ) -> JSONResponse:
     """
-    Permanently delete entities in the trash.
+    Enqueue permanent deletion of entities in the trash.
 
-    This endpoint permanently deletes entities (experiments, runs) that are currently
-    in the trash. The requesting user must be an admin. This is equivalent to
-    MLflow's 'mlflow gc' command.
+    This is equivalent to MLflow's 'mlflow gc' command. The request is validated here and then
+    carried out by a background job (``mlflow_oidc_auth/jobs/trash_gc.py``) in batches, so a
+    large trash no longer times the request out and an interrupted cleanup resumes. The
+    requesting user must be an admin.
 
     Parameters:
     -----------
@@ -228,13 +244,13 @@ async def permanently_delete_all_trashed_entities(
     Returns:
     --------
     JSONResponse
-        A JSON response indicating the result of the cleanup operation.
+        202 with the id of the enqueued job, and its status URL in ``Location``.
 
     Raises:
     -------
     HTTPException
         403 - If the user does not have admin permissions.
-        500 - If the cleanup operation fails.
+        500 - If the job cannot be enqueued.
     """
     try:
         backend_store = _get_store()
@@ -265,182 +281,115 @@ async def permanently_delete_all_trashed_entities(
                 logger.error(f"Invalid time format '{older_than}': {str(e)}")
                 return JSONResponse(status_code=400, content={"error": f"Invalid time format"})
 
-        # Get deleted runs that match the time criteria
-        try:
-            deleted_run_ids_older_than = backend_store._get_deleted_runs(older_than=time_delta)
-        except Exception as e:
-            logger.warning(f"Could not fetch deleted runs by time criteria: {str(e)}")
-            deleted_run_ids_older_than = []
-
-        # Determine which run IDs to delete
-        target_run_ids = _split_csv(run_ids) if run_ids else deleted_run_ids_older_than
-
-        # Handle experiment deletion
+        # Explicitly named experiments are checked now, so a typo is a 404 on the request rather
+        # than a failure found later in the job. Everything that has to enumerate the trash is
+        # left to the job.
         target_experiment_ids: List[str] = []
-        time_threshold = get_current_time_millis() - time_delta
-
-        if not skip_experiments:
-            if experiment_ids:
-                target_experiment_ids = _split_csv(experiment_ids)
-                experiments = []
-
-                for exp_id in target_experiment_ids:
-                    try:
-                        exp = backend_store.get_experiment(exp_id)
-                        experiments.append(exp)
-                    except Exception as e:
-                        logger.error(f"Could not fetch experiment {exp_id}: {str(e)}")
-                        return JSONResponse(
-                            status_code=404,
-                            content={"error": f"Experiment {exp_id} not found"},
-                        )
-
-                # Ensure experiments are deleted
-                active_experiment_ids = [e.experiment_id for e in experiments if e.lifecycle_stage != LifecycleStage.DELETED]
-                if active_experiment_ids:
-                    return JSONResponse(
-                        status_code=400,
-                        content={"error": f"Experiments {active_experiment_ids} are not in deleted lifecycle stage"},
-                    )
-
-                # Check age requirements
-                if older_than:
-                    non_old_experiment_ids = [e.experiment_id for e in experiments if e.last_update_time is None or e.last_update_time >= time_threshold]
-                    if non_old_experiment_ids:
-                        return JSONResponse(
-                            status_code=400,
-                            content={"error": f"Experiments {non_old_experiment_ids} are not older than {older_than}"},
-                        )
-            else:
-                # Get all deleted experiments
-                filter_string = f"last_update_time < {time_threshold}" if older_than else None
-
-                def fetch_experiments(token=None):
-                    try:
-                        page = backend_store.search_experiments(
-                            view_type=ViewType.DELETED_ONLY,
-                            filter_string=filter_string,
-                            page_token=token,
-                        )
-                        return (page + fetch_experiments(page.token)) if page.token else page
-                    except Exception:
-                        return []
-
-                experiment_list = fetch_experiments()
-                target_experiment_ids = [exp.experiment_id for exp in experiment_list]
-
-            # Get runs from target experiments
-            if target_experiment_ids:
-
-                def fetch_runs(token=None):
-                    try:
-                        page = backend_store.search_runs(
-                            experiment_ids=target_experiment_ids,
-                            filter_string="",
-                            run_view_type=ViewType.DELETED_ONLY,
-                            page_token=token,
-                        )
-                        return (page + fetch_runs(page.token)) if page.token else page
-                    except Exception:
-                        return []
-
-                runs_from_experiments = fetch_runs()
-                target_run_ids.extend([run.info.run_id for run in runs_from_experiments])
-
-        # Delete runs
-        deleted_runs = []
-        failed_runs = []
-
-        for run_id in set(target_run_ids):
-            try:
-                run = backend_store.get_run(run_id)
-
-                # Validate run is deleted
-                if run.info.lifecycle_stage != LifecycleStage.DELETED:
-                    failed_runs.append(
-                        {
-                            "run_id": run_id,
-                            "error": "Run is not in deleted lifecycle stage",
-                        }
-                    )
-                    continue
-
-                # Check age requirement
-                if older_than and run_id not in deleted_run_ids_older_than:
-                    failed_runs.append(
-                        {
-                            "run_id": run_id,
-                            "error": f"Run is not older than {older_than}",
-                        }
-                    )
-                    continue
+        if not skip_experiments and experiment_ids:
+            target_experiment_ids = _split_csv(experiment_ids)
+            experiments = []
 
-                # Delete artifacts
+            for exp_id in target_experiment_ids:
                 try:
-                    artifact_repo = get_artifact_repository(run.info.artifact_uri)
-                    artifact_repo.delete_artifacts()
-                except InvalidUrlException as e:
-                    logger.warning(f"Could not delete artifacts for run {run_id}: {str(e)}")
+                    exp = await run_blocking(backend_store.get_experiment, exp_id)
+                    experiments.append(exp)
                 except Exception as e:
-                    logger.warning(f"Error deleting artifacts for run {run_id}: {str(e)}")
-
-                # Hard delete the run
-                backend_store._hard_delete_run(run_id)
-                deleted_runs.append(run_id)
-                logger.info(f"Permanently deleted run {run_id}")
-
-            except Exception as e:
-                logger.error(f"Error deleting run {run_id}: {str(e)}")
-                failed_runs.append({"run_id": run_id, "error": str(e)})
-
-        # Delete experiments
-        deleted_experiments = []
-        failed_experiments = []
-
-        if not skip_experiments:
-            for experiment_id in target_experiment_ids:
-                try:
-                    backend_store._hard_delete_experiment(experiment_id)
-                    deleted_experiments.append(experiment_id)
-                    logger.info(f"Permanently deleted experiment {experiment_id}")
-                except Exception as e:
-                    logger.error(f"Error deleting experiment {experiment_id}: {str(e)}")
-                    failed_experiments.append({"experiment_id": experiment_id, "error": str(e)})
-
-        # Prepare response
-        response_data = {
-            "deleted_runs": deleted_runs,
-            "deleted_experiments": deleted_experiments,
-            "total_deleted_runs": len(deleted_runs),
-            "total_deleted_experiments": len(deleted_experiments),
-        }
-
-        if failed_runs:
-            response_data["failed_runs"] = failed_runs
-
-        if failed_experiments:
-            response_data["failed_experiments"] = failed_experiments
+                    logger.error(f"Could not fetch experiment {exp_id}: {str(e)}")
+                    return JSONResponse(
+                        status_code=404,
+                        content={"error": f"Experiment {exp_id} not found"},
+                    )
 
-        logger.info(f"Admin user '{admin_username}' completed cleanup: " f"{len(deleted_runs)} runs, {len(deleted_experiments)} experiments deleted")
+            # Ensure experiments are deleted
+            active_experiment_ids = [e.experiment_id for e in experiments if e.lifecycle_stage != LifecycleStage.DELETED]
+            if active_experiment_ids:
+                return JSONResponse(
+                    status_code=400,
+                    content={"error": f"Experiments {active_experiment_ids} are not in deleted lifecycle stage"},
+                )
+
+            # Check age requirements
+            if older_than:
+                time_threshold = get_current_time_millis() - time_delta
+                non_old_experiment_ids = [e.experiment_id for e in experiments if e.last_update_time is None or e.last_update_time >= time_threshold]
+                if non_old_experiment_ids:
+                    return JSONResponse(
+                        status_code=400,
+                        content={"error": f"Experiments {non_old_experiment_ids} are not older than {older_than}"},
+                    )
 
-        emit_audit_event(
-            "trash.cleanup",
+        job_id = await run_blocking(
+            store.create_trash_gc_job,
             admin_username,
-            resource_type="trash",
-            detail={
-                "deleted_runs_count": len(deleted_runs),
-                "deleted_experiments_count": len(deleted_experiments),
-                "older_than": older_than,
-            },
+            older_than=older_than,
+            older_than_ms=time_delta,
+            run_ids=_split_csv(run_ids),
+            experiment_ids=target_experiment_ids,
+            workspace=get_request_workspace(),
         )
+        trash_gc.notify()
 
-        return JSONResponse(content=response_data)
+        logger.info(f"Admin user '{admin_username}' enqueued trash cleanup job {job_id} (older_than: {older_than or 'not set'})")
+        return JSONResponse(
+            status_code=202,
+            content={"job_id": job_id, "status": QUEUED},
+            headers={"Location": f"{TRASH_ROUTER_PREFIX}{CLEANUP}/{job_id}"},
+        )
 
     except Exception:
         logger.exception("Error in cleanup operation for admin %s", admin_username)
         raise HTTPException(status_code=500, detail="Cleanup operation failed")
 
 
+@trash_router.get(
+    CLEANUP_JOB,
+    summary="Get a trash cleanup job",
+    description="Reports the status and progress of a trash cleanup job.",
+)
+async def get_cleanup_job(
+    job_id: int,
+    admin_username: str = Depends(check_admin_permission),
+) -> JSONResponse:
+    """
+    Report the status and progress of a cleanup job.
+
+    Parameters
+    ----------
+    job_id : int
+        The id returned when the job was enqueued.
+    admin_username : str
+        The authenticated admin username (injected by dependency).
+
+    Returns
+    -------
+    JSONResponse
+        The job's status and phase, run and experiment counts so far, and the first
+        ``CLEANUP_FAILURES_LIMIT`` items it could not delete.
+    """
+    job = await run_blocking(store.get_trash_gc_job, job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": f"Cleanup job {job_id} not found"})
+    failures = await run_blocking(store.list_trash_gc_job_failures, job_id, CLEANUP_FAILURES_LIMIT)
+
+    return JSONResponse(
+        content={
+            "job_id": job.id,
+            "status": job.status,
+            "phase": job.phase,
+            "requested_by": job.requested_by,
+            "older_than": job.older_than,
+            "runs": {"total": job.total_runs, "deleted": job.deleted_runs, "failed": job.failed_runs},
+            "experiments": {"total": job.total_experiments, "deleted": job.deleted_experiments, "failed": job.failed_experiments},
+            "failed_runs": [{"run_id": f.resource_id, "error": f.error} for f in failures if f.kind == RUN],
+            "failed_experiments": [{"experiment_id": f.resource_id, "error": f.error} for f in failures if f.kind == EXPERIMENT],
+            "created_at": _isoformat(job.created_at),
+            "started_at": _isoformat(job.started_at),
+            "finished_at": _isoformat(job.finished_at),
+            "error": job.error,
+        }
+    )
+
+
 @trash_router.post(
     RESTORE_EXPERIMENT,
     summary="Restore a deleted experiment",
@@ -463,7 +412,7 @@ async def restore_experiment(
     backend_store = _get_store()
 
     try:
-        experiment = backend_store.get_experiment(experiment_id)
+        experiment = await run_blocking(backend_store.get_experiment, experiment_id)
     except Exception as exc:
         logger.error(f"Experiment {experiment_id} not found for restore: {str(exc)}")
         return JSONResponse(status_code=404, content={"error": f"Experiment {experiment_id} not found"})
@@ -472,8 +421,9 @@ async def restore_experiment(
         return JSONResponse(status_code=400, content={"error": "Experiment is not deleted"})
 
     try:
-        backend_store.restore_experiment(experiment_id)
-        restored = backend_store.get_experiment(experiment_id)
+        await run_blocking(backend_store.restore_experiment, experiment_id)
+        invalidate_experiment_metadata(experiment_id)
+        restored = await run_blocking(backend_store.get_experiment, experiment_id)
         logger.info(f"Admin user '{admin_username}' restored experiment {experiment_id}")
         emit_audit_event(
             "trash.restore",
@@ -518,7 +468,7 @@ async def restore_run(
     backend_store = _get_store()
 
     try:
-        run = backend_store.get_run(run_id)
+        run = await run_blocking(backend_store.get_run, run_id)
     except Exception as exc:
         logger.error(f"Run {run_id} not found for restore: {str(exc)}")
         return JSONResponse(status_code=404, content={"error": f"Run {run_id} not found"})
@@ -527,8 +477,8 @@ async def restore_run(
         return JSONResponse(status_code=400, content={"error": "Run is not deleted"})
 
     try:
-        backend_store.restore_run(run_id)
-        restored = backend_store.get_run(run_id)
+        await run_blocking(backend_store.restore_run, run_id)
+        restored = await run_blocking(backend_store.get_run, run_id)
         logger.info(f"Admin user '{admin_username}' restored run {run_id}")
         emit_audit_event(
             "trash.restore",
@@ -583,6 +533,11 @@ def _parse_time_delta(older_than: str) -> int:
     return time_delta
 
 
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """ISO 8601 for a naive-UTC column value, or None."""
+    return value.replace(tzinfo=timezone.utc).isoformat() if value is not None else None
+
+
 def _split_csv(raw: Optional[str]) -> List[str]:
     """Split a comma-separated query parameter into trimmed, non-empty values."""
     if not raw:
@@ -4,6 +4,7 @@ Permissions router for FastAPI application.
 This router handles permission management endpoints for experiments, models, and users.
 """
 
+from types import SimpleNamespace
 from typing import List
 
 from fastapi import APIRouter, Body, Depends, Path
@@ -71,6 +72,8 @@ from mlflow_oidc_auth.utils.batch_permissions import (
     batch_resolve_model_permissions,
     batch_resolve_prompt_permissions,
 )
+from mlflow_oidc_auth.utils.offload import run_blocking
+from mlflow_oidc_auth.utils.resource_index import list_experiments_from_index, list_registered_model_names_from_index
 from mlflow_oidc_auth.utils.permissions import (
     effective_gateway_endpoint_permission,
     effective_gateway_model_definition_permission,
@@ -164,21 +167,30 @@ async def get_user_experiment_permissions(
         If the user is not found or the requesting user lacks sufficient permissions.
     """
     tracking_store = _get_tracking_store()
-    all_experiments = tracking_store.search_experiments()
+
+    # Non-admins see a subset named by a resource index: the experiments the user can
+    # read, or, for someone else's listing, the ones the caller can manage.
+    if is_admin:
+        indexed = None
+    elif current_username == username:
+        indexed = await run_blocking(list_experiments_from_index, tracking_store, username)
+    else:
+        indexed = await run_blocking(list_experiments_from_index, tracking_store, current_username, manage=True)
+    all_experiments = indexed if indexed is not None else await run_blocking(tracking_store.search_experiments)
 
     # Batch resolve permissions for all experiments (fixed number of DB queries)
-    experiment_permissions = batch_resolve_experiment_permissions(username, all_experiments)
+    experiment_permissions = await run_blocking(batch_resolve_experiment_permissions, username, all_experiments)
 
     # Determine which experiments to include based on permissions
-    if is_admin:
-        # Admins can see all experiments
+    if is_admin or indexed is not None:
+        # Admins can see all experiments; an indexed listing is already filtered
         list_experiments = all_experiments
     elif current_username == username:
         # Users can see their own accessible experiments (filter using pre-computed permissions)
         list_experiments = [exp for exp in all_experiments if experiment_permissions[exp.experiment_id].permission.name != NO_PERMISSIONS.name]
     else:
         # For other users, only show experiments the current user can manage
-        current_user_permissions = batch_resolve_experiment_permissions(current_username, all_experiments)
+        current_user_permissions = await run_blocking(batch_resolve_experiment_permissions, current_username, all_experiments)
         list_experiments = [exp for exp in all_experiments if current_user_permissions[exp.experiment_id].permission.can_manage]
 
     # Format experiment information with permissions (reuse pre-computed permissions)
@@ -206,7 +218,8 @@ async def create_user_experiment_permission(
     permission_data: ExperimentPermission = Body(..., description="The permission level to grant"),
     current_username: str = Depends(check_experiment_manage_permission),
 ) -> MessageResponse:
-    store.create_experiment_permission(
+    await run_blocking(
+        store.create_experiment_permission,
         experiment_id,
         username,
         permission_data.permission,
@@ -233,7 +246,7 @@ async def get_user_experiment_permission(
     experiment_id: str = Path(..., description="The experiment ID to set permissions for"),
     _: None = Depends(check_experiment_manage_permission),
 ) -> ExperimentPermissionResponse:
-    ep = store.get_experiment_permission(experiment_id, username)
+    ep = await run_blocking(store.get_experiment_permission, experiment_id, username)
     return ExperimentPermissionResponse(experiment_permission=ExperimentPermissionRecord(**ep.to_json()))
 
 
@@ -250,7 +263,8 @@ async def update_user_experiment_permission(
     permission_data: ExperimentPermission = Body(..., description="The permission level to grant"),
     current_username: str = Depends(check_experiment_manage_permission),
 ) -> MessageResponse:
-    store.update_experiment_permission(
+    await run_blocking(
+        store.update_experiment_permission,
         experiment_id,
         username,
         permission_data.permission,
@@ -277,7 +291,7 @@ async def delete_user_experiment_permission(
     experiment_id: str = Path(..., description="The experiment ID to revoke permissions for"),
     current_username: str = Depends(check_experiment_manage_permission),
 ) -> MessageResponse:
-    store.delete_experiment_permission(experiment_id, username)
+    await run_blocking(store.delete_experiment_permission, experiment_id, username)
     emit_audit_event(
         "permission.delete",
         actor=current_username,
@@ -327,7 +341,8 @@ async def create_user_experiment_pattern_permission(
         If there's an error creating the permission pattern.
     """
     try:
-        store.create_experiment_regex_permission(
+        await run_blocking(
+            store.create_experiment_regex_permission,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
             permission=pattern_data.permission,
@@ -381,7 +396,7 @@ async def list_user_experiment_pattern_permissions(
         If there's an error retrieving the permissions.
     """
     try:
-        permissions = store.list_experiment_regex_permissions(username=username)
+        permissions = await run_blocking(store.list_experiment_regex_permissions, username=username)
         return [
             ExperimentRegexPermission(
                 id=str(perm.id),
@@ -431,7 +446,7 @@ async def get_user_experiment_pattern_permission(
         If the pattern is not found or there's an error retrieving it.
     """
     try:
-        permission = store.get_experiment_regex_permission(username, int(id))
+        permission = await run_blocking(store.get_experiment_regex_permission, username, int(id))
         return ExperimentRegexPermission(
             id=str(permission.id),
             regex=permission.regex,
@@ -482,7 +497,8 @@ async def update_user_experiment_pattern_permission(
         If the pattern is not found or there's an error updating it.
     """
     try:
-        store.update_experiment_regex_permission(
+        await run_blocking(
+            store.update_experiment_regex_permission,
             id=int(id),
             regex=pattern_data.regex,
             priority=pattern_data.priority,
@@ -538,7 +554,7 @@ async def delete_user_experiment_pattern_permission(
         If the pattern is not found or there's an error deleting it.
     """
     try:
-        store.delete_experiment_regex_permission(username, int(id))
+        await run_blocking(store.delete_experiment_regex_permission, username, int(id))
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -590,17 +606,17 @@ async def get_user_prompts(
         If there's an error retrieving the permissions.
     """
     # Get all prompts and filter based on permissions
-    prompts = fetch_all_prompts()
+    prompts = await run_blocking(fetch_all_prompts)
 
     # Batch resolve permissions for all prompts (fixed number of DB queries)
-    prompt_permissions = batch_resolve_prompt_permissions(username, prompts)
+    prompt_permissions = await run_blocking(batch_resolve_prompt_permissions, username, prompts)
 
     if is_admin:
         list_prompts = prompts
     elif current_username == username:
         list_prompts = [prompt for prompt in prompts if prompt_permissions[prompt.name].permission.name != "NO_PERMISSIONS"]
     else:
-        current_user_permissions = batch_resolve_prompt_permissions(current_username, prompts)
+        current_user_permissions = await run_blocking(batch_resolve_prompt_permissions, current_username, prompts)
         list_prompts = [prompt for prompt in prompts if current_user_permissions[prompt.name].permission.can_manage]
 
     # Format prompt information with permissions (reuse pre-computed permissions)
@@ -648,7 +664,8 @@ async def create_user_prompt_permission(
         A response indicating success.
     """
     try:
-        store.create_registered_model_permission(
+        await run_blocking(
+            store.create_registered_model_permission,
             name=name,
             username=username,
             permission=permission_data.permission,
@@ -703,7 +720,7 @@ async def get_user_prompt_permission(
         A response containing the prompt permission details.
     """
     try:
-        rmp = store.get_registered_model_permission(name, username)
+        rmp = await run_blocking(store.get_registered_model_permission, name, username)
         return PromptPermissionResponse(prompt_permission=RegisteredModelPermissionRecord(**rmp.to_json()))
     except Exception as e:
         logger.error(f"Error getting prompt permission: {str(e)}")
@@ -742,7 +759,8 @@ async def update_user_prompt_permission(
         A response indicating success.
     """
     try:
-        store.update_registered_model_permission(
+        await run_blocking(
+            store.update_registered_model_permission,
             name=name,
             username=username,
             permission=permission_data.permission,
@@ -797,7 +815,7 @@ async def delete_user_prompt_permission(
         A response indicating success.
     """
     try:
-        store.delete_registered_model_permission(name, username)
+        await run_blocking(store.delete_registered_model_permission, name, username)
         emit_audit_event(
             "permission.delete",
             actor=current_username,
@@ -840,7 +858,7 @@ async def get_user_prompt_pattern_permissions(
         A list of prompt regex permissions for the user.
     """
     try:
-        rm = store.list_prompt_regex_permissions(username=username)
+        rm = await run_blocking(store.list_prompt_regex_permissions, username=username)
         return [RegisteredModelRegexPermissionRecord(**r.to_json()) for r in rm]
     except Exception as e:
         logger.error(f"Error listing prompt pattern permissions: {str(e)}")
@@ -880,7 +898,8 @@ async def create_user_prompt_regex_permission(
         A response indicating success.
     """
     try:
-        store.create_prompt_regex_permission(
+        await run_blocking(
+            store.create_prompt_regex_permission,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
             permission=pattern_data.permission,
@@ -931,7 +950,7 @@ async def get_user_prompt_regex_permission(
         The prompt regex permission details.
     """
     try:
-        rm = store.get_prompt_regex_permission(id=int(id), username=username)
+        rm = await run_blocking(store.get_prompt_regex_permission, id=int(id), username=username)
         return PromptRegexPermissionResponse(prompt_permission=RegisteredModelRegexPermissionRecord(**rm.to_json()))
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid pattern ID format. Expected an integer.")
@@ -975,7 +994,8 @@ async def update_user_prompt_regex_permission(
         The updated prompt regex permission details.
     """
     try:
-        rm = store.update_prompt_regex_permission(
+        rm = await run_blocking(
+            store.update_prompt_regex_permission,
             id=int(id),
             regex=pattern_data.regex,
             priority=pattern_data.priority,
@@ -1030,7 +1050,7 @@ async def delete_user_prompt_regex_permission(
         A response indicating success.
     """
     try:
-        store.delete_prompt_regex_permission(id=int(id), username=username)
+        await run_blocking(store.delete_prompt_regex_permission, id=int(id), username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1077,18 +1097,25 @@ async def get_user_registered_models(
         A list of registered models with permission information.
     """
 
+    # Non-admins see a subset named by a resource index (see get_user_experiment_permissions)
+    if is_admin:
+        indexed = None
+    elif current_username == username:
+        indexed = await run_blocking(list_registered_model_names_from_index, username)
+    else:
+        indexed = await run_blocking(list_registered_model_names_from_index, current_username, manage=True)
     # Get all registered models and filter based on permissions
-    models = fetch_all_registered_models()
+    models = [SimpleNamespace(name=name) for name in indexed] if indexed is not None else await run_blocking(fetch_all_registered_models)
 
     # Batch resolve permissions for all models (fixed number of DB queries)
-    model_permissions = batch_resolve_model_permissions(username, models)
+    model_permissions = await run_blocking(batch_resolve_model_permissions, username, models)
 
-    if is_admin:
+    if is_admin or indexed is not None:
         list_models = models
     elif current_username == username:
         list_models = [model for model in models if model_permissions[model.name].permission.name != "NO_PERMISSIONS"]
     else:
-        current_user_permissions = batch_resolve_model_permissions(current_username, models)
+        current_user_permissions = await run_blocking(batch_resolve_model_permissions, current_username, models)
         list_models = [model for model in models if current_user_permissions[model.name].permission.can_manage]
 
     # Format model information with permissions (reuse pre-computed permissions)
@@ -1135,7 +1162,8 @@ async def create_user_registered_model_permission(
         A response indicating success.
     """
     try:
-        store.create_registered_model_permission(
+        await run_blocking(
+            store.create_registered_model_permission,
             name=name,
             username=username,
             permission=permission_data.permission,
@@ -1190,7 +1218,7 @@ async def get_user_registered_model_permission(
         A response containing the registered model permission details.
     """
     try:
-        rmp = store.get_registered_model_permission(name, username)
+        rmp = await run_blocking(store.get_registered_model_permission, name, username)
         return RegisteredModelPermissionResponse(registered_model_permission=RegisteredModelPermissionRecord(**rmp.to_json()))
     except Exception as e:
         logger.error(f"Error getting registered model permission: {str(e)}")
@@ -1231,7 +1259,8 @@ async def update_user_registered_model_permission(
         A response indicating success.
     """
     try:
-        store.update_registered_model_permission(
+        await run_blocking(
+            store.update_registered_model_permission,
             name=name,
             username=username,
             permission=permission_data.permission,
@@ -1288,7 +1317,7 @@ async def delete_user_registered_model_permission(
         A response indicating success.
     """
     try:
-        store.delete_registered_model_permission(name, username)
+        await run_blocking(store.delete_registered_model_permission, name, username)
         emit_audit_event(
             "permission.delete",
             actor=current_username,
@@ -1320,11 +1349,11 @@ async def get_user_scorer_permissions(
     For other users, only include scorers in experiments the current user can manage.
     """
     try:
-        perms = store.list_scorer_permissions(username=username)
+        perms = await run_blocking(store.list_scorer_permissions, username=username)
         if is_admin or current_username == username:
             filtered = perms
         else:
-            filtered = [sp for sp in perms if effective_experiment_permission(sp.experiment_id, current_username).permission.can_manage]
+            filtered = [sp for sp in perms if (await run_blocking(effective_experiment_permission, sp.experiment_id, current_username)).permission.can_manage]
         return [ScorerPermissionRecord(**p.to_json()) for p in filtered]
     except Exception as e:
         logger.error(f"Error listing scorer permissions: {str(e)}")
@@ -1351,7 +1380,8 @@ async def create_user_scorer_permission(
     We require MANAGE on the owning experiment to grant/revoke scorer permissions.
     """
     try:
-        sp = store.create_scorer_permission(
+        sp = await run_blocking(
+            store.create_scorer_permission,
             experiment_id=str(experiment_id),
             scorer_name=str(scorer_name),
             username=str(username),
@@ -1391,7 +1421,7 @@ async def get_user_scorer_permission(
     _: None = Depends(check_experiment_manage_permission),
 ) -> ScorerPermissionResponse:
     try:
-        sp = store.get_scorer_permission(str(experiment_id), str(scorer_name), str(username))
+        sp = await run_blocking(store.get_scorer_permission, str(experiment_id), str(scorer_name), str(username))
         return ScorerPermissionResponse(scorer_permission=ScorerPermissionRecord(**sp.to_json()))
     except Exception as e:
         logger.error(f"Error getting scorer permission: {str(e)}")
@@ -1413,7 +1443,8 @@ async def update_user_scorer_permission(
     current_username: str = Depends(check_experiment_manage_permission),
 ) -> StatusMessageResponse:
     try:
-        store.update_scorer_permission(
+        await run_blocking(
+            store.update_scorer_permission,
             experiment_id=str(experiment_id),
             scorer_name=str(scorer_name),
             username=str(username),
@@ -1453,7 +1484,7 @@ async def delete_user_scorer_permission(
     current_username: str = Depends(check_experiment_manage_permission),
 ) -> StatusMessageResponse:
     try:
-        store.delete_scorer_permission(str(experiment_id), str(scorer_name), str(username))
+        await run_blocking(store.delete_scorer_permission, str(experiment_id), str(scorer_name), str(username))
         emit_audit_event(
             "permission.delete",
             actor=current_username,
@@ -1479,7 +1510,7 @@ async def get_user_scorer_regex_permissions(
     admin_username: str = Depends(check_admin_permission),
 ) -> List[ScorerRegexPermissionRecord]:
     try:
-        perms = store.list_scorer_regex_permissions(username=username)
+        perms = await run_blocking(store.list_scorer_regex_permissions, username=username)
         return [ScorerRegexPermissionRecord(**p.to_json()) for p in perms]
     except Exception as e:
         logger.error(f"Error listing scorer pattern permissions: {str(e)}")
@@ -1500,7 +1531,8 @@ async def create_user_scorer_regex_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> ScorerRegexPermissionResponse:
     try:
-        perm = store.create_scorer_regex_permission(
+        perm = await run_blocking(
+            store.create_scorer_regex_permission,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
             permission=pattern_data.permission,
@@ -1539,7 +1571,7 @@ async def get_user_scorer_pattern_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> ScorerRegexPermissionResponse:
     try:
-        perm = store.get_scorer_regex_permission(username=username, id=id)
+        perm = await run_blocking(store.get_scorer_regex_permission, username=username, id=id)
         return ScorerRegexPermissionResponse(pattern=ScorerRegexPermissionRecord(**perm.to_json()))
     except Exception as e:
         logger.error(f"Error getting scorer pattern permission: {str(e)}")
@@ -1560,7 +1592,8 @@ async def update_user_scorer_pattern_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> ScorerRegexPermissionResponse:
     try:
-        perm = store.update_scorer_regex_permission(
+        perm = await run_blocking(
+            store.update_scorer_regex_permission,
             id=id,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
@@ -1593,7 +1626,7 @@ async def delete_user_scorer_pattern_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> StatusMessageResponse:
     try:
-        store.delete_scorer_regex_permission(id=id, username=username)
+        await run_blocking(store.delete_scorer_regex_permission, id=id, username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1636,7 +1669,7 @@ async def get_user_registered_model_regex_permissions(
         A list of registered model regex permissions for the user.
     """
     try:
-        rm = store.list_registered_model_regex_permissions(username=username)
+        rm = await run_blocking(store.list_registered_model_regex_permissions, username=username)
         return [RegisteredModelRegexPermissionRecord(**r.to_json()) for r in rm]
     except Exception as e:
         logger.error(f"Error listing registered model pattern permissions: {str(e)}")
@@ -1682,7 +1715,8 @@ async def create_user_registered_model_regex_permission(
         A response indicating success.
     """
     try:
-        store.create_registered_model_regex_permission(
+        await run_blocking(
+            store.create_registered_model_regex_permission,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
             permission=pattern_data.permission,
@@ -1736,7 +1770,7 @@ async def get_user_registered_model_regex_permission(
         The registered model regex permission details.
     """
     try:
-        rm = store.get_registered_model_regex_permission(id=int(id), username=username)
+        rm = await run_blocking(store.get_registered_model_regex_permission, id=int(id), username=username)
         return RegisteredModelRegexPermissionResponse(registered_model_permission=RegisteredModelRegexPermissionRecord(**rm.to_json()))
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid pattern ID format. Expected an integer.")
@@ -1783,7 +1817,8 @@ async def update_user_registered_model_regex_permission(
         The updated registered model regex permission details.
     """
     try:
-        rm = store.update_registered_model_regex_permission(
+        rm = await run_blocking(
+            store.update_registered_model_regex_permission,
             id=int(id),
             regex=pattern_data.regex,
             priority=pattern_data.priority,
@@ -1844,7 +1879,7 @@ async def delete_user_registered_model_regex_permission(
         A response indicating success.
     """
     try:
-        store.delete_registered_model_regex_permission(id=int(id), username=username)
+        await run_blocking(store.delete_registered_model_regex_permission, id=int(id), username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -1887,14 +1922,14 @@ async def get_user_gateway_endpoint_permissions(
     - Other users see only endpoints they themselves can MANAGE.
     """
     try:
-        all_endpoints = fetch_all_gateway_endpoints()
+        all_endpoints = await run_blocking(fetch_all_gateway_endpoints)
 
         results: list[NamedPermissionSummary] = []
         for ep in all_endpoints:
             ep_name = ep.get("name", "")
             if not ep_name:
                 continue
-            perm_result = effective_gateway_endpoint_permission(ep_name, username)
+            perm_result = await run_blocking(effective_gateway_endpoint_permission, ep_name, username)
             if is_admin:
                 results.append(
                     NamedPermissionSummary(
@@ -1913,7 +1948,7 @@ async def get_user_gateway_endpoint_permissions(
                         )
                     )
             else:
-                caller_perm = effective_gateway_endpoint_permission(ep_name, current_username)
+                caller_perm = await run_blocking(effective_gateway_endpoint_permission, ep_name, current_username)
                 if caller_perm.permission.can_manage:
                     results.append(
                         NamedPermissionSummary(
@@ -1944,7 +1979,7 @@ async def create_user_gateway_endpoint_permission(
 ) -> NamedPermissionSummary:
     """Create a gateway endpoint permission for a user."""
     try:
-        perm = store.create_gateway_endpoint_permission(gateway_name=name, username=username, permission=permission_data.permission)
+        perm = await run_blocking(store.create_gateway_endpoint_permission, gateway_name=name, username=username, permission=permission_data.permission)
         emit_audit_event(
             "permission.create",
             actor=admin_username,
@@ -1972,7 +2007,7 @@ async def get_user_gateway_endpoint_permission(
 ) -> NamedPermissionSummary:
     """Get a gateway endpoint permission for a user."""
     try:
-        perm = store.get_gateway_endpoint_permission(gateway_name=name, username=username)
+        perm = await run_blocking(store.get_gateway_endpoint_permission, gateway_name=name, username=username)
         return NamedPermissionSummary(name=perm.endpoint_id, permission=perm.permission, kind="user")
     except Exception as e:
         logger.error(f"Error getting gateway endpoint permission: {str(e)}")
@@ -1994,7 +2029,7 @@ async def update_user_gateway_endpoint_permission(
 ) -> StatusMessageResponse:
     """Update a gateway endpoint permission for a user."""
     try:
-        store.update_gateway_endpoint_permission(gateway_name=name, username=username, permission=permission_data.permission)
+        await run_blocking(store.update_gateway_endpoint_permission, gateway_name=name, username=username, permission=permission_data.permission)
         emit_audit_event(
             "permission.update",
             actor=admin_username,
@@ -2022,7 +2057,7 @@ async def delete_user_gateway_endpoint_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway endpoint permission for a user."""
     try:
-        store.delete_gateway_endpoint_permission(gateway_name=name, username=username)
+        await run_blocking(store.delete_gateway_endpoint_permission, gateway_name=name, username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -2054,7 +2089,7 @@ async def get_user_gateway_endpoint_pattern_permissions(
 ) -> List[UserGatewayRegexPermissionItem]:
     """List gateway endpoint pattern permissions for a user."""
     try:
-        perms = store.list_gateway_endpoint_regex_permissions(username=username)
+        perms = await run_blocking(store.list_gateway_endpoint_regex_permissions, username=username)
         return [
             UserGatewayRegexPermissionItem(
                 id=p.id,
@@ -2091,7 +2126,8 @@ async def create_user_gateway_endpoint_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Create a gateway endpoint pattern permission for a user."""
     try:
-        perm = store.create_gateway_endpoint_regex_permission(
+        perm = await run_blocking(
+            store.create_gateway_endpoint_regex_permission,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
             permission=pattern_data.permission,
@@ -2133,7 +2169,7 @@ async def get_user_gateway_endpoint_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Get a gateway endpoint pattern permission for a user."""
     try:
-        perm = store.get_gateway_endpoint_regex_permission(id=id, username=username)
+        perm = await run_blocking(store.get_gateway_endpoint_regex_permission, id=id, username=username)
         return UserGatewayRegexPermissionItem(
             id=perm.id,
             regex=perm.regex,
@@ -2164,7 +2200,8 @@ async def update_user_gateway_endpoint_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Update a gateway endpoint pattern permission for a user."""
     try:
-        perm = store.update_gateway_endpoint_regex_permission(
+        perm = await run_blocking(
+            store.update_gateway_endpoint_regex_permission,
             id=id,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
@@ -2210,7 +2247,7 @@ async def delete_user_gateway_endpoint_pattern_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway endpoint pattern permission for a user."""
     try:
-        store.delete_gateway_endpoint_regex_permission(id=id, username=username)
+        await run_blocking(store.delete_gateway_endpoint_regex_permission, id=id, username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -2251,14 +2288,14 @@ async def get_user_gateway_model_definition_permissions(
     - Other users see only model definitions they themselves can MANAGE.
     """
     try:
-        all_models = fetch_all_gateway_model_definitions()
+        all_models = await run_blocking(fetch_all_gateway_model_definitions)
 
         results: list[NamedPermissionSummary] = []
         for md in all_models:
             md_name = md.get("name", "")
             if not md_name:
                 continue
-            perm_result = effective_gateway_model_definition_permission(md_name, username)
+            perm_result = await run_blocking(effective_gateway_model_definition_permission, md_name, username)
             if is_admin:
                 results.append(
                     NamedPermissionSummary(
@@ -2277,7 +2314,7 @@ async def get_user_gateway_model_definition_permissions(
                         )
                     )
             else:
-                caller_perm = effective_gateway_model_definition_permission(md_name, current_username)
+                caller_perm = await run_blocking(effective_gateway_model_definition_permission, md_name, current_username)
                 if caller_perm.permission.can_manage:
                     results.append(
                         NamedPermissionSummary(
@@ -2311,7 +2348,7 @@ async def create_user_gateway_model_definition_permission(
 ) -> NamedPermissionSummary:
     """Create a gateway model definition permission for a user."""
     try:
-        perm = store.create_gateway_model_definition_permission(gateway_name=name, username=username, permission=permission_data.permission)
+        perm = await run_blocking(store.create_gateway_model_definition_permission, gateway_name=name, username=username, permission=permission_data.permission)
         emit_audit_event(
             "permission.create",
             actor=admin_username,
@@ -2342,7 +2379,7 @@ async def get_user_gateway_model_definition_permission(
 ) -> NamedPermissionSummary:
     """Get a gateway model definition permission for a user."""
     try:
-        perm = store.get_gateway_model_definition_permission(gateway_name=name, username=username)
+        perm = await run_blocking(store.get_gateway_model_definition_permission, gateway_name=name, username=username)
         return NamedPermissionSummary(name=perm.model_definition_id, permission=perm.permission, kind="user")
     except Exception as e:
         logger.error(f"Error getting gateway model definition permission: {str(e)}")
@@ -2367,7 +2404,7 @@ async def update_user_gateway_model_definition_permission(
 ) -> StatusMessageResponse:
     """Update a gateway model definition permission for a user."""
     try:
-        store.update_gateway_model_definition_permission(gateway_name=name, username=username, permission=permission_data.permission)
+        await run_blocking(store.update_gateway_model_definition_permission, gateway_name=name, username=username, permission=permission_data.permission)
         emit_audit_event(
             "permission.update",
             actor=admin_username,
@@ -2401,7 +2438,7 @@ async def delete_user_gateway_model_definition_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway model definition permission for a user."""
     try:
-        store.delete_gateway_model_definition_permission(gateway_name=name, username=username)
+        await run_blocking(store.delete_gateway_model_definition_permission, gateway_name=name, username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -2439,7 +2476,7 @@ async def get_user_gateway_model_definition_pattern_permissions(
 ) -> List[UserGatewayRegexPermissionItem]:
     """List gateway model definition pattern permissions for a user."""
     try:
-        perms = store.list_gateway_model_definition_regex_permissions(username=username)
+        perms = await run_blocking(store.list_gateway_model_definition_regex_permissions, username=username)
         return [
             UserGatewayRegexPermissionItem(
                 id=p.id,
@@ -2476,7 +2513,8 @@ async def create_user_gateway_model_definition_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Create a gateway model definition pattern permission for a user."""
     try:
-        perm = store.create_gateway_model_definition_regex_permission(
+        perm = await run_blocking(
+            store.create_gateway_model_definition_regex_permission,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
             permission=pattern_data.permission,
@@ -2521,7 +2559,7 @@ async def get_user_gateway_model_definition_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Get a gateway model definition pattern permission for a user."""
     try:
-        perm = store.get_gateway_model_definition_regex_permission(id=id, username=username)
+        perm = await run_blocking(store.get_gateway_model_definition_regex_permission, id=id, username=username)
         return UserGatewayRegexPermissionItem(
             id=perm.id,
             regex=perm.regex,
@@ -2555,7 +2593,8 @@ async def update_user_gateway_model_definition_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Update a gateway model definition pattern permission for a user."""
     try:
-        perm = store.update_gateway_model_definition_regex_permission(
+        perm = await run_blocking(
+            store.update_gateway_model_definition_regex_permission,
             id=id,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
@@ -2601,7 +2640,7 @@ async def delete_user_gateway_model_definition_pattern_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway model definition pattern permission for a user."""
     try:
-        store.delete_gateway_model_definition_regex_permission(id=id, username=username)
+        await run_blocking(store.delete_gateway_model_definition_regex_permission, id=id, username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -2642,14 +2681,14 @@ async def get_user_gateway_secret_permissions(
     - Other users see only secrets they themselves can MANAGE.
     """
     try:
-        all_secrets = fetch_all_gateway_secrets()
+        all_secrets = await run_blocking(fetch_all_gateway_secrets)
 
         results: list[NamedPermissionSummary] = []
         for secret in all_secrets:
             secret_name = secret.get("secret_name") or secret.get("name") or secret.get("key", "")
             if not secret_name:
                 continue
-            perm_result = effective_gateway_secret_permission(secret_name, username)
+            perm_result = await run_blocking(effective_gateway_secret_permission, secret_name, username)
             if is_admin:
                 results.append(
                     NamedPermissionSummary(
@@ -2668,7 +2707,7 @@ async def get_user_gateway_secret_permissions(
                         )
                     )
             else:
-                caller_perm = effective_gateway_secret_permission(secret_name, current_username)
+                caller_perm = await run_blocking(effective_gateway_secret_permission, secret_name, current_username)
                 if caller_perm.permission.can_manage:
                     results.append(
                         NamedPermissionSummary(
@@ -2699,7 +2738,7 @@ async def create_user_gateway_secret_permission(
 ) -> NamedPermissionSummary:
     """Create a gateway secret permission for a user."""
     try:
-        perm = store.create_gateway_secret_permission(gateway_name=name, username=username, permission=permission_data.permission)
+        perm = await run_blocking(store.create_gateway_secret_permission, gateway_name=name, username=username, permission=permission_data.permission)
         emit_audit_event(
             "permission.create",
             actor=admin_username,
@@ -2727,7 +2766,7 @@ async def get_user_gateway_secret_permission(
 ) -> NamedPermissionSummary:
     """Get a gateway secret permission for a user."""
     try:
-        perm = store.get_gateway_secret_permission(gateway_name=name, username=username)
+        perm = await run_blocking(store.get_gateway_secret_permission, gateway_name=name, username=username)
         return NamedPermissionSummary(name=perm.secret_id, permission=perm.permission, kind="user")
     except Exception as e:
         logger.error(f"Error getting gateway secret permission: {str(e)}")
@@ -2749,7 +2788,7 @@ async def update_user_gateway_secret_permission(
 ) -> StatusMessageResponse:
     """Update a gateway secret permission for a user."""
     try:
-        store.update_gateway_secret_permission(gateway_name=name, username=username, permission=permission_data.permission)
+        await run_blocking(store.update_gateway_secret_permission, gateway_name=name, username=username, permission=permission_data.permission)
         emit_audit_event(
             "permission.update",
             actor=admin_username,
@@ -2777,7 +2816,7 @@ async def delete_user_gateway_secret_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway secret permission for a user."""
     try:
-        store.delete_gateway_secret_permission(gateway_name=name, username=username)
+        await run_blocking(store.delete_gateway_secret_permission, gateway_name=name, username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -2809,7 +2848,7 @@ async def get_user_gateway_secret_pattern_permissions(
 ) -> List[UserGatewayRegexPermissionItem]:
     """List gateway secret pattern permissions for a user."""
     try:
-        perms = store.list_gateway_secret_regex_permissions(username=username)
+        perms = await run_blocking(store.list_gateway_secret_regex_permissions, username=username)
         return [
             UserGatewayRegexPermissionItem(
                 id=p.id,
@@ -2843,7 +2882,8 @@ async def create_user_gateway_secret_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Create a gateway secret pattern permission for a user."""
     try:
-        perm = store.create_gateway_secret_regex_permission(
+        perm = await run_blocking(
+            store.create_gateway_secret_regex_permission,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
             permission=pattern_data.permission,
@@ -2882,7 +2922,7 @@ async def get_user_gateway_secret_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Get a gateway secret pattern permission for a user."""
     try:
-        perm = store.get_gateway_secret_regex_permission(id=id, username=username)
+        perm = await run_blocking(store.get_gateway_secret_regex_permission, id=id, username=username)
         return UserGatewayRegexPermissionItem(
             id=perm.id,
             regex=perm.regex,
@@ -2910,7 +2950,8 @@ async def update_user_gateway_secret_pattern_permission(
 ) -> UserGatewayRegexPermissionItem:
     """Update a gateway secret pattern permission for a user."""
     try:
-        perm = store.update_gateway_secret_regex_permission(
+        perm = await run_blocking(
+            store.update_gateway_secret_regex_permission,
             id=id,
             regex=pattern_data.regex,
             priority=pattern_data.priority,
@@ -2950,7 +2991,7 @@ async def delete_user_gateway_secret_pattern_permission(
 ) -> StatusMessageResponse:
     """Delete a gateway secret pattern permission for a user."""
     try:
-        store.delete_gateway_secret_regex_permission(id=id, username=username)
+        await run_blocking(store.delete_gateway_secret_regex_permission, id=id, username=username)
         emit_audit_event(
             "permission.delete",
             actor=admin_username,
@@ -18,6 +18,7 @@ from mlflow_oidc_auth.models import (
 from mlflow_oidc_auth.store import store
 from mlflow_oidc_auth.user import create_user, generate_token
 from mlflow_oidc_auth.utils import get_is_admin, get_username
+from mlflow_oidc_auth.utils.offload import run_blocking
 
 from ._prefix import USERS_ROUTER_PREFIX
 
@@ -125,7 +126,7 @@ async def create_access_token(
         # Check if the target user exists. get_user_profile raises rather than returning None,
         # so without this the outer handler turns a mistyped username into a 500 (issue #338).
         try:
-            user = store.get_user_profile(target_username)
+            user = await run_blocking(store.get_user_profile, target_username)
         except MlflowException:
             raise HTTPException(status_code=404, detail=f"User {target_username} not found")
         if user is None:
@@ -137,7 +138,9 @@ async def create_access_token(
         new_token = generate_token()
         # An administrator acting through the admin API is break glass by definition: they must
         # be able to repair a row a directory owns, and the attempt is audited either way (#319).
-        store.update_user(username=target_username, password=new_token, password_expiration=expiration, written_by="manual", admin_override=True)
+        await run_blocking(
+            store.update_user, username=target_username, password=new_token, password_expiration=expiration, written_by="manual", admin_override=True
+        )
         emit_audit_event(
             "user.token_rotate",
             actor=current_username,
@@ -204,7 +207,7 @@ async def list_users(service: bool = False, username: str = Depends(get_username
 
         # Use lightweight query that only fetches usernames,
         # avoiding eager loading of all permission relationships per user.
-        users = store.list_usernames(is_service_account=service)
+        users = await run_blocking(store.list_usernames, is_service_account=service)
 
         return JSONResponse(content=users)
 
@@ -247,7 +250,8 @@ async def create_new_user(
     """
     try:
         # Call the user creation implementation
-        status, message = create_user(
+        status, message = await run_blocking(
+            create_user,
             username=user_request.username,
             display_name=user_request.display_name,
             is_admin=user_request.is_admin,
@@ -312,12 +316,12 @@ async def set_user_ownership(
         raise HTTPException(status_code=400, detail="managed_by must be 'manual', 'scim', or 'oidc:<provider-id>'")
 
     try:
-        store.get_user_profile(username)
+        await run_blocking(store.get_user_profile, username)
     except MlflowException:
         raise HTTPException(status_code=404, detail=f"User {username} not found")
 
-    previous = store.get_user_profile(username).managed_by
-    store.update_user(username=username, managed_by=managed_by, written_by="manual", admin_override=True)
+    previous = (await run_blocking(store.get_user_profile, username)).managed_by
+    await run_blocking(store.update_user, username=username, managed_by=managed_by, written_by="manual", admin_override=True)
     emit_audit_event(
         "user.ownership_set",
         actor=admin_username,
@@ -363,12 +367,12 @@ async def delete_user(
     """
     try:
         # Check if user exists before attempting deletion
-        user = store.get_user_profile(username)
+        user = await run_blocking(store.get_user_profile, username)
         if not user:
             raise HTTPException(status_code=404, detail=f"User {username} not found")
 
         # Delete the user
-        store.delete_user(username)
+        await run_blocking(store.delete_user, username)
         emit_audit_event(
             "user.delete",
             actor=admin_username,
@@ -417,7 +421,7 @@ async def get_current_user_information(
         If the user is not found or there's an error retrieving user information.
     """
     try:
-        user = store.get_user_profile(current_username)
+        user = await run_blocking(store.get_user_profile, current_username)
         return CurrentUserProfile(
             id=user.id,
             username=user.username,
@@ -463,7 +467,7 @@ async def get_user_information(username: str, admin_username: str = Depends(chec
         If the user is not found or there's an error retrieving user information.
     """
     try:
-        user = store.get_user_profile(username)
+        user = await run_blocking(store.get_user_profile, username)
         return CurrentUserProfile(
             id=user.id,
             username=user.username,
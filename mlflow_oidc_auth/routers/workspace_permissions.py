@@ -25,6 +25,7 @@ from mlflow_oidc_auth.models.workspace import (
 )
 from mlflow_oidc_auth.permissions import _validate_permission
 from mlflow_oidc_auth.store import store
+from mlflow_oidc_auth.utils.offload import run_blocking
 from mlflow_oidc_auth.utils.workspace_cache import invalidate_workspace_permission
 
 from ._prefix import WORKSPACE_PERMISSIONS_ROUTER_PREFIX
@@ -57,7 +58,7 @@ async def list_workspace_users(
     _: str = Depends(check_workspace_read_permission),
 ) -> List[WorkspaceUserPermissionResponse]:
     """List all users with permissions in the specified workspace."""
-    perms = store.list_workspace_permissions(workspace)
+    perms = await run_blocking(store.list_workspace_permissions, workspace)
     return [
         WorkspaceUserPermissionResponse(
             workspace=p.workspace,
@@ -78,7 +79,7 @@ async def list_workspace_groups(
     _: str = Depends(check_workspace_read_permission),
 ) -> List[WorkspaceGroupPermissionResponse]:
     """List all groups with permissions in the specified workspace."""
-    perms = store.list_workspace_group_permissions(workspace)
+    perms = await run_blocking(store.list_workspace_group_permissions, workspace)
     return [
         WorkspaceGroupPermissionResponse(
             workspace=p.workspace,
@@ -102,7 +103,7 @@ async def create_workspace_user_permission(
 ) -> WorkspaceUserPermissionResponse:
     """Grant a user permission on a workspace. Per D-04, MANAGE users can grant up to MANAGE."""
     _validate_permission(body.permission)
-    perm = store.create_workspace_permission(workspace, body.username, body.permission)
+    perm = await run_blocking(store.create_workspace_permission, workspace, body.username, body.permission)
     invalidate_workspace_permission(body.username, workspace)
     emit_audit_event(
         "permission.create",
@@ -131,7 +132,7 @@ async def create_workspace_group_permission(
 ) -> WorkspaceGroupPermissionResponse:
     """Grant a group permission on a workspace."""
     _validate_permission(body.permission)
-    perm = store.create_workspace_group_permission(workspace, body.group_name, body.permission)
+    perm = await run_blocking(store.create_workspace_group_permission, workspace, body.group_name, body.permission)
     emit_audit_event(
         "permission.create",
         current_username,
@@ -159,7 +160,7 @@ async def update_workspace_user_permission(
 ) -> WorkspaceUserPermissionResponse:
     """Update a user's permission on a workspace."""
     _validate_permission(body.permission)
-    perm = store.update_workspace_permission(workspace, username, body.permission)
+    perm = await run_blocking(store.update_workspace_permission, workspace, username, body.permission)
     invalidate_workspace_permission(username, workspace)
     emit_audit_event(
         "permission.update",
@@ -188,7 +189,7 @@ async def update_workspace_group_permission(
 ) -> WorkspaceGroupPermissionResponse:
     """Update a group's permission on a workspace."""
     _validate_permission(body.permission)
-    perm = store.update_workspace_group_permission(workspace, group_name, body.permission)
+    perm = await run_blocking(store.update_workspace_group_permission, workspace, group_name, body.permission)
     emit_audit_event(
         "permission.update",
         current_username,
@@ -214,7 +215,7 @@ async def delete_workspace_user_permission(
     current_username: str = Depends(check_workspace_manage_permission),
 ) -> None:
     """Remove a user's permission from a workspace."""
-    store.delete_workspace_permission(workspace, username)
+    await run_blocking(store.delete_workspace_permission, workspace, username)
     invalidate_workspace_permission(username, workspace)
     emit_audit_event(
         "permission.delete",
@@ -236,7 +237,7 @@ async def delete_workspace_group_permission(
     current_username: str = Depends(check_workspace_manage_permission),
 ) -> None:
     """Remove a group's permission from a workspace."""
-    store.delete_workspace_group_permission(workspace, group_name)
+    await run_blocking(store.delete_workspace_group_permission, workspace, group_name)
     emit_audit_event(
         "permission.delete",
         current_username,
@@ -22,6 +22,7 @@ from mlflow_oidc_auth.models.workspace import (
 )
 from mlflow_oidc_auth.permissions import _validate_permission
 from mlflow_oidc_auth.store import store
+from mlflow_oidc_auth.utils.offload import run_blocking
 from mlflow_oidc_auth.utils.workspace_cache import flush_workspace_cache
 
 from ._prefix import WORKSPACE_REGEX_PERMISSIONS_ROUTER_PREFIX
@@ -56,7 +57,7 @@ async def create_user_regex_permission(
 ) -> WorkspaceRegexPermissionResponse:
     """Create a user regex workspace permission. Requires admin privileges."""
     _validate_permission(body.permission)
-    perm = store.create_workspace_regex_permission(body.regex, body.priority, body.permission, body.username)
+    perm = await run_blocking(store.create_workspace_regex_permission, body.regex, body.priority, body.permission, body.username)
     flush_workspace_cache()
     emit_audit_event(
         "permission.create",
@@ -88,7 +89,7 @@ async def list_user_regex_permissions(
     _: str = Depends(check_admin_permission),
 ) -> List[WorkspaceRegexPermissionResponse]:
     """List all user regex workspace permissions. Requires admin privileges."""
-    perms = store.list_all_workspace_regex_permissions()
+    perms = await run_blocking(store.list_all_workspace_regex_permissions)
     return [
         WorkspaceRegexPermissionResponse(
             id=p.id,
@@ -113,7 +114,7 @@ async def update_user_regex_permission(
 ) -> WorkspaceRegexPermissionResponse:
     """Update a user regex workspace permission. Requires admin privileges."""
     _validate_permission(body.permission)
-    perm = store.update_workspace_regex_permission(body.regex, body.priority, body.permission, body.username, permission_id)
+    perm = await run_blocking(store.update_workspace_regex_permission, body.regex, body.priority, body.permission, body.username, permission_id)
     flush_workspace_cache()
     emit_audit_event(
         "permission.update",
@@ -147,7 +148,7 @@ async def delete_user_regex_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> None:
     """Delete a user regex workspace permission. Requires admin privileges."""
-    store.delete_workspace_regex_permission(username, permission_id)
+    await run_blocking(store.delete_workspace_regex_permission, username, permission_id)
     flush_workspace_cache()
     emit_audit_event(
         "permission.delete",
@@ -170,7 +171,7 @@ async def create_group_regex_permission(
 ) -> WorkspaceGroupRegexPermissionResponse:
     """Create a group regex workspace permission. Requires admin privileges."""
     _validate_permission(body.permission)
-    perm = store.create_workspace_group_regex_permission(body.group_name, body.regex, body.priority, body.permission)
+    perm = await run_blocking(store.create_workspace_group_regex_permission, body.group_name, body.regex, body.priority, body.permission)
     flush_workspace_cache()
     emit_audit_event(
         "permission.create",
@@ -202,7 +203,7 @@ async def list_group_regex_permissions(
     _: str = Depends(check_admin_permission),
 ) -> List[WorkspaceGroupRegexPermissionResponse]:
     """List all group regex workspace permissions. Requires admin privileges."""
-    perms = store.list_all_workspace_group_regex_permissions()
+    perms = await run_blocking(store.list_all_workspace_group_regex_permissions)
     return [
         WorkspaceGroupRegexPermissionResponse(
             id=p.id,
@@ -227,7 +228,7 @@ async def update_group_regex_permission(
 ) -> WorkspaceGroupRegexPermissionResponse:
     """Update a group regex workspace permission. Requires admin privileges."""
     _validate_permission(body.permission)
-    perm = store.update_workspace_group_regex_permission(permission_id, body.group_name, body.regex, body.priority, body.permission)
+    perm = await run_blocking(store.update_workspace_group_regex_permission, permission_id, body.group_name, body.regex, body.priority, body.permission)
     flush_workspace_cache()
     emit_audit_event(
         "permission.update",
@@ -261,7 +262,7 @@ async def delete_group_regex_permission(
     admin_username: str = Depends(check_admin_permission),
 ) -> None:
     """Delete a group regex workspace permission. Requires admin privileges."""
-    store.delete_workspace_group_regex_permission(group_name, permission_id)
+    await run_blocking(store.delete_workspace_group_regex_permission, group_name, permission_id)
     flush_workspace_cache()
     emit_audit_event(
         "permission.delete",
@@ -1,8 +1,11 @@
 import functools
+import inspect
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 import sqlalchemy
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, ErrorCode
 from mlflow.store.db.utils import (
     _get_managed_session_maker,
     _make_parent_dirs_if_sqlite,
@@ -11,6 +14,7 @@ from mlflow.utils.uri import extract_db_type_from_uri
 from sqlalchemy.orm import sessionmaker
 
 from mlflow_oidc_auth.db import utils as dbutils
+from mlflow_oidc_auth.db.routing import RoutingSessionMaker, primary_reads
 from mlflow_oidc_auth.entities import (
     ExperimentGroupRegexPermission,
     ExperimentPermission,
@@ -18,6 +22,7 @@ from mlflow_oidc_auth.entities import (
     RegisteredModelGroupRegexPermission,
     RegisteredModelPermission,
     RegisteredModelRegexPermission,
+    ResourcePrincipal,
     ScorerGroupRegexPermission,
     ScorerPermission,
     ScorerRegexPermission,
@@ -45,6 +50,7 @@ from mlflow_oidc_auth.repository import (
     RegisteredModelPermissionGroupRepository,
     RegisteredModelPermissionRegexRepository,
     RegisteredModelPermissionRepository,
+    ResourcePrincipalRepository,
     ScorerPermissionGroupRegexRepository,
     ScorerPermissionGroupRepository,
     ScorerPermissionRegexRepository,
@@ -65,9 +71,12 @@ from mlflow_oidc_auth.repository import (
     UserIdentityRepository,
     AuthSessionRepository,
     AuthStateRepository,
+    TrashGcJobRepository,
     WorkspacePermissionRepository,
     WorkspaceGroupPermissionRepository,
 )
+from mlflow_oidc_auth.repository.resource_principal import DIRECT_SOURCES
+from mlflow_oidc_auth.repository.user import normalize_username
 from mlflow_oidc_auth.repository.workspace_regex_permission import (
     WorkspaceRegexPermissionRepository,
 )
@@ -77,17 +86,24 @@ from mlflow_oidc_auth.repository.workspace_group_regex_permission import (
 
 
 class SqlAlchemyStore:
-    def init_db(self, db_uri):
+    replica_router: Optional[RoutingSessionMaker] = None
+
+    def init_db(self, db_uri, replica_uris: Optional[List[str]] = None):
         self.db_uri = db_uri
         self.db_type = extract_db_type_from_uri(db_uri)
         self.engine = self._create_engine(db_uri)
         dbutils.migrate_if_needed(self.engine, "head")
         SessionMaker = sessionmaker(bind=self.engine)
         self.ManagedSessionMaker = _get_managed_session_maker(SessionMaker, self.db_type)
+        self.replica_router = None
+        if replica_uris:
+            self.replica_router = self._create_replica_router(replica_uris)
+            self.ManagedSessionMaker = self.replica_router
         self.user_repo = UserRepository(self.ManagedSessionMaker)
         self.user_identity_repo = UserIdentityRepository(self.ManagedSessionMaker)
         self.auth_session_repo = AuthSessionRepository(self.ManagedSessionMaker)
         self.auth_state_repo = AuthStateRepository(self.ManagedSessionMaker)
+        self.trash_gc_job_repo = TrashGcJobRepository(self.ManagedSessionMaker)
         self.experiment_repo = ExperimentPermissionRepository(self.ManagedSessionMaker)
         self.experiment_group_repo = ExperimentPermissionGroupRepository(self.ManagedSessionMaker)
         self.group_repo = GroupRepository(self.ManagedSessionMaker)
@@ -129,6 +145,9 @@ class SqlAlchemyStore:
         self.workspace_regex_permission_repo = WorkspaceRegexPermissionRepository(self.ManagedSessionMaker)
         self.workspace_group_regex_permission_repo = WorkspaceGroupRegexPermissionRepository(self.ManagedSessionMaker)
 
+        # Reverse "who has access" lookups across all resource types
+        self.resource_principal_repo = ResourcePrincipalRepository(self.ManagedSessionMaker)
+
     @staticmethod
     def _create_engine(db_uri):
         """Create a SQLAlchemy engine with connection pool configuration.
@@ -187,6 +206,37 @@ class SqlAlchemyStore:
                 else:
                     raise
 
+    def _create_replica_router(self, replica_uris: List[str]) -> RoutingSessionMaker:
+        """Route read-only sessions to ``replica_uris``. See db/routing.py.
+
+        Replicas are not migrated; they follow the primary's schema. One that cannot be
+        reached here starts out skipped rather than failing startup.
+        """
+        from mlflow_oidc_auth.cache.invalidation_bus import get_invalidation_bus
+        from mlflow_oidc_auth.config import config
+        from mlflow_oidc_auth.logger import get_logger
+
+        engines = []
+        for uri in replica_uris:
+            try:
+                engines.append(self._create_engine(uri))
+            except Exception as exc:
+                get_logger().warning("Auth DB replica could not be reached at startup; it is retried on demand: %s", exc)
+                engines.append(sqlalchemy.create_engine(uri, pool_pre_ping=True))
+        router = RoutingSessionMaker(
+            self.ManagedSessionMaker,
+            engines,
+            self.db_type,
+            read_your_writes_seconds=config.DB_REPLICA_READ_YOUR_WRITES_SECONDS,
+            retry_seconds=config.DB_REPLICA_RETRY_SECONDS,
+        )
+        # Another process changed something this one caches; the rebuild must see it.
+        bus = get_invalidation_bus()
+        if bus is not None:
+            bus.subscribe(lambda event: router.pin_primary())
+        get_logger().info("Auth DB reads routed across %d replica(s)", len(engines))
+        return router
+
     def ping(self) -> bool:
         """Lightweight database connectivity check for health probes.
 
@@ -236,7 +286,7 @@ class SqlAlchemyStore:
             SqlScorerPermission,
         )
 
-        with self.ManagedSessionMaker() as session:
+        with self.ManagedSessionMaker(read_only=False) as session:
             session.query(SqlScorerPermission).filter(
                 SqlScorerPermission.experiment_id == experiment_id,
                 SqlScorerPermission.scorer_name == scorer_name,
@@ -263,6 +313,9 @@ class SqlAlchemyStore:
     def get_user_groups_scorer_permission(self, experiment_id: str, scorer_name: str, username: str):
         return self.scorer_group_repo.get_group_permission_for_user_scorer(experiment_id, scorer_name, username)
 
+    def list_user_groups_scorer_permissions(self, username: str) -> List[ScorerPermission]:
+        return self.scorer_group_repo.list_permissions_for_user_groups(username)
+
     # Scorer regex (user-scoped)
     def create_scorer_regex_permission(self, regex: str, priority: int, permission: str, username: str) -> ScorerRegexPermission:
         return self.scorer_regex_repo.grant(regex=regex, priority=priority, permission=permission, username=username)
@@ -317,7 +370,21 @@ class SqlAlchemyStore:
         return self.scorer_group_regex_repo.revoke(id=id, group_name=group_name)
 
     def authenticate_user(self, username: str, password: str) -> bool:
-        return self.user_repo.authenticate(username, password)
+        """Verify a username and password.
+
+        Successful verifications are remembered briefly (utils/credential_cache.py), so
+        repeated Basic-auth requests with the same credentials skip the password hash and
+        the user lookup. Failures are always checked against the database.
+        """
+        from mlflow_oidc_auth.utils.credential_cache import is_verified, remember_verified
+
+        username = normalize_username(username)
+        if is_verified(username, password):
+            return True
+        verified, expiration = self.user_repo.verify_password(username, password)
+        if verified:
+            remember_verified(username, password, expiration)
+        return verified
 
     def create_user(
         self,
@@ -343,7 +410,12 @@ class SqlAlchemyStore:
 
     def resolve_auth_session(self, session_id: str):
         """Resolve a session id to its user in one statement, or None if it is not honoured."""
-        return self.auth_session_repo.resolve(session_id)
+        resolved = self.auth_session_repo.resolve(session_id)
+        if resolved is None and self.replica_router is not None:
+            # The session may have been created on another worker and not reached the replica yet.
+            with primary_reads():
+                resolved = self.auth_session_repo.resolve(session_id)
+        return resolved
 
     def revoke_auth_session(self, session_id: str) -> bool:
         """Revoke one session. True if it was live until now."""
@@ -353,11 +425,23 @@ class SqlAlchemyStore:
         """Revoke every live session for a user. Returns how many were revoked."""
         return self.auth_session_repo.revoke_all_for_user(username)
 
+    def create_trash_gc_job(self, requested_by: str, **kwargs) -> int:
+        """Enqueue a trash garbage-collection job and return its id."""
+        return self.trash_gc_job_repo.create(requested_by, **kwargs)
+
+    def get_trash_gc_job(self, job_id: int):
+        """The trash garbage-collection job with this id, or None."""
+        return self.trash_gc_job_repo.get(job_id)
+
+    def list_trash_gc_job_failures(self, job_id: int, limit: int = 100):
+        """The runs and experiments a trash garbage-collection job could not delete."""
+        return self.trash_gc_job_repo.list_failures(job_id, limit)
+
     def has_user(self, username: str) -> bool:
         return self.user_repo.exist(username)
 
     def get_user(self, username: str) -> User:
-        return self.user_repo.get(username)
+        return self._read_or_primary(self.user_repo.get, username)
 
     def get_user_profile(self, username: str) -> User:
         """Return a lightweight user entity for UI/admin checks.
@@ -366,7 +450,21 @@ class SqlAlchemyStore:
         It is suitable for endpoints that only need basic user metadata.
         """
 
-        return self.user_repo.get_profile(username)
+        return self._read_or_primary(self.user_repo.get_profile, username)
+
+    def _read_or_primary(self, read, *args):
+        """Call ``read``; if a replica does not have the row yet, read it again from the primary.
+
+        A user provisioned on another worker moments ago is only on the primary until
+        replication catches up.
+        """
+        try:
+            return read(*args)
+        except MlflowException as e:
+            if self.replica_router is None or e.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+                raise
+        with primary_reads():
+            return read(*args)
 
     def list_users(self, is_service_account: bool = False, all: bool = False) -> List[User]:
         return self.user_repo.list(is_service_account, all)
@@ -490,6 +588,19 @@ class SqlAlchemyStore:
     def list_experiment_permissions_for_experiment(self, experiment_id: str) -> List[ExperimentPermission]:
         return self.experiment_repo.list_permissions_for_experiment(experiment_id)
 
+    def list_resource_principals(
+        self,
+        resource_type: str,
+        resource_ids: Iterable,
+        sources: Iterable[str] = DIRECT_SOURCES,
+        names: Optional[Mapping] = None,
+    ) -> Dict[Any, List[ResourcePrincipal]]:
+        """Return the users and groups holding a grant on each resource, without loading every user.
+
+        See ``ResourcePrincipalRepository.list_principals``.
+        """
+        return self.resource_principal_repo.list_principals(resource_type, resource_ids, sources=sources, names=names)
+
     def populate_groups(self, group_names: List[str]):
         return self.group_repo.create_groups(group_names)
 
@@ -774,6 +885,9 @@ class SqlAlchemyStore:
     def get_user_groups_gateway_secret_permission(self, gateway_name: str, group_name: str):
         return self.gateway_secret_group_repo.get_group_permission_for_user(gateway_name, group_name)
 
+    def list_user_groups_gateway_secret_permissions(self, username: str):
+        return self.gateway_secret_group_repo.list_permissions_for_user_groups(username)
+
     def update_group_gateway_secret_permission(self, group_name: str, gateway_name: str, permission: str):
         return self.gateway_secret_group_repo.update_group_permission(group_name, gateway_name, permission)
 
@@ -854,6 +968,9 @@ class SqlAlchemyStore:
     def get_user_groups_gateway_endpoint_permission(self, gateway_name: str, group_name: str):
         return self.gateway_endpoint_group_repo.get_group_permission_for_user(gateway_name, group_name)
 
+    def list_user_groups_gateway_endpoint_permissions(self, username: str):
+        return self.gateway_endpoint_group_repo.list_permissions_for_user_groups(username)
+
     def update_group_gateway_endpoint_permission(self, group_name: str, gateway_name: str, permission: str):
         return self.gateway_endpoint_group_repo.update_group_permission(group_name, gateway_name, permission)
 
@@ -923,6 +1040,9 @@ class SqlAlchemyStore:
     def get_user_groups_gateway_model_definition_permission(self, gateway_name: str, group_name: str):
         return self.gateway_model_definition_group_repo.get_group_permission_for_user(gateway_name, group_name)
 
+    def list_user_groups_gateway_model_definition_permissions(self, username: str):
+        return self.gateway_model_definition_group_repo.list_permissions_for_user_groups(username)
+
     def update_group_gateway_model_definition_permission(self, group_name: str, gateway_name: str, permission: str):
         return self.gateway_model_definition_group_repo.update_group_permission(group_name, gateway_name, permission)
 
@@ -977,7 +1097,7 @@ class SqlAlchemyStore:
         """Create a workspace permission for a user by username."""
         from mlflow_oidc_auth.repository.utils import get_user
 
-        with self.ManagedSessionMaker() as session:
+        with primary_reads(), self.ManagedSessionMaker() as session:
             user = get_user(session, username)
             return self.workspace_permission_repo.create(workspace, user.id, permission)
 
@@ -985,7 +1105,7 @@ class SqlAlchemyStore:
         """Update a user's workspace permission by username."""
         from mlflow_oidc_auth.repository.utils import get_user
 
-        with self.ManagedSessionMaker() as session:
+        with primary_reads(), self.ManagedSessionMaker() as session:
             user = get_user(session, username)
             return self.workspace_permission_repo.update(workspace, user.id, permission)
 
@@ -993,7 +1113,7 @@ class SqlAlchemyStore:
         """Delete a user's workspace permission by username."""
         from mlflow_oidc_auth.repository.utils import get_user
 
-        with self.ManagedSessionMaker() as session:
+        with primary_reads(), self.ManagedSessionMaker() as session:
             user = get_user(session, username)
             self.workspace_permission_repo.delete(workspace, user.id)
 
@@ -1023,7 +1143,7 @@ class SqlAlchemyStore:
         """Create a workspace permission for a group by group name."""
         from mlflow_oidc_auth.repository.utils import get_group
 
-        with self.ManagedSessionMaker() as session:
+        with primary_reads(), self.ManagedSessionMaker() as session:
             group = get_group(session, group_name)
             return self.workspace_group_permission_repo.create(workspace, group.id, permission)
 
@@ -1031,7 +1151,7 @@ class SqlAlchemyStore:
         """Update a group's workspace permission by group name."""
         from mlflow_oidc_auth.repository.utils import get_group
 
-        with self.ManagedSessionMaker() as session:
+        with primary_reads(), self.ManagedSessionMaker() as session:
             group = get_group(session, group_name)
             return self.workspace_group_permission_repo.update(workspace, group.id, permission)
 
@@ -1039,7 +1159,7 @@ class SqlAlchemyStore:
         """Delete a group's workspace permission by group name."""
         from mlflow_oidc_auth.repository.utils import get_group
 
-        with self.ManagedSessionMaker() as session:
+        with primary_reads(), self.ManagedSessionMaker() as session:
             group = get_group(session, group_name)
             self.workspace_group_permission_repo.delete(workspace, group.id)
 
@@ -1286,6 +1406,22 @@ _PERMISSION_CUD_METHODS = [
     "wipe_workspace_permissions",
 ]
 
+# User deletion is not a permission CUD (see above), but it cascades to the user's
+# grants, so the compiled permission snapshot for that name must not outlive it.
+_SNAPSHOT_USER_LIFECYCLE_METHODS = [
+    "delete_user",
+]
+
+# Anything that changes whether a password verifies: a new secret or expiry, the active
+# flag, and the account's existence. Each drops that user's cached Basic-auth
+# verifications. Creation is included so a user re-created under a deleted name never
+# inherits an entry. All take the username as their first positional argument.
+_CREDENTIAL_LIFECYCLE_METHODS = [
+    "create_user",
+    "update_user",
+    "delete_user",
+]
+
 # Wiping a whole workspace can change the permission of EVERY user in it, and the
 # entries are keyed username:workspace, so there is no bounded target to invalidate —
 # a full workspace-cache flush is the correct choice here. The DeleteWorkspace cascade
@@ -1295,6 +1431,18 @@ _WORKSPACE_WIPE_METHODS = [
     "wipe_workspace_permissions",
 ]
 
+# Workspace regex CUD can change the permission of any user in any workspace, so it
+# flushes as well. The regex routers already flush. Doing it here too matters because
+# denials are cached: a new regex grant must not wait for a cached denial to expire.
+_WORKSPACE_REGEX_CUD_METHODS = [
+    "create_workspace_regex_permission",
+    "update_workspace_regex_permission",
+    "delete_workspace_regex_permission",
+    "create_workspace_group_regex_permission",
+    "update_workspace_group_regex_permission",
+    "delete_workspace_group_regex_permission",
+]
+
 # Group membership drives the group-scoped branch of workspace resolution, so these
 # must additionally drop the mutated user's workspace-cache entries. They take the
 # username as their first positional argument. Targeted (not a full flush) because
@@ -1325,8 +1473,64 @@ _WORKSPACE_USER_CUD_METHODS = [
 ]
 
 
+# A user's own grant on one listed resource: the user's resource index is patched for that
+# resource rather than rebuilt (utils/resource_index.py). Maps the method to the index's
+# resource type and the argument naming the resource.
+_INDEXED_GRANT_METHODS = {
+    "create_experiment_permission": ("experiment", "experiment_id"),
+    "update_experiment_permission": ("experiment", "experiment_id"),
+    "delete_experiment_permission": ("experiment", "experiment_id"),
+    "create_registered_model_permission": ("registered_model", "name"),
+    "update_registered_model_permission": ("registered_model", "name"),
+    "delete_registered_model_permission": ("registered_model", "name"),
+}
+
+
+def _invalidate_permission_snapshots(method, signature, args, kwargs) -> None:
+    """Bump the snapshot generation a permission write affects, and update resource indexes.
+
+    Writes that name a user (user grants, user regex rules, membership) only stale that
+    user's snapshot. Group grants, renames and wipes cannot be attributed to one user
+    without another query, so they stale every snapshot. Failures are logged, never
+    raised — the mutation already succeeded.
+    """
+    try:
+        from mlflow_oidc_auth.utils import resource_index
+        from mlflow_oidc_auth.utils.permission_snapshot import (
+            invalidate_all_permission_snapshots,
+            invalidate_permission_snapshot,
+        )
+
+        arguments = signature.bind_partial(None, *args, **kwargs).arguments
+        username = arguments.get("username") if "username" in signature.parameters else None
+        if username:
+            invalidate_permission_snapshot(username)
+            indexed = _INDEXED_GRANT_METHODS.get(method.__name__)
+            if indexed is not None and arguments.get(indexed[1]) is not None:
+                resource_index.apply_grant_change(username, indexed[0], arguments[indexed[1]])
+            else:
+                resource_index.invalidate_user_resource_indexes(username)
+        else:
+            invalidate_all_permission_snapshots()
+            resource_index.clear_resource_index_cache()
+    except Exception:
+        from mlflow_oidc_auth.logger import get_logger
+
+        get_logger().warning(
+            "Permission snapshot invalidation failed after %s; snapshots expire via TTL",
+            method.__name__,
+        )
+
+
 def _wrap_with_cache_flush(method):
-    """Wrap a store method to flush the permission cache after successful execution."""
+    """Wrap a store method to flush the permission cache after successful execution.
+
+    Resource permission writes additionally stale the compiled permission snapshots
+    (utils/permission_snapshot.py). Workspace writes do not: snapshots hold resource
+    grants only, and the workspace fallback is resolved separately.
+    """
+    signature = inspect.signature(method)
+    affects_snapshots = "workspace" not in method.__name__
 
     @functools.wraps(method)
     def wrapper(self, *args, **kwargs):
@@ -1335,6 +1539,25 @@ def _wrap_with_cache_flush(method):
         from mlflow_oidc_auth.utils.permissions import flush_permission_cache
 
         flush_permission_cache()
+        if affects_snapshots:
+            _invalidate_permission_snapshots(method, signature, args, kwargs)
+        return result
+
+    return wrapper
+
+
+def _wrap_with_snapshot_invalidation(method):
+    """Wrap a user lifecycle method to stale that user's permission snapshot.
+
+    Deleting a user cascades to their grants. Without this, a user re-created under the
+    same name within the snapshot TTL would briefly inherit the old grants.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        _invalidate_permission_snapshots(method, signature, args, kwargs)
         return result
 
     return wrapper
@@ -1375,6 +1598,49 @@ for _method_name in _PERMISSION_CUD_METHODS:
     _original = getattr(SqlAlchemyStore, _method_name)
     setattr(SqlAlchemyStore, _method_name, _wrap_with_cache_flush(_original))
 
+for _method_name in _SNAPSHOT_USER_LIFECYCLE_METHODS:
+    _original = getattr(SqlAlchemyStore, _method_name)
+    setattr(SqlAlchemyStore, _method_name, _wrap_with_snapshot_invalidation(_original))
+
+
+def _wrap_with_credential_invalidation(method):
+    """Wrap a user lifecycle method to drop that user's cached Basic-auth verifications.
+
+    ``update_user`` only invalidates when it is given a password, an expiration or an
+    active flag; admin and service-account flag changes do not affect verification.
+    Failures are logged, never raised — the mutation already succeeded.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        arguments = signature.bind_partial(None, *args, **kwargs).arguments
+        credential_fields = ("password", "password_expiration", "active")
+        if method.__name__ == "update_user" and all(arguments.get(field) is None for field in credential_fields):
+            return result
+        username = arguments.get("username")
+        if username:
+            try:
+                from mlflow_oidc_auth.utils.credential_cache import invalidate_user_credentials
+
+                invalidate_user_credentials(normalize_username(username))
+            except Exception:
+                from mlflow_oidc_auth.logger import get_logger
+
+                get_logger().warning(
+                    "Basic auth credential cache invalidation failed after %s; entries expire via TTL",
+                    method.__name__,
+                )
+        return result
+
+    return wrapper
+
+
+for _method_name in _CREDENTIAL_LIFECYCLE_METHODS:
+    _original = getattr(SqlAlchemyStore, _method_name)
+    setattr(SqlAlchemyStore, _method_name, _wrap_with_credential_invalidation(_original))
+
 
 def _wrap_with_workspace_group_invalidation(method):
     """Wrap a group-scoped workspace CUD method to invalidate the group's members.
@@ -1477,6 +1743,6 @@ def _wrap_with_workspace_flush(method):
     return wrapper
 
 
-for _method_name in _WORKSPACE_WIPE_METHODS:
+for _method_name in _WORKSPACE_WIPE_METHODS + _WORKSPACE_REGEX_CUD_METHODS:
     _original = getattr(SqlAlchemyStore, _method_name)
     setattr(SqlAlchemyStore, _method_name, _wrap_with_workspace_flush(_original))
@@ -30,7 +30,7 @@ class _LazyStore:
         from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
 
         instance = SqlAlchemyStore()
-        instance.init_db(config.OIDC_USERS_DB_URI)
+        instance.init_db(config.OIDC_USERS_DB_URI, config.OIDC_USERS_DB_REPLICA_URIS)
         object.__setattr__(self, "_instance", instance)
 
     def _get_instance(self):
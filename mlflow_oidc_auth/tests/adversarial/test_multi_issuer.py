@@ -169,10 +169,17 @@ class TestKeyRotationIsPerIssuer:
             fetched.append(url)
 
             class Response:
+                @staticmethod
+                def raise_for_status():
+                    pass
+
                 @staticmethod
                 def json():
                     if url.endswith("/.well-known/openid-configuration"):
-                        return {"jwks_uri": url.replace("/.well-known/openid-configuration", "/keys")}
+                        return {
+                            "issuer": url.replace("/.well-known/openid-configuration", ""),
+                            "jwks_uri": url.replace("/.well-known/openid-configuration", "/keys"),
+                        }
                     return entra.jwks if "entra" in url else kubernetes.jwks
 
             return Response()
@@ -297,9 +304,13 @@ class TestTheSingleProviderDeploymentFetchesKeysTheSameWay:
             fetched.append(url)
 
             class Response:
+                @staticmethod
+                def raise_for_status():
+                    pass
+
                 @staticmethod
                 def json():
-                    return {"jwks_uri": "https://entra.invalid/keys"} if "openid-configuration" in url else entra.jwks
+                    return {"issuer": "https://entra.invalid", "jwks_uri": "https://entra.invalid/keys"} if "openid-configuration" in url else entra.jwks
 
             return Response()
 
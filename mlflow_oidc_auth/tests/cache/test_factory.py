@@ -4,9 +4,19 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mlflow_oidc_auth.cache.broadcast_backend import BroadcastCacheBackend
+from mlflow_oidc_auth.cache.invalidation_bus import reset_invalidation_bus
 from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
 
 
+@pytest.fixture(autouse=True)
+def _reset_bus():
+    """The bus is a lazily resolved process-wide singleton; resolve it per test."""
+    reset_invalidation_bus()
+    yield
+    reset_invalidation_bus()
+
+
 class TestGetCacheBackend:
     """Tests for get_cache_backend() factory function."""
 
@@ -14,6 +24,7 @@ class TestGetCacheBackend:
         """Default CACHE_BACKEND='local' returns LocalTTLCacheBackend."""
         mock_config = MagicMock()
         mock_config.CACHE_BACKEND = "local"
+        mock_config.CACHE_INVALIDATION_BUS = "none"
 
         with patch("mlflow_oidc_auth.config.config", mock_config):
             from mlflow_oidc_auth.cache.factory import get_cache_backend
@@ -48,6 +59,7 @@ class TestGetCacheBackend:
         mock_config = MagicMock()
         mock_config.CACHE_BACKEND = "redis"
         mock_config.CACHE_REDIS_URL = "redis://localhost:6379/0"
+        mock_config.CACHE_CODEC = "compact"
         mock_config.CACHE_KEY_PREFIX = "mlflow_oidc_auth:"
 
         mock_redis_client = MagicMock()
@@ -92,6 +104,38 @@ class TestGetCacheBackend:
             backend = get_cache_backend("ws", maxsize=100, ttl=30)
             assert backend._prefix == "mlflow_oidc_auth:ws:"
 
+    @pytest.mark.parametrize("codec_name, codec_class", [("compact", "PermissionCodec"), ("pickle", "PickleCodec")])
+    def test_redis_backend_codec_follows_config(self, codec_name, codec_class):
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "redis"
+        mock_config.CACHE_REDIS_URL = "redis://localhost:6379/0"
+        mock_config.CACHE_KEY_PREFIX = "mlflow_oidc_auth:"
+        mock_config.CACHE_CODEC = codec_name
+
+        mock_redis_module = MagicMock()
+        mock_redis_module.ConnectionError = ConnectionError
+
+        with (
+            patch("mlflow_oidc_auth.config.config", mock_config),
+            patch.dict("sys.modules", {"redis": mock_redis_module}),
+        ):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            backend = get_cache_backend("permissions", maxsize=100, ttl=30)
+            assert type(backend._codec).__name__ == codec_class
+
+    def test_unknown_codec_raises_value_error(self):
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "redis"
+        mock_config.CACHE_REDIS_URL = "redis://localhost:6379/0"
+        mock_config.CACHE_CODEC = "msgpack"
+
+        with patch("mlflow_oidc_auth.config.config", mock_config):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            with pytest.raises(ValueError, match="Unknown CACHE_CODEC: 'msgpack'"):
+                get_cache_backend("test", maxsize=100, ttl=30)
+
     def test_unknown_backend_raises_value_error(self):
         """Unknown CACHE_BACKEND value raises ValueError."""
         mock_config = MagicMock()
@@ -102,3 +146,152 @@ class TestGetCacheBackend:
 
             with pytest.raises(ValueError, match="Unknown CACHE_BACKEND: 'memcached'"):
                 get_cache_backend("test", maxsize=100, ttl=30)
+
+
+class TestTieredBackend:
+    """CACHE_BACKEND='tiered' puts a bounded local L1 in front of a Redis L2."""
+
+    @staticmethod
+    def _mock_redis_module():
+        mock_redis_module = MagicMock()
+        mock_redis_module.Redis.from_url.return_value = MagicMock()
+        mock_redis_module.ConnectionError = ConnectionError
+        return mock_redis_module
+
+    def test_returns_tiered_backend(self):
+        from mlflow_oidc_auth.cache.tiered_backend import TieredCacheBackend
+
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "tiered"
+        mock_config.CACHE_REDIS_URL = "redis://localhost:6379/0"
+        mock_config.CACHE_CODEC = "compact"
+        mock_config.CACHE_KEY_PREFIX = "mlflow_oidc_auth:"
+        mock_config.CACHE_L1_MAX_SIZE = 64
+        mock_config.CACHE_L1_TTL_SECONDS = 5
+        mock_config.CACHE_INVALIDATION_BUS = "none"
+
+        with (
+            patch("mlflow_oidc_auth.config.config", mock_config),
+            patch.dict("sys.modules", {"redis": self._mock_redis_module()}),
+        ):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            backend = get_cache_backend("permissions", maxsize=2048, ttl=300)
+
+        assert isinstance(backend, TieredCacheBackend)
+        assert backend._l2._prefix == "mlflow_oidc_auth:permissions:"
+        assert backend._l1._cache.maxsize == 64
+        assert backend._l1._cache.ttl == 5
+
+    def test_l1_bounds_are_capped_by_the_cache(self):
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "tiered"
+        mock_config.CACHE_REDIS_URL = "redis://localhost:6379/0"
+        mock_config.CACHE_CODEC = "compact"
+        mock_config.CACHE_KEY_PREFIX = "p:"
+        mock_config.CACHE_L1_MAX_SIZE = 1024
+        mock_config.CACHE_L1_TTL_SECONDS = 60
+        mock_config.CACHE_INVALIDATION_BUS = "local"
+
+        with (
+            patch("mlflow_oidc_auth.config.config", mock_config),
+            patch.dict("sys.modules", {"redis": self._mock_redis_module()}),
+        ):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            backend = get_cache_backend("workspace-denial", maxsize=100, ttl=10)
+
+        assert isinstance(backend._l1, BroadcastCacheBackend)
+        assert backend._l1._inner._cache.maxsize == 100
+        assert backend._l1._inner._cache.ttl == 10
+
+    def test_tiered_backend_raises_without_url(self):
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "tiered"
+        mock_config.CACHE_REDIS_URL = None
+
+        with patch("mlflow_oidc_auth.config.config", mock_config):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            with pytest.raises(ValueError, match="'tiered' but CACHE_REDIS_URL is not configured"):
+                get_cache_backend("test", maxsize=100, ttl=30)
+
+
+class TestInvalidationBusWiring:
+    """CACHE_INVALIDATION_BUS wraps local backends so invalidations reach other replicas."""
+
+    def test_local_backend_is_wrapped_when_bus_configured(self):
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "local"
+        mock_config.CACHE_INVALIDATION_BUS = "local"
+
+        with patch("mlflow_oidc_auth.config.config", mock_config):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            assert isinstance(get_cache_backend("permissions", maxsize=100, ttl=30), BroadcastCacheBackend)
+
+    def test_invalidation_reaches_other_backends_of_the_namespace(self):
+        """Two backends for one namespace stand in for two replicas."""
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "local"
+        mock_config.CACHE_INVALIDATION_BUS = "local"
+
+        with patch("mlflow_oidc_auth.config.config", mock_config):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            replica_a = get_cache_backend("permissions", maxsize=100, ttl=30)
+            replica_b = get_cache_backend("permissions", maxsize=100, ttl=30)
+            other_namespace = get_cache_backend("workspace", maxsize=100, ttl=30)
+
+        for cache in (replica_a, replica_b, other_namespace):
+            cache.set("alice:exp:1", "READ")
+
+        replica_a.clear()
+
+        assert replica_b.get("alice:exp:1") is None
+        assert other_namespace.get("alice:exp:1") == "READ"
+
+    def test_unknown_bus_raises_value_error(self):
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "local"
+        mock_config.CACHE_INVALIDATION_BUS = "kafka"
+
+        with patch("mlflow_oidc_auth.config.config", mock_config):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            with pytest.raises(ValueError, match="Unknown CACHE_INVALIDATION_BUS: 'kafka'"):
+                get_cache_backend("test", maxsize=100, ttl=30)
+
+    def test_redis_bus_raises_without_url(self):
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "local"
+        mock_config.CACHE_INVALIDATION_BUS = "redis"
+        mock_config.CACHE_INVALIDATION_REDIS_URL = None
+        mock_config.CACHE_REDIS_URL = None
+
+        with patch("mlflow_oidc_auth.config.config", mock_config):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            with pytest.raises(ValueError, match="CACHE_INVALIDATION_BUS is set to 'redis'"):
+                get_cache_backend("test", maxsize=100, ttl=30)
+
+    def test_redis_backend_is_not_wrapped(self):
+        """A shared Redis cache is already coherent across replicas."""
+        mock_config = MagicMock()
+        mock_config.CACHE_BACKEND = "redis"
+        mock_config.CACHE_REDIS_URL = "redis://localhost:6379/0"
+        mock_config.CACHE_CODEC = "compact"
+        mock_config.CACHE_KEY_PREFIX = "mlflow_oidc_auth:"
+        mock_config.CACHE_INVALIDATION_BUS = "local"
+
+        mock_redis_module = MagicMock()
+        mock_redis_module.Redis.from_url.return_value = MagicMock()
+        mock_redis_module.ConnectionError = ConnectionError
+
+        with (
+            patch("mlflow_oidc_auth.config.config", mock_config),
+            patch.dict("sys.modules", {"redis": mock_redis_module}),
+        ):
+            from mlflow_oidc_auth.cache.factory import get_cache_backend
+
+            assert not isinstance(get_cache_backend("permissions", maxsize=100, ttl=30), BroadcastCacheBackend)
@@ -0,0 +1,240 @@
+"""Tests for the cache invalidation buses and the broadcasting backend."""
+
+import queue
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mlflow_oidc_auth.cache.backend import CacheBackend
+from mlflow_oidc_auth.cache.broadcast_backend import BroadcastCacheBackend
+from mlflow_oidc_auth.cache.invalidation_bus import (
+    ALL_NAMESPACES,
+    CLEAR,
+    DELETE,
+    InvalidationBus,
+    InvalidationEvent,
+    LocalInvalidationBus,
+)
+from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+
+
+def _replica(bus, namespace="permissions"):
+    return BroadcastCacheBackend(LocalTTLCacheBackend(maxsize=100, ttl=60), namespace, bus)
+
+
+class TestInvalidationEvent:
+    def test_message_round_trip(self):
+        event = InvalidationEvent(namespace="workspace", op="delete_prefix", arg="alice:", origin="abc")
+        assert InvalidationEvent.from_message(event.to_message()) == event
+
+    def test_key_list_round_trip(self):
+        event = InvalidationEvent(namespace="permissions", op="delete_many", arg=("a", "b"), origin="abc")
+        assert InvalidationEvent.from_message(event.to_message()) == event
+
+
+class TestLocalInvalidationBus:
+    def test_implements_protocol(self):
+        assert isinstance(LocalInvalidationBus(), InvalidationBus)
+
+    def test_publish_reaches_every_subscriber(self):
+        bus = LocalInvalidationBus()
+        received = []
+        bus.subscribe(received.append)
+        bus.subscribe(received.append)
+
+        bus.publish(InvalidationEvent(namespace="ns", op=CLEAR))
+
+        assert len(received) == 2
+
+    def test_failing_subscriber_does_not_block_others(self):
+        bus = LocalInvalidationBus()
+        received = []
+        bus.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        bus.subscribe(received.append)
+
+        bus.publish(InvalidationEvent(namespace="ns", op=CLEAR))
+
+        assert len(received) == 1
+
+
+class TestBroadcastCacheBackend:
+    """Two backends on one LocalInvalidationBus stand in for two replicas."""
+
+    def test_implements_cache_backend_protocol(self):
+        assert isinstance(_replica(LocalInvalidationBus()), CacheBackend)
+
+    def test_reads_and_writes_stay_local(self):
+        bus = LocalInvalidationBus()
+        replica_a, replica_b = _replica(bus), _replica(bus)
+
+        replica_a.set("k", "v")
+
+        assert replica_a.get("k") == "v"
+        assert replica_b.get("k") is None
+
+    @pytest.mark.parametrize(
+        "invalidate, dropped, kept",
+        [
+            (lambda cache: cache.delete("alice:1"), ["alice:1"], ["alice:2", "bob:1"]),
+            (lambda cache: cache.delete_prefix("alice:"), ["alice:1", "alice:2"], ["bob:1"]),
+            (lambda cache: cache.clear(), ["alice:1", "alice:2", "bob:1"], []),
+        ],
+    )
+    def test_invalidation_reaches_other_replicas(self, invalidate, dropped, kept):
+        bus = LocalInvalidationBus()
+        replica_a, replica_b = _replica(bus), _replica(bus)
+        for cache in (replica_a, replica_b):
+            for key in ("alice:1", "alice:2", "bob:1"):
+                cache.set(key, "READ")
+
+        invalidate(replica_a)
+
+        for cache in (replica_a, replica_b):
+            assert all(cache.get(key) is None for key in dropped)
+            assert all(cache.get(key) == "READ" for key in kept)
+
+    def test_delete_many_reaches_other_replicas(self):
+        bus = LocalInvalidationBus()
+        replica_a, replica_b = _replica(bus), _replica(bus)
+        replica_b.set_many({"k1": 1, "k2": 2, "k3": 3})
+
+        replica_a.delete_many(["k1", "k2"])
+
+        assert replica_b.get_many(["k1", "k2", "k3"]) == {"k3": 3}
+
+    def test_other_namespaces_are_untouched(self):
+        bus = LocalInvalidationBus()
+        permissions, workspace = _replica(bus, "permissions"), _replica(bus, "workspace")
+        workspace.set("k", "v")
+
+        permissions.clear()
+
+        assert workspace.get("k") == "v"
+
+    def test_all_namespaces_clear(self):
+        """The reconnect event clears every namespace."""
+        bus = LocalInvalidationBus()
+        cache = _replica(bus, "workspace")
+        cache.set("k", "v")
+
+        bus.publish(InvalidationEvent(namespace=ALL_NAMESPACES, op=CLEAR))
+
+        assert cache.get("k") is None
+
+    def test_own_events_are_not_reapplied(self):
+        """A replica already applied its own invalidation; the echo must not touch new entries."""
+        bus = MagicMock()
+        cache = _replica(bus)
+        cache.delete("k")
+        event = bus.publish.call_args.args[0]
+        cache.set("k", "fresh")
+
+        cache._on_event(event)
+
+        assert cache.get("k") == "fresh"
+
+
+class _FakeRedis:
+    """Loops PUBLISH back to the subscription, as a real Redis server does."""
+
+    def __init__(self):
+        self.messages: "queue.Queue" = queue.Queue()
+        self.fail_next_poll = threading.Event()
+        self.pubsubs = []
+
+    def publish(self, channel, data):
+        self.messages.put({"type": "message", "channel": channel, "data": data})
+
+    def pubsub(self, ignore_subscribe_messages=True):
+        pubsub = MagicMock()
+        pubsub.get_message.side_effect = self._get_message
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    def _get_message(self, timeout):
+        if self.fail_next_poll.is_set():
+            self.fail_next_poll.clear()
+            raise ConnectionError("connection reset")
+        try:
+            return self.messages.get(timeout=min(timeout, 0.05))
+        except queue.Empty:
+            return None
+
+
+class TestRedisInvalidationBus:
+    @pytest.fixture
+    def fake_redis(self):
+        fake = _FakeRedis()
+        mock_redis_module = MagicMock()
+        mock_redis_module.Redis.from_url.return_value = fake
+        mock_redis_module.ConnectionError = ConnectionError
+        return mock_redis_module, fake
+
+    @pytest.fixture
+    def bus(self, fake_redis, monkeypatch):
+        import mlflow_oidc_auth.cache.invalidation_bus as ib
+
+        monkeypatch.setattr(ib, "_RECONNECT_BACKOFF_SECONDS", 0.01)
+        mock_redis_module, _ = fake_redis
+        with patch.dict("sys.modules", {"redis": mock_redis_module}):
+            bus = ib.RedisInvalidationBus(url="redis://localhost:6379/0", channel="test:invalidation")
+        yield bus
+        bus.close()
+
+    @staticmethod
+    def _wait_for(received, count):
+        for _ in range(200):
+            if len(received) >= count:
+                return
+            threading.Event().wait(0.01)
+        raise AssertionError(f"expected {count} event(s), got {received}")
+
+    def test_subscribes_at_construction(self, bus, fake_redis):
+        _, fake = fake_redis
+        fake.pubsubs[0].subscribe.assert_called_once_with("test:invalidation")
+
+    def test_published_events_are_delivered(self, bus):
+        received = []
+        bus.subscribe(received.append)
+
+        bus.publish(InvalidationEvent(namespace="permissions", op=DELETE, arg="k", origin="a"))
+
+        self._wait_for(received, 1)
+        assert received[0] == InvalidationEvent(namespace="permissions", op=DELETE, arg="k", origin="a")
+
+    def test_malformed_messages_are_skipped(self, bus, fake_redis):
+        _, fake = fake_redis
+        received = []
+        bus.subscribe(received.append)
+
+        fake.messages.put({"type": "message", "data": b"not json"})
+        bus.publish(InvalidationEvent(namespace="permissions", op=CLEAR))
+
+        self._wait_for(received, 1)
+        assert received[0].op == CLEAR
+
+    def test_reconnect_clears_every_namespace(self, bus, fake_redis):
+        """Events may have been missed while disconnected."""
+        _, fake = fake_redis
+        received = []
+        bus.subscribe(received.append)
+
+        fake.fail_next_poll.set()
+
+        self._wait_for(received, 1)
+        assert received[0] == InvalidationEvent(namespace=ALL_NAMESPACES, op=CLEAR)
+        assert len(fake.pubsubs) == 2
+
+    def test_publish_failure_is_not_raised(self, bus, fake_redis):
+        _, fake = fake_redis
+        fake.publish = MagicMock(side_effect=ConnectionError("down"))
+
+        bus.publish(InvalidationEvent(namespace="permissions", op=CLEAR))
+
+    def test_requires_redis_package(self):
+        from mlflow_oidc_auth.cache.invalidation_bus import RedisInvalidationBus
+
+        with patch.dict("sys.modules", {"redis": None}):
+            with pytest.raises(ImportError, match="redis"):
+                RedisInvalidationBus(url="redis://localhost:6379/0", channel="c")
@@ -53,6 +53,17 @@ class TestLocalTTLCacheBackend:
         backend.delete("key1")
         assert backend.get("key1") is None
 
+    def test_get_many_returns_only_hits(self):
+        backend = LocalTTLCacheBackend(maxsize=10, ttl=60)
+        backend.set_many({"a": 1, "b": 2})
+        assert backend.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+    def test_delete_many(self):
+        backend = LocalTTLCacheBackend(maxsize=10, ttl=60)
+        backend.set_many({"a": 1, "b": 2, "c": 3})
+        backend.delete_many(["a", "b", "missing"])
+        assert backend.get_many(["a", "b", "c"]) == {"c": 3}
+
     def test_delete_noop_for_missing_key(self):
         """delete() is a no-op when the key does not exist."""
         backend = LocalTTLCacheBackend(maxsize=10, ttl=60)
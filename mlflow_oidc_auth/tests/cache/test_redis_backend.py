@@ -112,6 +112,42 @@ class TestRedisCacheBackend:
         backend.delete("key1")
         mock_client.delete.assert_called_once_with("test:key1")
 
+    def test_get_many_uses_a_single_mget(self, backend, mock_redis):
+        """get_many() reads every key with one MGET and drops the misses."""
+        _, mock_client = mock_redis
+        mock_client.mget.return_value = [pickle.dumps("a"), None, pickle.dumps("c")]
+
+        assert backend.get_many(["k1", "k2", "k3"]) == {"k1": "a", "k3": "c"}
+        mock_client.mget.assert_called_once_with(["test:k1", "test:k2", "test:k3"])
+        mock_client.get.assert_not_called()
+
+    def test_get_many_empty(self, backend, mock_redis):
+        _, mock_client = mock_redis
+
+        assert backend.get_many([]) == {}
+        mock_client.mget.assert_not_called()
+
+    def test_set_many_pipelines_setex(self, backend, mock_redis):
+        """set_many() sends every SETEX in one non-transactional pipeline."""
+        _, mock_client = mock_redis
+        pipe = mock_client.pipeline.return_value
+
+        backend.set_many({"k1": "a", "k2": "b"})
+
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.setex.call_count == 2
+        pipe.setex.assert_any_call("test:k1", 30, pickle.dumps("a", protocol=pickle.HIGHEST_PROTOCOL))
+        pipe.execute.assert_called_once()
+        mock_client.setex.assert_not_called()
+
+    def test_delete_many_uses_one_delete(self, backend, mock_redis):
+        _, mock_client = mock_redis
+
+        backend.delete_many(["k1", "k2"])
+        backend.delete_many([])
+
+        mock_client.delete.assert_called_once_with("test:k1", "test:k2")
+
     def test_clear_uses_scan(self, backend, mock_redis):
         """clear() uses SCAN to find and delete all prefixed keys."""
         _, mock_client = mock_redis
@@ -160,6 +196,33 @@ class TestRedisCacheBackend:
         backend.delete("foo:bar:baz")
         mock_client.delete.assert_called_once_with("test:foo:bar:baz")
 
+    def test_values_go_through_the_codec(self, mock_redis):
+        mock_redis_module, mock_client = mock_redis
+        codec = MagicMock()
+        codec.encode.return_value = b"encoded"
+        codec.decode.return_value = "decoded"
+
+        with patch.dict("sys.modules", {"redis": mock_redis_module}):
+            from mlflow_oidc_auth.cache.redis_backend import RedisCacheBackend
+
+            backend = RedisCacheBackend(url="redis://localhost:6379/0", prefix="t:", ttl=30, codec=codec)
+
+        backend.set("k", "value")
+        mock_client.setex.assert_called_once_with("t:k", 30, b"encoded")
+        codec.encode.assert_called_once_with("value")
+
+        mock_client.get.return_value = b"encoded"
+        assert backend.get("k") == "decoded"
+
+    def test_undecodable_entry_is_a_miss(self, backend, mock_redis):
+        """Bytes written by another release must not raise on the request path."""
+        _, mock_client = mock_redis
+        mock_client.get.return_value = b"\x80\x05garbage"
+        mock_client.mget.return_value = [b"\x80\x05garbage", pickle.dumps("ok")]
+
+        assert backend.get("k") is None
+        assert backend.get_many(["bad", "good"]) == {"good": "ok"}
+
 
 class TestGlobEscaping:
     """SCAN MATCH is a glob pattern, so a username must not act as a wildcard (#253).
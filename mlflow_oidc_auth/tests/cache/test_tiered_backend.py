@@ -0,0 +1,91 @@
+"""Tests for the tiered (L1 in-process + L2 shared) cache backend."""
+
+from unittest.mock import MagicMock
+
+from mlflow_oidc_auth.cache.backend import CacheBackend
+from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+from mlflow_oidc_auth.cache.tiered_backend import TieredCacheBackend
+
+
+def _tiered(l2=None):
+    """A local backend stands in for Redis as the shared L2."""
+    return TieredCacheBackend(l1=LocalTTLCacheBackend(maxsize=10, ttl=60), l2=l2 or LocalTTLCacheBackend(maxsize=100, ttl=60))
+
+
+class TestTieredCacheBackend:
+    def test_implements_cache_backend_protocol(self):
+        assert isinstance(_tiered(), CacheBackend)
+
+    def test_hot_key_is_served_from_l1(self):
+        l2 = MagicMock(wraps=LocalTTLCacheBackend(maxsize=100, ttl=60))
+        cache = _tiered(l2)
+        cache.set("k", "v")
+
+        for _ in range(5):
+            assert cache.get("k") == "v"
+
+        l2.get.assert_not_called()
+        assert cache.stats() == {"l1_hits": 5, "l1_misses": 0, "l2_hits": 0, "l2_misses": 0}
+
+    def test_cold_key_is_read_from_l2_and_promoted(self):
+        """An entry written by another replica is served from L2 once, then from L1."""
+        shared = LocalTTLCacheBackend(maxsize=100, ttl=60)
+        replica_a, replica_b = _tiered(shared), _tiered(shared)
+        replica_a.set("k", "v")
+
+        assert replica_b.get("k") == "v"
+        assert replica_b.get("k") == "v"
+
+        assert replica_b.stats() == {"l1_hits": 1, "l1_misses": 1, "l2_hits": 1, "l2_misses": 0}
+
+    def test_miss_in_both_tiers(self):
+        cache = _tiered()
+
+        assert cache.get("missing") is None
+        assert cache.stats() == {"l1_hits": 0, "l1_misses": 1, "l2_hits": 0, "l2_misses": 1}
+
+    def test_invalidation_goes_through_both_tiers(self):
+        shared = LocalTTLCacheBackend(maxsize=100, ttl=60)
+        cache = _tiered(shared)
+        for key in ("alice:1", "alice:2", "bob:1"):
+            cache.set(key, "READ")
+
+        cache.delete("bob:1")
+        assert cache.get("bob:1") is None and shared.get("bob:1") is None
+
+        cache.delete_prefix("alice:")
+        assert cache.get("alice:1") is None and shared.get("alice:2") is None
+
+        cache.set("k", "v")
+        cache.clear()
+        assert cache.get("k") is None and shared.get("k") is None
+
+    def test_get_many_reads_l2_once_for_l1_misses(self):
+        shared = LocalTTLCacheBackend(maxsize=100, ttl=60)
+        shared.set_many({"cold": "c"})
+        l2 = MagicMock(wraps=shared)
+        cache = _tiered(l2)
+        cache.set("hot", "h")
+
+        assert cache.get_many(["hot", "cold", "missing"]) == {"hot": "h", "cold": "c"}
+        l2.get_many.assert_called_once_with(["cold", "missing"])
+        assert cache.stats() == {"l1_hits": 1, "l1_misses": 2, "l2_hits": 1, "l2_misses": 1}
+        # The L2 hit was promoted.
+        assert cache.get_many(["cold"]) == {"cold": "c"}
+        assert l2.get_many.call_count == 1
+
+    def test_batched_writes_and_deletes_reach_both_tiers(self):
+        shared = LocalTTLCacheBackend(maxsize=100, ttl=60)
+        cache = _tiered(shared)
+
+        cache.set_many({"a": 1, "b": 2})
+        assert shared.get_many(["a", "b"]) == {"a": 1, "b": 2}
+
+        cache.delete_many(["a"])
+        assert cache.get("a") is None and shared.get("a") is None
+
+    def test_reset_stats(self):
+        cache = _tiered()
+        cache.get("k")
+        cache.reset_stats()
+        assert cache.stats() == {"l1_hits": 0, "l1_misses": 0, "l2_hits": 0, "l2_misses": 0}
@@ -3,6 +3,7 @@
 import os
 
 import dotenv
+import pytest
 
 # ``mlflow_oidc_auth.config`` calls ``load_dotenv()`` at import time, which walks up
 # from the package directory and picks up whatever ".env" a developer keeps at the
@@ -23,3 +24,100 @@ dotenv.load_dotenv = lambda *args, **kwargs: False
 # that fall back to the default './mlruns' store; they are testing our authorization
 # layer, not MLflow's storage policy, so opt in for the suite.
 os.environ.setdefault("MLFLOW_ALLOW_FILE_STORE", "true")
+
+
+@pytest.fixture(autouse=True)
+def _clear_verified_credentials():
+    """Verified Basic-auth credentials are cached per process, keyed by username and password.
+
+    Many tests reuse the same username and secret against a fresh database, so an entry
+    left by one test would authenticate a user another test expects to be rejected.
+    """
+    from mlflow_oidc_auth.utils.credential_cache import clear_credential_cache
+
+    clear_credential_cache()
+    yield
+    clear_credential_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_validated_tokens():
+    """Validated bearer tokens are cached per process, keyed by the token.
+
+    Tests reuse token strings with different keys, providers and mocked decoders, so a
+    validation cached by one test would skip the checks another test exercises.
+    """
+    from mlflow_oidc_auth.auth import clear_validated_tokens
+
+    clear_validated_tokens()
+    yield
+    clear_validated_tokens()
+
+
+@pytest.fixture(autouse=True)
+def _clear_experiment_resolver_cache():
+    """Run and trace ids resolve to experiment ids through a long-lived process cache.
+
+    Tests reuse ids such as ``run123`` against mocked stores that place them in different
+    experiments, so a resolution cached by one test would decide another test's check.
+    """
+    from mlflow_oidc_auth.utils.experiment_resolver import clear_experiment_resolver_cache
+
+    clear_experiment_resolver_cache()
+    yield
+    clear_experiment_resolver_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_experiment_metadata_cache():
+    """Experiment names and workspaces are cached per process, keyed by experiment id.
+
+    Tests mock tracking stores that give the same ids different names and workspaces.
+    """
+    from mlflow_oidc_auth.utils.experiment_metadata import clear_experiment_metadata_cache
+
+    clear_experiment_metadata_cache()
+    yield
+    clear_experiment_metadata_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_resource_index_cache():
+    """Per-user resource indexes are process-global and keyed by username only."""
+    from mlflow_oidc_auth.utils.resource_index import clear_resource_index_cache
+
+    clear_resource_index_cache()
+    yield
+    clear_resource_index_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_gateway_capability_cache():
+    """Per-user gateway capability maps are process-global and keyed by username only."""
+    from mlflow_oidc_auth.utils.gateway_capabilities import clear_gateway_capability_cache
+
+    clear_gateway_capability_cache()
+    yield
+    clear_gateway_capability_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_discovery_cache():
+    """Discovery documents are cached per process, keyed by URL.
+
+    Tests reuse discovery URLs with different mocked documents and count the fetches.
+    """
+    from mlflow_oidc_auth.discovery import clear_discovery_cache
+
+    clear_discovery_cache()
+    yield
+    clear_discovery_cache()
+
+
+@pytest.fixture(autouse=True)
+def _stop_audit_pipeline():
+    """A test that runs the app lifespan starts the audit writer; later tests expect synchronous writes."""
+    yield
+    from mlflow_oidc_auth import audit_pipeline
+
+    audit_pipeline.shutdown(timeout=5)
@@ -0,0 +1,85 @@
+"""Permission lookup index migration: round trip, and agreement with the ORM models.
+
+Runs against SQLite, and PostgreSQL when ``MLFLOW_OIDC_TEST_POSTGRES_URI`` is set; see
+``test_phase0_migration.py``. The query plans these indexes exist for are checked in
+``tests/perf/test_query_plans.py``.
+"""
+
+import importlib
+import os
+
+import pytest
+from alembic.command import downgrade, upgrade
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+
+import mlflow_oidc_auth.db.models  # noqa: F401 - registers every table on Base.metadata
+from mlflow_oidc_auth.db.models._base import Base
+from mlflow_oidc_auth.db.utils import _get_alembic_config
+
+PREVIOUS_REVISION = "9c0d1e2f3456"
+INDEX_REVISION = "a1b2c3d4e5f6"
+
+POSTGRES_URI = os.environ.get("MLFLOW_OIDC_TEST_POSTGRES_URI")
+
+migration = importlib.import_module("mlflow_oidc_auth.db.migrations.versions.a1b2c3d4e5f6_add_permission_lookup_indexes")
+
+
+@pytest.fixture(params=["sqlite", "postgres"])
+def engine(request, tmp_path):
+    if request.param == "sqlite":
+        eng = create_engine(f"sqlite:///{tmp_path / 'auth.db'}")
+    elif not POSTGRES_URI:
+        pytest.skip("MLFLOW_OIDC_TEST_POSTGRES_URI is not set")
+    else:
+        eng = create_engine(POSTGRES_URI)
+        with eng.begin() as conn:
+            conn.execute(text("DROP SCHEMA public CASCADE"))
+            conn.execute(text("CREATE SCHEMA public"))
+    yield eng
+    eng.dispose()
+
+
+def _run(engine, command, revision: str) -> None:
+    cfg = _get_alembic_config(engine.url.render_as_string(hide_password=False))
+    with engine.begin() as conn:
+        cfg.attributes["connection"] = conn
+        command(cfg, revision)
+
+
+def _index_names(engine) -> set:
+    inspector = inspect(engine)
+    return {index["name"] for table, _ in migration.INDEXES for index in inspector.get_indexes(table)}
+
+
+def _expected() -> set:
+    return {migration._index_name(table, columns) for table, columns in migration.INDEXES}
+
+
+def test_follows_the_previous_head(tmp_path):
+    cfg = _get_alembic_config(f"sqlite:///{tmp_path / 'auth.db'}")
+
+    assert ScriptDirectory.from_config(cfg).get_revision(INDEX_REVISION).down_revision == PREVIOUS_REVISION
+
+
+def test_upgrade_creates_and_downgrade_drops_the_indexes(engine):
+    _run(engine, upgrade, INDEX_REVISION)
+    assert _expected() <= _index_names(engine)
+
+    _run(engine, downgrade, PREVIOUS_REVISION)
+    assert not (_expected() & _index_names(engine))
+
+    _run(engine, upgrade, INDEX_REVISION)
+    assert _expected() <= _index_names(engine)
+
+
+def test_models_declare_the_same_indexes():
+    """A fresh ``create_all`` and a migrated database must index the same columns."""
+    declared = {
+        (table.name, tuple(column.name for column in index.columns))
+        for table in Base.metadata.tables.values()
+        for index in table.indexes
+        if index.name in _expected()
+    }
+
+    assert declared == {(table, tuple(columns)) for table, columns in migration.INDEXES}
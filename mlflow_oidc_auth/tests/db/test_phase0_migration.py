@@ -108,7 +108,7 @@ class TestRevisionChain:
         cfg = _get_alembic_config(_sqlite_uri(tmp_path))
         heads = ScriptDirectory.from_config(cfg).get_heads()
 
-        assert heads == [PHASE0_REVISION], f"expected a single head, got {heads}"
+        assert len(heads) == 1, f"expected a single head, got {heads}"
 
     def test_phase0_follows_the_previous_head(self, tmp_path):
         cfg = _get_alembic_config(_sqlite_uri(tmp_path))
@@ -216,7 +216,7 @@ class TestRoundTrip:
         """Migrations must be reversible on both backends."""
         _upgrade(engine, "head")
 
-        _downgrade(engine, "-1")
+        _downgrade(engine, PREVIOUS_REVISION)
 
         inspector = inspect(engine)
         tables = set(inspector.get_table_names())
@@ -236,7 +236,7 @@ class TestRoundTrip:
         _seed_legacy_data(engine)
         _upgrade(engine, "head")
 
-        _downgrade(engine, "-1")
+        _downgrade(engine, PREVIOUS_REVISION)
         _upgrade(engine, "head")
 
         with engine.connect() as conn:
@@ -0,0 +1,137 @@
+"""Tests for read-replica routing of auth-database sessions (db/routing.py)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+import sqlalchemy
+from mlflow.exceptions import MlflowException
+
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.db.routing import RoutingSessionMaker, primary_reads
+from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+
+@pytest.fixture
+def replica(tmp_path):
+    """A second database with the auth schema, standing in for a replica."""
+    s = SqlAlchemyStore()
+    s.init_db(f"sqlite:///{tmp_path / 'replica.db'}")
+    yield s
+    s.engine.dispose()
+
+
+@pytest.fixture
+def store(tmp_path, replica, monkeypatch):
+    monkeypatch.setattr(config, "DB_REPLICA_READ_YOUR_WRITES_SECONDS", 0)
+    monkeypatch.setattr(config, "DB_REPLICA_RETRY_SECONDS", 30)
+    s = SqlAlchemyStore()
+    s.init_db(f"sqlite:///{tmp_path / 'primary.db'}", [replica.db_uri])
+    yield s
+    s.replica_router.dispose()
+    s.engine.dispose()
+
+
+def _expires():
+    return datetime.utcnow() + timedelta(hours=1)
+
+
+class TestRouting:
+    def test_reads_go_to_the_replica(self, store, replica):
+        replica.create_user("only-on-replica", "pw", "Replica")
+
+        assert store.has_user("only-on-replica") is True
+
+    def test_writes_go_to_the_primary(self, store, replica):
+        store.create_user("alice", "pw", "Alice")
+
+        assert replica.has_user("alice") is False
+        with primary_reads():
+            assert store.has_user("alice") is True
+
+    def test_reads_stay_on_the_primary_after_a_write(self, store):
+        store.replica_router._read_your_writes_seconds = 60
+
+        store.create_user("alice", "pw", "Alice")
+
+        assert store.has_user("alice") is True
+
+    def test_without_replicas_the_managed_session_maker_is_unchanged(self, tmp_path):
+        s = SqlAlchemyStore()
+        s.init_db(f"sqlite:///{tmp_path / 'auth.db'}")
+
+        assert s.replica_router is None
+        assert not isinstance(s.ManagedSessionMaker, RoutingSessionMaker)
+        s.engine.dispose()
+
+
+class TestPrimaryFallback:
+    def test_a_session_missing_on_the_replica_is_resolved_on_the_primary(self, store):
+        store.create_user("alice", "pw", "Alice")
+        session_id = store.create_auth_session("alice", _expires())
+
+        resolved = store.resolve_auth_session(session_id)
+
+        assert resolved is not None and resolved.username == "alice"
+
+    def test_a_user_missing_on_the_replica_is_read_from_the_primary(self, store):
+        store.create_user("alice", "pw", "Alice")
+
+        assert store.get_user("alice").username == "alice"
+        assert store.get_user_profile("alice").username == "alice"
+
+    def test_an_unknown_user_still_raises(self, store):
+        with pytest.raises(MlflowException):
+            store.get_user("nobody")
+
+    def test_workspace_grants_find_a_user_not_yet_on_the_replica(self, store):
+        store.create_user("alice", "pw", "Alice")
+
+        store.create_workspace_permission("default", "alice", "READ")
+
+        with primary_reads():
+            assert store.get_workspace_permission("default", "alice").permission == "READ"
+
+
+class TestFailover:
+    def test_an_unreachable_replica_fails_over_to_the_primary(self, tmp_path, replica):
+        down = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'missing-dir' / 'replica.db'}")
+        router = RoutingSessionMaker(replica.ManagedSessionMaker, [down], replica.db_type, read_your_writes_seconds=0, retry_seconds=30)
+
+        with router() as session:
+            assert session.execute(sqlalchemy.text("SELECT 1")).scalar() == 1
+
+        assert router.replica_status()[0][1] is False
+
+    def test_a_replica_that_is_down_is_skipped_until_the_retry_interval(self, tmp_path, replica, monkeypatch):
+        down = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'missing-dir' / 'replica.db'}")
+        router = RoutingSessionMaker(replica.ManagedSessionMaker, [down], replica.db_type, read_your_writes_seconds=0, retry_seconds=30)
+        connects = []
+
+        def refuse():
+            connects.append(1)
+            raise sqlalchemy.exc.OperationalError("SELECT 1", {}, Exception("replica down"))
+
+        monkeypatch.setattr(down, "connect", refuse)
+
+        for _ in range(3):
+            with router():
+                pass
+        assert len(connects) == 1
+
+        router._replicas[0].down_until = 0.0
+        with router():
+            pass
+        assert len(connects) == 2
+
+    def test_healthy_replicas_share_reads(self, tmp_path, replica):
+        engines = [sqlalchemy.create_engine(f"sqlite:///{tmp_path / f'r{i}.db'}") for i in range(2)]
+        router = RoutingSessionMaker(replica.ManagedSessionMaker, engines, replica.db_type, read_your_writes_seconds=0, retry_seconds=30)
+        used = []
+        for engine in engines:
+            sqlalchemy.event.listen(engine, "checkout", lambda *args, engine=engine: used.append(engine))
+
+        for _ in range(4):
+            with router():
+                pass
+
+        assert used.count(engines[0]) == used.count(engines[1]) == 2
@@ -23,6 +23,8 @@ from mlflow_oidc_auth.hooks.after_request import (
     _delete_gateway_secret_permissions_cascade,
     _delete_gateway_model_definition_permissions_cascade,
     _rename_gateway_endpoint_permission,
+    _prefetch_can_read,
+    _cached_can_read_experiment,
 )
 
 app = Flask(__name__)
@@ -36,6 +38,13 @@ class _FakePagedList(list):
         self.token = token
 
 
+@pytest.fixture(autouse=True)
+def _no_batch_prefetch():
+    """These tests mock the per-row can_read_* checks; keep the batched prefetch out of the way."""
+    with patch("mlflow_oidc_auth.hooks.after_request._prefetch_can_read"):
+        yield
+
+
 @pytest.fixture
 def mock_response():
     response = MagicMock(spec=Response)
@@ -889,8 +898,10 @@ def test_set_can_manage_gateway_endpoint_permission(mock_response, mock_store, m
             "mlflow_oidc_auth.hooks.after_request.CreateGatewayEndpoint.Response",
             return_value=mock_response_message,
         ):
-            _set_can_manage_gateway_endpoint_permission(mock_response)
+            with patch("mlflow_oidc_auth.hooks.after_request.invalidate_gateway_capabilities") as mock_invalidate:
+                _set_can_manage_gateway_endpoint_permission(mock_response)
             mock_store.create_gateway_endpoint_permission.assert_called_once_with("my-endpoint", "test_user", "MANAGE")
+            mock_invalidate.assert_called_once_with()
 
 
 def test_set_can_manage_gateway_secret_permission(mock_response, mock_store, mock_bridge):
@@ -1131,8 +1142,10 @@ def test_delete_gateway_endpoint_permissions_cascade(mock_response, mock_store):
         from flask import g
 
         g._deleting_gateway_endpoint_name = "my-endpoint"
-        _delete_gateway_endpoint_permissions_cascade(mock_response)
+        with patch("mlflow_oidc_auth.hooks.after_request.invalidate_gateway_capabilities") as mock_invalidate:
+            _delete_gateway_endpoint_permissions_cascade(mock_response)
         mock_store.wipe_gateway_endpoint_permissions.assert_called_once_with("my-endpoint")
+        mock_invalidate.assert_called_once_with()
 
 
 def test_delete_gateway_endpoint_permissions_cascade_no_name(mock_response, mock_store):
@@ -1479,3 +1492,37 @@ def test_filter_search_model_versions_no_pagination(mock_response, mock_bridge):
             ):
                 _filter_search_model_versions(mock_response)
                 assert mock_response_message.next_page_token == ""
+
+
+def test_prefetch_can_read_fills_request_cache():
+    """The per-row helpers find the batched decisions and never resolve rows themselves."""
+    readable = MagicMock(permission=MagicMock(can_read=True))
+    hidden = MagicMock(permission=MagicMock(can_read=False))
+    with (
+        app.test_request_context(),
+        patch(
+            "mlflow_oidc_auth.hooks.after_request.resolve_permissions_many",
+            return_value={"1": readable, "2": hidden},
+        ) as mock_many,
+        patch("mlflow_oidc_auth.hooks.after_request.can_read_experiment") as mock_can_read,
+    ):
+        _prefetch_can_read("exp", "experiment", ["1", "2", "1"], "test_user")
+
+        assert _cached_can_read_experiment("1", "test_user") is True
+        assert _cached_can_read_experiment("2", "test_user") is False
+        mock_many.assert_called_once_with("experiment", ["1", "2"], "test_user")
+        mock_can_read.assert_not_called()
+
+
+def test_prefetch_can_read_skips_memoized_ids():
+    with (
+        app.test_request_context(),
+        patch("mlflow_oidc_auth.hooks.after_request.resolve_permissions_many", return_value={}) as mock_many,
+        patch("mlflow_oidc_auth.hooks.after_request.can_read_experiment", return_value=True),
+    ):
+        _cached_can_read_experiment("1", "test_user")
+
+        _prefetch_can_read("exp", "experiment", ["1"], "test_user")
+        _prefetch_can_read("exp", "experiment", ["1", "2"], "test_user")
+
+        mock_many.assert_called_once_with("experiment", ["2"], "test_user")
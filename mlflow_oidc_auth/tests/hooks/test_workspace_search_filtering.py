@@ -29,6 +29,13 @@ class _FakePagedList(list):
         return list.__eq__(self, other)
 
 
+@pytest.fixture(autouse=True)
+def _no_batch_prefetch():
+    """These tests mock the per-row can_read_* checks; keep the batched prefetch out of the way."""
+    with patch("mlflow_oidc_auth.hooks.after_request._prefetch_can_read"):
+        yield
+
+
 # ---------------------------------------------------------------------------
 # _can_access_workspace helper tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,377 @@
+"""Trash garbage collection as a batched, resumable background job.
+
+Runs against a real MLflow SQLite tracking store, because the batched hard delete is derived
+from MLflow's own ``SqlRun`` mapping and only a real store can show it does what
+``_hard_delete_run`` would.
+"""
+
+import os
+import time
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mlflow.entities.lifecycle_stage import LifecycleStage
+from mlflow.store.tracking.dbmodels.models import SqlRun, SqlTag
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore as TrackingStore
+from mlflow.utils.time import get_current_time_millis
+
+from mlflow_oidc_auth.jobs import trash_gc
+from mlflow_oidc_auth.jobs.trash_gc import TrashGcWorker
+from mlflow_oidc_auth.repository.trash_gc_job import COMPLETED, EXPERIMENT, FAILED, QUEUED, RUN
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+class Page(list):
+    def __init__(self, items, token=None):
+        super().__init__(items)
+        self.token = token
+
+
+@pytest.fixture
+def auth_store(tmp_path):
+    from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+    s = SqlAlchemyStore()
+    s.init_db(f"sqlite:///{tmp_path / 'auth.db'}")
+    yield s
+    s.engine.dispose()
+
+
+@pytest.fixture
+def repo(auth_store):
+    return auth_store.trash_gc_job_repo
+
+
+@pytest.fixture
+def tracking(tmp_path):
+    s = TrackingStore(f"sqlite:///{tmp_path / 'mlflow.db'}", str(tmp_path / "artifacts"))
+    yield s
+    s.engine.dispose()
+
+
+@pytest.fixture
+def worker(repo, tracking):
+    def _make(**kwargs):
+        kwargs.setdefault("batch_size", 10)
+        kwargs.setdefault("parallelism", 1)
+        kwargs.setdefault("lease_seconds", 300)
+        return TrashGcWorker(repo, tracking_store=tracking, **kwargs)
+
+    return _make
+
+
+def _trash_runs(tracking, count, *, experiment_id=None, deleted_time=0, tmp_path=None):
+    """Insert ``count`` runs already in the trash, in one statement, and return their ids."""
+    experiment_id = experiment_id or tracking.create_experiment(f"exp-{uuid.uuid4().hex}")
+    rows = [
+        {
+            "run_uuid": uuid.uuid4().hex,
+            "name": f"run-{i}",
+            "experiment_id": int(experiment_id),
+            "lifecycle_stage": LifecycleStage.DELETED,
+            "deleted_time": deleted_time,
+            "artifact_uri": str(tmp_path / "artifacts" / f"missing-{i}") if tmp_path else None,
+            "status": "FINISHED",
+            "start_time": 0,
+            "source_type": "LOCAL",
+        }
+        for i in range(count)
+    ]
+    with tracking.ManagedSessionMaker() as session:
+        session.execute(SqlRun.__table__.insert(), rows)
+    return [row["run_uuid"] for row in rows]
+
+
+def _remaining_runs(tracking, run_ids):
+    with tracking.ManagedSessionMaker() as session:
+        return session.query(SqlRun.run_uuid).filter(SqlRun.run_uuid.in_(run_ids)).count()
+
+
+class TestDeletingRuns:
+    def test_every_trashed_run_is_deleted_in_batches(self, repo, tracking, worker, tmp_path):
+        run_ids = _trash_runs(tracking, 25, tmp_path=tmp_path)
+        job_id = repo.create("admin")
+        batches = []
+        original = trash_gc._bulk_hard_delete_runs
+
+        with patch.object(trash_gc, "_bulk_hard_delete_runs", side_effect=lambda s, ids: (batches.append(len(ids)), original(s, ids))):
+            assert worker().run_once() is True
+
+        job = repo.get(job_id)
+        assert job.status == COMPLETED
+        assert (job.total_runs, job.deleted_runs, job.failed_runs) == (25, 25, 0)
+        assert batches == [10, 10, 5]
+        assert _remaining_runs(tracking, run_ids) == 0
+
+    def test_batch_delete_matches_hard_delete_run(self, repo, tracking, worker):
+        """Tags, params and metrics go with the run, exactly as ``_hard_delete_run`` takes them."""
+        experiment_id = tracking.create_experiment("with-children")
+        run = tracking.create_run(experiment_id, "admin", 0, [], "child-run")
+        tracking.set_tag(run.info.run_id, SimpleNamespace(key="k", value="v"))
+        tracking.log_param(run.info.run_id, SimpleNamespace(key="p", value="1"))
+        tracking.delete_run(run.info.run_id)
+        repo.create("admin", run_ids=[run.info.run_id])
+
+        worker().run_once()
+
+        with tracking.ManagedSessionMaker() as session:
+            assert session.query(SqlTag).filter(SqlTag.run_uuid == run.info.run_id).count() == 0
+        assert _remaining_runs(tracking, [run.info.run_id]) == 0
+
+    def test_artifacts_are_deleted_in_parallel(self, repo, tracking, worker):
+        experiment_id = tracking.create_experiment("with-artifacts")
+        runs = [tracking.create_run(experiment_id, "admin", 0, [], f"r{i}") for i in range(4)]
+        for run in runs:
+            artifact_dir = run.info.artifact_uri
+            os.makedirs(artifact_dir, exist_ok=True)
+            with open(os.path.join(artifact_dir, "model.txt"), "w") as f:
+                f.write("weights")
+            tracking.delete_run(run.info.run_id)
+        repo.create("admin")
+
+        worker(parallelism=4).run_once()
+
+        assert not any(os.path.exists(run.info.artifact_uri) for run in runs)
+
+    def test_runs_that_do_not_qualify_are_reported_not_deleted(self, repo, tracking, worker, tmp_path):
+        experiment_id = tracking.create_experiment("mixed")
+        active = tracking.create_run(experiment_id, "admin", 0, [], "active").info.run_id
+        (recent,) = _trash_runs(tracking, 1, experiment_id=experiment_id, deleted_time=get_current_time_millis(), tmp_path=tmp_path)
+        (old,) = _trash_runs(tracking, 1, experiment_id=experiment_id, deleted_time=0, tmp_path=tmp_path)
+        job_id = repo.create("admin", older_than="1d", older_than_ms=DAY_MS, run_ids=[active, recent, old, "no-such-run"])
+
+        worker().run_once()
+
+        job = repo.get(job_id)
+        assert (job.status, job.deleted_runs, job.failed_runs) == (COMPLETED, 1, 3)
+        assert {f.resource_id: f.error for f in repo.list_failures(job_id)} == {
+            active: "Run is not in deleted lifecycle stage",
+            recent: "Run is not older than 1d",
+            "no-such-run": "Run not found",
+        }
+        assert _remaining_runs(tracking, [active, recent, old]) == 2
+
+    def test_a_failing_batch_is_retried_run_by_run(self, repo, tracking, worker, tmp_path):
+        run_ids = _trash_runs(tracking, 3, tmp_path=tmp_path)
+        job_id = repo.create("admin")
+
+        with patch.object(trash_gc, "_bulk_hard_delete_runs", side_effect=RuntimeError("lock timeout")):
+            worker().run_once()
+
+        assert repo.get(job_id).deleted_runs == 3
+        assert _remaining_runs(tracking, run_ids) == 0
+
+    def test_runs_are_deleted_one_at_a_time_without_a_bulk_plan(self, repo, tracking, worker, tmp_path):
+        run_ids = _trash_runs(tracking, 3, tmp_path=tmp_path)
+        job_id = repo.create("admin")
+
+        with patch.object(trash_gc, "_run_delete_plan", return_value=None), patch.object(tracking, "_hard_delete_run", wraps=tracking._hard_delete_run) as one:
+            worker().run_once()
+
+        assert repo.get(job_id).deleted_runs == 3
+        assert one.call_count == 3
+        assert _remaining_runs(tracking, run_ids) == 0
+
+
+class TestDeletingExperiments:
+    def test_deleted_experiments_are_removed_with_their_runs(self, repo, tracking, worker):
+        experiment_id = tracking.create_experiment("doomed")
+        run_id = tracking.create_run(experiment_id, "admin", 0, [], "r").info.run_id
+        tracking.delete_experiment(experiment_id)
+        job_id = repo.create("admin")
+
+        with patch.object(trash_gc, "invalidate_experiment_metadata") as invalidate:
+            worker().run_once()
+
+        job = repo.get(job_id)
+        assert (job.total_experiments, job.deleted_experiments) == (1, 1)
+        assert (job.total_runs, job.deleted_runs) == (1, 1)
+        assert _remaining_runs(tracking, [run_id]) == 0
+        invalidate.assert_called_once_with(experiment_id)
+
+
+class TestResuming:
+    def test_an_interrupted_job_resumes_where_it_stopped(self, repo, tracking, worker, tmp_path):
+        run_ids = _trash_runs(tracking, 35, tmp_path=tmp_path)
+        job_id = repo.create("admin")
+        first = worker()
+        record = repo.record_batch
+
+        def stop_after_two(*args, **kwargs):
+            recorded = record(*args, **kwargs)
+            if repo.get(job_id).deleted_runs >= 20:
+                first._stop.set()
+            return recorded
+
+        with patch.object(repo, "record_batch", side_effect=stop_after_two):
+            first.run_once()
+
+        stopped = repo.get(job_id)
+        assert (stopped.status, stopped.deleted_runs) == (QUEUED, 20)
+        assert _remaining_runs(tracking, run_ids) == 15
+
+        worker().run_once()
+
+        resumed = repo.get(job_id)
+        assert (resumed.status, resumed.deleted_runs, resumed.failed_runs) == (COMPLETED, 35, 0)
+        assert _remaining_runs(tracking, run_ids) == 0
+
+    def test_a_batch_deleted_but_not_checkpointed_is_not_reported_as_failed(self, repo, tracking, worker, tmp_path):
+        """A worker that died between deleting a batch and recording it."""
+        run_ids = _trash_runs(tracking, 15, tmp_path=tmp_path)
+        job_id = repo.create("admin")
+        repo.claim("dead-worker", lease_seconds=300)
+        repo.start_deleting(job_id, "dead-worker", run_ids, [])
+        trash_gc._bulk_hard_delete_runs(tracking, list(repo.take_batch(job_id, "dead-worker", RUN, 10)))
+
+        assert worker(lease_seconds=0).run_once() is True
+
+        job = repo.get(job_id)
+        assert (job.status, job.deleted_runs, job.failed_runs) == (COMPLETED, 15, 0)
+
+    def test_collect_renews_the_lease_between_pages(self, repo):
+        tracking = MagicMock(spec=["_hard_delete_experiment", "_get_deleted_runs", "search_experiments", "search_runs"])
+        tracking._get_deleted_runs.return_value = []
+        experiments = {None: Page([SimpleNamespace(experiment_id="e1")], token="next"), "next": Page([SimpleNamespace(experiment_id="e2")])}
+        tracking.search_experiments.side_effect = lambda page_token=None, **kwargs: experiments[page_token]
+        tracking.search_runs.side_effect = lambda page_token=None, **kwargs: Page([])
+        job_id = repo.create("admin")
+        heartbeats = []
+        heartbeat = repo.heartbeat
+
+        def taken_over_on_second_page(*args):
+            heartbeats.append(args)
+            if len(heartbeats) == 2:
+                repo.claim("other-worker", lease_seconds=0)
+            return heartbeat(*args)
+
+        with patch.object(repo, "heartbeat", side_effect=taken_over_on_second_page):
+            TrashGcWorker(repo, tracking_store=tracking).run_once()
+
+        job = repo.get(job_id)
+        assert len(heartbeats) == 2, "renewed after the aged-run lookup and between experiment pages"
+        assert (job.status, job.phase, job.total_experiments) == ("running", "collect", 0)
+        tracking.search_runs.assert_not_called()
+
+    def test_a_worker_that_lost_its_lease_stops_writing(self, repo, tracking, worker, tmp_path):
+        _trash_runs(tracking, 20, tmp_path=tmp_path)
+        job_id = repo.create("admin")
+        slow = worker()
+        take = repo.take_batch
+
+        def taken_over(*args, **kwargs):
+            batch = take(*args, **kwargs)
+            repo.claim("other-worker", lease_seconds=0)
+            return batch
+
+        with patch.object(repo, "take_batch", side_effect=taken_over):
+            slow.run_once()
+
+        job = repo.get(job_id)
+        assert job.status == "running"
+        assert job.deleted_runs == 0
+
+
+class TestOtherTrackingStores:
+    def test_runs_are_deleted_one_at_a_time(self, repo):
+        tracking = MagicMock(spec=["get_run", "_hard_delete_run", "_get_deleted_runs"])
+        tracking._get_deleted_runs.return_value = ["r1", "r2"]
+        tracking.get_run.side_effect = lambda run_id: SimpleNamespace(info=SimpleNamespace(lifecycle_stage=LifecycleStage.DELETED, artifact_uri=None))
+        tracking._hard_delete_run.side_effect = lambda run_id: (_ for _ in ()).throw(RuntimeError("locked")) if run_id == "r2" else None
+        job_id = repo.create("admin")
+
+        with patch.object(trash_gc, "_delete_artifacts"):
+            TrashGcWorker(repo, tracking_store=tracking, batch_size=10, parallelism=1).run_once()
+
+        job = repo.get(job_id)
+        assert (job.status, job.deleted_runs, job.failed_runs, job.total_experiments) == (COMPLETED, 1, 1, 0)
+        assert [f.error for f in repo.list_failures(job_id)] == ["locked"]
+
+    def test_an_unexpected_error_fails_the_job_with_its_reason(self, repo):
+        tracking = MagicMock(spec=["_get_deleted_runs", "_hard_delete_run", "_hard_delete_experiment", "search_experiments"])
+        tracking._get_deleted_runs.return_value = []
+        tracking.search_experiments.side_effect = RuntimeError("tracking store unavailable")
+        job_id = repo.create("admin")
+
+        TrashGcWorker(repo, tracking_store=tracking).run_once()
+
+        job = repo.get(job_id)
+        assert (job.status, job.error) == (FAILED, "tracking store unavailable")
+
+    def test_every_page_of_trashed_experiments_and_runs_is_collected(self, repo):
+        tracking = MagicMock(spec=["get_run", "_hard_delete_run", "_hard_delete_experiment", "_get_deleted_runs", "search_experiments", "search_runs"])
+        tracking._get_deleted_runs.return_value = []
+        experiments = {None: Page([SimpleNamespace(experiment_id="e1")], token="next"), "next": Page([SimpleNamespace(experiment_id="e2")])}
+        runs = {
+            None: Page([SimpleNamespace(info=SimpleNamespace(run_id="r1"))], token="next"),
+            "next": Page([SimpleNamespace(info=SimpleNamespace(run_id="r2"))]),
+        }
+        tracking.search_experiments.side_effect = lambda page_token=None, **kwargs: experiments[page_token]
+        tracking.search_runs.side_effect = lambda page_token=None, **kwargs: runs[page_token]
+        tracking.get_run.side_effect = lambda run_id: SimpleNamespace(info=SimpleNamespace(lifecycle_stage=LifecycleStage.DELETED, artifact_uri=None))
+        tracking._hard_delete_experiment.side_effect = lambda experiment_id: (_ for _ in ()).throw(RuntimeError("in use")) if experiment_id == "e2" else None
+        job_id = repo.create("admin")
+
+        with patch.object(trash_gc, "_delete_artifacts"):
+            TrashGcWorker(repo, tracking_store=tracking, batch_size=10, parallelism=1).run_once()
+
+        job = repo.get(job_id)
+        assert (job.status, job.deleted_runs, job.deleted_experiments, job.failed_experiments) == (COMPLETED, 2, 1, 1)
+        assert [(f.kind, f.resource_id, f.error) for f in repo.list_failures(job_id)] == [(EXPERIMENT, "e2", "in use")]
+
+    def test_a_failed_lookup_of_aged_runs_deletes_nothing_by_age(self, repo):
+        tracking = MagicMock(spec=["get_run", "_hard_delete_run", "_get_deleted_runs"])
+        tracking._get_deleted_runs.side_effect = RuntimeError("unsupported filter")
+        job_id = repo.create("admin", older_than="1d", older_than_ms=DAY_MS)
+
+        TrashGcWorker(repo, tracking_store=tracking).run_once()
+
+        job = repo.get(job_id)
+        assert (job.status, job.total_runs) == (COMPLETED, 0)
+        tracking._hard_delete_run.assert_not_called()
+
+    def test_an_artifact_store_error_does_not_keep_the_run(self, repo):
+        tracking = MagicMock(spec=["get_run", "_hard_delete_run", "_get_deleted_runs"])
+        tracking._get_deleted_runs.return_value = ["r1"]
+        tracking.get_run.return_value = SimpleNamespace(info=SimpleNamespace(lifecycle_stage=LifecycleStage.DELETED, artifact_uri="s3://bucket/r1"))
+        job_id = repo.create("admin")
+
+        with patch.object(trash_gc, "get_artifact_repository", side_effect=RuntimeError("access denied")):
+            TrashGcWorker(repo, tracking_store=tracking, parallelism=1).run_once()
+
+        tracking._hard_delete_run.assert_called_once_with("r1")
+        assert repo.get(job_id).deleted_runs == 1
+
+
+class TestBackgroundWorker:
+    def test_an_enqueued_job_is_picked_up_without_waiting_for_a_poll(self, repo, tracking, tmp_path):
+        run_ids = _trash_runs(tracking, 5, tmp_path=tmp_path)
+        background = TrashGcWorker(repo, tracking_store=tracking, poll_seconds=60)
+        background.start()
+        try:
+            job_id = repo.create("admin")
+            background.wake()
+            deadline = time.monotonic() + 10
+            while repo.get(job_id).status != COMPLETED and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            background.stop()
+
+        assert repo.get(job_id).status == COMPLETED
+        assert _remaining_runs(tracking, run_ids) == 0
+
+    def test_completion_is_audited_as_the_requesting_admin(self, repo, tracking, worker, tmp_path):
+        _trash_runs(tracking, 2, tmp_path=tmp_path)
+        job_id = repo.create("admin@example.com", older_than="0s")
+
+        with patch.object(trash_gc, "emit_audit_event") as audit:
+            worker().run_once()
+
+        audit.assert_called_once()
+        args, kwargs = audit.call_args
+        assert args == ("trash.cleanup", "admin@example.com")
+        assert kwargs["resource_id"] == str(job_id)
+        assert kwargs["detail"]["deleted_runs_count"] == 2
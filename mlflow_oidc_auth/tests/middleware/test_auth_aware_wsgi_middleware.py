@@ -19,6 +19,7 @@ from mlflow_oidc_auth.middleware.auth_aware_wsgi_middleware import (
     AuthAwareWSGIMiddleware,
     AuthInjectingWSGIApp,
 )
+from mlflow_oidc_auth.middleware.wsgi_bridge import WSGIBridge
 
 
 class TestAuthInjectingWSGIApp:
@@ -182,6 +183,13 @@ class TestAuthAwareWSGIMiddleware:
         middleware = AuthAwareWSGIMiddleware(mock_flask_app)
 
         assert middleware.flask_app == mock_flask_app
+        assert isinstance(middleware.bridge, WSGIBridge)
+
+    def test_init_with_shared_bridge(self, mock_flask_app):
+        """A bridge passed in is used rather than a new one."""
+        bridge = WSGIBridge(max_workers=2)
+
+        assert AuthAwareWSGIMiddleware(mock_flask_app, bridge=bridge).bridge is bridge
 
     @pytest.mark.asyncio
     async def test_call_http_request(self, mock_flask_app, sample_asgi_scope, mock_receive, mock_send):
@@ -192,19 +200,16 @@ class TestAuthAwareWSGIMiddleware:
 
         middleware = AuthAwareWSGIMiddleware(mock_flask_app)
 
-        with patch("mlflow_oidc_auth.middleware.auth_aware_wsgi_middleware.WSGIMiddleware") as mock_wsgi_middleware:
-            mock_wsgi_instance = AsyncMock()
-            mock_wsgi_middleware.return_value = mock_wsgi_instance
-
+        with patch.object(middleware.bridge, "handle", new_callable=AsyncMock) as handle:
             await middleware(sample_asgi_scope, mock_receive, mock_send)
 
-            mock_wsgi_middleware.assert_called_once()
-            created_app = mock_wsgi_middleware.call_args[0][0]
+            handle.assert_called_once()
+            created_app = handle.call_args[0][0]
             assert isinstance(created_app, AuthInjectingWSGIApp)
             assert created_app.flask_app == mock_flask_app
             assert created_app.scope == sample_asgi_scope
 
-            mock_wsgi_instance.assert_called_once_with(sample_asgi_scope, mock_receive, mock_send)
+            handle.assert_called_once_with(created_app, sample_asgi_scope, mock_receive, mock_send)
 
     @pytest.mark.asyncio
     async def test_call_non_http_request(self, mock_flask_app, sample_asgi_scope, mock_receive, mock_send):
@@ -246,13 +251,10 @@ class TestAuthAwareWSGIMiddleware:
 
         middleware = AuthAwareWSGIMiddleware(mock_flask_app)
 
-        with patch("mlflow_oidc_auth.middleware.auth_aware_wsgi_middleware.WSGIMiddleware") as mock_wsgi_middleware:
-            mock_wsgi_instance = AsyncMock()
-            mock_wsgi_middleware.return_value = mock_wsgi_instance
-
+        with patch.object(middleware.bridge, "handle", new_callable=AsyncMock) as handle:
             await middleware(sample_asgi_scope, mock_receive, mock_send)
 
-            created_app = mock_wsgi_middleware.call_args[0][0]
+            created_app = handle.call_args[0][0]
             assert created_app.scope["mlflow_oidc_auth"] is auth_ctx
             assert created_app.scope["mlflow_oidc_auth"].workspace == "prod-ws"
 
@@ -263,31 +265,22 @@ class TestAuthAwareWSGIMiddleware:
 
         middleware = AuthAwareWSGIMiddleware(mock_flask_app)
 
-        with patch("mlflow_oidc_auth.middleware.auth_aware_wsgi_middleware.WSGIMiddleware") as mock_wsgi_middleware:
-            mock_wsgi_instance = AsyncMock()
-            mock_wsgi_middleware.return_value = mock_wsgi_instance
-
+        with patch.object(middleware.bridge, "handle", new_callable=AsyncMock) as handle:
             await middleware(sample_asgi_scope, mock_receive, mock_send)
 
-            mock_wsgi_middleware.assert_called_once()
-            created_app = mock_wsgi_middleware.call_args[0][0]
+            handle.assert_called_once()
+            created_app = handle.call_args[0][0]
             assert isinstance(created_app, AuthInjectingWSGIApp)
             assert created_app.scope == sample_asgi_scope
 
-            mock_wsgi_instance.assert_called_once_with(sample_asgi_scope, mock_receive, mock_send)
-
     @pytest.mark.asyncio
     async def test_call_wsgi_middleware_exception(self, mock_flask_app, sample_asgi_scope, mock_receive, mock_send):
-        """Test handling when WSGIMiddleware raises an exception."""
+        """Test handling when the WSGI bridge raises an exception."""
         sample_asgi_scope["type"] = "http"
 
         middleware = AuthAwareWSGIMiddleware(mock_flask_app)
 
-        with patch("mlflow_oidc_auth.middleware.auth_aware_wsgi_middleware.WSGIMiddleware") as mock_wsgi_middleware:
-            mock_wsgi_instance = AsyncMock()
-            mock_wsgi_instance.side_effect = RuntimeError("WSGI middleware error")
-            mock_wsgi_middleware.return_value = mock_wsgi_instance
-
+        with patch.object(middleware.bridge, "handle", new_callable=AsyncMock, side_effect=RuntimeError("WSGI middleware error")):
             with pytest.raises(RuntimeError, match="WSGI middleware error"):
                 await middleware(sample_asgi_scope, mock_receive, mock_send)
 
@@ -311,17 +304,14 @@ class TestAuthAwareWSGIMiddleware:
             "mlflow_oidc_auth": auth_ctx2,
         }
 
-        with patch("mlflow_oidc_auth.middleware.auth_aware_wsgi_middleware.WSGIMiddleware") as mock_wsgi_middleware:
-            mock_wsgi_instance = AsyncMock()
-            mock_wsgi_middleware.return_value = mock_wsgi_instance
-
+        with patch.object(middleware.bridge, "handle", new_callable=AsyncMock) as handle:
             await middleware(scope1, mock_receive, mock_send)
             await middleware(scope2, mock_receive, mock_send)
 
-            assert mock_wsgi_middleware.call_count == 2
+            assert handle.call_count == 2
 
-            first_app = mock_wsgi_middleware.call_args_list[0][0][0]
-            second_app = mock_wsgi_middleware.call_args_list[1][0][0]
+            first_app = handle.call_args_list[0][0][0]
+            second_app = handle.call_args_list[1][0][0]
 
             assert first_app.scope["mlflow_oidc_auth"].username == "user1@example.com"
             assert second_app.scope["mlflow_oidc_auth"].username == "admin@example.com"
@@ -0,0 +1,147 @@
+"""Tests for the pure-ASGI base shared by the request middleware."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from mlflow_oidc_auth.middleware import ProxyHeadersMiddleware, WorkspaceContextMiddleware
+from mlflow_oidc_auth.middleware._dispatch import DispatchMiddleware
+
+
+class _Recorder(DispatchMiddleware):
+    """Forwards every request, or answers it itself when ``X-Deny`` is set."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.tasks = []
+
+    async def dispatch(self, request: Request, call_next):
+        self.tasks.append(asyncio.current_task())
+        if request.headers.get("x-deny"):
+            return JSONResponse(status_code=401, content={"detail": "denied"})
+        request.state.seen_by_middleware = True
+        return await call_next(request)
+
+
+async def _call(app, scope_type="http", path="/", headers=()):
+    """Drive ``app`` with one request and return the messages it sent."""
+    scope = {
+        "type": scope_type,
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": list(headers),
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 1234),
+        "root_path": "",
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+class TestDispatchMiddleware:
+    async def test_forwarded_request_reaches_the_app_in_the_same_task(self):
+        app_tasks = []
+
+        async def app(scope, receive, send):
+            app_tasks.append(asyncio.current_task())
+            assert scope["state"]["seen_by_middleware"] is True
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = _Recorder(app)
+        sent = await _call(middleware)
+
+        assert [m["type"] for m in sent] == ["http.response.start", "http.response.body"]
+        assert sent[0]["status"] == 204
+        assert app_tasks == middleware.tasks
+
+    async def test_own_response_is_sent_and_the_app_is_not_called(self):
+        async def app(scope, receive, send):
+            pytest.fail("the app must not be called for a denied request")
+
+        sent = await _call(_Recorder(app), headers=[(b"x-deny", b"1")])
+
+        assert sent[0]["status"] == 401
+        assert b"denied" in sent[1]["body"]
+
+    @pytest.mark.parametrize("scope_type", ["lifespan", "websocket"])
+    async def test_non_http_scopes_pass_through(self, scope_type):
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append(scope["type"])
+
+        middleware = _Recorder(app)
+        await _call(middleware, scope_type=scope_type)
+
+        assert seen == [scope_type]
+        assert middleware.tasks == []
+
+    async def test_streamed_chunks_are_relayed_as_they_are_produced(self):
+        """Each chunk reaches the client before the app produces the next one."""
+        delivered = []
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for i in range(3):
+                await send({"type": "http.response.body", "body": bytes([i]), "more_body": True})
+                assert len(delivered) == i + 1
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = _Recorder(app)
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message["body"]:
+                delivered.append(message["body"])
+
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""}
+        await middleware(scope, None, send)
+
+        assert delivered == [b"\x00", b"\x01", b"\x02"]
+
+
+class TestMiddlewareStack:
+    def test_workspace_context_spans_a_streamed_response(self):
+        """The workspace ContextVar is cleared only after the last chunk has been sent."""
+        app = FastAPI()
+        observed = []
+
+        @app.get("/download")
+        async def download():
+            from mlflow.utils.workspace_context import get_request_workspace
+
+            async def body():
+                for _ in range(3):
+                    observed.append(get_request_workspace())
+                    yield b"chunk"
+
+            return StreamingResponse(body())
+
+        app.add_middleware(ProxyHeadersMiddleware)
+        app.add_middleware(WorkspaceContextMiddleware)
+
+        workspace = type("Workspace", (), {"name": "team-a"})()
+        with (
+            patch("mlflow_oidc_auth.middleware.workspace_context_middleware.config") as mock_config,
+            patch("mlflow.server.workspace_helpers.resolve_workspace_for_request_if_enabled", return_value=workspace),
+        ):
+            mock_config.MLFLOW_ENABLE_WORKSPACES = True
+            response = TestClient(app).get("/download", headers={"X-MLFLOW-WORKSPACE": "team-a"})
+
+        assert response.content == b"chunk" * 3
+        assert observed == ["team-a"] * 3
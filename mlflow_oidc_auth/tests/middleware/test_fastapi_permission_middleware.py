@@ -296,7 +296,7 @@ class TestRequireAuthenticationValidator:
 def _create_app_with_auth(username=None, is_admin=False):
     """Create a test FastAPI app with auth context and permission middleware.
 
-    Starlette ``@app.middleware("http")`` uses LIFO ordering: the last middleware
+    Starlette middleware uses LIFO ordering: the last middleware
     registered wraps the outermost layer and runs first.  We must register the
     permission middleware FIRST, then the auth-context middleware, so that
     auth context is set before the permission middleware reads it.
@@ -323,6 +323,10 @@ def _create_app_with_auth(username=None, is_admin=False):
     async def assistant_chat():
         return {"response": "hello"}
 
+    @app.post("/gateway/openai/v1/chat/completions")
+    async def chat_completions(request: Request):
+        return await request.json()
+
     @app.get("/api/2.0/mlflow/experiments/list")
     async def flask_passthrough():
         return {"experiments": []}
@@ -484,3 +488,25 @@ class TestFastapiPermissionMiddlewareIntegration:
         client = TestClient(app)
         response = client.get("/gateway/my-ep/mlflow/invocations")
         assert response.status_code == 403
+
+    @patch("mlflow_oidc_auth.middleware.fastapi_permission_middleware.can_use_gateway_endpoint")
+    def test_body_read_by_the_validator_reaches_the_route(self, mock_can_use):
+        """The endpoint name is read from the body; the route must still receive all of it."""
+        mock_can_use.return_value = True
+        app = _create_app_with_auth(username="user@example.com", is_admin=False)
+        client = TestClient(app)
+        payload = {"model": "my-ep", "messages": [{"role": "user", "content": "hi"}]}
+        response = client.post("/gateway/openai/v1/chat/completions", json=payload)
+        assert response.status_code == 200
+        assert response.json() == payload
+        mock_can_use.assert_called_once_with("my-ep", "user@example.com")
+
+    def test_is_plain_asgi(self):
+        """No ``BaseHTTPMiddleware`` relay sits between gateway responses and the client."""
+        from starlette.middleware.base import BaseHTTPMiddleware
+
+        from mlflow_oidc_auth.middleware.fastapi_permission_middleware import FastAPIPermissionMiddleware
+
+        app = _create_app_with_auth(username=None)
+        assert [m.cls for m in app.user_middleware] == [FastAPIPermissionMiddleware]
+        assert not issubclass(FastAPIPermissionMiddleware, BaseHTTPMiddleware)
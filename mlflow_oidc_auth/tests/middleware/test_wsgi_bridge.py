@@ -0,0 +1,275 @@
+"""Tests for the streaming, bounded-concurrency WSGI bridge."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from flask import Flask, Response, request
+
+from mlflow_oidc_auth.middleware import wsgi_bridge
+from mlflow_oidc_auth.middleware.wsgi_bridge import WSGIBridge
+
+
+def _scope(method="GET", path="/", headers=()):
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": list(headers),
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 1234),
+    }
+
+
+def _receive_from(chunks):
+    messages = [{"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1} for i, chunk in enumerate(chunks)]
+
+    async def receive():
+        return messages.pop(0)
+
+    return receive
+
+
+class _Sink:
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, message):
+        self.messages.append(message)
+
+    @property
+    def status(self):
+        return self.messages[0]["status"]
+
+    @property
+    def bodies(self):
+        return [m["body"] for m in self.messages if m["type"] == "http.response.body"]
+
+
+@pytest.fixture
+def flask_app():
+    app = Flask(__name__)
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        return {"size": len(request.get_data()), "head": request.get_data()[:5].decode()}
+
+    @app.route("/hello")
+    def hello():
+        return "hello", 201, {"X-Test": "yes"}
+
+    return app
+
+
+class TestThroughFastAPI:
+    def test_get_and_post_round_trip(self, flask_app):
+        app = FastAPI()
+        app.mount("/", WSGIBridge(flask_app, max_workers=2))
+        client = TestClient(app)
+
+        hello = client.get("/hello")
+        assert hello.status_code == 201
+        assert hello.text == "hello"
+        assert hello.headers["x-test"] == "yes"
+
+        echoed = client.post("/echo", content=b"abcde" * 100_000)
+        assert echoed.json() == {"size": 500_000, "head": "abcde"}
+
+
+class TestRequestBody:
+    async def test_app_reads_the_body_before_the_client_has_sent_it_all(self):
+        """An upload is handed to the app as it arrives, not buffered first."""
+        loop = asyncio.get_running_loop()
+        first_chunk_read = asyncio.Event()
+        sent = [{"type": "http.request", "body": b"first", "more_body": True}]
+
+        async def receive():
+            if sent:
+                return sent.pop(0)
+            # The second chunk only arrives once the app has consumed the first.
+            await asyncio.wait_for(first_chunk_read.wait(), timeout=5)
+            return {"type": "http.request", "body": b"second", "more_body": False}
+
+        def app(environ, start_response):
+            first = environ["wsgi.input"].read(5)
+            loop.call_soon_threadsafe(first_chunk_read.set)
+            rest = environ["wsgi.input"].read()
+            start_response("200 OK", [])
+            return [first + b"|" + rest]
+
+        sink = _Sink()
+        await WSGIBridge(app, max_workers=1)(_scope("POST"), receive, sink)
+
+        assert b"".join(sink.bodies) == b"first|second"
+
+    async def test_chunked_body_without_content_length_reads_to_the_end(self):
+        def app(environ, start_response):
+            assert environ["wsgi.input_terminated"] is True
+            lines = list(environ["wsgi.input"])
+            start_response("200 OK", [])
+            return [b";".join(lines)]
+
+        sink = _Sink()
+        await WSGIBridge(app, max_workers=1)(_scope("POST"), _receive_from([b"a\nb", b"c\n", b"d"]), sink)
+
+        assert b"".join(sink.bodies) == b"a\n;bc\n;d"
+
+    async def test_sized_reads_span_messages(self):
+        def app(environ, start_response):
+            body = environ["wsgi.input"]
+            parts = [body.read(3), body.readline(2), body.read(), body.read()]
+            start_response("200 OK", [])
+            return [b"/".join(parts)]
+
+        sink = _Sink()
+        await WSGIBridge(app, max_workers=1)(_scope("POST"), _receive_from([b"ab", b"cd\nef", b"gh"]), sink)
+
+        assert b"".join(sink.bodies) == b"abc/d\n/efgh/"
+
+    async def test_client_disconnect_is_raised_to_the_app(self):
+        seen = []
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        def app(environ, start_response):
+            try:
+                environ["wsgi.input"].read()
+            except OSError as e:
+                seen.append(e)
+            start_response("400 Bad Request", [])
+            return []
+
+        await WSGIBridge(app, max_workers=1)(_scope("POST"), receive, _Sink())
+
+        assert len(seen) == 1
+
+
+class TestResponseBody:
+    async def test_sized_response_is_sent_in_chunks_and_truncated(self):
+        closed = []
+
+        class Body:
+            def __iter__(self):
+                for _ in range(10):
+                    yield b"x" * 3
+
+            def close(self):
+                closed.append(True)
+
+        def app(environ, start_response):
+            start_response("200 OK", [("Content-Length", "20")])
+            return Body()
+
+        sink = _Sink()
+        await WSGIBridge(app, max_workers=1, chunk_size=8)(_scope(), _receive_from([b""]), sink)
+
+        assert sink.status == 200
+        assert [len(b) for b in sink.bodies] == [9, 9, 2]
+        assert sink.messages[-1]["more_body"] is False
+        assert closed == [True]
+
+    async def test_unsized_response_is_sent_as_produced(self):
+        """Each chunk is delivered before the app produces the next one."""
+        delivered = []
+        produced = []
+
+        def app(environ, start_response):
+            start_response("200 OK", [("Content-Type", "text/event-stream")])
+            for i in range(3):
+                assert len(delivered) == i
+                produced.append(i)
+                yield str(i).encode()
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message["body"]:
+                delivered.append(message["body"])
+
+        await WSGIBridge(app, max_workers=1, chunk_size=1024)(_scope(), _receive_from([b""]), send)
+
+        assert delivered == [b"0", b"1", b"2"]
+
+    async def test_flask_streamed_file_arrives_whole(self):
+        app = Flask(__name__)
+        payload = bytes(range(256)) * 4096  # 1 MiB
+
+        @app.route("/file")
+        def download():
+            return Response(iter(payload[i : i + 8192] for i in range(0, len(payload), 8192)), headers={"Content-Length": str(len(payload))})
+
+        sink = _Sink()
+        await WSGIBridge(app, max_workers=1, chunk_size=65536)(_scope(path="/file"), _receive_from([b""]), sink)
+
+        assert b"".join(sink.bodies) == payload
+        assert max(len(b) for b in sink.bodies) == 65536
+
+    async def test_error_before_start_response_propagates(self):
+        def app(environ, start_response):
+            raise ValueError("broken")
+
+        sink = _Sink()
+        with pytest.raises(ValueError, match="broken"):
+            await WSGIBridge(app, max_workers=1)(_scope(), _receive_from([b""]), sink)
+        assert sink.messages == []
+
+
+class TestConcurrency:
+    async def test_worker_limit_bounds_in_flight_requests(self):
+        lock = threading.Lock()
+        active = peak = 0
+
+        def app(environ, start_response):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            start_response("200 OK", [])
+            return [b"ok"]
+
+        bridge = WSGIBridge(app, max_workers=2)
+        started = time.perf_counter()
+        await asyncio.gather(*(bridge(_scope(), _receive_from([b""]), _Sink()) for _ in range(6)))
+        elapsed = time.perf_counter() - started
+
+        assert peak == 2
+        # Three rounds of two, not six requests one after another.
+        assert elapsed < 0.05 * 6
+        stats = bridge.stats()
+        assert stats["max_in_flight"] == 2
+        assert stats["max_queued"] >= 4
+        assert stats["queued"] == stats["in_flight"] == 0
+        assert stats["completed"] == 6
+        bridge.shutdown()
+
+    async def test_stats_count_bytes_and_failures(self):
+        def app(environ, start_response):
+            body = environ["wsgi.input"].read()
+            if body == b"fail":
+                raise RuntimeError("fail")
+            start_response("200 OK", [])
+            return [body * 2]
+
+        bridge = WSGIBridge(app, max_workers=1)
+        await bridge(_scope("POST"), _receive_from([b"abc"]), _Sink())
+        with pytest.raises(RuntimeError):
+            await bridge(_scope("POST"), _receive_from([b"fail"]), _Sink())
+
+        stats = bridge.stats()
+        assert (stats["completed"], stats["failed"]) == (1, 1)
+        assert stats["bytes_received"] == 7
+        assert stats["bytes_sent"] == 6
+        assert wsgi_bridge.stats()["completed"] >= 1
+
+    async def test_non_http_scope_is_rejected(self):
+        with pytest.raises(ValueError):
+            await WSGIBridge(lambda e, s: [], max_workers=1)({"type": "websocket"}, None, None)
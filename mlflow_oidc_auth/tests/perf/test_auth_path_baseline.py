@@ -17,7 +17,7 @@ scenario         SQL statements
 unprotected      0
 session          1
 bearer           2
-basic            3
+basic            3 first, then 2
 ===============  ===================
 
 The session path was 2 until #310 moved sessions server-side: resolving the cookie's opaque id
@@ -25,6 +25,10 @@ joins ``auth_sessions`` to ``users`` and returns the session's validity together
 and active flags, so the request that used to cost a lookup *and* a profile read now costs one
 statement. Lower is allowed; it simply has to be acknowledged here rather than drift.
 
+Basic auth drops to 2 after the first request with the same credentials: a successful
+verification is remembered in-process (``utils/credential_cache.py``), so a repeat
+with the same credentials skips the password-hash select and ``check_password_hash``.
+
 **No task may raise these numbers.** A change that needs more per-request data must fit
 it into the existing statements (widen the ``load_only``) or cache it — not add a query.
 
@@ -201,8 +205,23 @@ class TestAuthPathQueryBudget:
 
         assert counts == [3, 3, 3], counter.report()
 
-    def test_basic_authenticated_request_issues_three_queries(self, client, counter, auth_user):
-        """Basic auth pays one extra statement to load the password hash before the admin check."""
+    def test_first_basic_request_issues_three_queries_and_cached_requests_two(self, client, counter, auth_user):
+        """Basic auth pays one extra statement to load the password hash before the admin check.
+
+        Only the first request does: the verification is then cached, and repeats cost the
+        same 2 statements as bearer.
+        """
+        credentials = base64.b64encode(f"{auth_user}:{BENCH_PASSWORD}".encode()).decode()
+
+        counts = _count_requests(counter, lambda: client.get(PROTECTED_PATH, headers={"Authorization": f"Basic {credentials}"}))
+
+        assert counts == [3, 2, 2], counter.report()
+
+    def test_basic_auth_without_credential_cache_issues_three_queries_every_time(self, client, counter, auth_user, monkeypatch):
+        """``BASIC_AUTH_CACHE_TTL_SECONDS=0`` restores the uncached budget."""
+        from mlflow_oidc_auth.utils import credential_cache
+
+        monkeypatch.setattr(credential_cache.config, "BASIC_AUTH_CACHE_TTL_SECONDS", 0)
         credentials = base64.b64encode(f"{auth_user}:{BENCH_PASSWORD}".encode()).decode()
 
         counts = _count_requests(counter, lambda: client.get(PROTECTED_PATH, headers={"Authorization": f"Basic {credentials}"}))
@@ -301,3 +320,68 @@ class TestAdminStatusLookup:
         store.get_user_profile(auth_user)
 
         assert counter.count == 4, counter.report()
+
+
+class TestBasicAuthWallTime:
+    """What the verified-credential cache saves, in wall time.
+
+    Timings are machine-dependent, so cold and warm are compared within one run rather
+    than against fixed numbers. Cold clears the cache before every call, so each one loads
+    the hash and runs ``check_password_hash``; warm repeats the same credentials. A failing
+    assertion reports both medians.
+    """
+
+    ROUNDS = 30
+
+    @staticmethod
+    def _median_ms(samples: List[float]) -> float:
+        return sorted(samples)[len(samples) // 2] * 1000
+
+    def _time(self, fn, before=None) -> float:
+        samples = []
+        for _ in range(self.ROUNDS):
+            if before is not None:
+                before()
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        return self._median_ms(samples)
+
+    @pytest.mark.parametrize("hash_method", ["pbkdf2:sha256:1000", "scrypt:32768:8:1"])
+    def test_cached_verification_skips_the_hash(self, store, auth_user, hash_method):
+        """Both the current token hash and the legacy scrypt hash (pre-#336 rows)."""
+        from werkzeug.security import generate_password_hash
+
+        from mlflow_oidc_auth.db.models import SqlUser
+        from mlflow_oidc_auth.utils.credential_cache import clear_credential_cache
+
+        with store.engine.begin() as conn:
+            conn.execute(
+                SqlUser.__table__.update()
+                .where(SqlUser.__table__.c.username == auth_user)
+                .values(password_hash=generate_password_hash(BENCH_PASSWORD, method=hash_method))
+            )
+
+        def verify():
+            assert store.authenticate_user(auth_user, BENCH_PASSWORD) is True
+
+        cold = self._time(verify, before=clear_credential_cache)
+        verify()
+        warm = self._time(verify)
+
+        assert warm * 5 < cold, f"{hash_method}: cold {cold:.3f} ms, warm {warm:.3f} ms"
+
+    def test_cached_basic_request_is_not_slower(self, client, auth_user):
+        """At the ASGI boundary the saving is one statement and one hash per request."""
+        from mlflow_oidc_auth.utils.credential_cache import clear_credential_cache
+
+        credentials = base64.b64encode(f"{auth_user}:{BENCH_PASSWORD}".encode()).decode()
+
+        def request():
+            assert client.get(PROTECTED_PATH, headers={"Authorization": f"Basic {credentials}"}).status_code == 200
+
+        cold = self._time(request, before=clear_credential_cache)
+        request()
+        warm = self._time(request)
+
+        assert warm < cold, f"basic request: cold {cold:.3f} ms, warm {warm:.3f} ms"
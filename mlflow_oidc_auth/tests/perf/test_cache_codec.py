@@ -0,0 +1,76 @@
+"""Encode/decode cost and bytes per key of the Redis cache codecs.
+
+Every permission check on the Redis backend decodes one cached ``PermissionResult``,
+and every miss encodes one. With pickle that is ~230 bytes per key and a full
+unpickle (class lookup, dataclass reconstruction) per hit. ``PermissionCodec`` stores
+the same decision in 3 bytes.
+
+Bytes per key are asserted exactly. Timings are machine-dependent, so they are only
+compared against pickle measured in the same run: the compact codec must be faster at
+both encoding and decoding. The measured numbers are in each assertion's message.
+"""
+
+import pickle
+import timeit
+
+import pytest
+
+from mlflow_oidc_auth.cache.codec import PermissionCodec, PickleCodec
+from mlflow_oidc_auth.models.permission import PermissionResult
+from mlflow_oidc_auth.permissions import EDIT, MANAGE, NO_PERMISSIONS, READ
+
+# A realistic mix: the same handful of decisions repeated across many keys.
+SAMPLE = [
+    PermissionResult(READ, "group"),
+    PermissionResult(MANAGE, "user"),
+    PermissionResult(EDIT, "regex"),
+    PermissionResult(NO_PERMISSIONS, "workspace-deny"),
+    PermissionResult(READ, "fallback"),
+]
+_ROUNDS = 2_000
+_REPEATS = 5
+
+
+def _best_seconds(fn) -> float:
+    """Fastest of several runs, in seconds per value; the minimum is the least noisy estimate."""
+    return min(timeit.repeat(fn, number=_ROUNDS, repeat=_REPEATS)) / (_ROUNDS * len(SAMPLE))
+
+
+def _measure(codec):
+    encoded = [codec.encode(value) for value in SAMPLE]
+    return {
+        "bytes": sum(len(raw) for raw in encoded) / len(encoded),
+        "encode": _best_seconds(lambda: [codec.encode(value) for value in SAMPLE]),
+        "decode": _best_seconds(lambda: [codec.decode(raw) for raw in encoded]),
+    }
+
+
+def _report(measurements) -> str:
+    """The measurements, one codec per line, for assertion messages."""
+    return "\n".join(
+        f"{name:8s} {m['bytes']:6.1f} B/key  encode {m['encode'] * 1e9:7.0f} ns  decode {m['decode'] * 1e9:7.0f} ns" for name, m in measurements.items()
+    )
+
+
+@pytest.fixture(scope="module")
+def measurements():
+    return {"pickle": _measure(PickleCodec()), "compact": _measure(PermissionCodec())}
+
+
+class TestPermissionCodecCost:
+    def test_compact_entries_are_three_bytes(self, measurements):
+        assert measurements["compact"]["bytes"] == 3, _report(measurements)
+
+    def test_compact_is_a_fraction_of_pickle_size(self, measurements):
+        assert measurements["pickle"]["bytes"] == sum(len(pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL)) for v in SAMPLE) / len(SAMPLE)
+        assert measurements["compact"]["bytes"] * 20 < measurements["pickle"]["bytes"], _report(measurements)
+
+    def test_compact_decodes_faster_than_pickle(self, measurements):
+        assert measurements["compact"]["decode"] < measurements["pickle"]["decode"], _report(measurements)
+
+    def test_compact_encodes_faster_than_pickle(self, measurements):
+        assert measurements["compact"]["encode"] < measurements["pickle"]["encode"], _report(measurements)
+
+    def test_decoded_values_match(self):
+        codec = PermissionCodec()
+        assert [codec.decode(codec.encode(value)) for value in SAMPLE] == SAMPLE
@@ -245,15 +245,42 @@ class TestPermissionContextBuild:
         assert len(set(counts.values())) == 1, f"context build scales with group count: {counts}"
 
 
+class TestPermissionSnapshotResolution:
+    """resolve_permission cache misses are served from the user's compiled snapshot."""
+
+    def test_resolution_cost_does_not_scale_with_resource_count(self, seeded_store, counter, monkeypatch):
+        """Each miss used to issue one query per source walked, plus a group-id lookup per
+        group-regex source. With the snapshot, the first miss loads the model section and
+        every further miss for the same user is free.
+        """
+        store, username, _ = seeded_store
+        import mlflow_oidc_auth.utils.permissions as perms
+        from mlflow_oidc_auth.config import config as cfg
+
+        monkeypatch.setattr(perms, "store", store)
+        monkeypatch.setattr(cfg, "MLFLOW_ENABLE_WORKSPACES", False)
+        perms.flush_permission_cache()
+
+        counter.reset()
+        for i in range(25):
+            perms.resolve_permission(perms.REGISTERED_MODEL, f"model-{i}", username)
+        perms.flush_permission_cache()
+
+        # One model-section load: user grants (1), group grants (3 — the registered model
+        # group lister still resolves the user and memberships first), user regex (2),
+        # group ids (1), group regex (1).
+        assert counter.count == 8, counter.report()
+
+
 class TestWorkspaceFallbackMemo:
     """The workspace fallback must be resolved once per batch, not once per resource."""
 
     def test_workspace_deny_does_not_scale_with_resource_count(self, seeded_store, counter, monkeypatch):
-        """get_workspace_permission_cached never caches DENIALS.
-
-        Without a memo, a user with no workspace grant re-ran the full source walk for
+        """Without a memo, a user with no workspace grant re-ran the full source walk for
         every resource, making a listing 21+9N queries. The memo lives on the context, so
         its lifetime is one batch call and it cannot serve a stale decision.
+
+        The denial cache is flushed before each batch, so this measures the memo alone.
         """
         store, username, _ = seeded_store
         import mlflow_oidc_auth.utils.batch_permissions as bp
@@ -275,6 +302,7 @@ class TestWorkspaceFallbackMemo:
             for n in (1, 5, 20):
                 experiments = [SimpleNamespace(experiment_id=f"e{i}", name=f"exp-{i}") for i in range(n)]
                 ctx = bp.build_user_permission_context(username)
+                wsc.flush_workspace_cache()
                 counter.reset()
                 for exp in experiments:
                     bp.resolve_experiment_permission_from_context(ctx, exp.experiment_id, exp.name)
@@ -287,6 +315,36 @@ class TestWorkspaceFallbackMemo:
         # And it must actually be walking the sources, or the test proves nothing.
         assert next(iter(finally_counts.values())) > 0, "deny path issued no queries; test would be vacuous"
 
+    def test_workspace_deny_is_cached_across_batches(self, seeded_store, counter, monkeypatch):
+        """A repeated denial is served from the denial cache instead of re-walking every source."""
+        store, username, _ = seeded_store
+        import mlflow_oidc_auth.utils.batch_permissions as bp
+        from mlflow_oidc_auth.config import config as cfg
+
+        import mlflow_oidc_auth.store as store_mod
+        import mlflow_oidc_auth.utils.workspace_cache as wsc
+
+        monkeypatch.setattr(cfg, "MLFLOW_ENABLE_WORKSPACES", True)
+        monkeypatch.setattr("mlflow.utils.workspace_context.get_request_workspace", lambda: "ws-none")
+        monkeypatch.setattr(store_mod, "store", store)
+        wsc.flush_workspace_cache()
+
+        original = bp.store
+        bp.store = store
+        try:
+            counts = []
+            for _ in range(2):
+                ctx = bp.build_user_permission_context(username)
+                counter.reset()
+                bp.resolve_experiment_permission_from_context(ctx, "e0", "exp-0")
+                counts.append(counter.count)
+        finally:
+            bp.store = original
+            wsc.flush_workspace_cache()
+
+        assert counts[0] > 0, "first batch issued no queries; test would be vacuous"
+        assert counts[1] == 0, f"cached denial still walked the sources: {counts}"
+
 
 class TestListFoldsDoNotLeakAcrossUsers:
     """The three JOIN folds gate cross-user isolation; nothing else tests their predicates.
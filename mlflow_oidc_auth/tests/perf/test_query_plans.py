@@ -0,0 +1,145 @@
+"""Query-plan regression tests for the per-user and per-group permission lookups.
+
+``test_query_counts.py`` guards the number of round-trips; this guards what each of them
+costs. Every lookup below runs on the request path, filters a permission table by
+``user_id`` or ``group_id``, and must be answered from an index: the statements a repository
+call issues are captured, EXPLAINed, and any full scan of a table fails the test.
+
+**Postgres.** The plans are checked on SQLite, and on PostgreSQL too when
+``MLFLOW_OIDC_TEST_POSTGRES_URI`` is set (skipped otherwise). Each test migrates a schema of
+its own and drops it afterwards; nothing else in that database is read or changed. The test
+tables are tiny, where a sequential scan is the planner's right choice, so sequential scans
+are disabled for the EXPLAIN: the planner then still picks one only when no index can answer
+the query.
+"""
+
+import os
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+
+from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+POSTGRES_URI = os.environ.get("MLFLOW_OIDC_TEST_POSTGRES_URI")
+
+USERNAME = "alice@example.com"
+GROUPS = ["group-1", "group-2"]
+
+
+@pytest.fixture(params=["sqlite", "postgres"])
+def plan_store(request, tmp_path):
+    """A migrated store with one user in two groups, per backend."""
+    if request.param == "postgres" and not POSTGRES_URI:
+        pytest.skip("MLFLOW_OIDC_TEST_POSTGRES_URI is not set")
+    with _isolated_database(request.param, tmp_path) as uri:
+        s = SqlAlchemyStore()
+        s.init_db(uri)
+        s.create_user(USERNAME, "pw", "Alice")
+        s.populate_groups(GROUPS)
+        s.set_user_groups(USERNAME, GROUPS)
+        yield s
+        s.engine.dispose()
+
+
+@contextmanager
+def _isolated_database(backend: str, tmp_path) -> Iterator[str]:
+    """A URI no other test run or user of the database can see.
+
+    On PostgreSQL that is a schema created for this test and dropped after it, selected
+    through ``search_path``, so the migrations, the EXPLAINs and the teardown never touch
+    ``public`` or any other schema of the database ``MLFLOW_OIDC_TEST_POSTGRES_URI`` names.
+    """
+    if backend == "sqlite":
+        yield f"sqlite:///{tmp_path / 'auth.db'}"
+        return
+
+    schema = f"mlflow_oidc_plans_{uuid.uuid4().hex[:12]}"
+    admin = create_engine(POSTGRES_URI)
+    with admin.begin() as conn:
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+    try:
+        url = make_url(POSTGRES_URI).update_query_dict({"options": f"-csearch_path={schema}"})
+        yield url.render_as_string(hide_password=False)
+    finally:
+        with admin.begin() as conn:
+            conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        admin.dispose()
+
+
+def _captured_selects(store: SqlAlchemyStore, call: Callable[[SqlAlchemyStore], object]) -> List[Tuple[str, object]]:
+    statements: List[Tuple[str, object]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(store.engine, "before_cursor_execute", _record)
+    try:
+        call(store)
+    finally:
+        event.remove(store.engine, "before_cursor_execute", _record)
+    return statements
+
+
+def _full_scans(store: SqlAlchemyStore, statement: str, parameters) -> List[str]:
+    """The plan lines of ``statement`` that read a whole table."""
+    with store.engine.connect() as conn:
+        if conn.dialect.name == "sqlite":
+            plan = [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+            # "SCAN t USING COVERING INDEX" is still a pass over every row.
+            return [line for line in plan if line.startswith("SCAN ")]
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        plan = [row[0] for row in conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)]
+        return [line.strip() for line in plan if "Seq Scan" in line]
+
+
+def _group_ids(store: SqlAlchemyStore) -> List[int]:
+    return store.group_repo.list_group_ids_for_user(USERNAME)
+
+
+# The hot per-principal lookups, one per repository shape and resource type.
+LOOKUPS = {
+    "experiment user grants": lambda s: s.experiment_repo.list_permissions_for_user(USERNAME),
+    "experiment group grants": lambda s: s.experiment_group_repo.list_permissions_for_user_groups(USERNAME),
+    "experiment grants of a group": lambda s: s.experiment_group_repo.list_permissions_for_group_id(_group_ids(s)[0]),
+    "experiment user regex": lambda s: s.experiment_regex_repo.list_regex_for_user(USERNAME),
+    "experiment group regex": lambda s: s.experiment_group_regex_repo.list_permissions_for_groups_ids(_group_ids(s)),
+    "registered model user grants": lambda s: s.registered_model_repo.list_permissions_for_user(USERNAME),
+    "registered model group grants": lambda s: s.registered_model_group_repo.list_permissions_for_user_groups(USERNAME),
+    "registered model user regex": lambda s: s.registered_model_regex_repo.list_regex_for_user(USERNAME),
+    "registered model group regex": lambda s: s.registered_model_group_regex_repo.list_permissions_for_groups_ids(_group_ids(s)),
+    "prompt user regex": lambda s: s.prompt_regex_repo.list_regex_for_user(username=USERNAME, prompt=True),
+    "prompt group regex": lambda s: s.prompt_group_regex_repo.list_permissions_for_groups_ids(_group_ids(s), prompt=True),
+    "scorer user grants": lambda s: s.scorer_repo.list_permissions_for_user(USERNAME),
+    "scorer group grants": lambda s: s.scorer_group_repo.list_permissions_for_user_groups(USERNAME),
+    "scorer user regex": lambda s: s.scorer_regex_repo.list_regex_for_user(USERNAME),
+    "scorer group regex": lambda s: s.scorer_group_regex_repo.list_permissions_for_groups_ids(_group_ids(s)),
+    "gateway endpoint user grants": lambda s: s.gateway_endpoint_repo.list_permissions_for_user(USERNAME),
+    "gateway endpoint group grants": lambda s: s.gateway_endpoint_group_repo.list_permissions_for_user_groups(USERNAME),
+    "gateway endpoint user regex": lambda s: s.gateway_endpoint_regex_repo.list_regex_for_user(USERNAME),
+    "gateway endpoint group regex": lambda s: s.gateway_endpoint_group_regex_repo.list_permissions_for_groups_ids(_group_ids(s)),
+    "gateway secret user grants": lambda s: s.gateway_secret_repo.list_permissions_for_user(USERNAME),
+    "gateway secret group regex": lambda s: s.gateway_secret_group_regex_repo.list_permissions_for_groups_ids(_group_ids(s)),
+    "gateway model definition user grants": lambda s: s.gateway_model_definition_repo.list_permissions_for_user(USERNAME),
+    "gateway model definition group regex": lambda s: s.gateway_model_definition_group_regex_repo.list_permissions_for_groups_ids(_group_ids(s)),
+    "workspace user grants": lambda s: s.workspace_permission_repo.list_for_user(1),
+    "workspace group grants": lambda s: s.workspace_group_permission_repo.list_for_group(_group_ids(s)[0]),
+    "workspace user regex": lambda s: s.workspace_regex_permission_repo.list_regex_for_user(USERNAME),
+    "workspace group regex": lambda s: s.workspace_group_regex_permission_repo.list_permissions_for_groups_ids(_group_ids(s)),
+    "groups of a user": lambda s: s.group_repo.list_groups_for_user(USERNAME),
+    "members of a group": lambda s: s.group_repo.list_group_members(GROUPS[0]),
+}
+
+
+@pytest.mark.parametrize("lookup", list(LOOKUPS))
+def test_lookup_is_answered_from_an_index(plan_store, lookup):
+    statements = _captured_selects(plan_store, LOOKUPS[lookup])
+    assert statements, "the lookup issued no SELECT"
+
+    scans = {" ".join(statement.split())[:160]: _full_scans(plan_store, statement, parameters) for statement, parameters in statements}
+
+    assert not any(scans.values()), "full table scan:\n" + "\n".join(f"  {stmt}\n    -> {lines}" for stmt, lines in scans.items() if lines)
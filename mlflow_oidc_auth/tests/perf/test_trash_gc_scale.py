@@ -0,0 +1,61 @@
+"""Trash GC at scale: a hundred thousand trashed runs.
+
+Opt-in, because it inserts and deletes 100k runs and takes a minute or more. Set
+``MLFLOW_OIDC_TEST_SCALE=1`` to run it.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore as TrackingStore
+
+from mlflow_oidc_auth.jobs import trash_gc
+from mlflow_oidc_auth.jobs.trash_gc import TrashGcWorker
+from mlflow_oidc_auth.repository.trash_gc_job import COMPLETED
+from mlflow_oidc_auth.tests.jobs.test_trash_gc import _remaining_runs, _trash_runs
+
+pytestmark = pytest.mark.skipif(not os.environ.get("MLFLOW_OIDC_TEST_SCALE"), reason="MLFLOW_OIDC_TEST_SCALE is not set")
+
+
+@pytest.fixture
+def tracking(tmp_path):
+    s = TrackingStore(f"sqlite:///{tmp_path / 'mlflow.db'}", str(tmp_path / "artifacts"))
+    yield s
+    s.engine.dispose()
+
+
+def test_a_hundred_thousand_trashed_runs(store, tracking, tmp_path):
+    """100k runs at the default batch size, interrupted half-way and resumed by another worker."""
+    repo = store.trash_gc_job_repo
+    run_ids = _trash_runs(tracking, 100_000, tmp_path=tmp_path)
+    job_id = repo.create("admin")
+    deleted_per_call = []
+    original = trash_gc._bulk_hard_delete_runs
+
+    def counting(tracking_store, ids):
+        deleted_per_call.append(len(ids))
+        return original(tracking_store, ids)
+
+    first = TrashGcWorker(repo, tracking_store=tracking, batch_size=500, parallelism=4)
+    record = repo.record_batch
+
+    def stop_half_way(*args, **kwargs):
+        recorded = record(*args, **kwargs)
+        if len(deleted_per_call) == 100:
+            first._stop.set()
+        return recorded
+
+    with patch.object(trash_gc, "_bulk_hard_delete_runs", side_effect=counting):
+        with patch.object(repo, "record_batch", side_effect=stop_half_way):
+            first.run_once()
+        assert repo.get(job_id).deleted_runs == 50_000
+
+        TrashGcWorker(repo, tracking_store=tracking, batch_size=500, parallelism=4).run_once()
+    first.stop()
+
+    job = repo.get(job_id)
+    assert (job.status, job.total_runs, job.deleted_runs, job.failed_runs) == (COMPLETED, 100_000, 100_000, 0)
+    # 200 transactions of 500, and no run deleted twice.
+    assert deleted_per_call == [500] * 200
+    assert _remaining_runs(tracking, run_ids[:1000]) == 0
@@ -0,0 +1,106 @@
+"""Reverse "who has access" lookups against a real database."""
+
+import pytest
+from mlflow.exceptions import MlflowException
+
+from mlflow_oidc_auth.entities import ResourcePrincipal
+from mlflow_oidc_auth.repository.resource_principal import ALL_SOURCES
+
+TOKEN = "principal-token"  # not a credential: only ever seeded into a tmp_path database
+
+
+@pytest.fixture
+def store(tmp_path):
+    from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+    s = SqlAlchemyStore()
+    s.init_db(f"sqlite:///{tmp_path / 'auth.db'}")
+    s.create_user("alice@example.com", TOKEN, "Alice")
+    s.create_user("bob@example.com", TOKEN, "Bob")
+    s.create_user("bot@example.com", TOKEN, "Bot", is_service_account=True)
+    s.populate_groups(["data-science", "platform"])
+    s.add_user_to_group("alice@example.com", "data-science")
+    s.add_user_to_group("bob@example.com", "platform")
+    yield s
+    s.engine.dispose()
+
+
+def test_direct_user_and_group_grants_for_many_resources(store):
+    store.create_experiment_permission("1", "bob@example.com", "READ")
+    store.create_experiment_permission("1", "alice@example.com", "MANAGE")
+    store.create_experiment_permission("2", "bot@example.com", "EDIT")
+    store.create_group_experiment_permission("data-science", "1", "READ")
+
+    principals = store.list_resource_principals("experiment", ["1", "2", "3"])
+
+    assert principals == {
+        "1": [
+            ResourcePrincipal("alice@example.com", "MANAGE", "user", "user"),
+            ResourcePrincipal("bob@example.com", "READ", "user", "user"),
+            ResourcePrincipal("data-science", "READ", "group", "group"),
+        ],
+        "2": [ResourcePrincipal("bot@example.com", "EDIT", "service-account", "user")],
+        "3": [],
+    }
+
+
+def test_sources_select_what_is_read(store):
+    store.create_experiment_permission("1", "bob@example.com", "READ")
+    store.create_group_experiment_permission("data-science", "1", "READ")
+
+    assert [p.name for p in store.list_resource_principals("experiment", ["1"], sources=("group",))["1"]] == ["data-science"]
+    assert store.list_resource_principals("experiment", ["1"], sources=())["1"] == []
+
+
+def test_prompt_and_model_group_grants_are_kept_apart(store):
+    store.create_group_model_permission("platform", "shared", "READ")
+    store.create_group_prompt_permission("data-science", "shared", "EDIT")
+
+    assert store.list_resource_principals("registered_model", ["shared"])["shared"] == [ResourcePrincipal("platform", "READ", "group", "group")]
+    assert store.list_resource_principals("prompt", ["shared"])["shared"] == [ResourcePrincipal("data-science", "EDIT", "group", "group")]
+
+
+def test_scorers_are_keyed_by_experiment_and_name(store):
+    store.create_scorer_permission("1", "quality", "alice@example.com", "READ")
+    store.create_scorer_permission("2", "latency", "alice@example.com", "MANAGE")
+
+    # (1, latency) and (2, quality) share the column values but hold no grant.
+    principals = store.list_resource_principals("scorer", [("1", "quality"), ("1", "latency"), ("2", "quality")])
+
+    assert principals == {
+        ("1", "quality"): [ResourcePrincipal("alice@example.com", "READ", "user", "user")],
+        ("1", "latency"): [],
+        ("2", "quality"): [],
+    }
+
+
+def test_regex_grants_first_match_by_priority(store):
+    store.create_registered_model_regex_permission("^team-", 2, "READ", "bob@example.com")
+    store.create_registered_model_regex_permission("^team-a-", 1, "MANAGE", "bob@example.com")
+    store.create_group_registered_model_regex_permission("platform", ".*forecast$", 1, "EDIT")
+
+    principals = store.list_resource_principals("registered_model", ["team-a-forecast", "team-b"], sources=ALL_SOURCES)
+
+    assert principals == {
+        "team-a-forecast": [
+            ResourcePrincipal("bob@example.com", "MANAGE", "user", "regex", regex="^team-a-"),
+            ResourcePrincipal("platform", "EDIT", "group", "group-regex", regex=".*forecast$"),
+        ],
+        "team-b": [ResourcePrincipal("bob@example.com", "READ", "user", "regex", regex="^team-")],
+    }
+
+
+def test_experiment_regex_grants_need_the_experiment_name(store):
+    store.create_experiment_regex_permission("^forecast", 1, "READ", "alice@example.com")
+
+    assert store.list_resource_principals("experiment", ["1"], sources=("regex",)) == {"1": []}
+    assert store.list_resource_principals("experiment", ["1"], sources=("regex",), names={"1": "forecast-q3"}) == {
+        "1": [ResourcePrincipal("alice@example.com", "READ", "user", "regex", regex="^forecast")]
+    }
+
+
+def test_unknown_resource_type_or_source_is_rejected(store):
+    with pytest.raises(MlflowException, match="Unknown resource type"):
+        store.list_resource_principals("notebook", ["1"])
+    with pytest.raises(MlflowException, match="Unknown permission sources"):
+        store.list_resource_principals("experiment", ["1"], sources=("workspace",))
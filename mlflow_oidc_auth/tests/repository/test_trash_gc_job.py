@@ -0,0 +1,133 @@
+"""Trash GC job queue: claiming, leases and checkpoints."""
+
+import pytest
+
+from mlflow_oidc_auth.repository.trash_gc_job import (
+    COMPLETED,
+    EXPERIMENT,
+    PHASE_COLLECT,
+    PHASE_DONE,
+    PHASE_RUNS,
+    QUEUED,
+    RUN,
+    RUNNING,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+    s = SqlAlchemyStore()
+    s.init_db(f"sqlite:///{tmp_path / 'auth.db'}")
+    yield s
+    s.engine.dispose()
+
+
+@pytest.fixture
+def repo(store):
+    return store.trash_gc_job_repo
+
+
+class TestEnqueue:
+    def test_a_new_job_is_queued_with_its_filters(self, store):
+        job_id = store.create_trash_gc_job("admin@example.com", older_than="7d", older_than_ms=604800000, run_ids=["r1", "r2"], workspace="team-a")
+
+        job = store.get_trash_gc_job(job_id)
+
+        assert (job.status, job.phase) == (QUEUED, PHASE_COLLECT)
+        assert job.requested_by == "admin@example.com"
+        assert (job.older_than, job.older_than_ms) == ("7d", 604800000)
+        assert job.run_ids == ("r1", "r2")
+        assert job.experiment_ids == ()
+        assert job.workspace == "team-a"
+
+    def test_unknown_job_is_none(self, store):
+        assert store.get_trash_gc_job(12345) is None
+
+
+class TestClaiming:
+    def test_only_one_worker_gets_a_job(self, repo):
+        job_id = repo.create("admin")
+
+        first = repo.claim("worker-a", lease_seconds=300)
+        second = repo.claim("worker-b", lease_seconds=300)
+
+        assert first.id == job_id
+        assert first.status == RUNNING
+        assert first.started_at is not None
+        assert second is None
+
+    def test_oldest_job_is_claimed_first(self, repo):
+        older = repo.create("admin")
+        repo.create("admin")
+
+        assert repo.claim("worker-a", lease_seconds=300).id == older
+
+    def test_an_expired_lease_is_taken_over_and_the_old_worker_is_locked_out(self, repo):
+        job_id = repo.create("admin")
+        repo.claim("worker-a", lease_seconds=300)
+
+        taken = repo.claim("worker-b", lease_seconds=0)
+
+        assert taken.id == job_id
+        assert repo.set_phase(job_id, "worker-a", PHASE_RUNS) is False
+        assert repo.take_batch(job_id, "worker-a", RUN, 10) is None
+        assert repo.set_phase(job_id, "worker-b", PHASE_RUNS) is True
+
+    def test_release_puts_the_job_back_with_its_progress(self, repo):
+        job_id = repo.create("admin")
+        repo.claim("worker-a", lease_seconds=300)
+        repo.start_deleting(job_id, "worker-a", ["r1"], [])
+
+        assert repo.release(job_id, "worker-a") is True
+
+        job = repo.get(job_id)
+        assert (job.status, job.phase, job.total_runs) == (QUEUED, PHASE_RUNS, 1)
+        assert repo.claim("worker-b", lease_seconds=300).id == job_id
+
+
+class TestCheckpoints:
+    def test_batches_take_unfinished_items_in_order(self, repo):
+        job_id = repo.create("admin")
+        repo.claim("worker-a", lease_seconds=300)
+        repo.start_deleting(job_id, "worker-a", ["r1", "r2", "r3"], ["e1"])
+
+        first = repo.take_batch(job_id, "worker-a", RUN, 2)
+        repo.record_batch(job_id, "worker-a", RUN, ["r1"], {"r2": "Run is not in deleted lifecycle stage"})
+        second = repo.take_batch(job_id, "worker-a", RUN, 2)
+
+        assert first == {"r1": False, "r2": False}
+        assert second == {"r3": False}
+        job = repo.get(job_id)
+        assert (job.total_runs, job.deleted_runs, job.failed_runs, job.total_experiments) == (3, 1, 1, 1)
+        assert [(f.kind, f.resource_id, f.error) for f in repo.list_failures(job_id)] == [(RUN, "r2", "Run is not in deleted lifecycle stage")]
+
+    def test_an_unrecorded_batch_is_handed_out_again_as_resumed(self, repo):
+        job_id = repo.create("admin")
+        repo.claim("worker-a", lease_seconds=300)
+        repo.start_deleting(job_id, "worker-a", ["r1", "r2", "r3"], [])
+        repo.take_batch(job_id, "worker-a", RUN, 2)
+
+        repo.claim("worker-b", lease_seconds=0)
+        batch = repo.take_batch(job_id, "worker-b", RUN, 3)
+
+        assert batch == {"r1": True, "r2": True, "r3": False}
+
+    def test_kinds_are_batched_separately(self, repo):
+        job_id = repo.create("admin")
+        repo.claim("worker-a", lease_seconds=300)
+        repo.start_deleting(job_id, "worker-a", ["r1"], ["e1", "e2"])
+
+        assert repo.take_batch(job_id, "worker-a", EXPERIMENT, 10) == {"e1": False, "e2": False}
+
+    def test_finish_closes_the_job_and_frees_the_lease(self, repo):
+        job_id = repo.create("admin")
+        repo.claim("worker-a", lease_seconds=300)
+
+        assert repo.finish(job_id, "worker-a", COMPLETED) is True
+
+        job = repo.get(job_id)
+        assert (job.status, job.phase) == (COMPLETED, PHASE_DONE)
+        assert job.finished_at is not None
+        assert repo.claim("worker-b", lease_seconds=0) is None
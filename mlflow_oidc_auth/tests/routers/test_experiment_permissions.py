@@ -9,6 +9,7 @@ authorization, and error handling.
 from fastapi.testclient import TestClient
 import pytest
 from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 from typing import Any
 
 from mlflow_oidc_auth.routers.experiment_permissions import (
@@ -21,10 +22,7 @@ from mlflow_oidc_auth.routers.experiment_permissions import (
     EXPERIMENT_USER_PERMISSIONS,
 )
 from mlflow_oidc_auth.models import ExperimentSummary
-from mlflow_oidc_auth.entities import (
-    User,
-    ExperimentPermission as ExperimentPermissionEntity,
-)
+from mlflow_oidc_auth.entities import ResourcePrincipal
 
 
 class TestExperimentPermissionsRouter:
@@ -52,12 +50,12 @@ class TestGetExperimentGroupsEndpoint:
     async def test_get_experiment_groups_success(self, mock_store_module: MagicMock, mock_store: MagicMock):
         """Test successful retrieval of experiment groups."""
 
-        mock_store_module.experiment_group_repo.list_groups_for_experiment.return_value = [
-            ("my-group", "READ"),
-            ("admins", "MANAGE"),
-        ]
+        mock_store_module.list_resource_principals.return_value = {
+            "123": [ResourcePrincipal("my-group", "READ", "group", "group"), ResourcePrincipal("admins", "MANAGE", "group", "group")]
+        }
 
         result = await get_experiment_groups(experiment_id="123", _=None)
+        mock_store_module.list_resource_principals.assert_called_once_with("experiment", ["123"], sources=("group",))
         assert len(result) == 2
         assert result[0].name == "my-group"
         assert result[0].permission == "READ"
@@ -69,7 +67,7 @@ class TestGetExperimentGroupsEndpoint:
     def test_get_experiment_groups_integration(self, authenticated_client: TestClient, mock_store: MagicMock):
         """Integration-style check that the route is wired up."""
 
-        mock_store.experiment_group_repo.list_groups_for_experiment.return_value = []
+        mock_store.list_resource_principals.return_value = {"123": []}
         response = authenticated_client.get("/api/2.0/mlflow/permissions/experiments/123/groups")
         assert response.status_code == 200
 
@@ -81,46 +79,19 @@ class TestGetExperimentUsersEndpoint:
     @patch("mlflow_oidc_auth.routers.experiment_permissions.store")
     async def test_get_experiment_users_success(self, mock_store_module: MagicMock, mock_store: MagicMock):
         """Test successful retrieval of experiment users."""
-        # Mock users with experiment permissions
-        user1 = User(
-            id_=1,
-            username="user1@example.com",
-            password_hash="hash1",
-            password_expiration=None,
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            experiment_permissions=[ExperimentPermissionEntity(experiment_id="123", permission="MANAGE")],
-        )
-
-        user2 = User(
-            id_=2,
-            username="service@example.com",
-            password_hash="hash2",
-            password_expiration=None,
-            display_name="Service Account",
-            is_admin=False,
-            is_service_account=True,
-            experiment_permissions=[ExperimentPermissionEntity(experiment_id="123", permission="READ")],
-        )
-
-        user3 = User(
-            id_=3,
-            username="user3@example.com",
-            password_hash="hash3",
-            password_expiration=None,
-            display_name="User 3",
-            is_admin=False,
-            is_service_account=False,
-            experiment_permissions=[],  # No permissions for this experiment
-        )
-
-        mock_store.list_users.return_value = [user1, user2, user3]
-        mock_store_module.list_users = mock_store.list_users
+        mock_store_module.list_resource_principals.return_value = {
+            "123": [
+                ResourcePrincipal("user1@example.com", "MANAGE", "user", "user"),
+                ResourcePrincipal("service@example.com", "READ", "service-account", "user"),
+            ]
+        }
 
         result = await get_experiment_users(experiment_id="123", _="admin@example.com")
 
-        assert len(result) == 2  # Only users with permissions for experiment 123
+        # One reverse lookup for this experiment's direct user grants; no user listing.
+        mock_store_module.list_resource_principals.assert_called_once_with("experiment", ["123"], sources=("user",))
+        mock_store_module.list_users.assert_not_called()
+        assert len(result) == 2
 
         # Check first user
         assert result[0].name == "user1@example.com"
@@ -136,19 +107,7 @@ class TestGetExperimentUsersEndpoint:
     @patch("mlflow_oidc_auth.routers.experiment_permissions.store")
     async def test_get_experiment_users_no_permissions(self, mock_store_module: MagicMock, mock_store: MagicMock):
         """Test getting experiment users when no users have permissions."""
-        user1 = User(
-            id_=1,
-            username="user1@example.com",
-            password_hash="hash1",
-            password_expiration=None,
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            experiment_permissions=[],
-        )
-
-        mock_store.list_users.return_value = [user1]
-        mock_store_module.list_users = mock_store.list_users
+        mock_store_module.list_resource_principals.return_value = {"123": []}
 
         result = await get_experiment_users(experiment_id="123", _="admin@example.com")
 
@@ -156,30 +115,19 @@ class TestGetExperimentUsersEndpoint:
 
     @pytest.mark.asyncio
     @patch("mlflow_oidc_auth.routers.experiment_permissions.store")
-    async def test_get_experiment_users_multiple_experiments(self, mock_store_module: MagicMock, mock_store: MagicMock):
-        """Test getting users for specific experiment when users have multiple experiment permissions."""
-        user1 = User(
-            id_=1,
-            username="user1@example.com",
-            password_hash="hash1",
-            password_expiration=None,
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            experiment_permissions=[
-                ExperimentPermissionEntity(experiment_id="123", permission="MANAGE"),
-                ExperimentPermissionEntity(experiment_id="456", permission="READ"),
-            ],
-        )
-
-        mock_store.list_users.return_value = [user1]
-        mock_store_module.list_users = mock_store.list_users
+    async def test_get_experiment_users_lists_direct_grants_only(self, mock_store_module: MagicMock, mock_store: MagicMock):
+        """Group and regex grants are not listed as user permissions."""
+        mock_store_module.list_resource_principals.return_value = {
+            "123": [
+                ResourcePrincipal("user1@example.com", "MANAGE", "user", "user"),
+                ResourcePrincipal("team", "READ", "group", "group"),
+                ResourcePrincipal("user2@example.com", "READ", "user", "regex", regex="^exp"),
+            ]
+        }
 
         result = await get_experiment_users(experiment_id="123", _="admin@example.com")
 
-        assert len(result) == 1
-        assert result[0].name == "user1@example.com"
-        assert result[0].permission == "MANAGE"  # Should get permission for experiment 123
+        assert [(r.name, r.permission) for r in result] == [("user1@example.com", "MANAGE")]
 
     def test_get_experiment_users_integration(self, authenticated_client: TestClient):
         """Test get experiment users endpoint through FastAPI test client."""
@@ -346,6 +294,21 @@ class TestListExperimentsEndpoint:
         assert len(result) == 1
         assert result[0].tags is None
 
+    @pytest.mark.asyncio
+    @patch("mlflow_oidc_auth.routers.experiment_permissions._get_tracking_store")
+    async def test_list_experiments_regular_user_from_index(self, mock_get_tracking_store: MagicMock, mock_tracking_store: MagicMock):
+        """A resource index answers without listing every experiment."""
+        mock_get_tracking_store.return_value = mock_tracking_store
+        indexed = MagicMock(experiment_id="7", tags={})
+        indexed.name = "Indexed"
+
+        with patch("mlflow_oidc_auth.routers.experiment_permissions.list_experiments_from_index", return_value=[indexed]) as from_index:
+            result = await list_experiments(username="user@example.com", is_admin=False)
+
+        from_index.assert_called_once_with(mock_tracking_store, "user@example.com", manage=True)
+        mock_tracking_store.search_experiments.assert_not_called()
+        assert [(e.id, e.name) for e in result] == [("7", "Indexed")]
+
     def test_list_experiments_integration_admin(self, admin_client: TestClient):
         """Test list experiments endpoint through FastAPI test client as admin."""
         response = admin_client.get("/api/2.0/mlflow/permissions/experiments")
@@ -490,3 +453,48 @@ class TestExperimentPermissionsRouterIntegration:
             assert (end_time - start_time) < 5.0
             # Authenticated client should receive a response (allow common auth/route codes)
             assert response.status_code in [200, 401, 403, 404]
+
+
+class TestListingOffTheEventLoop:
+    """An admin listing every experiment must not stall other requests on the worker."""
+
+    @staticmethod
+    def _app():
+        from fastapi import FastAPI
+
+        from mlflow_oidc_auth.utils import get_is_admin, get_username
+
+        app = FastAPI()
+        app.include_router(experiment_permissions_router)
+        app.dependency_overrides[get_username] = lambda: "admin@example.com"
+        app.dependency_overrides[get_is_admin] = lambda: True
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        return app
+
+    async def test_other_requests_are_served_while_the_listing_runs(self):
+        import asyncio
+        import time
+
+        import httpx
+
+        tracking_store = MagicMock()
+        tracking_store.search_experiments.side_effect = lambda: time.sleep(0.5) or [SimpleNamespace(name="exp", experiment_id="1", tags={})]
+        transport = httpx.ASGITransport(app=self._app())
+
+        with patch("mlflow_oidc_auth.routers.experiment_permissions._get_tracking_store", return_value=tracking_store):
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                listing = asyncio.ensure_future(client.get(experiment_permissions_router.prefix))
+                await asyncio.sleep(0.05)
+                pings = [(await client.get("/ping")).status_code for _ in range(5)]
+                # Called on the loop, the listing would have finished before any ping was served.
+                served_during_listing = not listing.done()
+                response = await listing
+
+        assert pings == [200] * 5
+        assert served_during_listing, "pings waited for the listing"
+        assert response.status_code == 200
+        assert response.json() == [{"name": "exp", "id": "1", "tags": {}}]
@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 
 from mlflow_oidc_auth.dependencies import check_gateway_endpoint_manage_permission
+from mlflow_oidc_auth.entities import ResourcePrincipal
 from mlflow_oidc_auth.utils import get_is_admin, get_username
 
 
@@ -42,12 +43,12 @@ class TestGatewayEndpointPermissionRoutes:
 
     def test_list_gateway_endpoint_users(self, test_app, authenticated_client, mock_store, mock_gateway_permissions):
         """Test listing users with permissions for a gateway endpoint."""
-        # Setup users with gateway endpoint permissions
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        admin_user.gateway_endpoint_permissions = [mock_gateway_permissions("my-endpoint", "MANAGE")]
-        regular_user.gateway_endpoint_permissions = [mock_gateway_permissions("my-endpoint", "READ")]
-        service_user.gateway_endpoint_permissions = []
+        mock_store.list_resource_principals.return_value = {
+            "my-endpoint": [
+                ResourcePrincipal("admin@example.com", "MANAGE", "user", "user"),
+                ResourcePrincipal("user@example.com", "READ", "user", "user"),
+            ]
+        }
 
         with patch("mlflow_oidc_auth.routers.gateway_endpoint_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_ENDPOINT_BASE}/my-endpoint/users")
@@ -65,41 +66,27 @@ class TestGatewayEndpointPermissionRoutes:
             "permission": "READ",
             "kind": "user",
         } in body
-        mock_store.list_users.assert_called_with(all=True)
-
-    def test_list_gateway_endpoint_users_filters_by_endpoint(self, test_app, authenticated_client, mock_store, mock_gateway_permissions):
-        """Test that only users with permissions for the specific endpoint are returned."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        admin_user.gateway_endpoint_permissions = [mock_gateway_permissions("other-endpoint", "MANAGE")]
-        regular_user.gateway_endpoint_permissions = [mock_gateway_permissions("my-endpoint", "READ")]
-        service_user.gateway_endpoint_permissions = [mock_gateway_permissions("my-endpoint", "EDIT")]
+        mock_store.list_resource_principals.assert_called_with("gateway_endpoint", ["my-endpoint"], sources=("user",))
+        mock_store.list_users.assert_not_called()
+
+    def test_list_gateway_endpoint_users_keeps_service_account_kind(self, test_app, authenticated_client, mock_store, mock_gateway_permissions):
+        """Service accounts keep their kind; grants from other sources are not listed."""
+        mock_store.list_resource_principals.return_value = {
+            "my-endpoint": [
+                ResourcePrincipal("service@example.com", "EDIT", "service-account", "user"),
+                ResourcePrincipal("developers", "READ", "group", "group"),
+            ]
+        }
 
         with patch("mlflow_oidc_auth.routers.gateway_endpoint_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_ENDPOINT_BASE}/my-endpoint/users")
 
         assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 2
-        # admin should not be included since they have permissions for a different endpoint
-        assert {
-            "name": "user@example.com",
-            "permission": "READ",
-            "kind": "user",
-        } in body
-        assert {
-            "name": "service@example.com",
-            "permission": "EDIT",
-            "kind": "service-account",
-        } in body
+        assert resp.json() == [{"name": "service@example.com", "permission": "EDIT", "kind": "service-account"}]
 
     def test_list_gateway_endpoint_users_empty(self, test_app, authenticated_client, mock_store, mock_gateway_permissions):
         """Test listing users when no one has permissions for the endpoint."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        admin_user.gateway_endpoint_permissions = []
-        regular_user.gateway_endpoint_permissions = []
-        service_user.gateway_endpoint_permissions = []
+        mock_store.list_resource_principals.return_value = {"unknown-endpoint": []}
 
         with patch("mlflow_oidc_auth.routers.gateway_endpoint_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_ENDPOINT_BASE}/unknown-endpoint/users")
@@ -107,31 +94,18 @@ class TestGatewayEndpointPermissionRoutes:
         assert resp.status_code == 200
         assert resp.json() == []
 
-    def test_list_gateway_endpoint_users_no_gateway_permissions_attr(self, test_app, authenticated_client, mock_store):
-        """Test listing users when users don't have gateway_endpoint_permissions attribute."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        # Remove the attribute entirely
-        if hasattr(admin_user, "gateway_endpoint_permissions"):
-            delattr(admin_user, "gateway_endpoint_permissions")
-        if hasattr(regular_user, "gateway_endpoint_permissions"):
-            delattr(regular_user, "gateway_endpoint_permissions")
-        if hasattr(service_user, "gateway_endpoint_permissions"):
-            delattr(service_user, "gateway_endpoint_permissions")
-
-        with patch("mlflow_oidc_auth.routers.gateway_endpoint_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{GATEWAY_ENDPOINT_BASE}/my-endpoint/users")
+    def test_list_gateway_endpoint_principals_requires_admin(self, test_app, authenticated_client, mock_store):
+        """The batch endpoint is for the admin permission matrix only."""
+        resp = authenticated_client.get(f"{GATEWAY_ENDPOINT_BASE}/principals?name=my-endpoint")
 
-        assert resp.status_code == 200
-        assert resp.json() == []
+        assert resp.status_code == 403
+        mock_store.list_resource_principals.assert_not_called()
 
     def test_list_gateway_endpoint_groups(self, test_app, authenticated_client, mock_store, mock_gateway_permissions):
         """Test listing groups with permissions for a gateway endpoint."""
-        # Mock the repository method to return groups with permissions
-        mock_store.gateway_endpoint_group_repo.list_groups_for_endpoint.return_value = [
-            ("developers", "READ"),
-            ("admins", "MANAGE"),
-        ]
+        mock_store.list_resource_principals.return_value = {
+            "my-endpoint": [ResourcePrincipal("developers", "READ", "group", "group"), ResourcePrincipal("admins", "MANAGE", "group", "group")]
+        }
 
         with patch("mlflow_oidc_auth.routers.gateway_endpoint_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_ENDPOINT_BASE}/my-endpoint/groups")
@@ -141,26 +115,20 @@ class TestGatewayEndpointPermissionRoutes:
         assert len(body) == 2
         assert {"kind": "group", "name": "developers", "permission": "READ"} in body
         assert {"kind": "group", "name": "admins", "permission": "MANAGE"} in body
-        mock_store.gateway_endpoint_group_repo.list_groups_for_endpoint.assert_called_with("my-endpoint")
+        mock_store.list_resource_principals.assert_called_with("gateway_endpoint", ["my-endpoint"], sources=("group",))
 
-    def test_list_gateway_endpoint_groups_filters_by_endpoint(self, test_app, authenticated_client, mock_store, mock_gateway_permissions):
-        """Test that only groups with permissions for the specific endpoint are returned."""
-        # Only one group has permission for this endpoint
-        mock_store.gateway_endpoint_group_repo.list_groups_for_endpoint.return_value = [
-            ("admins", "MANAGE"),
-        ]
+    def test_list_gateway_endpoint_groups_backend_error(self, test_app, authenticated_client, mock_store, mock_gateway_permissions):
+        """A failed lookup is a 500, not a partial listing."""
+        mock_store.list_resource_principals.side_effect = RuntimeError("db down")
 
         with patch("mlflow_oidc_auth.routers.gateway_endpoint_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_ENDPOINT_BASE}/my-endpoint/groups")
 
-        assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 1
-        assert {"kind": "group", "name": "admins", "permission": "MANAGE"} in body
+        assert resp.status_code == 500
 
     def test_list_gateway_endpoint_groups_empty(self, test_app, authenticated_client, mock_store, mock_gateway_permissions):
         """Test listing groups when no group has permissions for the endpoint."""
-        mock_store.gateway_endpoint_group_repo.list_groups_for_endpoint.return_value = []
+        mock_store.list_resource_principals.return_value = {"unknown-endpoint": []}
 
         with patch("mlflow_oidc_auth.routers.gateway_endpoint_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_ENDPOINT_BASE}/unknown-endpoint/groups")
@@ -7,21 +7,10 @@ import pytest
 from mlflow_oidc_auth.dependencies import (
     check_gateway_model_definition_manage_permission,
 )
+from mlflow_oidc_auth.entities import ResourcePrincipal
 from mlflow_oidc_auth.utils import get_is_admin, get_username
 
 
-@pytest.fixture
-def mock_model_def_permissions():
-    """Create mock gateway model definition permissions for users."""
-
-    class MockModelDefPermission:
-        def __init__(self, model_definition_id: str, permission: str) -> None:
-            self.model_definition_id = model_definition_id
-            self.permission = permission
-
-    return MockModelDefPermission
-
-
 @pytest.fixture
 def override_model_def_manage_permission(test_app):
     """Override the gateway model definition manage permission check."""
@@ -41,107 +30,60 @@ GATEWAY_MODEL_DEF_BASE = "/api/2.0/mlflow/permissions/gateways/model-definitions
 class TestGatewayModelDefinitionPermissionRoutes:
     """Tests for gateway model definition permission routes."""
 
-    def test_list_users(self, test_app, authenticated_client, mock_store, mock_model_def_permissions):
-        """Test listing users with permissions for a gateway model definition."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        admin_user.gateway_model_definition_permissions = [mock_model_def_permissions("my-model", "MANAGE")]
-        regular_user.gateway_model_definition_permissions = [mock_model_def_permissions("my-model", "READ")]
-        service_user.gateway_model_definition_permissions = []
+    def test_list_users(self, test_app, authenticated_client, mock_store):
+        """Test listing users with direct grants on the resource."""
+        mock_store.list_resource_principals.return_value = {
+            "my-model": [ResourcePrincipal("admin@example.com", "MANAGE", "user", "user"), ResourcePrincipal("user@example.com", "READ", "user", "user")]
+        }
 
-        with patch(
-            "mlflow_oidc_auth.routers.gateway_model_definition_permissions.store",
-            mock_store,
-        ):
+        with patch("mlflow_oidc_auth.routers.gateway_model_definition_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/my-model/users")
 
         assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 2
-        assert {
-            "name": "admin@example.com",
-            "permission": "MANAGE",
-            "kind": "user",
-        } in body
-        assert {
-            "name": "user@example.com",
-            "permission": "READ",
-            "kind": "user",
-        } in body
-
-    def test_list_users_filters_by_model(self, test_app, authenticated_client, mock_store, mock_model_def_permissions):
-        """Test that only users with permissions for the specific model are returned."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        admin_user.gateway_model_definition_permissions = [mock_model_def_permissions("other-model", "MANAGE")]
-        regular_user.gateway_model_definition_permissions = [mock_model_def_permissions("my-model", "READ")]
-        service_user.gateway_model_definition_permissions = [mock_model_def_permissions("my-model", "EDIT")]
-
-        with patch(
-            "mlflow_oidc_auth.routers.gateway_model_definition_permissions.store",
-            mock_store,
-        ):
+        assert resp.json() == [
+            {"name": "admin@example.com", "permission": "MANAGE", "kind": "user"},
+            {"name": "user@example.com", "permission": "READ", "kind": "user"},
+        ]
+        mock_store.list_resource_principals.assert_called_once_with("gateway_model_definition", ["my-model"], sources=("user",))
+
+    def test_list_users_keeps_service_account_kind(self, test_app, authenticated_client, mock_store):
+        """Service accounts keep their kind; grants from other sources are not listed."""
+        mock_store.list_resource_principals.return_value = {
+            "my-model": [ResourcePrincipal("service@example.com", "EDIT", "service-account", "user"), ResourcePrincipal("developers", "READ", "group", "group")]
+        }
+
+        with patch("mlflow_oidc_auth.routers.gateway_model_definition_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/my-model/users")
 
         assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 2
-        assert {
-            "name": "user@example.com",
-            "permission": "READ",
-            "kind": "user",
-        } in body
-        assert {
-            "name": "service@example.com",
-            "permission": "EDIT",
-            "kind": "service-account",
-        } in body
-
-    def test_list_users_empty(self, test_app, authenticated_client, mock_store, mock_model_def_permissions):
-        """Test listing users when no one has permissions."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
+        assert resp.json() == [{"name": "service@example.com", "permission": "EDIT", "kind": "service-account"}]
+        mock_store.list_resource_principals.assert_called_once_with("gateway_model_definition", ["my-model"], sources=("user",))
 
-        admin_user.gateway_model_definition_permissions = []
-        regular_user.gateway_model_definition_permissions = []
-        service_user.gateway_model_definition_permissions = []
+    def test_list_users_empty(self, test_app, authenticated_client, mock_store):
+        """Test listing users when no one has permissions."""
+        mock_store.list_resource_principals.return_value = {"unknown": []}
 
-        with patch(
-            "mlflow_oidc_auth.routers.gateway_model_definition_permissions.store",
-            mock_store,
-        ):
+        with patch("mlflow_oidc_auth.routers.gateway_model_definition_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/unknown/users")
 
         assert resp.status_code == 200
         assert resp.json() == []
+        mock_store.list_resource_principals.assert_called_once_with("gateway_model_definition", ["unknown"], sources=("user",))
 
-    def test_list_users_no_attr(self, test_app, authenticated_client, mock_store):
-        """Test when users don't have gateway_model_definition_permissions attribute."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
+    def test_list_principals_requires_admin(self, test_app, authenticated_client, mock_store):
+        """The batch endpoint is for the admin permission matrix only."""
+        resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/principals?name=my-model")
 
-        for user in [admin_user, regular_user, service_user]:
-            if hasattr(user, "gateway_model_definition_permissions"):
-                delattr(user, "gateway_model_definition_permissions")
+        assert resp.status_code == 403
+        mock_store.list_resource_principals.assert_not_called()
 
-        with patch(
-            "mlflow_oidc_auth.routers.gateway_model_definition_permissions.store",
-            mock_store,
-        ):
-            resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/my-model/users")
-
-        assert resp.status_code == 200
-        assert resp.json() == []
+    def test_list_groups(self, test_app, authenticated_client, mock_store):
+        """Test listing groups with permissions for the resource."""
+        mock_store.list_resource_principals.return_value = {
+            "my-model": [ResourcePrincipal("admins", "MANAGE", "group", "group"), ResourcePrincipal("developers", "READ", "group", "group")]
+        }
 
-    def test_list_groups(self, test_app, authenticated_client, mock_store, mock_model_def_permissions):
-        """Test listing groups with permissions for a gateway model definition."""
-        mock_store.gateway_model_definition_group_repo.list_groups_for_model_definition.return_value = [
-            ("developers", "READ"),
-            ("admins", "MANAGE"),
-        ]
-
-        with patch(
-            "mlflow_oidc_auth.routers.gateway_model_definition_permissions.store",
-            mock_store,
-        ):
+        with patch("mlflow_oidc_auth.routers.gateway_model_definition_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/my-model/groups")
 
         assert resp.status_code == 200
@@ -149,59 +91,53 @@ class TestGatewayModelDefinitionPermissionRoutes:
         assert len(body) == 2
         assert {"kind": "group", "name": "developers", "permission": "READ"} in body
         assert {"kind": "group", "name": "admins", "permission": "MANAGE"} in body
+        mock_store.list_resource_principals.assert_called_once_with("gateway_model_definition", ["my-model"], sources=("group",))
 
-    def test_list_groups_empty(self, test_app, authenticated_client, mock_store, mock_model_def_permissions):
+    def test_list_groups_empty(self, test_app, authenticated_client, mock_store):
         """Test listing groups when none have permissions."""
-        mock_store.gateway_model_definition_group_repo.list_groups_for_model_definition.return_value = []
+        mock_store.list_resource_principals.return_value = {"my-model": []}
 
-        with patch(
-            "mlflow_oidc_auth.routers.gateway_model_definition_permissions.store",
-            mock_store,
-        ):
+        with patch("mlflow_oidc_auth.routers.gateway_model_definition_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/my-model/groups")
 
         assert resp.status_code == 200
         assert resp.json() == []
 
-    def test_list_users_name_with_slashes(self, test_app, authenticated_client, mock_store, mock_model_def_permissions):
-        """Test that model definition names containing slashes and colons are routed correctly."""
-        model_name = "us-gov-east-1/anthropic.claude-3-haiku-20240307-v1:0"
+    def test_list_users_name_with_slashes(self, test_app, authenticated_client, mock_store):
+        """Test that names containing slashes and colons are routed correctly."""
+        mock_store.list_resource_principals.return_value = {
+            "us-gov-east-1/anthropic.claude-3-haiku-20240307-v1:0": [ResourcePrincipal("admin@example.com", "MANAGE", "user", "user")]
+        }
 
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-        admin_user.gateway_model_definition_permissions = [mock_model_def_permissions(model_name, "MANAGE")]
-        regular_user.gateway_model_definition_permissions = []
-        service_user.gateway_model_definition_permissions = []
-
-        with patch(
-            "mlflow_oidc_auth.routers.gateway_model_definition_permissions.store",
-            mock_store,
-        ):
-            resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/{model_name}/users")
+        with patch("mlflow_oidc_auth.routers.gateway_model_definition_permissions.store", mock_store):
+            resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/us-gov-east-1/anthropic.claude-3-haiku-20240307-v1:0/users")
 
         assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 1
-        assert body[0]["name"] == "admin@example.com"
-        assert body[0]["permission"] == "MANAGE"
-
-    def test_list_groups_name_with_slashes(self, test_app, authenticated_client, mock_store, mock_model_def_permissions):
-        """Test that model definition names containing slashes and colons work for group listing."""
-        model_name = "us-gov-east-1/anthropic.claude-3-haiku-20240307-v1:0"
-
-        mock_store.gateway_model_definition_group_repo.list_groups_for_model_definition.return_value = [
-            ("developers", "READ"),
-        ]
+        assert resp.json() == [{"name": "admin@example.com", "permission": "MANAGE", "kind": "user"}]
+        mock_store.list_resource_principals.assert_called_once_with(
+            "gateway_model_definition", ["us-gov-east-1/anthropic.claude-3-haiku-20240307-v1:0"], sources=("user",)
+        )
+
+    def test_list_groups_name_with_slashes(self, test_app, authenticated_client, mock_store):
+        """Test that names containing slashes and colons work for group listing."""
+        mock_store.list_resource_principals.return_value = {
+            "us-gov-east-1/anthropic.claude-3-haiku-20240307-v1:0": [
+                ResourcePrincipal("admins", "MANAGE", "group", "group"),
+                ResourcePrincipal("developers", "READ", "group", "group"),
+            ]
+        }
 
-        with patch(
-            "mlflow_oidc_auth.routers.gateway_model_definition_permissions.store",
-            mock_store,
-        ):
-            resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/{model_name}/groups")
+        with patch("mlflow_oidc_auth.routers.gateway_model_definition_permissions.store", mock_store):
+            resp = authenticated_client.get(f"{GATEWAY_MODEL_DEF_BASE}/us-gov-east-1/anthropic.claude-3-haiku-20240307-v1:0/groups")
 
         assert resp.status_code == 200
         body = resp.json()
-        assert len(body) == 1
-        mock_store.gateway_model_definition_group_repo.list_groups_for_model_definition.assert_called_once_with(model_name)
+        assert len(body) == 2
+        assert {"kind": "group", "name": "developers", "permission": "READ"} in body
+        assert {"kind": "group", "name": "admins", "permission": "MANAGE"} in body
+        mock_store.list_resource_principals.assert_called_once_with(
+            "gateway_model_definition", ["us-gov-east-1/anthropic.claude-3-haiku-20240307-v1:0"], sources=("group",)
+        )
 
 
 @pytest.mark.usefixtures("authenticated_session")
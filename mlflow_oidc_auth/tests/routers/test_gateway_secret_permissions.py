@@ -5,21 +5,10 @@ from unittest.mock import patch
 import pytest
 
 from mlflow_oidc_auth.dependencies import check_gateway_secret_manage_permission
+from mlflow_oidc_auth.entities import ResourcePrincipal
 from mlflow_oidc_auth.utils import get_is_admin, get_username
 
 
-@pytest.fixture
-def mock_secret_permissions():
-    """Create mock gateway secret permissions for users."""
-
-    class MockSecretPermission:
-        def __init__(self, secret_id: str, permission: str) -> None:
-            self.secret_id = secret_id
-            self.permission = permission
-
-    return MockSecretPermission
-
-
 @pytest.fixture
 def override_secret_manage_permission(test_app):
     """Override the gateway secret manage permission check."""
@@ -39,90 +28,61 @@ GATEWAY_SECRET_BASE = "/api/2.0/mlflow/permissions/gateways/secrets"
 class TestGatewaySecretPermissionRoutes:
     """Tests for gateway secret permission routes."""
 
-    def test_list_users(self, test_app, authenticated_client, mock_store, mock_secret_permissions):
-        """Test listing users with permissions for a gateway secret."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        admin_user.gateway_secret_permissions = [mock_secret_permissions("my-secret", "MANAGE")]
-        regular_user.gateway_secret_permissions = [mock_secret_permissions("my-secret", "READ")]
-        service_user.gateway_secret_permissions = []
+    def test_list_users(self, test_app, authenticated_client, mock_store):
+        """Test listing users with direct grants on the resource."""
+        mock_store.list_resource_principals.return_value = {
+            "my-secret": [ResourcePrincipal("admin@example.com", "MANAGE", "user", "user"), ResourcePrincipal("user@example.com", "READ", "user", "user")]
+        }
 
         with patch("mlflow_oidc_auth.routers.gateway_secret_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_SECRET_BASE}/my-secret/users")
 
         assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 2
-        assert {
-            "name": "admin@example.com",
-            "permission": "MANAGE",
-            "kind": "user",
-        } in body
-        assert {
-            "name": "user@example.com",
-            "permission": "READ",
-            "kind": "user",
-        } in body
-
-    def test_list_users_filters_by_secret(self, test_app, authenticated_client, mock_store, mock_secret_permissions):
-        """Test that only users with permissions for the specific secret are returned."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        admin_user.gateway_secret_permissions = [mock_secret_permissions("other-secret", "MANAGE")]
-        regular_user.gateway_secret_permissions = [mock_secret_permissions("my-secret", "READ")]
-        service_user.gateway_secret_permissions = [mock_secret_permissions("my-secret", "EDIT")]
+        assert resp.json() == [
+            {"name": "admin@example.com", "permission": "MANAGE", "kind": "user"},
+            {"name": "user@example.com", "permission": "READ", "kind": "user"},
+        ]
+        mock_store.list_resource_principals.assert_called_once_with("gateway_secret", ["my-secret"], sources=("user",))
+
+    def test_list_users_keeps_service_account_kind(self, test_app, authenticated_client, mock_store):
+        """Service accounts keep their kind; grants from other sources are not listed."""
+        mock_store.list_resource_principals.return_value = {
+            "my-secret": [
+                ResourcePrincipal("service@example.com", "EDIT", "service-account", "user"),
+                ResourcePrincipal("developers", "READ", "group", "group"),
+            ]
+        }
 
         with patch("mlflow_oidc_auth.routers.gateway_secret_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_SECRET_BASE}/my-secret/users")
 
         assert resp.status_code == 200
-        body = resp.json()
-        assert len(body) == 2
-        assert {
-            "name": "user@example.com",
-            "permission": "READ",
-            "kind": "user",
-        } in body
-        assert {
-            "name": "service@example.com",
-            "permission": "EDIT",
-            "kind": "service-account",
-        } in body
-
-    def test_list_users_empty(self, test_app, authenticated_client, mock_store, mock_secret_permissions):
-        """Test listing users when no one has permissions."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
+        assert resp.json() == [{"name": "service@example.com", "permission": "EDIT", "kind": "service-account"}]
+        mock_store.list_resource_principals.assert_called_once_with("gateway_secret", ["my-secret"], sources=("user",))
 
-        admin_user.gateway_secret_permissions = []
-        regular_user.gateway_secret_permissions = []
-        service_user.gateway_secret_permissions = []
+    def test_list_users_empty(self, test_app, authenticated_client, mock_store):
+        """Test listing users when no one has permissions."""
+        mock_store.list_resource_principals.return_value = {"unknown": []}
 
         with patch("mlflow_oidc_auth.routers.gateway_secret_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_SECRET_BASE}/unknown/users")
 
         assert resp.status_code == 200
         assert resp.json() == []
+        mock_store.list_resource_principals.assert_called_once_with("gateway_secret", ["unknown"], sources=("user",))
 
-    def test_list_users_no_attr(self, test_app, authenticated_client, mock_store):
-        """Test when users don't have gateway_secret_permissions attribute."""
-        admin_user, regular_user, service_user = mock_store.list_users.return_value
-
-        for user in [admin_user, regular_user, service_user]:
-            if hasattr(user, "gateway_secret_permissions"):
-                delattr(user, "gateway_secret_permissions")
-
-        with patch("mlflow_oidc_auth.routers.gateway_secret_permissions.store", mock_store):
-            resp = authenticated_client.get(f"{GATEWAY_SECRET_BASE}/my-secret/users")
+    def test_list_principals_requires_admin(self, test_app, authenticated_client, mock_store):
+        """The batch endpoint is for the admin permission matrix only."""
+        resp = authenticated_client.get(f"{GATEWAY_SECRET_BASE}/principals?name=my-secret")
 
-        assert resp.status_code == 200
-        assert resp.json() == []
+        assert resp.status_code == 403
+        mock_store.list_resource_principals.assert_not_called()
 
-    def test_list_groups(self, test_app, authenticated_client, mock_store, mock_secret_permissions):
-        """Test listing groups with permissions for a gateway secret."""
-        mock_store.gateway_secret_group_repo.list_groups_for_secret.return_value = [
-            ("developers", "READ"),
-            ("admins", "MANAGE"),
-        ]
+    def test_list_groups(self, test_app, authenticated_client, mock_store):
+        """Test listing groups with permissions for the resource."""
+        mock_store.list_resource_principals.return_value = {
+            "my-secret": [ResourcePrincipal("admins", "MANAGE", "group", "group"), ResourcePrincipal("developers", "READ", "group", "group")]
+        }
 
         with patch("mlflow_oidc_auth.routers.gateway_secret_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_SECRET_BASE}/my-secret/groups")
@@ -132,10 +92,11 @@ class TestGatewaySecretPermissionRoutes:
         assert len(body) == 2
         assert {"kind": "group", "name": "developers", "permission": "READ"} in body
         assert {"kind": "group", "name": "admins", "permission": "MANAGE"} in body
+        mock_store.list_resource_principals.assert_called_once_with("gateway_secret", ["my-secret"], sources=("group",))
 
-    def test_list_groups_empty(self, test_app, authenticated_client, mock_store, mock_secret_permissions):
+    def test_list_groups_empty(self, test_app, authenticated_client, mock_store):
         """Test listing groups when none have permissions."""
-        mock_store.gateway_secret_group_repo.list_groups_for_secret.return_value = []
+        mock_store.list_resource_principals.return_value = {"my-secret": []}
 
         with patch("mlflow_oidc_auth.routers.gateway_secret_permissions.store", mock_store):
             resp = authenticated_client.get(f"{GATEWAY_SECRET_BASE}/my-secret/groups")
@@ -121,6 +121,10 @@ class TestHealthCheckIntegration:
             assert json_response["status"] == "ready"
             assert "checks" in json_response
 
+    def test_runtime_counters_are_not_under_health(self, client):
+        """Pool and audit queue counters are admin-only, not on the unauthenticated probe prefix."""
+        assert client.get("/health/runtime").status_code == 404
+
     def test_ready_endpoint_not_ready(self, client):
         """Test ready endpoint when checks fail."""
         with (
@@ -161,6 +165,16 @@ class TestHealthCheckIntegration:
             assert json_response["status"] == "initializing"
             assert json_response["oidc_initialized"] is False
 
+    def test_startup_endpoint_does_not_expose_discovery_errors(self, client):
+        """The probe is public; why discovery failed is for the logs and /oidc/runtime."""
+        from mlflow_oidc_auth.oauth import ProviderStartup
+
+        startup = {"broken": ProviderStartup(True, "failed", 0.2, "ConnectTimeout: idp.internal:443")}
+        with patch("mlflow_oidc_auth.app.is_oidc_ready", return_value=True), patch("mlflow_oidc_auth.app._oidc_provider_startup", startup):
+            response = client.get("/health/startup")
+
+        assert response.json()["provider_startup"] == {"broken": {"registered": True, "discovery": "failed", "seconds": 0.2}}
+
     def test_nonexistent_health_endpoint(self, client):
         """Test accessing non-existent health endpoint."""
         response = client.get("/health/nonexistent")
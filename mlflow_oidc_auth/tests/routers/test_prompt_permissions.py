@@ -18,10 +18,7 @@ from mlflow_oidc_auth.routers.prompt_permissions import (
     list_prompts,
     prompt_permissions_router,
 )
-from mlflow_oidc_auth.entities import (
-    User,
-    RegisteredModelPermission as RegisteredModelPermissionEntity,
-)
+from mlflow_oidc_auth.entities import ResourcePrincipal
 
 
 class TestPromptPermissionsRouter:
@@ -46,14 +43,14 @@ class TestGetPromptGroupsEndpoint:
 
     @pytest.mark.asyncio
     async def test_get_prompt_groups_success(self, mock_store):
-        mock_store.prompt_group_repo.list_groups_for_prompt.return_value = [
-            ("team-a", "READ"),
-            ("team-b", "MANAGE"),
-        ]
+        mock_store.list_resource_principals.return_value = {
+            "test-prompt": [ResourcePrincipal("team-a", "READ", "group", "group"), ResourcePrincipal("team-b", "MANAGE", "group", "group")]
+        }
 
         with patch("mlflow_oidc_auth.routers.prompt_permissions.store", mock_store):
             result = await get_prompt_groups(prompt_name="test-prompt", _="admin@example.com")
 
+        mock_store.list_resource_principals.assert_called_once_with("prompt", ["test-prompt"], sources=("group",))
         assert len(result) == 2
         assert result[0].name == "team-a"
         assert result[0].permission == "READ"
@@ -63,7 +60,7 @@ class TestGetPromptGroupsEndpoint:
         assert result[1].kind == "group"
 
     def test_get_prompt_groups_integration(self, admin_client, mock_store):
-        mock_store.prompt_group_repo.list_groups_for_prompt.return_value = []
+        mock_store.list_resource_principals.return_value = {"test-prompt": []}
         response = admin_client.get("/api/2.0/mlflow/permissions/prompts/test-prompt/groups")
         assert response.status_code == 200
 
@@ -74,46 +71,20 @@ class TestGetPromptUsersEndpoint:
     @pytest.mark.asyncio
     async def test_get_prompt_users_success(self, mock_store):
         """Test successful retrieval of prompt users."""
-        # Mock users with prompt permissions (stored as registered model permissions)
-        user1 = User(
-            id_=1,
-            username="user1@example.com",
-            password_hash="hash1",
-            password_expiration=None,
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            registered_model_permissions=[RegisteredModelPermissionEntity(name="test-prompt", permission="MANAGE")],
-        )
-
-        user2 = User(
-            id_=2,
-            username="service@example.com",
-            password_hash="hash2",
-            password_expiration=None,
-            display_name="Service Account",
-            is_admin=False,
-            is_service_account=True,
-            registered_model_permissions=[RegisteredModelPermissionEntity(name="test-prompt", permission="READ")],
-        )
-
-        user3 = User(
-            id_=3,
-            username="user3@example.com",
-            password_hash="hash3",
-            password_expiration=None,
-            display_name="User 3",
-            is_admin=False,
-            is_service_account=False,
-            registered_model_permissions=[],  # No permissions for this prompt
-        )
-
-        mock_store.list_users.return_value = [user1, user2, user3]
+        mock_store.list_resource_principals.return_value = {
+            "test-prompt": [
+                ResourcePrincipal("user1@example.com", "MANAGE", "user", "user"),
+                ResourcePrincipal("service@example.com", "READ", "service-account", "user"),
+            ]
+        }
 
         with patch("mlflow_oidc_auth.routers.prompt_permissions.store", mock_store):
             result = await get_prompt_users(prompt_name="test-prompt", _=None)
 
-        assert len(result) == 2  # Only users with permissions for test-prompt
+        # Prompts share the registered model user grants; the store resolves that.
+        mock_store.list_resource_principals.assert_called_once_with("prompt", ["test-prompt"], sources=("user",))
+        mock_store.list_users.assert_not_called()
+        assert len(result) == 2
 
         # Check first user
         assert result[0].name == "user1@example.com"
@@ -128,70 +99,35 @@ class TestGetPromptUsersEndpoint:
     @pytest.mark.asyncio
     async def test_get_prompt_users_no_permissions(self, mock_store):
         """Test getting prompt users when no users have permissions."""
-        user1 = User(
-            id_=1,
-            username="user1@example.com",
-            password_hash="hash1",
-            password_expiration=None,
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            registered_model_permissions=[],
-        )
-
-        mock_store.list_users.return_value = [user1]
+        mock_store.list_resource_principals.return_value = {"test-prompt": []}
 
         result = await get_prompt_users(prompt_name="test-prompt", _=None)
 
         assert len(result) == 0
 
     @pytest.mark.asyncio
-    async def test_get_prompt_users_multiple_prompts(self, mock_store):
-        """Test getting users for specific prompt when users have multiple prompt permissions."""
-        user1 = User(
-            id_=1,
-            username="user1@example.com",
-            password_hash="hash1",
-            password_expiration=None,
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            registered_model_permissions=[
-                RegisteredModelPermissionEntity(name="prompt-1", permission="MANAGE"),
-                RegisteredModelPermissionEntity(name="prompt-2", permission="READ"),
-            ],
-        )
+    async def test_get_prompt_users_lists_direct_grants_only(self, mock_store):
+        """Group and regex grants are not listed as user permissions."""
+        mock_store.list_resource_principals.return_value = {
+            "prompt-1": [
+                ResourcePrincipal("user1@example.com", "MANAGE", "user", "user"),
+                ResourcePrincipal("user2@example.com", "READ", "user", "group-regex", regex="^prompt-"),
+            ]
+        }
 
-        with patch(
-            "mlflow_oidc_auth.routers.prompt_permissions.store.list_users",
-            return_value=[user1],
-        ):
-            result = await get_prompt_users(prompt_name="prompt-1", _=None)
+        result = await get_prompt_users(prompt_name="prompt-1", _=None)
 
-        assert len(result) == 1
-        assert result[0].name == "user1@example.com"
-        assert result[0].permission == "MANAGE"  # Should get permission for prompt-1
+        assert [(r.name, r.permission) for r in result] == [("user1@example.com", "MANAGE")]
 
-    @pytest.mark.asyncio
-    async def test_get_prompt_users_no_registered_model_permissions_attr(self, mock_store):
-        """Test getting users when user object doesn't have registered_model_permissions attribute."""
-        user1 = User(
-            id_=1,
-            username="user1@example.com",
-            password_hash="hash1",
-            password_expiration=None,
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-        )
-        # Set registered_model_permissions to None to simulate missing attribute
-        user1._registered_model_permissions = None
-
-        mock_store.list_users.return_value = [user1]
+    def test_get_prompt_principals_batch(self, admin_client, mock_store):
+        """Admins can list every grant on several prompts in one request."""
+        mock_store.list_resource_principals.return_value = {"prompt-1": [], "prompt-2": [ResourcePrincipal("team", "READ", "group", "group")]}
 
-        result = await get_prompt_users(prompt_name="test-prompt", _=None)
+        response = admin_client.get("/api/2.0/mlflow/permissions/prompts/principals?prompt_name=prompt-1&prompt_name=prompt-2")
 
-        assert len(result) == 0
+        assert response.status_code == 200
+        mock_store.list_resource_principals.assert_called_once_with("prompt", ["prompt-1", "prompt-2"], sources=("user", "group"))
+        assert response.json()["prompt-2"] == [{"name": "team", "permission": "READ", "kind": "group", "source": "group", "regex": None}]
 
     def test_get_prompt_users_integration(self, admin_client):
         """Test get prompt users endpoint through FastAPI test client."""
@@ -18,10 +18,7 @@ from mlflow_oidc_auth.routers.registered_model_permissions import (
     REGISTERED_MODEL_GROUP_PERMISSIONS,
     REGISTERED_MODEL_USER_PERMISSIONS,
 )
-from mlflow_oidc_auth.entities import (
-    User,
-    RegisteredModelPermission as RegisteredModelPermissionEntity,
-)
+from mlflow_oidc_auth.entities import ResourcePrincipal
 
 
 class TestRegisteredModelPermissionsRouter:
@@ -46,14 +43,14 @@ class TestGetRegisteredModelGroupsEndpoint:
 
     @pytest.mark.asyncio
     async def test_get_registered_model_groups_success(self, mock_store):
-        mock_store.registered_model_group_repo.list_groups_for_model.return_value = [
-            ("team-a", "READ"),
-            ("team-b", "MANAGE"),
-        ]
+        mock_store.list_resource_principals.return_value = {
+            "test-model": [ResourcePrincipal("team-a", "READ", "group", "group"), ResourcePrincipal("team-b", "MANAGE", "group", "group")]
+        }
 
         with patch("mlflow_oidc_auth.routers.registered_model_permissions.store", mock_store):
             result = await get_registered_model_groups(name="test-model", _="admin@example.com")
 
+        mock_store.list_resource_principals.assert_called_once_with("registered_model", ["test-model"], sources=("group",))
         assert len(result) == 2
         assert result[0].name == "team-a"
         assert result[0].permission == "READ"
@@ -63,7 +60,7 @@ class TestGetRegisteredModelGroupsEndpoint:
         assert result[1].kind == "group"
 
     def test_get_registered_model_groups_integration(self, admin_client, mock_store):
-        mock_store.registered_model_group_repo.list_groups_for_model.return_value = []
+        mock_store.list_resource_principals.return_value = {"test-model": []}
         response = admin_client.get("/api/2.0/mlflow/permissions/registered-models/test-model/groups")
         assert response.status_code == 200
 
@@ -74,46 +71,20 @@ class TestGetRegisteredModelUsersEndpoint:
     @pytest.mark.asyncio
     async def test_get_registered_model_users_success(self, mock_store):
         """Test successful retrieval of registered model users."""
-        # Mock users with registered model permissions
-        user1 = User(
-            id_=1,
-            username="user1@example.com",
-            password_hash="hash1",
-            password_expiration=None,
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            registered_model_permissions=[RegisteredModelPermissionEntity(name="test-model", permission="MANAGE")],
-        )
-
-        user2 = User(
-            id_=2,
-            username="service@example.com",
-            password_hash="hash2",
-            password_expiration=None,
-            display_name="Service Account",
-            is_admin=False,
-            is_service_account=True,
-            registered_model_permissions=[RegisteredModelPermissionEntity(name="test-model", permission="READ")],
-        )
-
-        user3 = User(
-            id_=3,
-            username="user3@example.com",
-            password_hash="hash3",
-            password_expiration=None,
-            display_name="User 3",
-            is_admin=False,
-            is_service_account=False,
-            registered_model_permissions=[],  # No permissions for this model
-        )
-
-        mock_store.list_users.return_value = [user1, user2, user3]
+        mock_store.list_resource_principals.return_value = {
+            "test-model": [
+                ResourcePrincipal("user1@example.com", "MANAGE", "user", "user"),
+                ResourcePrincipal("service@example.com", "READ", "service-account", "user"),
+            ]
+        }
 
         with patch("mlflow_oidc_auth.routers.registered_model_permissions.store", mock_store):
             result = await get_registered_model_users(name="test-model", _=None)
 
-        assert len(result) == 2  # Only users with permissions for test-model
+        # One reverse lookup for this model's direct user grants; no user listing.
+        mock_store.list_resource_principals.assert_called_once_with("registered_model", ["test-model"], sources=("user",))
+        mock_store.list_users.assert_not_called()
+        assert len(result) == 2
 
         # Check first user
         assert result[0].name == "user1@example.com"
@@ -128,59 +99,50 @@ class TestGetRegisteredModelUsersEndpoint:
     @pytest.mark.asyncio
     async def test_get_registered_model_users_no_permissions(self, mock_store):
         """Test getting registered model users when no users have permissions."""
-        user1 = User(
-            username="user1@example.com",
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            registered_model_permissions=[],
-        )
-
-        mock_store.list_users.return_value = [user1]
+        mock_store.list_resource_principals.return_value = {"test-model": []}
 
         result = await get_registered_model_users(name="test-model", _=None)
 
         assert len(result) == 0
 
     @pytest.mark.asyncio
-    async def test_get_registered_model_users_multiple_models(self, mock_store):
-        """Test getting users for specific model when users have multiple model permissions."""
-        user1 = User(
-            username="user1@example.com",
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-            registered_model_permissions=[
-                RegisteredModelPermissionEntity(name="model-1", permission="MANAGE"),
-                RegisteredModelPermissionEntity(name="model-2", permission="READ"),
-            ],
-        )
-
-        mock_store.list_users.return_value = [user1]
+    async def test_get_registered_model_users_lists_direct_grants_only(self, mock_store):
+        """Group and regex grants are not listed as user permissions."""
+        mock_store.list_resource_principals.return_value = {
+            "model-1": [
+                ResourcePrincipal("user1@example.com", "MANAGE", "user", "user"),
+                ResourcePrincipal("team", "READ", "group", "group"),
+                ResourcePrincipal("user2@example.com", "READ", "user", "regex", regex="^model-"),
+            ]
+        }
 
         result = await get_registered_model_users(name="model-1", _=None)
 
         assert len(result) == 1
         assert result[0].name == "user1@example.com"
-        assert result[0].permission == "MANAGE"  # Should get permission for model-1
+        assert result[0].permission == "MANAGE"
 
-    @pytest.mark.asyncio
-    async def test_get_registered_model_users_no_registered_model_permissions_attr(self, mock_store):
-        """Test getting users when user object doesn't have registered_model_permissions attribute."""
-        user1 = User(
-            username="user1@example.com",
-            display_name="User 1",
-            is_admin=False,
-            is_service_account=False,
-        )
-        # Remove the registered_model_permissions attribute
-        delattr(user1, "registered_model_permissions")
+    def test_get_registered_model_principals_batch(self, admin_client, mock_store):
+        """Admins can list every grant on several models in one request."""
+        mock_store.list_resource_principals.return_value = {
+            "model-1": [ResourcePrincipal("team", "READ", "group", "group")],
+            "model-2": [ResourcePrincipal("user1@example.com", "EDIT", "user", "regex", regex="^model-")],
+        }
 
-        mock_store.list_users.return_value = [user1]
+        response = admin_client.get("/api/2.0/mlflow/permissions/registered-models/principals?name=model-1&name=model-2&include_regex=true")
 
-        result = await get_registered_model_users(name="test-model", _=None)
+        assert response.status_code == 200
+        mock_store.list_resource_principals.assert_called_once_with(
+            "registered_model", ["model-1", "model-2"], sources=("user", "group", "regex", "group-regex")
+        )
+        assert response.json() == {
+            "model-1": [{"name": "team", "permission": "READ", "kind": "group", "source": "group", "regex": None}],
+            "model-2": [{"name": "user1@example.com", "permission": "EDIT", "kind": "user", "source": "regex", "regex": "^model-"}],
+        }
 
-        assert len(result) == 0
+    def test_get_registered_model_principals_batch_requires_admin(self, authenticated_client):
+        response = authenticated_client.get("/api/2.0/mlflow/permissions/registered-models/principals?name=model-1")
+        assert response.status_code == 403
 
     def test_get_registered_model_users_integration(self, admin_client):
         """Test get registered model users endpoint through FastAPI test client."""
@@ -0,0 +1,34 @@
+"""Tests for the admin-only runtime counters router."""
+
+from unittest.mock import patch
+
+from mlflow_oidc_auth.oauth import ProviderStartup
+from mlflow_oidc_auth.routers.runtime import runtime_router
+
+
+class TestRuntimeRouter:
+    def test_router_configuration(self):
+        assert runtime_router.prefix == "/oidc/runtime"
+        assert runtime_router.tags == ["runtime"]
+
+    def test_admin_gets_the_pool_and_audit_counters(self, admin_client):
+        response = admin_client.get("/oidc/runtime")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body) == {"wsgi_bridge", "store_offload", "audit", "provider_startup"}
+        assert {"waiting", "running", "max_threads"} <= set(body["store_offload"])
+        assert "running" in body["audit"]
+
+    def test_admin_sees_why_discovery_failed(self, admin_client):
+        startup = {"broken": ProviderStartup(True, "failed", 0.2, "ConnectTimeout: idp.internal:443")}
+        with patch("mlflow_oidc_auth.app._oidc_provider_startup", startup):
+            response = admin_client.get("/oidc/runtime")
+
+        assert response.json()["provider_startup"]["broken"]["error"] == "ConnectTimeout: idp.internal:443"
+
+    def test_non_admin_is_forbidden(self, authenticated_client):
+        assert authenticated_client.get("/oidc/runtime").status_code == 403
+
+    def test_anonymous_caller_is_rejected(self, client):
+        assert client.get("/oidc/runtime").status_code == 401
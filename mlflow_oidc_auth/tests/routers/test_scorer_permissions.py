@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from mlflow_oidc_auth.entities import ScorerPermission
+from mlflow_oidc_auth.entities import ResourcePrincipal, ScorerPermission
 from mlflow_oidc_auth.utils import get_is_admin, get_username
 
 
@@ -141,10 +141,12 @@ class TestScorerPermissionRoutes:
         assert resp.json()["detail"] == "Failed to retrieve scorers"
 
     def test_list_scorer_groups(self, authenticated_client, mock_store):
-        mock_store.scorer_group_repo.list_groups_for_scorer.return_value = [
-            ("my-group", "READ"),
-            ("admins", "MANAGE"),
-        ]
+        mock_store.list_resource_principals.return_value = {
+            ("123", "my_scorer"): [
+                ResourcePrincipal("my-group", "READ", "group", "group"),
+                ResourcePrincipal("admins", "MANAGE", "group", "group"),
+            ]
+        }
 
         resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/123/my_scorer/groups")
 
@@ -154,10 +156,10 @@ class TestScorerPermissionRoutes:
             {"name": "my-group", "permission": "READ", "kind": "group"},
             {"name": "admins", "permission": "MANAGE", "kind": "group"},
         ]
-        mock_store.scorer_group_repo.list_groups_for_scorer.assert_called_once_with("123", "my_scorer")
+        mock_store.list_resource_principals.assert_called_once_with("scorer", [("123", "my_scorer")], sources=("group",))
 
     def test_list_scorer_groups_handles_backend_error(self, authenticated_client, mock_store):
-        mock_store.scorer_group_repo.list_groups_for_scorer.side_effect = Exception("db down")
+        mock_store.list_resource_principals.side_effect = Exception("db down")
 
         resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/123/my_scorer/groups")
 
@@ -165,9 +167,12 @@ class TestScorerPermissionRoutes:
         assert resp.json()["detail"] == "Failed to retrieve scorer group permissions"
 
     def test_list_scorer_users(self, authenticated_client, mock_store):
-        _admin_user, regular_user, service_user = mock_store.list_users.return_value
-        regular_user.scorer_permissions = [ScorerPermission("123", "my_scorer", "READ", user_id=regular_user.id)]
-        service_user.scorer_permissions = [ScorerPermission("123", "my_scorer", "MANAGE", user_id=service_user.id)]
+        mock_store.list_resource_principals.return_value = {
+            ("123", "my_scorer"): [
+                ResourcePrincipal("user@example.com", "READ", "user", "user"),
+                ResourcePrincipal("service@example.com", "MANAGE", "service-account", "user"),
+            ]
+        }
 
         resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/123/my_scorer/users")
 
@@ -180,12 +185,30 @@ class TestScorerPermissionRoutes:
                 "kind": "service-account",
             },
         ]
-        mock_store.list_users.assert_called_once_with(all=True)
+        mock_store.list_resource_principals.assert_called_once_with("scorer", [("123", "my_scorer")], sources=("user",))
+        mock_store.list_users.assert_not_called()
 
     def test_list_scorer_users_handles_backend_error(self, authenticated_client, mock_store):
-        mock_store.list_users.side_effect = Exception("db offline")
+        mock_store.list_resource_principals.side_effect = Exception("db offline")
 
         resp = authenticated_client.get("/api/3.0/mlflow/permissions/scorers/123/my_scorer/users")
 
         assert resp.status_code == 500
         assert resp.json()["detail"] == "Failed to retrieve scorer user permissions"
+
+    def test_list_scorer_principals_keyed_by_scorer_name(self, admin_client, mock_store):
+        mock_store.list_resource_principals.return_value = {
+            ("123", "my_scorer"): [ResourcePrincipal("eval-team", "EDIT", "group", "group-regex", regex="^my_")],
+            ("123", "other"): [],
+        }
+
+        resp = admin_client.get("/api/3.0/mlflow/permissions/scorers/123/principals?scorer_name=my_scorer&scorer_name=other&include_regex=true")
+
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "my_scorer": [{"name": "eval-team", "permission": "EDIT", "kind": "group", "source": "group-regex", "regex": "^my_"}],
+            "other": [],
+        }
+        mock_store.list_resource_principals.assert_called_once_with(
+            "scorer", [("123", "my_scorer"), ("123", "other")], sources=("user", "group", "regex", "group-regex")
+        )
@@ -12,6 +12,7 @@ from mlflow.exceptions import MlflowException
 
 from mlflow_oidc_auth.routers.trash import (
     _parse_time_delta,
+    get_cleanup_job,
     list_deleted_experiments,
     list_deleted_runs,
     permanently_delete_all_trashed_entities,
@@ -461,92 +462,6 @@ class TestAdditionalTrashBehaviour:
         payload = json.loads(result.body)
         assert "are not in deleted lifecycle stage" in payload["error"]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_delete_runs_and_experiments_happy_path(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
-
-        # Setup run to be deleted
-        run = MagicMock()
-        run.info.run_id = "run-1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "invalid://"
-        run.info.experiment_id = "exp-1"
-        backend_store.get_run.return_value = run
-
-        # _get_deleted_runs returns our run id
-        backend_store._get_deleted_runs.return_value = ["run-1"]
-
-        # Experiment to delete
-        exp = MagicMock()
-        exp.experiment_id = "exp-1"
-        exp.lifecycle_stage = "deleted"
-        exp.last_update_time = 0
-
-        backend_store.get_experiment.return_value = exp
-
-        # Make artifact repo deletion raise InvalidUrlException to exercise that branch
-        from mlflow.exceptions import InvalidUrlException
-
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.side_effect = InvalidUrlException("bad url")
-        mock_get_artifact_repo.return_value = mock_repo
-
-        mock_get_store.return_value = backend_store
-
-        result = await permanently_delete_all_trashed_entities(
-            admin_username="admin@example.com",
-            run_ids="run-1",
-            experiment_ids="exp-1",
-            older_than=None,
-        )
-        assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert payload["deleted_runs"] == ["run-1"]
-        assert payload["deleted_experiments"] == ["exp-1"]
-
-    @pytest.mark.asyncio
-    @pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_run_not_deleted_and_hard_delete_experiment_failure(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-
-        # Run exists but is active
-        run = MagicMock()
-        run.info.run_id = "run-2"
-        run.info.lifecycle_stage = "active"
-        backend_store.get_run.return_value = run
-
-        # Experiment deletion will raise
-        exp = MagicMock()
-        exp.experiment_id = "e2"
-        exp.lifecycle_stage = "deleted"
-        backend_store.get_experiment.return_value = exp
-        backend_store._hard_delete_experiment.side_effect = Exception("boom")
-
-        mock_get_store.return_value = backend_store
-
-        result = await permanently_delete_all_trashed_entities(
-            admin_username="admin@example.com",
-            run_ids="run-2",
-            experiment_ids="e2",
-            older_than=None,
-        )
-        assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        # run should not be deleted and should appear in failed_runs
-        assert any(f["run_id"] == "run-2" for f in payload.get("failed_runs", []))
-        # experiment deletion should have failed
-        assert any(f["experiment_id"] == "e2" for f in payload.get("failed_experiments", []))
-
     @pytest.mark.asyncio
     @patch("mlflow_oidc_auth.routers.trash._get_store")
     async def test_list_deleted_runs_filters_by_experiment(self, mock_get_store):
@@ -606,67 +521,6 @@ class TestAdditionalTrashBehaviour:
         assert excinfo.value.status_code == 500
         assert excinfo.value.detail == "Failed to retrieve deleted runs"
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_fetch_experiments_and_runs(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
-
-        # Implement a simple Page class used by backend search methods
-        class Page(list):
-            def __init__(self, items, token=None):
-                super().__init__(items)
-                self.token = token
-
-            def __add__(self, other):
-                return Page(list(self) + list(other), token=None)
-
-        # Experiment returned by search_experiments
-        exp = MagicMock()
-        exp.experiment_id = "e1"
-        exp.lifecycle_stage = "deleted"
-        exp.last_update_time = 0
-
-        # Run returned by search_runs
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "invalid://"
-        run.info.experiment_id = "e1"
-        run.info.run_name = "rname"
-        run.info.status = "FINISHED"
-        run.info.start_time = 1
-        run.info.end_time = 2
-
-        backend_store.search_experiments.return_value = Page([exp], token=None)
-        backend_store.search_runs.return_value = Page([run], token=None)
-        backend_store._get_deleted_runs.return_value = ["r1"]
-        backend_store.get_run.return_value = run
-
-        # artifact repo raising InvalidUrl triggers warning branch but doesn't fail
-        from mlflow.exceptions import InvalidUrlException
-
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.side_effect = InvalidUrlException("bad url")
-        mock_get_artifact_repo.return_value = mock_repo
-
-        mock_get_store.return_value = backend_store
-
-        result = await permanently_delete_all_trashed_entities(
-            admin_username="admin@example.com",
-            older_than=None,
-            run_ids=None,
-            experiment_ids=None,
-        )
-        assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert payload["deleted_runs"] == ["r1"]
-        assert payload["deleted_experiments"] == ["e1"]
-
     @pytest.mark.asyncio
     @patch("mlflow_oidc_auth.routers.trash._get_store")
     async def test_list_deleted_runs_paged_search_runs(self, mock_get_store):
@@ -726,40 +580,6 @@ class TestAdditionalTrashBehaviour:
             payload = json.loads(result.body)
             assert len(payload["deleted_runs"]) == 2
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_run_not_old_returns_failed_run(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        # no deleted runs older than
-        backend_store._get_deleted_runs.return_value = []
-
-        # run exists and is deleted
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "invalid://"
-        run.info.experiment_id = "e1"
-        run.info.run_name = "r"
-        run.info.status = "FINISHED"
-        run.info.start_time = 1
-        run.info.end_time = 2
-
-        backend_store.get_run.return_value = run
-        mock_get_store.return_value = backend_store
-
-        result = await permanently_delete_all_trashed_entities(
-            admin_username="admin@example.com",
-            older_than="1d",
-            run_ids="r1",
-            experiment_ids=None,
-        )
-        assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert any(f["run_id"] == "r1" for f in payload.get("failed_runs", []))
-
     @pytest.mark.asyncio
     @patch("mlflow_oidc_auth.routers.trash._get_store")
     async def test_cleanup_experiment_age_check_non_old(self, mock_get_store):
@@ -791,107 +611,6 @@ class TestAdditionalTrashBehaviour:
         payload = json.loads(result.body)
         assert "not older than" in payload["error"]
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_fetch_experiments_pages_and_runs(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
-
-        class Page(list):
-            def __init__(self, items, token=None):
-                super().__init__(items)
-                self.token = token
-
-            def __add__(self, other):
-                return Page(list(self) + list(other), token=None)
-
-        exp1 = MagicMock()
-        exp1.experiment_id = "e1"
-        exp2 = MagicMock()
-        exp2.experiment_id = "e2"
-
-        run1 = MagicMock()
-        run1.info.run_id = "r1"
-        run1.info.lifecycle_stage = "deleted"
-        run1.info.artifact_uri = "invalid://"
-        run1.info.experiment_id = "e1"
-        run1.info.run_name = "r"
-        run1.info.status = "FINISHED"
-        run1.info.start_time = 1
-        run1.info.end_time = 2
-        run2 = MagicMock()
-        run2.info.run_id = "r2"
-        run2.info.lifecycle_stage = "deleted"
-        run2.info.artifact_uri = "invalid://"
-        run2.info.experiment_id = "e2"
-        run2.info.run_name = "r"
-        run2.info.status = "FINISHED"
-        run2.info.start_time = 1
-        run2.info.end_time = 2
-
-        # make search_experiments return two pages
-        def search_experiments(view_type, filter_string, page_token=None):
-            if page_token is None:
-                return Page([exp1], token="t")
-            return Page([exp2], token=None)
-
-        # make search_runs return page per experiments group
-        def search_runs(experiment_ids, filter_string, run_view_type, page_token=None):
-            if experiment_ids == ["e1"]:
-                return Page([run1], token=None)
-            if experiment_ids == ["e2"]:
-                return Page([run2], token=None)
-            return Page([], token=None)
-
-        backend_store.search_experiments.side_effect = search_experiments
-        backend_store.search_runs.side_effect = search_runs
-        backend_store._get_deleted_runs.return_value = []
-        backend_store.get_run.side_effect = [run1, run2]
-
-        from mlflow.exceptions import InvalidUrlException
-
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.side_effect = InvalidUrlException("bad url")
-        mock_get_artifact_repo.return_value = mock_repo
-
-        mock_get_store.return_value = backend_store
-
-        result = await permanently_delete_all_trashed_entities(
-            admin_username="admin@example.com",
-            older_than=None,
-            run_ids=None,
-            experiment_ids=None,
-        )
-        assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert set(payload["deleted_experiments"]) == {"e1", "e2"}
-
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_deleted_runs_fetch_failure_is_handled(self, mock_get_store):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        # _get_deleted_runs raises
-        backend_store._get_deleted_runs.side_effect = Exception("boom-fetch")
-        mock_get_store.return_value = backend_store
-
-        result = await permanently_delete_all_trashed_entities(
-            admin_username="admin@example.com",
-            older_than=None,
-            run_ids=None,
-            experiment_ids=None,
-        )
-        assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert payload["deleted_runs"] == []
-        assert payload["deleted_experiments"] == []
-
     @pytest.mark.asyncio
     @patch("mlflow_oidc_auth.routers.trash._get_store")
     async def test_cleanup_older_than_invalid_returns_400(self, mock_get_store):
@@ -934,74 +653,6 @@ class TestAdditionalTrashBehaviour:
         assert excinfo.value.status_code == 500
         assert excinfo.value.detail == "Failed to retrieve deleted runs"
 
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_artifact_delete_exception_is_handled(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        backend_store._hard_delete_run = MagicMock()
-        backend_store._hard_delete_experiment = MagicMock()
-        backend_store._get_deleted_runs.return_value = ["r1"]
-
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "some://"
-        run.info.experiment_id = "e1"
-
-        backend_store.get_run.return_value = run
-        mock_get_store.return_value = backend_store
-
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.side_effect = Exception("boom-artifact")
-        mock_get_artifact_repo.return_value = mock_repo
-
-        result = await permanently_delete_all_trashed_entities(
-            admin_username="admin@example.com",
-            run_ids="r1",
-            experiment_ids=None,
-            older_than=None,
-        )
-        assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert payload["deleted_runs"] == ["r1"]
-
-    @pytest.mark.asyncio
-    @patch("mlflow_oidc_auth.routers.trash.get_artifact_repository")
-    @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_hard_delete_run_failure_records_failed_run(self, mock_get_store, mock_get_artifact_repo):
-        backend_store = MagicMock()
-        # hard delete run will fail
-        backend_store._hard_delete_run.side_effect = Exception("boom-delete")
-        backend_store._get_deleted_runs.return_value = ["r1"]
-
-        run = MagicMock()
-        run.info.run_id = "r1"
-        run.info.lifecycle_stage = "deleted"
-        run.info.artifact_uri = "some://"
-        run.info.experiment_id = "e1"
-
-        backend_store.get_run.return_value = run
-        mock_get_store.return_value = backend_store
-
-        mock_repo = MagicMock()
-        mock_repo.delete_artifacts.return_value = None
-        mock_get_artifact_repo.return_value = mock_repo
-
-        result = await permanently_delete_all_trashed_entities(
-            admin_username="admin@example.com",
-            run_ids="r1",
-            experiment_ids=None,
-            older_than=None,
-        )
-        assert result.status_code == 200
-        import json
-
-        payload = json.loads(result.body)
-        assert any(f["run_id"] == "r1" and "boom-delete" in f["error"] for f in payload.get("failed_runs", []))
-
     def test_parse_time_delta_more_cases(self):
         from mlflow.exceptions import MlflowException
 
@@ -1011,8 +662,10 @@ class TestAdditionalTrashBehaviour:
         assert _parse_time_delta("2d8h5m20s") == int((2 * 24 * 3600 + 8 * 3600 + 5 * 60 + 20) * 1000)
 
     @pytest.mark.asyncio
+    @patch("mlflow_oidc_auth.routers.trash.trash_gc")
+    @patch("mlflow_oidc_auth.routers.trash.store")
     @patch("mlflow_oidc_auth.routers.trash._get_store")
-    async def test_cleanup_skips_experiments_when_not_supported(self, mock_get_store):
+    async def test_cleanup_skips_experiments_when_not_supported(self, mock_get_store, mock_store, mock_trash_gc):
         backend_store = MagicMock()
         backend_store._hard_delete_run = MagicMock()
         # remove _hard_delete_experiment if present
@@ -1021,6 +674,7 @@ class TestAdditionalTrashBehaviour:
         # No runs or experiments to delete
         backend_store._get_deleted_runs.return_value = []
         mock_get_store.return_value = backend_store
+        mock_store.create_trash_gc_job.return_value = 1
 
         import warnings
 
@@ -1032,12 +686,8 @@ class TestAdditionalTrashBehaviour:
                 run_ids=None,
                 experiment_ids=None,
             )
-            assert result.status_code == 200
-            import json
-
-            payload = json.loads(result.body)
-            assert payload["deleted_runs"] == []
-            assert payload["deleted_experiments"] == []
+            assert result.status_code == 202
+            assert mock_store.create_trash_gc_job.call_args.kwargs["experiment_ids"] == []
             # Ensure we warned about experiments not supported
             assert any("does not allow hard-deleting experiments" in str(x.message) for x in w)
 
@@ -1117,3 +767,86 @@ class TestAdditionalTrashBehaviour:
         # _split_csv
         assert _split_csv(None) == []
         assert _split_csv("a, b, ,c") == ["a", "b", "c"]
+
+
+@pytest.fixture
+def auth_store(tmp_path):
+    from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+    s = SqlAlchemyStore()
+    s.init_db(f"sqlite:///{tmp_path / 'auth.db'}")
+    with patch("mlflow_oidc_auth.routers.trash.store", s):
+        yield s
+    s.engine.dispose()
+
+
+class TestCleanupJobs:
+    @pytest.mark.asyncio
+    @patch("mlflow_oidc_auth.routers.trash.trash_gc")
+    @patch("mlflow_oidc_auth.routers.trash._get_store")
+    async def test_cleanup_enqueues_a_job_and_wakes_the_worker(self, mock_get_store, mock_trash_gc, auth_store):
+        backend_store = MagicMock()
+        deleted = MagicMock()
+        deleted.experiment_id = "exp-1"
+        deleted.lifecycle_stage = "deleted"
+        deleted.last_update_time = 0
+        backend_store.get_experiment.return_value = deleted
+        mock_get_store.return_value = backend_store
+
+        result = await permanently_delete_all_trashed_entities(
+            admin_username="admin@example.com",
+            older_than="1d",
+            run_ids="run-1, run-2",
+            experiment_ids="exp-1",
+        )
+
+        assert result.status_code == 202
+        import json
+
+        payload = json.loads(result.body)
+        assert payload["status"] == "queued"
+        assert result.headers["Location"] == f"/oidc/trash/cleanup/{payload['job_id']}"
+        job = auth_store.get_trash_gc_job(payload["job_id"])
+        assert job.requested_by == "admin@example.com"
+        assert (job.older_than, job.older_than_ms) == ("1d", 86400000)
+        assert job.run_ids == ("run-1", "run-2")
+        assert job.experiment_ids == ("exp-1",)
+        mock_trash_gc.notify.assert_called_once()
+        backend_store._hard_delete_run.assert_not_called()
+        backend_store._hard_delete_experiment.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_cleanup_job_reports_progress_and_failures(self, auth_store):
+        from mlflow_oidc_auth.repository.trash_gc_job import RUN
+
+        repo = auth_store.trash_gc_job_repo
+        job_id = auth_store.create_trash_gc_job("admin@example.com", older_than="7d", older_than_ms=604800000)
+        repo.claim("worker-a", lease_seconds=300)
+        repo.start_deleting(job_id, "worker-a", ["r1", "r2"], ["e1"])
+        repo.take_batch(job_id, "worker-a", RUN, 10)
+        repo.record_batch(job_id, "worker-a", RUN, ["r1"], {"r2": "Run is not in deleted lifecycle stage"})
+
+        result = await get_cleanup_job(job_id=job_id, admin_username="admin@example.com")
+
+        assert result.status_code == 200
+        import json
+
+        payload = json.loads(result.body)
+        assert payload["job_id"] == job_id
+        assert (payload["status"], payload["phase"]) == ("running", "runs")
+        assert payload["older_than"] == "7d"
+        assert payload["runs"] == {"total": 2, "deleted": 1, "failed": 1}
+        assert payload["experiments"] == {"total": 1, "deleted": 0, "failed": 0}
+        assert payload["failed_runs"] == [{"run_id": "r2", "error": "Run is not in deleted lifecycle stage"}]
+        assert payload["failed_experiments"] == []
+        assert payload["started_at"] is not None
+        assert payload["finished_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_cleanup_job_unknown_returns_404(self, auth_store):
+        result = await get_cleanup_job(job_id=999, admin_username="admin@example.com")
+
+        assert result.status_code == 404
+        import json
+
+        assert json.loads(result.body) == {"error": "Cleanup job 999 not found"}
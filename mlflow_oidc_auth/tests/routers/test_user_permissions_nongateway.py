@@ -98,6 +98,26 @@ class TestUserExperimentList:
         assert body[0]["id"] == "123"
         assert body[0]["permission"] == "MANAGE"
 
+    def test_list_own_experiments_from_index(self, authenticated_client, mock_store):
+        """A non-admin's own listing comes from their resource index, not a full search."""
+        mock_exp = MagicMock()
+        mock_exp.experiment_id = "7"
+        mock_exp.name = "Mine"
+        perm_result = MagicMock()
+        perm_result.permission.name = "READ"
+        perm_result.kind = "user"
+
+        with (
+            patch(f"{_UP}._get_tracking_store") as mock_ts,
+            patch(f"{_UP}.list_experiments_from_index", return_value=[mock_exp]) as from_index,
+            patch(f"{_UP}.batch_resolve_experiment_permissions", return_value={"7": perm_result}),
+        ):
+            resp = authenticated_client.get(f"{USER_BASE}/user@example.com/experiments")
+        assert resp.status_code == 200
+        assert from_index.call_args.args[1:] == ("user@example.com",) and not from_index.call_args.kwargs
+        mock_ts.return_value.search_experiments.assert_not_called()
+        assert resp.json() == [{"name": "Mine", "id": "7", "permission": "READ", "kind": "user"}]
+
 
 @pytest.mark.usefixtures("authenticated_session", "override_experiment_manage")
 class TestUserExperimentCRUD:
@@ -0,0 +1,316 @@
+"""Tests for the asynchronous audit event pipeline (audit_pipeline.py)."""
+
+import io
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from mlflow_oidc_auth import audit_pipeline
+from mlflow_oidc_auth.audit import emit_audit_event
+from mlflow_oidc_auth.audit_pipeline import (
+    AuditPipeline,
+    AuditSink,
+    HttpSink,
+    LogSink,
+    RotatingFileSink,
+    StreamSink,
+    sinks_from_config,
+)
+from mlflow_oidc_auth.config import config
+
+
+class _HeldSink(AuditSink):
+    """Records batches; while held, the writer waits inside ``write``."""
+
+    name = "held"
+
+    def __init__(self):
+        self.batches = []
+        self.writing = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.closed = False
+
+    def write(self, batch):
+        self.writing.set()
+        self.gate.wait(10)
+        self.batches.append([json.loads(line)["event"] for _, line in batch])
+
+    def close(self):
+        self.closed = True
+
+    def hold(self):
+        self.writing.clear()
+        self.gate.clear()
+
+    @property
+    def events(self):
+        return [event for batch in self.batches for event in batch]
+
+
+class _FailingSink(AuditSink):
+    name = "failing"
+
+    def write(self, batch):
+        raise OSError("disk full")
+
+
+def _record(event):
+    return {"event": event, "actor": "alice"}
+
+
+@pytest.fixture
+def sink():
+    return _HeldSink()
+
+
+@pytest.fixture
+def pipeline(sink):
+    p = AuditPipeline([sink], queue_size=100, batch_size=100, policy="drop-oldest")
+    p.start()
+    yield p
+    sink.gate.set()
+    p.stop(timeout=5)
+
+
+class TestDelivery:
+    def test_events_reach_the_sink_in_order(self, pipeline, sink):
+        for i in range(5):
+            pipeline.submit(logging.INFO, _record(f"e{i}"))
+
+        assert pipeline.flush(timeout=5)
+        assert sink.events == ["e0", "e1", "e2", "e3", "e4"]
+        assert pipeline.stats()["written"] == 5
+
+    def test_events_queued_while_writing_form_one_batch(self, pipeline, sink):
+        sink.hold()
+        pipeline.submit(logging.INFO, _record("first"))
+        assert sink.writing.wait(5)
+        for i in range(10):
+            pipeline.submit(logging.INFO, _record(f"e{i}"))
+
+        sink.gate.set()
+        pipeline.flush(timeout=5)
+
+        assert sink.batches == [["first"], [f"e{i}" for i in range(10)]]
+
+    def test_a_failing_sink_is_counted_and_the_others_still_get_the_batch(self, sink):
+        p = AuditPipeline([_FailingSink(), sink], queue_size=10, batch_size=10, policy="drop-oldest")
+        p.start()
+        p.submit(logging.INFO, _record("e0"))
+        p.flush(timeout=5)
+        p.submit(logging.INFO, _record("e1"))
+        p.stop(timeout=5)
+
+        assert sink.events == ["e0", "e1"]
+        assert (p.stats()["failed"], p.stats()["written"]) == (2, 0)
+
+    def test_stop_writes_what_is_queued_and_closes_the_sinks(self, sink):
+        p = AuditPipeline([sink], queue_size=10, batch_size=1, policy="drop-oldest")
+        p.start()
+        for i in range(5):
+            p.submit(logging.INFO, _record(f"e{i}"))
+
+        assert p.stop(timeout=5) is True
+        assert sink.events == [f"e{i}" for i in range(5)]
+        assert sink.closed is True
+
+
+class TestBackpressure:
+    def test_drop_oldest_keeps_the_newest_and_counts_the_rest(self, sink):
+        p = AuditPipeline([sink], queue_size=3, batch_size=10, policy="drop-oldest")
+        p.start()
+        sink.hold()
+        p.submit(logging.INFO, _record("in-flight"))
+        assert sink.writing.wait(5)
+
+        for i in range(6):
+            p.submit(logging.INFO, _record(f"e{i}"))
+
+        assert p.stats()["dropped"] == 3
+        sink.gate.set()
+        p.stop(timeout=5)
+        assert sink.events == ["in-flight", "e3", "e4", "e5"]
+
+    def test_block_waits_for_room_and_loses_nothing(self, sink):
+        p = AuditPipeline([sink], queue_size=1, batch_size=1, policy="block")
+        p.start()
+        sink.hold()
+        p.submit(logging.INFO, _record("in-flight"))
+        assert sink.writing.wait(5)
+        p.submit(logging.INFO, _record("queued"))
+
+        blocked = threading.Thread(target=p.submit, args=(logging.INFO, _record("blocked")))
+        blocked.start()
+        blocked.join(0.2)
+        assert blocked.is_alive(), "the emitter should wait while the queue is full"
+
+        sink.gate.set()
+        blocked.join(5)
+        p.stop(timeout=5)
+        assert sink.events == ["in-flight", "queued", "blocked"]
+        assert p.stats()["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_block_does_not_wait_on_the_event_loop(self, sink):
+        p = AuditPipeline([sink], queue_size=1, batch_size=1, policy="block")
+        p.start()
+        sink.hold()
+        p.submit(logging.INFO, _record("in-flight"))
+        assert sink.writing.wait(5)
+        p.submit(logging.INFO, _record("queued"))
+
+        started = time.perf_counter()
+        assert p.submit(logging.INFO, _record("from-the-loop")) is True
+        assert time.perf_counter() - started < 1, "a full queue must not stall the event loop"
+
+        sink.gate.set()
+        p.stop(timeout=5)
+        assert sink.events == ["in-flight", "from-the-loop"]
+        assert p.stats()["dropped"] == 1
+
+    def test_a_blocked_emitter_is_turned_away_when_the_pipeline_stops(self, sink):
+        p = AuditPipeline([sink], queue_size=1, batch_size=1, policy="block")
+        p.start()
+        sink.hold()
+        p.submit(logging.INFO, _record("in-flight"))
+        assert sink.writing.wait(5)
+        p.submit(logging.INFO, _record("queued"))
+        accepted = []
+        blocked = threading.Thread(target=lambda: accepted.append(p.submit(logging.INFO, _record("blocked"))))
+        blocked.start()
+        blocked.join(0.2)
+
+        with p._cond:
+            p._stopping = True
+            p._cond.notify_all()
+        blocked.join(5)
+        sink.gate.set()
+        p.stop(timeout=5)
+
+        assert accepted == [False], "the caller must write the event itself"
+        assert "blocked" not in sink.events
+        assert p.submit(logging.INFO, _record("late")) is False
+
+    def test_an_unknown_policy_falls_back_to_drop_oldest(self, sink):
+        assert AuditPipeline([sink], policy="spill").policy == "drop-oldest"
+
+
+class TestEmit:
+    def test_emit_queues_instead_of_writing_when_the_pipeline_runs(self, sink, monkeypatch):
+        monkeypatch.setattr(config, "AUDIT_LOG_ASYNC", True)
+        audit_pipeline.start(sinks=[sink])
+        sink.hold()
+
+        with patch("mlflow_oidc_auth.audit._get_audit_logger") as get_logger:
+            started = time.perf_counter()
+            emit_audit_event("permission.create", "alice", detail={"n": 1})
+            elapsed = time.perf_counter() - started
+
+        get_logger.assert_not_called()
+        assert elapsed < 1, "emit must not wait for the held sink"
+        sink.gate.set()
+        audit_pipeline.shutdown(timeout=5)
+        assert sink.events == ["permission.create"]
+
+    def test_emit_writes_synchronously_once_the_pipeline_is_stopping(self, sink, monkeypatch):
+        monkeypatch.setattr(config, "AUDIT_LOG_ASYNC", True)
+        pipeline = audit_pipeline.start(sinks=[sink])
+        pipeline.stop(timeout=5)
+
+        with patch("mlflow_oidc_auth.audit._get_audit_logger") as get_logger:
+            emit_audit_event("permission.create", "alice")
+
+        get_logger.return_value.log.assert_called_once()
+        audit_pipeline.shutdown(timeout=5)
+
+    def test_emit_writes_synchronously_without_a_pipeline(self):
+        with patch("mlflow_oidc_auth.audit._get_audit_logger") as get_logger:
+            emit_audit_event("permission.create", "alice")
+
+        get_logger.return_value.log.assert_called_once()
+
+    def test_the_caller_may_change_its_detail_after_emitting(self, sink, monkeypatch):
+        monkeypatch.setattr(config, "AUDIT_LOG_ASYNC", True)
+        captured = []
+
+        class Capture(AuditSink):
+            def write(self, batch):
+                captured.extend(json.loads(line)["detail"] for _, line in batch)
+
+        audit_pipeline.start(sinks=[sink, Capture()])
+        sink.hold()
+        detail = {"count": 1}
+        emit_audit_event("bulk.change", "alice", detail=detail)
+        detail["count"] = 2
+        sink.gate.set()
+        audit_pipeline.shutdown(timeout=5)
+
+        assert captured == [{"count": 1}]
+
+    def test_async_can_be_turned_off(self, monkeypatch):
+        monkeypatch.setattr(config, "AUDIT_LOG_ASYNC", False)
+
+        assert audit_pipeline.start() is None
+        assert audit_pipeline.stats() == {"running": False}
+
+
+class TestSinks:
+    def test_stream_sink_writes_one_line_per_event(self):
+        stream = io.StringIO()
+        StreamSink(stream).write([(logging.INFO, '{"a": 1}'), (logging.INFO, '{"b": 2}')])
+
+        assert stream.getvalue() == '{"a": 1}\n{"b": 2}\n'
+
+    def test_file_sink_rotates_and_keeps_backup_count_files(self, tmp_path):
+        path = tmp_path / "audit.log"
+        sink = RotatingFileSink(str(path), max_bytes=50, backup_count=2)
+        for i in range(5):
+            sink.write([(logging.INFO, json.dumps({"event": f"e{i}", "pad": "x" * 20}))])
+        sink.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["audit.log", "audit.log.1", "audit.log.2"]
+        assert json.loads(path.read_text())["event"] == "e4"
+        assert json.loads((tmp_path / "audit.log.2").read_text())["event"] == "e2"
+
+    def test_http_sink_posts_each_batch_as_ndjson(self):
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+                received.append((self.headers["Content-Type"], body))
+                self.send_response(204)
+                self.end_headers()
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            sink = HttpSink(f"http://127.0.0.1:{server.server_address[1]}/audit", timeout=5)
+            sink.write([(logging.INFO, '{"a": 1}'), (logging.INFO, '{"b": 2}')])
+            sink.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert received == [("application/x-ndjson", '{"a": 1}\n{"b": 2}\n')]
+
+    def test_sinks_are_built_from_config(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "AUDIT_SINKS", ["log", "file", "http"])
+        monkeypatch.setattr(config, "AUDIT_FILE_PATH", str(tmp_path / "audit.log"))
+        monkeypatch.setattr(config, "AUDIT_HTTP_URL", None)
+
+        assert [type(s) for s in sinks_from_config()] == [LogSink, RotatingFileSink]
+
+    def test_no_usable_sink_falls_back_to_the_log(self, monkeypatch):
+        monkeypatch.setattr(config, "AUDIT_SINKS", ["kafka"])
+
+        assert [type(s) for s in sinks_from_config()] == [LogSink]
@@ -1,7 +1,9 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 from authlib.jose.errors import BadSignatureError
+from cachetools import TLRUCache
 
 from mlflow_oidc_auth.auth import (
     _claims_options_for,
@@ -31,7 +33,7 @@ class TestGetOidcJwks:
         mock_config.OIDC_VERIFY_SSL = True
 
         discovery_response = MagicMock()
-        discovery_response.json.return_value = {"jwks_uri": "https://example.com/jwks"}
+        discovery_response.json.return_value = {"issuer": "https://example.com", "jwks_uri": "https://example.com/jwks"}
         jwks_response = MagicMock()
         jwks_response.json.return_value = {"keys": [{"kty": "RSA", "kid": "test"}]}
 
@@ -52,7 +54,7 @@ class TestGetOidcJwks:
         mock_config.OIDC_HTTP_TIMEOUT_SECONDS = 3
 
         discovery_response = MagicMock()
-        discovery_response.json.return_value = {"jwks_uri": "https://example.com/jwks"}
+        discovery_response.json.return_value = {"issuer": "https://example.com", "jwks_uri": "https://example.com/jwks"}
         jwks_response = MagicMock()
         jwks_response.json.return_value = {"keys": []}
 
@@ -70,7 +72,7 @@ class TestGetOidcJwks:
         mock_config.OIDC_DISCOVERY_URL = "https://example.com/.well-known/openid_configuration"
 
         discovery_response = MagicMock()
-        discovery_response.json.return_value = {"jwks_uri": "https://example.com/jwks"}
+        discovery_response.json.return_value = {"issuer": "https://example.com", "jwks_uri": "https://example.com/jwks"}
         jwks_response = MagicMock()
         jwks_response.json.return_value = {"keys": [{"kty": "RSA", "kid": "test"}]}
 
@@ -92,7 +94,7 @@ class TestGetOidcJwks:
         mock_config.OIDC_DISCOVERY_URL = "https://example.com/.well-known/openid_configuration"
 
         discovery_response = MagicMock()
-        discovery_response.json.return_value = {"jwks_uri": "https://example.com/jwks"}
+        discovery_response.json.return_value = {"issuer": "https://example.com", "jwks_uri": "https://example.com/jwks"}
         jwks_old = MagicMock()
         jwks_old.json.return_value = {"keys": [{"kty": "RSA", "kid": "old"}]}
         jwks_new = MagicMock()
@@ -136,6 +138,7 @@ class TestValidateToken:
 
         provider = ProviderConfig(id="default", type="oidc", allowed_algorithms=ASYMMETRIC_ALGORITHMS, audience=audience, issuer=issuer)
         mock_config.AUTH_PROVIDERS = RegistryLoadResult(providers=[provider], errors=[], source="legacy")
+        mock_config.OIDC_TOKEN_CACHE_TTL_SECONDS = 300
         return provider
 
     @patch("mlflow_oidc_auth.auth.config")
@@ -321,3 +324,147 @@ class TestClaimsOptionsPerProvider:
             "aud": {"essential": True, "value": "legacy-audience"},
             "iss": {"essential": True, "value": "https://idp.example.com"},
         }
+
+
+class _Claims(dict):
+    """Stands in for authlib's ``JWTClaims``: a dict with ``validate()`` and the token's ``header``."""
+
+    def __init__(self, claims, kid=None):
+        super().__init__(claims)
+        self.header = {"kid": kid} if kid else {}
+
+    def validate(self):
+        pass
+
+
+class TestValidatedTokenCache:
+    """A token that validated once is not decoded again until its ``exp`` or the configured cap."""
+
+    @pytest.fixture
+    def env(self, monkeypatch):
+        import mlflow_oidc_auth.auth as auth_module
+
+        mock_config = MagicMock()
+        TestValidateToken._single_provider_registry(mock_config)
+        mock_config.OIDC_TOKEN_CACHE_TTL_SECONDS = 300
+        monkeypatch.setattr(auth_module, "config", mock_config)
+        get_jwks = MagicMock(return_value={"keys": []})
+        monkeypatch.setattr(auth_module, "_get_oidc_jwks", get_jwks)
+        decoder = MagicMock()
+        monkeypatch.setattr(auth_module, "_jwt_for", lambda provider: decoder)
+        now = [1_000_000.0]
+        monkeypatch.setattr(auth_module.time, "time", lambda: now[0])
+        # The module-level cache captured the real clock; give the test one on the fake clock.
+        cache = TLRUCache(maxsize=16, ttu=lambda _key, entry, _now: entry.expires_at, timer=lambda: now[0])
+        monkeypatch.setattr(auth_module, "_validated_tokens", cache)
+        return SimpleNamespace(config=mock_config, decoder=decoder, get_jwks=get_jwks, now=now)
+
+    def test_second_validation_is_served_from_cache(self, env):
+        env.decoder.decode.return_value = _Claims({"sub": "alice", "exp": env.now[0] + 60})
+
+        first = validate_token("tok")
+        second = validate_token("tok")
+
+        assert second is first
+        assert env.decoder.decode.call_count == 1
+
+    def test_distinct_tokens_are_validated_separately(self, env):
+        env.decoder.decode.side_effect = [_Claims({"sub": "alice"}), _Claims({"sub": "bob"})]
+
+        assert validate_token("tok-a")["sub"] == "alice"
+        assert validate_token("tok-b")["sub"] == "bob"
+
+    def test_entry_expires_at_token_exp(self, env):
+        env.decoder.decode.return_value = _Claims({"sub": "alice", "exp": env.now[0] + 60})
+        validate_token("tok")
+
+        env.now[0] += 61
+        validate_token("tok")
+
+        assert env.decoder.decode.call_count == 2
+
+    def test_entry_lifetime_is_capped(self, env):
+        env.config.OIDC_TOKEN_CACHE_TTL_SECONDS = 30
+        env.decoder.decode.return_value = _Claims({"sub": "alice", "exp": env.now[0] + 3600})
+        validate_token("tok")
+
+        env.now[0] += 29
+        validate_token("tok")
+        env.now[0] += 2
+        validate_token("tok")
+
+        assert env.decoder.decode.call_count == 2
+
+    def test_zero_ttl_disables_the_cache(self, env):
+        env.config.OIDC_TOKEN_CACHE_TTL_SECONDS = 0
+        env.decoder.decode.return_value = _Claims({"sub": "alice"})
+
+        validate_token("tok")
+        validate_token("tok")
+
+        assert env.decoder.decode.call_count == 2
+
+    def test_failures_are_not_cached(self, env):
+        env.decoder.decode.side_effect = [ValueError("expired"), _Claims({"sub": "alice"})]
+
+        with pytest.raises(ValueError):
+            validate_token("tok")
+
+        assert validate_token("tok") == _Claims({"sub": "alice"})
+
+    def test_forced_jwks_refresh_drops_entries_signed_by_a_removed_key(self, env):
+        """A key rotated out must stop vouching for the tokens it signed."""
+        env.get_jwks.return_value = {"keys": [{"kid": "k2"}]}
+        env.decoder.decode.side_effect = [
+            _Claims({"sub": "alice"}, kid="k1"),
+            BadSignatureError("rotated"),
+            _Claims({"sub": "bob"}, kid="k2"),
+            _Claims({"sub": "alice"}, kid="k2"),
+        ]
+        validate_token("tok-a")
+
+        validate_token("tok-b")
+        validate_token("tok-a")
+
+        env.get_jwks.assert_any_call(force_refresh=True)
+        assert env.decoder.decode.call_count == 4
+
+    def test_bad_signature_leaves_other_cached_tokens_in_place(self, env):
+        """A forged token must not empty the cache: entries signed by published keys stay."""
+        env.get_jwks.return_value = {"keys": [{"kid": "k1"}]}
+        env.decoder.decode.side_effect = [
+            _Claims({"sub": "alice"}, kid="k1"),
+            _Claims({"sub": "bob"}, kid="k1"),
+            BadSignatureError("forged"),
+            BadSignatureError("forged"),
+        ]
+        validate_token("tok-a")
+        validate_token("tok-b")
+
+        with pytest.raises(BadSignatureError):
+            validate_token("forged")
+        assert validate_token("tok-a")["sub"] == "alice"
+        assert validate_token("tok-b")["sub"] == "bob"
+
+        env.get_jwks.assert_any_call(force_refresh=True)
+        assert env.decoder.decode.call_count == 4
+
+    def test_cache_keys_are_token_digests(self, env):
+        import mlflow_oidc_auth.auth as auth_module
+
+        env.decoder.decode.return_value = _Claims({"sub": "alice"})
+        validate_token("secret-token")
+
+        assert "secret-token" not in auth_module._validated_tokens
+        assert all(len(key) == 64 for key in auth_module._validated_tokens)
+
+    def test_resolve_token_provider_reuses_the_entry(self, env, monkeypatch):
+        import mlflow_oidc_auth.auth as auth_module
+
+        env.decoder.decode.return_value = _Claims({"sub": "alice"})
+        validate_token("tok")
+        provider = env.config.AUTH_PROVIDERS.providers[0]
+        resolve = MagicMock(side_effect=AssertionError("token decoded again"))
+        monkeypatch.setattr(auth_module, "_resolve_provider", resolve)
+
+        assert auth_module.resolve_token_provider("tok") is provider
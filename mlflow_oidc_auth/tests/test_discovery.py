@@ -0,0 +1,87 @@
+"""Tests for the shared OIDC discovery-document cache (discovery.py)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mlflow_oidc_auth import discovery
+from mlflow_oidc_auth.config import config
+
+URL = "https://idp.example.com/.well-known/openid-configuration"
+DOCUMENT = {"issuer": "https://idp.example.com", "jwks_uri": "https://idp.example.com/jwks"}
+
+
+def _response(document):
+    response = MagicMock()
+    response.json.return_value = document
+    return response
+
+
+class TestCache:
+    def test_a_document_is_fetched_once(self):
+        with patch.object(discovery.requests, "get", return_value=_response(DOCUMENT)) as get:
+            for _ in range(3):
+                assert discovery.get_discovery_document(URL) == DOCUMENT
+
+        get.assert_called_once()
+        assert get.call_args.kwargs["allow_redirects"] is False
+        assert discovery.cached_discovery_document(URL) == DOCUMENT
+
+    def test_a_forced_refresh_replaces_the_cached_document(self):
+        fetch = MagicMock(side_effect=[DOCUMENT, {**DOCUMENT, "jwks_uri": "https://idp.example.com/jwks2"}])
+        discovery.get_discovery_document(URL, fetch=fetch)
+
+        refreshed = discovery.get_discovery_document(URL, fetch=fetch, force_refresh=True)
+
+        assert refreshed["jwks_uri"].endswith("/jwks2")
+        assert discovery.get_discovery_document(URL, fetch=fetch) is refreshed
+
+    def test_a_failed_fetch_is_not_cached(self):
+        fetch = MagicMock(side_effect=[ConnectionError("down"), DOCUMENT])
+        with pytest.raises(ConnectionError):
+            discovery.get_discovery_document(URL, fetch=fetch)
+
+        assert discovery.get_discovery_document(URL, fetch=fetch) == DOCUMENT
+
+    def test_a_document_that_is_not_an_object_is_rejected(self):
+        with pytest.raises(ValueError):
+            discovery.get_discovery_document(URL, fetch=lambda: ["not", "a", "document"])
+
+        assert discovery.cached_discovery_document(URL) is None
+
+    def test_an_error_body_is_returned_but_not_cached(self):
+        fetch = MagicMock(side_effect=[{"error": "temporarily_unavailable"}, DOCUMENT])
+
+        assert discovery.get_discovery_document(URL, fetch=fetch) == {"error": "temporarily_unavailable"}
+        assert discovery.cached_discovery_document(URL) is None
+        assert discovery.get_discovery_document(URL, fetch=fetch) == DOCUMENT
+        assert discovery.cached_discovery_document(URL) == DOCUMENT
+
+    def test_zero_ttl_disables_the_cache(self, monkeypatch):
+        monkeypatch.setattr(config, "OIDC_DISCOVERY_CACHE_TTL_SECONDS", 0)
+        fetch = MagicMock(return_value=DOCUMENT)
+
+        discovery.get_discovery_document(URL, fetch=fetch)
+        discovery.get_discovery_document(URL, fetch=fetch)
+
+        assert fetch.call_count == 2
+
+
+class TestSingleFlight:
+    def test_concurrent_misses_share_one_fetch(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return DOCUMENT
+
+        threads = [threading.Thread(target=discovery.get_discovery_document, args=(URL,), kwargs={"fetch": fetch}) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
@@ -0,0 +1,242 @@
+"""Stale-while-revalidate JWKS against a local stub IdP.
+
+The stub serves a discovery document and a key set over real HTTP, and can hold JWKS responses
+until the test releases them — standing in for an IdP that is slow at the moment keys rotate.
+Every test asserts that callers other than the one that must wait are answered from the cached
+key set while the fetch is held, and that concurrent fetches for one key collapse into one.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from cachetools import TTLCache
+
+import mlflow_oidc_auth.auth as auth_module
+
+_FAST = 0.5  # seconds; generous for a dict lookup, far below the held fetch
+
+
+class _StubIdP:
+    def __init__(self):
+        self.keys = {"keys": [{"kid": "v1"}]}
+        self.hits = {"discovery": 0, "jwks": 0}
+        self.fail = False
+        self.discovery_unavailable = False
+        self.gate = threading.Event()
+        self.gate.set()
+        self.waiting = threading.Event()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path == "/.well-known/openid-configuration":
+                    stub.hits["discovery"] += 1
+                    body = {"issuer": stub.url, "jwks_uri": f"{stub.url}/jwks"}
+                else:
+                    stub.hits["jwks"] += 1
+                    stub.waiting.set()
+                    stub.gate.wait(10)
+                    body = stub.keys
+                status = 500 if stub.fail else 200
+                raw = b"unavailable" if stub.fail else json.dumps(body).encode()
+                if stub.discovery_unavailable and self.path == "/.well-known/openid-configuration":
+                    status, raw = 503, json.dumps({"error": "temporarily_unavailable"}).encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def hold(self):
+        """Hold JWKS responses until :meth:`release`."""
+        self.waiting.clear()
+        self.gate.clear()
+
+    def release(self):
+        self.gate.set()
+
+    def close(self):
+        self.gate.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def _timed(fn):
+    start = time.monotonic()
+    result = fn()
+    return result, time.monotonic() - start
+
+
+@pytest.fixture
+def idp(monkeypatch):
+    stub = _StubIdP()
+    monkeypatch.setattr(auth_module.config, "OIDC_DISCOVERY_URL", f"{stub.url}/.well-known/openid-configuration")
+    monkeypatch.setattr(auth_module.config, "OIDC_HTTP_TIMEOUT_SECONDS", 10)
+    monkeypatch.setattr(auth_module.config, "OIDC_VERIFY_SSL", False)
+    monkeypatch.setattr(auth_module, "_jwks_cache", TTLCache(maxsize=1, ttl=300))
+    monkeypatch.setattr(auth_module, "_jwks_inflight", {})
+    monkeypatch.setattr(auth_module, "_jwks_refresh_due", {})
+    monkeypatch.setattr(auth_module, "_jwks_forced_at", {})
+    yield stub
+    stub.close()
+
+
+def _make_refresh_due():
+    auth_module._jwks_refresh_due[auth_module._JWKS_CACHE_KEY] = 0.0
+
+
+class TestBackgroundRefresh:
+    def test_fetch_schedules_a_refresh_before_expiry(self, idp):
+        auth_module._get_oidc_jwks()
+
+        due = auth_module._jwks_refresh_due[auth_module._JWKS_CACHE_KEY]
+        assert 0 < due - time.monotonic() <= 300 * auth_module._JWKS_REFRESH_AT
+
+    def test_an_idp_error_during_discovery_is_not_cached(self, idp):
+        from mlflow_oidc_auth.discovery import cached_discovery_document
+
+        idp.discovery_unavailable = True
+        with pytest.raises(requests.exceptions.HTTPError):
+            auth_module._get_oidc_jwks()
+        assert cached_discovery_document(auth_module.config.OIDC_DISCOVERY_URL) is None
+
+        idp.discovery_unavailable = False
+        assert auth_module._get_oidc_jwks() == {"keys": [{"kid": "v1"}]}
+
+    def test_fresh_hits_do_not_refetch(self, idp):
+        auth_module._get_oidc_jwks()
+        auth_module._get_oidc_jwks()
+
+        assert idp.hits == {"discovery": 1, "jwks": 1}
+
+    def test_due_refresh_serves_cached_keys_while_fetching(self, idp):
+        auth_module._get_oidc_jwks()
+        _make_refresh_due()
+        idp.keys = {"keys": [{"kid": "v2"}]}
+        idp.hold()
+
+        results, elapsed = _timed(lambda: [auth_module._get_oidc_jwks() for _ in range(20)])
+
+        assert elapsed < _FAST
+        assert all(r == {"keys": [{"kid": "v1"}]} for r in results)
+        assert idp.waiting.wait(5)
+        assert idp.hits["jwks"] == 2, "one background refresh, not one per request"
+
+        idp.release()
+        _wait_until(lambda: auth_module._get_oidc_jwks() == {"keys": [{"kid": "v2"}]})
+        assert idp.hits["jwks"] == 2
+
+    def test_failed_refresh_keeps_serving_and_backs_off(self, idp):
+        auth_module._get_oidc_jwks()
+        _make_refresh_due()
+        idp.fail = True
+
+        assert auth_module._get_oidc_jwks() == {"keys": [{"kid": "v1"}]}
+        _wait_until(lambda: not auth_module._jwks_inflight)
+        assert auth_module._get_oidc_jwks() == {"keys": [{"kid": "v1"}]}
+
+        assert idp.hits == {"discovery": 1, "jwks": 2}, "one failed refresh, then no retry until the backoff passes"
+        assert auth_module._jwks_refresh_due[auth_module._JWKS_CACHE_KEY] > time.monotonic()
+
+
+class TestSingleFlight:
+    def test_concurrent_misses_fetch_once(self, idp):
+        idp.hold()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(auth_module._get_oidc_jwks())) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        assert idp.waiting.wait(5)
+        idp.release()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == [{"keys": [{"kid": "v1"}]}] * 10
+        assert idp.hits == {"discovery": 1, "jwks": 1}
+
+    def test_forced_refresh_does_not_block_other_callers(self, idp):
+        """Rotation: the caller with the bad signature waits; everyone else is served old keys."""
+        auth_module._get_oidc_jwks()
+        idp.keys = {"keys": [{"kid": "v2"}]}
+        idp.hold()
+        forced = []
+        threads = [threading.Thread(target=lambda: forced.append(auth_module._get_oidc_jwks(force_refresh=True))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        assert idp.waiting.wait(5)
+
+        result, elapsed = _timed(auth_module._get_oidc_jwks)
+
+        assert elapsed < _FAST
+        assert result == {"keys": [{"kid": "v1"}]}
+
+        idp.release()
+        for thread in threads:
+            thread.join(5)
+        assert forced == [{"keys": [{"kid": "v2"}]}] * 3
+        assert idp.hits["jwks"] == 2, "the three forced refreshes share one fetch"
+
+    def test_forced_refreshes_are_rate_limited(self, idp, monkeypatch):
+        """A stream of bad signatures costs the IdP one fetch per cooldown, not one per token."""
+        auth_module._get_oidc_jwks()
+        idp.keys = {"keys": [{"kid": "v2"}]}
+
+        assert auth_module._get_oidc_jwks(force_refresh=True) == {"keys": [{"kid": "v2"}]}
+        for _ in range(5):
+            assert auth_module._get_oidc_jwks(force_refresh=True) == {"keys": [{"kid": "v2"}]}
+        assert idp.hits["jwks"] == 2
+
+        monkeypatch.setattr(auth_module, "_JWKS_FORCED_REFRESH_INTERVAL_SECONDS", 0.0)
+        auth_module._get_oidc_jwks(force_refresh=True)
+        assert idp.hits["jwks"] == 3, "once the cooldown has passed a forced refresh fetches again"
+
+    def test_failed_fetch_is_raised_and_not_left_in_flight(self, idp):
+        idp.fail = True
+
+        with pytest.raises(Exception):
+            auth_module._get_oidc_jwks()
+
+        assert not auth_module._jwks_inflight
+
+
+class TestEventLoop:
+    @pytest.mark.asyncio
+    async def test_cold_bearer_validation_does_not_stall_the_loop(self, idp, monkeypatch):
+        """A JWKS miss in the middleware runs on a worker thread while other requests proceed."""
+        from mlflow_oidc_auth.middleware import auth_middleware as middleware_module
+
+        def validate(token):
+            auth_module._get_oidc_jwks()
+            return {"email": "user@example.com"}
+
+        monkeypatch.setattr(middleware_module, "validate_token", validate)
+        middleware = middleware_module.AuthMiddleware(MagicMock())
+        idp.hold()
+
+        bearer = asyncio.create_task(middleware._authenticate_bearer_token("Bearer cold-token"))
+        # Had the fetch run on the loop, this coroutine could not resume until the IdP answered.
+        assert await asyncio.get_running_loop().run_in_executor(None, idp.waiting.wait, 5)
+        assert not bearer.done()
+
+        idp.release()
+        assert await bearer == (True, "user@example.com", "")
@@ -12,6 +12,7 @@ What these tests defend:
 * secrets come from the config chain, never from the registry JSON.
 """
 
+import time
 from contextlib import ExitStack
 from unittest.mock import patch
 
@@ -299,3 +300,76 @@ class TestReset:
 
             assert oauth_mod.get_client("okta") is None
             assert oauth_mod._registered == {}
+
+
+class TestStartProviders:
+    """Discovery is fetched for every provider at once, and startup never waits past the deadline."""
+
+    def _documents(self, delays=None, errors=None):
+        delays, errors = delays or {}, errors or {}
+
+        def fetch(url, **kwargs):
+            host = url.split("//")[1].split(".")[0]
+            time.sleep(delays.get(host, 0))
+            if host in errors:
+                raise errors[host]
+            return {"issuer": f"https://{host}.example.com", "jwks_uri": f"https://{host}.example.com/jwks"}
+
+        return patch.object(oauth_mod, "get_discovery_document", fetch)
+
+    def test_providers_are_fetched_concurrently(self):
+        with (
+            with_registry(provider("okta"), provider("entra"), provider("auth0")),
+            with_secrets(OIDC_CLIENT_SECRET_OKTA="s1", OIDC_CLIENT_SECRET_ENTRA="s2", OIDC_CLIENT_SECRET_AUTH0="s3"),
+            self._documents(delays={"okta": 0.3, "entra": 0.3, "auth0": 0.3}),
+        ):
+            started = time.monotonic()
+            report = oauth_mod.start_providers(timeout=5)
+
+        assert time.monotonic() - started < 0.8
+        assert {pid: r.discovery for pid, r in report.items()} == {"okta": "ok", "entra": "ok", "auth0": "ok"}
+
+    def test_the_client_is_seeded_and_does_not_fetch_again(self):
+        with with_registry(provider("okta")), with_secrets(OIDC_CLIENT_SECRET_OKTA="s1"), self._documents():
+            oauth_mod.start_providers(timeout=5)
+
+        metadata = oauth_mod.get_client("okta").server_metadata
+        assert metadata["issuer"] == "https://okta.example.com"
+        assert "_loaded_at" in metadata
+
+    def test_a_slow_provider_is_reported_without_holding_up_startup(self):
+        with (
+            with_registry(provider("okta"), provider("slow")),
+            with_secrets(OIDC_CLIENT_SECRET_OKTA="s1", OIDC_CLIENT_SECRET_SLOW="s2"),
+            self._documents(delays={"slow": 1.0}),
+        ):
+            started = time.monotonic()
+            report = oauth_mod.start_providers(timeout=0.2)
+
+        assert time.monotonic() - started < 0.6
+        assert report["okta"].discovery == "ok"
+        assert (report["slow"].registered, report["slow"].discovery) == (True, "timeout")
+
+    def test_a_failing_provider_stays_registered(self):
+        with (
+            with_registry(provider("okta"), provider("broken")),
+            with_secrets(OIDC_CLIENT_SECRET_OKTA="s1", OIDC_CLIENT_SECRET_BROKEN="s2"),
+            self._documents(errors={"broken": ConnectionError("connection refused")}),
+        ):
+            report = oauth_mod.start_providers(timeout=5)
+
+        assert report["okta"].discovery == "ok"
+        assert report["broken"].to_dict()["discovery"] == "failed"
+        assert report["broken"].error == "connection refused"
+        assert oauth_mod.get_client("broken") is not None
+
+    def test_unregistered_providers_and_a_zero_timeout_skip_discovery(self):
+        with (
+            with_registry(provider("okta"), provider("nosecret")),
+            with_secrets(OIDC_CLIENT_SECRET_OKTA="s1"),
+            patch.object(oauth_mod, "get_discovery_document") as fetch,
+        ):
+            report = oauth_mod.start_providers(timeout=0)
+
+        fetch.assert_not_called()
+        assert {pid: (r.registered, r.discovery) for pid, r in report.items()} == {"okta": (True, "skipped"), "nosecret": (False, "skipped")}
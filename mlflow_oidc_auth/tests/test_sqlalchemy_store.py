@@ -253,11 +253,23 @@ class TestSqlAlchemyStore:
 
     # Test missing user management methods
     def test_authenticate_user(self, mock_store: SqlAlchemyStore):
-        mock_store.user_repo.authenticate.return_value = True
+        mock_store.user_repo.verify_password.return_value = (True, None)
         result = mock_store.authenticate_user("testuser", "password")
-        mock_store.user_repo.authenticate.assert_called_once_with("testuser", "password")
+        mock_store.user_repo.verify_password.assert_called_once_with("testuser", "password")
         assert result is True
 
+    def test_authenticate_user_reuses_a_recent_verification(self, mock_store: SqlAlchemyStore):
+        mock_store.user_repo.verify_password.return_value = (True, None)
+        assert mock_store.authenticate_user("TestUser", "password") is True
+        assert mock_store.authenticate_user("testuser", "password") is True
+        mock_store.user_repo.verify_password.assert_called_once_with("testuser", "password")
+
+    def test_authenticate_user_does_not_cache_failures(self, mock_store: SqlAlchemyStore):
+        mock_store.user_repo.verify_password.return_value = (False, None)
+        assert mock_store.authenticate_user("testuser", "wrong") is False
+        assert mock_store.authenticate_user("testuser", "wrong") is False
+        assert mock_store.user_repo.verify_password.call_count == 2
+
     def test_create_user(self, mock_store: SqlAlchemyStore):
         mock_user = create_test_user("testuser", "Test User", False, False)
         mock_store.user_repo.create.return_value = mock_user
@@ -593,7 +605,7 @@ class TestSqlAlchemyStoreErrorHandling:
 
     def test_user_operations_with_database_error(self, mock_store):
         """Test user operations when database operations fail"""
-        mock_store.user_repo.authenticate.side_effect = OperationalError("Database error", None, None)
+        mock_store.user_repo.verify_password.side_effect = OperationalError("Database error", None, None)
 
         with pytest.raises(OperationalError):
             mock_store.authenticate_user("testuser", "password")
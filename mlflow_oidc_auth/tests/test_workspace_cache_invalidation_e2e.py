@@ -6,8 +6,9 @@ tests in test_store_cache_invalidation.py assert that a helper was *called*, so
 neutering the helpers themselves (delete_prefix, invalidate_user_workspace_entries,
 invalidate_group_workspace_permission) leaves them green. These tests fail instead.
 
-Every case asserts the REVOKED direction. All three bugs fixed here were fail-open —
-denials are never cached, so only a stale *grant* can be served.
+Most cases assert the REVOKED direction. All three bugs fixed here were fail-open:
+only a stale *grant* could be served. Denials are now cached briefly too, so
+TestCachedDenialIsPurged asserts the GRANTED direction through the same hooks.
 """
 
 import pytest
@@ -187,3 +188,43 @@ class TestPrefixInvalidationDoesNotOverDelete:
         assert cache.get(_make_cache_key("bob", "ws-prod")) is None, "target not invalidated"
         assert cache.get(_make_cache_key("bob2", "ws-prod")) is not None, "over-deleted bob2"
         assert cache.get(_make_cache_key("bobby", "ws-prod")) is not None, "over-deleted bobby"
+
+
+class TestCachedDenialIsPurged:
+    """A cached denial must not outlive a new grant from any source."""
+
+    def test_user_grant_replaces_cached_denial(self, ws_store):
+        ws_store.create_user("ivan@example.com", "pw", "Ivan")
+        assert _cached("ivan@example.com", "ws-prod") is None, "precondition: denial cached"
+
+        ws_store.create_workspace_permission("ws-prod", "ivan@example.com", "READ")
+
+        assert _cached("ivan@example.com", "ws-prod").name == "READ", "stale denial served after a user grant"
+
+    def test_group_grant_replaces_cached_denial(self, ws_store):
+        ws_store.create_user("judy@example.com", "pw", "Judy")
+        ws_store.populate_groups(["team-j"])
+        ws_store.set_user_groups("judy@example.com", ["team-j"])
+        assert _cached("judy@example.com", "ws-prod") is None
+
+        ws_store.create_workspace_group_permission("ws-prod", "team-j", "EDIT")
+
+        assert _cached("judy@example.com", "ws-prod").name == "EDIT", "stale denial served after a group grant"
+
+    def test_membership_change_replaces_cached_denial(self, ws_store):
+        ws_store.create_user("ken@example.com", "pw", "Ken")
+        ws_store.populate_groups(["team-k"])
+        ws_store.create_workspace_group_permission("ws-prod", "team-k", "EDIT")
+        assert _cached("ken@example.com", "ws-prod") is None
+
+        ws_store.set_user_groups("ken@example.com", ["team-k"])
+
+        assert _cached("ken@example.com", "ws-prod").name == "EDIT", "stale denial served after joining a group"
+
+    def test_regex_grant_via_store_replaces_cached_denial(self, ws_store):
+        ws_store.create_user("lena@example.com", "pw", "Lena")
+        assert _cached("lena@example.com", "ws-prod") is None
+
+        ws_store.create_workspace_regex_permission("^ws-.*", 1, "READ", "lena@example.com")
+
+        assert _cached("lena@example.com", "ws-prod").name == "READ", "stale denial served after a regex grant"
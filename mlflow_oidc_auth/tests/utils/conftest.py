@@ -2,12 +2,15 @@
 
 import pytest
 
+import mlflow_oidc_auth.utils.permission_snapshot as _snapshot_mod
 import mlflow_oidc_auth.utils.permissions as _permissions_mod
 
 
 @pytest.fixture(autouse=True)
 def _flush_permission_cache():
-    """Flush the permission cache before each test to prevent cross-test leakage."""
+    """Flush the permission cache and snapshots before each test to prevent cross-test leakage."""
     _permissions_mod._permission_cache = None
+    _snapshot_mod._snapshot_cache = None
     yield
     _permissions_mod._permission_cache = None
+    _snapshot_mod._snapshot_cache = None
@@ -301,9 +301,9 @@ class TestBuildUserPermissionContext:
         ctx = build_user_permission_context("testuser")
 
         assert ctx.group_ids == []
-        assert ctx.group_experiment_regex_permissions == []
-        assert ctx.group_model_regex_permissions == []
-        assert ctx.group_prompt_regex_permissions == []
+        assert len(ctx.group_experiment_regex_permissions) == 0
+        assert len(ctx.group_model_regex_permissions) == 0
+        assert len(ctx.group_prompt_regex_permissions) == 0
 
         # Should NOT call group regex methods when no groups
         mock_store.list_group_experiment_regex_permissions_for_groups_ids.assert_not_called()
@@ -0,0 +1,120 @@
+"""Tests for the verified Basic-auth credential cache in utils/credential_cache.py."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from mlflow_oidc_auth.utils import credential_cache as cc
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cc._cache = None
+    yield
+    cc._cache = None
+
+
+class TestCredentialCache:
+    def test_remembers_a_verification(self):
+        cc.remember_verified("alice", "s3cret", None)
+
+        assert cc.is_verified("alice", "s3cret") is True
+
+    def test_other_password_or_user_is_a_miss(self):
+        cc.remember_verified("alice", "s3cret", None)
+
+        assert cc.is_verified("alice", "guess") is False
+        assert cc.is_verified("bob", "s3cret") is False
+
+    def test_password_is_never_stored(self):
+        cc.remember_verified("alice", "s3cret", None)
+
+        key = cc._make_cache_key("alice", "s3cret")
+        assert "s3cret" not in key
+        assert key.startswith("alice:")
+
+    def test_not_honoured_past_the_expiration(self):
+        cc.remember_verified("alice", "s3cret", datetime.now(timezone.utc) + timedelta(seconds=60))
+        assert cc.is_verified("alice", "s3cret") is True
+
+        with patch.object(cc, "datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime.now(timezone.utc) + timedelta(seconds=61)
+            assert cc.is_verified("alice", "s3cret") is False
+
+    def test_naive_expiration_is_utc(self):
+        cc.remember_verified("alice", "s3cret", datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1))
+
+        assert cc.is_verified("alice", "s3cret") is False
+
+    def test_invalidation_is_per_user(self):
+        cc.remember_verified("alice", "s3cret", None)
+        cc.remember_verified("bob", "hunter2", None)
+
+        cc.invalidate_user_credentials("alice")
+
+        assert cc.is_verified("alice", "s3cret") is False
+        assert cc.is_verified("bob", "hunter2") is True
+
+    def test_zero_ttl_disables(self):
+        with patch.object(cc.config, "BASIC_AUTH_CACHE_TTL_SECONDS", 0):
+            cc.remember_verified("alice", "s3cret", None)
+            assert cc.is_verified("alice", "s3cret") is False
+        assert cc._cache is None
+
+    def test_is_always_in_process(self):
+        """Credential-derived keys never go to a shared backend, whatever CACHE_BACKEND says."""
+        with patch.object(cc.config, "CACHE_BACKEND", "redis"):
+            cc.remember_verified("alice", "s3cret", None)
+
+        assert type(cc._get_cache()).__name__ in ("LocalTTLCacheBackend", "BroadcastCacheBackend")
+
+
+class TestStoreInvalidation:
+    """The store drops a user's cached verifications whenever verification could change."""
+
+    TOKEN = "aB3dE6gH9jK2mN5pQ8sT1vW4"  # shaped like generate_token() output; only ever in a tmp db
+    ROTATED = "zY9xW8vU7tS6rQ5pO4nM3lK2"
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+        s = SqlAlchemyStore()
+        s.init_db(f"sqlite:///{tmp_path / 'auth.db'}")
+        s.create_user("carol@example.com", self.TOKEN, "Carol")
+        s.create_user("admin@example.com", "unused", "Admin", is_admin=True)
+        assert s.authenticate_user("carol@example.com", self.TOKEN) is True
+        assert cc.is_verified("carol@example.com", self.TOKEN)
+        return s
+
+    def test_rotated_password_is_not_served_from_cache(self, store):
+        store.update_user(username="carol@example.com", password=self.ROTATED)
+
+        assert store.authenticate_user("carol@example.com", self.TOKEN) is False
+        assert store.authenticate_user("carol@example.com", self.ROTATED) is True
+
+    def test_new_expiration_drops_the_entry(self, store):
+        store.update_user(username="carol@example.com", password_expiration=datetime.now(timezone.utc) - timedelta(days=1))
+
+        assert store.authenticate_user("carol@example.com", self.TOKEN) is False
+
+    def test_deactivation_drops_the_entry(self, store):
+        store.update_user(username="carol@example.com", active=False)
+
+        assert not cc.is_verified("carol@example.com", self.TOKEN)
+
+    def test_deletion_drops_the_entry(self, store):
+        store.delete_user("carol@example.com")
+
+        assert not cc.is_verified("carol@example.com", self.TOKEN)
+
+    def test_unrelated_update_keeps_the_entry(self, store):
+        store.update_user(username="carol@example.com", is_service_account=True)
+
+        assert cc.is_verified("carol@example.com", self.TOKEN)
+
+    def test_mixed_case_username_shares_the_entry(self, store):
+        with patch.object(store.user_repo, "verify_password") as mock_verify:
+            assert store.authenticate_user("Carol@Example.com", self.TOKEN) is True
+        mock_verify.assert_not_called()
@@ -0,0 +1,150 @@
+"""Tests for the experiment metadata cache used by regex and workspace checks."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from mlflow.exceptions import MlflowException
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from sqlalchemy import event
+
+from mlflow_oidc_auth.utils import experiment_metadata
+from mlflow_oidc_auth.utils.experiment_metadata import (
+    ExperimentMetadata,
+    get_experiment_metadata,
+    get_experiments_metadata,
+    invalidate_experiment_metadata,
+    remember_experiments,
+)
+
+
+@pytest.fixture(scope="module")
+def tracking(tmp_path_factory):
+    """A real MLflow SQL tracking store with a few experiments, one of them tagged."""
+    root = tmp_path_factory.mktemp("tracking")
+    store = SqlAlchemyStore(f"sqlite:///{root}/mlflow.db", str(root / "artifacts"))
+    ids = [store.create_experiment(f"exp-{i}") for i in range(3)]
+    store.set_experiment_tag(ids[0], SimpleNamespace(key="team", value="ml"))
+    return SimpleNamespace(store=store, ids=ids)
+
+
+@pytest.fixture
+def statements(tracking):
+    """Count SELECTs issued against the tracking database."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            seen.append(statement)
+
+    event.listen(tracking.store.engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(tracking.store.engine, "before_cursor_execute", record)
+
+
+class TestSqlStore:
+    def test_bulk_lookup_is_one_query_without_tags(self, tracking, statements):
+        resolved = get_experiments_metadata(tracking.store, tracking.ids)
+
+        assert [resolved[i].name for i in tracking.ids] == ["exp-0", "exp-1", "exp-2"]
+        assert all(m.lifecycle_stage == "active" for m in resolved.values())
+        assert len(statements) == 1
+        assert " IN " in statements[0].upper()
+        assert "experiment_tags" not in statements[0]
+
+    def test_hits_issue_no_query(self, tracking, statements):
+        get_experiments_metadata(tracking.store, tracking.ids)
+        statements.clear()
+
+        assert get_experiment_metadata(tracking.store, tracking.ids[1]).name == "exp-1"
+        assert statements == []
+
+    def test_unknown_experiment_raises_mlflow_error_and_is_not_cached(self, tracking, statements):
+        with pytest.raises(MlflowException):
+            get_experiments_metadata(tracking.store, [tracking.ids[0], "999999"])
+        statements.clear()
+
+        with pytest.raises(MlflowException):
+            get_experiment_metadata(tracking.store, "999999")
+        assert statements
+
+    def test_invalidation_picks_up_a_rename(self, tracking):
+        experiment_id = tracking.store.create_experiment("before")
+        assert get_experiment_metadata(tracking.store, experiment_id).name == "before"
+        tracking.store.rename_experiment(experiment_id, "after")
+
+        assert get_experiment_metadata(tracking.store, experiment_id).name == "before"
+        invalidate_experiment_metadata(experiment_id)
+        assert get_experiment_metadata(tracking.store, experiment_id).name == "after"
+
+    def test_remembered_entities_need_no_query(self, tracking, statements):
+        experiments = [tracking.store.get_experiment(i) for i in tracking.ids]
+        statements.clear()
+
+        remember_experiments(experiments)
+
+        assert get_experiments_metadata(tracking.store, tracking.ids)[tracking.ids[2]].name == "exp-2"
+        assert statements == []
+
+
+class TestOtherStores:
+    """Anything that is not MLflow's SQL store is asked one id at a time, as before."""
+
+    def test_uses_get_experiment_once_per_id(self):
+        store = MagicMock()
+        store.get_experiment.side_effect = lambda i: SimpleNamespace(experiment_id=i, name=f"n-{i}", workspace="ws", lifecycle_stage="active")
+
+        assert get_experiments_metadata(store, ["1", "2", "1"]) == {
+            "1": ExperimentMetadata("1", "n-1", "ws", "active"),
+            "2": ExperimentMetadata("2", "n-2", "ws", "active"),
+        }
+        get_experiment_metadata(store, "1")
+        assert store.get_experiment.call_count == 2
+
+    def test_zero_ttl_disables_the_cache(self, monkeypatch):
+        monkeypatch.setattr(experiment_metadata.config, "EXPERIMENT_METADATA_CACHE_TTL_SECONDS", 0)
+        store = MagicMock()
+        store.get_experiment.return_value = SimpleNamespace(experiment_id="1", name="n", workspace=None, lifecycle_stage="active")
+
+        get_experiment_metadata(store, "1")
+        get_experiment_metadata(store, "1")
+
+        assert store.get_experiment.call_count == 2
+
+
+class TestAfterRequestInvalidation:
+    @pytest.mark.parametrize("path", ["/api/2.0/mlflow/experiments/update", "/api/2.0/mlflow/experiments/delete", "/api/2.0/mlflow/experiments/restore"])
+    def test_lifecycle_endpoints_drop_the_entry(self, path):
+        from mlflow_oidc_auth.hooks.after_request import AFTER_REQUEST_HANDLERS
+
+        handler = AFTER_REQUEST_HANDLERS[(path, "POST")]
+        app = Flask(__name__)
+        with app.test_request_context(path, method="POST", json={"experiment_id": "42"}):
+            with patch("mlflow_oidc_auth.hooks.after_request.invalidate_experiment_metadata") as invalidate:
+                handler(MagicMock())
+
+        invalidate.assert_called_once_with("42")
+
+
+class TestReplicas:
+    @pytest.fixture
+    def other_replica(self, monkeypatch):
+        """This process's cache and a second replica's, joined by an invalidation bus as ``get_cache_backend`` joins them."""
+        from mlflow_oidc_auth.cache.broadcast_backend import BroadcastCacheBackend
+        from mlflow_oidc_auth.cache.invalidation_bus import LocalInvalidationBus
+        from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+
+        bus = LocalInvalidationBus()
+        here = BroadcastCacheBackend(LocalTTLCacheBackend(maxsize=16, ttl=60), "experiment-metadata", bus)
+        monkeypatch.setattr(experiment_metadata, "_cache", here)
+        return BroadcastCacheBackend(LocalTTLCacheBackend(maxsize=16, ttl=60), "experiment-metadata", bus)
+
+    def test_a_rename_drops_the_entry_on_other_replicas(self, other_replica):
+        stale = ExperimentMetadata("42", "old-name", None, "active")
+        remember_experiments([SimpleNamespace(experiment_id="42", name="old-name", workspace=None, lifecycle_stage="active")])
+        other_replica.set("42", stale)
+
+        invalidate_experiment_metadata("42")
+
+        assert other_replica.get("42") is None
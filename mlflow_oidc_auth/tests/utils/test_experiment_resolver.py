@@ -0,0 +1,142 @@
+"""Tests for the run/trace id -> experiment id resolver cache."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from mlflow.entities import TraceInfo
+from mlflow.entities.trace_location import TraceLocation
+from mlflow.entities.trace_state import TraceState
+from mlflow.exceptions import MlflowException
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from sqlalchemy import event
+
+from mlflow_oidc_auth.utils import experiment_resolver
+from mlflow_oidc_auth.utils.experiment_resolver import (
+    experiment_id_for_run,
+    experiment_id_for_trace,
+    experiment_ids_for_runs,
+    experiment_ids_for_traces,
+)
+
+
+@pytest.fixture(scope="module")
+def tracking(tmp_path_factory):
+    """A real MLflow SQL tracking store with runs and traces in two experiments."""
+    root = tmp_path_factory.mktemp("tracking")
+    store = SqlAlchemyStore(f"sqlite:///{root}/mlflow.db", str(root / "artifacts"))
+    first = store.create_experiment("first")
+    second = store.create_experiment("second")
+    runs = {store.create_run(exp, "alice", 0, [], f"run-{i}").info.run_id: exp for i, exp in enumerate([first, first, second])}
+    traces = {}
+    for i, exp in enumerate([first, second]):
+        trace_id = f"tr-{i}"
+        store.start_trace(TraceInfo(trace_id=trace_id, trace_location=TraceLocation.from_experiment_id(exp), request_time=0, state=TraceState.OK))
+        traces[trace_id] = exp
+    return SimpleNamespace(store=store, runs=runs, traces=traces)
+
+
+@pytest.fixture
+def statements(tracking):
+    """Count SELECTs issued against the tracking database."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            seen.append(statement)
+
+    event.listen(tracking.store.engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(tracking.store.engine, "before_cursor_execute", record)
+
+
+class TestSqlStore:
+    def test_bulk_runs_resolve_in_one_query(self, tracking, statements):
+        resolved = experiment_ids_for_runs(tracking.store, list(tracking.runs))
+
+        assert resolved == tracking.runs
+        assert len(statements) == 1
+        assert " IN " in statements[0].upper()
+
+    def test_single_run_selects_only_the_experiment(self, tracking, statements):
+        run_id, experiment_id = next(iter(tracking.runs.items()))
+
+        assert experiment_id_for_run(tracking.store, run_id) == experiment_id
+        assert len(statements) == 1
+        assert "params" not in statements[0] and "metrics" not in statements[0]
+
+    def test_hits_issue_no_query(self, tracking, statements):
+        experiment_ids_for_runs(tracking.store, list(tracking.runs))
+        statements.clear()
+
+        assert experiment_ids_for_runs(tracking.store, list(tracking.runs)) == tracking.runs
+        assert statements == []
+
+    def test_only_misses_are_queried(self, tracking, statements):
+        run_ids = list(tracking.runs)
+        experiment_id_for_run(tracking.store, run_ids[0])
+        statements.clear()
+
+        experiment_ids_for_runs(tracking.store, run_ids)
+
+        assert len(statements) == 1
+
+    def test_traces_resolve_in_one_query(self, tracking, statements):
+        assert experiment_ids_for_traces(tracking.store, list(tracking.traces)) == tracking.traces
+        assert len(statements) == 1
+        assert experiment_id_for_trace(tracking.store, "tr-0") == tracking.traces["tr-0"]
+        assert len(statements) == 1
+
+    def test_unknown_run_raises_mlflow_error(self, tracking):
+        with pytest.raises(MlflowException, match="not found"):
+            experiment_ids_for_runs(tracking.store, [next(iter(tracking.runs)), "does-not-exist"])
+
+    def test_unknown_trace_raises_mlflow_error(self, tracking):
+        with pytest.raises(MlflowException, match="not found"):
+            experiment_id_for_trace(tracking.store, "tr-missing")
+
+    def test_failures_are_not_cached(self, tracking, statements):
+        with pytest.raises(MlflowException):
+            experiment_id_for_run(tracking.store, "does-not-exist")
+        statements.clear()
+
+        with pytest.raises(MlflowException):
+            experiment_id_for_run(tracking.store, "does-not-exist")
+        assert statements
+
+
+class TestOtherStores:
+    """Anything that is not MLflow's SQL store is asked one id at a time, as before."""
+
+    def test_runs_use_get_run(self):
+        store = MagicMock()
+        store.get_run.side_effect = lambda run_id: SimpleNamespace(info=SimpleNamespace(experiment_id=f"exp-{run_id}"))
+
+        assert experiment_ids_for_runs(store, ["a", "b", "a"]) == {"a": "exp-a", "b": "exp-b"}
+        assert store.get_run.call_count == 2
+
+    def test_traces_use_get_trace_info(self):
+        store = MagicMock()
+        store.get_trace_info.return_value = SimpleNamespace(experiment_id="7")
+
+        assert experiment_id_for_trace(store, "t") == "7"
+        assert experiment_id_for_trace(store, "t") == "7"
+        store.get_trace_info.assert_called_once_with("t")
+
+    def test_zero_ttl_disables_the_cache(self, monkeypatch):
+        monkeypatch.setattr(experiment_resolver.config, "EXPERIMENT_RESOLVER_CACHE_TTL_SECONDS", 0)
+        store = MagicMock()
+        store.get_run.return_value = SimpleNamespace(info=SimpleNamespace(experiment_id="1"))
+
+        experiment_id_for_run(store, "a")
+        experiment_id_for_run(store, "a")
+
+        assert store.get_run.call_count == 2
+
+    def test_run_and_trace_ids_do_not_collide(self):
+        store = MagicMock()
+        store.get_run.return_value = SimpleNamespace(info=SimpleNamespace(experiment_id="run-exp"))
+        store.get_trace_info.return_value = SimpleNamespace(experiment_id="trace-exp")
+
+        assert experiment_id_for_run(store, "same-id") == "run-exp"
+        assert experiment_id_for_trace(store, "same-id") == "trace-exp"
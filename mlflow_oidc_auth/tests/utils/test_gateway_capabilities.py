@@ -0,0 +1,187 @@
+"""Tests for the per-user gateway endpoint capability map (utils/gateway_capabilities.py)."""
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from mlflow.store.tracking.dbmodels.models import SqlGatewayEndpoint
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore as TrackingStore
+
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+from mlflow_oidc_auth.utils import gateway_capabilities as caps
+from mlflow_oidc_auth.utils import permissions as perms
+from mlflow_oidc_auth.utils.gateway_capabilities import (
+    can_use_any_gateway_endpoint,
+    gateway_endpoint_permission,
+    get_gateway_capabilities,
+    invalidate_gateway_capabilities,
+)
+
+ALICE = "alice@example.com"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A real auth store, bound where both the map and resolve_permission read it."""
+    s = SqlAlchemyStore()
+    s.init_db(f"sqlite:///{tmp_path / 'auth.db'}")
+    monkeypatch.setattr(perms, "store", s)
+    monkeypatch.setattr(caps, "store", s)
+    monkeypatch.setattr(config, "MLFLOW_ENABLE_WORKSPACES", False)
+    monkeypatch.setattr(config, "PERMISSION_SOURCE_ORDER", ["user", "group", "regex", "group-regex"])
+    monkeypatch.setattr(config, "DEFAULT_MLFLOW_PERMISSION", "NO_PERMISSIONS")
+    s.create_user(ALICE, "pw", "Alice")
+    s.populate_groups(["team"])
+    s.set_user_groups(ALICE, ["team"])
+    yield s
+    s.engine.dispose()
+
+
+@pytest.fixture
+def endpoints(tmp_path):
+    """The gateway endpoints MLflow knows about, in a real tracking store."""
+    tracking = TrackingStore(f"sqlite:///{tmp_path / 'mlflow.db'}", str(tmp_path / "artifacts"))
+
+    def add(*names):
+        with tracking.ManagedSessionMaker() as session:
+            session.execute(
+                SqlGatewayEndpoint.__table__.insert(),
+                [{"endpoint_id": uuid.uuid4().hex, "name": name, "created_at": 0, "last_updated_at": 0} for name in names],
+            )
+
+    with patch("mlflow.server.handlers._get_tracking_store", return_value=tracking):
+        yield add
+    tracking.engine.dispose()
+
+
+@pytest.fixture
+def request_context():
+    with Flask(__name__).test_request_context("/"):
+        yield
+
+
+class TestDecisions:
+    def test_sources_are_folded_in_source_order(self, store, endpoints, request_context):
+        endpoints("chat", "shared", "team-llm", "other")
+        store.create_gateway_endpoint_permission("chat", ALICE, "EDIT")
+        store.create_group_gateway_endpoint_permission("team", "chat", "MANAGE")
+        store.create_group_gateway_endpoint_permission("team", "shared", "USE")
+        store.create_group_gateway_endpoint_regex_permission("team", "^team-", 1, "READ")
+
+        assert (gateway_endpoint_permission("chat", ALICE).kind, gateway_endpoint_permission("chat", ALICE).permission.name) == ("user", "EDIT")
+        assert gateway_endpoint_permission("shared", ALICE).kind == "group"
+        assert gateway_endpoint_permission("team-llm", ALICE).kind == "group-regex"
+        assert (gateway_endpoint_permission("other", ALICE).kind, gateway_endpoint_permission("other", ALICE).permission.name) == ("fallback", "NO_PERMISSIONS")
+
+    def test_every_decision_matches_resolve_permission(self, store, endpoints, request_context, monkeypatch):
+        monkeypatch.setattr(config, "PERMISSION_SOURCE_ORDER", ["regex", "group", "user", "group-regex"])
+        monkeypatch.setattr(config, "DEFAULT_MLFLOW_PERMISSION", "READ")
+        endpoints("prod-a", "prod-b", "dev-a", "shared", "plain")
+        store.create_gateway_endpoint_permission("prod-a", ALICE, "NO_PERMISSIONS")
+        store.create_gateway_endpoint_permission("dev-a", ALICE, "MANAGE")
+        store.create_group_gateway_endpoint_permission("team", "dev-a", "USE")
+        store.create_group_gateway_endpoint_permission("team", "shared", "EDIT")
+        store.create_gateway_endpoint_regex_permission("^prod-", 1, "USE", ALICE)
+        store.create_group_gateway_endpoint_regex_permission("team", ".*", 5, "READ")
+
+        for name in ("prod-a", "prod-b", "dev-a", "shared", "plain", "not-an-endpoint"):
+            assert gateway_endpoint_permission(name, ALICE) == perms.effective_gateway_endpoint_permission(name, ALICE), name
+
+    def test_an_endpoint_the_map_has_not_seen_is_matched_on_lookup(self, store, endpoints, request_context):
+        store.create_gateway_endpoint_regex_permission("^llm-", 1, "USE", ALICE)
+        get_gateway_capabilities(ALICE)
+        endpoints("llm-created-elsewhere")
+
+        assert gateway_endpoint_permission("llm-created-elsewhere", ALICE).kind == "regex"
+
+    def test_an_unknown_user_gets_the_fallback(self, store, request_context):
+        assert gateway_endpoint_permission("chat", "nobody@example.com").kind == "fallback"
+        assert can_use_any_gateway_endpoint("nobody@example.com") is False
+
+
+class TestAnyEndpoint:
+    def test_group_and_regex_grants_count(self, store, endpoints):
+        endpoints("team-llm")
+        assert can_use_any_gateway_endpoint(ALICE) is False
+
+        store.create_group_gateway_endpoint_regex_permission("team", "^team-", 1, "USE")
+
+        assert can_use_any_gateway_endpoint(ALICE) is True
+
+    def test_grants_below_use_do_not_count(self, store):
+        store.create_gateway_endpoint_permission("chat", ALICE, "READ")
+
+        assert can_use_any_gateway_endpoint(ALICE) is False
+
+
+class TestCaching:
+    def test_the_map_is_built_once(self, store, endpoints):
+        store.create_gateway_endpoint_permission("chat", ALICE, "USE")
+
+        with patch.object(caps, "_build", wraps=caps._build) as build:
+            for _ in range(5):
+                get_gateway_capabilities(ALICE)
+
+        assert build.call_count == 1
+
+    def test_a_permission_write_rebuilds_the_map(self, store, request_context):
+        store.create_gateway_endpoint_permission("chat", ALICE, "USE")
+        assert gateway_endpoint_permission("chat", ALICE).permission.can_update is False
+
+        store.update_gateway_endpoint_permission("chat", ALICE, "EDIT")
+
+        assert gateway_endpoint_permission("chat", ALICE).permission.can_update is True
+
+    def test_a_wipe_after_endpoint_deletion_rebuilds_the_map(self, store, request_context):
+        store.create_gateway_endpoint_permission("chat", ALICE, "MANAGE")
+        assert can_use_any_gateway_endpoint(ALICE) is True
+
+        store.wipe_gateway_endpoint_permissions("chat")
+
+        assert can_use_any_gateway_endpoint(ALICE) is False
+
+    def test_endpoint_changes_rebuild_only_maps_built_from_regex(self, store, endpoints):
+        store.populate_groups(["other"])
+        store.create_user("bob@example.com", "pw", "Bob")
+        store.create_gateway_endpoint_regex_permission("^llm-", 1, "USE", ALICE)
+        store.create_gateway_endpoint_permission("chat", "bob@example.com", "USE")
+        alice, bob = get_gateway_capabilities(ALICE), get_gateway_capabilities("bob@example.com")
+
+        invalidate_gateway_capabilities()
+
+        assert get_gateway_capabilities(ALICE) is not alice
+        assert get_gateway_capabilities("bob@example.com") is bob
+
+    def test_zero_ttl_rebuilds_every_time(self, store, monkeypatch):
+        monkeypatch.setattr(config, "GATEWAY_CAPABILITY_TTL_SECONDS", 0)
+
+        assert get_gateway_capabilities(ALICE) is not get_gateway_capabilities(ALICE)
+
+
+class TestReplicas:
+    @pytest.fixture
+    def other_replica(self, monkeypatch):
+        """This process's snapshot cache and a second replica's, joined by an invalidation bus."""
+        from mlflow_oidc_auth.cache.broadcast_backend import BroadcastCacheBackend
+        from mlflow_oidc_auth.cache.invalidation_bus import LocalInvalidationBus
+        from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+        from mlflow_oidc_auth.utils import permission_snapshot
+
+        bus = LocalInvalidationBus()
+        here = BroadcastCacheBackend(LocalTTLCacheBackend(maxsize=16, ttl=60), "permission-snapshot", bus)
+        monkeypatch.setattr(permission_snapshot, "_snapshot_cache", here)
+        return BroadcastCacheBackend(LocalTTLCacheBackend(maxsize=16, ttl=60), "permission-snapshot", bus)
+
+    def test_a_revoke_on_another_replica_rebuilds_the_map(self, store, other_replica):
+        store.create_gateway_endpoint_permission("chat", ALICE, "USE")
+        assert can_use_any_gateway_endpoint(ALICE) is True
+
+        # The other replica writes the shared database and publishes its invalidation;
+        # this process's generation counters never move.
+        with patch("mlflow_oidc_auth.sqlalchemy_store._invalidate_permission_snapshots"):
+            store.delete_gateway_endpoint_permission("chat", ALICE)
+        other_replica.delete(ALICE)
+
+        assert can_use_any_gateway_endpoint(ALICE) is False
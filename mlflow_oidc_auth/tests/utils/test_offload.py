@@ -0,0 +1,133 @@
+"""Tests for running blocking store calls off the event loop."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mlflow_oidc_auth.utils import offload
+from mlflow_oidc_auth.utils.offload import reset_stats, run_blocking, stats
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_offload():
+    offload._limiter = None
+    reset_stats()
+    yield
+    offload._limiter = None
+    reset_stats()
+
+
+@pytest.fixture
+def max_threads():
+    def _set(value: int):
+        return patch.object(offload.config, "STORE_OFFLOAD_MAX_THREADS", value, create=True)
+
+    return _set
+
+
+class TestRunBlocking:
+    async def test_returns_the_result_from_a_worker_thread(self):
+        loop_thread = threading.get_ident()
+
+        result, ran_on = await run_blocking(lambda a, b=0: (a + b, threading.get_ident()), 2, b=3)
+
+        assert result == 5
+        assert ran_on != loop_thread
+
+    async def test_exceptions_propagate_unchanged(self):
+        def boom():
+            raise KeyError("missing")
+
+        with pytest.raises(KeyError, match="missing"):
+            await run_blocking(boom)
+
+        assert stats()["failed"] == 1
+        assert stats()["completed"] == 0
+
+    async def test_context_variables_are_carried_into_the_thread(self):
+        request_id.set("req-42")
+
+        assert await run_blocking(request_id.get) == "req-42"
+
+    async def test_zero_threads_runs_inline(self, max_threads):
+        loop_thread = threading.get_ident()
+
+        with max_threads(0):
+            ran_on = await run_blocking(threading.get_ident)
+
+        assert ran_on == loop_thread
+        assert stats()["submitted"] == 0
+
+    async def test_limit_bounds_concurrent_calls(self, max_threads):
+        lock = threading.Lock()
+        active = peak = 0
+
+        def work():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        with max_threads(2):
+            await asyncio.gather(*(run_blocking(work) for _ in range(8)))
+            snapshot = stats()
+
+        assert peak == 2
+        assert snapshot["max_threads"] == 2
+        assert snapshot["submitted"] == snapshot["completed"] == 8
+        assert snapshot["waiting"] == snapshot["running"] == 0
+        assert snapshot["max_waiting"] >= 6
+        assert snapshot["max_wait_seconds"] > 0
+
+    async def test_cancelled_while_queued_is_not_counted_as_running(self, max_threads):
+        release = threading.Event()
+
+        with max_threads(1):
+            first = asyncio.ensure_future(run_blocking(release.wait, 5))
+            await asyncio.sleep(0.01)
+            queued = asyncio.ensure_future(run_blocking(time.sleep, 0))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            release.set()
+            await first
+
+        snapshot = stats()
+        assert snapshot["waiting"] == snapshot["running"] == 0
+        assert snapshot["completed"] == 1
+
+
+class TestEventLoopLatency:
+    async def test_unrelated_work_stays_responsive_during_a_slow_store_call(self):
+        """A slow store call must not delay other coroutines on the loop.
+
+        Called inline, the loop stalls for the whole call and every tick below waits for it;
+        offloaded, ticks keep their schedule.
+        """
+
+        async def tick_latencies(duration: float):
+            latencies = []
+            deadline = time.perf_counter() + duration
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await asyncio.sleep(0.005)
+                latencies.append(time.perf_counter() - started - 0.005)
+            return sorted(latencies)
+
+        slow_call = asyncio.ensure_future(run_blocking(time.sleep, 0.3))
+        latencies = await tick_latencies(0.25)
+        await slow_call
+
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        assert len(latencies) > 10
+        assert p99 < 0.1
@@ -0,0 +1,114 @@
+"""Tests for the compiled per-user permission snapshot (utils/permission_snapshot.py)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+from mlflow_oidc_auth.utils import permission_snapshot as snap
+from mlflow_oidc_auth.utils import permissions as perms
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A real store, bound where the resolver reads it."""
+    s = SqlAlchemyStore()
+    s.init_db(f"sqlite:///{tmp_path / 'auth.db'}")
+    monkeypatch.setattr(perms, "store", s)
+    monkeypatch.setattr(config, "MLFLOW_ENABLE_WORKSPACES", False)
+    monkeypatch.setattr(config, "PERMISSION_SOURCE_ORDER", ["user", "group", "regex", "group-regex"])
+    monkeypatch.setattr(config, "DEFAULT_MLFLOW_PERMISSION", "NO_PERMISSIONS")
+    s.create_user("alice@example.com", "pw", "Alice")
+    s.create_user("bob@example.com", "pw", "Bob")
+    s.populate_groups(["team"])
+    s.set_user_groups("alice@example.com", ["team"])
+    return s
+
+
+class TestCollapseGroupPermissions:
+    """collapse_group_permissions folds multi-group grants with compare_permissions."""
+
+    def test_strongest_grant_wins_regardless_of_order(self):
+        rows = [SimpleNamespace(name="m", permission="READ"), SimpleNamespace(name="m", permission="MANAGE")]
+        assert snap.collapse_group_permissions(rows, "name") == {"m": "MANAGE"}
+        assert snap.collapse_group_permissions(list(reversed(rows)), "name") == {"m": "MANAGE"}
+
+    def test_composite_key(self):
+        rows = [SimpleNamespace(experiment_id="1", scorer_name="s", permission="EDIT")]
+        assert snap.collapse_group_permissions(rows, ("experiment_id", "scorer_name")) == {("1", "s"): "EDIT"}
+
+
+class TestSnapshotResolution:
+    """resolve_permission reads every source from the snapshot."""
+
+    def test_direct_group_and_regex_sources(self, store):
+        store.create_registered_model_permission("direct", "alice@example.com", "EDIT")
+        store.create_group_model_permission("team", "shared", "READ")
+        store.create_registered_model_regex_permission("^mine-.*", 1, "MANAGE", "alice@example.com")
+        store.create_group_registered_model_regex_permission("team", "^team-.*", 1, "READ")
+
+        assert perms.resolve_permission(perms.REGISTERED_MODEL, "direct", "alice@example.com").kind == "user"
+        assert perms.resolve_permission(perms.REGISTERED_MODEL, "shared", "alice@example.com").kind == "group"
+        assert perms.resolve_permission(perms.REGISTERED_MODEL, "mine-1", "alice@example.com").kind == "regex"
+        assert perms.resolve_permission(perms.REGISTERED_MODEL, "team-1", "alice@example.com").kind == "group-regex"
+        assert perms.resolve_permission(perms.REGISTERED_MODEL, "other", "alice@example.com").kind == "fallback"
+
+    def test_regex_rules_keep_priority_order(self, store):
+        store.create_registered_model_regex_permission(".*", 2, "READ", "alice@example.com")
+        store.create_registered_model_regex_permission("^prod-.*", 1, "MANAGE", "alice@example.com")
+
+        result = perms.resolve_permission(perms.REGISTERED_MODEL, "prod-model", "alice@example.com")
+        assert result.permission.name == "MANAGE"
+
+    def test_gateway_group_grant_applies_to_members(self, store):
+        """Group grants resolve through the caller's memberships, not a group named after them."""
+        store.create_group_gateway_endpoint_permission("team", "chat", "USE")
+
+        assert perms.resolve_permission(perms.GATEWAY_ENDPOINT, "chat", "alice@example.com").kind == "group"
+        assert perms.resolve_permission(perms.GATEWAY_ENDPOINT, "chat", "bob@example.com").kind == "fallback"
+
+
+class TestSnapshotInvalidation:
+    """Snapshots are reused until a permission write bumps their generation."""
+
+    def test_snapshot_is_reused(self, store):
+        assert snap.get_permission_snapshot("alice@example.com", store) is snap.get_permission_snapshot("alice@example.com", store)
+
+    def test_snapshot_is_not_shared_across_stores(self, store):
+        first = snap.get_permission_snapshot("alice@example.com", store)
+        assert snap.get_permission_snapshot("alice@example.com", object()) is not first
+
+    def test_user_write_only_stales_that_user(self, store):
+        alice = snap.get_permission_snapshot("alice@example.com", store)
+        bob = snap.get_permission_snapshot("bob@example.com", store)
+
+        store.create_experiment_permission("1", "alice@example.com", "READ")
+
+        assert snap.get_permission_snapshot("alice@example.com", store) is not alice
+        assert snap.get_permission_snapshot("bob@example.com", store) is bob
+
+    def test_group_write_stales_every_user(self, store):
+        alice = snap.get_permission_snapshot("alice@example.com", store)
+        bob = snap.get_permission_snapshot("bob@example.com", store)
+
+        store.create_group_experiment_permission("team", "1", "READ")
+
+        assert snap.get_permission_snapshot("alice@example.com", store) is not alice
+        assert snap.get_permission_snapshot("bob@example.com", store) is not bob
+
+    def test_membership_change_is_visible(self, store):
+        store.create_group_model_permission("team", "shared", "READ")
+        assert perms.resolve_permission(perms.REGISTERED_MODEL, "shared", "alice@example.com").kind == "group"
+
+        store.set_user_groups("alice@example.com", [])
+
+        assert perms.resolve_permission(perms.REGISTERED_MODEL, "shared", "alice@example.com").kind == "fallback"
+
+    def test_delete_user_stales_snapshot(self, store):
+        store.create_experiment_permission("1", "bob@example.com", "MANAGE")
+        bob = snap.get_permission_snapshot("bob@example.com", store)
+
+        store.delete_user("bob@example.com")
+
+        assert snap.get_permission_snapshot("bob@example.com", store) is not bob
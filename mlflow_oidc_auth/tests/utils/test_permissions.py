@@ -6,8 +6,11 @@ including permission retrieval, caching, and access control checks.
 """
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from flask import Flask
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import BAD_REQUEST, RESOURCE_DOES_NOT_EXIST
@@ -24,6 +27,7 @@ from mlflow_oidc_auth.utils import (
     effective_registered_model_permission,
     get_permission_from_store_or_default,
 )
+from mlflow_oidc_auth.utils.experiment_metadata import invalidate_experiment_metadata
 from mlflow_oidc_auth.utils.permissions import (
     PERMISSION_REGISTRY,
     _build_experiment_sources,
@@ -321,8 +325,9 @@ class TestPermissions(unittest.TestCase):
         result = _get_experiment_permission_from_regex(regex_perms, "exp123")
         self.assertEqual(result, "READ")
 
-        # No match
+        # No match (a rename drops the cached name, as the UpdateExperiment hook does)
         mock_experiment.name = "other-experiment"
+        invalidate_experiment_metadata("exp123")
         with self.assertRaises(MlflowException) as cm:
             _get_experiment_permission_from_regex(regex_perms, "exp123")
         self.assertEqual(cm.exception.error_code, "RESOURCE_DOES_NOT_EXIST")
@@ -365,8 +370,9 @@ class TestPermissions(unittest.TestCase):
         result = _get_experiment_group_permission_from_regex(regex_perms, "exp123")
         self.assertEqual(result, "READ")
 
-        # No match
+        # No match (a rename drops the cached name, as the UpdateExperiment hook does)
         mock_experiment.name = "other-experiment"
+        invalidate_experiment_metadata("exp123")
         with self.assertRaises(MlflowException) as cm:
             _get_experiment_group_permission_from_regex(regex_perms, "exp123")
         self.assertEqual(cm.exception.error_code, "RESOURCE_DOES_NOT_EXIST")
@@ -743,3 +749,68 @@ class TestPermissionCacheWorkspaceKey:
         with patch.object(perms.config, "MLFLOW_ENABLE_WORKSPACES", False):
             assert perms._get_cache_workspace() is None
             assert perms._make_cache_key("experiment", "1", "bob", None) == "experiment:1:bob"
+
+
+class TestResolvePermissionsMany:
+    """resolve_permissions_many must agree with resolve_permission and batch its cache traffic."""
+
+    @pytest.fixture
+    def env(self):
+        from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+        from mlflow_oidc_auth.utils import permissions as perms
+
+        cache = MagicMock(wraps=LocalTTLCacheBackend(maxsize=100, ttl=60))
+        built = []
+
+        def fake_builder(resource_id, username, **kwargs):
+            built.append(resource_id)
+            return {"user": lambda: "MANAGE" if resource_id.startswith("m") else "READ"}
+
+        with (
+            patch.dict(perms.PERMISSION_REGISTRY, {"experiment": fake_builder}),
+            patch.object(perms.config, "MLFLOW_ENABLE_WORKSPACES", False),
+            patch.object(perms, "_get_permission_cache", return_value=cache),
+        ):
+            yield SimpleNamespace(perms=perms, cache=cache, built=built)
+
+    def test_matches_per_id_resolution(self, env):
+        ids = ["m1", "r1", "r2"]
+        batched = env.perms.resolve_permissions_many("experiment", ids, "bob")
+        env.cache.clear()
+        single = {resource_id: env.perms.resolve_permission("experiment", resource_id, "bob") for resource_id in ids}
+
+        assert {k: v.permission for k, v in batched.items()} == {k: v.permission for k, v in single.items()}
+        assert batched["m1"].permission.can_manage and not batched["r1"].permission.can_manage
+
+    def test_one_batched_read_and_write(self, env):
+        env.perms.resolve_permissions_many("experiment", ["r1", "r2", "r3"], "bob")
+
+        env.cache.get_many.assert_called_once()
+        env.cache.set_many.assert_called_once()
+        env.cache.get.assert_not_called()
+        env.cache.set.assert_not_called()
+
+    def test_cached_ids_are_not_resolved_again(self, env):
+        env.perms.resolve_permission("experiment", "r1", "bob")
+        env.built.clear()
+
+        results = env.perms.resolve_permissions_many("experiment", ["r1", "r2"], "bob")
+
+        assert env.built == ["r2"]
+        assert set(results) == {"r1", "r2"}
+        assert list(env.cache.set_many.call_args.args[0]) == [env.perms._make_cache_key("experiment", "r2", "bob", None)]
+
+    def test_all_cached_skips_the_write(self, env):
+        env.perms.resolve_permissions_many("experiment", ["r1"], "bob")
+        env.cache.reset_mock()
+
+        env.perms.resolve_permissions_many("experiment", ["r1"], "bob")
+
+        env.cache.set_many.assert_not_called()
+
+    def test_duplicates_and_empty_input(self, env):
+        results = env.perms.resolve_permissions_many("experiment", ["r1", "r1", "r2"], "bob")
+
+        assert env.built == ["r1", "r2"]
+        assert list(results) == ["r1", "r2"]
+        assert env.perms.resolve_permissions_many("experiment", [], "bob") == {}
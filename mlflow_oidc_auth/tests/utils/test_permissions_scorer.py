@@ -101,22 +101,33 @@ class TestBuildScorerSources:
         assert "group-regex" in config
 
     @patch(f"{_MOD}.store")
-    def test_user_source_calls_store(self, mock_store: MagicMock) -> None:
-        """User source should call store.get_scorer_permission."""
-        mock_store.get_scorer_permission.return_value.permission = "READ"
+    def test_user_source_reads_snapshot(self, mock_store: MagicMock) -> None:
+        """User source should read the user's scorer grants from the permission snapshot."""
+        mock_store.list_scorer_permissions.return_value = [MagicMock(experiment_id="exp-1", scorer_name="scorer-1", permission="READ")]
         config = _build_scorer_sources("exp-1", "alice", scorer_name="scorer-1")
         result = config["user"]()
         assert result == "READ"
-        mock_store.get_scorer_permission.assert_called_once_with("exp-1", "scorer-1", "alice")
+        mock_store.list_scorer_permissions.assert_called_once_with("alice")
 
     @patch(f"{_MOD}.store")
-    def test_group_source_calls_store(self, mock_store: MagicMock) -> None:
-        """Group source should call store.get_user_groups_scorer_permission."""
-        mock_store.get_user_groups_scorer_permission.return_value.permission = "EDIT"
+    def test_group_source_reads_snapshot(self, mock_store: MagicMock) -> None:
+        """Group source should read the user's collapsed group scorer grants from the snapshot."""
+        mock_store.list_user_groups_scorer_permissions.return_value = [
+            MagicMock(experiment_id="exp-1", scorer_name="scorer-1", permission="READ"),
+            MagicMock(experiment_id="exp-1", scorer_name="scorer-1", permission="EDIT"),
+        ]
         config = _build_scorer_sources("exp-1", "alice", scorer_name="scorer-1")
         result = config["group"]()
         assert result == "EDIT"
-        mock_store.get_user_groups_scorer_permission.assert_called_once_with("exp-1", "scorer-1", "alice")
+        mock_store.list_user_groups_scorer_permissions.assert_called_once_with("alice")
+
+    @patch(f"{_MOD}.store")
+    def test_user_source_keys_on_experiment_and_scorer(self, mock_store: MagicMock) -> None:
+        """A grant on the same scorer name in another experiment must not match."""
+        mock_store.list_scorer_permissions.return_value = [MagicMock(experiment_id="exp-2", scorer_name="scorer-1", permission="READ")]
+        config = _build_scorer_sources("exp-1", "alice", scorer_name="scorer-1")
+        with pytest.raises(MlflowException):
+            config["user"]()
 
 
 # ---------------------------------------------------------------------------
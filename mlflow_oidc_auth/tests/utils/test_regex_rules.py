@@ -0,0 +1,111 @@
+"""Tests for the compiled regex rule sets in utils/regex_rules.py."""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from mlflow_oidc_auth.utils.regex_rules import (
+    EMPTY_RULE_SET,
+    CompiledRuleSet,
+    clear_compiled_rule_sets,
+    get_compiled_rule_set,
+    literal_prefix,
+)
+
+
+def _rule(id_, regex, permission="READ", priority=1):
+    return SimpleNamespace(id=id_, regex=regex, permission=permission, priority=priority)
+
+
+def _first_match(rules, name):
+    """The rule-by-rule loop the rule set replaces."""
+    for rule in rules:
+        if re.match(rule.regex, name):
+            return rule.permission
+    return None
+
+
+@pytest.fixture(autouse=True)
+def _clear_rule_sets():
+    clear_compiled_rule_sets()
+    yield
+    clear_compiled_rule_sets()
+
+
+class TestLiteralPrefix:
+    """literal_prefix must never claim more than every match is guaranteed to start with."""
+
+    @pytest.mark.parametrize(
+        "regex, expected",
+        [
+            ("^team-a/.*", "team-a/"),
+            ("team-a/.*", "team-a/"),
+            ("^prod\\.models/.*", "prod.models/"),
+            ("abc$", "abc"),
+            ("ab?c", "a"),
+            ("ab*c", "a"),
+            ("ab{0,2}c", "a"),
+            ("ab+c", "ab"),
+            ("a|b", ""),
+            ("(team)-a", ""),
+            ("[ab]c", ""),
+            ("\\dteam", ""),
+            ("(?i)team", ""),
+            (".*", ""),
+            ("", ""),
+        ],
+    )
+    def test_prefix(self, regex, expected):
+        assert literal_prefix(regex) == expected
+
+
+class TestCompiledRuleSet:
+    """Matching must be identical to first-match-in-list-order."""
+
+    RULES = [
+        _rule(1, "^team-a/exp-1$", "MANAGE"),
+        _rule(2, "^team-a/.*", "EDIT"),
+        _rule(3, "team-b/.*", "READ"),
+        _rule(4, "(?i)TEAM-C/.*", "USE"),
+        _rule(5, "te+am-d", "READ"),
+        _rule(6, "a|team-e", "EDIT"),
+        _rule(7, ".*-shared$", "READ"),
+        _rule(8, ".*", "NO_PERMISSIONS"),
+    ]
+
+    @pytest.mark.parametrize(
+        "name",
+        ["team-a/exp-1", "team-a/exp-2", "team-b/x", "team-c/x", "teeeam-d", "team-e", "other-shared", "zzz", "", "team-", "a"],
+    )
+    def test_matches_rule_by_rule_semantics(self, name):
+        rule = CompiledRuleSet(self.RULES).match(name)
+        assert (rule.permission if rule else None) == _first_match(self.RULES, name)
+
+    def test_list_order_wins_over_prefix_depth(self):
+        """A catch-all listed first beats a longer literal prefix listed later."""
+        rules = [_rule(1, ".*", "READ"), _rule(2, "^team-a/.*", "MANAGE")]
+        assert CompiledRuleSet(rules).match("team-a/x").permission == "READ"
+
+    def test_no_match_returns_none(self):
+        assert CompiledRuleSet([_rule(1, "^x")]).match("y") is None
+        assert EMPTY_RULE_SET.match("y") is None
+
+
+class TestSharedRuleSets:
+    """Rule sets are shared across callers and keyed on rule ids and contents."""
+
+    def test_same_rows_share_a_rule_set(self):
+        rows = [_rule(1, "^a"), _rule(2, "^b")]
+        assert get_compiled_rule_set(rows) is get_compiled_rule_set([_rule(1, "^a"), _rule(2, "^b")])
+
+    def test_edited_rule_gets_a_new_rule_set(self):
+        before = get_compiled_rule_set([_rule(1, "^a", "READ")])
+        after = get_compiled_rule_set([_rule(1, "^a", "MANAGE")])
+        assert before is not after
+        assert after.match("a").permission == "MANAGE"
+
+    def test_empty_and_compiled_inputs(self):
+        rule_set = CompiledRuleSet([_rule(1, "^a")])
+        assert get_compiled_rule_set([]) is EMPTY_RULE_SET
+        assert get_compiled_rule_set(rule_set) is rule_set
@@ -0,0 +1,248 @@
+"""Tests for the per-user readable/manageable resource index."""
+
+from array import array
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mlflow.entities import ExperimentTag
+from mlflow.entities.model_registry import RegisteredModelTag
+from mlflow.entities.model_registry.prompt_version import IS_PROMPT_TAG_KEY
+from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore as RegistryStore
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+from mlflow_oidc_auth.entities import ExperimentRegexPermission, RegisteredModelRegexPermission
+from mlflow_oidc_auth.utils import resource_index
+from mlflow_oidc_auth.utils.permission_snapshot import invalidate_permission_snapshot
+from mlflow_oidc_auth.utils.permissions import EXPERIMENT, REGISTERED_MODEL
+from mlflow_oidc_auth.utils.resource_index import (
+    get_resource_index,
+    invalidate_resource_indexes,
+    list_experiments_from_index,
+    list_registered_model_names_from_index,
+)
+
+
+@pytest.fixture(scope="module")
+def stores(tmp_path_factory):
+    root = tmp_path_factory.mktemp("resource-index")
+    uri = f"sqlite:///{root}/mlflow.db"
+    tracking = SqlAlchemyStore(uri, str(root / "artifacts"))
+    registry = RegistryStore(uri)
+    experiments = {name: tracking.create_experiment(name, tags=[ExperimentTag("team", name[:6])]) for name in ("team-a-1", "team-a-2", "team-b-1", "other")}
+    tracking.delete_experiment(tracking.create_experiment("team-a-deleted"))
+    for name in ("model-a", "model-b"):
+        registry.create_registered_model(name)
+    registry.create_registered_model("prompt-a", tags=[RegisteredModelTag(IS_PROMPT_TAG_KEY, "true")])
+    return SimpleNamespace(tracking=tracking, registry=registry, experiments=experiments)
+
+
+@pytest.fixture
+def grants(monkeypatch):
+    """The user's grants, as ``build_user_permission_context`` would load them."""
+    state = SimpleNamespace(user={}, group={}, regex=[], builds=0)
+    monkeypatch.setattr(resource_index.config, "DEFAULT_MLFLOW_PERMISSION", "NO_PERMISSIONS")
+    monkeypatch.setattr(resource_index.config, "MLFLOW_ENABLE_WORKSPACES", False)
+
+    def context(username):
+        state.builds += 1
+        return SimpleNamespace(
+            user_experiment_permissions=dict(state.user),
+            group_experiment_permissions=dict(state.group),
+            experiment_regex_permissions=state.regex,
+            group_experiment_regex_permissions=[],
+            user_model_permissions=dict(state.user),
+            group_model_permissions=dict(state.group),
+            model_regex_permissions=state.regex,
+            group_model_regex_permissions=[],
+        )
+
+    monkeypatch.setattr(resource_index, "build_user_permission_context", context)
+    return state
+
+
+class TestIndex:
+    def test_direct_and_group_grants(self, stores, grants):
+        ids = stores.experiments
+        grants.user = {ids["team-a-1"]: "MANAGE", ids["other"]: "NO_PERMISSIONS"}
+        grants.group = {ids["team-b-1"]: "READ", ids["other"]: "MANAGE"}
+
+        index = get_resource_index(stores.tracking, "alice", EXPERIMENT)
+
+        assert isinstance(index.readable, array)
+        assert list(index.readable) == sorted(int(ids[name]) for name in ("team-a-1", "team-b-1"))
+        assert list(index.manageable) == [int(ids["team-a-1"])]
+        assert index.contains(ids["team-b-1"]) and not index.contains(ids["team-b-1"], manage=True)
+        assert not index.contains(ids["other"])
+        assert not index.uses_names
+
+    def test_regex_rules_scan_names(self, stores, grants):
+        grants.regex = [ExperimentRegexPermission(id_=1, regex="^team-a-", permission="READ", priority=1, user_id=1)]
+
+        index = get_resource_index(stores.tracking, "alice", EXPERIMENT)
+
+        assert index.uses_names
+        # The deleted experiment matches too; listing drops it.
+        assert len(index.readable) == 3
+        assert [e.name for e in list_experiments_from_index(stores.tracking, "alice")] == ["team-a-2", "team-a-1"]
+
+    def test_registered_models(self, stores, grants):
+        grants.user = {"model-b": "MANAGE", "gone": "READ"}
+        grants.regex = [RegisteredModelRegexPermission(id_=1, regex="^(model|prompt)-a$", permission="READ", priority=1, user_id=1)]
+
+        index = get_resource_index(stores.registry, "alice", REGISTERED_MODEL)
+
+        assert index.readable == ("gone", "model-a", "model-b", "prompt-a")
+        assert index.manageable == ("model-b",)
+        with patch("mlflow.server.handlers._get_model_registry_store", return_value=stores.registry):
+            assert list_registered_model_names_from_index("alice") == ["model-a", "model-b"]
+            assert list_registered_model_names_from_index("alice", manage=True) == ["model-b"]
+
+
+class TestInvalidation:
+    def test_cached_until_a_permission_write(self, stores, grants):
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        assert grants.builds == 1
+
+        invalidate_permission_snapshot("alice")
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        assert grants.builds == 2
+
+    def test_resource_changes_only_rebuild_regex_indexes(self, stores, grants):
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        invalidate_resource_indexes(EXPERIMENT)
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        assert grants.builds == 1
+
+        grants.regex = [ExperimentRegexPermission(id_=1, regex="^team-", permission="READ", priority=1, user_id=1)]
+        invalidate_permission_snapshot("bob")
+        get_resource_index(stores.tracking, "bob", EXPERIMENT)
+        invalidate_resource_indexes(EXPERIMENT)
+        get_resource_index(stores.tracking, "bob", EXPERIMENT)
+        assert grants.builds == 3
+
+
+class TestGrantChanges:
+    @pytest.fixture
+    def builder(self, monkeypatch):
+        build = MagicMock(wraps=resource_index._BUILDERS[EXPERIMENT])
+        monkeypatch.setitem(resource_index._BUILDERS, EXPERIMENT, build)
+        return build
+
+    def test_a_single_grant_is_applied_without_a_rebuild(self, stores, grants, builder):
+        ids = stores.experiments
+        grants.user = {ids["team-a-1"]: "READ"}
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        model_index = get_resource_index(stores.registry, "alice", REGISTERED_MODEL)
+
+        grants.user = {ids["team-a-1"]: "READ", ids["team-b-1"]: "MANAGE"}
+        invalidate_permission_snapshot("alice")
+        resource_index.apply_grant_change("alice", EXPERIMENT, ids["team-b-1"])
+        index = get_resource_index(stores.tracking, "alice", EXPERIMENT)
+
+        assert builder.call_count == 1
+        assert list(index.readable) == sorted(int(ids[name]) for name in ("team-a-1", "team-b-1"))
+        assert list(index.manageable) == [int(ids["team-b-1"])]
+        assert get_resource_index(stores.registry, "alice", REGISTERED_MODEL).readable == model_index.readable
+
+        del grants.user[ids["team-a-1"]]
+        invalidate_permission_snapshot("alice")
+        resource_index.apply_grant_change("alice", EXPERIMENT, ids["team-a-1"])
+
+        assert list(get_resource_index(stores.tracking, "alice", EXPERIMENT).readable) == [int(ids["team-b-1"])]
+        assert builder.call_count == 1
+
+    def test_a_regex_built_index_resolves_the_changed_resource_by_name(self, stores, grants, builder):
+        ids = stores.experiments
+        grants.regex = [ExperimentRegexPermission(id_=1, regex="^team-a-", permission="READ", priority=1, user_id=1)]
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+
+        grants.user = {ids["team-a-1"]: "NO_PERMISSIONS"}
+        invalidate_permission_snapshot("alice")
+        with patch("mlflow.server.handlers._get_tracking_store", return_value=stores.tracking):
+            resource_index.apply_grant_change("alice", EXPERIMENT, ids["team-a-1"])
+        index = get_resource_index(stores.tracking, "alice", EXPERIMENT)
+
+        assert builder.call_count == 1
+        assert not index.contains(ids["team-a-1"]) and index.contains(ids["team-a-2"])
+
+    def test_an_index_older_than_the_last_write_is_rebuilt(self, stores, grants, builder):
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        invalidate_permission_snapshot("alice")
+        invalidate_permission_snapshot("alice")
+        resource_index.apply_grant_change("alice", EXPERIMENT, stores.experiments["other"])
+
+        get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        assert builder.call_count == 2
+
+    def test_store_writes_of_one_users_grant_patch_the_index(self, monkeypatch):
+        import inspect
+
+        from mlflow_oidc_auth import sqlalchemy_store
+
+        apply = MagicMock()
+        invalidate = MagicMock()
+        monkeypatch.setattr(resource_index, "apply_grant_change", apply)
+        monkeypatch.setattr(resource_index, "invalidate_user_resource_indexes", invalidate)
+        for method, args in (
+            (sqlalchemy_store.SqlAlchemyStore.update_experiment_permission, ("7", "alice", "READ")),
+            (sqlalchemy_store.SqlAlchemyStore.delete_registered_model_permission, ("model-a", "alice")),
+            (sqlalchemy_store.SqlAlchemyStore.create_experiment_regex_permission, ("^a", 1, "READ", "alice")),
+        ):
+            sqlalchemy_store._invalidate_permission_snapshots(method, inspect.signature(method), args, {})
+
+        assert apply.call_args_list == [(("alice", EXPERIMENT, "7"),), (("alice", REGISTERED_MODEL, "model-a"),)]
+        invalidate.assert_called_once_with("alice")
+
+
+class TestReplicas:
+    @pytest.fixture
+    def replicas(self, monkeypatch):
+        from mlflow_oidc_auth.cache.broadcast_backend import BroadcastCacheBackend
+        from mlflow_oidc_auth.cache.invalidation_bus import LocalInvalidationBus
+        from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+
+        bus = LocalInvalidationBus()
+        here = BroadcastCacheBackend(LocalTTLCacheBackend(maxsize=16, ttl=60), "resource-index", bus)
+        other = BroadcastCacheBackend(LocalTTLCacheBackend(maxsize=16, ttl=60), "resource-index", bus)
+        monkeypatch.setattr(resource_index, "_index_cache", here)
+        return other
+
+    def test_a_permission_write_drops_the_index_on_other_replicas(self, stores, grants, replicas):
+        index = get_resource_index(stores.tracking, "alice", EXPERIMENT)
+        replicas.set("experiment:ids:alice", index)
+
+        invalidate_permission_snapshot("alice")
+        resource_index.apply_grant_change("alice", EXPERIMENT, stores.experiments["other"])
+
+        assert replicas.get("experiment:ids:alice") is None
+
+    def test_a_rename_drops_only_regex_built_indexes_on_other_replicas(self, stores, grants, replicas):
+        replicas.set("experiment:ids:alice", "ids")
+        replicas.set("experiment:names:bob", "names")
+
+        invalidate_resource_indexes(EXPERIMENT)
+
+        assert (replicas.get("experiment:ids:alice"), replicas.get("experiment:names:bob")) == ("ids", None)
+
+
+class TestListing:
+    def test_experiments_in_search_order_with_tags(self, stores, grants):
+        ids = stores.experiments
+        grants.user = {ids["team-a-1"]: "READ", ids["other"]: "READ"}
+
+        listed = list_experiments_from_index(stores.tracking, "alice")
+
+        assert [e.name for e in listed] == ["other", "team-a-1"]
+        assert listed[1].tags == {"team": "team-a"}
+
+    def test_fallback_that_grants_the_level_lists_everything(self, stores, grants, monkeypatch):
+        monkeypatch.setattr(resource_index.config, "DEFAULT_MLFLOW_PERMISSION", "READ")
+        assert list_experiments_from_index(stores.tracking, "alice") is None
+        assert list_experiments_from_index(stores.tracking, "alice", manage=True) == []
+
+    def test_non_sql_store_and_failures_list_everything(self, stores, grants, monkeypatch):
+        assert list_experiments_from_index(MagicMock(), "alice") is None
+        monkeypatch.setattr(resource_index, "build_user_permission_context", MagicMock(side_effect=RuntimeError("db down")))
+        assert list_experiments_from_index(stores.tracking, "alice") is None
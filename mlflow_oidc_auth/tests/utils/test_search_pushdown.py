@@ -0,0 +1,227 @@
+"""Tests for pushing a user's readable set into the SQL search query."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from mlflow.entities import ViewType
+from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore as RegistryStore
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from sqlalchemy import event
+
+from mlflow_oidc_auth.entities import ExperimentRegexPermission, RegisteredModelRegexPermission
+from mlflow_oidc_auth.models import PermissionResult
+from mlflow_oidc_auth.permissions import NO_PERMISSIONS, READ
+from mlflow_oidc_auth.utils import resource_index, search_pushdown
+from mlflow_oidc_auth.utils.search_pushdown import (
+    SEARCH_EXPERIMENTS,
+    SEARCH_LOGGED_MODELS,
+    SEARCH_MODEL_VERSIONS,
+    SEARCH_REGISTERED_MODELS,
+    enable_search_pushdown,
+)
+
+app = Flask(__name__)
+
+
+@pytest.fixture(scope="module")
+def stores(tmp_path_factory):
+    """Real MLflow SQL tracking and registry stores sharing one database."""
+    root = tmp_path_factory.mktemp("pushdown")
+    uri = f"sqlite:///{root}/mlflow.db"
+    tracking = SqlAlchemyStore(uri, str(root / "artifacts"))
+    registry = RegistryStore(uri)
+    experiments = {f"exp-{i:02d}": tracking.create_experiment(f"exp-{i:02d}") for i in range(20)}
+    tracking.create_experiment("team-a-forecast")
+    logged = {exp: tracking.create_logged_model(experiments[exp]).model_id for exp in ("exp-00", "exp-01")}
+    for i in range(10):
+        registry.create_registered_model(f"model-{i}")
+        registry.create_model_version(f"model-{i}", "s3://bucket/model")
+    return SimpleNamespace(tracking=tracking, registry=registry, experiments=experiments, logged=logged)
+
+
+@pytest.fixture
+def grants(monkeypatch, stores):
+    """Grant what a test puts in ``user`` and ``regex`` (``readable`` for logged models); the fallback is NO_PERMISSIONS."""
+    state = SimpleNamespace(readable=set(), user={}, regex=[], fallback="NO_PERMISSIONS")
+    monkeypatch.setattr(search_pushdown.config, "DEFAULT_MLFLOW_PERMISSION", state.fallback)
+    monkeypatch.setattr(search_pushdown.config, "MLFLOW_ENABLE_WORKSPACES", False)
+    monkeypatch.setattr(search_pushdown.config, "SEARCH_PUSHDOWN_MAX_IDS", 5000)
+
+    def context(username):
+        return SimpleNamespace(
+            user_experiment_permissions=dict(state.user),
+            group_experiment_permissions={},
+            experiment_regex_permissions=state.regex,
+            group_experiment_regex_permissions=[],
+            user_model_permissions=dict(state.user),
+            group_model_permissions={},
+            model_regex_permissions=state.regex,
+            group_model_regex_permissions=[],
+        )
+
+    def resolve_many(resource_type, ids, username):
+        return {i: PermissionResult(READ if i in state.readable else NO_PERMISSIONS, "user") for i in dict.fromkeys(ids)}
+
+    # Experiments and registered models come from the resource index; logged models
+    # are decided per requested experiment.
+    monkeypatch.setattr(resource_index, "build_user_permission_context", context)
+    monkeypatch.setattr(search_pushdown, "resolve_permissions_many", resolve_many)
+    with (
+        patch("mlflow.server.handlers._get_tracking_store", return_value=stores.tracking),
+        patch("mlflow.server.handlers._get_model_registry_store", return_value=stores.registry),
+    ):
+        yield state
+
+
+def _grant_experiments(state, stores, *names):
+    for name in names:
+        experiment_id = stores.experiments[name]
+        state.user[experiment_id] = "READ"
+        state.readable.add(experiment_id)
+
+
+@pytest.fixture
+def statements(stores):
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            seen.append(statement)
+
+    event.listen(stores.tracking.engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(stores.tracking.engine, "before_cursor_execute", record)
+
+
+class TestExperiments:
+    def test_search_returns_only_readable_experiments(self, stores, grants):
+        _grant_experiments(grants, stores, "exp-03", "exp-17")
+
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_EXPERIMENTS, "alice") is True
+            page = stores.tracking.search_experiments(view_type=ViewType.ACTIVE_ONLY, max_results=1)
+            rest = stores.tracking.search_experiments(view_type=ViewType.ACTIVE_ONLY, max_results=1, page_token=page.token)
+
+        assert {e.name for e in (*page, *rest)} == {"exp-03", "exp-17"}
+        assert rest.token is None
+
+    def test_other_requests_are_not_filtered(self, stores, grants):
+        _grant_experiments(grants, stores, "exp-03")
+        with app.app_context():
+            enable_search_pushdown(SEARCH_EXPERIMENTS, "alice")
+
+        with app.app_context():
+            assert len(stores.tracking.search_experiments(max_results=1000)) > 1
+        assert len(stores.tracking.search_experiments(max_results=1000)) > 1
+
+    def test_regex_rules_add_matching_names(self, stores, grants):
+        grants.regex = [ExperimentRegexPermission(id_=1, regex="^team-a-", permission="READ", priority=1, user_id=1)]
+
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_EXPERIMENTS, "alice") is True
+            names = [e.name for e in stores.tracking.search_experiments(max_results=1000)]
+
+        assert names == ["team-a-forecast"]
+
+    def test_nothing_readable_is_an_empty_page(self, stores, grants):
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_EXPERIMENTS, "alice") is True
+            assert list(stores.tracking.search_experiments(max_results=1000)) == []
+
+    def test_one_page_query(self, stores, grants, statements):
+        _grant_experiments(grants, stores, "exp-05")
+        with app.app_context():
+            enable_search_pushdown(SEARCH_EXPERIMENTS, "alice")
+            statements.clear()
+            stores.tracking.search_experiments(max_results=1000)
+
+        # The page query and MLflow's eager tag load, both restricted to the allow-list.
+        assert len(statements) == 2
+        assert all("experiments.experiment_id IN" in s for s in statements)
+
+
+class TestFallsBack:
+    def test_fallback_that_grants_read_is_not_pushed_down(self, stores, grants, monkeypatch):
+        monkeypatch.setattr(search_pushdown.config, "DEFAULT_MLFLOW_PERMISSION", "READ")
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_EXPERIMENTS, "alice") is False
+            assert len(stores.tracking.search_experiments(max_results=1000)) > 1
+
+    def test_allow_list_over_the_limit_is_not_pushed_down(self, stores, grants, monkeypatch):
+        monkeypatch.setattr(search_pushdown.config, "SEARCH_PUSHDOWN_MAX_IDS", 1)
+        _grant_experiments(grants, stores, "exp-01", "exp-02")
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_EXPERIMENTS, "alice") is False
+
+    def test_zero_disables_pushdown(self, stores, grants, monkeypatch):
+        monkeypatch.setattr(search_pushdown.config, "SEARCH_PUSHDOWN_MAX_IDS", 0)
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_EXPERIMENTS, "alice") is False
+
+    def test_non_sql_store_is_not_pushed_down(self, grants):
+        with patch("mlflow.server.handlers._get_tracking_store", return_value=MagicMock()), app.app_context():
+            assert enable_search_pushdown(SEARCH_EXPERIMENTS, "alice") is False
+
+    def test_failure_building_the_allow_list_is_not_pushed_down(self, stores, grants, monkeypatch):
+        monkeypatch.setattr(resource_index, "build_user_permission_context", MagicMock(side_effect=RuntimeError("db down")))
+        _grant_experiments(grants, stores, "exp-01")
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_EXPERIMENTS, "alice") is False
+            assert len(stores.tracking.search_experiments(max_results=1000)) > 1
+
+
+class TestRegistryAndLoggedModels:
+    def test_registered_models_and_versions(self, stores, grants):
+        grants.user = {"model-2": "NO_PERMISSIONS", "model-7": "READ"}
+
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_REGISTERED_MODELS, "alice") is True
+            assert enable_search_pushdown(SEARCH_MODEL_VERSIONS, "alice") is True
+            models = [m.name for m in stores.registry.search_registered_models(max_results=100)]
+            versions = [v.name for v in stores.registry.search_model_versions(max_results=100)]
+
+        assert models == ["model-7"]
+        assert versions == ["model-7"]
+
+    def test_registered_model_regex(self, stores, grants):
+        grants.regex = [RegisteredModelRegexPermission(id_=1, regex="model-[34]$", permission="READ", priority=1, user_id=1)]
+
+        with app.app_context():
+            enable_search_pushdown(SEARCH_REGISTERED_MODELS, "alice")
+            models = sorted(m.name for m in stores.registry.search_registered_models(max_results=100))
+
+        assert models == ["model-3", "model-4"]
+
+    def test_logged_models_keep_only_readable_experiments(self, stores, grants, monkeypatch):
+        # Logged models are pushed down whatever the fallback: the request names its experiments.
+        monkeypatch.setattr(search_pushdown.config, "DEFAULT_MLFLOW_PERMISSION", "READ")
+        requested = [stores.experiments["exp-00"], stores.experiments["exp-01"]]
+        grants.readable = {stores.experiments["exp-01"]}
+
+        with app.app_context():
+            assert enable_search_pushdown(SEARCH_LOGGED_MODELS, "alice", requested) is True
+            page = stores.tracking.search_logged_models(experiment_ids=requested, max_results=100)
+
+        assert [m.model_id for m in page] == [stores.logged["exp-01"]]
+
+
+class TestBeforeRequest:
+    def test_search_paths_enable_pushdown(self):
+        from mlflow_oidc_auth.hooks import before_request
+
+        with app.test_request_context("/api/2.0/mlflow/experiments/search", method="POST", json={}):
+            with patch("mlflow_oidc_auth.utils.search_pushdown.enable_search_pushdown") as enable:
+                before_request._push_down_search("alice")
+
+        enable.assert_called_once_with(SEARCH_EXPERIMENTS, "alice", [])
+
+    def test_other_paths_do_not(self):
+        from mlflow_oidc_auth.hooks import before_request
+
+        with app.test_request_context("/api/2.0/mlflow/experiments/get", method="GET"):
+            with patch("mlflow_oidc_auth.utils.search_pushdown.enable_search_pushdown") as enable:
+                before_request._push_down_search("alice")
+
+        enable.assert_not_called()
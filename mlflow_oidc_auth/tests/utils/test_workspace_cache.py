@@ -18,8 +18,10 @@ class TestGetWorkspacePermissionCached:
         import mlflow_oidc_auth.utils.workspace_cache as wc
 
         wc._cache = None
+        wc._denial_cache = None
         yield
         wc._cache = None
+        wc._denial_cache = None
 
     def test_returns_none_when_workspaces_disabled(self):
         """get_workspace_permission_cached() returns None when MLFLOW_ENABLE_WORKSPACES is False."""
@@ -44,6 +46,7 @@ class TestGetWorkspacePermissionCached:
         mock_config.MLFLOW_ENABLE_WORKSPACES = True
         mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
         mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 10
 
         with (
             patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config),
@@ -64,6 +67,7 @@ class TestGetWorkspacePermissionCached:
         mock_config.MLFLOW_ENABLE_WORKSPACES = True
         mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
         mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 10
 
         with (
             patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config),
@@ -84,6 +88,7 @@ class TestGetWorkspacePermissionCached:
         mock_config.MLFLOW_ENABLE_WORKSPACES = True
         mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
         mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 10
 
         with (
             patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config),
@@ -104,6 +109,7 @@ class TestGetWorkspacePermissionCached:
         mock_config.MLFLOW_ENABLE_WORKSPACES = True
         mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
         mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 10
 
         with (
             patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config),
@@ -118,8 +124,34 @@ class TestGetWorkspacePermissionCached:
             # lookup should only be called once (not twice)
             assert mock_lookup.call_count == 1
 
-    def test_does_not_cache_none_results(self):
-        """get_workspace_permission_cached() does NOT cache None results."""
+    def test_caches_denials(self):
+        """get_workspace_permission_cached() caches a None result in the denial cache."""
+        from mlflow_oidc_auth.utils.workspace_cache import (
+            _get_cache,
+            _get_denial_cache,
+            get_workspace_permission_cached,
+        )
+
+        mock_config = MagicMock()
+        mock_config.MLFLOW_ENABLE_WORKSPACES = True
+        mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
+        mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 10
+
+        with (
+            patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config),
+            patch("mlflow_oidc_auth.utils.workspace_cache._lookup_workspace_permission") as mock_lookup,
+        ):
+            mock_lookup.return_value = None
+            assert get_workspace_permission_cached("user1", "ws1") is None
+            assert get_workspace_permission_cached("user1", "ws1") is None
+            assert mock_lookup.call_count == 1
+            # The denial is kept apart from grants, never as a None grant entry.
+            assert _get_cache().get("user1:ws1") is None
+            assert _get_denial_cache().get("user1:ws1") is not None
+
+    def test_denial_cache_disabled_with_zero_ttl(self):
+        """WORKSPACE_DENIAL_CACHE_TTL_SECONDS=0 restores the uncached deny path."""
         from mlflow_oidc_auth.utils.workspace_cache import (
             get_workspace_permission_cached,
         )
@@ -128,21 +160,74 @@ class TestGetWorkspacePermissionCached:
         mock_config.MLFLOW_ENABLE_WORKSPACES = True
         mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
         mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 0
 
         with (
             patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config),
             patch("mlflow_oidc_auth.utils.workspace_cache._lookup_workspace_permission") as mock_lookup,
         ):
             mock_lookup.return_value = None
-            # First call — returns None, should not cache
-            result1 = get_workspace_permission_cached("user1", "ws1")
-            assert result1 is None
-            # Second call — should call lookup again because None was not cached
-            result2 = get_workspace_permission_cached("user1", "ws1")
-            assert result2 is None
+            get_workspace_permission_cached("user1", "ws1")
+            get_workspace_permission_cached("user1", "ws1")
             assert mock_lookup.call_count == 2
 
 
+class TestDenialInvalidation:
+    """Every invalidation hook must purge cached denials as well as cached grants."""
+
+    @pytest.fixture(autouse=True)
+    def workspaces_on(self):
+        import mlflow_oidc_auth.utils.workspace_cache as wc
+
+        mock_config = MagicMock()
+        mock_config.MLFLOW_ENABLE_WORKSPACES = True
+        mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
+        mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 10
+        wc._cache = None
+        wc._denial_cache = None
+        with (
+            patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config),
+            patch("mlflow_oidc_auth.utils.workspace_cache._lookup_workspace_permission", return_value=None) as mock_lookup,
+        ):
+            wc.get_workspace_permission_cached("user1", "ws1")
+            wc.get_workspace_permission_cached("user1", "ws2")
+            wc.get_workspace_permission_cached("user2", "ws1")
+            assert wc._get_denial_cache().get("user1:ws1") is not None
+            yield wc
+        wc._cache = None
+        wc._denial_cache = None
+
+    def test_invalidate_workspace_permission(self, workspaces_on):
+        workspaces_on.invalidate_workspace_permission("user1", "ws1")
+        denials = workspaces_on._get_denial_cache()
+        assert denials.get("user1:ws1") is None
+        assert denials.get("user1:ws2") is not None
+
+    def test_invalidate_user_workspace_entries(self, workspaces_on):
+        workspaces_on.invalidate_user_workspace_entries("user1")
+        denials = workspaces_on._get_denial_cache()
+        assert denials.get("user1:ws1") is None
+        assert denials.get("user1:ws2") is None
+        assert denials.get("user2:ws1") is not None
+
+    def test_invalidate_group_workspace_permission(self, workspaces_on):
+        mock_store = MagicMock()
+        mock_store.get_group_users.return_value = [MagicMock(username="user1"), MagicMock(username="user2")]
+        with patch("mlflow_oidc_auth.store.store", mock_store):
+            workspaces_on.invalidate_group_workspace_permission("team", "ws1")
+        denials = workspaces_on._get_denial_cache()
+        assert denials.get("user1:ws1") is None
+        assert denials.get("user2:ws1") is None
+        assert denials.get("user1:ws2") is not None
+
+    def test_flush_workspace_cache(self, workspaces_on):
+        workspaces_on.flush_workspace_cache()
+        denials = workspaces_on._get_denial_cache()
+        assert denials.get("user1:ws2") is None
+        assert denials.get("user2:ws1") is None
+
+
 class TestLookupWorkspacePermission:
     """Test _lookup_workspace_permission() function."""
 
@@ -152,8 +237,10 @@ class TestLookupWorkspacePermission:
         import mlflow_oidc_auth.utils.workspace_cache as wc
 
         wc._cache = None
+        wc._denial_cache = None
         yield
         wc._cache = None
+        wc._denial_cache = None
 
     def test_tries_user_permission_first(self):
         """_lookup_workspace_permission() tries user-level permission first."""
@@ -229,8 +316,10 @@ class TestFlushWorkspaceCache:
         import mlflow_oidc_auth.utils.workspace_cache as wc
 
         wc._cache = None
+        wc._denial_cache = None
         yield
         wc._cache = None
+        wc._denial_cache = None
 
     def test_flush_clears_all_entries(self):
         """flush_workspace_cache() clears the entire cache."""
@@ -242,6 +331,7 @@ class TestFlushWorkspaceCache:
         mock_config = MagicMock()
         mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
         mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 10
         mock_config.CACHE_BACKEND = "local"
 
         with patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config):
@@ -262,6 +352,7 @@ class TestFlushWorkspaceCache:
         mock_config = MagicMock()
         mock_config.WORKSPACE_CACHE_MAX_SIZE = 1024
         mock_config.WORKSPACE_CACHE_TTL_SECONDS = 300
+        mock_config.WORKSPACE_DENIAL_CACHE_TTL_SECONDS = 10
         mock_config.CACHE_BACKEND = "local"
 
         with patch("mlflow_oidc_auth.utils.workspace_cache.config", mock_config):
@@ -454,8 +545,10 @@ class TestLookupWithRegexSources:
         import mlflow_oidc_auth.utils.workspace_cache as wc
 
         wc._cache = None
+        wc._denial_cache = None
         yield
         wc._cache = None
+        wc._denial_cache = None
 
     def test_falls_through_to_user_regex(self):
         """When user-direct and group-direct fail, user-regex matches."""
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from flask import Flask
 
+from mlflow_oidc_auth.models import PermissionResult
 from mlflow_oidc_auth.permissions import get_permission
 from mlflow_oidc_auth.validators.stuff import (
     validate_can_create_gateway,
@@ -16,6 +17,14 @@ from mlflow_oidc_auth.validators.stuff import (
     validate_can_invoke_scorer,
 )
 
+_ENDPOINT_PERMISSION = "mlflow_oidc_auth.utils.gateway_capabilities.gateway_endpoint_permission"
+_CAN_USE_ANY = "mlflow_oidc_auth.utils.gateway_capabilities.can_use_any_gateway_endpoint"
+
+
+def _result(permission: str) -> PermissionResult:
+    return PermissionResult(get_permission(permission), "user")
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -69,18 +78,18 @@ class TestValidateGatewayProxy:
         """POST authorizes the endpoint named inside gateway_path."""
         with (
             flask_app.test_request_context("/", method="POST", json={"gateway_path": "gateway/my-endpoint/invocations"}),
-            patch("mlflow_oidc_auth.utils.permissions.can_update_gateway_endpoint", return_value=True) as mock_upd,
+            patch(_ENDPOINT_PERMISSION, return_value=_result("EDIT")) as mock_perm,
         ):
             assert validate_gateway_proxy("alice") is True
-        mock_upd.assert_called_once_with("my-endpoint", "alice")
+        mock_perm.assert_called_once_with("my-endpoint", "alice")
 
     def test_post_denied_when_user_cannot_update_that_endpoint(self, flask_app: Flask) -> None:
         with (
             flask_app.test_request_context("/", method="POST", json={"gateway_path": "gateway/locked-ep/invocations"}),
-            patch("mlflow_oidc_auth.utils.permissions.can_update_gateway_endpoint", return_value=False) as mock_upd,
+            patch(_ENDPOINT_PERMISSION, return_value=_result("USE")) as mock_perm,
         ):
             assert validate_gateway_proxy("bob") is False
-        mock_upd.assert_called_once_with("locked-ep", "bob")
+        mock_perm.assert_called_once_with("locked-ep", "bob")
 
     def test_post_ignores_the_query_string(self, flask_app: Flask) -> None:
         """THE #288 BYPASS: MLflow ignores the query string entirely on a POST.
@@ -94,19 +103,19 @@ class TestValidateGatewayProxy:
                 method="POST",
                 json={"gateway_path": "gateway/VICTIM/invocations"},
             ),
-            patch("mlflow_oidc_auth.utils.permissions.can_update_gateway_endpoint", return_value=True) as mock_upd,
+            patch(_ENDPOINT_PERMISSION, return_value=_result("EDIT")) as mock_perm,
         ):
             validate_gateway_proxy("alice")
-        mock_upd.assert_called_once_with("VICTIM", "alice")
+        mock_perm.assert_called_once_with("VICTIM", "alice")
 
     def test_post_ignores_other_body_keys_in_favour_of_gateway_path(self, flask_app: Flask) -> None:
         """Second #288 vector: right source, wrong field. MLflow reads gateway_path only."""
         with (
             flask_app.test_request_context("/", method="POST", json={"gateway_name": "my-own", "name": "my-own", "gateway_path": "gateway/VICTIM/invocations"}),
-            patch("mlflow_oidc_auth.utils.permissions.can_update_gateway_endpoint", return_value=True) as mock_upd,
+            patch(_ENDPOINT_PERMISSION, return_value=_result("EDIT")) as mock_perm,
         ):
             validate_gateway_proxy("alice")
-        mock_upd.assert_called_once_with("VICTIM", "alice")
+        mock_perm.assert_called_once_with("VICTIM", "alice")
 
     @pytest.mark.parametrize("body", [{}, {"gateway_path": ""}, {"gateway_path": "not/a/valid/path"}, {"gateway_path": "gateway//invocations"}])
     def test_post_denies_when_no_endpoint_can_be_resolved(self, flask_app: Flask, body) -> None:
@@ -119,52 +128,30 @@ class TestValidateGatewayProxy:
         # The user MUST hold UPDATE on an endpoint of their own here, otherwise the
         # assertion passes whether or not the fallback exists — the fallback would find
         # nothing to grant on. This is exactly the state that made the old code unsafe.
-        perm = MagicMock()
-        perm.permission = "MANAGE"
         with (
             flask_app.test_request_context("/", method="POST", json=body),
-            patch("mlflow_oidc_auth.store.store") as mock_store,
+            patch(_ENDPOINT_PERMISSION, return_value=_result("MANAGE")) as mock_perm,
+            patch(_CAN_USE_ANY, return_value=True),
         ):
-            mock_store.list_gateway_endpoint_permissions.return_value = [perm]
             assert validate_gateway_proxy("alice") is False
+        mock_perm.assert_not_called()
 
     def test_get_names_no_endpoint_and_falls_back_to_any_use(self, flask_app: Flask) -> None:
         """A GET is the endpoint listing; _validate_gateway_path forbids naming one."""
-        perm = MagicMock()
-        perm.permission = "EDIT"
         with (
             flask_app.test_request_context("/?gateway_path=api/2.0/endpoints", method="GET"),
-            patch("mlflow_oidc_auth.store.store") as mock_store,
+            patch(_CAN_USE_ANY, return_value=True) as mock_any,
         ):
-            mock_store.list_gateway_endpoint_permissions.return_value = [perm]
             assert validate_gateway_proxy("alice") is True
-        mock_store.list_gateway_endpoint_permissions.assert_called_once_with("alice")
-
-    def test_get_fallback_any_gateway_with_use(self, flask_app: Flask) -> None:
-        """GET without explicit name falls back to listing all endpoint permissions."""
-        perm = MagicMock()
-        perm.permission = "EDIT"
-
-        with (
-            flask_app.test_request_context("/", method="GET"),
-            patch("mlflow_oidc_auth.store.store") as mock_store,
-        ):
-            mock_store.list_gateway_endpoint_permissions.return_value = [perm]
-            result = validate_gateway_proxy("alice")
-
-        assert result is True
-        mock_store.list_gateway_endpoint_permissions.assert_called_once_with("alice")
+        mock_any.assert_called_once_with("alice")
 
     def test_get_fallback_no_permissions(self, flask_app: Flask) -> None:
-        """GET without explicit name returns False when user has no endpoint permissions."""
+        """GET without explicit name returns False when no endpoint grant allows USE."""
         with (
             flask_app.test_request_context("/", method="GET"),
-            patch("mlflow_oidc_auth.store.store") as mock_store,
+            patch(_CAN_USE_ANY, return_value=False),
         ):
-            mock_store.list_gateway_endpoint_permissions.return_value = []
-            result = validate_gateway_proxy("nobody")
-
-        assert result is False
+            assert validate_gateway_proxy("nobody") is False
 
 
 # ---------------------------------------------------------------------------
@@ -5,26 +5,20 @@ resources (experiments, models, prompts) in a single operation, minimizing datab
 queries compared to per-item permission lookups.
 """
 
-import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from mlflow.server.handlers import _get_tracking_store
 
 from mlflow_oidc_auth.config import config
-from mlflow_oidc_auth.entities import (
-    ExperimentGroupRegexPermission,
-    ExperimentPermission,
-    ExperimentRegexPermission,
-    RegisteredModelGroupRegexPermission,
-    RegisteredModelPermission,
-    RegisteredModelRegexPermission,
-)
 from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.models import PermissionResult
-from mlflow_oidc_auth.permissions import NO_PERMISSIONS, compare_permissions, get_permission
+from mlflow_oidc_auth.permissions import NO_PERMISSIONS, get_permission
 from mlflow_oidc_auth.store import store
+from mlflow_oidc_auth.utils.experiment_metadata import get_experiment_metadata
+from mlflow_oidc_auth.utils.permission_snapshot import get_permission_snapshot
 from mlflow_oidc_auth.utils.permissions import EXPERIMENT, PROMPT, REGISTERED_MODEL, record_permission_fallback
+from mlflow_oidc_auth.utils.regex_rules import CompiledRuleSet, get_compiled_rule_set
 
 logger = get_logger()
 
@@ -39,6 +33,7 @@ class UserPermissionContext:
         user_experiment_permissions: Dict mapping experiment_id to permission string.
         group_experiment_permissions: Dict mapping experiment_id to permission string.
         experiment_regex_permissions: Ordered list of user's experiment regex permissions.
+            Regex fields hold the snapshot's shared compiled rule sets, in priority order.
         group_experiment_regex_permissions: Ordered list of group experiment regex permissions.
         user_model_permissions: Dict mapping model_name to permission string.
         group_model_permissions: Dict mapping model_name to permission string.
@@ -55,57 +50,28 @@ class UserPermissionContext:
     # Experiment permissions
     user_experiment_permissions: Dict[str, str]
     group_experiment_permissions: Dict[str, str]
-    experiment_regex_permissions: List[ExperimentRegexPermission]
-    group_experiment_regex_permissions: List[ExperimentGroupRegexPermission]
+    experiment_regex_permissions: CompiledRuleSet
+    group_experiment_regex_permissions: CompiledRuleSet
     # Model permissions (also used for prompts)
     user_model_permissions: Dict[str, str]
     group_model_permissions: Dict[str, str]
-    model_regex_permissions: List[RegisteredModelRegexPermission]
-    group_model_regex_permissions: List[RegisteredModelGroupRegexPermission]
+    model_regex_permissions: CompiledRuleSet
+    group_model_regex_permissions: CompiledRuleSet
     # Prompt-specific regex permissions
-    prompt_regex_permissions: List[RegisteredModelRegexPermission]
-    group_prompt_regex_permissions: List[RegisteredModelGroupRegexPermission]
+    prompt_regex_permissions: CompiledRuleSet
+    group_prompt_regex_permissions: CompiledRuleSet
     # Memo for the workspace fallback. Lifetime is this context object — i.e. one
     # batch call — so it cannot serve a stale decision across requests.
     workspace_permission_memo: Dict[str, Optional[object]] = field(default_factory=dict)
 
 
-def _collapse_group_permissions(permissions: List, resource_attr: str) -> Dict[str, str]:
-    """Collapse multiple group grants on one resource to a single permission.
-
-    A user in several groups can hold more than one grant on the same resource. This was
-    previously a last-wins dict comprehension, so the winner was whichever row the
-    database happened to return last — an order SQL does not guarantee without an
-    ORDER BY, and which therefore could differ by backend or query plan.
-
-    Worse, it disagreed with the per-resource path
-    (``BaseGroupPermissionRepository.get_group_permission_for_user_resource``), which
-    folds with ``compare_permissions``. For the same user and data — groups granting
-    MANAGE and READ on one experiment — the per-resource check returned MANAGE while the
-    batch check returned READ. Folding with the same ``compare_permissions`` rule makes
-    the two paths agree and makes the result independent of row order (issue #253).
-
-    NOTE: this deliberately reuses the EXISTING precedence rule rather than defining a
-    new one. ``compare_permissions`` ranks by ``priority``, and NO_PERMISSIONS carries
-    priority 100 — so a NO_PERMISSIONS group grant outranks MANAGE here, exactly as it
-    already does on the per-resource path. Whether that precedence is the right policy
-    for multi-group membership is issue #80, and is intentionally not changed here.
-    """
-    collapsed: Dict[str, str] = {}
-    for perm in permissions:
-        resource_id = getattr(perm, resource_attr)
-        current = collapsed.get(resource_id)
-        # compare_permissions(a, b) is True when b is at least as strong as a.
-        if current is None or compare_permissions(current, perm.permission):
-            collapsed[resource_id] = perm.permission
-    return collapsed
-
-
 def build_user_permission_context(username: str) -> UserPermissionContext:
-    """Build a permission context for a user by fetching all permissions in batch.
+    """Build a permission context for a user from their compiled permission snapshot.
 
-    This function makes a fixed number of database queries regardless of the number
-    of resources being checked, enabling efficient batch permission resolution.
+    The snapshot (utils/permission_snapshot.py) is shared with ``resolve_permission``,
+    so the listing and single-resource paths read the same grants, and a warm snapshot
+    makes building a context free. A cold build makes a fixed number of database
+    queries regardless of the number of resources being checked.
 
     Parameters:
         username: The username to build context for.
@@ -113,50 +79,25 @@ def build_user_permission_context(username: str) -> UserPermissionContext:
     Returns:
         UserPermissionContext with all permission data pre-fetched.
     """
-    # Get user's group IDs (single query)
-    group_ids = store.get_groups_ids_for_user(username)
-
-    # Fetch all experiment permissions for user (single query)
-    user_exp_perms = store.list_experiment_permissions(username)
-    user_experiment_permissions = {p.experiment_id: p.permission for p in user_exp_perms}
-
-    # Fetch all experiment permissions from user's groups (single query)
-    group_exp_perms = store.list_user_groups_experiment_permissions(username)
-    group_experiment_permissions = _collapse_group_permissions(group_exp_perms, "experiment_id")
-
-    # Fetch experiment regex permissions (single query each)
-    experiment_regex_permissions = store.list_experiment_regex_permissions(username)
-    group_experiment_regex_permissions = store.list_group_experiment_regex_permissions_for_groups_ids(group_ids) if group_ids else []
-
-    # Fetch all registered model permissions for user (single query)
-    user_model_perms = store.list_registered_model_permissions(username)
-    user_model_permissions = {p.name: p.permission for p in user_model_perms}
-
-    # Fetch all model permissions from user's groups (single query)
-    group_model_perms = store.list_user_groups_registered_model_permissions(username)
-    group_model_permissions = _collapse_group_permissions(group_model_perms, "name")
-
-    # Fetch model regex permissions (single query each)
-    model_regex_permissions = store.list_registered_model_regex_permissions(username)
-    group_model_regex_permissions = store.list_group_registered_model_regex_permissions_for_groups_ids(group_ids) if group_ids else []
-
-    # Fetch prompt regex permissions (prompts use model permissions but have separate regex)
-    prompt_regex_permissions = store.list_prompt_regex_permissions(username)
-    group_prompt_regex_permissions = store.list_group_prompt_regex_permissions_for_groups_ids(group_ids) if group_ids else []
+    snapshot = get_permission_snapshot(username, store)
+    experiments = snapshot.grants(EXPERIMENT)
+    models = snapshot.grants(REGISTERED_MODEL)
+    prompts = snapshot.grants(PROMPT)
 
     return UserPermissionContext(
         username=username,
-        group_ids=group_ids,
-        user_experiment_permissions=user_experiment_permissions,
-        group_experiment_permissions=group_experiment_permissions,
-        experiment_regex_permissions=experiment_regex_permissions,
-        group_experiment_regex_permissions=group_experiment_regex_permissions,
-        user_model_permissions=user_model_permissions,
-        group_model_permissions=group_model_permissions,
-        model_regex_permissions=model_regex_permissions,
-        group_model_regex_permissions=group_model_regex_permissions,
-        prompt_regex_permissions=prompt_regex_permissions,
-        group_prompt_regex_permissions=group_prompt_regex_permissions,
+        group_ids=snapshot.group_ids,
+        user_experiment_permissions=experiments.user,
+        group_experiment_permissions=experiments.group,
+        experiment_regex_permissions=experiments.regex,
+        group_experiment_regex_permissions=experiments.group_regex,
+        user_model_permissions=models.user,
+        group_model_permissions=models.group,
+        model_regex_permissions=models.regex,
+        group_model_regex_permissions=models.group_regex,
+        # Prompts use model permissions but have separate regex
+        prompt_regex_permissions=prompts.regex,
+        group_prompt_regex_permissions=prompts.group_regex,
     )
 
 
@@ -220,12 +161,12 @@ def _apply_workspace_fallback(result: PermissionResult, username: str, ctx: Opti
     (WSAUTH-C/WSAUTH-04) but is designed for batch resolution in FastAPI route context
     where the workspace is available via MLflow's ContextVar (set by WorkspaceContextMiddleware).
 
-    The workspace permission is the same for every resource in a batch, but
-    ``get_workspace_permission_cached`` deliberately does not cache DENIALS — so without
-    a memo a user with no workspace grant paid a full source walk (measured 7 queries) for
-    EVERY resource in the batch, making a listing 15+7N queries instead of a flat 22.
-    Memoizing on ``ctx`` bounds the lifetime to this one batch call, so unlike a
-    cross-request cache it cannot serve a stale authorization decision (issue #253).
+    The workspace permission is the same for every resource in a batch. Without a memo, a
+    user with no workspace grant paid a full source walk (measured 7 queries) for EVERY
+    resource, because denials were not cached, making a listing 15+7N queries instead of a
+    flat 22. ``get_workspace_permission_cached`` now caches denials briefly too, but the
+    memo still keeps a batch to at most one lookup. It also keeps a single decision for
+    the whole batch even if a cached entry expires partway through (issue #253).
 
     Parameters:
         result: The PermissionResult from resource-level resolution.
@@ -265,16 +206,15 @@ def _find_regex_permission(regexes: List, name: str) -> Optional[str]:
     """Find the first matching regex permission for a given name.
 
     Parameters:
-        regexes: List of regex permission objects with .regex and .permission attributes.
+        regexes: Priority-ordered regex permission objects with .regex and .permission
+            attributes, or a ``CompiledRuleSet``.
         name: The name to match against regexes.
 
     Returns:
         The permission string if a match is found, None otherwise.
     """
-    for regex_perm in regexes:
-        if re.match(regex_perm.regex, name):
-            return regex_perm.permission
-    return None
+    rule = get_compiled_rule_set(regexes).match(name)
+    return rule.permission if rule is not None else None
 
 
 def resolve_experiment_permission_from_context(
@@ -295,7 +235,7 @@ def resolve_experiment_permission_from_context(
     """
     # Get experiment name for regex matching (may require a query if not provided)
     if experiment_name is None:
-        experiment_name = _get_tracking_store().get_experiment(experiment_id).name
+        experiment_name = get_experiment_metadata(_get_tracking_store(), experiment_id).name
 
     # Look up permissions from context (no DB queries)
     user_direct = ctx.user_experiment_permissions.get(experiment_id)
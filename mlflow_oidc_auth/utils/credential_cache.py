@@ -0,0 +1,125 @@
+"""Short-lived cache of verified HTTP Basic credentials.
+
+Every Basic-authenticated request used to run ``check_password_hash`` on the
+stored hash. The MLflow CLI and service accounts send many requests per second
+with the same credentials, so that hash was paid over and over on the request
+path. A successful verification is now remembered for
+``BASIC_AUTH_CACHE_TTL_SECONDS`` (default 60, 0 disables).
+
+Entries never hold the password. The key is ``<username>:<HMAC-SHA256>`` over
+the username and password, with an HMAC key generated at process start and
+never persisted, so a key cannot be checked against password guesses outside
+this process. The username prefix lets one user's entries be dropped together.
+The value is the password expiration the verification saw, so an entry stops
+being honoured the moment the password expires.
+
+The cache is always in-process (never Redis), whatever ``CACHE_BACKEND`` says:
+a shared store would put credential-derived keys on the network. Its
+invalidations are broadcast over ``CACHE_INVALIDATION_BUS`` when one is
+configured. Without a bus, another replica may accept a replaced password until
+its entry's TTL runs out.
+
+The store drops a user's entries whenever the user is created, deleted, or
+updated with a new password, expiration or active flag (see
+``_CREDENTIAL_LIFECYCLE_METHODS`` in ``sqlalchemy_store.py``). Failed
+verifications are never cached.
+"""
+
+import hashlib
+import hmac
+import secrets
+from datetime import datetime, timezone
+
+from mlflow_oidc_auth.cache import CacheBackend, with_invalidation_bus
+from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+
+logger = get_logger()
+
+_cache: CacheBackend | None = None
+
+_BASIC_AUTH_CACHE_DEFAULT_MAX_SIZE = 1024
+_BASIC_AUTH_CACHE_DEFAULT_TTL = 60
+
+# Per-process and never written anywhere.
+_HMAC_KEY = secrets.token_bytes(32)
+
+# Stored when the password does not expire. Backends return None on a miss, so
+# None cannot mark one.
+_NO_EXPIRATION = 0.0
+
+
+def _ttl() -> int:
+    return getattr(config, "BASIC_AUTH_CACHE_TTL_SECONDS", _BASIC_AUTH_CACHE_DEFAULT_TTL)
+
+
+def _enabled() -> bool:
+    """A TTL of 0 or less turns the cache off."""
+    return _ttl() > 0
+
+
+def _get_cache() -> CacheBackend:
+    """Get or create the verified-credential cache (lazy init)."""
+    global _cache
+    if _cache is None:
+        maxsize = getattr(config, "BASIC_AUTH_CACHE_MAX_SIZE", _BASIC_AUTH_CACHE_DEFAULT_MAX_SIZE)
+        _cache = with_invalidation_bus(LocalTTLCacheBackend(maxsize=maxsize, ttl=_ttl()), "basic-auth")
+    return _cache
+
+
+def _make_cache_key(username: str, password: str) -> str:
+    digest = hmac.new(_HMAC_KEY, f"{username}\0{password}".encode("utf-8"), hashlib.sha256).hexdigest()
+    return f"{username}:{digest}"
+
+
+def is_verified(username: str, password: str) -> bool:
+    """Whether these exact credentials were verified recently and have not expired since.
+
+    ``username`` must already be normalized.
+    """
+    if not _enabled():
+        return False
+    expires_at = _get_cache().get(_make_cache_key(username, password))
+    if expires_at is None:
+        return False
+    if expires_at != _NO_EXPIRATION and expires_at <= datetime.now(timezone.utc).timestamp():
+        return False
+    return True
+
+
+def remember_verified(username: str, password: str, password_expiration: datetime | None) -> None:
+    """Record a successful verification.
+
+    Parameters:
+        username: Normalized username.
+        password: The password that was verified. Only its keyed hash is kept.
+        password_expiration: The stored expiration at verification time, or None.
+    """
+    if not _enabled():
+        return
+    if password_expiration is None:
+        expires_at = _NO_EXPIRATION
+    else:
+        if password_expiration.tzinfo is None:
+            password_expiration = password_expiration.replace(tzinfo=timezone.utc)
+        expires_at = password_expiration.timestamp()
+    _get_cache().set(_make_cache_key(username, password), expires_at)
+
+
+def invalidate_user_credentials(username: str) -> None:
+    """Drop every cached verification for ``username`` (normalized).
+
+    Goes through the cache even when this process has cached nothing yet, so the
+    invalidation still reaches the other replicas over the bus.
+    """
+    if not _enabled():
+        return
+    _get_cache().delete_prefix(f"{username}:")
+    logger.debug("Dropped cached Basic auth verifications for %s", username.replace("\n", "").replace("\r", ""))
+
+
+def clear_credential_cache() -> None:
+    """Drop every cached verification."""
+    if _cache is not None:
+        _cache.clear()
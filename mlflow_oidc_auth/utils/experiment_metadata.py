@@ -0,0 +1,182 @@
+"""Experiment id to name, workspace and lifecycle stage, cached.
+
+Regex permissions match on the experiment name, and workspace filtering needs the
+experiment's workspace. Both used to call ``get_experiment`` per experiment. That
+loads the experiment's tags too, so a 1,000-experiment search page cost 1,000
+extra tracking-store round trips for fields the search response already held.
+
+``ExperimentMetadata`` keeps only the fields these checks read. It is cached on
+the configured ``CACHE_BACKEND`` for ``EXPERIMENT_METADATA_CACHE_TTL_SECONDS``
+(default 30, 0 disables), and:
+
+- :func:`remember_experiments` primes the cache from experiment entities the
+  tracking store has just returned (search refetch pages);
+- :func:`get_experiments_metadata` resolves every miss with one ``IN (...)``
+  query on a SQL tracking store, and one ``get_experiment`` per id otherwise;
+- :func:`invalidate_experiment_metadata` is called by the after-request hooks
+  for rename, delete and restore, and by the trash router's restore. With a
+  ``local`` or ``tiered`` backend the drop is published on
+  ``CACHE_INVALIDATION_BUS``, so other replicas forget the entry too. Without a
+  bus the TTL bounds how long they keep deciding on the old name or workspace,
+  which is why it matches the permission cache's rather than the resolver's.
+
+Unknown ids still raise MLflow's own error from ``get_experiment`` and are never
+cached.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from mlflow_oidc_auth.cache import CacheBackend, get_cache_backend
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.utils.experiment_resolver import _IN_CLAUSE_CHUNK, _sql_store
+
+logger = get_logger()
+
+_cache: CacheBackend | None = None
+
+_METADATA_CACHE_DEFAULT_MAX_SIZE = 10_000
+_METADATA_CACHE_DEFAULT_TTL = 30
+
+
+@dataclass(frozen=True)
+class ExperimentMetadata:
+    """The experiment fields authorization reads.
+
+    Attributes:
+        experiment_id: The experiment id.
+        name: The experiment name, matched by regex permissions.
+        workspace: The workspace the experiment belongs to, or None if unknown.
+        lifecycle_stage: ``"active"`` or ``"deleted"``.
+    """
+
+    experiment_id: str
+    name: str
+    workspace: Optional[str]
+    lifecycle_stage: str
+
+
+def _ttl() -> int:
+    return getattr(config, "EXPERIMENT_METADATA_CACHE_TTL_SECONDS", _METADATA_CACHE_DEFAULT_TTL)
+
+
+def _enabled() -> bool:
+    """A TTL of 0 or less turns the cache off."""
+    return _ttl() > 0
+
+
+def _get_cache() -> CacheBackend:
+    """Get or create the experiment metadata cache (lazy init)."""
+    global _cache
+    if _cache is None:
+        maxsize = getattr(config, "EXPERIMENT_METADATA_CACHE_MAX_SIZE", _METADATA_CACHE_DEFAULT_MAX_SIZE)
+        _cache = get_cache_backend("experiment-metadata", maxsize=maxsize, ttl=_ttl())
+    return _cache
+
+
+def _from_experiment(experiment) -> ExperimentMetadata:
+    """Metadata from an MLflow ``Experiment`` entity."""
+    workspace = getattr(experiment, "workspace", None)
+    return ExperimentMetadata(
+        experiment_id=str(experiment.experiment_id),
+        name=experiment.name,
+        workspace=workspace or None,
+        lifecycle_stage=experiment.lifecycle_stage,
+    )
+
+
+def _query_experiments(sql_store, experiment_ids: List[str]) -> Dict[str, ExperimentMetadata]:
+    from mlflow.store.tracking.dbmodels.models import SqlExperiment
+    from mlflow.utils.workspace_utils import resolve_entity_workspace_name
+
+    # Ids that are not integers are left to get_experiment, which raises MLflow's error for them.
+    numeric = [int(experiment_id) for experiment_id in experiment_ids if str(experiment_id).isdigit()]
+    found: Dict[str, ExperimentMetadata] = {}
+    with sql_store.ManagedSessionMaker() as session:
+        for start in range(0, len(numeric), _IN_CLAUSE_CHUNK):
+            chunk = numeric[start : start + _IN_CLAUSE_CHUNK]
+            rows = (
+                sql_store._get_query(session, SqlExperiment)
+                .with_entities(SqlExperiment.experiment_id, SqlExperiment.name, SqlExperiment.workspace, SqlExperiment.lifecycle_stage)
+                .filter(SqlExperiment.experiment_id.in_(chunk))
+            )
+            for experiment_id, name, workspace, lifecycle_stage in rows:
+                found[str(experiment_id)] = ExperimentMetadata(str(experiment_id), name, resolve_entity_workspace_name(workspace), lifecycle_stage)
+    return found
+
+
+def get_experiments_metadata(tracking_store, experiment_ids: Iterable[str]) -> Dict[str, ExperimentMetadata]:
+    """Metadata for each experiment id.
+
+    Parameters:
+        tracking_store: The MLflow tracking store (``_get_tracking_store()``).
+        experiment_ids: Experiment ids; duplicates are resolved once.
+
+    Returns:
+        ``{experiment_id: ExperimentMetadata}`` for every requested id.
+
+    Raises:
+        MlflowException: If an experiment does not exist, as raised by ``get_experiment``.
+    """
+    unique = list(dict.fromkeys(str(experiment_id) for experiment_id in experiment_ids))
+    enabled = _enabled()
+    resolved: Dict[str, ExperimentMetadata] = {}
+    if enabled:
+        resolved = _get_cache().get_many(unique)
+
+    missing = [experiment_id for experiment_id in unique if experiment_id not in resolved]
+    if not missing:
+        return resolved
+
+    found: Dict[str, ExperimentMetadata] = {}
+    sql_store = _sql_store(tracking_store)
+    if sql_store is not None:
+        try:
+            found = _query_experiments(sql_store, missing)
+        except Exception as e:
+            # The per-id path below still answers (or raises MLflow's own error).
+            logger.warning("Bulk experiment metadata lookup failed, resolving one by one: %s", e)
+    for experiment_id in missing:
+        if experiment_id not in found:
+            found[experiment_id] = _from_experiment(tracking_store.get_experiment(experiment_id))
+
+    if enabled:
+        _get_cache().set_many(found)
+    resolved.update(found)
+    return resolved
+
+
+def get_experiment_metadata(tracking_store, experiment_id: str) -> ExperimentMetadata:
+    """Metadata for one experiment. See :func:`get_experiments_metadata`."""
+    return get_experiments_metadata(tracking_store, [experiment_id])[str(experiment_id)]
+
+
+def remember_experiments(experiments: Iterable) -> None:
+    """Prime the cache from experiments MLflow has just returned.
+
+    Parameters:
+        experiments: MLflow ``Experiment`` entities from the tracking store. Response
+            protos are not accepted: their workspace field is not always populated.
+    """
+    if not _enabled():
+        return
+    entries = {}
+    for experiment in experiments:
+        metadata = _from_experiment(experiment)
+        entries[metadata.experiment_id] = metadata
+    if entries:
+        _get_cache().set_many(entries)
+
+
+def invalidate_experiment_metadata(experiment_id: str) -> None:
+    """Drop the cached metadata of one experiment (renamed, deleted or restored)."""
+    if not _enabled():
+        return
+    _get_cache().delete(str(experiment_id))
+
+
+def clear_experiment_metadata_cache() -> None:
+    """Drop every cached experiment's metadata."""
+    if _cache is not None:
+        _cache.clear()
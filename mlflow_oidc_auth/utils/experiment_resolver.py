@@ -0,0 +1,185 @@
+"""Run and trace id to experiment id resolution, cached.
+
+Run and trace permissions inherit from the parent experiment, so every run- or
+trace-scoped request first has to learn that experiment's id. The validators
+used to get it from ``get_run`` / ``get_trace_info``, and ``get_run`` loads the
+run's params, metrics, tags and inputs just so one column could be read. A
+training job logging metrics paid that on every batch.
+
+A run or trace never moves to another experiment (only its lifecycle changes),
+so the mapping is cached for a long time: ``EXPERIMENT_RESOLVER_CACHE_TTL_SECONDS``
+(default 86400, 0 disables) and at most ``EXPERIMENT_RESOLVER_CACHE_MAX_SIZE``
+ids per process. Nothing has to invalidate it. Ids are UUIDs and are never
+reused, so an entry for a deleted run is just never asked for again.
+
+On a SQL tracking store a miss selects only ``experiment_id``, and the bulk
+functions resolve every miss with one ``IN (...)`` query. The query goes through
+the store's own query builder, so a workspace-aware store applies the same
+scoping ``get_run`` would on the miss. A hit is not scoped again; that is safe
+because the permission check is made against the id's real experiment, and the
+MLflow handler still scopes its own read. Any id the query does not return, and every id on a
+non-SQL store, goes through ``get_run`` / ``get_trace_info`` as before, so an
+unknown id still fails with MLflow's own error. Failures are never cached.
+"""
+
+from typing import Callable, Dict, Iterable, List
+
+from mlflow_oidc_auth.cache import CacheBackend, get_cache_backend
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+
+logger = get_logger()
+
+_cache: CacheBackend | None = None
+
+_RESOLVER_CACHE_DEFAULT_MAX_SIZE = 100_000
+_RESOLVER_CACHE_DEFAULT_TTL = 86400
+
+# Bound parameters per IN (...) query; stays well under SQLite's limit.
+_IN_CLAUSE_CHUNK = 500
+
+
+def _ttl() -> int:
+    return getattr(config, "EXPERIMENT_RESOLVER_CACHE_TTL_SECONDS", _RESOLVER_CACHE_DEFAULT_TTL)
+
+
+def _enabled() -> bool:
+    """A TTL of 0 or less turns the cache off."""
+    return _ttl() > 0
+
+
+def _get_cache() -> CacheBackend:
+    """Get or create the resolver cache (lazy init)."""
+    global _cache
+    if _cache is None:
+        maxsize = getattr(config, "EXPERIMENT_RESOLVER_CACHE_MAX_SIZE", _RESOLVER_CACHE_DEFAULT_MAX_SIZE)
+        _cache = get_cache_backend("experiment-resolver", maxsize=maxsize, ttl=_ttl())
+    return _cache
+
+
+def _sql_store(tracking_store):
+    """``tracking_store`` if it is MLflow's SQL store, else None."""
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    return tracking_store if isinstance(tracking_store, SqlAlchemyStore) else None
+
+
+def _query_run_experiments(sql_store, run_ids: List[str]) -> Dict[str, str]:
+    from mlflow.store.tracking.dbmodels.models import SqlRun
+
+    found: Dict[str, str] = {}
+    with sql_store.ManagedSessionMaker() as session:
+        for start in range(0, len(run_ids), _IN_CLAUSE_CHUNK):
+            chunk = run_ids[start : start + _IN_CLAUSE_CHUNK]
+            rows = sql_store._get_query(session, SqlRun).with_entities(SqlRun.run_uuid, SqlRun.experiment_id).filter(SqlRun.run_uuid.in_(chunk))
+            found.update((run_id, str(experiment_id)) for run_id, experiment_id in rows)
+    return found
+
+
+def _query_trace_experiments(sql_store, trace_ids: List[str]) -> Dict[str, str]:
+    from mlflow.store.tracking.dbmodels.models import SqlTraceInfo
+
+    found: Dict[str, str] = {}
+    with sql_store.ManagedSessionMaker() as session:
+        for start in range(0, len(trace_ids), _IN_CLAUSE_CHUNK):
+            chunk = trace_ids[start : start + _IN_CLAUSE_CHUNK]
+            rows = sql_store._trace_query(session).with_entities(SqlTraceInfo.request_id, SqlTraceInfo.experiment_id).filter(SqlTraceInfo.request_id.in_(chunk))
+            found.update((trace_id, str(experiment_id)) for trace_id, experiment_id in rows)
+    return found
+
+
+def _resolve(
+    kind: str,
+    ids: Iterable[str],
+    tracking_store,
+    query: Callable[[object, List[str]], Dict[str, str]],
+    fetch_one: Callable[[str], str],
+) -> Dict[str, str]:
+    unique = list(dict.fromkeys(ids))
+    keys = {item: f"{kind}:{item}" for item in unique}
+    enabled = _enabled()
+    resolved: Dict[str, str] = {}
+    if enabled:
+        cached = _get_cache().get_many(list(keys.values()))
+        resolved = {item: cached[key] for item, key in keys.items() if key in cached}
+
+    missing = [item for item in unique if item not in resolved]
+    if not missing:
+        return resolved
+
+    found: Dict[str, str] = {}
+    sql_store = _sql_store(tracking_store)
+    if sql_store is not None:
+        try:
+            found = query(sql_store, missing)
+        except Exception as e:
+            # The per-id path below still answers (or raises MLflow's own error).
+            logger.warning("Bulk %s experiment lookup failed, resolving one by one: %s", kind, e)
+    for item in missing:
+        if item not in found:
+            found[item] = fetch_one(item)
+
+    if enabled:
+        _get_cache().set_many({keys[item]: experiment_id for item, experiment_id in found.items()})
+    resolved.update(found)
+    return resolved
+
+
+def experiment_ids_for_runs(tracking_store, run_ids: Iterable[str]) -> Dict[str, str]:
+    """Map each run id to its experiment id.
+
+    Parameters:
+        tracking_store: The MLflow tracking store (``_get_tracking_store()``).
+        run_ids: Run ids; duplicates are resolved once.
+
+    Returns:
+        ``{run_id: experiment_id}`` for every requested id.
+
+    Raises:
+        MlflowException: If a run does not exist, as raised by ``get_run``.
+    """
+    return _resolve(
+        "run",
+        run_ids,
+        tracking_store,
+        _query_run_experiments,
+        lambda run_id: tracking_store.get_run(run_id).info.experiment_id,
+    )
+
+
+def experiment_id_for_run(tracking_store, run_id: str) -> str:
+    """The experiment id of one run. See :func:`experiment_ids_for_runs`."""
+    return experiment_ids_for_runs(tracking_store, [run_id])[run_id]
+
+
+def experiment_ids_for_traces(tracking_store, trace_ids: Iterable[str]) -> Dict[str, str]:
+    """Map each trace id to its experiment id.
+
+    Parameters:
+        tracking_store: The MLflow tracking store (``_get_tracking_store()``).
+        trace_ids: Trace (request) ids; duplicates are resolved once.
+
+    Returns:
+        ``{trace_id: experiment_id}`` for every requested id.
+
+    Raises:
+        MlflowException: If a trace does not exist, as raised by ``get_trace_info``.
+    """
+    return _resolve(
+        "trace",
+        trace_ids,
+        tracking_store,
+        _query_trace_experiments,
+        lambda trace_id: tracking_store.get_trace_info(trace_id).experiment_id,
+    )
+
+
+def experiment_id_for_trace(tracking_store, trace_id: str) -> str:
+    """The experiment id of one trace. See :func:`experiment_ids_for_traces`."""
+    return experiment_ids_for_traces(tracking_store, [trace_id])[trace_id]
+
+
+def clear_experiment_resolver_cache() -> None:
+    """Drop every cached resolution."""
+    if _cache is not None:
+        _cache.clear()
@@ -0,0 +1,228 @@
+"""Per-user map of the permission a user's grants give each AI Gateway endpoint.
+
+Every gateway invocation passes ``validate_gateway_proxy``. It resolved the named endpoint
+through ``resolve_permission``, a permission-cache round trip per call (a Redis round trip
+on shared deployments) and a full source walk whenever the entry had expired, and the
+endpoint listing read the user's direct grants from the store on every request. Gateway
+calls are the highest-rate traffic the plugin authorizes, so both now read a
+``GatewayCapabilities``: endpoint name -> permission, built once per user and reused.
+
+The map holds "grant-derived" permissions: the first matching user, group, regex or
+group-regex source in ``PERMISSION_SOURCE_ORDER``, exactly as ``resolve_permission``
+resolves them. When the user has regex rules, they are matched against every existing
+endpoint name at build time, so a lookup never runs a pattern. A name no grant reaches
+is recorded as such, and looking it up applies the fallback (``DEFAULT_MLFLOW_PERMISSION``,
+or the workspace permission) per request, as ``resolve_permission`` does. A name the map
+has never seen, such as an endpoint created on another replica, is matched against the
+rules on lookup. Decisions are therefore the same as the per-call path's.
+
+Maps live in a process-local TTL cache and are reused only while
+``get_permission_snapshot`` returns the snapshot they were built from
+(utils/permission_snapshot.py). Every gateway permission write goes through a store
+method that invalidates snapshots, locally and, with ``CACHE_INVALIDATION_BUS``, on every
+replica: the permission routers, and the rename and delete cascades in the after-request
+hooks. The next lookup then gets a new snapshot and rebuilds. Creating, renaming or
+deleting an endpoint also changes which names the regex rules match, so those hooks call
+:func:`invalidate_gateway_capabilities`; only maps built from regex matches are rebuilt.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, ErrorCode
+
+from mlflow_oidc_auth.cache import CacheBackend
+from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.models import PermissionResult
+from mlflow_oidc_auth.permissions import get_permission
+from mlflow_oidc_auth.store import store
+from mlflow_oidc_auth.utils.batch_permissions import _find_regex_permission, _resolve_permission_from_context
+from mlflow_oidc_auth.utils.permission_snapshot import PermissionSnapshot, ResourceGrants, get_permission_snapshot
+from mlflow_oidc_auth.utils.permissions import GATEWAY_ENDPOINT, _apply_workspace_fallback, record_permission_fallback
+
+logger = get_logger()
+
+_CAPABILITY_CACHE_MAX_SIZE = 1024
+_CAPABILITY_CACHE_DEFAULT_TTL = 30
+
+_name_generation_lock = threading.Lock()
+_name_generation = 0
+
+_capability_cache: CacheBackend | None = None
+
+
+@dataclass(frozen=True)
+class GatewayCapabilities:
+    """The gateway endpoint permissions one user's grants give.
+
+    Attributes:
+        permissions: Endpoint name -> grant-derived result, or None for a known name that
+            only the fallback reaches.
+        grants: The snapshot section the map was built from, kept to resolve names
+            the map has not seen.
+        can_use_any: True if some endpoint's grant-derived permission includes USE.
+        uses_names: True if regex rules were matched against endpoint names.
+        snapshot: The permission snapshot the map was built from.
+        name_generation: The endpoint-name generation the map was built at.
+    """
+
+    permissions: Dict[str, Optional[PermissionResult]]
+    grants: ResourceGrants
+    can_use_any: bool
+    uses_names: bool
+    snapshot: PermissionSnapshot
+    name_generation: int
+
+    def granted(self, name: str) -> Optional[PermissionResult]:
+        """The grant-derived result for ``name``, or None if only the fallback reaches it."""
+        try:
+            return self.permissions[name]
+        except KeyError:
+            pass
+        if not self.uses_names:
+            return None
+        return _grant_permission(self.grants, name)
+
+
+def _ttl() -> int:
+    return getattr(config, "GATEWAY_CAPABILITY_TTL_SECONDS", _CAPABILITY_CACHE_DEFAULT_TTL)
+
+
+def _get_capability_cache() -> CacheBackend:
+    """Get or create the capability cache (lazy init). Always in-process, like snapshots."""
+    global _capability_cache
+    if _capability_cache is None:
+        _capability_cache = LocalTTLCacheBackend(maxsize=_CAPABILITY_CACHE_MAX_SIZE, ttl=max(_ttl(), 1))
+    return _capability_cache
+
+
+def _is_current(capabilities: GatewayCapabilities, snapshot: PermissionSnapshot, name_generation: int) -> bool:
+    # Identity, not generation: the generation counters are per process, but an invalidation
+    # from another replica drops the snapshot here, and the next one is a new object.
+    if capabilities.snapshot is not snapshot:
+        return False
+    return not capabilities.uses_names or capabilities.name_generation == name_generation
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+
+def _regex_applies(grants: ResourceGrants) -> bool:
+    order = config.PERMISSION_SOURCE_ORDER
+    return ("regex" in order and len(grants.regex_rules) > 0) or ("group-regex" in order and len(grants.group_regex_rules) > 0)
+
+
+def _grant_permission(grants: ResourceGrants, name: str) -> Optional[PermissionResult]:
+    """The permission the user's grants give one endpoint, or None if only the fallback would."""
+    result = _resolve_permission_from_context(
+        config.PERMISSION_SOURCE_ORDER,
+        grants.user.get(name),
+        grants.group.get(name),
+        _find_regex_permission(grants.regex, name),
+        _find_regex_permission(grants.group_regex, name),
+    )
+    return None if result.kind == "fallback" else result
+
+
+def _endpoint_names() -> List[str]:
+    """Every gateway endpoint name, in every workspace."""
+    from mlflow.server.handlers import _get_tracking_store
+    from mlflow.store.tracking.dbmodels.models import SqlGatewayEndpoint
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    tracking_store = _get_tracking_store()
+    if isinstance(tracking_store, SqlAlchemyStore):
+        with tracking_store.ManagedSessionMaker() as session:
+            return [name for (name,) in session.query(SqlGatewayEndpoint.name) if name]
+    return [endpoint.name for endpoint in tracking_store.list_gateway_endpoints()]
+
+
+def _load_grants(snapshot: PermissionSnapshot) -> ResourceGrants:
+    try:
+        return snapshot.grants(GATEWAY_ENDPOINT)
+    except MlflowException as e:
+        # A user unknown to the auth database has no grants; resolve_permission treats
+        # the same error as a miss on every source.
+        if e.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+            raise
+        return ResourceGrants(user={}, group={}, regex_rules=[], group_regex_rules=[])
+
+
+def _build(username: str, snapshot: PermissionSnapshot, name_generation: int) -> GatewayCapabilities:
+    grants = _load_grants(snapshot)
+    uses_names = _regex_applies(grants)
+
+    names = {*grants.user, *grants.group}
+    if uses_names:
+        try:
+            names.update(_endpoint_names())
+        except Exception as e:
+            # Names not listed here are still matched against the rules on lookup; only
+            # can_use_any misses endpoints reached by a rule alone.
+            logger.warning(f"Could not list gateway endpoints for {username}'s capability map: {e}")
+
+    permissions = {name: _grant_permission(grants, name) for name in names}
+    can_use_any = any(result is not None and result.permission.can_use for result in permissions.values())
+    return GatewayCapabilities(permissions, grants, can_use_any, uses_names, snapshot, name_generation)
+
+
+def get_gateway_capabilities(username: str) -> GatewayCapabilities:
+    """Return ``username``'s current capability map, building it if needed."""
+    name_generation = _name_generation
+    snapshot = get_permission_snapshot(username, store)
+    cache = _get_capability_cache() if _ttl() > 0 else None
+    if cache is not None:
+        capabilities = cache.get(username)
+        if capabilities is not None and _is_current(capabilities, snapshot, name_generation):
+            return capabilities
+
+    capabilities = _build(username, snapshot, name_generation)
+    if cache is not None:
+        cache.set(username, capabilities)
+    logger.debug(f"Built gateway capability map for {username}: {len(capabilities.permissions)} endpoints")
+    return capabilities
+
+
+def invalidate_gateway_capabilities() -> None:
+    """Mark maps built from regex matches stale. Call after an endpoint is created, renamed or deleted."""
+    global _name_generation
+    with _name_generation_lock:
+        _name_generation += 1
+
+
+def clear_gateway_capability_cache() -> None:
+    """Drop every cached map."""
+    if _capability_cache is not None:
+        _capability_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+
+def gateway_endpoint_permission(name: str, username: str) -> PermissionResult:
+    """The effective permission ``username`` holds on the endpoint ``name``.
+
+    The same decision as ``effective_gateway_endpoint_permission``, read from the
+    capability map. Must run inside the Flask request, which supplies the workspace
+    for the fallback.
+    """
+    result = get_gateway_capabilities(username).granted(name)
+    if result is not None:
+        return result
+    result = _apply_workspace_fallback(PermissionResult(get_permission(config.DEFAULT_MLFLOW_PERMISSION), "fallback"), username)
+    if result.kind == "fallback":
+        record_permission_fallback(GATEWAY_ENDPOINT, name, username, result.permission)
+    return result
+
+
+def can_use_any_gateway_endpoint(username: str) -> bool:
+    """Whether some endpoint's user, group, regex or group-regex grant lets ``username`` USE it."""
+    return get_gateway_capabilities(username).can_use_any
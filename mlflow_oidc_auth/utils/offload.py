@@ -0,0 +1,152 @@
+"""
+Run blocking store calls off the event loop.
+
+The FastAPI handlers and ``AuthMiddleware`` are ``async def``, but the auth store is
+synchronous SQLAlchemy and MLflow's tracking and registry stores are synchronous too. Called
+directly, every database round trip stalls the event loop, and with it every other request
+the worker is serving: an admin listing tens of thousands of experiments held up health
+probes and unrelated API calls for the length of the listing.
+
+``run_blocking`` runs such a call in a worker thread and awaits it. Threads are bounded by
+a limiter of their own (``STORE_OFFLOAD_MAX_THREADS``), separate from the default anyio
+limiter that sync endpoints and ``run_in_threadpool`` share, so a burst of slow store calls
+queues here instead of starving those. Context variables are carried into the thread.
+Setting the limit to 0 runs calls inline, as before.
+
+Queue and run times are available via ``stats()``.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from anyio import CapacityLimiter, to_thread
+
+from mlflow_oidc_auth.config import config
+
+T = TypeVar("T")
+
+
+class _OffloadStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.submitted = 0
+            self.completed = 0
+            self.failed = 0
+            self.waiting = 0
+            self.running = 0
+            self.max_waiting = 0
+            self.wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+            self.run_seconds = 0.0
+            self.max_run_seconds = 0.0
+
+    def submit(self) -> None:
+        with self._lock:
+            self.submitted += 1
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+
+    def start(self, waited: float) -> None:
+        with self._lock:
+            self.waiting -= 1
+            self.running += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def cancel(self) -> None:
+        """A call cancelled while still queued."""
+        with self._lock:
+            self.waiting -= 1
+
+    def finish(self, ran: float, ok: bool) -> None:
+        with self._lock:
+            self.running -= 1
+            self.run_seconds += ran
+            self.max_run_seconds = max(self.max_run_seconds, ran)
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_threads": _max_threads(),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "waiting": self.waiting,
+                "running": self.running,
+                "max_waiting": self.max_waiting,
+                "wait_seconds": round(self.wait_seconds, 6),
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+                "run_seconds": round(self.run_seconds, 6),
+                "max_run_seconds": round(self.max_run_seconds, 6),
+            }
+
+
+_stats = _OffloadStats()
+# One limiter per event loop: an anyio limiter is bound to the loop that first waits on it.
+_limiter: Optional[Tuple[asyncio.AbstractEventLoop, CapacityLimiter]] = None
+
+
+def _max_threads() -> int:
+    return max(0, int(getattr(config, "STORE_OFFLOAD_MAX_THREADS", 0) or 0))
+
+
+def _get_limiter(size: int) -> CapacityLimiter:
+    global _limiter
+    loop = asyncio.get_running_loop()
+    if _limiter is None or _limiter[0] is not loop:
+        _limiter = (loop, CapacityLimiter(size))
+    elif _limiter[1].total_tokens != size:
+        _limiter[1].total_tokens = size
+    return _limiter[1]
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call ``func(*args, **kwargs)`` in a bounded worker thread and return its result.
+
+    Exceptions propagate unchanged. Must be awaited from the event loop.
+    """
+    size = _max_threads()
+    if size == 0:
+        return func(*args, **kwargs)
+
+    submitted_at = time.perf_counter()
+    started = False
+
+    def _call() -> T:
+        nonlocal started
+        started = True
+        began = time.perf_counter()
+        _stats.start(began - submitted_at)
+        ok = False
+        try:
+            result = func(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            _stats.finish(time.perf_counter() - began, ok)
+
+    _stats.submit()
+    try:
+        return await to_thread.run_sync(_call, limiter=_get_limiter(size))
+    finally:
+        if not started:
+            _stats.cancel()
+
+
+def stats() -> Dict[str, Any]:
+    """Return offload counters and timings since start-up (or the last reset)."""
+    return _stats.snapshot()
+
+
+def reset_stats() -> None:
+    _stats.reset()
@@ -0,0 +1,295 @@
+"""
+Compiled per-user permission snapshots.
+
+A cache miss in ``resolve_permission`` used to walk up to four sources, each its
+own store query, and the regex sources re-listed every rule row and re-resolved
+the user's group ids on every call. A ``PermissionSnapshot`` fetches a user's
+grants once per resource type and keeps them in the shape the resolvers need:
+
+- direct user grants as a dict keyed by resource id,
+- group grants already collapsed to one permission per resource,
+- regex and group-regex rules as compiled rule sets (utils/regex_rules.py).
+
+Both ``utils.permissions.resolve_permission`` and
+``utils.batch_permissions.UserPermissionContext`` read from the same snapshot, so
+the single-resource and listing paths cannot disagree about a user's grants.
+
+Snapshots are per user rather than per (user, workspace): resource grants carry no
+workspace, and the workspace fallback is layered on top by the callers through
+``workspace_cache``. They are held in a process-local TTL cache — they contain
+compiled patterns and a reference to the store they were read from, neither of which
+belongs in Redis — and are invalidated through generation counters: the store bumps
+the user's generation after any permission write naming that user, and a global
+generation after writes that cannot be attributed to one user (group grants,
+renames, wipes). A snapshot whose generation no longer matches is rebuilt on the
+next lookup. The TTL is only a safety net for writes made by another replica.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mlflow_oidc_auth.cache import CacheBackend, with_invalidation_bus
+from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.permissions import compare_permissions
+from mlflow_oidc_auth.utils.regex_rules import CompiledRuleSet, get_compiled_rule_set
+
+logger = get_logger()
+
+_SNAPSHOT_CACHE_MAX_SIZE = 1024
+_SNAPSHOT_CACHE_DEFAULT_TTL = 30
+
+
+def collapse_group_permissions(permissions: List, resource_attr: str | Tuple[str, ...]) -> Dict[Any, str]:
+    """Collapse multiple group grants on one resource to a single permission.
+
+    A user in several groups can hold more than one grant on the same resource. This was
+    previously a last-wins dict comprehension, so the winner was whichever row the
+    database happened to return last — an order SQL does not guarantee without an
+    ORDER BY, and which therefore could differ by backend or query plan.
+
+    Worse, it disagreed with the per-resource path
+    (``BaseGroupPermissionRepository.get_group_permission_for_user_resource``), which
+    folds with ``compare_permissions``. For the same user and data — groups granting
+    MANAGE and READ on one experiment — the per-resource check returned MANAGE while the
+    batch check returned READ. Folding with the same ``compare_permissions`` rule makes
+    the two paths agree and makes the result independent of row order (issue #253).
+
+    NOTE: this deliberately reuses the EXISTING precedence rule rather than defining a
+    new one. ``compare_permissions`` ranks by ``priority``, and NO_PERMISSIONS carries
+    priority 100 — so a NO_PERMISSIONS group grant outranks MANAGE here, exactly as it
+    already does on the per-resource path. Whether that precedence is the right policy
+    for multi-group membership is issue #80, and is intentionally not changed here.
+
+    ``resource_attr`` may be a tuple of attribute names for resources with a composite
+    key (scorers are keyed by experiment id and scorer name).
+    """
+    collapsed: Dict[Any, str] = {}
+    for perm in permissions:
+        if isinstance(resource_attr, tuple):
+            resource_id = tuple(getattr(perm, attr) for attr in resource_attr)
+        else:
+            resource_id = getattr(perm, resource_attr)
+        current = collapsed.get(resource_id)
+        # compare_permissions(a, b) is True when b is at least as strong as a.
+        if current is None or compare_permissions(current, perm.permission):
+            collapsed[resource_id] = perm.permission
+    return collapsed
+
+
+@dataclass
+class ResourceGrants:
+    """One resource type's grants for one user, in resolver-ready form.
+
+    Attributes:
+        user: Direct user grants, keyed by resource id.
+        group: Group grants collapsed with ``compare_permissions``, keyed by resource id.
+        regex_rules: The user's regex rows, in priority order.
+        group_regex_rules: The user's groups' regex rows, in priority order.
+        regex: ``regex_rules`` as a shared compiled rule set.
+        group_regex: ``group_regex_rules`` as a shared compiled rule set.
+    """
+
+    user: Dict[Any, str]
+    group: Dict[Any, str]
+    regex_rules: List
+    group_regex_rules: List
+    regex: CompiledRuleSet = field(init=False)
+    group_regex: CompiledRuleSet = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.regex = get_compiled_rule_set(self.regex_rules)
+        self.group_regex = get_compiled_rule_set(self.group_regex_rules)
+
+
+# ---------------------------------------------------------------------------
+# Per-resource-type loaders
+# ---------------------------------------------------------------------------
+
+
+def _load_experiment(snapshot: "PermissionSnapshot") -> ResourceGrants:
+    store, username = snapshot.store, snapshot.username
+    return ResourceGrants(
+        user={p.experiment_id: p.permission for p in store.list_experiment_permissions(username)},
+        group=collapse_group_permissions(store.list_user_groups_experiment_permissions(username), "experiment_id"),
+        regex_rules=store.list_experiment_regex_permissions(username),
+        group_regex_rules=snapshot.list_group_rules(store.list_group_experiment_regex_permissions_for_groups_ids),
+    )
+
+
+def _load_registered_model(snapshot: "PermissionSnapshot") -> ResourceGrants:
+    store, username = snapshot.store, snapshot.username
+    return ResourceGrants(
+        user={p.name: p.permission for p in store.list_registered_model_permissions(username)},
+        group=collapse_group_permissions(store.list_user_groups_registered_model_permissions(username), "name"),
+        regex_rules=store.list_registered_model_regex_permissions(username),
+        group_regex_rules=snapshot.list_group_rules(store.list_group_registered_model_regex_permissions_for_groups_ids),
+    )
+
+
+def _load_prompt(snapshot: "PermissionSnapshot") -> ResourceGrants:
+    # Prompts are registered models: direct grants are shared with the model section,
+    # only the regex rules are prompt-specific.
+    store, username = snapshot.store, snapshot.username
+    models = snapshot.grants("registered_model")
+    return ResourceGrants(
+        user=models.user,
+        group=models.group,
+        regex_rules=store.list_prompt_regex_permissions(username),
+        group_regex_rules=snapshot.list_group_rules(store.list_group_prompt_regex_permissions_for_groups_ids),
+    )
+
+
+def _load_scorer(snapshot: "PermissionSnapshot") -> ResourceGrants:
+    store, username = snapshot.store, snapshot.username
+    return ResourceGrants(
+        user={(p.experiment_id, p.scorer_name): p.permission for p in store.list_scorer_permissions(username)},
+        group=collapse_group_permissions(store.list_user_groups_scorer_permissions(username), ("experiment_id", "scorer_name")),
+        regex_rules=store.list_scorer_regex_permissions(username),
+        group_regex_rules=snapshot.list_group_rules(store.list_group_scorer_regex_permissions_for_groups_ids),
+    )
+
+
+def _load_gateway_endpoint(snapshot: "PermissionSnapshot") -> ResourceGrants:
+    store, username = snapshot.store, snapshot.username
+    return ResourceGrants(
+        user={p.endpoint_id: p.permission for p in store.list_gateway_endpoint_permissions(username)},
+        group=collapse_group_permissions(store.list_user_groups_gateway_endpoint_permissions(username), "endpoint_id"),
+        regex_rules=store.list_gateway_endpoint_regex_permissions(username),
+        group_regex_rules=snapshot.list_group_rules(store.list_group_gateway_endpoint_regex_permissions_for_groups_ids),
+    )
+
+
+def _load_gateway_secret(snapshot: "PermissionSnapshot") -> ResourceGrants:
+    store, username = snapshot.store, snapshot.username
+    return ResourceGrants(
+        user={p.secret_id: p.permission for p in store.list_gateway_secret_permissions(username)},
+        group=collapse_group_permissions(store.list_user_groups_gateway_secret_permissions(username), "secret_id"),
+        regex_rules=store.list_gateway_secret_regex_permissions(username),
+        group_regex_rules=snapshot.list_group_rules(store.list_group_gateway_secret_regex_permissions_for_groups_ids),
+    )
+
+
+def _load_gateway_model_definition(snapshot: "PermissionSnapshot") -> ResourceGrants:
+    store, username = snapshot.store, snapshot.username
+    return ResourceGrants(
+        user={p.model_definition_id: p.permission for p in store.list_gateway_model_definition_permissions(username)},
+        group=collapse_group_permissions(store.list_user_groups_gateway_model_definition_permissions(username), "model_definition_id"),
+        regex_rules=store.list_gateway_model_definition_regex_permissions(username),
+        group_regex_rules=snapshot.list_group_rules(store.list_group_gateway_model_definition_regex_permissions_for_groups_ids),
+    )
+
+
+# Keys match the resource type constants in utils.permissions, which imports this
+# module and so cannot be imported from here.
+_LOADERS: Dict[str, Callable[["PermissionSnapshot"], ResourceGrants]] = {
+    "experiment": _load_experiment,
+    "registered_model": _load_registered_model,
+    "prompt": _load_prompt,
+    "scorer": _load_scorer,
+    "gateway_endpoint": _load_gateway_endpoint,
+    "gateway_secret": _load_gateway_secret,
+    "gateway_model_definition": _load_gateway_model_definition,
+}
+
+
+class PermissionSnapshot:
+    """All of one user's resource grants, loaded lazily per resource type.
+
+    Creating a snapshot issues no queries; the first ``grants(resource_type)`` call
+    loads that type's sources and keeps them for the snapshot's lifetime, so an
+    experiment check never pays for gateway tables. Group ids are resolved at most
+    once per snapshot and shared by every group-regex source.
+
+    Concurrent first access to the same section may load it twice; both loads read
+    the same rows and the last assignment wins, which is harmless.
+    """
+
+    def __init__(self, username: str, store, generation: Tuple[int, int]) -> None:
+        self.username = username
+        self.store = store
+        self.generation = generation
+        self._group_ids: Optional[List[int]] = None
+        self._sections: Dict[str, ResourceGrants] = {}
+
+    @property
+    def group_ids(self) -> List[int]:
+        if self._group_ids is None:
+            self._group_ids = self.store.get_groups_ids_for_user(self.username)
+        return self._group_ids
+
+    def list_group_rules(self, lister: Callable[[List[int]], List]) -> List:
+        """Call a group-regex lister for this user's groups, skipping the query when there are none."""
+        group_ids = self.group_ids
+        return lister(group_ids) if group_ids else []
+
+    def grants(self, resource_type: str) -> ResourceGrants:
+        section = self._sections.get(resource_type)
+        if section is None:
+            section = _LOADERS[resource_type](self)
+            self._sections[resource_type] = section
+        return section
+
+
+# ---------------------------------------------------------------------------
+# Snapshot cache and generation counters
+# ---------------------------------------------------------------------------
+
+_generation_lock = threading.Lock()
+_global_generation = 0
+_user_generations: Dict[str, int] = {}
+
+_snapshot_cache: CacheBackend | None = None
+
+
+def _get_snapshot_cache() -> CacheBackend:
+    """Get or create the snapshot cache (lazy init).
+
+    Always in-process, since snapshots hold a store reference. Generations only
+    protect this replica, so invalidations are also broadcast when a cache
+    invalidation bus is configured.
+    """
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        ttl = getattr(config, "PERMISSION_CACHE_TTL_SECONDS", _SNAPSHOT_CACHE_DEFAULT_TTL)
+        _snapshot_cache = with_invalidation_bus(LocalTTLCacheBackend(maxsize=_SNAPSHOT_CACHE_MAX_SIZE, ttl=ttl), "permission-snapshot")
+    return _snapshot_cache
+
+
+def _current_generation(username: str) -> Tuple[int, int]:
+    return _global_generation, _user_generations.get(username, 0)
+
+
+def get_permission_snapshot(username: str, store) -> PermissionSnapshot:
+    """Return the user's current snapshot, building a new (empty, lazy) one if needed.
+
+    A cached snapshot is reused only if it was read from ``store`` and no permission
+    write has bumped the user's or the global generation since it was created.
+    """
+    cache = _get_snapshot_cache()
+    generation = _current_generation(username)
+    snapshot = cache.get(username)
+    if snapshot is not None and snapshot.generation == generation and snapshot.store is store:
+        return snapshot
+
+    snapshot = PermissionSnapshot(username, store, generation)
+    cache.set(username, snapshot)
+    return snapshot
+
+
+def invalidate_permission_snapshot(username: str) -> None:
+    """Mark one user's snapshot stale. Call after a write that names the user."""
+    with _generation_lock:
+        _user_generations[username] = _user_generations.get(username, 0) + 1
+    _get_snapshot_cache().delete(username)
+
+
+def invalidate_all_permission_snapshots() -> None:
+    """Mark every snapshot stale. Call after writes that can affect many users."""
+    global _global_generation
+    with _generation_lock:
+        _global_generation += 1
+    _get_snapshot_cache().clear()
+    logger.debug("Permission snapshots invalidated")
@@ -13,12 +13,18 @@ after PERMISSION_CACHE_TTL_SECONDS (default 30). The backend is selected via
 Explicit invalidation is available via invalidate_permission_cache() and
 flush_permission_cache().
 
+resolve_permissions_many() resolves a whole page of resources with one batched
+cache read and at most one batched write, instead of one round trip of each per
+row on the Redis backend.
+
+On a cache miss the builders read from the user's compiled permission snapshot
+(utils/permission_snapshot.py) rather than querying the store once per source.
+
 Existing public functions (effective_*, can_*) are thin wrappers around
 resolve_permission() and remain backward-compatible.
 """
 
-import re
-from typing import Callable, Dict
+from typing import Callable, Dict, Iterable
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, ErrorCode
@@ -30,6 +36,9 @@ from mlflow_oidc_auth.logger import get_logger
 from mlflow_oidc_auth.models import PermissionResult
 from mlflow_oidc_auth.permissions import NO_PERMISSIONS, get_permission
 from mlflow_oidc_auth.store import store
+from mlflow_oidc_auth.utils.experiment_metadata import get_experiment_metadata
+from mlflow_oidc_auth.utils.permission_snapshot import ResourceGrants, get_permission_snapshot
+from mlflow_oidc_auth.utils.regex_rules import get_compiled_rule_set
 
 logger = get_logger()
 
@@ -131,152 +140,131 @@ GATEWAY_MODEL_DEFINITION = "gateway_model_definition"
 
 
 def _match_regex_permission(regexes, name: str, label: str) -> str:
-    """Generic regex matcher for any resource type. Replaces 8 near-identical functions."""
-    for regex in regexes:
-        if re.match(regex.regex, name):
-            logger.debug(f"Regex permission found for {label} {name}: {regex.permission} with regex {regex.regex} and priority {regex.priority}")
-            return regex.permission
+    """Generic regex matcher for any resource type. Replaces 8 near-identical functions.
+
+    Accepts regex permission rows (priority-ordered) or a ``CompiledRuleSet``; rows are
+    compiled once into a shared rule set, and the first matching rule wins.
+    """
+    regex = get_compiled_rule_set(regexes).match(name)
+    if regex is not None:
+        logger.debug(f"Regex permission found for {label} {name}: {regex.permission} with regex {regex.regex} and priority {regex.priority}")
+        return regex.permission
     raise MlflowException(f"{label} {name}", error_code=RESOURCE_DOES_NOT_EXIST)
 
 
+def _grants(username: str, resource_type: str) -> ResourceGrants:
+    """Load the user's snapshot section for ``resource_type``.
+
+    Called from inside each source rather than once per builder, so a load failure —
+    e.g. RESOURCE_DOES_NOT_EXIST for a user unknown to the auth database — surfaces
+    through get_permission_from_store_or_default exactly like a failed store lookup.
+    """
+    return get_permission_snapshot(username, store).grants(resource_type)
+
+
+def _granted_permission(permission: str | None, label: str, resource_id) -> str:
+    """Return a snapshot grant, or raise RESOURCE_DOES_NOT_EXIST like a store lookup miss."""
+    if permission is None:
+        raise MlflowException(f"{label} {resource_id}", error_code=RESOURCE_DOES_NOT_EXIST)
+    return permission
+
+
 # ---------------------------------------------------------------------------
 # Experiment-specific regex wrappers (experiment_id → experiment_name lookup)
 # ---------------------------------------------------------------------------
 
 
 def _get_experiment_permission_from_regex(regexes, experiment_id: str) -> str:
-    experiment_name = _get_tracking_store().get_experiment(experiment_id).name
+    # No rules can match, so skip the tracking-store round-trip for the name.
+    if not regexes:
+        raise MlflowException(f"experiment {experiment_id}", error_code=RESOURCE_DOES_NOT_EXIST)
+    experiment_name = get_experiment_metadata(_get_tracking_store(), experiment_id).name
     return _match_regex_permission(regexes, experiment_name, "experiment")
 
 
 def _get_experiment_group_permission_from_regex(regexes, experiment_id: str) -> str:
-    experiment_name = _get_tracking_store().get_experiment(experiment_id).name
+    if not regexes:
+        raise MlflowException(f"experiment {experiment_id}", error_code=RESOURCE_DOES_NOT_EXIST)
+    experiment_name = get_experiment_metadata(_get_tracking_store(), experiment_id).name
     return _match_regex_permission(regexes, experiment_name, "experiment")
 
 
 # ---------------------------------------------------------------------------
 # Builder functions — one per resource type
+#
+# Every source reads from the user's compiled permission snapshot
+# (utils/permission_snapshot.py), so a cache miss costs at most one snapshot section
+# load instead of one store query per source. The sources still raise
+# RESOURCE_DOES_NOT_EXIST on a miss, so get_permission_from_store_or_default and
+# PERMISSION_SOURCE_ORDER behave exactly as they do for direct store lookups.
 # ---------------------------------------------------------------------------
 
 
 def _build_experiment_sources(experiment_id: str, username: str, **kwargs) -> Dict[str, Callable[[], str]]:
     return {
-        "user": lambda experiment_id=experiment_id, user=username: store.get_experiment_permission(experiment_id, user).permission,
-        "group": lambda experiment_id=experiment_id, user=username: store.get_user_groups_experiment_permission(experiment_id, user).permission,
-        "regex": lambda experiment_id=experiment_id, user=username: _get_experiment_permission_from_regex(
-            store.list_experiment_regex_permissions(user), experiment_id
-        ),
-        "group-regex": lambda experiment_id=experiment_id, user=username: _get_experiment_group_permission_from_regex(
-            store.list_group_experiment_regex_permissions_for_groups_ids(store.get_groups_ids_for_user(user)),
-            experiment_id,
-        ),
+        "user": lambda: _granted_permission(_grants(username, EXPERIMENT).user.get(experiment_id), "experiment", experiment_id),
+        "group": lambda: _granted_permission(_grants(username, EXPERIMENT).group.get(experiment_id), "experiment", experiment_id),
+        "regex": lambda: _get_experiment_permission_from_regex(_grants(username, EXPERIMENT).regex, experiment_id),
+        "group-regex": lambda: _get_experiment_group_permission_from_regex(_grants(username, EXPERIMENT).group_regex, experiment_id),
     }
 
 
 def _build_registered_model_sources(model_name: str, username: str, **kwargs) -> Dict[str, Callable[[], str]]:
     return {
-        "user": lambda model_name=model_name, user=username: store.get_registered_model_permission(model_name, user).permission,
-        "group": lambda model_name=model_name, user=username: store.get_user_groups_registered_model_permission(model_name, user).permission,
-        "regex": lambda model_name=model_name, user=username: _match_regex_permission(
-            store.list_registered_model_regex_permissions(user),
-            model_name,
-            "model name",
-        ),
-        "group-regex": lambda model_name=model_name, user=username: _match_regex_permission(
-            store.list_group_registered_model_regex_permissions_for_groups_ids(store.get_groups_ids_for_user(user)),
-            model_name,
-            "model name",
-        ),
+        "user": lambda: _granted_permission(_grants(username, REGISTERED_MODEL).user.get(model_name), "model name", model_name),
+        "group": lambda: _granted_permission(_grants(username, REGISTERED_MODEL).group.get(model_name), "model name", model_name),
+        "regex": lambda: _match_regex_permission(_grants(username, REGISTERED_MODEL).regex, model_name, "model name"),
+        "group-regex": lambda: _match_regex_permission(_grants(username, REGISTERED_MODEL).group_regex, model_name, "model name"),
     }
 
 
 def _build_prompt_sources(model_name: str, username: str, **kwargs) -> Dict[str, Callable[[], str]]:
     """Build prompt permission sources.
 
-    CRITICAL: user/group sources map to store.get_registered_model_permission and
-    store.get_user_groups_registered_model_permission (NOT prompt-specific methods).
-    Regex sources use prompt-specific store methods. This is intentional — preserved
-    from the original implementation.
+    CRITICAL: user/group sources are the registered model grants (NOT prompt-specific
+    grants). Regex sources use the prompt-specific rules. This is intentional — preserved
+    from the original implementation; the snapshot's prompt section shares the model
+    section's direct grants.
     """
     return {
-        "user": lambda model_name=model_name, user=username: store.get_registered_model_permission(model_name, user).permission,
-        "group": lambda model_name=model_name, user=username: store.get_user_groups_registered_model_permission(model_name, user).permission,
-        "regex": lambda model_name=model_name, user=username: _match_regex_permission(store.list_prompt_regex_permissions(user), model_name, "model name"),
-        "group-regex": lambda model_name=model_name, user=username: _match_regex_permission(
-            store.list_group_prompt_regex_permissions_for_groups_ids(store.get_groups_ids_for_user(user)),
-            model_name,
-            "model name",
-        ),
+        "user": lambda: _granted_permission(_grants(username, PROMPT).user.get(model_name), "model name", model_name),
+        "group": lambda: _granted_permission(_grants(username, PROMPT).group.get(model_name), "model name", model_name),
+        "regex": lambda: _match_regex_permission(_grants(username, PROMPT).regex, model_name, "model name"),
+        "group-regex": lambda: _match_regex_permission(_grants(username, PROMPT).group_regex, model_name, "model name"),
     }
 
 
 def _build_scorer_sources(experiment_id: str, username: str, **kwargs) -> Dict[str, Callable[[], str]]:
     scorer_name = kwargs["scorer_name"]
+    key = (experiment_id, scorer_name)
     return {
-        "user": lambda experiment_id=experiment_id, scorer_name=scorer_name, user=username: store.get_scorer_permission(
-            experiment_id, scorer_name, user
-        ).permission,
-        "group": lambda experiment_id=experiment_id, scorer_name=scorer_name, user=username: store.get_user_groups_scorer_permission(
-            experiment_id, scorer_name, user
-        ).permission,
-        "regex": lambda scorer_name=scorer_name, user=username: _match_regex_permission(store.list_scorer_regex_permissions(user), scorer_name, "scorer name"),
-        "group-regex": lambda scorer_name=scorer_name, user=username: _match_regex_permission(
-            store.list_group_scorer_regex_permissions_for_groups_ids(store.get_groups_ids_for_user(user)),
-            scorer_name,
-            "scorer name",
-        ),
+        "user": lambda: _granted_permission(_grants(username, SCORER).user.get(key), "scorer name", scorer_name),
+        "group": lambda: _granted_permission(_grants(username, SCORER).group.get(key), "scorer name", scorer_name),
+        "regex": lambda: _match_regex_permission(_grants(username, SCORER).regex, scorer_name, "scorer name"),
+        "group-regex": lambda: _match_regex_permission(_grants(username, SCORER).group_regex, scorer_name, "scorer name"),
     }
 
 
-def _build_gateway_endpoint_sources(gateway_name: str, username: str, **kwargs) -> Dict[str, Callable[[], str]]:
+def _build_gateway_sources(resource_type: str, gateway_name: str, username: str) -> Dict[str, Callable[[], str]]:
+    """Sources shared by the three gateway resource types, which differ only in section."""
     return {
-        "user": lambda gateway_name=gateway_name, user=username: store.get_gateway_endpoint_permission(gateway_name, user).permission,
-        "group": lambda gateway_name=gateway_name, user=username: store.get_user_groups_gateway_endpoint_permission(gateway_name, user).permission,
-        "regex": lambda gateway_name=gateway_name, user=username: _match_regex_permission(
-            store.list_gateway_endpoint_regex_permissions(user),
-            gateway_name,
-            "gateway name",
-        ),
-        "group-regex": lambda gateway_name=gateway_name, user=username: _match_regex_permission(
-            store.list_group_gateway_endpoint_regex_permissions_for_groups_ids(store.get_groups_ids_for_user(user)),
-            gateway_name,
-            "gateway name",
-        ),
+        "user": lambda: _granted_permission(_grants(username, resource_type).user.get(gateway_name), "gateway name", gateway_name),
+        "group": lambda: _granted_permission(_grants(username, resource_type).group.get(gateway_name), "gateway name", gateway_name),
+        "regex": lambda: _match_regex_permission(_grants(username, resource_type).regex, gateway_name, "gateway name"),
+        "group-regex": lambda: _match_regex_permission(_grants(username, resource_type).group_regex, gateway_name, "gateway name"),
     }
 
 
+def _build_gateway_endpoint_sources(gateway_name: str, username: str, **kwargs) -> Dict[str, Callable[[], str]]:
+    return _build_gateway_sources(GATEWAY_ENDPOINT, gateway_name, username)
+
+
 def _build_gateway_secret_sources(gateway_name: str, username: str, **kwargs) -> Dict[str, Callable[[], str]]:
-    return {
-        "user": lambda gateway_name=gateway_name, user=username: store.get_gateway_secret_permission(gateway_name, user).permission,
-        "group": lambda gateway_name=gateway_name, user=username: store.get_user_groups_gateway_secret_permission(gateway_name, user).permission,
-        "regex": lambda gateway_name=gateway_name, user=username: _match_regex_permission(
-            store.list_gateway_secret_regex_permissions(user),
-            gateway_name,
-            "gateway name",
-        ),
-        "group-regex": lambda gateway_name=gateway_name, user=username: _match_regex_permission(
-            store.list_group_gateway_secret_regex_permissions_for_groups_ids(store.get_groups_ids_for_user(user)),
-            gateway_name,
-            "gateway name",
-        ),
-    }
+    return _build_gateway_sources(GATEWAY_SECRET, gateway_name, username)
 
 
 def _build_gateway_model_definition_sources(gateway_name: str, username: str, **kwargs) -> Dict[str, Callable[[], str]]:
-    return {
-        "user": lambda gateway_name=gateway_name, user=username: store.get_gateway_model_definition_permission(gateway_name, user).permission,
-        "group": lambda gateway_name=gateway_name, user=username: store.get_user_groups_gateway_model_definition_permission(gateway_name, user).permission,
-        "regex": lambda gateway_name=gateway_name, user=username: _match_regex_permission(
-            store.list_gateway_model_definition_regex_permissions(user),
-            gateway_name,
-            "gateway name",
-        ),
-        "group-regex": lambda gateway_name=gateway_name, user=username: _match_regex_permission(
-            store.list_group_gateway_model_definition_regex_permissions_for_groups_ids(store.get_groups_ids_for_user(user)),
-            gateway_name,
-            "gateway name",
-        ),
-    }
+    return _build_gateway_sources(GATEWAY_MODEL_DEFINITION, gateway_name, username)
 
 
 # ---------------------------------------------------------------------------
@@ -420,6 +408,45 @@ def resolve_permission(resource_type: str, resource_id: str, username: str, **kw
     if cached is not None:
         return cached
 
+    result = _resolve_uncached(resource_type, resource_id, username, **kwargs)
+    cache.set(cache_key, result)
+    return result
+
+
+def resolve_permissions_many(resource_type: str, resource_ids: Iterable[str], username: str, **kwargs) -> Dict[str, PermissionResult]:
+    """Resolve ``resource_type`` permissions for many ids at once.
+
+    Returns the same decisions as calling resolve_permission for each id, shares
+    its cache entries, and is keyed by resource id (duplicates are resolved once).
+    The cache is read with a single ``get_many`` and the misses are written with a
+    single ``set_many``. A page of N rows therefore costs two cache round trips
+    on the Redis backend instead of up to 2N. Misses resolve from the user's
+    permission snapshot, which is loaded once for the whole batch.
+    """
+    ids = list(dict.fromkeys(resource_ids))
+    if not ids:
+        return {}
+
+    cache = _get_permission_cache()
+    workspace = _get_cache_workspace()
+    keys = {resource_id: _make_cache_key(resource_type, resource_id, username, workspace) for resource_id in ids}
+    cached = cache.get_many(keys.values())
+
+    results: Dict[str, PermissionResult] = {}
+    fresh: Dict[str, PermissionResult] = {}
+    for resource_id, cache_key in keys.items():
+        result = cached.get(cache_key)
+        if result is None:
+            result = _resolve_uncached(resource_type, resource_id, username, **kwargs)
+            fresh[cache_key] = result
+        results[resource_id] = result
+
+    if fresh:
+        cache.set_many(fresh)
+    return results
+
+
+def _resolve_uncached(resource_type: str, resource_id: str, username: str, **kwargs) -> PermissionResult:
     builder = PERMISSION_REGISTRY[resource_type]
     sources_config = builder(resource_id, username, **kwargs)
     result = get_permission_from_store_or_default(sources_config)
@@ -430,8 +457,6 @@ def resolve_permission(resource_type: str, resource_id: str, username: str, **kw
     # workspace fallback, which may already have replaced it with a real decision.
     if result.kind == "fallback":
         record_permission_fallback(resource_type, resource_id, username, result.permission)
-
-    cache.set(cache_key, result)
     return result
 
 
@@ -0,0 +1,162 @@
+"""
+Compiled, combined matchers for regex and group-regex permission rules.
+
+Matching a resource name against a user's regex grants used to call
+``re.match(rule.regex, name)`` rule by rule for every resource checked. Python's
+internal pattern cache holds only a few hundred entries, so with many regex grants
+a large listing kept recompiling patterns, and every rule was tried even when its
+literal prefix ruled it out.
+
+A ``CompiledRuleSet`` is built once per rule list:
+
+- every pattern is compiled once;
+- the literal prefix of each pattern (``^team-a/.*`` -> ``team-a/``) is indexed in a
+  character trie, so a lookup only tries rules whose prefix the name starts with,
+  plus the rules with no usable prefix;
+- candidates are tried in list order — the store returns rules by priority — and the
+  first match wins, exactly as the rule-by-rule loop did.
+
+Rule sets are shared across requests through a bounded LRU keyed on the rows' ids and
+contents. The rule tables carry no version column, so the row content is the version:
+editing a rule's regex, priority or permission produces a new key.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cachetools import LRUCache
+
+_RULE_SET_CACHE_MAX_SIZE = 512
+
+# Characters that end a literal prefix. "|" is handled separately: any alternation
+# makes the prefix unsound, wherever it appears.
+_REGEX_META = frozenset(".^$*+?{}[]\\()")
+# Quantifiers that make the preceding literal optional or repeatable zero times.
+_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+
+@dataclass(frozen=True)
+class CompiledRegexRule:
+    """A regex permission rule with its pattern compiled once."""
+
+    id: Any
+    pattern: re.Pattern
+    permission: str
+    priority: int
+    regex: str
+
+
+def literal_prefix(regex: str) -> str:
+    """Return a string every ``re.match`` hit of ``regex`` must start with.
+
+    Conservative by design: anything that is not plainly a literal (classes, groups,
+    escapes such as ``\\d``, inline flags, alternation) ends the prefix, and a literal
+    followed by ``*``, ``?`` or ``{`` is dropped because it may match zero times. An
+    empty prefix is always safe — the rule is simply tried for every name.
+    """
+    if "|" in regex:
+        return ""
+    chars: List[str] = []
+    i = 1 if regex.startswith("^") else 0
+    while i < len(regex):
+        char = regex[i]
+        if char == "\\":
+            # An escaped punctuation character is a literal; \d, \w, \A, backrefs are not.
+            if i + 1 >= len(regex) or regex[i + 1].isalnum():
+                break
+            char = regex[i + 1]
+            i += 2
+        elif char in _REGEX_META:
+            break
+        else:
+            i += 1
+        if i < len(regex) and regex[i] in _OPTIONAL_QUANTIFIERS:
+            break
+        chars.append(char)
+        if i < len(regex) and regex[i] == "+":
+            break
+    return "".join(chars)
+
+
+class _TrieNode:
+    __slots__ = ("children", "rule_indexes")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.rule_indexes: List[int] = []
+
+
+class CompiledRuleSet:
+    """An immutable, priority-ordered set of compiled regex rules.
+
+    Iterating yields the compiled rules in priority order; ``match`` returns the first
+    rule whose pattern matches the name, or None.
+    """
+
+    def __init__(self, rules: Iterable) -> None:
+        self.rules: Tuple[CompiledRegexRule, ...] = tuple(
+            CompiledRegexRule(getattr(rule, "id", None), re.compile(rule.regex), rule.permission, rule.priority, rule.regex) for rule in rules
+        )
+        self._root = _TrieNode()
+        for index, rule in enumerate(self.rules):
+            node = self._root
+            for char in literal_prefix(rule.regex):
+                node = node.children.setdefault(char, _TrieNode())
+            node.rule_indexes.append(index)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __iter__(self) -> Iterator[CompiledRegexRule]:
+        return iter(self.rules)
+
+    def match(self, name: str) -> Optional[CompiledRegexRule]:
+        node = self._root
+        candidates = list(node.rule_indexes)
+        for char in name:
+            node = node.children.get(char)
+            if node is None:
+                break
+            candidates.extend(node.rule_indexes)
+        # Trie depth order is not priority order; the rule index is.
+        for index in sorted(candidates):
+            rule = self.rules[index]
+            if rule.pattern.match(name):
+                return rule
+        return None
+
+
+EMPTY_RULE_SET = CompiledRuleSet(())
+
+_rule_set_cache: LRUCache = LRUCache(maxsize=_RULE_SET_CACHE_MAX_SIZE)
+_rule_set_lock = threading.Lock()
+
+
+def _rule_set_key(rules: List) -> Tuple:
+    return tuple((getattr(rule, "id", None), rule.regex, rule.priority, rule.permission) for rule in rules)
+
+
+def get_compiled_rule_set(rules: Iterable) -> CompiledRuleSet:
+    """Return the shared compiled rule set for ``rules``, building it on first use."""
+    if isinstance(rules, CompiledRuleSet):
+        return rules
+    rules = list(rules)
+    if not rules:
+        return EMPTY_RULE_SET
+    key = _rule_set_key(rules)
+    with _rule_set_lock:
+        rule_set = _rule_set_cache.get(key)
+    if rule_set is None:
+        # Compiled outside the lock; a concurrent duplicate build is harmless.
+        rule_set = CompiledRuleSet(rules)
+        with _rule_set_lock:
+            _rule_set_cache[key] = rule_set
+    return rule_set
+
+
+def clear_compiled_rule_sets() -> None:
+    """Drop every shared rule set (tests)."""
+    with _rule_set_lock:
+        _rule_set_cache.clear()
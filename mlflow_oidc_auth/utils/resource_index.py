@@ -0,0 +1,459 @@
+"""Per-user index of the experiments and registered models a user's grants reach.
+
+The permission listing endpoints (``GET /experiments``, ``/users/{username}/experiments``,
+``/users/{username}/registered-models``) listed every resource and batch-resolved a
+permission for each one, only to show the handful the caller could see. With 40,000
+experiments that is seconds per page, all of it spent on rows that are thrown away.
+
+A ``ResourceIndex`` holds, for one user and resource type, the sorted ids whose
+grant-derived permission can read, and the subset that can manage. "Grant-derived"
+means the first matching user, group, regex or group-regex source in
+``PERMISSION_SOURCE_ORDER``, exactly as ``utils/batch_permissions.py`` resolves it, but
+without the fallback: a resource no grant reaches is left out. The index is therefore
+only a complete answer when the fallback (``DEFAULT_MLFLOW_PERMISSION``, or the
+workspace permission) does not grant the level asked for; ``list_*_from_index`` check
+that and return None otherwise, and callers keep listing everything.
+
+Experiment ids are kept as a compact ``array('q')``, registered model names as a sorted
+tuple. Building an index reads the user's permission snapshot. Only when regex rules
+apply does it also scan resource names, because a rule can match any of them.
+
+Entries live in a process-local TTL cache and carry the generations they were built
+at. A permission write bumps the affected user's (or every user's) snapshot
+generation, so the next lookup rebuilds. A write of one user's own grant on one
+experiment or registered model is applied in place instead (:func:`apply_grant_change`):
+only that resource is resolved again. An index that used regex rules also depends on
+resource names: creating or renaming a resource bumps that type's name generation
+through :func:`invalidate_resource_indexes`, and only regex-built indexes are rebuilt.
+Deleted resources need no invalidation, because the listing fetch only returns live
+resources.
+
+Generations are per process, so every invalidation also deletes the affected entries
+from the cache, which broadcasts them on the cache invalidation bus when one is
+configured. Other replicas then rebuild on next use rather than wait for the TTL.
+Regex-built indexes are kept under their own key prefix so a name change can drop
+just those.
+"""
+
+import threading
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from mlflow_oidc_auth.cache import CacheBackend, with_invalidation_bus
+from mlflow_oidc_auth.cache.local_backend import LocalTTLCacheBackend
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.models import PermissionResult
+from mlflow_oidc_auth.permissions import get_permission
+from mlflow_oidc_auth.utils.batch_permissions import (
+    _apply_workspace_fallback,
+    _find_regex_permission,
+    _resolve_permission_from_context,
+    build_user_permission_context,
+)
+from mlflow_oidc_auth.utils.permission_snapshot import _current_generation
+from mlflow_oidc_auth.utils.permissions import EXPERIMENT, REGISTERED_MODEL
+
+logger = get_logger()
+
+_INDEX_CACHE_MAX_SIZE = 1024
+_INDEX_CACHE_DEFAULT_TTL = 30
+_IN_CLAUSE_CHUNK = 500
+
+_name_generation_lock = threading.Lock()
+_name_generations: Dict[str, int] = {}
+
+_index_cache: CacheBackend | None = None
+
+
+@dataclass(frozen=True)
+class ResourceIndex:
+    """The resources one user's grants make readable and manageable.
+
+    Attributes:
+        resource_type: ``EXPERIMENT`` or ``REGISTERED_MODEL``.
+        readable: Sorted ids (experiment ids as ints, model names as strings).
+        manageable: Sorted subset of ``readable``.
+        uses_names: True if regex rules were matched against resource names.
+        generation: Snapshot and name generations the index was built at.
+    """
+
+    resource_type: str
+    readable: Sequence
+    manageable: Sequence
+    uses_names: bool
+    generation: Tuple[int, int, int]
+
+    def ids(self, manage: bool = False) -> Sequence:
+        return self.manageable if manage else self.readable
+
+    def contains(self, resource_id, manage: bool = False) -> bool:
+        ids = self.ids(manage)
+        if self.resource_type == EXPERIMENT:
+            if not str(resource_id).isdigit():
+                return False
+            resource_id = int(resource_id)
+        position = bisect_left(ids, resource_id)
+        return position < len(ids) and ids[position] == resource_id
+
+
+def _ttl() -> int:
+    return getattr(config, "RESOURCE_INDEX_TTL_SECONDS", _INDEX_CACHE_DEFAULT_TTL)
+
+
+def _get_index_cache() -> CacheBackend:
+    """Get or create the index cache (lazy init).
+
+    Always in-process, like snapshots, with invalidations broadcast when a cache
+    invalidation bus is configured.
+    """
+    global _index_cache
+    if _index_cache is None:
+        _index_cache = with_invalidation_bus(LocalTTLCacheBackend(maxsize=_INDEX_CACHE_MAX_SIZE, ttl=max(_ttl(), 1)), "resource-index")
+    return _index_cache
+
+
+def _key(resource_type: str, username: str, uses_names: bool) -> str:
+    return f"{resource_type}:{'names' if uses_names else 'ids'}:{username}"
+
+
+def _keys(username: str, resource_type: str) -> List[str]:
+    return [_key(resource_type, username, False), _key(resource_type, username, True)]
+
+
+def _generation(username: str, resource_type: str) -> Tuple[int, int, int]:
+    return (*_current_generation(username), _name_generations.get(resource_type, 0))
+
+
+def _is_current(index: ResourceIndex, generation: Tuple[int, int, int]) -> bool:
+    if index.generation[:2] != generation[:2]:
+        return False
+    return not index.uses_names or index.generation[2] == generation[2]
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+
+def _regex_applies(user_rules, group_rules) -> bool:
+    order = config.PERMISSION_SOURCE_ORDER
+    return ("regex" in order and len(user_rules) > 0) or ("group-regex" in order and len(group_rules) > 0)
+
+
+def _grant_permission(user_direct, group_direct, user_rules, group_rules, name: Optional[str]) -> Optional[PermissionResult]:
+    """The permission the user's grants give one resource, or None if only the fallback would."""
+    user_regex = _find_regex_permission(user_rules, name) if name is not None else None
+    group_regex = _find_regex_permission(group_rules, name) if name is not None else None
+    result = _resolve_permission_from_context(config.PERMISSION_SOURCE_ORDER, user_direct, group_direct, user_regex, group_regex)
+    return None if result.kind == "fallback" else result
+
+
+def _experiment_names(tracking_store) -> List[Tuple[int, str]]:
+    """Every experiment's id and name, in every workspace and lifecycle stage."""
+    from mlflow.store.tracking.dbmodels.models import SqlExperiment
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    if isinstance(tracking_store, SqlAlchemyStore):
+        with tracking_store.ManagedSessionMaker() as session:
+            return [(int(experiment_id), name) for experiment_id, name in session.query(SqlExperiment.experiment_id, SqlExperiment.name)]
+
+    from mlflow.entities import ViewType
+
+    from mlflow_oidc_auth.utils.data_fetching import fetch_all_experiments
+
+    return [(int(e.experiment_id), e.name) for e in fetch_all_experiments(view_type=ViewType.ALL) if str(e.experiment_id).isdigit()]
+
+
+def _registered_model_names(registry_store) -> List[str]:
+    """Every registered model and prompt name, in every workspace."""
+    from mlflow.store.model_registry.dbmodels.models import SqlRegisteredModel
+    from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
+
+    if isinstance(registry_store, SqlAlchemyStore):
+        with registry_store.ManagedSessionMaker() as session:
+            return [name for (name,) in session.query(SqlRegisteredModel.name).distinct()]
+
+    from mlflow_oidc_auth.utils.data_fetching import fetch_all_registered_models
+
+    return [m.name for m in fetch_all_registered_models()]
+
+
+def _context_grants(ctx, resource_type: str):
+    """``(user, group, user_rules, group_rules)`` for ``resource_type`` from a permission context."""
+    if resource_type == EXPERIMENT:
+        return (
+            ctx.user_experiment_permissions,
+            ctx.group_experiment_permissions,
+            ctx.experiment_regex_permissions,
+            ctx.group_experiment_regex_permissions,
+        )
+    return ctx.user_model_permissions, ctx.group_model_permissions, ctx.model_regex_permissions, ctx.group_model_regex_permissions
+
+
+def _build_experiment_index(tracking_store, username: str, generation: Tuple[int, int, int]) -> ResourceIndex:
+    user, group, user_rules, group_rules = _context_grants(build_user_permission_context(username), EXPERIMENT)
+    uses_names = _regex_applies(user_rules, group_rules)
+
+    if uses_names:
+        rows: List[Tuple[int, Optional[str]]] = _experiment_names(tracking_store)
+    else:
+        rows = [(int(experiment_id), None) for experiment_id in {*user, *group} if str(experiment_id).isdigit()]
+
+    readable: List[int] = []
+    manageable: List[int] = []
+    for experiment_id, name in rows:
+        key = str(experiment_id)
+        result = _grant_permission(user.get(key), group.get(key), user_rules, group_rules, name)
+        if result is not None and result.permission.can_read:
+            readable.append(experiment_id)
+            if result.permission.can_manage:
+                manageable.append(experiment_id)
+    return ResourceIndex(EXPERIMENT, array("q", sorted(readable)), array("q", sorted(manageable)), uses_names, generation)
+
+
+def _build_registered_model_index(registry_store, username: str, generation: Tuple[int, int, int]) -> ResourceIndex:
+    user, group, user_rules, group_rules = _context_grants(build_user_permission_context(username), REGISTERED_MODEL)
+    uses_names = _regex_applies(user_rules, group_rules)
+
+    names = {*user, *group}
+    if uses_names:
+        names.update(_registered_model_names(registry_store))
+
+    readable: List[str] = []
+    manageable: List[str] = []
+    for name in names:
+        result = _grant_permission(user.get(name), group.get(name), user_rules, group_rules, name)
+        if result is not None and result.permission.can_read:
+            readable.append(name)
+            if result.permission.can_manage:
+                manageable.append(name)
+    return ResourceIndex(REGISTERED_MODEL, tuple(sorted(readable)), tuple(sorted(manageable)), uses_names, generation)
+
+
+_BUILDERS = {
+    EXPERIMENT: _build_experiment_index,
+    REGISTERED_MODEL: _build_registered_model_index,
+}
+
+
+def get_resource_index(resource_store, username: str, resource_type: str) -> ResourceIndex:
+    """Return ``username``'s current index for ``resource_type``, building it if needed.
+
+    Parameters:
+        resource_store: The MLflow tracking store for experiments, or the model registry
+            store for registered models.
+        username: The user whose grants are indexed.
+        resource_type: ``EXPERIMENT`` or ``REGISTERED_MODEL``.
+
+    Returns:
+        The user's ``ResourceIndex``. Only grants are indexed; see the module docstring
+        for what the fallback adds.
+    """
+    generation = _generation(username, resource_type)
+    cache = _get_index_cache() if _ttl() > 0 else None
+    if cache is not None:
+        for index in cache.get_many(_keys(username, resource_type)).values():
+            if _is_current(index, generation):
+                return index
+
+    index = _BUILDERS[resource_type](resource_store, username, generation)
+    if cache is not None:
+        cache.set(_key(resource_type, username, index.uses_names), index)
+    logger.debug(f"Built {resource_type} index for {username}: {len(index.readable)} readable, {len(index.manageable)} manageable")
+    return index
+
+
+def invalidate_resource_indexes(resource_type: str) -> None:
+    """Mark indexes built from regex matches stale. Call after a resource is created or renamed."""
+    with _name_generation_lock:
+        _name_generations[resource_type] = _name_generations.get(resource_type, 0) + 1
+    if _ttl() > 0:
+        _get_index_cache().delete_prefix(f"{resource_type}:names:")
+
+
+def invalidate_user_resource_indexes(username: str) -> None:
+    """Drop ``username``'s indexes, here and on other replicas. Call after a write that names the user."""
+    if _ttl() > 0:
+        _get_index_cache().delete_many([key for resource_type in _BUILDERS for key in _keys(username, resource_type)])
+
+
+def clear_resource_index_cache() -> None:
+    """Drop every cached index, here and on other replicas."""
+    if _index_cache is not None or _ttl() > 0:
+        _get_index_cache().clear()
+
+
+def _with(ids: Sequence, value, present: bool) -> Sequence:
+    """``ids`` with ``value`` added or removed, keeping the order and the container type."""
+    position = bisect_left(ids, value)
+    if (position < len(ids) and ids[position] == value) == present:
+        return ids
+    if isinstance(ids, array):
+        patched = array(ids.typecode, ids)
+        if present:
+            patched.insert(position, value)
+        else:
+            del patched[position]
+        return patched
+    return ids[:position] + (value,) + ids[position:] if present else ids[:position] + ids[position + 1 :]
+
+
+def _patch(index: ResourceIndex, username: str, resource_id: str, generation: Tuple[int, int, int]) -> Optional[ResourceIndex]:
+    """``index`` with one resource resolved again, or None if it has to be rebuilt."""
+    user, group, user_rules, group_rules = _context_grants(build_user_permission_context(username), index.resource_type)
+    if _regex_applies(user_rules, group_rules) != index.uses_names:
+        return None
+    key = str(resource_id)
+    if index.resource_type == EXPERIMENT:
+        if not key.isdigit():
+            return None
+        value = int(key)
+    else:
+        value = key
+    name = None
+    if index.uses_names:
+        if index.resource_type == EXPERIMENT:
+            from mlflow.server.handlers import _get_tracking_store
+
+            from mlflow_oidc_auth.utils.experiment_metadata import get_experiment_metadata
+
+            name = get_experiment_metadata(_get_tracking_store(), key).name
+        else:
+            name = key
+
+    result = _grant_permission(user.get(key), group.get(key), user_rules, group_rules, name)
+    readable = result is not None and result.permission.can_read
+    manageable = readable and result.permission.can_manage
+    return replace(index, readable=_with(index.readable, value, readable), manageable=_with(index.manageable, value, manageable), generation=generation)
+
+
+def apply_grant_change(username: str, resource_type: str, resource_id: str) -> None:
+    """Bring ``username``'s cached indexes up to date after one change to their own grant.
+
+    Call after ``username``'s direct grant on one experiment or registered model was created,
+    updated or deleted, once their snapshot generation has been bumped. The index of
+    ``resource_type`` has just that resource resolved again; the user's other indexes are
+    unaffected and only move to the new generation. Anything that does not line up — an
+    index that predates an earlier write, or a resource whose name cannot be read — is
+    dropped instead and rebuilt on next use. Other replicas cannot patch, so the entries are
+    deleted there through the invalidation bus.
+    """
+    if _ttl() <= 0:
+        return
+    cache = _get_index_cache()
+    keys = [key for indexed_type in _BUILDERS for key in _keys(username, indexed_type)]
+    cached = cache.get_many(keys)
+    cache.delete_many(keys)
+
+    updated = {}
+    for key, index in cached.items():
+        generation = _generation(username, index.resource_type)
+        previous = (generation[0], generation[1] - 1)
+        if index.generation[:2] != previous or (index.uses_names and index.generation[2] != generation[2]):
+            continue
+        if index.resource_type != resource_type:
+            updated[key] = replace(index, generation=generation)
+            continue
+        try:
+            patched = _patch(index, username, resource_id, generation)
+        except Exception as e:
+            logger.debug(f"Could not patch the {resource_type} index for {username}, rebuilding on next use: {e}")
+            continue
+        if patched is not None:
+            updated[key] = patched
+    if updated:
+        cache.set_many(updated)
+
+
+# ---------------------------------------------------------------------------
+# Listing
+# ---------------------------------------------------------------------------
+
+
+def _fallback_grants(username: str, manage: bool) -> bool:
+    """Whether a resource no grant reaches would be listed anyway (FastAPI request context)."""
+    fallback = PermissionResult(get_permission(config.DEFAULT_MLFLOW_PERMISSION), "fallback")
+    permission = _apply_workspace_fallback(fallback, username).permission
+    return permission.can_manage if manage else permission.can_read
+
+
+def _fetch_experiments(tracking_store, experiment_ids: Sequence[int]) -> List:
+    """Active experiments among ``experiment_ids`` in the current workspace, in search order."""
+    from mlflow.entities import LifecycleStage
+    from mlflow.store.tracking.dbmodels.models import SqlExperiment
+
+    experiments = []
+    with tracking_store.ManagedSessionMaker() as session:
+        for start in range(0, len(experiment_ids), _IN_CLAUSE_CHUNK):
+            chunk = list(experiment_ids[start : start + _IN_CLAUSE_CHUNK])
+            rows = (
+                tracking_store._get_query(session, SqlExperiment)
+                .options(*tracking_store._get_eager_experiment_query_options())
+                .filter(SqlExperiment.experiment_id.in_(chunk), SqlExperiment.lifecycle_stage == LifecycleStage.ACTIVE)
+            )
+            experiments.extend(row.to_mlflow_entity() for row in rows)
+    # search_experiments' default order: newest first, then by id.
+    experiments.sort(key=lambda e: (-(e.creation_time or 0), int(e.experiment_id)))
+    return experiments
+
+
+def _fetch_registered_model_names(registry_store, names: Sequence[str]) -> List[str]:
+    """Registered models (not prompts) among ``names`` in the current workspace, sorted."""
+    from mlflow.store.model_registry.dbmodels.models import SqlRegisteredModel, SqlRegisteredModelTag
+
+    found: List[str] = []
+    with registry_store.ManagedSessionMaker() as session:
+        for start in range(0, len(names), _IN_CLAUSE_CHUNK):
+            chunk = list(names[start : start + _IN_CLAUSE_CHUNK])
+            query = registry_store._get_query(session, SqlRegisteredModel).with_entities(SqlRegisteredModel.name).filter(SqlRegisteredModel.name.in_(chunk))
+            query = registry_store._update_query_to_exclude_prompts(query, {}, registry_store._get_dialect(), SqlRegisteredModel, SqlRegisteredModelTag)
+            found.extend(name for (name,) in query)
+    return sorted(found)
+
+
+def list_experiments_from_index(tracking_store, username: str, manage: bool = False) -> Optional[List]:
+    """The active experiments ``username`` can read (or manage), fetched by id.
+
+    Returns:
+        The experiments, or None when the index cannot answer: the fallback grants
+        the level to every experiment, the store is not MLflow's SQL store, or the
+        index could not be built. Callers then list and filter every experiment.
+    """
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    if not isinstance(tracking_store, SqlAlchemyStore):
+        return None
+    try:
+        if _fallback_grants(username, manage):
+            return None
+        index = get_resource_index(tracking_store, username, EXPERIMENT)
+        return _fetch_experiments(tracking_store, index.ids(manage))
+    except Exception as e:
+        logger.warning(f"Experiment index lookup failed for {username}, listing every experiment: {e}")
+        return None
+
+
+def list_registered_model_names_from_index(username: str, manage: bool = False) -> Optional[List[str]]:
+    """The registered model names ``username`` can read (or manage), checked to exist.
+
+    Returns:
+        Sorted names, or None when the index cannot answer (see
+        :func:`list_experiments_from_index`).
+    """
+    from mlflow.server.handlers import _get_model_registry_store
+    from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
+
+    try:
+        registry_store = _get_model_registry_store()
+        if not isinstance(registry_store, SqlAlchemyStore):
+            return None
+        if _fallback_grants(username, manage):
+            return None
+        index = get_resource_index(registry_store, username, REGISTERED_MODEL)
+        return _fetch_registered_model_names(registry_store, index.ids(manage))
+    except Exception as e:
+        logger.warning(f"Registered model index lookup failed for {username}, listing every model: {e}")
+        return None
@@ -0,0 +1,237 @@
+"""Authorization-aware search: the caller's readable set inside the SQL query.
+
+The search after-request handlers filter a page MLflow has already returned, then
+re-query ``search_*`` until the page is full again. For a user who can read 1% of
+50,000 experiments, one UI page turned into dozens of full-page store queries, each
+loading tags for rows that were then thrown away.
+
+:func:`enable_search_pushdown` runs in the before-request hook. It takes the user's
+readable ids as an allow-list and stores it on ``flask.g``. While it is set, the
+store's search query carries an extra ``IN (allow-list)`` clause, so MLflow's own
+handler and the after-request refetch loop both page through the readable rows only.
+The after-request filters still run unchanged. They now find every row readable, and
+the refetch loop does not iterate.
+
+The allow-list is exact because a resource only becomes readable through a grant:
+
+- experiments, registered models and model versions are pushed down only when the
+  fallback (``DEFAULT_MLFLOW_PERMISSION``, or the workspace permission when
+  workspaces are enabled) cannot read. The allow-list is then the user's resource
+  index (``utils/resource_index.py``): the ids their user, group and regex grants
+  make readable;
+- logged models are always pushed down: the request names its experiments, so
+  the allow-list is whichever of them the user can read.
+
+The clause goes in through the SQL stores' own extension points
+(``_experiment_where_clauses`` and the search filter builders), wrapped once per
+store instance.
+
+Nothing is pushed down, and today's loop does all the work, when:
+
+- the store is not MLflow's SQL store;
+- the fallback grants read, so nearly every row is readable anyway;
+- the allow-list is longer than ``SEARCH_PUSHDOWN_MAX_IDS`` (default 5000, 0
+  disables pushdown);
+- building the allow-list fails.
+
+Page tokens stay MLflow's offsets. While pushdown is active they count readable
+rows only, and every page of one listing is computed the same way.
+"""
+
+import threading
+from typing import Iterable, List, Optional
+
+from flask import g, has_app_context
+from mlflow.exceptions import MlflowException
+
+from mlflow_oidc_auth.config import config
+from mlflow_oidc_auth.logger import get_logger
+from mlflow_oidc_auth.models import PermissionResult
+from mlflow_oidc_auth.permissions import get_permission
+from mlflow_oidc_auth.utils.permissions import EXPERIMENT, REGISTERED_MODEL, _apply_workspace_fallback, resolve_permissions_many
+from mlflow_oidc_auth.utils.resource_index import get_resource_index
+
+logger = get_logger()
+
+SEARCH_EXPERIMENTS = "experiments"
+SEARCH_REGISTERED_MODELS = "registered_models"
+SEARCH_MODEL_VERSIONS = "model_versions"
+SEARCH_LOGGED_MODELS = "logged_models"
+
+_SEARCH_PUSHDOWN_DEFAULT_MAX_IDS = 5000
+
+# Set on a store instance once its search hooks are wrapped.
+_INSTALLED_ATTR = "_oidc_search_pushdown_installed"
+_install_lock = threading.Lock()
+
+
+def _max_ids() -> int:
+    return getattr(config, "SEARCH_PUSHDOWN_MAX_IDS", _SEARCH_PUSHDOWN_DEFAULT_MAX_IDS)
+
+
+def active_allow_list(kind: str) -> Optional[List]:
+    """The allow-list in force for ``kind`` in this request, or None when not pushed down."""
+    if not has_app_context():
+        return None
+    return getattr(g, "_search_pushdown", {}).get(kind)
+
+
+# ---------------------------------------------------------------------------
+# Store hooks
+# ---------------------------------------------------------------------------
+
+
+def _install_once(sql_store, wrap) -> bool:
+    if getattr(sql_store, _INSTALLED_ATTR, False):
+        return True
+    with _install_lock:
+        if not getattr(sql_store, _INSTALLED_ATTR, False):
+            if not wrap(sql_store):
+                return False
+            setattr(sql_store, _INSTALLED_ATTR, True)
+    return True
+
+
+def _wrap_tracking_store(tracking_store) -> bool:
+    from mlflow.store.tracking.dbmodels.models import SqlExperiment, SqlLoggedModel
+
+    where_clauses = getattr(tracking_store, "_experiment_where_clauses", None)
+    apply_logged_model_filters = getattr(tracking_store, "_apply_filter_string_datasets_search_logged_models", None)
+    if where_clauses is None or apply_logged_model_filters is None:
+        return False
+
+    def _experiment_where_clauses():
+        clauses = where_clauses()
+        allowed = active_allow_list(SEARCH_EXPERIMENTS)
+        return clauses if allowed is None else [*clauses, SqlExperiment.experiment_id.in_(allowed)]
+
+    def _apply_filter_string_datasets_search_logged_models(models, *args, **kwargs):
+        models = apply_logged_model_filters(models, *args, **kwargs)
+        allowed = active_allow_list(SEARCH_LOGGED_MODELS)
+        return models if allowed is None else models.filter(SqlLoggedModel.experiment_id.in_(allowed))
+
+    tracking_store._experiment_where_clauses = _experiment_where_clauses
+    tracking_store._apply_filter_string_datasets_search_logged_models = _apply_filter_string_datasets_search_logged_models
+    return True
+
+
+def _wrap_registry_store(registry_store) -> bool:
+    from mlflow.store.model_registry.dbmodels.models import SqlModelVersion, SqlRegisteredModel
+
+    model_filter_query = getattr(registry_store, "_get_search_registered_model_filter_query", None)
+    version_filter_query = getattr(registry_store, "_get_search_model_versions_filter_clauses", None)
+    if model_filter_query is None or version_filter_query is None:
+        return False
+
+    def _get_search_registered_model_filter_query(*args, **kwargs):
+        query = model_filter_query(*args, **kwargs)
+        allowed = active_allow_list(SEARCH_REGISTERED_MODELS)
+        return query if allowed is None else query.filter(SqlRegisteredModel.name.in_(allowed))
+
+    def _get_search_model_versions_filter_clauses(*args, **kwargs):
+        query = version_filter_query(*args, **kwargs)
+        allowed = active_allow_list(SEARCH_MODEL_VERSIONS)
+        return query if allowed is None else query.filter(SqlModelVersion.name.in_(allowed))
+
+    registry_store._get_search_registered_model_filter_query = _get_search_registered_model_filter_query
+    registry_store._get_search_model_versions_filter_clauses = _get_search_model_versions_filter_clauses
+    return True
+
+
+def _sql_tracking_store(tracking_store):
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+    if isinstance(tracking_store, SqlAlchemyStore) and _install_once(tracking_store, _wrap_tracking_store):
+        return tracking_store
+    return None
+
+
+def _sql_registry_store(registry_store):
+    from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
+
+    if isinstance(registry_store, SqlAlchemyStore) and _install_once(registry_store, _wrap_registry_store):
+        return registry_store
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Allow-lists
+# ---------------------------------------------------------------------------
+
+
+def _fallback_can_read(username: str) -> bool:
+    """Whether a resource with no grant at all would be readable by ``username``."""
+    fallback = PermissionResult(get_permission(config.DEFAULT_MLFLOW_PERMISSION), "fallback")
+    return _apply_workspace_fallback(fallback, username).permission.can_read
+
+
+def _readable(resource_type: str, candidates: Iterable[str], username: str) -> List[str]:
+    results = resolve_permissions_many(resource_type, candidates, username)
+    return [resource_id for resource_id, result in results.items() if result.permission.can_read]
+
+
+def _experiment_allow_list(tracking_store, username: str) -> Optional[List[int]]:
+    if _fallback_can_read(username):
+        return None
+    return list(get_resource_index(tracking_store, username, EXPERIMENT).readable)
+
+
+def _registered_model_allow_list(registry_store, username: str) -> Optional[List[str]]:
+    if _fallback_can_read(username):
+        return None
+    return list(get_resource_index(registry_store, username, REGISTERED_MODEL).readable)
+
+
+def _logged_model_allow_list(experiment_ids: Iterable[str], username: str) -> List[int]:
+    requested = [str(experiment_id) for experiment_id in experiment_ids]
+    return [int(experiment_id) for experiment_id in _readable(EXPERIMENT, requested, username) if experiment_id.isdigit()]
+
+
+def enable_search_pushdown(kind: str, username: str, experiment_ids: Iterable[str] = ()) -> bool:
+    """Push ``username``'s readable set into this request's ``kind`` search.
+
+    Parameters:
+        kind: One of ``SEARCH_EXPERIMENTS``, ``SEARCH_REGISTERED_MODELS``,
+            ``SEARCH_MODEL_VERSIONS`` or ``SEARCH_LOGGED_MODELS``.
+        username: The authenticated, non-admin caller.
+        experiment_ids: The experiments a logged-model search names.
+
+    Returns:
+        True if the search will run with an allow-list, False if the after-request
+        filter and refetch loop are left to do the work.
+    """
+    max_ids = _max_ids()
+    if max_ids <= 0:
+        return False
+
+    from mlflow.server.handlers import _get_model_registry_store, _get_tracking_store
+
+    try:
+        if kind in (SEARCH_EXPERIMENTS, SEARCH_LOGGED_MODELS):
+            sql_store = _sql_tracking_store(_get_tracking_store())
+            if sql_store is None:
+                return False
+            if kind == SEARCH_EXPERIMENTS:
+                allowed = _experiment_allow_list(sql_store, username)
+            else:
+                allowed = _logged_model_allow_list(experiment_ids, username)
+        else:
+            sql_store = _sql_registry_store(_get_model_registry_store())
+            if sql_store is None:
+                return False
+            allowed = _registered_model_allow_list(sql_store, username)
+    except MlflowException as e:
+        logger.debug("Search pushdown skipped for %s: %s", kind, e)
+        return False
+    except Exception as e:
+        # The after-request filter still enforces permissions; only the shortcut is lost.
+        logger.warning("Search pushdown failed for %s, falling back to post-filtering: %s", kind, e)
+        return False
+
+    if allowed is None or len(allowed) > max_ids:
+        return False
+    if not hasattr(g, "_search_pushdown"):
+        g._search_pushdown = {}
+    g._search_pushdown[kind] = allowed
+    logger.debug("Search pushdown for %s: %d readable ids", kind, len(allowed))
+    return True
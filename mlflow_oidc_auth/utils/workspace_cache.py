@@ -3,6 +3,13 @@
 Uses the pluggable CacheBackend (local TTLCache by default, Redis for
 multi-replica) with lazy initialization to avoid import-time config reads.
 Only active when MLFLOW_ENABLE_WORKSPACES is True.
+
+Grants and denials live in two separate caches. Grants use
+``WORKSPACE_CACHE_TTL_SECONDS``. Denials (no source grants anything) use a much
+shorter ``WORKSPACE_DENIAL_CACHE_TTL_SECONDS``. Without them, a user who has no
+workspace grant would walk every permission source on every request. Every
+invalidation hook below purges both caches, so a new grant is visible as soon as
+it is written, not when the denial expires.
 """
 
 import re
@@ -15,9 +22,14 @@ from mlflow_oidc_auth.permissions import MANAGE, Permission, get_permission
 logger = get_logger()
 
 _cache: CacheBackend | None = None
+_denial_cache: CacheBackend | None = None
 
 _WORKSPACE_CACHE_DEFAULT_MAX_SIZE = 1024
 _WORKSPACE_CACHE_DEFAULT_TTL = 300
+_WORKSPACE_DENIAL_CACHE_DEFAULT_TTL = 10
+
+# Stored for a denial. Backends return None on a miss, so None cannot mark one.
+_DENIED = True
 
 
 def _sanitize(value: str) -> str:
@@ -40,12 +52,37 @@ def _get_cache() -> CacheBackend:
     return _cache
 
 
+def _denial_cache_ttl() -> int:
+    return getattr(config, "WORKSPACE_DENIAL_CACHE_TTL_SECONDS", _WORKSPACE_DENIAL_CACHE_DEFAULT_TTL)
+
+
+def _get_denial_cache() -> CacheBackend:
+    """Get or create the workspace denial cache (lazy init).
+
+    Same key format as the grant cache. It has its own namespace so that a Redis
+    backend can apply the shorter TTL.
+    """
+    global _denial_cache
+    if _denial_cache is None:
+        maxsize = getattr(config, "WORKSPACE_CACHE_MAX_SIZE", _WORKSPACE_CACHE_DEFAULT_MAX_SIZE)
+        _denial_cache = get_cache_backend("workspace-denial", maxsize=maxsize, ttl=_denial_cache_ttl())
+    return _denial_cache
+
+
+def _denials_enabled() -> bool:
+    """A denial TTL of 0 or less turns denial caching off."""
+    return _denial_cache_ttl() > 0
+
+
 def get_workspace_permission_cached(username: str, workspace: str) -> Permission | None:
     """Get effective workspace permission for a user, with caching.
 
     Returns None if the user has no workspace permission.
     Only active when MLFLOW_ENABLE_WORKSPACES is True.
 
+    A denial is cached for ``WORKSPACE_DENIAL_CACHE_TTL_SECONDS``. The invalidation
+    hooks purge it, so a new grant takes effect immediately.
+
     Parameters:
         username: The username to look up.
         workspace: The workspace name.
@@ -62,9 +99,15 @@ def get_workspace_permission_cached(username: str, workspace: str) -> Permission
     if cached is not None:
         return cached
 
+    denials_enabled = _denials_enabled()
+    if denials_enabled and _get_denial_cache().get(key) is not None:
+        return None
+
     perm = _lookup_workspace_permission(username, workspace)
     if perm is not None:
-        cache.set(key, perm)  # Only cache non-None to avoid caching denials
+        cache.set(key, perm)
+    elif denials_enabled:
+        _get_denial_cache().set(key, _DENIED)
     return perm
 
 
@@ -72,9 +115,11 @@ def invalidate_workspace_permission(username: str, workspace: str) -> None:
     """Remove a specific user+workspace entry from cache (per D-13).
 
     Called by workspace permission router after successful CUD operations.
+    Drops both a cached grant and a cached denial.
     """
-    cache = _get_cache()
-    cache.delete(_make_cache_key(username, workspace))
+    key = _make_cache_key(username, workspace)
+    _get_cache().delete(key)
+    _get_denial_cache().delete(key)
 
 
 def invalidate_user_workspace_entries(username: str) -> None:
@@ -94,8 +139,9 @@ def invalidate_user_workspace_entries(username: str) -> None:
         # otherwise every login pays a Redis keyspace SCAN for no benefit. Mirrors
         # the guard in get_workspace_permission_cached.
         return
-    cache = _get_cache()
-    cache.delete_prefix(f"{username}:")
+    prefix = f"{username}:"
+    _get_cache().delete_prefix(prefix)
+    _get_denial_cache().delete_prefix(prefix)
     logger.debug("Workspace cache entries invalidated for user %s", _sanitize(username))
 
 
@@ -127,8 +173,11 @@ def invalidate_group_workspace_permission(group_name: str, workspace: str) -> No
         return
 
     cache = _get_cache()
+    denial_cache = _get_denial_cache()
     for member in members:
-        cache.delete(_make_cache_key(member.username, workspace))
+        key = _make_cache_key(member.username, workspace)
+        cache.delete(key)
+        denial_cache.delete(key)
     logger.debug(
         "Workspace cache invalidated for %d member(s) of group %s in workspace %s",
         len(members),
@@ -143,8 +192,8 @@ def flush_workspace_cache() -> None:
     Called by workspace regex permission router after any CUD operation.
     Full flush is necessary because regex changes can affect any user+workspace combo.
     """
-    cache = _get_cache()
-    cache.clear()
+    _get_cache().clear()
+    _get_denial_cache().clear()
     logger.debug("Workspace permission cache fully flushed (regex CUD)")
 
 
@@ -3,13 +3,13 @@ from flask import request
 
 from mlflow_oidc_auth.permissions import Permission
 from mlflow_oidc_auth.utils import effective_experiment_permission, get_request_param
+from mlflow_oidc_auth.utils.experiment_resolver import experiment_id_for_run, experiment_ids_for_runs
 
 
 def _permission_for_run(run_id: str, username: str) -> Permission:
     # run permissions inherit from parent resource (experiment)
     # so we just get the experiment permission
-    run = _get_tracking_store().get_run(run_id)
-    experiment_id = run.info.experiment_id
+    experiment_id = experiment_id_for_run(_get_tracking_store(), run_id)
     return effective_experiment_permission(experiment_id, username).permission
 
 
@@ -69,9 +69,8 @@ def validate_can_read_metric_history_bulk_interval(username: str) -> bool:
         # Some clients use run_id instead
         run_ids = request.args.to_dict(flat=False).get("run_id", [])
 
+    experiment_ids = experiment_ids_for_runs(_get_tracking_store(), run_ids)
     for run_id in run_ids:
-        run = _get_tracking_store().get_run(run_id)
-        experiment_id = run.info.experiment_id
-        if not effective_experiment_permission(experiment_id, username).permission.can_read:
+        if not effective_experiment_permission(experiment_ids[run_id], username).permission.can_read:
             return False
     return True
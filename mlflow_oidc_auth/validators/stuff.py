@@ -9,6 +9,10 @@ from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.server.handlers import _get_tracking_store
 
 from mlflow_oidc_auth.utils import effective_experiment_permission, get_request_param
+from mlflow_oidc_auth.utils.experiment_resolver import experiment_ids_for_runs
+
+# The only gateway_path shape MLflow proxies on a POST (see validate_gateway_proxy).
+_GATEWAY_INVOCATION_PATH = re.compile(r"gateway/([^/]+)/invocations")
 
 
 def validate_can_read_metric_history_bulk(username: str, run_ids: Sequence[str] | None = None) -> bool:
@@ -36,11 +40,9 @@ def validate_can_read_metric_history_bulk(username: str, run_ids: Sequence[str]
             INVALID_PARAMETER_VALUE,
         )
 
-    tracking_store = _get_tracking_store()
+    experiment_ids = experiment_ids_for_runs(_get_tracking_store(), run_ids)
     for run_id in run_ids:
-        run = tracking_store.get_run(run_id)
-        experiment_id = run.info.experiment_id
-        if not effective_experiment_permission(experiment_id, username).permission.can_read:
+        if not effective_experiment_permission(experiment_ids[run_id], username).permission.can_read:
             return False
     return True
 
@@ -120,11 +122,12 @@ def validate_gateway_proxy(username: str) -> bool:
 
     When no explicit gateway name can be extracted, it falls back to
     checking whether the user has the required capability on any gateway.
+
+    Both checks read the user's gateway capability map
+    (utils/gateway_capabilities.py), so an invocation costs a dict lookup.
     """
 
-    from mlflow_oidc_auth.store import store
-    from mlflow_oidc_auth.permissions import get_permission
-    from mlflow_oidc_auth.utils.permissions import can_use_gateway_endpoint, can_update_gateway_endpoint
+    from mlflow_oidc_auth.utils.gateway_capabilities import can_use_any_gateway_endpoint, gateway_endpoint_permission
 
     def _extract_gateway_name():
         """The endpoint MLflow will actually proxy to, or None.
@@ -159,7 +162,7 @@ def validate_gateway_proxy(username: str) -> bool:
         gateway_path = args.get("gateway_path")
         if not gateway_path:
             return None
-        match = re.fullmatch(r"gateway/([^/]+)/invocations", str(gateway_path).strip("/"))
+        match = _GATEWAY_INVOCATION_PATH.fullmatch(str(gateway_path).strip("/"))
         return match.group(1) if match else None
 
     gateway_name = _extract_gateway_name()
@@ -173,14 +176,13 @@ def validate_gateway_proxy(username: str) -> bool:
         # AFTER_REQUEST_HANDLERS entry (that map is built from proto endpoints only).
         # That exposure is pre-existing and tracked separately.
         if gateway_name:
-            return can_use_gateway_endpoint(str(gateway_name), username)
+            return gateway_endpoint_permission(str(gateway_name), username).permission.can_use
         # Fallback: check if user has any gateway endpoint with use
-        perms = store.list_gateway_endpoint_permissions(username)
-        return any(get_permission(p.permission).can_use for p in perms)
+        return can_use_any_gateway_endpoint(username)
     else:
         # POST -> UPDATE required
         if gateway_name:
-            return can_update_gateway_endpoint(str(gateway_name), username)
+            return gateway_endpoint_permission(str(gateway_name), username).permission.can_update
         # No resolvable endpoint on a mutating proxy call. Previously this fell through
         # to "does the user hold UPDATE on ANY endpoint", which let a caller with one
         # endpoint of their own invoke a path naming somebody else's. MLflow rejects a
@@ -4,6 +4,7 @@ from flask import request
 from mlflow.server.handlers import _get_tracking_store
 
 from mlflow_oidc_auth.utils import effective_experiment_permission
+from mlflow_oidc_auth.utils.experiment_resolver import experiment_id_for_trace, experiment_ids_for_runs, experiment_ids_for_traces
 
 # ---------------------------------------------------------------------------
 # Dual-spelling extraction (security-critical)
@@ -87,7 +88,7 @@ def _all_single_trace_ids() -> list:
 
 
 def _experiment_for_trace(trace_id: str) -> str:
-    return _get_tracking_store().get_trace_info(trace_id).experiment_id
+    return experiment_id_for_trace(_get_tracking_store(), trace_id)
 
 
 def _require_read_on_all(username: str, experiment_ids) -> bool:
@@ -128,13 +129,11 @@ def validate_can_read_traces_from_trace_ids(username: str) -> bool:
     trace_ids = _all_trace_ids_from_batch()
     if not trace_ids:
         return False
-    experiment_ids = []
-    for trace_id in trace_ids:
-        try:
-            experiment_ids.append(_experiment_for_trace(trace_id))
-        except Exception:
-            return False
-    return _require_read_on_all(username, experiment_ids)
+    try:
+        experiment_ids = experiment_ids_for_traces(_get_tracking_store(), trace_ids)
+    except Exception:
+        return False
+    return _require_read_on_all(username, [experiment_ids[trace_id] for trace_id in trace_ids])
 
 
 def validate_can_read_trace(username: str) -> bool:
@@ -175,12 +174,11 @@ def validate_can_update_trace_from_run_id(username: str) -> bool:
     run_ids = list(dict.fromkeys(run_ids))
     if not run_ids:
         return False
-    store = _get_tracking_store()
+    try:
+        experiment_ids = experiment_ids_for_runs(_get_tracking_store(), run_ids)
+    except Exception:
+        return False
     for run_id in run_ids:
-        try:
-            experiment_id = store.get_run(run_id).info.experiment_id
-        except Exception:
-            return False
-        if not effective_experiment_permission(experiment_id, username).permission.can_update:
+        if not effective_experiment_permission(experiment_ids[run_id], username).permission.can_update:
             return False
     return True
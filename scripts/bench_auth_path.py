@@ -23,6 +23,15 @@ Four scenarios are driven end to end through a real ``AuthMiddleware``:
     ``OIDC_JWKS_CACHE_TTL_SECONDS``.
 ``basic``
     Username/password, used by MLflow CLI clients and service accounts.
+``stream``
+    A session-authenticated 1 MiB streamed response in 64 KiB chunks, standing in for an
+    artifact download proxied through MLflow.
+
+The app is wrapped in the same middleware as ``app.py`` (sessions, workspace context,
+authentication, proxy headers, FastAPI-route permissions). ``--stacks asgi base-http`` runs every scenario twice: once
+with the middleware as shipped, which is plain ASGI, and once with each ``dispatch`` wrapped
+in Starlette's ``BaseHTTPMiddleware`` as it was before, so the difference is the per-request
+cost of that wrapper.
 
 Usage::
 
@@ -35,6 +44,9 @@ Usage::
     # Quick pass while iterating
     python scripts/bench_auth_path.py --users 1 --groups 0 --iterations 50
 
+    # Middleware overhead, plain ASGI against BaseHTTPMiddleware
+    python scripts/bench_auth_path.py --users 1 --groups 0 --stacks asgi base-http
+
 Output is a Markdown table on stdout; ``--json PATH`` additionally writes the raw
 measurements. The recorded baseline lives in ``docs/performance-baseline.md``.
 """
@@ -57,7 +69,8 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 
 DEFAULT_USER_COUNTS = (1, 50, 500)
 DEFAULT_GROUP_COUNTS = (0, 20, 200)
-SCENARIOS = ("unprotected", "session", "bearer", "basic")
+SCENARIOS = ("unprotected", "session", "bearer", "basic", "stream")
+STACKS = ("asgi", "base-http")
 
 # Statements SQLite and the driver issue that are not application queries.
 _IGNORED_PREFIXES = ("PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "SET ", "SHOW ")
@@ -66,6 +79,9 @@ BENCH_PASSWORD = "bench-password"  # not a credential: seeded into a throwaway d
 PROTECTED_PATH = "/bench/protected"
 UNPROTECTED_PATH = "/health/bench"
 LOGIN_PATH = "/login/bench"
+STREAM_PATH = "/bench/stream"
+STREAM_CHUNK = b"x" * 65536
+STREAM_CHUNKS = 16
 
 
 class QueryCounter:
@@ -103,19 +119,26 @@ def _configure(db_uri: str) -> None:
     os.environ.setdefault("LOG_LEVEL", "ERROR")
 
 
-def _build_app(store) -> Any:
-    """A minimal ASGI app wrapping the real ``AuthMiddleware``.
+def _build_app(store, stack: str = "asgi") -> Any:
+    """A minimal ASGI app wrapped in the plugin's request middleware.
 
-    Middleware is added in the same order as ``app.py`` (Auth, then Session), which in
-    Starlette means Session runs outermost — ``AuthMiddleware`` needs ``request.session``
-    to already exist. MLflow's Flask app is not mounted: this measures the auth path,
-    not MLflow.
+    Middleware is added in the same order as ``app.py``, which in Starlette means Session runs
+    outermost — ``AuthMiddleware`` needs ``request.session`` to already exist. MLflow's Flask
+    app is not mounted: this measures the auth path, not MLflow.
+
+    With ``stack="base-http"`` each middleware's ``dispatch`` is run by Starlette's
+    ``BaseHTTPMiddleware`` instead, which is how they were wired before they became plain
+    ASGI; the logic is identical, only the wrapper differs.
     """
+    from datetime import datetime, timedelta, timezone
+
     from fastapi import FastAPI, Request
+    from fastapi.responses import StreamingResponse
+    from starlette.middleware.base import BaseHTTPMiddleware
     from starlette.middleware.sessions import SessionMiddleware
 
     from mlflow_oidc_auth.config import config
-    from mlflow_oidc_auth.middleware import AuthMiddleware
+    from mlflow_oidc_auth.middleware import AuthMiddleware, FastAPIPermissionMiddleware, ProxyHeadersMiddleware, WorkspaceContextMiddleware
 
     app = FastAPI()
 
@@ -123,6 +146,14 @@ def _build_app(store) -> Any:
     async def protected(request: Request):
         return {"username": getattr(request.state, "username", None)}
 
+    @app.get(STREAM_PATH)
+    async def stream():
+        async def body():
+            for _ in range(STREAM_CHUNKS):
+                yield STREAM_CHUNK
+
+        return StreamingResponse(body(), media_type="application/octet-stream")
+
     @app.get(UNPROTECTED_PATH)
     async def unprotected():
         return {"ok": True}
@@ -130,11 +161,15 @@ def _build_app(store) -> Any:
     @app.get(LOGIN_PATH)
     async def login(request: Request, username: str):
         # Under the "/login" unprotected prefix, so it runs without authentication and
-        # mints the same session the OIDC callback would.
-        request.session["username"] = username
+        # mints the same server-side session the OIDC callback would.
+        request.session["session_id"] = store.create_auth_session(username, expires_at=datetime.now(timezone.utc) + timedelta(hours=8))
         return {"ok": True}
 
-    app.add_middleware(AuthMiddleware)
+    for middleware in (FastAPIPermissionMiddleware, ProxyHeadersMiddleware, AuthMiddleware, WorkspaceContextMiddleware):
+        if stack == "base-http":
+            app.add_middleware(BaseHTTPMiddleware, dispatch=middleware(None).dispatch)
+        else:
+            app.add_middleware(middleware)
     app.add_middleware(SessionMiddleware, secret_key=config.SECRET_KEY)
     return app
 
@@ -199,6 +234,11 @@ def _prime_jwks() -> Callable[[str], str]:
 
     with auth_module._jwks_cache_lock:
         auth_module._jwks_cache[auth_module._JWKS_CACHE_KEY] = {"keys": [public]}
+    # The synthesised provider carries OIDC_DISCOVERY_URL, so its keys are looked up per provider.
+    with auth_module._provider_jwks_lock:
+        for provider in auth_module.config.AUTH_PROVIDERS.providers:
+            if provider.discovery_url:
+                auth_module._provider_jwks_cache[(provider.id, provider.discovery_url)] = {"keys": [public]}
 
     def mint(username: str) -> str:
         now = int(time.time())
@@ -232,6 +272,8 @@ def _measure(
         elapsed = time.perf_counter() - start
         if response.status_code != 200:
             raise RuntimeError(f"scenario request failed: {response.status_code} {response.text[:200]}")
+        if response.request.url.path == STREAM_PATH and len(response.content) != STREAM_CHUNKS * len(STREAM_CHUNK):
+            raise RuntimeError(f"streamed response truncated: {len(response.content)} bytes")
         per_request_queries.append(counter.count)
         timings.append(elapsed * 1000.0)
 
@@ -256,8 +298,9 @@ def _run_matrix(
     iterations: int,
     warmup: int,
     hash_method: Optional[str] = None,
+    stacks: Iterable[str] = ("asgi",),
 ) -> List[Dict[str, Any]]:
-    """Run every (users, groups, scenario) combination against one database."""
+    """Run every (users, groups, stack, scenario) combination against one database."""
     from fastapi.testclient import TestClient
     from sqlalchemy import event
 
@@ -285,30 +328,31 @@ def _run_matrix(
 
             event.listen(store.engine, "before_cursor_execute", _listener)
             try:
-                app = _build_app(store)
                 # Measure the last-seeded user: with an index on users.username the row's
                 # position should not matter, and measuring the tail makes that visible.
                 username = usernames[-1]
                 token = mint_token(username)
                 basic = base64.b64encode(f"{username}:{BENCH_PASSWORD}".encode()).decode()
 
-                with TestClient(app) as client:
-                    client.get(LOGIN_PATH, params={"username": username})
-                    requests = {
-                        "unprotected": lambda: client.get(UNPROTECTED_PATH),
-                        "session": lambda: client.get(PROTECTED_PATH),
-                        "bearer": lambda: client.get(PROTECTED_PATH, headers={"Authorization": f"Bearer {token}"}),
-                        "basic": lambda: client.get(PROTECTED_PATH, headers={"Authorization": f"Basic {basic}"}),
-                    }
-                    for scenario in scenarios:
-                        result = _measure(requests[scenario], counter, iterations, warmup)
-                        result.update(db=db_label, users=n_users, groups_per_user=n_groups, scenario=scenario)
-                        rows.append(result)
-                        print(
-                            f"  {db_label:10s} users={n_users:<4d} groups={n_groups:<4d} {scenario:<12s} "
-                            f"queries={result['queries_per_request']} median={result['median_ms']}ms p95={result['p95_ms']}ms",
-                            file=sys.stderr,
-                        )
+                for stack in stacks:
+                    with TestClient(_build_app(store, stack)) as client:
+                        client.get(LOGIN_PATH, params={"username": username})
+                        requests = {
+                            "unprotected": lambda: client.get(UNPROTECTED_PATH),
+                            "session": lambda: client.get(PROTECTED_PATH),
+                            "bearer": lambda: client.get(PROTECTED_PATH, headers={"Authorization": f"Bearer {token}"}),
+                            "basic": lambda: client.get(PROTECTED_PATH, headers={"Authorization": f"Basic {basic}"}),
+                            "stream": lambda: client.get(STREAM_PATH),
+                        }
+                        for scenario in scenarios:
+                            result = _measure(requests[scenario], counter, iterations, warmup)
+                            result.update(db=db_label, users=n_users, groups_per_user=n_groups, stack=stack, scenario=scenario)
+                            rows.append(result)
+                            print(
+                                f"  {db_label:10s} users={n_users:<4d} groups={n_groups:<4d} {stack:<9s} {scenario:<12s} "
+                                f"queries={result['queries_per_request']} median={result['median_ms']}ms p95={result['p95_ms']}ms",
+                                file=sys.stderr,
+                            )
             finally:
                 event.remove(store.engine, "before_cursor_execute", _listener)
                 store.engine.dispose()
@@ -343,12 +387,12 @@ def _reset_rows(store) -> None:
 
 def _to_markdown(rows: List[Dict[str, Any]]) -> str:
     """Render the measurements as a Markdown table, one row per matrix cell."""
-    header = "| db | users | groups/user | scenario | queries/request | median ms | p95 ms |"
-    sep = "|---|---:|---:|---|---:|---:|---:|"
+    header = "| db | users | groups/user | stack | scenario | queries/request | median ms | p95 ms |"
+    sep = "|---|---:|---:|---|---|---:|---:|---:|"
     lines = [header, sep]
     for r in rows:
         queries = r["queries_per_request"] if r["queries_stable"] else f"VARIES {r['queries_observed']}"
-        lines.append(f"| {r['db']} | {r['users']} | {r['groups_per_user']} | {r['scenario']} | {queries} | {r['median_ms']} | {r['p95_ms']} |")
+        lines.append(f"| {r['db']} | {r['users']} | {r['groups_per_user']} | {r['stack']} | {r['scenario']} | {queries} | {r['median_ms']} | {r['p95_ms']} |")
     return "\n".join(lines)
 
 
@@ -359,6 +403,13 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--users", type=int, nargs="+", default=list(DEFAULT_USER_COUNTS))
     parser.add_argument("--groups", type=int, nargs="+", default=list(DEFAULT_GROUP_COUNTS))
     parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument(
+        "--stacks",
+        nargs="+",
+        default=["asgi"],
+        choices=list(STACKS),
+        help="Middleware wrapping to measure: the shipped plain-ASGI middleware, and/or the same dispatch under BaseHTTPMiddleware.",
+    )
     parser.add_argument("--iterations", type=int, default=200)
     parser.add_argument("--warmup", type=int, default=20)
     parser.add_argument(
@@ -390,6 +441,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         iterations=args.iterations,
         warmup=args.warmup,
         hash_method=args.hash_method,
+        stacks=args.stacks,
     )
 
     print(_to_markdown(rows))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""Measure a worker's cold start: time to its first authorized request.
+
+Each worker initialises the auth store on first access, and ``init_db`` used to load the
+Alembic config and migration scripts to compare the database against the newest revision.
+It now reads the version table once and compares the result with ``HEAD_REVISION``
+(``db/utils.py``). Alembic loads only when they differ.
+
+``alembic``
+    The previous check: ``ScriptDirectory`` and ``MigrationContext`` on every boot.
+``probe``
+    ``migrate_if_needed`` as it is now.
+
+Every sample is a fresh Python process, so nothing is warm. It builds a minimal ASGI app
+behind the plugin's ``AuthMiddleware`` and sends one basic-auth request to a protected
+route. That request initialises the store singleton, as the first request does in a real
+worker. ``--workers N`` starts N processes at once against the same database, like a
+gunicorn or uvicorn pool booting. The database is migrated before any sample runs, so every
+sample measures the check and none performs a migration.
+
+Reported per mode:
+
+* **store init** — ``SqlAlchemyStore.init_db``: engine creation and the schema check.
+* **first request** — process start to the first 200, including imports. Imports dominate
+  and are the same in both modes.
+
+Usage::
+
+    python scripts/bench_cold_start.py
+    python scripts/bench_cold_start.py --workers 1 8 32 --rounds 5
+    python scripts/bench_cold_start.py --db-uri postgresql+psycopg2://user@host:5432/db
+
+Output is a Markdown table on stdout; ``--json PATH`` additionally writes the raw
+measurements.
+"""
+
+import argparse
+import base64
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# The plugin reads its configuration from the environment at import time, so plugin
+# modules are imported inside the functions below, after _configure().
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+MODES = ("alembic", "probe")
+DEFAULT_WORKERS = (1, 8)
+USERNAME = "bench@example.com"
+BENCH_PASSWORD = "bench-password"  # not a credential: seeded into a throwaway database
+PROTECTED_PATH = "/bench/protected"
+
+
+def _configure(db_uri: str) -> None:
+    os.environ["OIDC_USERS_DB_URI"] = db_uri
+    os.environ["SECRET_KEY"] = "bench-secret-key-not-a-credential"
+    os.environ["MLFLOW_ALLOW_FILE_STORE"] = "true"
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+
+def _previous_migrate_if_needed(engine, revision: str) -> None:
+    """migrate_if_needed as it was before the version probe."""
+    from alembic.command import upgrade
+    from alembic.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    from mlflow_oidc_auth.db.utils import _get_alembic_config
+
+    alembic_cfg = _get_alembic_config(engine.url.render_as_string(hide_password=False))
+    script_dir = ScriptDirectory.from_config(alembic_cfg)
+    with engine.begin() as conn:
+        context = MigrationContext.configure(conn)
+        if context.get_current_revision() != script_dir.get_current_head():
+            upgrade(alembic_cfg, revision)
+
+
+def _child(mode: str, started: float) -> Dict[str, Any]:
+    """One cold worker: import, build the app, send the first authorized request."""
+    from fastapi import FastAPI, Request
+    from fastapi.testclient import TestClient
+    from starlette.middleware.sessions import SessionMiddleware
+
+    from mlflow_oidc_auth.config import config
+    from mlflow_oidc_auth.db import utils as dbutils
+    from mlflow_oidc_auth.middleware import AuthMiddleware
+    from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+    if mode == "alembic":
+        dbutils.migrate_if_needed = _previous_migrate_if_needed
+
+    init_db = SqlAlchemyStore.init_db
+    store_seconds: List[float] = []
+
+    def timed_init_db(self, *args, **kwargs):
+        start = time.perf_counter()
+        init_db(self, *args, **kwargs)
+        store_seconds.append(time.perf_counter() - start)
+
+    SqlAlchemyStore.init_db = timed_init_db
+
+    app = FastAPI()
+
+    @app.get(PROTECTED_PATH)
+    async def protected(request: Request):
+        return {"username": getattr(request.state, "username", None)}
+
+    app.add_middleware(AuthMiddleware)
+    app.add_middleware(SessionMiddleware, secret_key=config.SECRET_KEY)
+    imported = time.perf_counter()
+
+    basic = base64.b64encode(f"{USERNAME}:{BENCH_PASSWORD}".encode()).decode()
+    with TestClient(app) as client:
+        response = client.get(PROTECTED_PATH, headers={"Authorization": f"Basic {basic}"})
+    if response.status_code != 200:
+        raise RuntimeError(f"first request failed: {response.status_code} {response.text[:200]}")
+    done = time.perf_counter()
+    return {
+        "import_ms": (imported - started) * 1000.0,
+        "store_init_ms": store_seconds[0] * 1000.0,
+        "first_request_ms": (done - started) * 1000.0,
+    }
+
+
+def _prepare(db_uri: str) -> None:
+    """Migrate the database and seed the user every sample authenticates as."""
+    from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+
+    store = SqlAlchemyStore()
+    store.init_db(db_uri)
+    if not store.has_user(USERNAME):
+        store.create_user(USERNAME, BENCH_PASSWORD, USERNAME)
+    store.engine.dispose()
+
+
+def _run(mode: str, workers: int, rounds: int) -> Dict[str, Any]:
+    samples: List[Dict[str, Any]] = []
+    for _ in range(rounds):
+        procs = [
+            subprocess.Popen([sys.executable, __file__, "--child", mode], stdout=subprocess.PIPE, cwd=REPO_ROOT, env=os.environ.copy()) for _ in range(workers)
+        ]
+        for proc in procs:
+            out, _ = proc.communicate()
+            if proc.returncode != 0:
+                raise RuntimeError(f"{mode} worker exited with {proc.returncode}")
+            samples.append(json.loads(out.decode().strip().splitlines()[-1]))
+
+    def stat(key: str) -> Dict[str, float]:
+        values = sorted(s[key] for s in samples)
+        return {"median": round(statistics.median(values), 1), "max": round(values[-1], 1)}
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "samples": len(samples),
+        "store_init_ms": stat("store_init_ms"),
+        "first_request_ms": stat("first_request_ms"),
+        "import_ms": stat("import_ms"),
+    }
+
+
+def _to_markdown(rows: List[Dict[str, Any]]) -> str:
+    lines = [
+        "| workers | mode | store init median ms | store init max ms | first request median ms | first request max ms |",
+        "|---:|---|---:|---:|---:|---:|",
+    ]
+    for r in rows:
+        lines.append(
+            f"| {r['workers']} | {r['mode']} | {r['store_init_ms']['median']} | {r['store_init_ms']['max']} "
+            f"| {r['first_request_ms']['median']} | {r['first_request_ms']['max']} |"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    started = time.perf_counter()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-uri", default=None, help="SQLAlchemy URI. Default: a temporary SQLite database.")
+    parser.add_argument("--workers", type=int, nargs="+", default=list(DEFAULT_WORKERS), help="Processes started at once.")
+    parser.add_argument("--rounds", type=int, default=3, help="Times each worker count is started, per mode.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write raw measurements here.")
+    parser.add_argument("--child", choices=MODES, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(REPO_ROOT))
+    if args.child:
+        # The parent has already set the environment.
+        print(json.dumps(_child(args.child, started)))
+        return 0
+
+    db_uri = args.db_uri or f"sqlite:///{Path(tempfile.mkdtemp(prefix='bench-cold-start-')) / 'auth.db'}"
+    _configure(db_uri)
+    _prepare(db_uri)
+
+    print(f"cold-start benchmark: {args.rounds} round(s) per worker count", file=sys.stderr)
+    rows: List[Dict[str, Any]] = []
+    for workers in args.workers:
+        for mode in MODES:
+            row = _run(mode, workers, args.rounds)
+            rows.append(row)
+            print(
+                f"  workers={workers:<3d} {mode:<8s} store init median={row['store_init_ms']['median']}ms "
+                f"first request median={row['first_request_ms']['median']}ms",
+                file=sys.stderr,
+            )
+
+    print(_to_markdown(rows))
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(rows, indent=2) + "\n")
+        print(f"raw measurements written to {args.json_path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+"""Measure the authorization overhead of one AI Gateway proxy call.
+
+Every call to ``/ajax-api/2.0/mlflow/gateway-proxy`` passes ``validate_gateway_proxy``
+before MLflow forwards it. That check used to resolve the named endpoint through
+``resolve_permission`` (a permission-cache lookup, and a source walk whenever the entry
+expired), and the endpoint listing read the user's grants from the store on every
+request. It now reads the user's gateway capability map
+(``utils/gateway_capabilities.py``).
+
+``resolve``
+    The previous check: ``can_update_gateway_endpoint`` for an invocation, and
+    ``store.list_gateway_endpoint_permissions`` for the listing.
+``capabilities``
+    ``validate_gateway_proxy`` as it is now.
+
+Both run against a real permission database, inside a Flask request context, with
+warm caches: the steady state of an application calling the same endpoints over and
+over. Invocations (POST, naming an endpoint) and listings (GET) are reported
+separately. Grants are either direct per-endpoint grants (``--grant direct``) or one group
+regex rule matching the same endpoints (``--grant regex``). The script fails if the two
+modes disagree on any invocation decision, or on a listing decision with direct grants
+(the previous listing check ignored group and regex grants).
+
+Usage::
+
+    python scripts/bench_gateway_proxy.py
+    python scripts/bench_gateway_proxy.py --endpoints 1000 --grant regex --calls 50000
+
+Output is a Markdown table on stdout; ``--json PATH`` additionally writes the raw
+measurements.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+# The plugin reads its configuration from the environment at import time, so plugin
+# modules are imported inside the functions below, after _configure().
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_ENDPOINTS = (10, 100, 1000)
+MODES = ("resolve", "capabilities")
+USERNAME = "bench@example.com"
+GROUP = "bench-group"
+PROXY_PATH = "/ajax-api/2.0/mlflow/gateway-proxy"
+
+_IGNORED_PREFIXES = ("PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "SET ", "SHOW ")
+
+
+def _configure(auth_uri: str) -> None:
+    os.environ["OIDC_USERS_DB_URI"] = auth_uri
+    os.environ["SECRET_KEY"] = "bench-secret-key-not-a-credential"
+    os.environ["DEFAULT_MLFLOW_PERMISSION"] = "NO_PERMISSIONS"
+    os.environ["CACHE_BACKEND"] = "local"
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+
+def _seed(store, names: List[str], grant: str) -> None:
+    store.create_user(USERNAME, "bench-password", USERNAME)
+    store.populate_groups([GROUP])
+    store.set_user_groups(USERNAME, [GROUP])
+    # Every other endpoint is callable; the rest are someone else's.
+    if grant == "direct":
+        for name in names[::2]:
+            store.create_gateway_endpoint_permission(name, USERNAME, "EDIT")
+    else:
+        store.create_group_gateway_endpoint_regex_permission(GROUP, r"^ep-\d*[02468]$", 1, "EDIT")
+
+
+def _previous_check(username: str) -> bool:
+    """validate_gateway_proxy as it was before the capability map."""
+    from flask import request
+
+    from mlflow_oidc_auth.permissions import get_permission
+    from mlflow_oidc_auth.store import store
+    from mlflow_oidc_auth.utils.permissions import can_update_gateway_endpoint
+
+    if request.method == "GET":
+        return any(get_permission(p.permission).can_use for p in store.list_gateway_endpoint_permissions(username))
+    body = request.get_json(silent=True)
+    gateway_path = body.get("gateway_path") if isinstance(body, dict) else None
+    match = re.fullmatch(r"gateway/([^/]+)/invocations", str(gateway_path or "").strip("/"))
+    return can_update_gateway_endpoint(match.group(1), username) if match else False
+
+
+def _measure(app, check, calls: List[Dict[str, Any]], statements: List[str]) -> Dict[str, Any]:
+    from flask import request
+
+    timings: List[float] = []
+    decisions: List[bool] = []
+    statements.clear()
+    for call in calls:
+        with app.test_request_context(PROXY_PATH, **call):
+            # Parse the body outside the timed region: Flask caches it, and both modes read it.
+            request.get_json(silent=True)
+            start = time.perf_counter()
+            decisions.append(check(USERNAME))
+            timings.append((time.perf_counter() - start) * 1_000_000.0)
+    timings.sort()
+    return {
+        "decisions": decisions,
+        "median_us": round(statistics.median(timings), 1),
+        "p99_us": round(timings[max(int(len(timings) * 0.99) - 1, 0)], 1),
+        "queries_per_call": round(len(statements) / len(calls), 3),
+    }
+
+
+def _run(n_endpoints: int, grant: str, n_calls: int, workdir: Path) -> List[Dict[str, Any]]:
+    from flask import Flask
+    from sqlalchemy import event
+
+    from mlflow.store.tracking.dbmodels.models import SqlGatewayEndpoint
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore as TrackingStore
+
+    import mlflow_oidc_auth.store as store_module
+    from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+    from mlflow_oidc_auth.utils.gateway_capabilities import clear_gateway_capability_cache
+    from mlflow_oidc_auth.utils.permission_snapshot import invalidate_all_permission_snapshots
+    from mlflow_oidc_auth.utils.permissions import flush_permission_cache
+    from mlflow_oidc_auth.validators.stuff import validate_gateway_proxy
+
+    names = [f"ep-{i}" for i in range(n_endpoints)]
+    store = SqlAlchemyStore()
+    store.init_db(f"sqlite:///{workdir / f'auth-{n_endpoints}-{grant}.db'}")
+    _seed(store, names, grant)
+    object.__setattr__(store_module.store, "_instance", store)
+
+    # The endpoints themselves live in the tracking store; the capability map lists them.
+    tracking = TrackingStore(f"sqlite:///{workdir / f'mlflow-{n_endpoints}-{grant}.db'}", str(workdir / "artifacts"))
+    with tracking.ManagedSessionMaker() as session:
+        session.execute(
+            SqlGatewayEndpoint.__table__.insert(),
+            [{"endpoint_id": f"id-{name}", "name": name, "created_at": 0, "last_updated_at": 0} for name in names],
+        )
+
+    statements: List[str] = []
+
+    def _listener(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_IGNORED_PREFIXES):
+            statements.append(statement)
+
+    # Invocations cycle through every endpoint; listings carry no endpoint name.
+    calls = {
+        "invoke": [{"method": "POST", "json": {"gateway_path": f"gateway/{names[i % n_endpoints]}/invocations"}} for i in range(n_calls)],
+        "list": [{"method": "GET", "query_string": {"gateway_path": "api/2.0/endpoints"}} for _ in range(max(n_calls // 10, 1))],
+    }
+
+    app = Flask(__name__)
+    checks = {"resolve": _previous_check, "capabilities": validate_gateway_proxy}
+    rows: List[Dict[str, Any]] = []
+    decisions: Dict[tuple, List[bool]] = {}
+    event.listen(store.engine, "before_cursor_execute", _listener)
+    try:
+        with patch("mlflow.server.handlers._get_tracking_store", return_value=tracking):
+            for mode in MODES:
+                flush_permission_cache()
+                invalidate_all_permission_snapshots()
+                clear_gateway_capability_cache()
+                for kind, kind_calls in calls.items():
+                    # One pass to warm the caches, then the measured pass.
+                    _measure(app, checks[mode], kind_calls[: n_endpoints + 10], statements)
+                    result = _measure(app, checks[mode], kind_calls, statements)
+                    decisions[(mode, kind)] = result.pop("decisions")
+                    rows.append({"endpoints": n_endpoints, "grant": grant, "call": kind, "mode": mode, "calls": len(kind_calls), **result})
+                    print(
+                        f"  {n_endpoints:>5d} {grant:<6s} {kind:<6s} {mode:<12s} median={result['median_us']}us p99={result['p99_us']}us",
+                        file=sys.stderr,
+                    )
+    finally:
+        event.remove(store.engine, "before_cursor_execute", _listener)
+        store.engine.dispose()
+        tracking.engine.dispose()
+
+    # The previous listing check counted direct grants only, so listings are compared for direct grants.
+    for kind in ("invoke", "list") if grant == "direct" else ("invoke",):
+        if decisions[("resolve", kind)] != decisions[("capabilities", kind)]:
+            raise RuntimeError(f"modes disagree on {kind} at {n_endpoints} endpoints ({grant})")
+    return rows
+
+
+def _to_markdown(rows: List[Dict[str, Any]]) -> str:
+    lines = ["| endpoints | grant | call | mode | median µs | p99 µs | auth queries per call |", "|---:|---|---|---|---:|---:|---:|"]
+    for r in rows:
+        lines.append(f"| {r['endpoints']} | {r['grant']} | {r['call']} | {r['mode']} | {r['median_us']} | {r['p99_us']} | {r['queries_per_call']:g} |")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoints", type=int, nargs="+", default=list(DEFAULT_ENDPOINTS))
+    parser.add_argument("--grant", choices=("direct", "regex"), default="direct")
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write raw measurements here.")
+    args = parser.parse_args(argv)
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench-gateway-"))
+    _configure(f"sqlite:///{workdir / 'auth.db'}")
+    sys.path.insert(0, str(REPO_ROOT))
+
+    print(f"gateway proxy benchmark: {args.calls} calls, {args.grant} grants", file=sys.stderr)
+    rows: List[Dict[str, Any]] = []
+    for n_endpoints in args.endpoints:
+        rows.extend(_run(n_endpoints, args.grant, args.calls, workdir))
+
+    print(_to_markdown(rows))
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(rows, indent=2) + "\n")
+        print(f"raw measurements written to {args.json_path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
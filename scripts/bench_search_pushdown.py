@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+"""Measure one ``SearchExperiments`` page with and without search pushdown.
+
+The after-request filter used to be the only way a non-admin's search was narrowed. It
+filters the page MLflow returned, then re-queries ``search_experiments`` until the page
+is full again. For a user who can read a small share of the experiments, that loop
+walks most of the table. With pushdown (``utils/search_pushdown.py``), the before-request hook
+puts the user's readable set into the SQL query, and the same filter finds nothing to
+remove.
+
+Both modes run the real code: the allow-list is built from a real permission
+database, the page comes from a real MLflow SQL tracking store, and
+``_filter_search_experiments`` post-processes it inside a Flask request context.
+Only the FastAPI bridge (username, admin flag) is stubbed, because the benchmark
+does not mount the ASGI app.
+
+``postfilter``
+    ``SEARCH_PUSHDOWN_MAX_IDS=0``: MLflow's page, then the filter-and-refetch loop.
+``pushdown``
+    ``enable_search_pushdown`` first, as the before-request hook does, then the same
+    handler and filter.
+
+Grants are either direct per-experiment grants (``--grant direct``) or one regex
+rule matching the same experiments (``--grant regex``), which adds the name scan.
+Every mode must return the same experiment ids; the script fails if they differ.
+
+Usage::
+
+    python scripts/bench_search_pushdown.py
+    python scripts/bench_search_pushdown.py --sizes 10000 --grant regex --iterations 3
+
+Output is a Markdown table on stdout; ``--json PATH`` additionally writes the raw
+measurements.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+# The plugin reads its configuration from the environment at import time, so plugin
+# modules are imported inside the functions below, after _configure().
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_SIZES = (10_000, 50_000, 100_000)
+MODES = ("postfilter", "pushdown")
+USERNAME = "bench@example.com"
+SEARCH_PATH = "/api/2.0/mlflow/experiments/search"
+
+_IGNORED_PREFIXES = ("PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "SET ", "SHOW ")
+
+
+def _configure(auth_uri: str) -> None:
+    os.environ["OIDC_USERS_DB_URI"] = auth_uri
+    os.environ["SECRET_KEY"] = "bench-secret-key-not-a-credential"
+    os.environ["DEFAULT_MLFLOW_PERMISSION"] = "NO_PERMISSIONS"
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+
+def _seed_tracking(tracking_store, n_experiments: int) -> List[str]:
+    """Bulk-insert experiments with Core; the ORM path would dominate the run time."""
+    from mlflow.store.tracking.dbmodels.models import SqlExperiment
+    from sqlalchemy import insert
+
+    now = int(time.time() * 1000)
+    rows = [
+        {"name": f"exp-{i:06d}", "artifact_location": f"/tmp/bench/{i}", "lifecycle_stage": "active", "creation_time": now - i, "last_update_time": now - i}
+        for i in range(n_experiments)
+    ]
+    with tracking_store.engine.begin() as conn:
+        conn.execute(insert(SqlExperiment), rows)
+        return [str(r[0]) for r in conn.exec_driver_sql("SELECT experiment_id FROM experiments ORDER BY experiment_id").fetchall()]
+
+
+def _seed_auth(store, experiment_ids: List[str], readable_every: int, grant: str) -> None:
+    from sqlalchemy import insert, text
+
+    from mlflow_oidc_auth.db.models import SqlExperimentPermission, SqlExperimentRegexPermission, SqlUser
+
+    with store.engine.begin() as conn:
+        for table in (SqlExperimentPermission.__tablename__, SqlExperimentRegexPermission.__tablename__, SqlUser.__tablename__):
+            conn.execute(text(f"DELETE FROM {table}"))
+        conn.execute(insert(SqlUser), [{"username": USERNAME, "display_name": USERNAME, "password_hash": "x", "is_admin": False, "is_service_account": False}])
+        user_id = conn.exec_driver_sql("SELECT id FROM users").scalar()
+        if grant == "direct":
+            granted = experiment_ids[::readable_every]
+            conn.execute(insert(SqlExperimentPermission), [{"experiment_id": e, "user_id": user_id, "permission": "READ"} for e in granted])
+        else:
+            # exp-000000, exp-000100, ... : the same share of experiments as the direct grants.
+            digits = len(str(readable_every)) - 1
+            regex = r"^exp-\d+" + "0" * digits + "$"
+            conn.execute(insert(SqlExperimentRegexPermission), [{"regex": regex, "priority": 1, "user_id": user_id, "permission": "READ"}])
+
+
+def _search_page(app, tracking_store, mode: str, max_results: int) -> List[str]:
+    """One SearchExperiments request: MLflow's page, then the after-request filter."""
+    from flask import Response
+    from mlflow.protos.service_pb2 import SearchExperiments
+    from mlflow.utils.proto_json_utils import message_to_json
+
+    from mlflow_oidc_auth.hooks.after_request import _filter_search_experiments
+    from mlflow_oidc_auth.utils.search_pushdown import SEARCH_EXPERIMENTS, enable_search_pushdown
+
+    with app.test_request_context(SEARCH_PATH, method="POST", json={"max_results": max_results}):
+        if mode == "pushdown" and not enable_search_pushdown(SEARCH_EXPERIMENTS, USERNAME):
+            raise RuntimeError("pushdown was not applied; raise SEARCH_PUSHDOWN_MAX_IDS")
+        page = tracking_store.search_experiments(max_results=max_results)
+        message = SearchExperiments.Response()
+        message.experiments.extend(e.to_proto() for e in page)
+        if page.token:
+            message.next_page_token = page.token
+        resp = Response(message_to_json(message), mimetype="application/json")
+        _filter_search_experiments(resp)
+        return [e["experiment_id"] for e in json.loads(resp.get_data()).get("experiments", [])]
+
+
+def _run(size: int, grant: str, readable_every: int, max_results: int, iterations: int, workdir: Path) -> List[Dict[str, Any]]:
+    from flask import Flask
+    from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore as TrackingStore
+    from sqlalchemy import event
+
+    import mlflow_oidc_auth.store as store_module
+    from mlflow_oidc_auth.config import config
+    from mlflow_oidc_auth.sqlalchemy_store import SqlAlchemyStore
+    from mlflow_oidc_auth.utils.permission_snapshot import invalidate_all_permission_snapshots
+    from mlflow_oidc_auth.utils.permissions import flush_permission_cache
+
+    tracking_store = TrackingStore(f"sqlite:///{workdir / f'tracking-{size}.db'}", str(workdir / "artifacts"))
+    experiment_ids = _seed_tracking(tracking_store, size)
+
+    store = SqlAlchemyStore()
+    store.init_db(os.environ["OIDC_USERS_DB_URI"])
+    _seed_auth(store, experiment_ids, readable_every, grant)
+    object.__setattr__(store_module.store, "_instance", store)
+
+    statements: List[str] = []
+
+    def _listener(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_IGNORED_PREFIXES):
+            statements.append(statement)
+
+    app = Flask(__name__)
+    rows: List[Dict[str, Any]] = []
+    results: Dict[str, List[str]] = {}
+    event.listen(tracking_store.engine, "before_cursor_execute", _listener)
+    try:
+        with (
+            patch("mlflow.server.handlers._get_tracking_store", return_value=tracking_store),
+            patch("mlflow_oidc_auth.hooks.after_request._get_tracking_store", return_value=tracking_store),
+            patch("mlflow_oidc_auth.utils.permissions._get_tracking_store", return_value=tracking_store),
+            patch("mlflow_oidc_auth.hooks.after_request.get_fastapi_username", return_value=USERNAME),
+            patch("mlflow_oidc_auth.hooks.after_request.get_fastapi_admin_status", return_value=False),
+        ):
+            for mode in MODES:
+                max_ids = getattr(config, "SEARCH_PUSHDOWN_MAX_IDS", 5000) if mode == "pushdown" else 0
+                with patch.object(config, "SEARCH_PUSHDOWN_MAX_IDS", max_ids):
+                    timings: List[float] = []
+                    queries: List[int] = []
+                    for _ in range(iterations):
+                        # Cold permission caches: every iteration decides its rows from scratch.
+                        flush_permission_cache()
+                        invalidate_all_permission_snapshots()
+                        statements.clear()
+                        start = time.perf_counter()
+                        results[mode] = _search_page(app, tracking_store, mode, max_results)
+                        timings.append((time.perf_counter() - start) * 1000.0)
+                        queries.append(len(statements))
+                rows.append(
+                    {
+                        "experiments": size,
+                        "grant": grant,
+                        "mode": mode,
+                        "returned": len(results[mode]),
+                        "tracking_queries": statistics.median(queries),
+                        "median_ms": round(statistics.median(timings), 2),
+                        "iterations": iterations,
+                    }
+                )
+                print(f"  {size:>7d} {grant:<6s} {mode:<10s} {rows[-1]['median_ms']}ms queries={rows[-1]['tracking_queries']}", file=sys.stderr)
+    finally:
+        event.remove(tracking_store.engine, "before_cursor_execute", _listener)
+        tracking_store.engine.dispose()
+        store.engine.dispose()
+
+    if results["postfilter"] != results["pushdown"]:
+        raise RuntimeError(f"modes disagree at {size} experiments: {len(results['postfilter'])} vs {len(results['pushdown'])} rows")
+    return rows
+
+
+def _to_markdown(rows: List[Dict[str, Any]]) -> str:
+    lines = ["| experiments | grant | mode | rows returned | tracking queries | median ms |", "|---:|---|---|---:|---:|---:|"]
+    for r in rows:
+        lines.append(f"| {r['experiments']} | {r['grant']} | {r['mode']} | {r['returned']} | {r['tracking_queries']:g} | {r['median_ms']} |")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--grant", choices=("direct", "regex"), default="direct")
+    parser.add_argument("--readable-every", type=int, default=100, help="The user can read one experiment in N. Default: 100 (1%%).")
+    parser.add_argument("--max-results", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write raw measurements here.")
+    args = parser.parse_args(argv)
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench-search-"))
+    _configure(f"sqlite:///{workdir / 'auth.db'}")
+    sys.path.insert(0, str(REPO_ROOT))
+
+    print(f"search pushdown benchmark: 1 in {args.readable_every} readable, page of {args.max_results}", file=sys.stderr)
+    rows: List[Dict[str, Any]] = []
+    for size in args.sizes:
+        rows.extend(_run(size, args.grant, args.readable_every, args.max_results, args.iterations, workdir))
+
+    print(_to_markdown(rows))
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(rows, indent=2) + "\n")
+        print(f"raw measurements written to {args.json_path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
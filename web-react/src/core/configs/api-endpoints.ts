@@ -218,6 +218,8 @@ export const DYNAMIC_API_ENDPOINTS = {
     `/oidc/trash/experiments/${encodeURIComponent(experimentId)}/restore`,
   RESTORE_RUN: (runId: string) =>
     `/oidc/trash/runs/${encodeURIComponent(runId)}/restore`,
+  TRASH_CLEANUP_JOB: (jobId: number) =>
+    `/oidc/trash/cleanup/${encodeURIComponent(String(jobId))}`,
 
   // Webhook management
   WEBHOOK_DETAILS: (webhookId: string) =>
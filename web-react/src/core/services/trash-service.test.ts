@@ -15,8 +15,14 @@ vi.mock("../../shared/services/runtime-config", () => ({
   ),
 }));
 
+const queued = { job_id: 1, status: "queued" };
+const completed = { job_id: 1, status: "completed" };
+
 describe("trash-service", () => {
   it("cleanupTrash calls http with correct params", async () => {
+    vi.mocked(http)
+      .mockResolvedValueOnce(queued)
+      .mockResolvedValueOnce(completed);
     await cleanupTrash({ older_than: "7d" });
     expect(http).toHaveBeenCalledWith(
       expect.stringContaining("older_than=7d"),
@@ -24,6 +30,25 @@ describe("trash-service", () => {
     );
   });
 
+  it("cleanupTrash polls the job until it finishes", async () => {
+    vi.mocked(http)
+      .mockResolvedValueOnce(queued)
+      .mockResolvedValueOnce(completed);
+    const job = await cleanupTrash({ run_ids: "r1" });
+    expect(http).toHaveBeenLastCalledWith(
+      expect.stringMatching(/\/oidc\/trash\/cleanup\/1$/),
+      expect.anything(),
+    );
+    expect(job).toEqual(completed);
+  });
+
+  it("cleanupTrash rejects when the job fails", async () => {
+    vi.mocked(http)
+      .mockResolvedValueOnce(queued)
+      .mockResolvedValueOnce({ job_id: 1, status: "failed", error: "boom" });
+    await expect(cleanupTrash({ run_ids: "r1" })).rejects.toThrow("boom");
+  });
+
   it("restoreExperiment calls correct endpoint", async () => {
     await restoreExperiment("123");
     expect(http).toHaveBeenCalled();
@@ -38,6 +63,9 @@ describe("trash-service", () => {
       authenticated: true,
       workspaces_enabled: false,
     });
+    vi.mocked(http)
+      .mockResolvedValueOnce(queued)
+      .mockResolvedValueOnce(completed);
     await cleanupTrash({ older_than: "7d" });
     expect(http).toHaveBeenCalledWith(
       expect.stringMatching(/^\/mlflow\/oidc\/trash\/cleanup\?older_than=7d$/),
@@ -4,7 +4,14 @@ import {
   STATIC_API_ENDPOINTS,
   DYNAMIC_API_ENDPOINTS,
 } from "../configs/api-endpoints";
-import type { DeletedExperiment, DeletedRun } from "../../shared/types/entity";
+import type {
+  DeletedExperiment,
+  DeletedRun,
+  TrashCleanupJob,
+  TrashCleanupJobStatus,
+} from "../../shared/types/entity";
+
+const CLEANUP_POLL_INTERVAL_MS = 1000;
 
 export const fetchDeletedExperiments = createStaticApiFetcher<{
   deleted_experiments: DeletedExperiment[];
@@ -24,15 +31,41 @@ export const fetchDeletedRuns = createStaticApiFetcher<{
   },
 });
 
+export const fetchCleanupJob = async (jobId: number) => {
+  return request<TrashCleanupJob>(
+    DYNAMIC_API_ENDPOINTS.TRASH_CLEANUP_JOB(jobId),
+  );
+};
+
+/**
+ * Enqueue a trash cleanup and wait for the server-side job to finish.
+ * Resolves with the finished job; rejects if the job failed.
+ */
 export const cleanupTrash = async (params: {
   older_than?: string;
   run_ids?: string;
   experiment_ids?: string;
 }) => {
-  return request(STATIC_API_ENDPOINTS.TRASH_CLEANUP, {
+  const { job_id } = await request<{
+    job_id: number;
+    status: TrashCleanupJobStatus;
+  }>(STATIC_API_ENDPOINTS.TRASH_CLEANUP, {
     queryParams: params,
     method: "POST",
   });
+
+  for (;;) {
+    const job = await fetchCleanupJob(job_id);
+    if (job.status === "completed") {
+      return job;
+    }
+    if (job.status === "failed") {
+      throw new Error(job.error || `Cleanup job ${job_id} failed`);
+    }
+    await new Promise((resolve) =>
+      setTimeout(resolve, CLEANUP_POLL_INTERVAL_MS),
+    );
+  }
 };
 
 export const restoreExperiment = async (experimentId: string) => {
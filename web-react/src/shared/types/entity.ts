@@ -97,6 +97,24 @@ export type DeletedRun = {
   lifecycle_stage: string;
 };
 
+export type TrashCleanupJobStatus = "queued" | "running" | "completed" | "failed";
+
+export type TrashCleanupJob = {
+  job_id: number;
+  status: TrashCleanupJobStatus;
+  phase: string;
+  requested_by: string;
+  older_than: string | null;
+  runs: { total: number; deleted: number; failed: number };
+  experiments: { total: number; deleted: number; failed: number };
+  failed_runs: { run_id: string; error: string }[];
+  failed_experiments: { experiment_id: string; error: string }[];
+  created_at: string | null;
+  started_at: string | null;
+  finished_at: string | null;
+  error: string | null;
+};
+
 export type WebhookStatus = "ACTIVE" | "DISABLED";
 
 export type Webhook = {